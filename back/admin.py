@@ -1,18 +1,51 @@
+from collections.abc import Callable, Sequence
+from typing import Any
 from uuid import UUID
 
-import bcrypt
-
-from fastadmin import TortoiseModelAdmin, WidgetType, action, register
+from catalog_cache import catalog_cache
+from config import config
+from db_routing import REPLICA
+from dependencies import token_cache
+from fastadmin import (
+    IContainsSearch,
+    InMemorySearchIndex,
+    PostgresFullTextSearch,
+    SearchBackend,
+    TortoiseModelAdmin,
+    TrigramSearch,
+    WidgetType,
+    action,
+    register,
+)
+from fastadmin.api.exceptions import AdminApiException
+from hashing import HashingPoolSaturated, password_hasher
 from models import Comment, Flower, Order, User
 
 
+def get_search_backend(text_fields: tuple[str, ...]) -> SearchBackend:
+    match config.ADMIN_SEARCH_BACKEND:
+        case "fulltext":
+            return PostgresFullTextSearch(fields=text_fields)
+        case "trigram":
+            return TrigramSearch(fields=text_fields)
+        case "memory":
+            return InMemorySearchIndex()
+    return IContainsSearch()
+
+
+class ReplicaModelAdmin(TortoiseModelAdmin):
+    # list and export pages read from the replica when one is configured
+    read_connection = REPLICA if config.DB_REPLICA_HOST else None
+
+
 @register(User)
-class UserAdmin(TortoiseModelAdmin):
+class UserAdmin(ReplicaModelAdmin):
     exclude = ("password_hash",)
     list_display = ("id", "username", "is_superuser", "is_active")
     list_display_links = ("id", "username")
     list_filter = ("id", "username", "is_superuser", "is_active")
     search_fields = ("username",)
+    str_depends_on = ("username", "email")
 
     formfield_overrides = {
         "email": (WidgetType.EmailInput, {"required": True}),
@@ -29,47 +62,96 @@ class UserAdmin(TortoiseModelAdmin):
         user = await User.filter(username=username, is_superuser=True).first()
         if not user:
             return None
-        if not bcrypt.checkpw(password.encode(), user.password_hash.encode()):
-            return None
+        try:
+            if not await password_hasher.verify(password, user.password_hash):
+                return None
+        except HashingPoolSaturated:
+            raise AdminApiException(503, detail="Server is busy, try again later.") from None
         return user.id
 
+    async def is_user_active(self, id: UUID | int) -> bool:
+        return await User.filter(id=id, is_superuser=True, is_active=True).exists()
+
     # async def change_password(self, id: int, password: str) -> None:
     #     user = await User.filter(id=id).first()
     #     if not user:
     #         return None
 
-    #     hashed_password = bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+    #     hashed_password = await password_hasher.hash(password)
     #     user.password_hash = hashed_password
     #     user.save()
 
+    # bulk statements and queryset.delete() don't send post_save/post_delete signals which drop cached users
+    async def delete_model(self, id: UUID | int) -> None:
+        await super().delete_model(id)
+        token_cache.discard_where(lambda user: user.id == id)
+
+    async def delete_many(self, ids: Sequence[UUID | int], progress: Callable[[int], None] | None = None) -> int:
+        deleted = await super().delete_many(ids, progress=progress)
+        ids = set(ids)
+        token_cache.discard_where(lambda user: user.id in ids)
+        return deleted
+
+    async def update_many(
+        self, ids: Sequence[UUID | int], values: dict[str, Any], progress: Callable[[int], None] | None = None
+    ) -> int:
+        updated = await super().update_many(ids, values, progress=progress)
+        ids = set(ids)
+        token_cache.discard_where(lambda user: user.id in ids)
+        return updated
+
     @action(description="Set as active")
     async def activate(self, ids: list[int]) -> None:
-        await self.model_cls.filter(id__in=ids).update(is_active=True)
+        await self.update_many(ids, {"is_active": True})
 
     @action(description="Deactivate")
     async def deactivate(self, ids: list[int]) -> None:
-        await self.model_cls.filter(id__in=ids).update(is_active=False)
+        await self.update_many(ids, {"is_active": False})
 
 
 @register(Flower)
-class FlowerAdmin(TortoiseModelAdmin):
+class FlowerAdmin(ReplicaModelAdmin):
     list_display = ("id", "name", "type", "category", "price")
     list_display_links = ("id", "name")
     list_filter = ("id", "name", "type", "category")
     search_fields = ("name",)
+    str_depends_on = ("name", "type", "price")
+
+    async def delete_model(self, id: UUID | int) -> None:
+        # deleting goes through queryset.delete(), which doesn't send post_delete signals
+        await super().delete_model(id)
+        catalog_cache.invalidate()
+
+    # bulk statements don't send signals either
+    async def delete_many(self, ids: Sequence[UUID | int], progress: Callable[[int], None] | None = None) -> int:
+        deleted = await super().delete_many(ids, progress=progress)
+        catalog_cache.invalidate()
+        return deleted
+
+    async def update_many(
+        self, ids: Sequence[UUID | int], values: dict[str, Any], progress: Callable[[int], None] | None = None
+    ) -> int:
+        updated = await super().update_many(ids, values, progress=progress)
+        catalog_cache.invalidate()
+        return updated
 
 
 @register(Order)
-class OrderAdmin(TortoiseModelAdmin):
+class OrderAdmin(ReplicaModelAdmin):
     list_display = ("id", "status", "user", "flower", "quantity")
     list_display_links = ("id", "status")
     list_filter = ("id", "user", "flower")
     search_fields = ("user", "flower")
+    str_depends_on = ("id", "user")
+    # the table is too big to count(*) on every page
+    count_strategy = "estimate"
 
 
 @register(Comment)
-class CommentAdmin(TortoiseModelAdmin):
+class CommentAdmin(ReplicaModelAdmin):
     list_display = ("id", "text", "user")
     list_display_links = ("id", "text")
     list_filter = ("id", "user", "text")
-    search_fields = ("user", "text")
+    search_fields = ("user__username", "text")
+    search_backend = get_search_backend(("text",))
+    str_depends_on = ("user", "text")
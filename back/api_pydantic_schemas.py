@@ -24,7 +24,7 @@ class UserLoginResponse(BaseModel):
 
 class OrderCreate(BaseModel):
     flower_name: str
-    quantity: int
+    quantity: int = Field(default=1, gt=0)
 
 
 class OrderCreateResponse(BaseModel):
@@ -32,6 +32,22 @@ class OrderCreateResponse(BaseModel):
     message: str
 
 
+class OrderBatchCreate(BaseModel):
+    items: list[OrderCreate] = Field(min_length=1, max_length=100)
+
+
+class OrderBatchLineResult(BaseModel):
+    flower_name: str
+    success: bool
+    message: str
+
+
+class OrderBatchCreateResponse(BaseModel):
+    success: bool
+    data: list[OrderBatchLineResult]
+    message: str
+
+
 UserLogoutResponse = OrderCreateResponse
 CommentCreateResponse = OrderCreateResponse
 OrderDeleteResponse = OrderCreateResponse
@@ -68,12 +84,14 @@ class OrderGetResponse(BaseModel):
     success: bool
     data: list[OrderSchema]
     message: str
+    next_before_id: Optional[int] = None
 
 
 class FlowersGetResponse(BaseModel):
     success: bool
     data: list[FlowerSchema]
     message: str
+    next_cursor: Optional[str] = None
 
 
 class CommentSchema(BaseModel):
@@ -86,6 +104,7 @@ class CommentGetResponse(BaseModel):
     success: bool
     data: list[CommentSchema]
     message: str
+    next_cursor: Optional[str] = None
 
 
 class CommentCreate(BaseModel):
@@ -1,10 +1,12 @@
 from typing import Annotated
 
 import bcrypt
-from fastapi import APIRouter, Header, Response, status
+from fastapi import APIRouter, Depends, Response, status
 from tortoise.exceptions import DoesNotExist, IntegrityError, ValidationError
 
 from api_pydantic_schemas import UserLogin, UserLoginResponse, UserLogoutResponse, UserRegister, UserRegisterResponse
+from dependencies import UserRecord, current_user, invalidate_token
+from hashing import HashingPoolSaturated, password_hasher
 from models import User
 
 router = APIRouter()
@@ -14,7 +16,7 @@ router = APIRouter()
 async def register(user: UserRegister, response: Response):
     try:
         # Hash the password before saving
-        hashed_password = bcrypt.hashpw(user.password.encode(), bcrypt.gensalt()).decode()
+        hashed_password = await password_hasher.hash(user.password)
 
         try:
             await User.create(
@@ -30,14 +32,19 @@ async def register(user: UserRegister, response: Response):
     except IntegrityError:
         response.status_code = status.HTTP_409_CONFLICT
         return {"success": False, "data": {}, "message": "Error. User already exists with that creds."}
+    except HashingPoolSaturated:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {"success": False, "message": "Error. Server is busy, try again later."}
 
 
 @router.post("/login", response_model=UserLoginResponse, status_code=status.HTTP_200_OK)
 async def login(user_creds: UserLogin, response: Response):
     try:
         user = await User.get(email=user_creds.email, is_active=True)
-        if bcrypt.checkpw(user_creds.password.encode("utf-8"), user.password_hash.encode()):
+        if await password_hasher.verify(user_creds.password, user.password_hash):
+            invalidate_token(user.token)  # the previous token stops working
             user.token = bcrypt.gensalt().decode("utf-8")
+            invalidate_token(user.token)
             await user.save()
             return {"success": True, "token": user.token, "message": ""}
         else:
@@ -46,15 +53,17 @@ async def login(user_creds: UserLogin, response: Response):
     except DoesNotExist:
         response.status_code = status.HTTP_404_NOT_FOUND
         return {"success": False, "token": "", "message": "Error. User not found with that creds."}
+    except HashingPoolSaturated:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {"success": False, "token": "", "message": "Error. Server is busy, try again later."}
 
 
 @router.post("/logout", response_model=UserLogoutResponse, status_code=status.HTTP_200_OK)
-async def logout(token: Annotated[str | None, Header()], response: Response):
-    try:
-        user = await User.get(token=token)
-        user.token = ""
-        await user.save()
-        return {"success": True, "message": ""}
-    except DoesNotExist:
+async def logout(user: Annotated[UserRecord | None, Depends(current_user)], response: Response):
+    if user is None:
         response.status_code = status.HTTP_403_FORBIDDEN
         return {"success": False, "message": "Error. Incorrect token."}
+
+    await User.filter(id=user.id).update(token="")
+    invalidate_token(user.token)
+    return {"success": True, "message": ""}
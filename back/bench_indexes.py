@@ -0,0 +1,109 @@
+"""
+Query plans of the hot lookups with and without the indexes declared in models.py.
+
+Run it against a scratch postgres database (DB_* env vars), it TRUNCATEs the tables and fills them with fake data:
+    DB_NAME=flowers_bench python bench_indexes.py --orders 1000000
+
+It refuses to run when the database name doesn't contain "bench" or "test", unless --i-know is passed.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from tortoise import Tortoise
+
+from config import config
+
+HOT_QUERIES = {
+    "user by token": """SELECT * FROM "user" WHERE "token" = 'token-4242'""",
+    "pending order of user/flower": (
+        """SELECT * FROM "order" WHERE "user_id" = 4242 AND "flower_id" = 7 AND "status" = 'Pending'"""
+    ),
+    "orders of user": """SELECT * FROM "order" WHERE "user_id" = 4242""",
+    "flowers by category": """SELECT * FROM "flower" WHERE "category" = 'Birthday'""",
+}
+SCRATCH_DB_MARKERS = ("bench", "test")
+
+
+def is_scratch_db(name: str | None) -> bool:
+    return any(marker in (name or "").lower() for marker in SCRATCH_DB_MARKERS)
+
+
+async def fill(db, users: int, flowers: int, orders: int):
+    await db.execute_script('TRUNCATE "order", "comment", "user", "flower" RESTART IDENTITY CASCADE;')
+    await db.execute_script(
+        f"""
+        INSERT INTO "user" (username, email, token, is_superuser, is_active, created_at, modified_at)
+        SELECT 'user-' || i, 'user-' || i || '@example.com', 'token-' || i, false, true, now(), now()
+        FROM generate_series(1, {users}) i;
+
+        INSERT INTO "flower" (name, price, type, category, img_link, created_at, modified_at)
+        SELECT 'flower-' || i, 10, 'Red',
+            (ARRAY['Birthday', 'Wedding', 'For a Loved One', 'For Children'])[1 + i % 4], '', now(), now()
+        FROM generate_series(1, {flowers}) i;
+
+        INSERT INTO "order" (status, user_id, flower_id, quantity, amount, created_at, modified_at)
+        SELECT CASE WHEN i % 20 = 0 THEN 'Pending' ELSE 'Completed' END,
+            1 + i % {users}, 1 + (i / {users}) % {flowers}, 1, 10, now(), now()
+        FROM generate_series(1, {orders}) i;
+
+        ANALYZE;
+        """
+    )
+
+
+async def explain(db) -> dict[str, tuple[str, float]]:
+    plans = {}
+    for name, sql in HOT_QUERIES.items():
+        _, rows = await db.execute_query(f"EXPLAIN (ANALYZE, FORMAT JSON) {sql}")
+        plan = rows[0][0]
+        plan = (json.loads(plan) if isinstance(plan, str) else plan)[0]
+        plans[name] = (plan["Plan"]["Node Type"], plan["Execution Time"])
+    return plans
+
+
+async def main(users: int, flowers: int, orders: int):
+    await Tortoise.init(config=config.db_config)
+    await Tortoise.generate_schemas(safe=True)
+    db = Tortoise.get_connection("default")
+
+    started = time.perf_counter()
+    await fill(db, users, flowers, orders)
+    print(f"filled {orders} orders in {time.perf_counter() - started:.1f}s")
+
+    _, indexes = await db.execute_query(
+        """SELECT indexname, indexdef FROM pg_indexes
+        WHERE tablename IN ('user', 'flower', 'order') AND indexname LIKE 'idx_%'"""
+    )
+    for index in indexes:
+        await db.execute_script(f'DROP INDEX "{index["indexname"]}";')
+    without_indexes = await explain(db)
+
+    for index in indexes:
+        await db.execute_script(f'{index["indexdef"]};')
+    await db.execute_script("ANALYZE;")
+    with_indexes = await explain(db)
+
+    print(f"{'query':32} {'without indexes':>32} {'with indexes':>32}")
+    for name in HOT_QUERIES:
+        before, after = without_indexes[name], with_indexes[name]
+        print(f"{name:32} {before[0]:>20} {before[1]:9.2f}ms {after[0]:>20} {after[1]:9.2f}ms")
+
+    await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--flowers", type=int, default=200)
+    parser.add_argument("--orders", type=int, default=1_000_000)
+    parser.add_argument("--i-know", action="store_true", help="wipe a database whose name isn't a scratch one")
+    args = parser.parse_args()
+    if not args.i_know and not is_scratch_db(config.DB_NAME):
+        parser.error(
+            f"refusing to TRUNCATE database {config.DB_NAME!r}: its name doesn't contain "
+            f"{' or '.join(map(repr, SCRATCH_DB_MARKERS))}, point DB_NAME to a scratch database or pass --i-know"
+        )
+    asyncio.run(main(args.users, args.flowers, args.orders))
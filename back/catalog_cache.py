@@ -0,0 +1,107 @@
+import asyncio
+import hashlib
+import time
+from dataclasses import dataclass
+from decimal import Decimal
+
+import orjson
+
+from tortoise.signals import post_delete, post_save
+
+from api_pydantic_schemas import FlowerSchema
+from config import config
+from models import Flower
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    version: int
+    expires_at: float  # time.monotonic()
+    body: bytes  # rendered FlowersGetResponse json
+    etag: str
+
+
+class CatalogCache:
+    """
+    In-memory snapshots of the flower catalog, one per category (None is the whole catalog).
+
+    Every Flower write bumps `version`, snapshots built for an older version are rebuilt on the next read.
+    The version is per process, so snapshots also expire `ttl` seconds after they were built: that bounds how long
+    other workers serve the catalog from before a write.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.version = 0
+        self._snapshots: dict[Flower.FlowerCategory | None, CatalogSnapshot] = {}
+        self._building: dict[Flower.FlowerCategory | None, asyncio.Task] = {}
+
+    def invalidate(self):
+        self.version += 1
+        self._snapshots.clear()
+
+    async def get(self, category: Flower.FlowerCategory | None = None) -> CatalogSnapshot:
+        snapshot = self._snapshots.get(category)
+        if snapshot is not None and snapshot.version == self.version and snapshot.expires_at > time.monotonic():
+            return snapshot
+
+        # concurrent misses for the same category share one query
+        task = self._building.get(category)
+        if task is None:
+            task = asyncio.ensure_future(self._build(category))
+            self._building[category] = task
+            task.add_done_callback(lambda _: self._building.pop(category, None))
+        return await task
+
+    async def _build(self, category: Flower.FlowerCategory | None) -> CatalogSnapshot:
+        version = self.version
+        # read from the primary, a snapshot lives until the next flower write or ttl so a lagging replica would pin stale data
+        if category:
+            flowers = await Flower.filter(category=category).values()
+        else:
+            flowers = await Flower.all().values()
+
+        data = [FlowerSchema.model_validate(f).model_dump(mode="json") for f in flowers]
+        body = render_json({"success": True, "data": data, "message": ""})
+        snapshot = CatalogSnapshot(
+            version=version,
+            expires_at=time.monotonic() + self.ttl,
+            body=body,
+            etag=f'"{hashlib.sha256(body).hexdigest()}"',
+        )
+        if version == self.version:  # don't store a snapshot which was invalidated while querying
+            self._snapshots[category] = snapshot
+        return snapshot
+
+
+def render_json(content: dict) -> bytes:
+    # orjson renders enums and datetimes natively and is several times faster than json + fastapi validation
+    return orjson.dumps(content, default=_json_default)
+
+
+def _json_default(value):
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+catalog_cache = CatalogCache(ttl=config.CATALOG_CACHE_TTL)
+
+
+@post_save(Flower)
+async def invalidate_on_save(sender, instance, created, using_db, update_fields):
+    catalog_cache.invalidate()
+
+
+@post_delete(Flower)
+async def invalidate_on_delete(sender, instance, using_db):
+    catalog_cache.invalidate()
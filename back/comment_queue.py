@@ -0,0 +1,127 @@
+import asyncio
+import logging
+from collections.abc import Callable
+
+from tortoise import timezone
+
+from config import config
+from models import Comment
+
+logger = logging.getLogger(__name__)
+
+
+class CommentWriter:
+    """
+    Write-behind buffer for comments, used when COMMENTS_INGEST_MODE is "buffered".
+
+    Accepted comments wait in an in-process queue and a background task inserts them with bulk_create,
+    once `batch_size` comments are collected or `flush_interval` seconds after the first one of a batch.
+    When the queue is full comments are inserted right away. `drain` flushes everything on shutdown.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 100,
+        flush_interval: float = 0.5,
+        max_queue: int = 10000,
+        on_flush: Callable[[], None] | None = None,
+    ):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue = max_queue
+        self.on_flush = on_flush
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+
+        self.accepted = 0
+        self.written = 0
+        self.failed = 0
+        self.overflowed = 0
+        self.batches = 0
+
+    def _start(self):
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+            self._task = asyncio.create_task(self._run(self._queue))
+
+    async def submit(self, text: str, user_id: int):
+        # created_at is the time the comment was accepted, not when its batch is written
+        comment = Comment(text=text, user_id=user_id, created_at=timezone.now())
+        self._start()
+        try:
+            self._queue.put_nowait(comment)
+        except asyncio.QueueFull:
+            self.overflowed += 1
+            await self._write([comment])
+            return
+        self.accepted += 1
+
+    async def _run(self, queue: asyncio.Queue):
+        loop = asyncio.get_running_loop()
+        while True:
+            comment = await queue.get()
+            if comment is None:  # drain
+                return
+            batch = [comment]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    comment = await asyncio.wait_for(queue.get(), deadline - loop.time())
+                except asyncio.TimeoutError:
+                    break
+                if comment is None:
+                    await self._write(batch)
+                    return
+                batch.append(comment)
+            await self._write(batch)
+
+    async def _write(self, batch: list[Comment]):
+        try:
+            await Comment.bulk_create(batch)
+            self.written += len(batch)
+        except Exception:
+            # one bad row (e.g. its user was deleted meanwhile) shouldn't drop the whole batch
+            logger.exception("bulk insert of %d comments failed, saving them one by one", len(batch))
+            dropped = 0
+            for comment in batch:
+                try:
+                    await comment.save()
+                    self.written += 1
+                except Exception:
+                    dropped += 1
+                    logger.exception("comment of user %s dropped", comment.user_id)
+            self.failed += dropped
+            if dropped:
+                logger.error("%d of %d comments of the batch dropped", dropped, len(batch))
+        self.batches += 1
+        if self.on_flush:
+            self.on_flush()
+
+    async def drain(self):
+        """Stop the background task after it writes everything accepted so far."""
+        if self._task is None:
+            return
+        queue, task = self._queue, self._task
+        if not task.done():
+            await queue.put(None)
+            await task
+        self._queue = self._task = None
+
+        leftovers = []
+        while not queue.empty():
+            comment = queue.get_nowait()
+            if comment is not None:
+                leftovers.append(comment)
+        if leftovers:
+            await self._write(leftovers)
+
+    def stats(self) -> dict:
+        return {
+            "mode": config.COMMENTS_INGEST_MODE,
+            "queued": self._queue.qsize() if self._queue else 0,
+            "accepted": self.accepted,
+            "written": self.written,
+            "failed": self.failed,
+            "overflowed": self.overflowed,
+            "batches": self.batches,
+        }
@@ -26,6 +26,18 @@ class Config:
     def DB_PASSWORD(self):
         return os.getenv("DB_PASSWORD")
 
+    @property
+    def DB_REPLICA_HOST(self):
+        return os.getenv("DB_REPLICA_HOST")  # not set means reads go to the primary too
+
+    @property
+    def DB_REPLICA_PORT(self):
+        return os.getenv("DB_REPLICA_PORT", self.DB_PORT)
+
+    @property
+    def DB_REPLICA_STICKY_TTL(self):
+        return float(os.getenv("DB_REPLICA_STICKY_TTL", 5))  # in sec, reads of a user stay on the primary after a write
+
     @property
     def ADMIN_NAME(self):
         return os.getenv("ADMIN_NAME")
@@ -37,24 +49,111 @@ class Config:
     @property
     def ADMIN_PASSWORD(self):
         return os.getenv("ADMIN_PASSWORD")
-    
+
+    @property
+    def HASHING_EXECUTOR(self):
+        return os.getenv("HASHING_EXECUTOR", "thread")  # thread or process
+
+    @property
+    def HASHING_WORKERS(self):
+        return int(os.getenv("HASHING_WORKERS", 4))
+
+    @property
+    def HASHING_MAX_QUEUE(self):
+        return int(os.getenv("HASHING_MAX_QUEUE", 64))
+
+    @property
+    def TOKEN_CACHE_SIZE(self):
+        return int(os.getenv("TOKEN_CACHE_SIZE", 10000))
+
+    @property
+    def TOKEN_CACHE_TTL(self):
+        # in sec, the cache is per worker: a logged out or replaced token keeps working on other workers until it expires
+        return float(os.getenv("TOKEN_CACHE_TTL", 5))
+
+    @property
+    def TOKEN_NEGATIVE_CACHE_TTL(self):
+        return float(os.getenv("TOKEN_NEGATIVE_CACHE_TTL", 5))  # in sec, 0 disables it
+
+    @property
+    def CATALOG_CACHE_TTL(self):
+        return float(os.getenv("CATALOG_CACHE_TTL", 5))  # in sec, how long other workers may serve a stale catalog
+
+    @property
+    def COMMENTS_CACHE_TTL(self):
+        return float(os.getenv("COMMENTS_CACHE_TTL", 5))  # in sec, 0 disables it
+
+    @property
+    def COMMENTS_INGEST_MODE(self):
+        return os.getenv("COMMENTS_INGEST_MODE", "sync")  # sync or buffered
+
+    @property
+    def COMMENTS_BATCH_SIZE(self):
+        return int(os.getenv("COMMENTS_BATCH_SIZE", 100))
+
+    @property
+    def COMMENTS_FLUSH_INTERVAL(self):
+        return float(os.getenv("COMMENTS_FLUSH_INTERVAL", 0.5))  # in sec
+
+    @property
+    def COMMENTS_QUEUE_SIZE(self):
+        return int(os.getenv("COMMENTS_QUEUE_SIZE", 10000))
+
+    @property
+    def ADMIN_SEARCH_BACKEND(self):
+        # icontains, fulltext, trigram or memory, fulltext and trigram need the DDL of get_index_sql in a migration
+        return os.getenv("ADMIN_SEARCH_BACKEND", "icontains")
+
+    # the pool is per uvicorn worker, workers * DB_POOL_MAX_SIZE must stay below postgres max_connections
+    @property
+    def DB_POOL_MIN_SIZE(self):
+        return int(os.getenv("DB_POOL_MIN_SIZE", 5))
+
+    @property
+    def DB_POOL_MAX_SIZE(self):
+        return int(os.getenv("DB_POOL_MAX_SIZE", 20))
+
+    @property
+    def DB_STATEMENT_CACHE_SIZE(self):
+        return int(os.getenv("DB_STATEMENT_CACHE_SIZE", 100))  # 0 for pgbouncer in transaction mode
+
+    @property
+    def DB_COMMAND_TIMEOUT(self):
+        return float(os.getenv("DB_COMMAND_TIMEOUT", 30))  # in sec
+
+    @property
+    def DB_POOL_MAX_IDLE_LIFETIME(self):
+        return float(os.getenv("DB_POOL_MAX_IDLE_LIFETIME", 300))  # in sec, idle connections are closed after it
+
+    def _db_credentials(self, host, port):
+        return {
+            'host': host,
+            'port': port,
+            'user': self.DB_USER,
+            'password': self.DB_PASSWORD,
+            'database': self.DB_NAME,
+            'minsize': self.DB_POOL_MIN_SIZE,
+            'maxsize': self.DB_POOL_MAX_SIZE,
+            'statement_cache_size': self.DB_STATEMENT_CACHE_SIZE,
+            'command_timeout': self.DB_COMMAND_TIMEOUT,
+            'max_inactive_connection_lifetime': self.DB_POOL_MAX_IDLE_LIFETIME,
+        }
+
     @property
     def db_config(self):
+        connections = {
+            'default': {
+                'engine': 'tortoise.backends.asyncpg',
+                'credentials': self._db_credentials(self.DB_HOST, self.DB_PORT),
+            }
+        }
+        if self.DB_REPLICA_HOST:
+            connections['replica'] = {
+                'engine': 'tortoise.backends.asyncpg',
+                'credentials': self._db_credentials(self.DB_REPLICA_HOST, self.DB_REPLICA_PORT),
+            }
         return {
-            'connections': {
-                'default': {
-                    'engine': 'tortoise.backends.asyncpg',
-                    'credentials': {
-                        'host': self.DB_HOST,
-                        'port': self.DB_PORT,
-                        'user': self.DB_USER,
-                        'password': self.DB_PASSWORD,
-                        'database': self.DB_NAME,
-                        'minsize': 1,
-                        'maxsize': 1000,
-                    },
-                }
-            },
+            'connections': connections,
             'apps': {
                 'models': {
                     'models': ['models', 'aerich.models'],
@@ -0,0 +1,44 @@
+import asyncio
+
+from tortoise import connections
+
+
+def _pooled_client(connection_name: str):
+    client = connections.get(connection_name)
+    # only the asyncpg client has a pool, sqlite (tests) has a single connection
+    return client if hasattr(client, "create_pool") else None
+
+
+async def warm_up_pool(connection_name: str = "default"):
+    """Open the pool and run a query on `minsize` connections, so the first burst doesn't wait for connects."""
+    client = _pooled_client(connection_name)
+    if client is None:
+        return
+    if client._pool is None:  # tortoise opens the pool lazily on the first query
+        await client.create_connection(with_db=True)
+
+    pool = client._pool
+    acquired = await asyncio.gather(*(pool.acquire() for _ in range(pool.get_min_size())))
+    try:
+        await asyncio.gather(*(conn.execute("SELECT 1") for conn in acquired))
+    finally:
+        for conn in acquired:
+            await pool.release(conn)
+
+
+def pool_stats(connection_name: str = "default") -> dict | None:
+    """Gauges of this worker's pool, None when the connection isn't pooled or not opened yet."""
+    client = _pooled_client(connection_name)
+    if client is None or client._pool is None:
+        return None
+    pool = client._pool
+    size, idle = pool.get_size(), pool.get_idle_size()
+    return {
+        "min_size": pool.get_min_size(),
+        "max_size": pool.get_max_size(),
+        "size": size,
+        "in_use": size - idle,
+        "idle": idle,
+        # asyncpg has no public counter of acquire() calls waiting for a free connection
+        "waiters": len(getattr(pool._queue, "_getters", ())),
+    }
@@ -0,0 +1,39 @@
+from collections.abc import Hashable
+
+from tortoise import connections
+from tortoise.backends.base.client import BaseDBAsyncClient
+
+from config import config
+from ttl_cache import TTLCache
+
+PRIMARY = "default"
+REPLICA = "replica"
+
+# keys (user ids) which wrote recently, their reads stay on the primary until the replica catches up
+_recent_writers = TTLCache(maxsize=100_000, ttl=config.DB_REPLICA_STICKY_TTL)
+
+
+def replica_name() -> str | None:
+    """Name of the read replica connection, None when it isn't configured."""
+    return REPLICA if REPLICA in connections.db_config else None
+
+
+def read_db(sticky_key: Hashable | None = None) -> BaseDBAsyncClient:
+    """
+    Connection for read-only queries: the replica if there is one, otherwise the primary.
+
+    Reads of a `sticky_key` passed to `pin_to_primary` a moment ago go to the primary,
+    so a user sees their own writes.
+    """
+    name = replica_name()
+    if name is None or (sticky_key is not None and _recent_writers.get(sticky_key)):
+        return connections.get(PRIMARY)
+    return connections.get(name)
+
+
+def pin_to_primary(sticky_key: Hashable):
+    _recent_writers.set(sticky_key, True)
+
+
+def reset_pins():
+    _recent_writers.clear()
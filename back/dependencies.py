@@ -0,0 +1,74 @@
+from dataclasses import dataclass
+from typing import Annotated
+
+from fastapi import Header
+from tortoise.signals import post_delete, post_save
+
+from config import config
+from models import User
+from ttl_cache import TTLCache
+
+
+@dataclass(frozen=True, slots=True)
+class UserRecord:
+    """What authenticated handlers need to know about the token owner."""
+
+    id: int
+    username: str
+    token: str
+    is_active: bool
+    is_superuser: bool
+
+
+# per process: logout and a new login evict the token only in the worker which handled them,
+# other workers accept the old token until TOKEN_CACHE_TTL expires
+token_cache = TTLCache(maxsize=config.TOKEN_CACHE_SIZE, ttl=config.TOKEN_CACHE_TTL)
+# tokens which didn't match any user, so token guessing floods don't reach the db
+bad_token_cache = TTLCache(maxsize=config.TOKEN_CACHE_SIZE, ttl=config.TOKEN_NEGATIVE_CACHE_TTL)
+
+
+async def resolve_token(token: str | None) -> UserRecord | None:
+    if not token:  # logged out users have an empty token
+        return None
+
+    user = token_cache.get(token)
+    if user is not None:
+        return user
+    if bad_token_cache.get(token):
+        return None
+
+    # a logout or login which evicts tokens while the query runs must not be overwritten with its result
+    generation, bad_generation = token_cache.generation, bad_token_cache.generation
+    row = (
+        await User.filter(token=token)
+        .first()
+        .values("id", "username", "token", "is_active", "is_superuser")
+    )
+    if row is None:
+        bad_token_cache.set(token, True, generation=bad_generation)
+        return None
+
+    user = UserRecord(**row)
+    token_cache.set(token, user, generation=generation)
+    return user
+
+
+def invalidate_token(token: str | None):
+    if token:
+        token_cache.pop(token)
+        bad_token_cache.pop(token)
+
+
+async def current_user(token: Annotated[str | None, Header()] = None) -> UserRecord | None:
+    """Dependency for authenticated handlers, None means the token is missing or incorrect."""
+    return await resolve_token(token)
+
+
+@post_save(User)
+async def invalidate_on_save(sender, instance, created, using_db, update_fields):
+    token_cache.discard_where(lambda user: user.id == instance.id)
+
+
+@post_delete(User)
+async def invalidate_on_delete(sender, instance, using_db):
+    token_cache.discard_where(lambda user: user.id == instance.id)
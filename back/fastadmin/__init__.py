@@ -37,3 +37,10 @@ from fastadmin.models.base import DashboardWidgetAdmin, InlineModelAdmin, ModelA
 from fastadmin.models.decorators import action, display, register, register_widget  # noqa: F401
 from fastadmin.models.helpers import register_admin_model_class, unregister_admin_model_class  # noqa: F401
 from fastadmin.models.schemas import DashboardWidgetType, WidgetType  # noqa: F401
+from fastadmin.models.search import (  # noqa: F401
+    IContainsSearch,
+    InMemorySearchIndex,
+    PostgresFullTextSearch,
+    SearchBackend,
+    TrigramSearch,
+)
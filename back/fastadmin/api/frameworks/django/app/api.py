@@ -13,7 +13,7 @@ from django.http.request import HttpRequest
 
 from fastadmin.api.exceptions import AdminApiException
 from fastadmin.api.helpers import is_valid_id
-from fastadmin.api.schemas import ActionInputSchema, ExportInputSchema, SignInInputSchema
+from fastadmin.api.schemas import ActionInputSchema, BulkInputSchema, ExportInputSchema, SignInInputSchema
 from fastadmin.api.service import ApiService, get_user_id_from_session_id
 from fastadmin.settings import settings
 
@@ -159,6 +159,7 @@ async def list_objs(request: HttpRequest, model: str) -> JsonResponse:
     :params sort_by: a sort by string.
     :params offset: an offset.
     :params limit: a limit.
+    :params cursor: a cursor of keyset pagination.
     :return: A list of objects.
     """
     if request.method != "GET":
@@ -169,8 +170,9 @@ async def list_objs(request: HttpRequest, model: str) -> JsonResponse:
         sort_by = filters.get("sort_by", None)
         offset = int(filters.get("offset", 0))
         limit = int(filters.get("limit", 10))
+        cursor = filters.get("cursor", None)
 
-        objs, total = await api_service.list(
+        objs, total, total_is_estimate, next_cursor = await api_service.list(
             request.COOKIES.get(settings.ADMIN_SESSION_ID_KEY, None),
             model,
             search=search,
@@ -178,10 +180,13 @@ async def list_objs(request: HttpRequest, model: str) -> JsonResponse:
             filters=filters,
             offset=offset,
             limit=limit,
+            cursor=cursor,
         )
         return JsonResponse(
             {
                 "total": total,
+                "total_is_estimate": total_is_estimate,
+                "next_cursor": next_cursor,
                 "results": objs,
             }
         )
@@ -359,19 +364,85 @@ async def action(
     :params model: a name of model.
     :params action: a name of action.
     :params payload: a payload object.
-    :return: A list of objects.
+    :return: A bulk job of the action.
     """
     if request.method != "POST":
         return JsonResponse({"error": "Method not allowed"}, status=405)
     try:
         payload = ActionInputSchema(**json.loads(request.body))
-        await api_service.action(
+        job = await api_service.action(
             request.COOKIES.get(settings.ADMIN_SESSION_ID_KEY, None),
             model,
             action,
             payload,
         )
-        return JsonResponse({})
+        return JsonResponse(asdict(job))
+
+    except AdminApiException as e:
+        return JsonResponse({"detail": e.detail}, status=e.status_code)
+
+
+@csrf_exempt
+async def bulk_delete(request: HttpRequest, model: str) -> JsonResponse:
+    """This method is used to delete objects in bulk.
+
+    :params model: a name of model.
+    :params payload: a payload object.
+    :return: A bulk job.
+    """
+    if request.method != "POST":
+        return JsonResponse({"error": "Method not allowed"}, status=405)
+    try:
+        payload = BulkInputSchema(**json.loads(request.body))
+        job = await api_service.bulk_delete(
+            request.COOKIES.get(settings.ADMIN_SESSION_ID_KEY, None),
+            model,
+            payload,
+        )
+        return JsonResponse(asdict(job))
+
+    except AdminApiException as e:
+        return JsonResponse({"detail": e.detail}, status=e.status_code)
+
+
+@csrf_exempt
+async def bulk_update(request: HttpRequest, model: str) -> JsonResponse:
+    """This method is used to update objects in bulk.
+
+    :params model: a name of model.
+    :params payload: a payload object.
+    :return: A bulk job.
+    """
+    if request.method != "POST":
+        return JsonResponse({"error": "Method not allowed"}, status=405)
+    try:
+        payload = BulkInputSchema(**json.loads(request.body))
+        job = await api_service.bulk_update(
+            request.COOKIES.get(settings.ADMIN_SESSION_ID_KEY, None),
+            model,
+            payload,
+        )
+        return JsonResponse(asdict(job))
+
+    except AdminApiException as e:
+        return JsonResponse({"detail": e.detail}, status=e.status_code)
+
+
+@csrf_exempt
+async def bulk_job(request: HttpRequest, job_id: str) -> JsonResponse:
+    """This method is used to get progress of a bulk job.
+
+    :params job_id: an id of job.
+    :return: A bulk job.
+    """
+    if request.method != "GET":
+        return JsonResponse({"error": "Method not allowed"}, status=405)
+    try:
+        job = await api_service.bulk_job(
+            request.COOKIES.get(settings.ADMIN_SESSION_ID_KEY, None),
+            job_id,
+        )
+        return JsonResponse(asdict(job))
 
     except AdminApiException as e:
         return JsonResponse({"detail": e.detail}, status=e.status_code)
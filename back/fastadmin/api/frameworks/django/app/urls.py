@@ -8,6 +8,9 @@ from fastadmin.settings import ROOT_DIR
 from .api import (
     action,
     add,
+    bulk_delete,
+    bulk_job,
+    bulk_update,
     change,
     change_password,
     configuration,
@@ -39,6 +42,9 @@ def get_admin_urls():
             path("api/export/<str:model>", export),
             path("api/delete/<str:model>/<str:id>", delete),
             path("api/action/<str:model>/<str:action>", action),
+            path("api/bulk-delete/<str:model>", bulk_delete),
+            path("api/bulk-update/<str:model>", bulk_update),
+            path("api/bulk-job/<str:job_id>", bulk_job),
             path("api/configuration", configuration),
             re_path(
                 r"^%s(?P<path>.*)$" % re.escape("static"),
@@ -6,7 +6,13 @@ from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import Response, StreamingResponse
 
 from fastadmin.api.exceptions import AdminApiException
-from fastadmin.api.schemas import ActionInputSchema, ExportInputSchema, SignInInputSchema
+from fastadmin.api.schemas import (
+    ActionInputSchema,
+    BulkInputSchema,
+    BulkJobOutputSchema,
+    ExportInputSchema,
+    SignInInputSchema,
+)
 from fastadmin.api.service import ApiService, get_user_id_from_session_id
 from fastadmin.models.schemas import ConfigurationSchema
 from fastadmin.settings import settings
@@ -120,6 +126,7 @@ async def list_objs(
     sort_by: str | None = None,
     offset: int | None = 0,
     limit: int | None = 10,
+    cursor: str | None = None,
 ):
     """This method is used to get a list of objects.
 
@@ -129,10 +136,11 @@ async def list_objs(
     :params sort_by: a sort by string.
     :params offset: an offset.
     :params limit: a limit.
+    :params cursor: a cursor of keyset pagination.
     :return: A list of objects.
     """
     try:
-        objs, total = await api_service.list(
+        objs, total, total_is_estimate, next_cursor = await api_service.list(
             request.cookies.get(settings.ADMIN_SESSION_ID_KEY, None),
             model,
             search=search,
@@ -140,9 +148,12 @@ async def list_objs(
             filters=request.query_params._dict,
             offset=offset,
             limit=limit,
+            cursor=cursor,
         )
         return {
             "total": total,
+            "total_is_estimate": total_is_estimate,
+            "next_cursor": next_cursor,
             "results": objs,
         }
     except AdminApiException as e:
@@ -296,13 +307,13 @@ async def action(
     model: str,
     action: str,
     payload: ActionInputSchema,
-) -> None:
+) -> BulkJobOutputSchema:
     """This method is used to perform an action.
 
     :params model: a name of model.
     :params action: a name of action.
     :params payload: a payload object.
-    :return: A list of objects.
+    :return: A bulk job of the action.
     """
     try:
         return await api_service.action(
@@ -315,6 +326,69 @@ async def action(
         raise HTTPException(e.status_code, detail=e.detail) from None
 
 
+@router.post("/bulk-delete/{model}")
+async def bulk_delete(
+    request: Request,
+    model: str,
+    payload: BulkInputSchema,
+) -> BulkJobOutputSchema:
+    """This method is used to delete objects in bulk.
+
+    :params model: a name of model.
+    :params payload: a payload object.
+    :return: A bulk job.
+    """
+    try:
+        return await api_service.bulk_delete(
+            request.cookies.get(settings.ADMIN_SESSION_ID_KEY, None),
+            model,
+            payload,
+        )
+    except AdminApiException as e:
+        raise HTTPException(e.status_code, detail=e.detail) from None
+
+
+@router.post("/bulk-update/{model}")
+async def bulk_update(
+    request: Request,
+    model: str,
+    payload: BulkInputSchema,
+) -> BulkJobOutputSchema:
+    """This method is used to update objects in bulk.
+
+    :params model: a name of model.
+    :params payload: a payload object.
+    :return: A bulk job.
+    """
+    try:
+        return await api_service.bulk_update(
+            request.cookies.get(settings.ADMIN_SESSION_ID_KEY, None),
+            model,
+            payload,
+        )
+    except AdminApiException as e:
+        raise HTTPException(e.status_code, detail=e.detail) from None
+
+
+@router.get("/bulk-job/{job_id}")
+async def bulk_job(
+    request: Request,
+    job_id: str,
+) -> BulkJobOutputSchema:
+    """This method is used to get progress of a bulk job.
+
+    :params job_id: an id of job.
+    :return: A bulk job.
+    """
+    try:
+        return await api_service.bulk_job(
+            request.cookies.get(settings.ADMIN_SESSION_ID_KEY, None),
+            job_id,
+        )
+    except AdminApiException as e:
+        raise HTTPException(e.status_code, detail=e.detail) from None
+
+
 @router.get("/configuration")
 async def configuration(
     request: Request,
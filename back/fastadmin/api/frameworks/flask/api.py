@@ -7,7 +7,7 @@ from werkzeug.exceptions import HTTPException
 
 from fastadmin.api.exceptions import AdminApiException
 from fastadmin.api.helpers import is_valid_id
-from fastadmin.api.schemas import ActionInputSchema, ExportInputSchema, SignInInputSchema
+from fastadmin.api.schemas import ActionInputSchema, BulkInputSchema, ExportInputSchema, SignInInputSchema
 from fastadmin.api.service import ApiService, get_user_id_from_session_id
 from fastadmin.settings import settings
 
@@ -122,6 +122,7 @@ async def list_objs(model: str) -> dict:
     :params sort_by: a sort by string.
     :params offset: an offset.
     :params limit: a limit.
+    :params cursor: a cursor of keyset pagination.
     :return: A list of objects.
     """
     try:
@@ -130,7 +131,8 @@ async def list_objs(model: str) -> dict:
         sort_by = filters.get("sort_by", None)
         offset = int(filters.get("offset", 0))
         limit = int(filters.get("limit", 10))
-        objs, total = await api_service.list(
+        cursor = filters.get("cursor", None)
+        objs, total, total_is_estimate, next_cursor = await api_service.list(
             request.cookies.get(settings.ADMIN_SESSION_ID_KEY, None),
             model,
             search=search,
@@ -138,9 +140,12 @@ async def list_objs(model: str) -> dict:
             filters=filters,
             offset=offset,
             limit=limit,
+            cursor=cursor,
         )
         return {
             "total": total,
+            "total_is_estimate": total_is_estimate,
+            "next_cursor": next_cursor,
             "results": objs,
         }
     except ValueError as e:
@@ -276,7 +281,10 @@ async def export(model: str) -> Response:
             sort_by=sort_by,
             filters=filters,
         )
-        response = Response(stream, mimetype=content_type)
+        # flask runs async views in a loop which is closed once the view returns, so the export can't be streamed
+        chunks = [chunk async for chunk in stream] if stream else []
+        content = b"".join(chunks) if chunks and isinstance(chunks[0], bytes) else "".join(chunks)
+        response = Response(content, mimetype=content_type)
         response.headers["Content-Disposition"] = f'attachment; filename="{file_name}"'
         return response
     except AdminApiException as e:
@@ -322,18 +330,87 @@ async def action(
     :params model: a name of model.
     :params action: a name of action.
     :params payload: a payload object.
-    :return: A list of objects.
+    :return: A bulk job of the action.
     """
     try:
         request_payload: dict = request.json
         payload: ActionInputSchema = ActionInputSchema(**request_payload)
-        await api_service.action(
+        # flask closes the loop of an async view once it returns, so background jobs can't outlive the request
+        job = await api_service.action(
             request.cookies.get(settings.ADMIN_SESSION_ID_KEY, None),
             model,
             action,
             payload,
+            background=False,
+        )
+        return asdict(job)
+    except AdminApiException as e:
+        http_exception = HTTPException(e.detail)
+        http_exception.code = e.status_code
+        raise http_exception from e
+
+
+@api_router.route("/bulk-delete/<string:model>", methods=["POST"])
+async def bulk_delete(model: str) -> dict:
+    """This method is used to delete objects in bulk.
+
+    :params model: a name of model.
+    :params payload: a payload object.
+    :return: A bulk job.
+    """
+    try:
+        request_payload: dict = request.json
+        payload: BulkInputSchema = BulkInputSchema(**request_payload)
+        job = await api_service.bulk_delete(
+            request.cookies.get(settings.ADMIN_SESSION_ID_KEY, None),
+            model,
+            payload,
+            background=False,
+        )
+        return asdict(job)
+    except AdminApiException as e:
+        http_exception = HTTPException(e.detail)
+        http_exception.code = e.status_code
+        raise http_exception from e
+
+
+@api_router.route("/bulk-update/<string:model>", methods=["POST"])
+async def bulk_update(model: str) -> dict:
+    """This method is used to update objects in bulk.
+
+    :params model: a name of model.
+    :params payload: a payload object.
+    :return: A bulk job.
+    """
+    try:
+        request_payload: dict = request.json
+        payload: BulkInputSchema = BulkInputSchema(**request_payload)
+        job = await api_service.bulk_update(
+            request.cookies.get(settings.ADMIN_SESSION_ID_KEY, None),
+            model,
+            payload,
+            background=False,
+        )
+        return asdict(job)
+    except AdminApiException as e:
+        http_exception = HTTPException(e.detail)
+        http_exception.code = e.status_code
+        raise http_exception from e
+
+
+@api_router.route("/bulk-job/<string:job_id>", methods=["GET"])
+async def bulk_job(job_id: str) -> dict:
+    """This method is used to get progress of a bulk job.
+
+    :params job_id: an id of job.
+    :return: A bulk job.
+    """
+    try:
+        job = await api_service.bulk_job(
+            request.cookies.get(settings.ADMIN_SESSION_ID_KEY, None),
+            job_id,
         )
-        return {}
+        return asdict(job)
     except AdminApiException as e:
         http_exception = HTTPException(e.detail)
         http_exception.code = e.status_code
@@ -1,6 +1,10 @@
 import base64
 import binascii
+import datetime
+import json
+from decimal import Decimal
 from pathlib import Path
+from typing import Any
 from uuid import UUID
 
 from fastadmin.models.schemas import ModelFieldWidgetSchema
@@ -81,6 +85,53 @@ def is_valid_base64(value: str) -> bool:
         return False
 
 
+CURSOR_VALUE_TYPES: dict[str, tuple[type, Any]] = {
+    # checked in order, datetime is a subclass of date
+    "datetime": (datetime.datetime, datetime.datetime.fromisoformat),
+    "date": (datetime.date, datetime.date.fromisoformat),
+    "time": (datetime.time, datetime.time.fromisoformat),
+    "decimal": (Decimal, Decimal),
+    "uuid": (UUID, UUID),
+}
+
+
+def encode_cursor(values: list[Any]) -> str:
+    """Encode a keyset position (values of the sort field and pk) to an opaque cursor.
+
+    :param values: A list of values.
+    :return: An url safe cursor.
+    """
+    encoded_values = []
+    for value in values:
+        for type_name, (value_type, _) in CURSOR_VALUE_TYPES.items():
+            if isinstance(value, value_type):
+                value = {"t": type_name, "v": value.isoformat() if type_name in ("datetime", "date", "time") else str(value)}
+                break
+        encoded_values.append(value)
+    return base64.urlsafe_b64encode(json.dumps(encoded_values, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list[Any]:
+    """Decode a cursor made by encode_cursor.
+
+    :param cursor: A cursor.
+    :return: A list of values.
+    :raises ValueError: If the cursor is malformed.
+    """
+    try:
+        encoded_values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(encoded_values, list):
+            raise ValueError("Cursor is not a list")
+        values = []
+        for value in encoded_values:
+            if isinstance(value, dict):
+                value = CURSOR_VALUE_TYPES[value["t"]][1](value["v"])
+            values.append(value)
+        return values
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError, KeyError, TypeError, ArithmeticError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
 def get_template(template: Path, context: dict) -> str:
     with Path.open(template, "r") as file:
         content = file.read()
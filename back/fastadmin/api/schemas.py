@@ -1,13 +1,26 @@
 from dataclasses import dataclass
 from enum import Enum
+from typing import Any
 from uuid import UUID
 
 
+class BulkJobStatus(str, Enum):
+    """Bulk job status"""
+
+    RECEIVING = "RECEIVING"
+    RUNNING = "RUNNING"
+    DONE = "DONE"
+    FAILED = "FAILED"
+
+
 class ExportFormat(str, Enum):
     """Export format"""
 
     CSV = "CSV"
     JSON = "JSON"
+    NDJSON = "NDJSON"
+    PARQUET = "PARQUET"
+    ARROW = "ARROW"
 
 
 @dataclass
@@ -38,6 +51,8 @@ class ListQuerySchema:
     sort_by: str | None = None
     search: str | None = None
     filters: dict[str, str] | None = None
+    # keyset pagination instead of offset: "" for the first page, then next_cursor of the previous page
+    cursor: str | None = None
 
 
 @dataclass
@@ -63,6 +78,8 @@ class ExportInputSchema:
     format: ExportFormat | None = ExportFormat.CSV
     limit: int | None = 1000
     offset: int | None = 0
+    # export objects after a list cursor instead of an offset
+    cursor: str | None = None
 
 
 @dataclass
@@ -70,3 +87,30 @@ class ActionInputSchema:
     """Action input schema"""
 
     ids: list[int | UUID]
+    # many ids may be sent in parts: a part with final=False returns a job id, next parts pass it,
+    # the action runs once the final part is received
+    job_id: str | None = None
+    final: bool = True
+
+
+@dataclass
+class BulkInputSchema:
+    """Bulk delete/update input schema"""
+
+    ids: list[int | UUID]
+    # new values of fields for bulk update
+    values: dict[str, Any] | None = None
+    # ids sent in parts, see ActionInputSchema
+    job_id: str | None = None
+    final: bool = True
+
+
+@dataclass
+class BulkJobOutputSchema:
+    """Bulk job output schema"""
+
+    id: str
+    status: BulkJobStatus
+    total: int
+    done: int = 0
+    error: str | None = None
@@ -1,11 +1,13 @@
+import asyncio
 import inspect
 import logging
 import re
-from collections.abc import Sequence
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from io import BytesIO, StringIO
 from typing import Any, cast
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import jwt
 from asgiref.sync import sync_to_async
@@ -14,6 +16,9 @@ from fastadmin.api.exceptions import AdminApiException
 from fastadmin.api.helpers import sanitize_filter_key, sanitize_filter_value
 from fastadmin.api.schemas import (
     ActionInputSchema,
+    BulkInputSchema,
+    BulkJobOutputSchema,
+    BulkJobStatus,
     ChangePasswordInputSchema,
     DashboardWidgetDataOutputSchema,
     DashboardWidgetQuerySchema,
@@ -22,7 +27,7 @@ from fastadmin.api.schemas import (
     ListQuerySchema,
     SignInInputSchema,
 )
-from fastadmin.models.base import InlineModelAdmin, ModelAdmin, admin_dashboard_widgets
+from fastadmin.models.base import InlineModelAdmin, ModelAdmin, admin_dashboard_widgets, pyarrow_installed
 from fastadmin.models.helpers import (
     generate_dashboard_widgets_schema,
     generate_models_schema,
@@ -57,19 +62,121 @@ def convert_id(id: str | int | UUID) -> int | UUID | None:
     return None
 
 
-async def get_user_id_from_session_id(session_id: str | None) -> UUID | int | None:
-    """This method is used to get user id from session_id.
+# keys of sessions verified against the db recently -> monotonic time until which it is trusted
+verified_sessions: dict[str, float] = {}
+# keys of signed out sessions -> session expiration, after which the jwt is rejected anyway
+revoked_sessions: dict[str, datetime] = {}
+SESSIONS_CACHE_MAX_SIZE = 10000
+
+
+@dataclass
+class BulkJob:
+    """A bulk operation (delete, update or an action) on ids, which may be received in several parts."""
+
+    id: str
+    user_id: str
+    model: str
+    operation: str
+    ids: list[int | UUID] = field(default_factory=list)
+    status: BulkJobStatus = BulkJobStatus.RECEIVING
+    done: int = 0
+    error: str | None = None
+    updated_at: float = field(default_factory=time.monotonic)
+
+    def to_output(self) -> BulkJobOutputSchema:
+        return BulkJobOutputSchema(
+            id=self.id, status=self.status, total=len(self.ids), done=self.done, error=self.error
+        )
+
+
+# job id -> receiving and background bulk jobs, finished or abandoned ones are dropped after BULK_JOBS_TTL sec
+bulk_jobs: dict[str, BulkJob] = {}
+# running tasks of background jobs, the loop keeps only weak references to them
+bulk_job_tasks: set[asyncio.Task] = set()
+BULK_JOBS_TTL = 3600
+
+
+async def run_bulk_job(
+    job: BulkJob, run: Callable[[Sequence[int | UUID], Callable[[int], None]], Awaitable[Any]], background: bool
+) -> None:
+    """Run a bulk operation of the job and keep its progress and status in the job.
+
+    :param job: A bulk job.
+    :param run: A function of the operation, it's called with ids and a progress function.
+    :param background: A flag to keep errors in the job instead of raising them.
+    :return: None.
+    """
+
+    def progress(done: int) -> None:
+        job.done = done
+        job.updated_at = time.monotonic()
+
+    job.status = BulkJobStatus.RUNNING
+    try:
+        await run(job.ids, progress)
+    except Exception as e:
+        job.status = BulkJobStatus.FAILED
+        job.error = str(e)
+        if not background:
+            raise
+        logger.exception("Bulk %s of %s failed", job.operation, job.model)
+    else:
+        job.status = BulkJobStatus.DONE
+        job.done = len(job.ids)
+    finally:
+        job.updated_at = time.monotonic()
+
+
+def get_search_field_owner(admin_model: ModelAdmin | InlineModelAdmin, field: str) -> str:
+    """Get a field of the model which a search field is matched by.
+
+    :param admin_model: An admin model.
+    :param field: A search field, "user__username" is matched by the user relation when the orm supports it.
+    :return: A field name.
+    """
+    if admin_model.supports_related_search_fields:
+        return field.split("__", 1)[0]
+    return field
+
+
+def get_session_key(token_payload: dict) -> str:
+    """Get a key of a session, its jti claim.
+
+    Tokens issued before the jti claim was added fall back to user_id and iat.
+
+    :param token_payload: A decoded session jwt.
+    :return: A session key.
+    """
+    if jti := token_payload.get("jti"):
+        return str(jti)
+    return f"{token_payload.get('user_id')}:{token_payload.get('iat')}"
+
+
+def revoke_session(token_payload: dict) -> None:
+    """Reject the session in this process from now on, used by sign out.
+
+    :param token_payload: A decoded session jwt.
+    :return: None.
+    """
+    now = datetime.now(timezone.utc)
+    if len(revoked_sessions) >= SESSIONS_CACHE_MAX_SIZE:
+        for key in [k for k, expired_at in revoked_sessions.items() if expired_at < now]:
+            del revoked_sessions[key]
+
+    key = get_session_key(token_payload)
+    verified_sessions.pop(key, None)
+    revoked_sessions[key] = datetime.fromisoformat(token_payload["session_expired_at"]).replace(tzinfo=timezone.utc)
+
+
+def decode_session_id(session_id: str | None) -> dict | None:
+    """Decode session id and check that the session is not expired or revoked.
 
     :param session_id: A session id.
-    :return: A user id or None.
+    :return: A token payload or None.
     """
     if not session_id:
         return None
 
-    admin_model = get_admin_model(settings.ADMIN_USER_MODEL)
-    if not admin_model:
-        return None
-
     try:
         token_payload = jwt.decode(session_id, settings.ADMIN_SECRET_KEY, algorithms=["HS256"])
     except jwt.PyJWTError:
@@ -82,14 +189,50 @@ async def get_user_id_from_session_id(session_id: str | None) -> UUID | int | No
     if datetime.fromisoformat(session_expired_at).replace(tzinfo=timezone.utc) < datetime.now(timezone.utc):
         return None
 
+    if get_session_key(token_payload) in revoked_sessions:
+        return None
+
+    return token_payload
+
+
+async def get_user_id_from_session_id(session_id: str | None) -> UUID | int | None:
+    """This method is used to get user id from session_id.
+
+    The user is checked with admin_model.is_user_active, the result is cached for
+    settings.ADMIN_SESSION_CACHE_TTL seconds per session.
+
+    :param session_id: A session id.
+    :return: A user id or None.
+    """
+    admin_model = get_admin_model(settings.ADMIN_USER_MODEL)
+    if not admin_model:
+        return None
+
+    token_payload = decode_session_id(session_id)
+    if not token_payload:
+        return None
+
     user_id = token_payload.get("user_id")
     if not user_id:
         return None
 
     user_id = convert_id(user_id)
-    if not user_id or not await admin_model.get_obj(user_id):
+    if not user_id:
         return None
 
+    key = get_session_key(token_payload)
+    trusted_until = verified_sessions.get(key)
+    if trusted_until is not None and trusted_until > time.monotonic():
+        return user_id
+
+    if not await admin_model.is_user_active(user_id):
+        verified_sessions.pop(key, None)
+        return None
+
+    if settings.ADMIN_SESSION_CACHE_TTL > 0:
+        if len(verified_sessions) >= SESSIONS_CACHE_MAX_SIZE:
+            verified_sessions.clear()
+        verified_sessions[key] = time.monotonic() + settings.ADMIN_SESSION_CACHE_TTL
     return user_id
 
 
@@ -123,6 +266,8 @@ class ApiService:
             {
                 "user_id": user_id,
                 "session_expired_at": session_expired_at.isoformat(),
+                "iat": int(now.timestamp()),
+                "jti": uuid4().hex,
             },
             settings.ADMIN_SECRET_KEY,
             algorithm="HS256",
@@ -136,6 +281,7 @@ class ApiService:
         if not current_user_id:
             raise AdminApiException(401, detail="User is not authenticated.")
 
+        revoke_session(decode_session_id(session_id))
         return True
 
     async def dashboard_widget(
@@ -182,7 +328,8 @@ class ApiService:
         filters: dict | None = None,
         offset: int | None = 0,
         limit: int | None = 10,
-    ) -> tuple[list[dict], int]:
+        cursor: str | None = None,
+    ) -> tuple[list[dict], int, bool, str | None]:
         current_user_id = await get_user_id_from_session_id(session_id)
         if not current_user_id:
             raise AdminApiException(401, detail="User is not authenticated.")
@@ -193,6 +340,7 @@ class ApiService:
             filters=filters or {},
             offset=offset,
             limit=limit,
+            cursor=cursor,
         )
 
         admin_model = get_admin_or_admin_inline_model(model)
@@ -204,10 +352,10 @@ class ApiService:
 
         if query_params.search and admin_model.search_fields:
             for field in admin_model.search_fields:
-                if field not in fields:
+                if get_search_field_owner(admin_model, field) not in fields:
                     raise AdminApiException(422, detail=f"Search by {field} is not allowed")
 
-        exclude_filter_fields = ("search", "sort_by", "offset", "limit")
+        exclude_filter_fields = ("search", "sort_by", "offset", "limit", "cursor")
         query_filters: dict[tuple[str, str], bool | str | None] | None = None
         if query_params.filters:
             for k in query_params.filters:
@@ -235,13 +383,17 @@ class ApiService:
                 if field not in fields:
                     raise AdminApiException(422, detail=f"Select related by {field} is not allowed")
 
-        return await admin_model.get_list(
-            offset=query_params.offset,
-            limit=query_params.limit,
-            search=query_params.search,
-            sort_by=query_params.sort_by,
-            filters=query_filters,
-        )
+        try:
+            return await admin_model.get_list(
+                offset=query_params.offset,
+                limit=query_params.limit,
+                search=query_params.search,
+                sort_by=query_params.sort_by,
+                filters=query_filters,
+                cursor=query_params.cursor,
+            )
+        except ValueError as e:
+            raise AdminApiException(422, detail=str(e)) from e
 
     async def get(
         self,
@@ -334,7 +486,7 @@ class ApiService:
         search: str | None = None,
         sort_by: str | None = None,
         filters: dict | None = None,
-    ) -> tuple[str, str, StringIO | BytesIO | None]:
+    ) -> tuple[str, str, AsyncIterator[str | bytes] | None]:
         current_user_id = await get_user_id_from_session_id(session_id)
         if not current_user_id:
             raise AdminApiException(401, detail="User is not authenticated.")
@@ -345,6 +497,7 @@ class ApiService:
             filters=filters or {},
             offset=payload.offset,
             limit=payload.limit,
+            cursor=payload.cursor,
         )
 
         admin_model = get_admin_or_admin_inline_model(model)
@@ -356,10 +509,10 @@ class ApiService:
 
         if query_params.search and admin_model.search_fields:
             for field in admin_model.search_fields:
-                if field not in fields:
+                if get_search_field_owner(admin_model, field) not in fields:
                     raise AdminApiException(422, detail=f"Search by {field} is not allowed")
 
-        exclude_filter_fields = ("search", "sort_by", "offset", "limit")
+        exclude_filter_fields = ("search", "sort_by", "offset", "limit", "cursor")
         query_filters: dict[tuple[str, str], bool | str | None] | None = None
         if query_params.filters:
             for k in query_params.filters:
@@ -382,6 +535,9 @@ class ApiService:
                 if ordering_field.strip("-") not in fields:
                     raise AdminApiException(422, detail=f"Sort by {ordering_field} is not allowed")
 
+        if payload.format in (ExportFormat.PARQUET, ExportFormat.ARROW) and not pyarrow_installed:
+            raise AdminApiException(422, detail=f"Export to {payload.format.value} requires pyarrow to be installed")
+
         content_type = "text/plain"
         file_name = f"{model}.txt"
         if payload.format == ExportFormat.CSV:
@@ -390,18 +546,28 @@ class ApiService:
         elif payload.format == ExportFormat.JSON:
             content_type = "text/plain"
             file_name = f"{model}.json"
-        return (
-            file_name,
-            content_type,
-            await admin_model.get_export(
+        elif payload.format == ExportFormat.NDJSON:
+            content_type = "application/x-ndjson"
+            file_name = f"{model}.ndjson"
+        elif payload.format == ExportFormat.PARQUET:
+            content_type = "application/vnd.apache.parquet"
+            file_name = f"{model}.parquet"
+        elif payload.format == ExportFormat.ARROW:
+            content_type = "application/vnd.apache.arrow.file"
+            file_name = f"{model}.arrow"
+        try:
+            stream = await admin_model.get_export(
                 payload.format,
                 offset=query_params.offset,
                 limit=query_params.limit,
                 search=query_params.search,
                 sort_by=query_params.sort_by,
                 filters=query_filters,
-            ),
-        )
+                cursor=query_params.cursor,
+            )
+        except ValueError as e:
+            raise AdminApiException(422, detail=str(e)) from e
+        return file_name, content_type, stream
 
     async def delete(
         self,
@@ -422,7 +588,142 @@ class ApiService:
         await admin_model.delete_model(id)
         return id
 
-    async def action(self, session_id: str | None, model: str, action: str, payload: ActionInputSchema) -> None:
+    async def bulk_delete(
+        self,
+        session_id: str | None,
+        model: str,
+        payload: BulkInputSchema,
+        background: bool = True,
+    ) -> BulkJobOutputSchema:
+        current_user_id = await get_user_id_from_session_id(session_id)
+        if not current_user_id:
+            raise AdminApiException(401, detail="User is not authenticated.")
+
+        admin_model = get_admin_or_admin_inline_model(model)
+        if not admin_model:
+            raise AdminApiException(404, detail=f"{model} model is not registered.")
+
+        if model == settings.ADMIN_USER_MODEL and str(current_user_id) in {str(id) for id in payload.ids}:
+            raise AdminApiException(403, detail="You cannot delete yourself.")
+
+        return await self._bulk_job(
+            current_user_id,
+            admin_model,
+            model,
+            "delete",
+            payload.ids,
+            payload.job_id,
+            payload.final,
+            lambda ids, progress: admin_model.delete_many(ids, progress=progress),
+            background,
+        )
+
+    async def bulk_update(
+        self,
+        session_id: str | None,
+        model: str,
+        payload: BulkInputSchema,
+        background: bool = True,
+    ) -> BulkJobOutputSchema:
+        current_user_id = await get_user_id_from_session_id(session_id)
+        if not current_user_id:
+            raise AdminApiException(401, detail="User is not authenticated.")
+
+        admin_model = get_admin_or_admin_inline_model(model)
+        if not admin_model:
+            raise AdminApiException(404, detail=f"{model} model is not registered.")
+
+        values = payload.values or {}
+        if payload.final:
+            if not values:
+                raise AdminApiException(422, detail="Values to update are required.")
+            try:
+                admin_model.get_bulk_update_values(values)
+            except ValueError as e:
+                raise AdminApiException(422, detail=str(e)) from e
+
+        return await self._bulk_job(
+            current_user_id,
+            admin_model,
+            model,
+            "update",
+            payload.ids,
+            payload.job_id,
+            payload.final,
+            lambda ids, progress: admin_model.update_many(ids, values, progress=progress),
+            background,
+        )
+
+    async def bulk_job(self, session_id: str | None, job_id: str) -> BulkJobOutputSchema:
+        current_user_id = await get_user_id_from_session_id(session_id)
+        if not current_user_id:
+            raise AdminApiException(401, detail="User is not authenticated.")
+
+        job = bulk_jobs.get(job_id)
+        if not job or job.user_id != str(current_user_id):
+            raise AdminApiException(404, detail=f"{job_id} job is not found.")
+        return job.to_output()
+
+    async def _bulk_job(
+        self,
+        current_user_id: UUID | int,
+        admin_model: ModelAdmin | InlineModelAdmin,
+        model: str,
+        operation: str,
+        ids: Sequence[int | UUID],
+        job_id: str | None,
+        final: bool,
+        run: Callable[[Sequence[int | UUID], Callable[[int], None]], Awaitable[Any]],
+        background: bool,
+    ) -> BulkJobOutputSchema:
+        """Collect ids of a bulk operation and run it, in background when there are more than bulk_background_threshold.
+
+        :return: A bulk job output.
+        """
+        now = time.monotonic()
+        for key in [
+            key
+            for key, job in bulk_jobs.items()
+            if job.status != BulkJobStatus.RUNNING and job.updated_at + BULK_JOBS_TTL < now
+        ]:
+            del bulk_jobs[key]
+
+        if job_id:
+            job = bulk_jobs.get(job_id)
+            if not job or job.user_id != str(current_user_id) or job.status != BulkJobStatus.RECEIVING:
+                raise AdminApiException(404, detail=f"{job_id} job is not found.")
+            if (job.model, job.operation) != (model, operation):
+                raise AdminApiException(422, detail=f"{job_id} job is a bulk {job.operation} of {job.model}.")
+        else:
+            job = BulkJob(id=uuid4().hex, user_id=str(current_user_id), model=model, operation=operation)
+        job.ids += ids
+        job.updated_at = now
+
+        if not final:
+            bulk_jobs[job.id] = job
+            return job.to_output()
+
+        job.ids = list(dict.fromkeys(job.ids))
+        if not background or len(job.ids) <= admin_model.bulk_background_threshold:
+            bulk_jobs.pop(job.id, None)
+            await run_bulk_job(job, run, background=False)
+            return job.to_output()
+
+        bulk_jobs[job.id] = job
+        job.status = BulkJobStatus.RUNNING
+        task = asyncio.create_task(run_bulk_job(job, run, background=True))
+        bulk_job_tasks.add(task)
+        task.add_done_callback(bulk_job_tasks.discard)
+        return job.to_output()
+
+    async def action(
+        self,
+        session_id: str | None,
+        model: str,
+        action: str,
+        payload: ActionInputSchema,
+        background: bool = True,
+    ) -> BulkJobOutputSchema:
         current_user_id = await get_user_id_from_session_id(session_id)
         if not current_user_id:
             raise AdminApiException(401, detail="User is not authenticated.")
@@ -443,7 +744,17 @@ class ApiService:
         else:
             action_function_fn = sync_to_async(action_function)
 
-        await action_function_fn(payload.ids)
+        return await self._bulk_job(
+            current_user_id,
+            admin_model,
+            model,
+            action,
+            payload.ids,
+            payload.job_id,
+            payload.final,
+            lambda ids, progress: action_function_fn(ids),
+            background,
+        )
 
     async def get_configuration(
         self,
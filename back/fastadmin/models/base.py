@@ -1,17 +1,162 @@
 import csv
 import datetime
+import functools
 import inspect
 import json
-from collections.abc import Sequence
-from io import BytesIO, StringIO
-from typing import Any
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from decimal import Decimal
+from enum import Enum
+from io import StringIO
+from operator import attrgetter
+from typing import Any, cast
 from uuid import UUID
 
 from asgiref.sync import sync_to_async
 
-from fastadmin.api.helpers import is_valid_base64
+from fastadmin.api.helpers import decode_cursor, encode_cursor, is_valid_base64
 from fastadmin.api.schemas import ExportFormat
 from fastadmin.models.schemas import DashboardWidgetType, ModelFieldWidgetSchema, WidgetType
+from fastadmin.models.search import IContainsSearch, SearchBackend
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is only needed for parquet and arrow exports
+    pa = None
+    pq = None
+
+pyarrow_installed = pa is not None
+
+# computed field metadata by (admin class, orm model class, ...), cleared when admin models are (un)registered
+admin_fields_cache: dict[tuple, Any] = {}
+
+# max number of (search, filters) totals cached per admin model with count_strategy = "cached"
+LIST_TOTALS_CACHE_MAX_SIZE = 1000
+
+
+def cache_model_fields(
+    get_fields: Callable[..., list[ModelFieldWidgetSchema]],
+) -> Callable[..., list[ModelFieldWidgetSchema]]:
+    """Memoize get_model_fields_with_widget_types per (admin class, orm model class, with_m2m, with_upload).
+
+    The fields depend only on the orm model metadata and the admin class settings, so they are computed once.
+
+    :params get_fields: a get_model_fields_with_widget_types method of an orm mixin.
+    :return: A wrapped method.
+    """
+
+    @functools.wraps(get_fields)
+    def wrapper(
+        self: "BaseModelAdmin",
+        with_m2m: bool | None = None,
+        with_upload: bool | None = None,
+    ) -> list[ModelFieldWidgetSchema]:
+        key = (type(self), self.model_cls, "fields", with_m2m, with_upload)
+        fields = admin_fields_cache.get(key)
+        if fields is None:
+            fields = admin_fields_cache[key] = get_fields(self, with_m2m=with_m2m, with_upload=with_upload)
+        return fields
+
+    return wrapper
+
+
+class ExportJSONEncoder(json.JSONEncoder):
+    def default(self, obj):
+        try:
+            return super().default(obj)
+        except TypeError:
+            return str(obj)
+
+
+class ExportChunkSink:
+    """Write-only file for pyarrow writers which hands out the bytes written so far.
+
+    The position keeps growing when the written bytes are taken out,
+    so the offsets written to parquet/arrow footers stay right.
+    """
+
+    closed = False
+
+    def __init__(self):
+        self.chunks: list[bytes] = []
+        self.position = 0
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self.chunks.append(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def writable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def take(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def get_arrow_column(field: ModelFieldWidgetSchema, values: list[Any]) -> tuple[Any, Callable[[Any], Any]]:
+    """Arrow type of an export column and a converter of serialized values to it.
+
+    The type comes from the form widget of the field. Number and free input widgets don't tell
+    int from float, decimal or uuid, so for them it's taken from the first value of the first chunk.
+
+    :params field: a model field schema.
+    :params values: serialized values of the first chunk.
+    :return: A tuple of arrow type and converter.
+    """
+
+    def to_str(value: Any) -> str | None:
+        if value is None or isinstance(value, str) and not isinstance(value, Enum):
+            return value
+        if isinstance(value, Enum):
+            return str(value.value)
+        if isinstance(value, dict | list | tuple):
+            return json.dumps(value, cls=ExportJSONEncoder)
+        return str(value)
+
+    def to_timestamp(value: Any) -> datetime.datetime | None:
+        if isinstance(value, str):
+            return datetime.datetime.fromisoformat(value)
+        return value
+
+    keep = lambda value: value  # noqa: E731
+
+    match field.form_widget_type:
+        case WidgetType.Switch | WidgetType.Checkbox:
+            return pa.bool_(), keep
+        case WidgetType.DatePicker:
+            return pa.date32(), keep
+        case WidgetType.DateTimePicker:
+            return pa.timestamp("us", tz="UTC"), to_timestamp
+        case WidgetType.TimePicker:
+            return pa.time64("us"), keep
+        case WidgetType.InputNumber | WidgetType.Input | WidgetType.AsyncSelect:
+            sample = next((v for v in values if v is not None), None)
+            if isinstance(sample, bool):
+                return pa.bool_(), keep
+            if isinstance(sample, int):
+                return pa.int64(), keep
+            if isinstance(sample, float):
+                return pa.float64(), keep
+            if isinstance(sample, Decimal):
+                # the scale of a field isn't known here, so every decimal column gets the widest one money needs
+                return pa.decimal128(38, 10), keep
+    return pa.string(), to_str
 
 
 class BaseModelAdmin:
@@ -130,6 +275,12 @@ class BaseModelAdmin:
     # Example of usage: list_select_related = ("user",)
     list_select_related: Sequence[str] = ()
 
+    # Set str_depends_on to the model fields which __str__ of the model reads.
+    # With it the list page loads only the columns of list_display, of display functions dependencies
+    # (see display(depends_on=...)) and of __str__, otherwise it loads whole objects.
+    # Example of usage: str_depends_on = ("username", "email")
+    str_depends_on: Sequence[str] | None = None
+
     # Set ordering to specify how lists of objects should be ordered in the admin views.
     # This should be a list or tuple in the same format as a model's ordering parameter.
     # Example of usage: ordering = ("-created_at",)
@@ -170,6 +321,17 @@ class BaseModelAdmin:
     # Example of usage: search_fields = ("mobile_number", "email")
     search_fields: Sequence[str] = ()
 
+    # Set search_backend to control how the search box query is matched (see fastadmin.models.search):
+    # IContainsSearch() - OR of icontains of search_fields (default),
+    # PostgresFullTextSearch(fields=...) - a generated tsvector column with a GIN index,
+    # TrigramSearch(fields=...) - ILIKE with pg_trgm GIN indexes,
+    # InMemorySearchIndex() - an in process inverted index of search_fields, e.g. for SQLite.
+    # Example of usage: search_backend = PostgresFullTextSearch(fields=("title", "text"))
+    search_backend: SearchBackend = IContainsSearch()
+
+    # Whether search_fields may have fields of related models (e.g. "user__username"), it's set by the orm mixins.
+    supports_related_search_fields: bool = False
+
     # Set search_help_text to specify a descriptive text for the search box which will be displayed below it.
     # Example of usage: search_help_text = "Search by mobile number or email"
     search_help_text: str = ""
@@ -193,12 +355,59 @@ class BaseModelAdmin:
     # An override to the verbose_name_plural from the model's inner Meta class.
     verbose_name_plural: str | None = None
 
+    # Set export_chunk_size to control how many objects are read from db and encoded at once while exporting.
+    # Example of usage: export_chunk_size = 500
+    export_chunk_size: int = 1000
+
+    # Set count_strategy to control how the total of the list page is counted:
+    # "exact" - count the filtered objects on every request,
+    # "cached" - count them and keep the total for count_cache_ttl seconds per search and filters,
+    # "estimate" - use the database planner estimate when it's above count_estimate_threshold, count otherwise.
+    # Orm mixins without estimates (e.g. not postgres) count exactly.
+    # Example of usage: count_strategy = "estimate"
+    count_strategy: str = "exact"
+    count_cache_ttl: int = 60
+    count_estimate_threshold: int = 100_000
+
+    # Set bulk_chunk_size to control how many ids go to one IN statement of bulk delete and update.
+    # All chunks of an operation run in one transaction.
+    # Example of usage: bulk_chunk_size = 500
+    bulk_chunk_size: int = 1000
+
+    # Bulk operations and actions on more ids than bulk_background_threshold run as background jobs,
+    # the api responds with a job to poll for progress instead of waiting for them.
+    # Example of usage: bulk_background_threshold = 1000
+    bulk_background_threshold: int = 10_000
+
+    # Run sync __str__ and display functions in a thread when serializing objects.
+    # Orm mixins with sync db access (e.g. lazy relations of django models) enable it, for others they are called inline.
+    serialize_sync_in_thread: bool = False
+
     def __init__(self, model_cls: Any):
         """This method is used to initialize admin class.
 
         :params model_cls: an orm/db model class.
         """
         self.model_cls = model_cls
+        self._row_serializers: dict[tuple, Callable[..., Awaitable[dict]]] = {}
+        # (search, filters) -> (expires at, total) for count_strategy = "cached"
+        self._list_totals: dict[tuple, tuple[float, int]] = {}
+        self.check_search_fields()
+
+    def check_search_fields(self) -> None:
+        """This method is used to validate search_fields and search_backend when the admin model is created.
+
+        :raises ValueError: if a search field isn't supported by the orm or by the search backend.
+        :return: None.
+        """
+        if not self.supports_related_search_fields:
+            related = [name for name in self.search_fields if "__" in name]
+            if related:
+                raise ValueError(
+                    f"{type(self).__name__}: search by fields of related models is not supported by the orm: "
+                    f"{', '.join(related)}."
+                )
+        self.search_backend.check(self)
 
     @staticmethod
     def get_model_pk_name(orm_model_cls: Any) -> str:
@@ -221,6 +430,73 @@ class BaseModelAdmin:
         """
         raise NotImplementedError
 
+    def get_keyset_ordering(self, sort_by: str | None = None) -> list[str]:
+        """This method is used to get an ordering for keyset (cursor) pagination.
+
+        It's the sort field (or the first ordering field) and pk as a tie breaker, in the same direction.
+
+        :params sort_by: a sort by field name.
+        :return: A list of column names, prefixed with "-" for descending order.
+        """
+        pk_name = self.get_model_pk_name(self.model_cls)
+        sort_field = sort_by or (self.ordering[0] if self.ordering else pk_name)
+        direction = "-" if sort_field.startswith("-") else ""
+        field_name = sort_field.lstrip("-")
+        column_name = next(
+            (
+                f.column_name
+                for f in self.get_model_fields_with_widget_types(with_m2m=False, with_upload=False)
+                if f.name == field_name
+            ),
+            field_name,
+        )
+        if column_name == pk_name:
+            return [direction + pk_name]
+        return [direction + column_name, direction + pk_name]
+
+    async def resolve_search(self, search: str | None, filters: dict | None) -> tuple[str | None, dict | None]:
+        """This method is used to match the search with search_backend when it's matched in process.
+
+        :params search: a search query.
+        :params filters: a dict of filters.
+        :return: A tuple of search and filters, the search is replaced with a pk filter when it's matched.
+        """
+        if not search:
+            return search, filters
+        pks = await self.search_backend.get_pks(self, search)
+        if pks is None:
+            return search, filters
+        pk_name = self.get_model_pk_name(self.model_cls)
+        return None, {**(filters or {}), (pk_name, "in"): list(pks)}
+
+    def parse_cursor(self, cursor: str | None, sort_by: str | None = None) -> tuple[list[str] | None, list[Any] | None]:
+        """This method is used to get keyset ordering and position of a cursor.
+
+        :params cursor: a cursor, an empty one for the first page, None for offset pagination.
+        :params sort_by: a sort by field name.
+        :return: A tuple of keyset ordering and values to start after (None for the first page).
+        :raises ValueError: If the cursor is malformed.
+        """
+        if cursor is None:
+            return None, None
+        keyset = self.get_keyset_ordering(sort_by)
+        if not cursor:
+            return keyset, None
+        after = decode_cursor(cursor)
+        if len(after) != len(keyset):
+            raise ValueError("Cursor doesn't match the sorting")
+        return keyset, after
+
+    @staticmethod
+    def get_keyset_values(obj: Any, keyset: Sequence[str]) -> list[Any]:
+        """This method is used to get values of keyset fields of orm/db model object.
+
+        :params obj: an object.
+        :params keyset: an ordering for keyset pagination.
+        :return: A list of values.
+        """
+        return [getattr(obj, field.lstrip("-")) for field in keyset]
+
     async def orm_get_list(
         self,
         offset: int | None = None,
@@ -228,7 +504,11 @@ class BaseModelAdmin:
         search: str | None = None,
         sort_by: str | None = None,
         filters: dict | None = None,
-    ) -> tuple[list[Any], int]:
+        with_total: bool = True,
+        keyset: Sequence[str] | None = None,
+        after: Sequence[Any] | None = None,
+        only: Sequence[str] | None = None,
+    ) -> tuple[list[Any], int | None]:
         """This method is used to get list of orm/db model objects.
 
         :params offset: an offset for pagination.
@@ -236,10 +516,114 @@ class BaseModelAdmin:
         :params search: a search query.
         :params sort_by: a sort by field name.
         :params filters: a dict of filters.
+        :params with_total: a flag to count objects, the total is None without it.
+        :params keyset: an ordering for keyset pagination (see get_keyset_ordering), it replaces sort_by.
+        :params after: values of the keyset fields of the last object of the previous page.
+        :params only: names of fields to load (see get_list_fields), None to load whole objects.
         :return: A tuple of list of objects and total count.
         """
         raise NotImplementedError
 
+    async def orm_estimate_count(
+        self,
+        search: str | None = None,
+        filters: dict | None = None,
+    ) -> int | None:
+        """This method is used to get the database planner estimate of list objects count.
+
+        :params search: a search query.
+        :params filters: a dict of filters.
+        :return: An estimated count or None when the database can't estimate it.
+        """
+        return None
+
+    async def orm_iter_list(
+        self,
+        offset: int | None = None,
+        limit: int | None = None,
+        search: str | None = None,
+        sort_by: str | None = None,
+        filters: dict | None = None,
+        chunk_size: int = 1000,
+        keyset: Sequence[str] | None = None,
+        after: Sequence[Any] | None = None,
+    ) -> AsyncIterator[list[Any]]:
+        """This method is used to iterate orm/db model objects of a list in chunks, for exports.
+
+        Orm mixins may use a server-side cursor, by default it pages through orm_get_list with keyset pagination,
+        so every chunk costs the same.
+
+        :params offset: an offset to start from.
+        :params limit: a max number of objects, None for all.
+        :params search: a search query.
+        :params sort_by: a sort by field name.
+        :params filters: a dict of filters.
+        :params chunk_size: a number of objects per chunk.
+        :params keyset: an ordering for keyset pagination, by default it's made of sort_by.
+        :params after: values of the keyset fields of the object to start after.
+        :return: An async iterator of lists of objects.
+        """
+        keyset = keyset or self.get_keyset_ordering(sort_by)
+        position = offset or 0
+        remaining = limit
+        while remaining is None or remaining > 0:
+            size = chunk_size if remaining is None else min(chunk_size, remaining)
+            objs, _ = await self.orm_get_list(
+                offset=position,
+                limit=size,
+                search=search,
+                filters=filters,
+                with_total=False,
+                keyset=keyset,
+                after=after,
+            )
+            objs = list(objs)
+            if not objs:
+                return
+            yield objs
+            if len(objs) < size:
+                return
+            position = 0
+            after = self.get_keyset_values(objs[-1], keyset)
+            if remaining is not None:
+                remaining -= len(objs)
+
+    async def orm_get_search_documents(self, fields: Sequence[str]) -> list[tuple[Any, ...]]:
+        """This method is used to get pk and values of fields of all orm/db model objects, to index them for search.
+
+        :params fields: a list of field names, related fields are separated by "__".
+        :return: A list of tuples of pk and values.
+        """
+        pk_name = self.get_model_pk_name(self.model_cls)
+        getter = attrgetter(pk_name, *(f.replace("__", ".") for f in fields))
+        documents = []
+        async for objs in self.orm_iter_list(chunk_size=self.export_chunk_size):
+            documents += [getter(obj) for obj in objs]
+        return documents
+
+    async def orm_delete_many(
+        self, ids: Sequence[UUID | int], progress: Callable[[int], None] | None = None
+    ) -> int:
+        """This method is used to delete orm/db model objects with IN statements of bulk_chunk_size ids in a transaction.
+
+        :params ids: ids of objects.
+        :params progress: a function called with a number of processed ids after every chunk.
+        :return: A number of deleted objects.
+        """
+        raise NotImplementedError
+
+    async def orm_update_many(
+        self, ids: Sequence[UUID | int], values: dict[str, Any], progress: Callable[[int], None] | None = None
+    ) -> int:
+        """This method is used to update orm/db model objects with IN statements of bulk_chunk_size ids in a transaction.
+
+        :params ids: ids of objects.
+        :params values: a dict of column names and new values.
+        :params progress: a function called with a number of processed ids after every chunk.
+        :return: A number of updated objects.
+        """
+        raise NotImplementedError
+
     async def orm_get_obj(self, id: UUID | int) -> Any | None:
         """This method is used to get orm/db model object.
 
@@ -275,6 +659,19 @@ class BaseModelAdmin:
         """
         raise NotImplementedError
 
+    async def orm_get_m2m_ids_bulk(self, objs: list[Any], field: str) -> dict[Any, list[int | UUID]]:
+        """This method is used to get m2m ids of several objects.
+
+        Orm mixins implement it with one query, by default it calls orm_get_m2m_ids for each object.
+
+        :params objs: a list of objects.
+        :params field: a m2m field name.
+
+        :return: A dict of object pk to a list of ids.
+        """
+        pk_name = self.get_model_pk_name(self.model_cls)
+        return {getattr(obj, pk_name): await self.orm_get_m2m_ids(obj, field) for obj in objs}
+
     async def orm_save_m2m_ids(self, obj: Any, field: str, ids: list[int | UUID]) -> None:
         """This method is used to get m2m ids.
 
@@ -319,6 +716,13 @@ class BaseModelAdmin:
 
         :return: A set of fields.
         """
+        key = (type(self), self.model_cls, "fields_for_serialize")
+        fields_for_serialize = admin_fields_cache.get(key)
+        if fields_for_serialize is None:
+            fields_for_serialize = admin_fields_cache[key] = self._get_fields_for_serialize()
+        return fields_for_serialize
+
+    def _get_fields_for_serialize(self) -> set[str]:
         fields = self.get_model_fields_with_widget_types()
         fields_for_serialize = {field.name for field in fields}
         if self.fields:
@@ -329,6 +733,47 @@ class BaseModelAdmin:
             fields_for_serialize |= set(self.list_display)
         return fields_for_serialize
 
+    def get_list_fields(self, keyset: Sequence[str] | None = None) -> list[str] | None:
+        """This method is used to get fields which the list page reads, to load only their columns.
+
+        :params keyset: an ordering for keyset pagination, its fields are read for the next cursor.
+        :return: A list of field names or None if whole objects are needed.
+        """
+        key = (type(self), self.model_cls, "list_fields")
+        if key not in admin_fields_cache:
+            admin_fields_cache[key] = self._get_list_fields()
+        list_fields = admin_fields_cache[key]
+        if list_fields is None or not keyset:
+            return list_fields
+        keyset_columns = {field.lstrip("-") for field in keyset}
+        return list_fields + [
+            field.name
+            for field in self.get_model_fields_with_widget_types()
+            if field.column_name in keyset_columns and field.name not in list_fields
+        ]
+
+    def _get_list_fields(self) -> list[str] | None:
+        if not self.list_display or self.str_depends_on is None:
+            return None
+        if type(self).serialize_obj is not BaseModelAdmin.serialize_obj:
+            return None  # an overridden serialize_obj may read any field
+
+        fields = self.get_model_fields_with_widget_types()
+        columns = {field.name for field in fields if not field.is_m2m}
+        m2m_fields = {field.name for field in fields if field.is_m2m}
+        list_fields = [self.get_model_pk_name(self.model_cls), *self.str_depends_on]
+        for field_name in self.list_display:
+            display_field_function = getattr(self, field_name, None)
+            if display_field_function and hasattr(display_field_function, "is_display"):
+                if display_field_function.depends_on is None:
+                    return None
+                list_fields += display_field_function.depends_on
+            elif field_name not in m2m_fields:  # m2m ids are loaded by pks
+                list_fields.append(field_name)
+        if not set(list_fields) <= columns:
+            return None  # e.g. a property of the model or a field of a related model
+        return list(dict.fromkeys(list_fields))
+
     async def serialize_obj_attributes(
         self, obj: Any, attributes_to_serizalize: list[ModelFieldWidgetSchema]
     ) -> dict[str, Any]:
@@ -353,10 +798,65 @@ class BaseModelAdmin:
         :params exclude_fields: a list of fields to exclude.
         :return: A dict.
         """
+        return await self.get_row_serializer(list_view=list_view)(obj)
+
+    async def serialize_objs(
+        self, objs: list[Any], list_view: bool = False, only: Sequence[str] | None = None
+    ) -> list[dict]:
+        """Serialize orm model objs to dicts, m2m ids are loaded with one query per m2m field.
+
+        :params objs: a list of objects.
+        :params list_view: a flag to skip m2m fields.
+        :params only: names of fields loaded for the objects (see get_list_fields), None for whole objects.
+        :return: A list of dicts.
+        """
+        if type(self).serialize_obj is not BaseModelAdmin.serialize_obj:
+            # respect an overridden serialize_obj
+            return [await self.serialize_obj(obj, list_view=list_view) for obj in objs]
+
+        serialize = self.get_row_serializer(list_view=list_view, only=only)
+        m2m_ids = {
+            field_name: await self.orm_get_m2m_ids_bulk(objs, column_name) if objs else {}
+            for field_name, column_name in serialize.m2m_fields
+        }
+        pk_name = self.get_model_pk_name(self.model_cls)
+        serialized_objs = []
+        for obj in objs:
+            pk = getattr(obj, pk_name)
+            obj_m2m_ids = {field_name: ids.get(pk, []) for field_name, ids in m2m_ids.items()}
+            serialized_objs.append(await serialize(obj, obj_m2m_ids))
+        return serialized_objs
+
+    def get_row_serializer(
+        self, list_view: bool = False, only: Sequence[str] | None = None
+    ) -> Callable[..., Awaitable[dict]]:
+        """Get a function serializing an orm model obj to dict, compiled once per admin model, list_view and only.
+
+        :params list_view: a flag to skip m2m fields.
+        :params only: names of fields loaded for objects, other model fields aren't serialized.
+        :return: An async function.
+        """
+        key = (list_view, tuple(only) if only is not None else None)
+        serializer = self._row_serializers.get(key)
+        if serializer is None:
+            serializer = self._row_serializers[key] = self._compile_row_serializer(list_view, only)
+        return serializer
+
+    def _wrap_sync(self, fn: Callable) -> tuple[Callable, bool]:
+        if inspect.iscoroutinefunction(fn):
+            return fn, True
+        if self.serialize_sync_in_thread:
+            return sync_to_async(fn), True
+        return fn, False
+
+    def _compile_row_serializer(self, list_view: bool, only: Sequence[str] | None) -> Callable[..., Awaitable[dict]]:
         fields = self.get_model_fields_with_widget_types()
         fields_for_serialize = self.get_fields_for_serialize()
+        if only is not None:
+            # projected objects have only these fields, display functions of list_display read them
+            fields_for_serialize = fields_for_serialize & {*only, *self.list_display}
 
-        obj_dict = {}
+        m2m_fields = []
         attributes_to_serizalize = []
         for field in fields:
             if field.name not in fields_for_serialize:
@@ -364,25 +864,51 @@ class BaseModelAdmin:
             if field.is_m2m and list_view:
                 continue
             if field.is_m2m:
-                obj_dict[field.name] = await self.orm_get_m2m_ids(obj, field.column_name)
+                m2m_fields.append((field.name, field.column_name))
             else:
                 attributes_to_serizalize.append(field)
 
-        obj_dict.update(await self.serialize_obj_attributes(obj, attributes_to_serizalize))
-
+        display_functions = []
         for field_name in fields_for_serialize:
             display_field_function = getattr(self, field_name, None)
             if not display_field_function or not hasattr(display_field_function, "is_display"):
                 continue
-
-            if inspect.iscoroutinefunction(display_field_function):
-                display_field_function_fn = display_field_function
+            display_functions.append((field_name, *self._wrap_sync(display_field_function)))
+
+        # orm mixins may override serialize_obj_attributes (e.g. pony), otherwise it's inlined
+        custom_attributes = type(self).serialize_obj_attributes is not BaseModelAdmin.serialize_obj_attributes
+        attribute_getters = [(field.name, attrgetter(field.column_name)) for field in attributes_to_serizalize]
+        str_is_async = inspect.iscoroutinefunction(getattr(self.model_cls, "__str__", None))
+        str_in_thread = not str_is_async and self.serialize_sync_in_thread
+
+        async def serialize(obj: Any, m2m_ids: dict[str, list[int | UUID]] | None = None) -> dict:
+            obj_dict = {}
+            for field_name, column_name in m2m_fields:
+                if m2m_ids is not None:  # loaded for a batch of objects by serialize_objs
+                    obj_dict[field_name] = m2m_ids[field_name]
+                else:
+                    obj_dict[field_name] = await self.orm_get_m2m_ids(obj, column_name)
+
+            if custom_attributes:
+                obj_dict.update(await self.serialize_obj_attributes(obj, attributes_to_serizalize))
             else:
-                display_field_function_fn = sync_to_async(display_field_function)
+                for field_name, getter in attribute_getters:
+                    obj_dict[field_name] = getter(obj)
+                if str_is_async:
+                    obj_dict["__str__"] = await obj.__str__()
+                elif str_in_thread:
+                    obj_dict["__str__"] = await sync_to_async(obj.__str__)()
+                else:
+                    obj_dict["__str__"] = obj.__str__()
 
-            obj_dict[field_name] = await display_field_function_fn(obj)
+            for field_name, display_function, is_async in display_functions:
+                value = display_function(obj)
+                obj_dict[field_name] = await value if is_async else value
 
-        return obj_dict
+            return obj_dict
+
+        serialize.m2m_fields = m2m_fields
+        return serialize
 
     def deserialize_value(self, field: ModelFieldWidgetSchema, value: Any) -> Any:
         if not value:
@@ -402,27 +928,66 @@ class BaseModelAdmin:
         search: str | None = None,
         sort_by: str | None = None,
         filters: dict | None = None,
-    ) -> tuple[list[dict], int]:
+        cursor: str | None = None,
+    ) -> tuple[list[dict], int, bool, str | None]:
         """This method is used to get list of seriaized objects.
 
-        :params offset: an offset for pagination.
+        The total is counted according to count_strategy. Objects are loaded with the columns of get_list_fields only,
+        when the admin model declares what __str__ and display functions read.
+        With a cursor (an empty one for the first page) the page is read with keyset pagination instead of offset,
+        so deep pages cost the same as the first one.
+
+        :params offset: an offset for pagination, ignored with a cursor.
         :params limit: a limit for pagination.
         :params search: a search query.
         :params sort_by: a sort by field name.
         :params filters: a dict of filters.
-        :return: A tuple of list of dict and total count.
+        :params cursor: a cursor of the page, None for offset pagination.
+        :return: A tuple of list of dict, total count, a flag if the total is estimated and a cursor of the next page.
+        :raises ValueError: If the cursor is malformed.
         """
-        objs, total = await self.orm_get_list(
+        keyset, after = self.parse_cursor(cursor, sort_by)
+        if keyset:
+            offset = 0
+        only = self.get_list_fields(keyset)
+
+        total: int | None = None
+        is_estimate = False
+        cache_key = (search, tuple(sorted((filters or {}).items(), key=repr)))
+        search, filters = await self.resolve_search(search, filters)
+        match self.count_strategy:
+            case "cached":
+                expires_at, cached_total = self._list_totals.get(cache_key, (0.0, 0))
+                if expires_at > time.monotonic():
+                    total = cached_total
+            case "estimate":
+                estimate = await self.orm_estimate_count(search=search, filters=filters)
+                if estimate is not None and estimate >= self.count_estimate_threshold:
+                    total, is_estimate = estimate, True
+
+        objs, counted_total = await self.orm_get_list(
             offset=offset,
             limit=limit,
             search=search,
             sort_by=sort_by,
             filters=filters,
+            with_total=total is None,
+            keyset=keyset,
+            after=after,
+            only=only,
         )
-        serialized_objs = []
-        for obj in objs:
-            serialized_objs.append(await self.serialize_obj(obj, list_view=True))
-        return serialized_objs, total
+        objs = list(objs)
+        if total is None:
+            total = cast(int, counted_total)
+            if self.count_strategy == "cached":
+                if len(self._list_totals) >= LIST_TOTALS_CACHE_MAX_SIZE:
+                    self._list_totals.clear()
+                self._list_totals[cache_key] = (time.monotonic() + self.count_cache_ttl, total)
+
+        next_cursor = None
+        if keyset and objs and limit is not None and len(objs) >= limit:
+            next_cursor = encode_cursor(self.get_keyset_values(objs[-1], keyset))
+        return await self.serialize_objs(objs, list_view=True, only=only), total, is_estimate, next_cursor
 
     async def get_obj(self, id: UUID | int) -> dict | None:
         """This method is used to get serialized object by id.
@@ -454,6 +1019,8 @@ class BaseModelAdmin:
         obj = await self.orm_save_obj(id, fields_payload)
         if not obj:
             return None
+        self._list_totals.clear()
+        self.search_backend.invalidate(self)
 
         for upload_field in upload_fields:
             if upload_field.name in payload and is_valid_base64(payload[upload_field.name]):
@@ -472,6 +1039,54 @@ class BaseModelAdmin:
         :return: None.
         """
         await self.orm_delete_obj(id)
+        self._list_totals.clear()
+        self.search_backend.invalidate(self)
+
+    async def delete_many(
+        self, ids: Sequence[UUID | int], progress: Callable[[int], None] | None = None
+    ) -> int:
+        """This method is used to delete orm/db model objects in bulk.
+
+        :params ids: ids of objects.
+        :params progress: a function called with a number of processed ids after every chunk.
+        :return: A number of deleted objects.
+        """
+        deleted = await self.orm_delete_many(ids, progress=progress)
+        self._list_totals.clear()
+        self.search_backend.invalidate(self)
+        return deleted
+
+    def get_bulk_update_values(self, values: dict[str, Any]) -> dict[str, Any]:
+        """This method is used to convert values of fields for a bulk update to values of columns.
+
+        :params values: a dict of field names and new values.
+        :return: A dict of column names and new values.
+        :raises ValueError: If a field can't be updated in bulk (unknown, m2m, upload or immutable field).
+        """
+        fields = {field.name: field for field in self.get_model_fields_with_widget_types()}
+        column_values = {}
+        for field_name, value in values.items():
+            field = fields.get(field_name)
+            if not field or field.is_m2m or field.is_immutable or field.form_widget_type == WidgetType.Upload:
+                raise ValueError(f"{field_name} can't be updated in bulk")
+            column_values[field.column_name] = self.deserialize_value(field, value)
+        return column_values
+
+    async def update_many(
+        self, ids: Sequence[UUID | int], values: dict[str, Any], progress: Callable[[int], None] | None = None
+    ) -> int:
+        """This method is used to set the same values of fields for orm/db model objects in bulk.
+
+        :params ids: ids of objects.
+        :params values: a dict of field names and new values.
+        :params progress: a function called with a number of processed ids after every chunk.
+        :return: A number of updated objects.
+        :raises ValueError: If a field can't be updated in bulk.
+        """
+        updated = await self.orm_update_many(ids, self.get_bulk_update_values(values), progress=progress)
+        self._list_totals.clear()
+        self.search_backend.invalidate(self)
+        return updated
 
     async def get_export(
         self,
@@ -481,48 +1096,131 @@ class BaseModelAdmin:
         search: str | None = None,
         sort_by: str | None = None,
         filters: dict | None = None,
-    ) -> StringIO | BytesIO | None:
-        """This method is used to get export data (str or bytes stream).
+        cursor: str | None = None,
+    ) -> AsyncIterator[str | bytes] | None:
+        """This method is used to get export data as a stream of str (or bytes for binary formats) chunks.
+
+        Objects are read with orm_iter_list in chunks of export_chunk_size and encoded as they come,
+        so memory doesn't grow with the export size.
 
         :params export_format: a n export format (CSV at default).
-        :params offset: an offset for pagination.
+        :params offset: an offset for pagination, ignored with a cursor.
         :params limit: a limit for pagination.
         :params search: a search query.
         :params sort_by: a sort by field name.
         :params filters: a dict of filters.
-        :return: A StringIO or BytesIO object.
+        :params cursor: a cursor (from the list) to export objects after, None for offset pagination.
+        :return: An async iterator of str/bytes or None for an unsupported format.
+        :raises ValueError: If the cursor is malformed.
         """
-        objs, _ = await self.orm_get_list(offset=offset, limit=limit, search=search, sort_by=sort_by, filters=filters)
-        fields = self.get_model_fields_with_widget_types(with_m2m=False)
+        if export_format not in ExportFormat:
+            return None
+        if export_format in (ExportFormat.PARQUET, ExportFormat.ARROW) and not pyarrow_installed:
+            return None
 
+        keyset, after = self.parse_cursor(cursor, sort_by)
+        if keyset:
+            offset = 0
+        search, filters = await self.resolve_search(search, filters)
+
+        chunks = self.orm_iter_list(
+            offset=offset,
+            limit=limit,
+            search=search,
+            sort_by=sort_by,
+            filters=filters,
+            chunk_size=self.export_chunk_size,
+            keyset=keyset,
+            after=after,
+        )
+        fields = self.get_model_fields_with_widget_types(with_m2m=False)
         export_fields = [f.name for f in fields]
 
+        async def serialized_chunks() -> AsyncIterator[list[dict]]:
+            async for objs in chunks:
+                yield await self.serialize_objs(objs, list_view=True)
+
         match export_format:
             case ExportFormat.CSV:
-                output = StringIO()
-                writer = csv.DictWriter(output, fieldnames=export_fields)
-                writer.writeheader()
-                for obj in objs:
-                    obj_dict = await self.serialize_obj(obj, list_view=True)
-                    obj_dict = {k: v for k, v in obj_dict.items() if k in export_fields}
-                    writer.writerow(obj_dict)
-                output.seek(0)
-                return output
+                return self._export_csv(serialized_chunks(), export_fields)
             case ExportFormat.JSON:
-
-                class JSONEncoder(json.JSONEncoder):
-                    def default(self, obj):
-                        try:
-                            return super().default(obj)
-                        except TypeError:
-                            return str(obj)
-
-                output = StringIO()
-                json.dump([await self.serialize_obj(obj, list_view=True) for obj in objs], output, cls=JSONEncoder)
-                output.seek(0)
-                return output
+                return self._export_json(serialized_chunks())
+            case ExportFormat.NDJSON:
+                return self._export_ndjson(serialized_chunks())
             case _:
-                return None
+                return self._export_arrow(serialized_chunks(), fields, export_format)
+
+    @staticmethod
+    async def _export_csv(serialized_chunks: AsyncIterator[list[dict]], export_fields: list[str]) -> AsyncIterator[str]:
+        output = StringIO()
+        writer = csv.DictWriter(output, fieldnames=export_fields)
+        writer.writeheader()
+        async for serialized_objs in serialized_chunks:
+            for obj_dict in serialized_objs:
+                writer.writerow({k: v for k, v in obj_dict.items() if k in export_fields})
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate()
+        if output.tell():  # only the header, nothing was exported
+            yield output.getvalue()
+
+    @staticmethod
+    async def _export_json(serialized_chunks: AsyncIterator[list[dict]]) -> AsyncIterator[str]:
+        # the same json array as before, written element by element
+        yield "["
+        separator = ""
+        async for serialized_objs in serialized_chunks:
+            for obj_dict in serialized_objs:
+                yield separator + json.dumps(obj_dict, cls=ExportJSONEncoder)
+                separator = ", "
+        yield "]"
+
+    @staticmethod
+    async def _export_ndjson(serialized_chunks: AsyncIterator[list[dict]]) -> AsyncIterator[str]:
+        async for serialized_objs in serialized_chunks:
+            yield "".join(json.dumps(obj_dict, cls=ExportJSONEncoder) + "\n" for obj_dict in serialized_objs)
+
+    @staticmethod
+    async def _export_arrow(
+        serialized_chunks: AsyncIterator[list[dict]],
+        fields: list[ModelFieldWidgetSchema],
+        export_format: ExportFormat,
+    ) -> AsyncIterator[bytes]:
+        # every chunk becomes a record batch (a row group for parquet) and is sent once written
+        sink = ExportChunkSink()
+        file = pa.PythonFile(sink, mode="w")
+        schema, converters, writer = None, None, None
+
+        def new_writer(schema: Any) -> Any:
+            if export_format == ExportFormat.PARQUET:
+                return pq.ParquetWriter(file, schema)
+            return pa.ipc.new_file(file, schema)
+
+        try:
+            async for serialized_objs in serialized_chunks:
+                if writer is None:
+                    columns = [
+                        get_arrow_column(f, [obj_dict.get(f.name) for obj_dict in serialized_objs]) for f in fields
+                    ]
+                    schema = pa.schema([pa.field(f.name, t) for f, (t, _) in zip(fields, columns, strict=True)])
+                    converters = [converter for _, converter in columns]
+                    writer = new_writer(schema)
+                batch = pa.record_batch(
+                    [
+                        pa.array([converter(obj_dict.get(f.name)) for obj_dict in serialized_objs], type=t)
+                        for f, t, converter in zip(fields, schema.types, converters, strict=True)
+                    ],
+                    schema=schema,
+                )
+                writer.write_batch(batch)
+                yield sink.take()
+
+            if writer is None:  # nothing was exported, columns without a widget type are strings
+                writer = new_writer(pa.schema([pa.field(f.name, get_arrow_column(f, [])[0]) for f in fields]))
+            writer.close()
+            yield sink.take()
+        finally:
+            file.close()
 
     async def has_add_permission(self, user_id: UUID | int | None = None) -> bool:
         """This method is used to check if user has permission to add new model instance.
@@ -613,6 +1311,17 @@ class ModelAdmin(BaseModelAdmin):
         """
         raise NotImplementedError
 
+    async def is_user_active(self, id: UUID | int) -> bool:
+        """This method is used to check that settings.ADMIN_USER_MODEL user of a session still may use the admin.
+
+        Called for admin api requests whose session isn't in the verified sessions cache,
+        override it with a cheaper query (e.g. exists with is_active filter) if needed.
+
+        :params id: An user id.
+        :return: A bool.
+        """
+        return await self.orm_get_obj(id) is not None
+
     async def change_password(self, id: UUID | int, password: str) -> None:
         """This method is used to change user password.
 
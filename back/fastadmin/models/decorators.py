@@ -1,3 +1,6 @@
+from collections.abc import Sequence
+
+
 def action(function=None, *, description: str | None = None):
     """Conveniently add attributes to an action function:
 
@@ -25,22 +28,25 @@ def action(function=None, *, description: str | None = None):
 
 
 # TODO: make the sorter parameter a string to specify how to sort the data
-def display(function=None, *, sorter: bool = False):
+def display(function=None, *, sorter: bool = False, depends_on: Sequence[str] | None = None):
     """Conveniently add attributes to a display function:
 
     Example of usage:
-    @display
+    @display(depends_on=("publish_date",))
     async def is_published(self, obj):
         return obj.publish_date is not None
 
     :param function: A function to decorate.
     :param sorter: Enable sorting or not. **WARNING**: supported only for Django and Tortoise.
         Function name should be like an ORM ordering param, e.g. `def user__username(self, obj)`.
+    :param depends_on: Model fields the function reads. If all display functions of list_display declare them,
+        the list page loads only the displayed columns instead of whole objects.
     """
 
     def decorator(func):
         func.is_display = True
         func.sorter = sorter
+        func.depends_on = tuple(depends_on) if depends_on is not None else None
         return func
 
     if function is None:
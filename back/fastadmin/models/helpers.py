@@ -2,7 +2,13 @@ from operator import attrgetter
 from typing import Any, cast
 from uuid import UUID
 
-from fastadmin.models.base import InlineModelAdmin, ModelAdmin, admin_dashboard_widgets, admin_models
+from fastadmin.models.base import (
+    InlineModelAdmin,
+    ModelAdmin,
+    admin_dashboard_widgets,
+    admin_fields_cache,
+    admin_models,
+)
 from fastadmin.models.schemas import (
     AddConfigurationFieldSchema,
     ChangeConfigurationFieldSchema,
@@ -43,6 +49,7 @@ def register_admin_model_class(admin_model_class: type[ModelAdmin], orm_model_cl
         if sqlalchemy_sessionmaker:
             admin_model_class.set_sessionmaker(sqlalchemy_sessionmaker)
         admin_models[orm_model_class] = admin_model_class(orm_model_class)
+    admin_fields_cache.clear()
 
 
 def unregister_admin_model_class(orm_model_classes: list[Any]) -> None:
@@ -54,6 +61,7 @@ def unregister_admin_model_class(orm_model_classes: list[Any]) -> None:
     for orm_model_class in orm_model_classes:
         if orm_model_class in admin_models:
             del admin_models[orm_model_class]
+    admin_fields_cache.clear()
 
 
 def get_admin_models() -> dict[Any, ModelAdmin]:
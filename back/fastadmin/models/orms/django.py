@@ -1,15 +1,22 @@
+import json
 from base64 import b64decode
+from collections.abc import AsyncIterator, Callable, Sequence
 from typing import Any
 from uuid import UUID
 
 from asgiref.sync import sync_to_async
 
-from fastadmin.models.base import InlineModelAdmin, ModelAdmin
+from fastadmin.models.base import InlineModelAdmin, ModelAdmin, cache_model_fields
 from fastadmin.models.schemas import ModelFieldWidgetSchema, WidgetType
+from fastadmin.models.search import PostgresFullTextSearch, TrigramSearch, escape_like
 from fastadmin.settings import settings
 
 
 class DjangoORMMixin:
+    # sync orm, __str__ and display functions may query the db
+    serialize_sync_in_thread = True
+    supports_related_search_fields = True
+
     @staticmethod
     def get_model_pk_name(orm_model_cls: Any) -> str:
         """This method is used to get model pk name.
@@ -18,6 +25,7 @@ class DjangoORMMixin:
         """
         return orm_model_cls._meta.pk.name
 
+    @cache_model_fields
     def get_model_fields_with_widget_types(
         self,
         with_m2m: bool | None = None,
@@ -224,23 +232,22 @@ class DjangoORMMixin:
             )
         return fields
 
-    @sync_to_async
-    def orm_get_list(
+    def get_list_queryset(
         self,
-        offset: int | None = None,
-        limit: int | None = None,
         search: str | None = None,
         sort_by: str | None = None,
         filters: dict | None = None,
-    ) -> tuple[list[Any], int]:
-        """This method is used to get list of orm/db model objects.
+        keyset: Sequence[str] | None = None,
+        after: Sequence[Any] | None = None,
+    ) -> Any:
+        """This method is used to get a filtered and ordered queryset for list/export.
 
-        :params offset: an offset for pagination.
-        :params limit: a limit for pagination.
         :params search: a search query.
         :params sort_by: a sort by field name.
         :params filters: a dict of filters.
-        :return: A tuple of list of objects and total count.
+        :params keyset: an ordering for keyset pagination, it replaces sort_by.
+        :params after: values of the keyset fields to start after.
+        :return: A queryset.
         """
         qs = self.model_cls.objects.all()
 
@@ -250,28 +257,182 @@ class DjangoORMMixin:
                 condition = field_with_condition[1]
                 qs = qs.filter(**{f"{field}__{condition}" if condition != "exact" else field: value})
 
-        if search and self.search_fields:
-            ids = []
-            for f in self.search_fields:
-                qs = qs.filter(**{f + "__icontains": search})
-                ids += qs.values_list(self.get_model_pk_name(self.model_cls), flat=True)
-            qs = qs.filter(id__in=set(ids))
+        if search:
+            match self.search_backend:
+                case PostgresFullTextSearch(column=column, config=config):
+                    # the tsvector column is generated by the db, it isn't a field of the model
+                    qs = qs.extra(where=[f'"{column}" @@ websearch_to_tsquery(%s, %s)'], params=[config, search])
+                case TrigramSearch():
+                    # plain ILIKE, icontains wraps columns with UPPER() which can't use trigram indexes
+                    columns = [self.model_cls._meta.get_field(f).column for f in self.search_backend.get_fields(self)]
+                    pattern = f"%{escape_like(search)}%"
+                    qs = qs.extra(
+                        where=[" OR ".join(f'"{column}" ILIKE %s' for column in columns)],
+                        params=[pattern] * len(columns),
+                    )
+                case _ if self.search_fields:
+                    ids = []
+                    for f in self.search_fields:
+                        qs = qs.filter(**{f + "__icontains": search})
+                        ids += qs.values_list(self.get_model_pk_name(self.model_cls), flat=True)
+                    qs = qs.filter(id__in=set(ids))
+
+        return self.order_list_queryset(qs, sort_by=sort_by, keyset=keyset, after=after)
+
+    def order_list_queryset(
+        self,
+        qs: Any,
+        sort_by: str | None = None,
+        keyset: Sequence[str] | None = None,
+        after: Sequence[Any] | None = None,
+    ) -> Any:
+        """This method is used to order a list queryset, or to order and filter it for keyset pagination.
 
-        if sort_by:
+        :params qs: a queryset.
+        :params sort_by: a sort by field name.
+        :params keyset: an ordering for keyset pagination, it replaces sort_by.
+        :params after: values of the keyset fields to start after.
+        :return: A queryset.
+        """
+        if keyset:
+            from django.db.models import Q
+
+            qs = qs.order_by(*keyset)
+            if after:
+                # (a, b) > (x, y) as a > x or a = x and b > y, for any direction of the keyset
+                q = Q()
+                for i, field in enumerate(keyset):
+                    lookup = "lt" if field.startswith("-") else "gt"
+                    equal = {prev.lstrip("-"): value for prev, value in zip(keyset[:i], after[:i], strict=True)}
+                    q |= Q(**equal, **{f"{field.lstrip('-')}__{lookup}": after[i]})
+                qs = qs.filter(q)
+        elif sort_by:
             qs = qs.order_by(sort_by)
         elif self.ordering:
             qs = qs.order_by(*self.ordering)
+        return qs
 
-        total = qs.count()
+    @sync_to_async
+    def orm_get_list(
+        self,
+        offset: int | None = None,
+        limit: int | None = None,
+        search: str | None = None,
+        sort_by: str | None = None,
+        filters: dict | None = None,
+        with_total: bool = True,
+        keyset: Sequence[str] | None = None,
+        after: Sequence[Any] | None = None,
+        only: Sequence[str] | None = None,
+    ) -> tuple[list[Any], int | None]:
+        """This method is used to get list of orm/db model objects.
+
+        :params offset: an offset for pagination.
+        :params limit: a limit for pagination.
+        :params search: a search query.
+        :params sort_by: a sort by field name.
+        :params filters: a dict of filters.
+        :params with_total: a flag to count objects, the total is None without it.
+        :params keyset: an ordering for keyset pagination, it replaces sort_by.
+        :params after: values of the keyset fields of the last object of the previous page.
+        :params only: names of fields to load, None to load whole objects.
+        :return: A tuple of list of objects and total count.
+        """
+        qs = self.get_list_queryset(search=search, sort_by=sort_by, filters=filters)
+
+        total = qs.count() if with_total else None
+        if keyset:
+            qs = self.order_list_queryset(qs, keyset=keyset, after=after)
 
         if self.list_select_related:
             qs = qs.select_related(*self.list_select_related)
 
+        if only is not None:
+            # relations of select_related can't be deferred
+            qs = qs.only(*dict.fromkeys([*only, *(f.split("__", 1)[0] for f in self.list_select_related)]))
+
         if offset is not None and limit is not None:
             qs = qs[offset : offset + limit]
 
         return list(qs), total
 
+    @sync_to_async
+    def orm_estimate_count(
+        self,
+        search: str | None = None,
+        filters: dict | None = None,
+    ) -> int | None:
+        """This method is used to get the database planner estimate of list objects count.
+
+        Postgres only: pg_class.reltuples of the table without filters, rows of the EXPLAIN plan with them.
+
+        :params search: a search query.
+        :params filters: a dict of filters.
+        :return: An estimated count or None when the database can't estimate it.
+        """
+        from django.db import connections
+
+        qs = self.get_list_queryset(search=search, filters=filters)
+        connection = connections[qs.db]
+        if connection.vendor != "postgresql":
+            return None
+
+        if not search and not filters:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)",
+                    [self.model_cls._meta.db_table],
+                )
+                row = cursor.fetchone()
+            # reltuples is -1 for a table which was never vacuumed or analyzed
+            return row[0] if row and row[0] >= 0 else None
+
+        plan = json.loads(qs.explain(format="json"))
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    async def orm_iter_list(
+        self,
+        offset: int | None = None,
+        limit: int | None = None,
+        search: str | None = None,
+        sort_by: str | None = None,
+        filters: dict | None = None,
+        chunk_size: int = 1000,
+        keyset: Sequence[str] | None = None,
+        after: Sequence[Any] | None = None,
+    ) -> AsyncIterator[list[Any]]:
+        """This method is used to iterate orm/db model objects of a list in chunks, with a server-side cursor.
+
+        :params offset: an offset to start from.
+        :params limit: a max number of objects, None for all.
+        :params search: a search query.
+        :params sort_by: a sort by field name.
+        :params filters: a dict of filters.
+        :params chunk_size: a number of objects per chunk.
+        :params keyset: an ordering for keyset pagination, it replaces sort_by.
+        :params after: values of the keyset fields of the object to start after.
+        :return: An async iterator of lists of objects.
+        """
+        # search runs queries while building the queryset
+        qs = await sync_to_async(self.get_list_queryset)(
+            search=search, sort_by=sort_by, filters=filters, keyset=keyset, after=after
+        )
+
+        if self.list_select_related:
+            qs = qs.select_related(*self.list_select_related)
+
+        start = offset or 0
+        qs = qs[start : start + limit] if limit is not None else qs[start:]
+
+        chunk = []
+        async for obj in qs.aiterator(chunk_size=chunk_size):
+            chunk.append(obj)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
     @sync_to_async
     def orm_get_obj(self, id: UUID | int) -> Any | None:
         """This method is used to get orm/db model object.
@@ -311,6 +472,50 @@ class DjangoORMMixin:
         qs = self.model_cls.objects.filter(**{self.get_model_pk_name(self.model_cls): id})
         qs.delete()
 
+    @sync_to_async
+    def orm_delete_many(self, ids: Sequence[UUID | int], progress: Callable[[int], None] | None = None) -> int:
+        """This method is used to delete orm/db model objects with IN statements of bulk_chunk_size ids in a transaction.
+
+        :params ids: ids of objects.
+        :params progress: a function called with a number of processed ids after every chunk.
+        :return: A number of deleted objects, without cascaded ones.
+        """
+        from django.db import transaction
+
+        pk_name = self.get_model_pk_name(self.model_cls)
+        deleted = 0
+        with transaction.atomic():
+            for i in range(0, len(ids), self.bulk_chunk_size):
+                chunk = ids[i : i + self.bulk_chunk_size]
+                _, deleted_by_model = self.model_cls.objects.filter(**{f"{pk_name}__in": chunk}).delete()
+                deleted += deleted_by_model.get(self.model_cls._meta.label, 0)
+                if progress:
+                    progress(i + len(chunk))
+        return deleted
+
+    @sync_to_async
+    def orm_update_many(
+        self, ids: Sequence[UUID | int], values: dict[str, Any], progress: Callable[[int], None] | None = None
+    ) -> int:
+        """This method is used to update orm/db model objects with IN statements of bulk_chunk_size ids in a transaction.
+
+        :params ids: ids of objects.
+        :params values: a dict of column names and new values.
+        :params progress: a function called with a number of processed ids after every chunk.
+        :return: A number of updated objects.
+        """
+        from django.db import transaction
+
+        pk_name = self.get_model_pk_name(self.model_cls)
+        updated = 0
+        with transaction.atomic():
+            for i in range(0, len(ids), self.bulk_chunk_size):
+                chunk = ids[i : i + self.bulk_chunk_size]
+                updated += self.model_cls.objects.filter(**{f"{pk_name}__in": chunk}).update(**values)
+                if progress:
+                    progress(i + len(chunk))
+        return updated
+
     @sync_to_async
     def orm_get_m2m_ids(self, obj: Any, field: str) -> list[int | UUID]:
         """This method is used to get m2m ids.
@@ -324,6 +529,27 @@ class DjangoORMMixin:
         remote_model = m2m_rel.model
         return list(m2m_rel.all().values_list(self.get_model_pk_name(remote_model), flat=True))
 
+    @sync_to_async
+    def orm_get_m2m_ids_bulk(self, objs: list[Any], field: str) -> dict[Any, list[int | UUID]]:
+        """This method is used to get m2m ids of several objects with one query.
+
+        :params objs: a list of objects.
+        :params field: a m2m field name.
+
+        :return: A dict of object pk to a list of ids.
+        """
+        pk_name = self.get_model_pk_name(self.model_cls)
+        remote_model = self.model_cls._meta.get_field(field).related_model
+        rows = self.model_cls.objects.filter(**{f"{pk_name}__in": [getattr(obj, pk_name) for obj in objs]}).values_list(
+            pk_name, f"{field}__{self.get_model_pk_name(remote_model)}"
+        )
+        m2m_ids: dict[Any, list[int | UUID]] = {}
+        for pk, rel_id in rows:
+            ids = m2m_ids.setdefault(pk, [])
+            if rel_id is not None:  # objects without relations come from the left join
+                ids.append(rel_id)
+        return m2m_ids
+
     @sync_to_async
     def orm_save_m2m_ids(self, obj: Any, field: str, ids: list[int | UUID]) -> None:
         """This method is used to get m2m ids.
@@ -1,3 +1,4 @@
+from collections.abc import Callable, Sequence
 from enum import EnumMeta
 from typing import Any
 from uuid import UUID
@@ -5,12 +6,15 @@ from uuid import UUID
 from asgiref.sync import sync_to_async
 from pony.orm import commit, db_session, desc, flush
 
-from fastadmin.models.base import InlineModelAdmin, ModelAdmin
+from fastadmin.models.base import InlineModelAdmin, ModelAdmin, cache_model_fields
 from fastadmin.models.schemas import ModelFieldWidgetSchema, WidgetType
 from fastadmin.settings import settings
 
 
 class PonyORMMixin:
+    # sync orm, __str__ and display functions may query the db
+    serialize_sync_in_thread = True
+
     @staticmethod
     def get_model_pk_name(orm_model_cls: Any) -> str:
         """This method is used to get model pk name.
@@ -19,6 +23,7 @@ class PonyORMMixin:
         """
         return orm_model_cls._pk_.name
 
+    @cache_model_fields
     def get_model_fields_with_widget_types(
         self,
         with_m2m: bool | None = None,
@@ -222,7 +227,11 @@ class PonyORMMixin:
         search: str | None = None,
         sort_by: str | None = None,
         filters: dict | None = None,
-    ) -> tuple[list[Any], int]:
+        with_total: bool = True,
+        keyset: Sequence[str] | None = None,
+        after: Sequence[Any] | None = None,
+        only: Sequence[str] | None = None,
+    ) -> tuple[list[Any], int | None]:
         """This method is used to get list of orm/db model objects.
 
         :params offset: an offset for pagination.
@@ -230,6 +239,10 @@ class PonyORMMixin:
         :params search: a search query.
         :params sort_by: a sort by field name.
         :params filters: a dict of filters.
+        :params with_total: a flag to count objects, the total is None without it.
+        :params keyset: an ordering for keyset pagination, it replaces sort_by.
+        :params after: values of the keyset fields of the last object of the previous page.
+        :params only: names of fields to load, pony loads whole objects anyway.
         :return: A tuple of list of objects and total count.
         """
 
@@ -258,9 +271,15 @@ class PonyORMMixin:
                     case "icontains":
                         # TODO: support icontains here
                         pony_condition = "in"
+                    case "in":
+                        # values are taken by pony from the in_values local variable
+                        in_values = list(value)  # noqa: F841
+                        qs = qs.filter(f"m.{field} in in_values")
+                        continue
                 filter_expr = f""""{value}" {pony_condition}  m.{field}"""
                 qs = qs.filter(filter_expr)
 
+        # postgres search backends aren't supported by pony, they fall back to search_fields
         if search and self.search_fields:
             ids = []
             for search_field in self.search_fields:
@@ -270,7 +289,7 @@ class PonyORMMixin:
                 ids += [o.id for o in qs_ids]
             qs = qs.filter(lambda m: m.id in set(ids))
 
-        ordering = [sort_by] if sort_by else self.ordering
+        ordering = keyset or ([sort_by] if sort_by else self.ordering)
         if ordering:
             desc_fields = [o[1:] for o in ordering if o.startswith("-")]
             asc_fields = [o for o in ordering if not o.startswith("-")]
@@ -279,7 +298,17 @@ class PonyORMMixin:
             if desc_fields:
                 qs = qs.order_by(*(desc(getattr(self.model_cls, o)) for o in desc_fields))
 
-        total = qs.count()
+        total = qs.count() if with_total else None
+
+        if keyset and after:
+            # (a, b) > (x, y) as a > x or a = x and b > y, for any direction of the keyset,
+            # values are taken by pony from the after local variable
+            conditions = []
+            for i, field in enumerate(keyset):
+                pony_condition = "<" if field.startswith("-") else ">"
+                equal = [f"m.{prev.lstrip('-')} == after[{j}]" for j, prev in enumerate(keyset[:i])]
+                conditions.append(" and ".join([*equal, f"m.{field.lstrip('-')} {pony_condition} after[{i}]"]))
+            qs = qs.filter(" or ".join(f"({condition})" for condition in conditions))
 
         if self.list_select_related:
             qs = qs.prefetch(*[getattr(self.model_cls, field) for field in self.list_select_related])
@@ -335,6 +364,56 @@ class PonyORMMixin:
         flush()
         commit()
 
+    @sync_to_async
+    @db_session
+    def orm_delete_many(self, ids: Sequence[UUID | int], progress: Callable[[int], None] | None = None) -> int:
+        """This method is used to delete orm/db model objects with IN statements of bulk_chunk_size ids in a transaction.
+
+        :params ids: ids of objects.
+        :params progress: a function called with a number of processed ids after every chunk.
+        :return: A number of deleted objects.
+        """
+        pk_name = self.get_model_pk_name(self.model_cls)
+        deleted = 0
+        for i in range(0, len(ids), self.bulk_chunk_size):
+            # values are taken by pony from the chunk local variable
+            chunk = list(ids[i : i + self.bulk_chunk_size])
+            qs = getattr(self.model_cls, "select")(lambda m: m)  # noqa: B009
+            deleted += qs.filter(f"m.{pk_name} in chunk").delete(bulk=True)
+            if progress:
+                progress(i + len(chunk))
+        commit()
+        return deleted
+
+    @sync_to_async
+    @db_session
+    def orm_update_many(
+        self, ids: Sequence[UUID | int], values: dict[str, Any], progress: Callable[[int], None] | None = None
+    ) -> int:
+        """This method is used to update orm/db model objects by chunks of bulk_chunk_size ids in a transaction.
+
+        Pony has no bulk update, objects of a chunk are selected with an IN statement and updated one by one.
+
+        :params ids: ids of objects.
+        :params values: a dict of column names and new values.
+        :params progress: a function called with a number of processed ids after every chunk.
+        :return: A number of updated objects.
+        """
+        pk_name = self.get_model_pk_name(self.model_cls)
+        updated = 0
+        for i in range(0, len(ids), self.bulk_chunk_size):
+            # values are taken by pony from the chunk local variable
+            chunk = list(ids[i : i + self.bulk_chunk_size])
+            qs = getattr(self.model_cls, "select")(lambda m: m)  # noqa: B009
+            for obj in qs.filter(f"m.{pk_name} in chunk"):
+                obj.set(**values)
+                updated += 1
+            flush()
+            if progress:
+                progress(i + len(chunk))
+        commit()
+        return updated
+
     @sync_to_async
     @db_session
     def orm_get_m2m_ids(self, obj: Any, field: str) -> list[int | UUID]:
@@ -353,6 +432,23 @@ class PonyORMMixin:
         rel_key_id = self.get_model_pk_name(rel_model_cls)
         return [getattr(o, rel_key_id) for o in getattr(obj, field)]
 
+    @sync_to_async
+    @db_session
+    def orm_get_m2m_ids_bulk(self, objs: list[Any], field: str) -> dict[Any, list[int | UUID]]:
+        """This method is used to get m2m ids of several objects, the relations are prefetched in one query.
+
+        :params objs: a list of objects.
+        :params field: a m2m field name.
+
+        :return: A dict of object pk to a list of ids.
+        """
+        key_id = self.get_model_pk_name(self.model_cls)
+        pks = [getattr(obj, key_id) for obj in objs]
+        rel_attr = getattr(self.model_cls, field)
+        rel_key_id = self.get_model_pk_name(rel_attr.py_type)
+        db_objs = self.model_cls.select(lambda o: getattr(o, key_id) in pks).prefetch(rel_attr)
+        return {getattr(o, key_id): [getattr(r, rel_key_id) for r in getattr(o, field)] for o in db_objs}
+
     @sync_to_async
     @db_session
     def orm_save_m2m_ids(self, obj: Any, field: str, ids: list[int | UUID]) -> None:
@@ -1,13 +1,16 @@
 import contextlib
+import json
+from collections.abc import AsyncIterator, Callable, Sequence
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import BIGINT, Integer, and_, func, inspect, or_, select, text
-from sqlalchemy.orm import selectinload
+from sqlalchemy import BIGINT, Integer, and_, delete, func, inspect, literal_column, or_, select, text, update
+from sqlalchemy.orm import load_only, selectinload
 
-from fastadmin.models.base import InlineModelAdmin, ModelAdmin
+from fastadmin.models.base import InlineModelAdmin, ModelAdmin, cache_model_fields
 from fastadmin.models.helpers import getattrs
 from fastadmin.models.schemas import ModelFieldWidgetSchema, WidgetType
+from fastadmin.models.search import PostgresFullTextSearch, TrigramSearch, escape_like
 from fastadmin.settings import settings
 
 
@@ -20,6 +23,7 @@ class SqlAlchemyMixin:
         """
         return getattrs(orm_model_cls, "__table__.primary_key._autoincrement_column.name", default="id")
 
+    @cache_model_fields
     def get_model_fields_with_widget_types(
         self,
         with_m2m: bool | None = None,
@@ -230,22 +234,22 @@ class SqlAlchemyMixin:
             )
         return fields
 
-    async def orm_get_list(
+    def get_list_query(
         self,
-        offset: int | None = None,
-        limit: int | None = None,
         search: str | None = None,
         sort_by: str | None = None,
         filters: dict | None = None,
-    ) -> tuple[list[Any], int]:
-        """This method is used to get list of orm/db model objects.
+        keyset: Sequence[str] | None = None,
+        after: Sequence[Any] | None = None,
+    ) -> Any:
+        """This method is used to get a filtered and ordered select for list/export.
 
-        :params offset: an offset for pagination.
-        :params limit: a limit for pagination.
         :params search: a search query.
         :params sort_by: a sort by field name.
         :params filters: a dict of filters.
-        :return: A tuple of list of objects and total count.
+        :params keyset: an ordering for keyset pagination, it replaces sort_by.
+        :params after: values of the keyset fields to start after.
+        :return: A select statement.
         """
 
         def convert_sort_by(sort_by: str) -> str:
@@ -253,63 +257,199 @@ class SqlAlchemyMixin:
                 return sort_by[1:] + " desc"
             return sort_by
 
-        sessionmaker = self.get_sessionmaker()
-        async with sessionmaker() as session:
-            qs = select(self.model_cls)
-
-            if filters:
-                q = []
-                for field_with_condition, value in filters.items():
-                    field = field_with_condition[0]
-                    condition = field_with_condition[1]
-                    model_field = getattr(self.model_cls, field)
-
-                    if isinstance(model_field.expression.type, BIGINT | Integer):
-                        with contextlib.suppress(ValueError, TypeError):
-                            value = int(value)
-
-                    match condition:
-                        case "lte":
-                            q.append(model_field >= value)
-                        case "gte":
-                            q.append(model_field <= value)
-                        case "lt":
-                            q.append(model_field > value)
-                        case "gt":
-                            q.append(model_field < value)
-                        case "exact":
-                            q.append(model_field == value)
-                        case "contains":
-                            q.append(model_field.like(f"%{value}%"))
-                        case "icontains":
-                            q.append(model_field.ilike(f"%{value}%"))
-                qs = qs.filter(and_(*q))
-
-            if search and self.search_fields:
+        qs = select(self.model_cls)
+
+        if filters:
+            q = []
+            for field_with_condition, value in filters.items():
+                field = field_with_condition[0]
+                condition = field_with_condition[1]
+                model_field = getattr(self.model_cls, field)
+
+                if isinstance(model_field.expression.type, BIGINT | Integer):
+                    with contextlib.suppress(ValueError, TypeError):
+                        value = int(value)
+
+                match condition:
+                    case "lte":
+                        q.append(model_field >= value)
+                    case "gte":
+                        q.append(model_field <= value)
+                    case "lt":
+                        q.append(model_field > value)
+                    case "gt":
+                        q.append(model_field < value)
+                    case "exact":
+                        q.append(model_field == value)
+                    case "contains":
+                        q.append(model_field.like(f"%{value}%"))
+                    case "icontains":
+                        q.append(model_field.ilike(f"%{value}%"))
+                    case "in":
+                        q.append(model_field.in_(value))
+            qs = qs.filter(and_(*q))
+
+        if search:
+            match self.search_backend:
+                case PostgresFullTextSearch(column=column, config=config):
+                    vector = getattr(self.model_cls, column, None)
+                    if vector is None:
+                        vector = literal_column(f'"{column}"')
+                    qs = qs.filter(vector.op("@@")(func.websearch_to_tsquery(config, search)))
+                case TrigramSearch():
+                    fields = self.search_backend.get_fields(self)
+                    pattern = f"%{escape_like(search)}%"
+                    qs = qs.filter(or_(*(getattr(self.model_cls, f).ilike(pattern, escape="\\") for f in fields)))
+                case _ if self.search_fields:
+                    q = []
+                    for field in self.search_fields:
+                        q.append(getattr(self.model_cls, field).ilike(f"%{search}%"))
+                    qs = qs.filter(or_(*q))
+
+        if keyset:
+            columns = [getattr(self.model_cls, f.lstrip("-")) for f in keyset]
+            qs = qs.order_by(*(c.desc() if f.startswith("-") else c.asc() for f, c in zip(keyset, columns, strict=True)))
+            if after:
+                # (a, b) > (x, y) as a > x or a = x and b > y, for any direction of the keyset
                 q = []
-                for field in self.search_fields:
-                    q.append(getattr(self.model_cls, field).ilike(f"%{search}%"))
+                for i, (field, column) in enumerate(zip(keyset, columns, strict=True)):
+                    equal = [c == value for c, value in zip(columns[:i], after[:i], strict=True)]
+                    q.append(and_(*equal, column < after[i] if field.startswith("-") else column > after[i]))
                 qs = qs.filter(or_(*q))
+        elif sort_by:
+            qs = qs.order_by(text(convert_sort_by(sort_by)))
+        elif self.ordering:
+            sort_by_text = ", ".join([convert_sort_by(f) for f in self.ordering])
+            qs = qs.order_by(text(sort_by_text))
+        return qs
+
+    async def orm_get_list(
+        self,
+        offset: int | None = None,
+        limit: int | None = None,
+        search: str | None = None,
+        sort_by: str | None = None,
+        filters: dict | None = None,
+        with_total: bool = True,
+        keyset: Sequence[str] | None = None,
+        after: Sequence[Any] | None = None,
+        only: Sequence[str] | None = None,
+    ) -> tuple[list[Any], int | None]:
+        """This method is used to get list of orm/db model objects.
 
-            if sort_by:
-                qs = qs.order_by(text(convert_sort_by(sort_by)))
-            elif self.ordering:
-                sort_by_text = ", ".join([convert_sort_by(f) for f in self.ordering])
-                qs = qs.order_by(text(sort_by_text))
+        :params offset: an offset for pagination.
+        :params limit: a limit for pagination.
+        :params search: a search query.
+        :params sort_by: a sort by field name.
+        :params filters: a dict of filters.
+        :params with_total: a flag to count objects, the total is None without it.
+        :params keyset: an ordering for keyset pagination, it replaces sort_by.
+        :params after: values of the keyset fields of the last object of the previous page.
+        :params only: names of fields to load, None to load whole objects.
+        :return: A tuple of list of objects and total count.
+        """
+        sessionmaker = self.get_sessionmaker()
+        async with sessionmaker() as session:
+            total = None
+            if with_total:
+                count_qs = self.get_list_query(search=search, filters=filters)
+                objs = await session.execute(select(func.count()).select_from(count_qs))  # type: ignore [arg-type]
+                total = objs.scalar()
 
-            objs = await session.execute(select(func.count()).select_from(qs))  # type: ignore [arg-type]
-            total = objs.scalar()
+            qs = self.get_list_query(search=search, sort_by=sort_by, filters=filters, keyset=keyset, after=after)
 
             if self.list_select_related:
                 for field in self.list_select_related:
                     qs = qs.options(selectinload(getattr(self.model_cls, field)))
 
+            if only is not None:
+                columns = {f.name: f.column_name for f in self.get_model_fields_with_widget_types()}
+                qs = qs.options(load_only(*(getattr(self.model_cls, columns[name]) for name in only)))
+
             if offset is not None and limit is not None:
                 qs = qs.offset(offset)
                 qs = qs.limit(limit)
 
             return await session.scalars(qs), total
 
+    async def orm_estimate_count(
+        self,
+        search: str | None = None,
+        filters: dict | None = None,
+    ) -> int | None:
+        """This method is used to get the database planner estimate of list objects count.
+
+        Postgres only: pg_class.reltuples of the table without filters, rows of the EXPLAIN plan with them.
+
+        :params search: a search query.
+        :params filters: a dict of filters.
+        :return: An estimated count or None when the database can't estimate it.
+        """
+        sessionmaker = self.get_sessionmaker()
+        async with sessionmaker() as session:
+            dialect = session.get_bind().dialect
+            if dialect.name != "postgresql":
+                return None
+
+            if not search and not filters:
+                result = await session.execute(
+                    text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)"),
+                    {"table": self.model_cls.__table__.fullname},
+                )
+                estimate = result.scalar()
+                # reltuples is -1 for a table which was never vacuumed or analyzed
+                return estimate if estimate is not None and estimate >= 0 else None
+
+            qs = self.get_list_query(search=search, filters=filters)
+            sql = qs.compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+            connection = await session.connection()
+            # the statement has literal values which text() could mistake for binds
+            result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")
+            plan = result.scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]["Plan"]["Plan Rows"])
+
+    async def orm_iter_list(
+        self,
+        offset: int | None = None,
+        limit: int | None = None,
+        search: str | None = None,
+        sort_by: str | None = None,
+        filters: dict | None = None,
+        chunk_size: int = 1000,
+        keyset: Sequence[str] | None = None,
+        after: Sequence[Any] | None = None,
+    ) -> AsyncIterator[list[Any]]:
+        """This method is used to iterate orm/db model objects of a list in chunks, with a server-side cursor.
+
+        :params offset: an offset to start from.
+        :params limit: a max number of objects, None for all.
+        :params search: a search query.
+        :params sort_by: a sort by field name.
+        :params filters: a dict of filters.
+        :params chunk_size: a number of objects per chunk.
+        :params keyset: an ordering for keyset pagination, it replaces sort_by.
+        :params after: values of the keyset fields of the object to start after.
+        :return: An async iterator of lists of objects.
+        """
+        sessionmaker = self.get_sessionmaker()
+        async with sessionmaker() as session:
+            qs = self.get_list_query(search=search, sort_by=sort_by, filters=filters, keyset=keyset, after=after)
+
+            if self.list_select_related:
+                for field in self.list_select_related:
+                    qs = qs.options(selectinload(getattr(self.model_cls, field)))
+
+            if offset:
+                qs = qs.offset(offset)
+            if limit is not None:
+                qs = qs.limit(limit)
+
+            result = await session.stream_scalars(qs.execution_options(yield_per=chunk_size))
+            async for objs in result.partitions(chunk_size):
+                yield list(objs)
+
     async def orm_get_obj(self, id: UUID | int) -> Any | None:
         """This method is used to get orm/db model object.
 
@@ -368,6 +508,51 @@ class SqlAlchemyMixin:
             await session.delete(obj)
             await session.commit()
 
+    async def orm_delete_many(
+        self, ids: Sequence[UUID | int], progress: Callable[[int], None] | None = None
+    ) -> int:
+        """This method is used to delete orm/db model objects with IN statements of bulk_chunk_size ids in a transaction.
+
+        Unlike orm_delete_obj it runs DELETE statements, so orm level cascades aren't applied (db level ones are).
+
+        :params ids: ids of objects.
+        :params progress: a function called with a number of processed ids after every chunk.
+        :return: A number of deleted objects.
+        """
+        pk = getattr(self.model_cls, self.get_model_pk_name(self.model_cls))
+        deleted = 0
+        sessionmaker = self.get_sessionmaker()
+        async with sessionmaker() as session, session.begin():
+            for i in range(0, len(ids), self.bulk_chunk_size):
+                chunk = ids[i : i + self.bulk_chunk_size]
+                result = await session.execute(delete(self.model_cls).where(pk.in_(chunk)))
+                deleted += result.rowcount
+                if progress:
+                    progress(i + len(chunk))
+        return deleted
+
+    async def orm_update_many(
+        self, ids: Sequence[UUID | int], values: dict[str, Any], progress: Callable[[int], None] | None = None
+    ) -> int:
+        """This method is used to update orm/db model objects with IN statements of bulk_chunk_size ids in a transaction.
+
+        :params ids: ids of objects.
+        :params values: a dict of column names and new values.
+        :params progress: a function called with a number of processed ids after every chunk.
+        :return: A number of updated objects.
+        """
+        pk = getattr(self.model_cls, self.get_model_pk_name(self.model_cls))
+        updated = 0
+        sessionmaker = self.get_sessionmaker()
+        async with sessionmaker() as session, session.begin():
+            for i in range(0, len(ids), self.bulk_chunk_size):
+                chunk = ids[i : i + self.bulk_chunk_size]
+                result = await session.execute(update(self.model_cls).where(pk.in_(chunk)).values(**values))
+                updated += result.rowcount
+                if progress:
+                    progress(i + len(chunk))
+        return updated
+
     async def orm_get_m2m_ids(self, obj: Any, field: str) -> list[int | UUID]:
         """This method is used to get m2m ids.
 
@@ -385,6 +570,32 @@ class SqlAlchemyMixin:
             obj = await session.scalar(qs)
             return [getattr(obj, id_key) for obj in getattr(obj, field, [])]
 
+    async def orm_get_m2m_ids_bulk(self, objs: list[Any], field: str) -> dict[Any, list[int | UUID]]:
+        """This method is used to get m2m ids of several objects with one query.
+
+        :params objs: a list of objects.
+        :params field: a m2m field name.
+
+        :return: A dict of object pk to a list of ids.
+        """
+        id_key = self.get_model_pk_name(self.model_cls)
+        orm_model_field = inspect(self.model_cls).relationships[field]
+        rel_model_cls = orm_model_field.mapper.class_
+        rel_id_key = self.get_model_pk_name(rel_model_cls)
+        pks = [getattr(obj, id_key) for obj in objs]
+        m2m_ids: dict[Any, list[int | UUID]] = {pk: [] for pk in pks}
+
+        sessionmaker = self.get_sessionmaker()
+        async with sessionmaker() as session:
+            qs = (
+                select(getattr(self.model_cls, id_key), getattr(rel_model_cls, rel_id_key))
+                .join(getattr(self.model_cls, field))
+                .where(getattr(self.model_cls, id_key).in_(pks))
+            )
+            for pk, rel_id in await session.execute(qs):
+                m2m_ids[pk].append(rel_id)
+        return m2m_ids
+
     async def orm_save_m2m_ids(self, obj: Any, field: str, ids: list[int | UUID]) -> None:
         """This method is used to get m2m ids.
 
@@ -1,16 +1,54 @@
 import functools
+import json
 import operator
+from collections.abc import Callable, Sequence
 from typing import Any
 from uuid import UUID
 
-from tortoise.expressions import Q
+from pypika_tortoise.enums import Comparator
+from pypika_tortoise.terms import BasicCriterion, Bracket, Field, Function, ValueWrapper
+from tortoise import connections
+from tortoise.expressions import Expression, Q, ResolveContext, ResolveResult
+from tortoise.filters import escape_like
+from tortoise.transactions import in_transaction
 
-from fastadmin.models.base import InlineModelAdmin, ModelAdmin
+from fastadmin.models.base import InlineModelAdmin, ModelAdmin, cache_model_fields
 from fastadmin.models.schemas import ModelFieldWidgetSchema, WidgetType
+from fastadmin.models.search import PostgresFullTextSearch, TrigramSearch
 from fastadmin.settings import settings
 
 
+class FullTextComparator(Comparator):
+    match = " @@ "
+
+
+class SearchMatch(Expression):
+    """A condition of the postgres search backends, as an expression to be annotated and filtered by."""
+
+    def __init__(self, backend: PostgresFullTextSearch | TrigramSearch, model_admin: Any, search: str):
+        self.backend = backend
+        self.model_admin = model_admin
+        self.search = search
+
+    def resolve(self, resolve_context: ResolveContext) -> ResolveResult:
+        table = resolve_context.table
+        if isinstance(self.backend, PostgresFullTextSearch):
+            query = Function("WEBSEARCH_TO_TSQUERY", ValueWrapper(self.backend.config), ValueWrapper(self.search))
+            term = BasicCriterion(FullTextComparator.match, Field(self.backend.column, table=table), query)
+        else:
+            pattern = ValueWrapper(f"%{escape_like(self.search)}%")
+            term = functools.reduce(
+                operator.or_,
+                (Field(name, table=table).ilike(pattern) for name in self.backend.get_fields(self.model_admin)),
+            )
+        return ResolveResult(term=Bracket(term))
+
+
 class TortoiseMixin:
+    # name of the tortoise connection for list/export queries (e.g. a read replica), None means the model's default
+    read_connection: str | None = None
+    supports_related_search_fields = True
+
     @staticmethod
     def get_model_pk_name(orm_model_cls: Any) -> str:
         """This method is used to get model pk name.
@@ -19,6 +57,7 @@ class TortoiseMixin:
         """
         return orm_model_cls._meta.pk_attr
 
+    @cache_model_fields
     def get_model_fields_with_widget_types(
         self,
         with_m2m: bool | None = None,
@@ -222,24 +261,26 @@ class TortoiseMixin:
             )
         return fields
 
-    async def orm_get_list(
+    def get_list_queryset(
         self,
-        offset: int | None = None,
-        limit: int | None = None,
         search: str | None = None,
         sort_by: str | None = None,
         filters: dict | None = None,
-    ) -> tuple[list[Any], int]:
-        """This method is used to get list of orm/db model objects.
+        keyset: Sequence[str] | None = None,
+        after: Sequence[Any] | None = None,
+    ) -> Any:
+        """This method is used to get a filtered and ordered queryset for list/export.
 
-        :params offset: an offset for pagination.
-        :params limit: a limit for pagination.
         :params search: a search query.
         :params sort_by: a sort by field name.
         :params filters: a dict of filters.
-        :return: A tuple of list of objects and total count.
+        :params keyset: an ordering for keyset pagination, it replaces sort_by.
+        :params after: values of the keyset fields to start after.
+        :return: A queryset.
         """
         qs = self.model_cls.all()
+        if self.read_connection:
+            qs = qs.using_db(connections.get(self.read_connection))
 
         if filters:
             for field_with_condition, value in filters.items():
@@ -247,31 +288,124 @@ class TortoiseMixin:
                 condition = field_with_condition[1]
                 qs = qs.filter(**{f"{field}__{condition}" if condition != "exact" else field: value})
 
-        if search and self.search_fields:
-            qs = qs.filter(
-                functools.reduce(
-                    operator.or_,
-                    (Q(**{f + "__icontains": search}) for f in self.search_fields),
-                    Q(),
-                )
-            )
-
-        if sort_by:
+        if search:
+            match self.search_backend:
+                case PostgresFullTextSearch() | TrigramSearch():
+                    qs = qs.annotate(_search_match=SearchMatch(self.search_backend, self, search)).filter(
+                        _search_match=True
+                    )
+                case _ if self.search_fields:
+                    qs = qs.filter(
+                        functools.reduce(
+                            operator.or_,
+                            (Q(**{f + "__icontains": search}) for f in self.search_fields),
+                            Q(),
+                        )
+                    )
+
+        if keyset:
+            qs = qs.order_by(*keyset)
+            if after:
+                # (a, b) > (x, y) as a > x or a = x and b > y, for any direction of the keyset
+                conditions = []
+                for i, field in enumerate(keyset):
+                    lookup = "lt" if field.startswith("-") else "gt"
+                    equal = {prev.lstrip("-"): value for prev, value in zip(keyset[:i], after[:i], strict=True)}
+                    conditions.append(Q(**equal, **{f"{field.lstrip('-')}__{lookup}": after[i]}))
+                qs = qs.filter(functools.reduce(operator.or_, conditions))
+        elif sort_by:
             qs = qs.order_by(sort_by)
         elif self.ordering:
             qs = qs.order_by(*self.ordering)
+        return qs
 
-        total = await qs.count()
+    async def orm_get_list(
+        self,
+        offset: int | None = None,
+        limit: int | None = None,
+        search: str | None = None,
+        sort_by: str | None = None,
+        filters: dict | None = None,
+        with_total: bool = True,
+        keyset: Sequence[str] | None = None,
+        after: Sequence[Any] | None = None,
+        only: Sequence[str] | None = None,
+    ) -> tuple[list[Any], int | None]:
+        """This method is used to get list of orm/db model objects.
+
+        :params offset: an offset for pagination.
+        :params limit: a limit for pagination.
+        :params search: a search query.
+        :params sort_by: a sort by field name.
+        :params filters: a dict of filters.
+        :params with_total: a flag to count objects, the total is None without it.
+        :params keyset: an ordering for keyset pagination, it replaces sort_by.
+        :params after: values of the keyset fields of the last object of the previous page.
+        :params only: names of fields to load, None to load whole objects.
+        :return: A tuple of list of objects and total count.
+        """
+        total = None
+        if with_total:
+            total = await self.get_list_queryset(search=search, filters=filters).count()
+
+        qs = self.get_list_queryset(search=search, sort_by=sort_by, filters=filters, keyset=keyset, after=after)
 
         if self.list_select_related:
             qs = qs.select_related(*self.list_select_related)
 
+        if only is not None:
+            columns = {f.name: f.column_name for f in self.get_model_fields_with_widget_types()}
+            qs = qs.only(*(columns[name] for name in only))
+
         if offset is not None and limit is not None:
             qs = qs.offset(offset)
             qs = qs.limit(limit)
 
         return await qs, total
 
+    async def orm_estimate_count(
+        self,
+        search: str | None = None,
+        filters: dict | None = None,
+    ) -> int | None:
+        """This method is used to get the database planner estimate of list objects count.
+
+        Postgres only: pg_class.reltuples of the table without filters, rows of the EXPLAIN plan with them.
+
+        :params search: a search query.
+        :params filters: a dict of filters.
+        :return: An estimated count or None when the database can't estimate it.
+        """
+        qs = self.get_list_queryset(search=search, filters=filters)
+        db = connections.get(self.read_connection) if self.read_connection else self.model_cls._meta.db
+        if db.capabilities.dialect != "postgres":
+            return None
+
+        if not search and not filters:
+            rows = await db.execute_query_dict(
+                "SELECT reltuples::bigint AS estimate FROM pg_class WHERE oid = to_regclass($1)",
+                [self.model_cls._meta.db_table],
+            )
+            # reltuples is -1 for a table which was never vacuumed or analyzed
+            return rows[0]["estimate"] if rows and rows[0]["estimate"] >= 0 else None
+
+        rows = await db.execute_query_dict(f"EXPLAIN (FORMAT JSON) {qs.sql(params_inline=True)}")
+        plan = rows[0]["QUERY PLAN"]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    async def orm_get_search_documents(self, fields: Sequence[str]) -> list[tuple[Any, ...]]:
+        """This method is used to get pk and values of fields of all orm/db model objects, to index them for search.
+
+        :params fields: a list of field names, related fields are separated by "__".
+        :return: A list of tuples of pk and values.
+        """
+        qs = self.model_cls.all()
+        if self.read_connection:
+            qs = qs.using_db(connections.get(self.read_connection))
+        return await qs.values_list(self.get_model_pk_name(self.model_cls), *fields)
+
     async def orm_get_obj(self, id: UUID | int) -> Any | None:
         """This method is used to get orm/db model object.
 
@@ -308,6 +442,45 @@ class TortoiseMixin:
         qs = self.model_cls.filter(**{self.get_model_pk_name(self.model_cls): id})
         await qs.delete()
 
+    async def orm_delete_many(
+        self, ids: Sequence[UUID | int], progress: Callable[[int], None] | None = None
+    ) -> int:
+        """This method is used to delete orm/db model objects with IN statements of bulk_chunk_size ids in a transaction.
+
+        :params ids: ids of objects.
+        :params progress: a function called with a number of processed ids after every chunk.
+        :return: A number of deleted objects.
+        """
+        pk_name = self.get_model_pk_name(self.model_cls)
+        deleted = 0
+        async with in_transaction(self.model_cls._meta.default_connection) as db:
+            for i in range(0, len(ids), self.bulk_chunk_size):
+                chunk = ids[i : i + self.bulk_chunk_size]
+                deleted += await self.model_cls.filter(**{f"{pk_name}__in": chunk}).using_db(db).delete()
+                if progress:
+                    progress(i + len(chunk))
+        return deleted
+
+    async def orm_update_many(
+        self, ids: Sequence[UUID | int], values: dict[str, Any], progress: Callable[[int], None] | None = None
+    ) -> int:
+        """This method is used to update orm/db model objects with IN statements of bulk_chunk_size ids in a transaction.
+
+        :params ids: ids of objects.
+        :params values: a dict of column names and new values.
+        :params progress: a function called with a number of processed ids after every chunk.
+        :return: A number of updated objects.
+        """
+        pk_name = self.get_model_pk_name(self.model_cls)
+        updated = 0
+        async with in_transaction(self.model_cls._meta.default_connection) as db:
+            for i in range(0, len(ids), self.bulk_chunk_size):
+                chunk = ids[i : i + self.bulk_chunk_size]
+                updated += await self.model_cls.filter(**{f"{pk_name}__in": chunk}).using_db(db).update(**values)
+                if progress:
+                    progress(i + len(chunk))
+        return updated
+
     async def orm_get_m2m_ids(self, obj: Any, field: str) -> list[int | UUID]:
         """This method is used to get m2m ids.
 
@@ -320,6 +493,26 @@ class TortoiseMixin:
         remote_model = m2m_rel.remote_model
         return await m2m_rel.all().values_list(self.get_model_pk_name(remote_model), flat=True)
 
+    async def orm_get_m2m_ids_bulk(self, objs: list[Any], field: str) -> dict[Any, list[int | UUID]]:
+        """This method is used to get m2m ids of several objects with one query.
+
+        :params objs: a list of objects.
+        :params field: a m2m field name.
+
+        :return: A dict of object pk to a list of ids.
+        """
+        pk_name = self.get_model_pk_name(self.model_cls)
+        remote_model = self.model_cls._meta.fields_map[field].related_model
+        rows = await self.model_cls.filter(**{f"{pk_name}__in": [getattr(obj, pk_name) for obj in objs]}).values_list(
+            pk_name, f"{field}__{self.get_model_pk_name(remote_model)}"
+        )
+        m2m_ids: dict[Any, list[int | UUID]] = {}
+        for pk, rel_id in rows:
+            ids = m2m_ids.setdefault(pk, [])
+            if rel_id is not None:  # objects without relations come from the left join
+                ids.append(rel_id)
+        return m2m_ids
+
     async def orm_save_m2m_ids(self, obj: Any, field: str, ids: list[int | UUID]) -> None:
         """This method is used to get m2m ids.
 
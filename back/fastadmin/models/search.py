@@ -0,0 +1,212 @@
+import asyncio
+import re
+import time
+from bisect import bisect_left
+from collections.abc import Collection, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from fastadmin.models.base import BaseModelAdmin
+
+TOKEN_RE = re.compile(r"\w+")
+
+
+def escape_like(value: str) -> str:
+    """Escape wildcards of a LIKE pattern, the escape character is a backslash.
+
+    :params value: a search query.
+    :return: An escaped value.
+    """
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split a text to lowercase word tokens.
+
+    :params text: a text.
+    :return: A list of tokens.
+    """
+    return TOKEN_RE.findall(text.lower())
+
+
+class SearchBackend:
+    """Base class of search backends, it's set per admin model with ModelAdmin.search_backend.
+
+    Orm mixins match search_fields with icontains for the base backend. Other backends
+    either match the search in the database (the orm mixin applies them to the list query)
+    or in process (get_pks returns pks of matching objects).
+    """
+
+    async def get_pks(self, model_admin: "BaseModelAdmin", search: str) -> Collection[Any] | None:
+        """This method is used to get pks of objects matching the search when it's matched in process.
+
+        :params model_admin: an admin model.
+        :params search: a search query.
+        :return: A collection of pks or None to match the search in the database.
+        """
+        return None
+
+    def invalidate(self, model_admin: "BaseModelAdmin") -> None:
+        """This method is called when objects of the admin model are saved or deleted.
+
+        :params model_admin: an admin model.
+        :return: None.
+        """
+
+    def get_index_sql(self, table: str) -> list[str]:
+        """This method is used to get DDL statements of indexes the backend needs, to add them to migrations.
+
+        :params table: a table name.
+        :return: A list of SQL statements.
+        """
+        return []
+
+    def check(self, model_admin: "BaseModelAdmin") -> None:
+        """This method is used to validate the backend settings when the admin model is created.
+
+        :params model_admin: an admin model.
+        :raises ValueError: if the settings can't be used.
+        :return: None.
+        """
+
+
+@dataclass
+class IContainsSearch(SearchBackend):
+    """OR of icontains of search_fields, it's the default. Fine for small tables, it can't use an index."""
+
+
+@dataclass
+class PostgresFullTextSearch(SearchBackend):
+    """Postgres full text search on a generated tsvector column with a GIN index.
+
+    The search is parsed with websearch_to_tsquery, so it supports "quoted phrases", or and -negation.
+    The column isn't a field of the orm model, add it with a migration (see get_index_sql).
+
+    Example of usage:
+    search_backend = PostgresFullTextSearch(fields=("title", "text"))
+    """
+
+    # fields of the model which make the document, in order of weight
+    fields: Sequence[str] = ()
+    column: str = "search_vector"
+    config: str = "simple"
+
+    def check(self, model_admin: "BaseModelAdmin") -> None:
+        check_column_names(model_admin, self.fields)
+
+    def get_index_sql(self, table: str) -> list[str]:
+        weights = "ABCD"
+        document = " || ".join(
+            f"setweight(to_tsvector('{self.config}', coalesce(\"{name}\", '')), '{weights[min(i, 3)]}')"
+            for i, name in enumerate(self.fields)
+        )
+        return [
+            f'ALTER TABLE "{table}" ADD COLUMN IF NOT EXISTS "{self.column}" tsvector '
+            f"GENERATED ALWAYS AS ({document}) STORED",
+            f'CREATE INDEX IF NOT EXISTS "{table}_{self.column}_gin" ON "{table}" USING GIN ("{self.column}")',
+        ]
+
+
+@dataclass
+class TrigramSearch(SearchBackend):
+    """Postgres ILIKE '%search%' on text columns with pg_trgm GIN indexes.
+
+    It matches the same substrings as icontains, but without casts and upper() around the column,
+    so the trigram indexes are used (see get_index_sql).
+
+    Example of usage:
+    search_backend = TrigramSearch(fields=("name", "email"))
+    """
+
+    # text columns of the model, search_fields by default
+    fields: Sequence[str] = ()
+
+    def get_fields(self, model_admin: "BaseModelAdmin") -> Sequence[str]:
+        return self.fields or model_admin.search_fields
+
+    def check(self, model_admin: "BaseModelAdmin") -> None:
+        # the fields are used as column names in raw SQL
+        check_column_names(model_admin, self.get_fields(model_admin))
+
+    def get_index_sql(self, table: str) -> list[str]:
+        return [
+            "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+            *(
+                f'CREATE INDEX IF NOT EXISTS "{table}_{name}_trgm" ON "{table}" USING GIN ("{name}" gin_trgm_ops)'
+                for name in self.fields
+            ),
+        ]
+
+
+def check_column_names(model_admin: "BaseModelAdmin", fields: Sequence[str]) -> None:
+    related = [name for name in fields if "__" in name]
+    if related:
+        raise ValueError(
+            f"{type(model_admin).__name__}: {type(model_admin.search_backend).__name__} matches columns of the model, "
+            f"fields of related models are not supported: {', '.join(related)}."
+        )
+
+
+@dataclass
+class _InvertedIndex:
+    tokens: list[str]  # sorted, for prefix lookups
+    postings: dict[str, set[Any]]
+    built_at: float
+
+
+@dataclass
+class InMemorySearchIndex(SearchBackend):
+    """In process inverted index of search_fields, for SQLite and small tables.
+
+    Words of the search match words of the fields by prefix, all words must match.
+    The index is built on the first search and rebuilt after ttl seconds or when objects
+    are saved or deleted through the admin. Every process keeps its own index.
+
+    Example of usage:
+    search_backend = InMemorySearchIndex(ttl=60)
+    """
+
+    ttl: float = 300
+    _indexes: dict[Any, _InvertedIndex] = field(default_factory=dict, init=False, repr=False)
+    _locks: dict[Any, asyncio.Lock] = field(default_factory=dict, init=False, repr=False)
+
+    async def get_pks(self, model_admin: "BaseModelAdmin", search: str) -> Collection[Any] | None:
+        words = tokenize(search)
+        if not words or not model_admin.search_fields:
+            return None
+        index = await self._get_index(model_admin)
+
+        pks: set[Any] | None = None
+        for word in words:
+            matched: set[Any] = set()
+            i = bisect_left(index.tokens, word)
+            while i < len(index.tokens) and index.tokens[i].startswith(word):
+                matched |= index.postings[index.tokens[i]]
+                i += 1
+            pks = matched if pks is None else pks & matched
+            if not pks:
+                break
+        return pks or set()
+
+    def invalidate(self, model_admin: "BaseModelAdmin") -> None:
+        self._indexes.pop(model_admin.model_cls, None)
+
+    async def _get_index(self, model_admin: "BaseModelAdmin") -> _InvertedIndex:
+        key = model_admin.model_cls
+        index = self._indexes.get(key)
+        if index and index.built_at + self.ttl > time.monotonic():
+            return index
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            index = self._indexes.get(key)
+            if index and index.built_at + self.ttl > time.monotonic():
+                return index  # built by a concurrent search
+            postings: dict[str, set[Any]] = {}
+            for pk, *values in await model_admin.orm_get_search_documents(model_admin.search_fields):
+                for value in values:
+                    if value is None:
+                        continue
+                    for token in tokenize(str(value)):
+                        postings.setdefault(token, set()).add(pk)
+            index = self._indexes[key] = _InvertedIndex(sorted(postings), postings, time.monotonic())
+            return index
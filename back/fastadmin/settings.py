@@ -31,6 +31,9 @@ class Settings:
     # This value is the expired_at period (in sec) for session id.
     ADMIN_SESSION_EXPIRED_AT: int = os.getenv("ADMIN_SESSION_EXPIRED_AT", 144000)  # in sec
 
+    # This value is the period (in sec) a verified session is trusted without checking the user in db, 0 disables it.
+    ADMIN_SESSION_CACHE_TTL: int = int(os.getenv("ADMIN_SESSION_CACHE_TTL", 30))  # in sec
+
     # This value is the date format for JS widgets.
     ADMIN_DATE_FORMAT: str = os.getenv("ADMIN_DATE_FORMAT", "YYYY-MM-DD")
 
@@ -654,7 +654,7 @@ In order to be iterable, non-array objects must have a [Symbol.iterator]() metho
   border-left: 0;
   border-right: 0;
 }
-`,UKe=1,GKe=3,KKe=1,YKe=function(e){Oi(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.imageRef=b.createRef(),n.videoRef=b.createRef(),n.containerPosition={x:0,y:0},n.containerRef=null,n.styleRef=null,n.containerRect=null,n.mediaSize={width:0,height:0,naturalWidth:0,naturalHeight:0},n.dragStartPosition={x:0,y:0},n.dragStartCrop={x:0,y:0},n.gestureZoomStart=0,n.gestureRotationStart=0,n.isTouching=!1,n.lastPinchDistance=0,n.lastPinchRotation=0,n.rafDragTimeout=null,n.rafPinchTimeout=null,n.wheelTimer=null,n.currentDoc=typeof document!="undefined"?document:null,n.currentWindow=typeof window!="undefined"?window:null,n.resizeObserver=null,n.state={cropSize:null,hasWheelJustStarted:!1,mediaObjectFit:void 0},n.initResizeObserver=function(){if(!(typeof window.ResizeObserver=="undefined"||!n.containerRef)){var r=!0;n.resizeObserver=new window.ResizeObserver(function(i){if(r){r=!1;return}n.computeSizes()}),n.resizeObserver.observe(n.containerRef)}},n.preventZoomSafari=function(r){return r.preventDefault()},n.cleanEvents=function(){n.currentDoc&&(n.currentDoc.removeEventListener("mousemove",n.onMouseMove),n.currentDoc.removeEventListener("mouseup",n.onDragStopped),n.currentDoc.removeEventListener("touchmove",n.onTouchMove),n.currentDoc.removeEventListener("touchend",n.onDragStopped),n.currentDoc.removeEventListener("gesturemove",n.onGestureMove),n.currentDoc.removeEventListener("gestureend",n.onGestureEnd),n.currentDoc.removeEventListener("scroll",n.onScroll))},n.clearScrollEvent=function(){n.containerRef&&n.containerRef.removeEventListener("wheel",n.onWheel),n.wheelTimer&&clearTimeout(n.wheelTimer)},n.onMediaLoad=function(){var r=n.computeSizes();r&&(n.emitCropData(),n.setInitialCrop(r)),n.props.onMediaLoaded&&n.props.onMediaLoaded(n.mediaSize)},n.setInitialCrop=function(r){if(n.props.initialCroppedAreaPercentages){var i=zKe(n.props.initialCroppedAreaPercentages,n.mediaSize,n.props.rotation,r,n.props.minZoom,n.props.maxZoom),a=i.crop,o=i.zoom;n.props.onCropChange(a),n.props.onZoomChange&&n.props.onZoomChange(o)}else if(n.props.initialCroppedAreaPixels){var s=WKe(n.props.initialCroppedAreaPixels,n.mediaSize,n.props.rotation,r,n.props.minZoom,n.props.maxZoom),a=s.crop,o=s.zoom;n.props.onCropChange(a),n.props.onZoomChange&&n.props.onZoomChange(o)}},n.computeSizes=function(){var r,i,a,o,s,l,c=n.imageRef.current||n.videoRef.current;if(c&&n.containerRef){n.containerRect=n.containerRef.getBoundingClientRect(),n.saveContainerPosition();var u=n.containerRect.width/n.containerRect.height,f=((r=n.imageRef.current)===null||r===void 0?void 0:r.naturalWidth)||((i=n.videoRef.current)===null||i===void 0?void 0:i.videoWidth)||0,d=((a=n.imageRef.current)===null||a===void 0?void 0:a.naturalHeight)||((o=n.videoRef.current)===null||o===void 0?void 0:o.videoHeight)||0,h=c.offsetWidth<f||c.offsetHeight<d,p=f/d,v=void 0;if(h)switch(n.state.mediaObjectFit){default:case"contain":v=u>p?{width:n.containerRect.height*p,height:n.containerRect.height}:{width:n.containerRect.width,height:n.containerRect.width/p};break;case"horizontal-cover":v={width:n.containerRect.width,height:n.containerRect.width/p};break;case"vertical-cover":v={width:n.containerRect.height*p,height:n.containerRect.height};break}else v={width:c.offsetWidth,height:c.offsetHeight};n.mediaSize=dt(dt({},v),{naturalWidth:f,naturalHeight:d}),n.props.setMediaSize&&n.props.setMediaSize(n.mediaSize);var g=n.props.cropSize?n.props.cropSize:LKe(n.mediaSize.width,n.mediaSize.height,n.containerRect.width,n.containerRect.height,n.props.aspect,n.props.rotation);return(((s=n.state.cropSize)===null||s===void 0?void 0:s.height)!==g.height||((l=n.state.cropSize)===null||l===void 0?void 0:l.width)!==g.width)&&n.props.onCropSizeChange&&n.props.onCropSizeChange(g),n.setState({cropSize:g},n.recomputeCropPosition),n.props.setCropSize&&n.props.setCropSize(g),g}},n.saveContainerPosition=function(){if(n.containerRef){var r=n.containerRef.getBoundingClientRect();n.containerPosition={x:r.left,y:r.top}}},n.onMouseDown=function(r){n.currentDoc&&(r.preventDefault(),n.currentDoc.addEventListener("mousemove",n.onMouseMove),n.currentDoc.addEventListener("mouseup",n.onDragStopped),n.saveContainerPosition(),n.onDragStart(t.getMousePoint(r)))},n.onMouseMove=function(r){return n.onDrag(t.getMousePoint(r))},n.onScroll=function(r){n.currentDoc&&(r.preventDefault(),n.saveContainerPosition())},n.onTouchStart=function(r){n.currentDoc&&(n.isTouching=!0,!(n.props.onTouchRequest&&!n.props.onTouchRequest(r))&&(n.currentDoc.addEventListener("touchmove",n.onTouchMove,{passive:!1}),n.currentDoc.addEventListener("touchend",n.onDragStopped),n.saveContainerPosition(),r.touches.length===2?n.onPinchStart(r):r.touches.length===1&&n.onDragStart(t.getTouchPoint(r.touches[0]))))},n.onTouchMove=function(r){r.preventDefault(),r.touches.length===2?n.onPinchMove(r):r.touches.length===1&&n.onDrag(t.getTouchPoint(r.touches[0]))},n.onGestureStart=function(r){n.currentDoc&&(r.preventDefault(),n.currentDoc.addEventListener("gesturechange",n.onGestureMove),n.currentDoc.addEventListener("gestureend",n.onGestureEnd),n.gestureZoomStart=n.props.zoom,n.gestureRotationStart=n.props.rotation)},n.onGestureMove=function(r){if(r.preventDefault(),!n.isTouching){var i=t.getMousePoint(r),a=n.gestureZoomStart-1+r.scale;if(n.setNewZoom(a,i,{shouldUpdatePosition:!0}),n.props.onRotationChange){var o=n.gestureRotationStart+r.rotation;n.props.onRotationChange(o)}}},n.onGestureEnd=function(r){n.cleanEvents()},n.onDragStart=function(r){var i,a,o=r.x,s=r.y;n.dragStartPosition={x:o,y:s},n.dragStartCrop=dt({},n.props.crop),(a=(i=n.props).onInteractionStart)===null||a===void 0||a.call(i)},n.onDrag=function(r){var i=r.x,a=r.y;n.currentWindow&&(n.rafDragTimeout&&n.currentWindow.cancelAnimationFrame(n.rafDragTimeout),n.rafDragTimeout=n.currentWindow.requestAnimationFrame(function(){if(n.state.cropSize&&!(i===void 0||a===void 0)){var o=i-n.dragStartPosition.x,s=a-n.dragStartPosition.y,l={x:n.dragStartCrop.x+o,y:n.dragStartCrop.y+s},c=n.props.restrictPosition?Kb(l,n.mediaSize,n.state.cropSize,n.props.zoom,n.props.rotation):l;n.props.onCropChange(c)}}))},n.onDragStopped=function(){var r,i;n.isTouching=!1,n.cleanEvents(),n.emitCropData(),(i=(r=n.props).onInteractionEnd)===null||i===void 0||i.call(r)},n.onWheel=function(r){if(n.currentWindow&&!(n.props.onWheelRequest&&!n.props.onWheelRequest(r))){r.preventDefault();var i=t.getMousePoint(r),a=NKe(r).pixelY,o=n.props.zoom-a*n.props.zoomSpeed/200;n.setNewZoom(o,i,{shouldUpdatePosition:!0}),n.state.hasWheelJustStarted||n.setState({hasWheelJustStarted:!0},function(){var s,l;return(l=(s=n.props).onInteractionStart)===null||l===void 0?void 0:l.call(s)}),n.wheelTimer&&clearTimeout(n.wheelTimer),n.wheelTimer=n.currentWindow.setTimeout(function(){return n.setState({hasWheelJustStarted:!1},function(){var s,l;return(l=(s=n.props).onInteractionEnd)===null||l===void 0?void 0:l.call(s)})},250)}},n.getPointOnContainer=function(r,i){var a=r.x,o=r.y;if(!n.containerRect)throw new Error("The Cropper is not mounted");return{x:n.containerRect.width/2-(a-i.x),y:n.containerRect.height/2-(o-i.y)}},n.getPointOnMedia=function(r){var i=r.x,a=r.y,o=n.props,s=o.crop,l=o.zoom;return{x:(i+s.x)/l,y:(a+s.y)/l}},n.setNewZoom=function(r,i,a){var o=a===void 0?{}:a,s=o.shouldUpdatePosition,l=s===void 0?!0:s;if(!(!n.state.cropSize||!n.props.onZoomChange)){var c=n_(r,n.props.minZoom,n.props.maxZoom);if(l){var u=n.getPointOnContainer(i,n.containerPosition),f=n.getPointOnMedia(u),d={x:f.x*c-u.x,y:f.y*c-u.y},h=n.props.restrictPosition?Kb(d,n.mediaSize,n.state.cropSize,c,n.props.rotation):d;n.props.onCropChange(h)}n.props.onZoomChange(c)}},n.getCropData=function(){if(!n.state.cropSize)return null;var r=n.props.restrictPosition?Kb(n.props.crop,n.mediaSize,n.state.cropSize,n.props.zoom,n.props.rotation):n.props.crop;return DKe(r,n.mediaSize,n.state.cropSize,n.getAspect(),n.props.zoom,n.props.rotation,n.props.restrictPosition)},n.emitCropData=function(){var r=n.getCropData();if(r){var i=r.croppedAreaPercentages,a=r.croppedAreaPixels;n.props.onCropComplete&&n.props.onCropComplete(i,a),n.props.onCropAreaChange&&n.props.onCropAreaChange(i,a)}},n.emitCropAreaChange=function(){var r=n.getCropData();if(r){var i=r.croppedAreaPercentages,a=r.croppedAreaPixels;n.props.onCropAreaChange&&n.props.onCropAreaChange(i,a)}},n.recomputeCropPosition=function(){if(n.state.cropSize){var r=n.props.restrictPosition?Kb(n.props.crop,n.mediaSize,n.state.cropSize,n.props.zoom,n.props.rotation):n.props.crop;n.props.onCropChange(r),n.emitCropData()}},n.onKeyDown=function(r){var i=n.props,a=i.crop,o=i.onCropChange,s=i.keyboardStep,l=i.zoom,c=i.rotation,u=s;if(n.state.cropSize){r.shiftKey&&(u*=.2);var f=dt({},a);switch(r.key){case"ArrowUp":f.y-=u,r.preventDefault();break;case"ArrowDown":f.y+=u,r.preventDefault();break;case"ArrowLeft":f.x-=u,r.preventDefault();break;case"ArrowRight":f.x+=u,r.preventDefault();break;default:return}n.props.restrictPosition&&(f=Kb(f,n.mediaSize,n.state.cropSize,l,c)),o(f)}},n}return t.prototype.componentDidMount=function(){!this.currentDoc||!this.currentWindow||(this.containerRef&&(this.containerRef.ownerDocument&&(this.currentDoc=this.containerRef.ownerDocument),this.currentDoc.defaultView&&(this.currentWindow=this.currentDoc.defaultView),this.initResizeObserver(),typeof window.ResizeObserver=="undefined"&&this.currentWindow.addEventListener("resize",this.computeSizes),this.props.zoomWithScroll&&this.containerRef.addEventListener("wheel",this.onWheel,{passive:!1}),this.containerRef.addEventListener("gesturestart",this.onGestureStart)),this.currentDoc.addEventListener("scroll",this.onScroll),this.props.disableAutomaticStylesInjection||(this.styleRef=this.currentDoc.createElement("style"),this.styleRef.setAttribute("type","text/css"),this.props.nonce&&this.styleRef.setAttribute("nonce",this.props.nonce),this.styleRef.innerHTML=qKe,this.currentDoc.head.appendChild(this.styleRef)),this.imageRef.current&&this.imageRef.current.complete&&this.onMediaLoad(),this.props.setImageRef&&this.props.setImageRef(this.imageRef),this.props.setVideoRef&&this.props.setVideoRef(this.videoRef))},t.prototype.componentWillUnmount=function(){var n,r;!this.currentDoc||!this.currentWindow||(typeof window.ResizeObserver=="undefined"&&this.currentWindow.removeEventListener("resize",this.computeSizes),(n=this.resizeObserver)===null||n===void 0||n.disconnect(),this.containerRef&&this.containerRef.removeEventListener("gesturestart",this.preventZoomSafari),this.styleRef&&((r=this.styleRef.parentNode)===null||r===void 0||r.removeChild(this.styleRef)),this.cleanEvents(),this.props.zoomWithScroll&&this.clearScrollEvent())},t.prototype.componentDidUpdate=function(n){var r,i,a,o,s,l,c,u,f;n.rotation!==this.props.rotation?(this.computeSizes(),this.recomputeCropPosition()):n.aspect!==this.props.aspect?this.computeSizes():n.objectFit!==this.props.objectFit?this.computeSizes():n.zoom!==this.props.zoom?this.recomputeCropPosition():((r=n.cropSize)===null||r===void 0?void 0:r.height)!==((i=this.props.cropSize)===null||i===void 0?void 0:i.height)||((a=n.cropSize)===null||a===void 0?void 0:a.width)!==((o=this.props.cropSize)===null||o===void 0?void 0:o.width)?this.computeSizes():(((s=n.crop)===null||s===void 0?void 0:s.x)!==((l=this.props.crop)===null||l===void 0?void 0:l.x)||((c=n.crop)===null||c===void 0?void 0:c.y)!==((u=this.props.crop)===null||u===void 0?void 0:u.y))&&this.emitCropAreaChange(),n.zoomWithScroll!==this.props.zoomWithScroll&&this.containerRef&&(this.props.zoomWithScroll?this.containerRef.addEventListener("wheel",this.onWheel,{passive:!1}):this.clearScrollEvent()),n.video!==this.props.video&&((f=this.videoRef.current)===null||f===void 0||f.load());var d=this.getObjectFit();d!==this.state.mediaObjectFit&&this.setState({mediaObjectFit:d},this.computeSizes)},t.prototype.getAspect=function(){var n=this.props,r=n.cropSize,i=n.aspect;return r?r.width/r.height:i},t.prototype.getObjectFit=function(){var n,r,i,a;if(this.props.objectFit==="cover"){var o=this.imageRef.current||this.videoRef.current;if(o&&this.containerRef){this.containerRect=this.containerRef.getBoundingClientRect();var s=this.containerRect.width/this.containerRect.height,l=((n=this.imageRef.current)===null||n===void 0?void 0:n.naturalWidth)||((r=this.videoRef.current)===null||r===void 0?void 0:r.videoWidth)||0,c=((i=this.imageRef.current)===null||i===void 0?void 0:i.naturalHeight)||((a=this.videoRef.current)===null||a===void 0?void 0:a.videoHeight)||0,u=l/c;return u<s?"horizontal-cover":"vertical-cover"}return"horizontal-cover"}return this.props.objectFit},t.prototype.onPinchStart=function(n){var r=t.getTouchPoint(n.touches[0]),i=t.getTouchPoint(n.touches[1]);this.lastPinchDistance=fie(r,i),this.lastPinchRotation=die(r,i),this.onDragStart(hie(r,i))},t.prototype.onPinchMove=function(n){var r=this;if(!(!this.currentDoc||!this.currentWindow)){var i=t.getTouchPoint(n.touches[0]),a=t.getTouchPoint(n.touches[1]),o=hie(i,a);this.onDrag(o),this.rafPinchTimeout&&this.currentWindow.cancelAnimationFrame(this.rafPinchTimeout),this.rafPinchTimeout=this.currentWindow.requestAnimationFrame(function(){var s=fie(i,a),l=r.props.zoom*(s/r.lastPinchDistance);r.setNewZoom(l,o,{shouldUpdatePosition:!1}),r.lastPinchDistance=s;var c=die(i,a),u=r.props.rotation+(c-r.lastPinchRotation);r.props.onRotationChange&&r.props.onRotationChange(u),r.lastPinchRotation=c})}},t.prototype.render=function(){var n=this,r,i=this.props,a=i.image,o=i.video,s=i.mediaProps,l=i.transform,c=i.crop,u=c.x,f=c.y,d=i.rotation,h=i.zoom,p=i.cropShape,v=i.showGrid,g=i.style,m=g.containerStyle,y=g.cropAreaStyle,x=g.mediaStyle,S=i.classes,w=S.containerClassName,C=S.cropAreaClassName,E=S.mediaClassName,O=(r=this.state.mediaObjectFit)!==null&&r!==void 0?r:this.getObjectFit();return b.createElement("div",{onMouseDown:this.onMouseDown,onTouchStart:this.onTouchStart,ref:function(P){return n.containerRef=P},"data-testid":"container",style:m,className:r_("reactEasyCrop_Container",w)},a?b.createElement("img",dt({alt:"",className:r_("reactEasyCrop_Image",O==="contain"&&"reactEasyCrop_Contain",O==="horizontal-cover"&&"reactEasyCrop_Cover_Horizontal",O==="vertical-cover"&&"reactEasyCrop_Cover_Vertical",E)},s,{src:a,ref:this.imageRef,style:dt(dt({},x),{transform:l||"translate(".concat(u,"px, ").concat(f,"px) rotate(").concat(d,"deg) scale(").concat(h,")")}),onLoad:this.onMediaLoad})):o&&b.createElement("video",dt({autoPlay:!0,playsInline:!0,loop:!0,muted:!0,className:r_("reactEasyCrop_Video",O==="contain"&&"reactEasyCrop_Contain",O==="horizontal-cover"&&"reactEasyCrop_Cover_Horizontal",O==="vertical-cover"&&"reactEasyCrop_Cover_Vertical",E)},s,{ref:this.videoRef,onLoadedMetadata:this.onMediaLoad,style:dt(dt({},x),{transform:l||"translate(".concat(u,"px, ").concat(f,"px) rotate(").concat(d,"deg) scale(").concat(h,")")}),controls:!1}),(Array.isArray(o)?o:[{src:o}]).map(function($){return b.createElement("source",dt({key:$.src},$))})),this.state.cropSize&&b.createElement("div",{style:dt(dt({},y),{width:this.state.cropSize.width,height:this.state.cropSize.height}),tabIndex:0,onKeyDown:this.onKeyDown,"data-testid":"cropper",className:r_("reactEasyCrop_CropArea",p==="round"&&"reactEasyCrop_CropAreaRound",v&&"reactEasyCrop_CropAreaGrid",C)}))},t.defaultProps={zoom:1,rotation:0,aspect:4/3,maxZoom:GKe,minZoom:UKe,cropShape:"rect",objectFit:"contain",showGrid:!0,style:{},classes:{},mediaProps:{},zoomSpeed:1,restrictPosition:!0,zoomWithScroll:!0,keyboardStep:KKe},t.getMousePoint=function(n){return{x:Number(n.clientX),y:Number(n.clientY)}},t.getTouchPoint=function(n){return{x:Number(n.clientX),y:Number(n.clientY)}},t}(b.Component);const uu="img-crop",Z6=1,Yb=.1,i_=0,pie=-180,vie=180,Q6=1,Xb=.01,XKe=b.forwardRef((e,t)=>{const{cropperRef:n,zoomSlider:r,rotationSlider:i,aspectSlider:a,showReset:o,resetBtnText:s,modalImage:l,aspect:c,minZoom:u,maxZoom:f,minAspect:d,maxAspect:h,cropShape:p,showGrid:v,cropperProps:g}=e,[m,y]=b.useState(Z6),[x,S]=b.useState(i_),[w,C]=b.useState(c),E=m!==Z6||x!==i_||w!==c,O=()=>{y(Z6),S(i_),C(c)},[$,P]=b.useState({x:0,y:0}),M=b.useRef({width:0,height:0,x:0,y:0}),k=b.useCallback((N,L)=>{M.current=L},[]);b.useImperativeHandle(t,()=>({rotation:x,cropPixelsRef:M,onReset:O}));const T="[display:flex] [align-items:center] [width:60%] [margin-inline:auto]",R="[display:flex] [align-items:center] [justify-content:center] [height:32px] [width:32px] [background:transparent] [border:0] [font-family:inherit] [font-size:18px] [cursor:pointer] disabled:[opacity:20%] disabled:[cursor:default]",A="[flex:1]";return ve.jsxs(ve.Fragment,{children:[ve.jsx(YKe,Object.assign({},g,{ref:n,image:l,crop:$,zoom:m,rotation:x,aspect:w,minZoom:u,maxZoom:f,zoomWithScroll:r,cropShape:p,showGrid:v,onCropChange:P,onZoomChange:y,onRotationChange:S,onCropComplete:k,classes:{containerClassName:`${uu}-container ![position:relative] [width:100%] [height:40vh] [&~section:first-of-type]:[margin-top:16px] [&~section:last-of-type]:[margin-bottom:16px]`,mediaClassName:`${uu}-media`}})),r&&ve.jsxs("section",{className:`${uu}-control ${uu}-control-zoom ${T}`,children:[ve.jsx("button",{className:R,onClick:()=>y(+(m-Yb).toFixed(1)),disabled:m-Yb<u,children:"－"}),ve.jsx(g5,{className:A,min:u,max:f,step:Yb,value:m,onChange:y}),ve.jsx("button",{className:R,onClick:()=>y(+(m+Yb).toFixed(1)),disabled:m+Yb>f,children:"＋"})]}),i&&ve.jsxs("section",{className:`${uu}-control ${uu}-control-rotation ${T}`,children:[ve.jsx("button",{className:`${R} [font-size:16px]`,onClick:()=>S(x-Q6),disabled:x===pie,children:"↺"}),ve.jsx(g5,{className:A,min:pie,max:vie,step:Q6,value:x,onChange:S}),ve.jsx("button",{className:`${R} [font-size:16px]`,onClick:()=>S(x+Q6),disabled:x===vie,children:"↻"})]}),a&&ve.jsxs("section",{className:`${uu}-control ${uu}-control-aspect ${T}`,children:[ve.jsx("button",{className:R,onClick:()=>C(+(w-Xb).toFixed(2)),disabled:w-Xb<d,children:"↕"}),ve.jsx(g5,{className:A,min:d,max:h,step:Xb,value:w,onChange:C}),ve.jsx("button",{className:R,onClick:()=>C(+(w+Xb).toFixed(2)),disabled:w+Xb>h,children:"↔"})]}),o&&(r||i||a)&&ve.jsx(Hn,{className:"[bottom:20px] [position:absolute]",style:E?{}:{opacity:.3,pointerEvents:"none"},onClick:O,children:s})]})});var ZKe=b.memo(XKe);function QKe(e,t){t===void 0&&(t={});var n=t.insertAt;if(typeof document!="undefined"){var r=document.head||document.getElementsByTagName("head")[0],i=document.createElement("style");i.type="text/css",n==="top"&&r.firstChild?r.insertBefore(i,r.firstChild):r.appendChild(i),i.styleSheet?i.styleSheet.cssText=e:i.appendChild(document.createTextNode(e))}}var JKe=".\\[align-items\\:center\\]{align-items:center}.\\[background\\:transparent\\]{background:transparent}.\\[border\\:0\\]{border:0}.\\[bottom\\:20px\\]{bottom:20px}.\\[cursor\\:pointer\\]{cursor:pointer}.\\[display\\:flex\\]{display:flex}.\\[flex\\:1\\]{flex:1}.\\[font-family\\:inherit\\]{font-family:inherit}.\\[font-size\\:16px\\]{font-size:16px}.\\[font-size\\:18px\\]{font-size:18px}.\\[height\\:32px\\]{height:32px}.\\[height\\:40vh\\]{height:40vh}.\\[justify-content\\:center\\]{justify-content:center}.\\[margin-inline\\:auto\\]{margin-inline:auto}.\\[position\\:absolute\\]{position:absolute}.\\!\\[position\\:relative\\]{position:relative!important}.\\[width\\:100\\%\\]{width:100%}.\\[width\\:32px\\]{width:32px}.\\[width\\:60\\%\\]{width:60%}.disabled\\:\\[cursor\\:default\\]:disabled{cursor:default}.disabled\\:\\[opacity\\:20\\%\\]:disabled{opacity:20%}.\\[\\&\\~section\\:first-of-type\\]\\:\\[margin-top\\:16px\\]~section:first-of-type{margin-top:16px}.\\[\\&\\~section\\:last-of-type\\]\\:\\[margin-bottom\\:16px\\]~section:last-of-type{margin-bottom:16px}";QKe(JKe,{insertAt:"top"});const eYe=b.forwardRef((e,t)=>{const{quality:n=.4,fillColor:r="white",zoomSlider:i=!0,rotationSlider:a=!1,aspectSlider:o=!1,showReset:s=!1,resetText:l,aspect:c=1,minZoom:u=1,maxZoom:f=3,minAspect:d=.5,maxAspect:h=2,cropShape:p="rect",showGrid:v=!1,cropperProps:g,modalClassName:m,modalTitle:y,modalWidth:x,modalOk:S,modalCancel:w,onModalOk:C,onModalCancel:E,modalProps:O,beforeCrop:$,children:P}=e,M=b.useRef({});M.current.onModalOk=C,M.current.onModalCancel=E,M.current.beforeCrop=$;const k=b.useRef(null),T=b.useCallback(G=>{var K;const X=document.createElement("canvas"),Q=X.getContext("2d"),ne=(((K=G==null?void 0:G.getRootNode)===null||K===void 0?void 0:K.call(G))||document).querySelector(`.${uu}-media`),{width:te,height:ie,x:J,y:le}=k.current.cropPixelsRef.current;if(a&&k.current.rotation!==i_){const{naturalWidth:oe,naturalHeight:re}=ne,se=k.current.rotation*(Math.PI/180),ge=Math.abs(Math.sin(se)),de=Math.abs(Math.cos(se)),pe=oe*de+re*ge,fe=re*de+oe*ge;X.width=pe,X.height=fe,Q.fillStyle=r,Q.fillRect(0,0,pe,fe);const xe=pe/2,Oe=fe/2;Q.translate(xe,Oe),Q.rotate(se),Q.translate(-xe,-Oe);const _e=(pe-oe)/2,Te=(fe-re)/2;Q.drawImage(ne,0,0,oe,re,_e,Te,oe,re);const Fe=Q.getImageData(0,0,pe,fe);X.width=te,X.height=ie,Q.putImageData(Fe,-J,-le)}else X.width=te,X.height=ie,Q.fillStyle=r,Q.fillRect(0,0,te,ie),Q.drawImage(ne,J,le,te,ie,0,0,te,ie);return X},[r,a]),[R,A]=b.useState(""),N=b.useRef(),L=b.useRef(),j=b.useCallback(G=>ZO(void 0,[G],void 0,function*({beforeUpload:K,file:X,resolve:Q,reject:ee}){const ne=X;if(typeof K!="function"){Q(ne);return}try{const te=yield K(X,[X]);Q(te===!1?!1:te!==!0&&te||ne)}catch(te){ee(te)}}),[]),F=b.useCallback(G=>(K,X)=>new Promise((Q,ee)=>ZO(void 0,void 0,void 0,function*(){let ne=K;if(typeof M.current.beforeCrop=="function")try{const ie=yield M.current.beforeCrop(K,X);if(ie===!1)return j({beforeUpload:G,file:K,resolve:Q,reject:ee});ie!==!0&&(ne=ie||K)}catch(ie){return j({beforeUpload:G,file:K,resolve:Q,reject:ee})}const te=new FileReader;te.addEventListener("load",()=>{typeof te.result=="string"&&A(te.result)}),te.readAsDataURL(ne),N.current=()=>{var ie,J;A(""),k.current.onReset();let le=!1;(J=(ie=M.current).onModalCancel)===null||J===void 0||J.call(ie,oe=>{Q(oe),le=!0}),le||Q(pO.LIST_IGNORE)},L.current=ie=>ZO(void 0,void 0,void 0,function*(){A(""),k.current.onReset();const J=T(ie.target),{type:le,name:oe,uid:re}=ne;J.toBlob(se=>ZO(void 0,void 0,void 0,function*(){const ge=new File([se],oe,{type:le});Object.assign(ge,{uid:re}),j({beforeUpload:G,file:ge,resolve:de=>{var pe,fe;Q(de),(fe=(pe=M.current).onModalOk)===null||fe===void 0||fe.call(pe,de)},reject:de=>{var pe,fe;ee(de),(fe=(pe=M.current).onModalOk)===null||fe===void 0||fe.call(pe,de)}})}),le,n)})})),[T,n,j]),B=b.useCallback(G=>{const K=Array.isArray(G)?G[0]:G,X=K.props,{beforeUpload:Q,accept:ee}=X,ne=Wa(X,["beforeUpload","accept"]);return Object.assign(Object.assign({},K),{props:Object.assign(Object.assign({},ne),{accept:ee||"image/*",beforeUpload:F(Q)})})},[F]),D=b.useMemo(()=>{const G={};return x!==void 0&&(G.width=x),S!==void 0&&(G.okText=S),w!==void 0&&(G.cancelText=w),G},[w,S,x]),z=`${uu}-modal${m?` ${m}`:""}`,q=(typeof window=="undefined"?"":window.navigator.language)==="zh-CN",H=y||(q?"编辑图片":"Edit image"),U=l||(q?"重置":"Reset");return ve.jsxs(ve.Fragment,{children:[B(P),R&&ve.jsx(Ha,Object.assign({},O,D,{open:!0,title:H,onCancel:N.current,onOk:L.current,wrapClassName:z,maskClosable:!1,destroyOnClose:!0,children:ve.jsx(ZKe,{ref:k,cropperRef:t,zoomSlider:i,rotationSlider:a,aspectSlider:o,showReset:s,resetBtnText:U,modalImage:R,aspect:c,minZoom:u,maxZoom:f,minAspect:d,maxAspect:h,cropShape:p,showGrid:v,cropperProps:g})}))]})});var tYe=e=>new Promise((t,n)=>{const r=new FileReader;r.readAsDataURL(e),r.onload=()=>t(r.result),r.onerror=i=>n(i)}),nYe=e=>la(this,null,function*(){const n=yield(yield fetch(e)).blob();return new Promise((r,i)=>{const a=new FileReader;a.readAsDataURL(n),a.onloadend=()=>{const o=a.result;r(o)},a.onerror=o=>i(o)})}),rYe=e=>la(this,null,function*(){return e.split(",")[0].match(/:(.*?);/)[1]}),iYe={fromFile:tYe,fromURL:nYe,mimeType:rYe};const gie=rn(iYe),aYe=a=>{var o=a,{parentId:e,value:t,onChange:n,multiple:r}=o,i=oc(o,["parentId","value","onChange","multiple"]);const{t:s}=io("UploadInput"),[l,c]=b.useState(),{configuration:u}=b.useContext(Mc),f=m=>la(this,null,function*(){const y=r?m.fileList:m.fileList.slice(-1),x=[];for(const S of y)if(S.originFileObj){const w=yield gie.fromFile(S.originFileObj);x.push(w)}else x.push(S.url);r?n&&n(x):n&&n(x[0])}),d=b.useMemo(()=>t?(Am(t)?t:[t]).map((y,x)=>({uid:x,status:"done",url:y})):void 0,[t]),h=m=>la(this,null,function*(){c(m.url?m.url:yield gie.fromFile(m.originFileObj))}),p=()=>c(void 0),v=()=>!1,g=({withCrop:m,children:y})=>m?ve.jsx(eYe,{rotationSlider:!0,children:y}):ve.jsx(ve.Fragment,{children:y});return ve.jsxs(ve.Fragment,{children:[ve.jsx(g,{withCrop:!(u!=null&&u.disable_crop_image),children:ve.jsx(pO,Rn(Ke({listType:"picture-card",withCredentials:!0,beforeUpload:v,onChange:f,defaultFileList:d,multiple:r,onPreview:h},i),{children:ve.jsxs(va,{children:[ve.jsx(QDe,{}),s("Upload")]})}))}),ve.jsx(Ha,{footer:null,title:s("Preview Image"),open:!!l,onCancel:p,children:ve.jsx(HE,{preview:!1,src:l})})]})},J6=(e,t,n)=>{switch(e){case Hr.Input:return[oi,{}];case Hr.InputNumber:return[s5,{style:{width:"100%"}}];case Hr.EmailInput:return[oi,{}];case Hr.PhoneInput:return[JUe,{}];case Hr.SlugInput:return[eGe,{}];case Hr.UrlInput:return[oi,{}];case Hr.PasswordInput:return[YUe,{parentId:n}];case Hr.TextArea:return[oi.TextArea,{}];case Hr.RichTextArea:return[EKe,{}];case Hr.JsonTextArea:return[KUe,{}];case Hr.Select:return[no,{style:{width:"100%"}}];case Hr.AsyncSelect:return[qUe,{style:{width:"100%"}}];case Hr.AsyncTransfer:return[UUe,{}];case Hr.Switch:return[ZQ,{}];case Hr.Checkbox:return[Ol,{}];case Hr.CheckboxGroup:return[Ol.Group,{}];case Hr.RadioGroup:return[Dd.Group,{}];case Hr.DatePicker:return[df,{style:{width:"100%"}}];case Hr.TimePicker:return[Pb,{style:{width:"100%"}}];case Hr.DateTimePicker:return[df,{style:{width:"100%"},showTime:!0}];case Hr.RangePicker:return[df.RangePicker,{style:{width:"100%"},placeholder:[t("Start"),t("End")]}];case Hr.Upload:return[aYe,{parentId:n}];default:return[oi,{}]}},oYe=({widgetType:e,widgetProps:t,value:n,onFilter:r,onReset:i})=>{const{t:a}=io("List"),[o,s]=b.useState(),[l,c]=J6(e,a);b.useEffect(()=>{s(n)},[n]);const u=()=>{r(o)},f=d=>{switch(l){case oi:case oi.TextArea:case Dd.Group:s(d.target.value);break;default:s(d);break}};return ve.jsxs(Ri,{style:{width:400},children:[ve.jsx(vr,{xs:24,style:{padding:10},children:ve.jsx(l,Ke(Ke({value:o,size:"middle",onChange:f,placeholder:a("Filter By")},c||{}),t||{}))}),ve.jsx(vr,{xs:24,style:{padding:10},children:ve.jsxs(va,{align:"end",children:[ve.jsx(Hn,{onClick:i,size:"small",children:a("Reset")}),ve.jsx(Hn,{type:"primary",onClick:u,icon:l===oi?ve.jsx(nm,{}):ve.jsx(KQ,{}),size:"small",children:a("Filter")})]})})]})},mie=(e,t,n,r,i,a,o)=>{const{t:s}=io("List"),l=(e||{fields:[]}).fields;return b.useMemo(()=>{const c=l.filter(u=>!!u.list_configuration).sort((u,f)=>{var d,h;return(((d=u.list_configuration)==null?void 0:d.index)||0)-(((h=f.list_configuration)==null?void 0:h.index)||0)}).map(u=>{var f,d,h,p;return{title:LO(u.name),dataIndex:u.name,key:u.name,sorter:(f=u.list_configuration)==null?void 0:f.sorter,width:(d=u.list_configuration)==null?void 0:d.width,ellipsis:!0,filterIcon:(h=u.list_configuration)!=null&&h.filter_widget_type?n(u.name)?ve.jsx(ro,{title:s("Click to reset this filter"),children:ve.jsx(GQ,{style:{color:"red"}})}):ve.jsx(ro,{title:s("Click to filter"),children:ve.jsx(KQ,{})}):void 0,filterDropdown:(p=u.list_configuration)!=null&&p.filter_widget_type?({confirm:v,clearFilters:g})=>{var x,S;const m=()=>{i(u.name),g(),v()},y=w=>{r(u.name,w),v()};return ve.jsx(oYe,{widgetType:(x=u.list_configuration)==null?void 0:x.filter_widget_type,widgetProps:(S=u.list_configuration)==null?void 0:S.filter_widget_props,value:n(u.name),onFilter:y,onReset:m})}:void 0,render:(v,g)=>{var y,x,S;if(v===void 0)return(y=u.list_configuration)==null?void 0:y.empty_value_display;const m=OUe(v,(x=u.list_configuration)==null?void 0:x.empty_value_display,t);if((S=u==null?void 0:u.list_configuration)!=null&&S.is_link){const w=()=>o(g);return ve.jsx(Hn,{style:{padding:0},type:"link",onClick:w,children:m})}return BO(m)&&(m.startsWith("http")||m.startsWith("/"))?ve.jsx("a",{href:m,target:"_blank",rel:"noreferrer",children:m}):m}}});return c.push({title:s("Actions"),key:"actions",width:100,fixed:"right",render:u=>{const f=()=>a(u),d=()=>o(u);return ve.jsxs(va,{children:[((e==null?void 0:e.permissions)||[]).includes(Ss.Delete)&&ve.jsx(P5,{title:s("Are you sure?"),onConfirm:f,children:ve.jsx(Hn,{size:"small",danger:!0,children:ve.jsx(XE,{})})}),((e==null?void 0:e.permissions)||[]).includes(Ss.Change)&&ve.jsx(Hn,{size:"small",onClick:d,children:ve.jsx(ZE,{})})]})}}),c},[s,t,l,n,e==null?void 0:e.permissions,r,o,a,i])},Zb=1,e8=10,yie=e=>{const[t,n]=b.useState(),[r,i]=b.useState([]),[a,o]=b.useState({}),[s,l]=b.useState(),[c,u]=b.useState(Zb),[f,d]=b.useState(e8),[h,p]=b.useState();return b.useEffect(()=>{e!=null&&e.list_per_page&&d(e==null?void 0:e.list_per_page)},[e==null?void 0:e.list_per_page]),b.useEffect(()=>{e!=null&&e.name&&(u(Zb),p(void 0),o({}))},[e==null?void 0:e.name]),{defaultPage:Zb,defaultPageSize:e8,page:c,setPage:u,pageSize:f,setPageSize:d,search:s,setSearch:l,filters:a,setFilters:o,sortBy:h,setSortBy:p,action:t,setAction:n,selectedRowKeys:r,setSelectedRowKeys:i,onTableChange:(m,y,x)=>{m.pageSize!==f?u(Zb):u(m.current),d(m.pageSize),x.field&&p(x.order==="ascend"?x.field:`-${x.field}`)},resetTable:m=>{n(void 0),i([]),u(Zb),d(e8),p(void 0),m||(o({}),l(void 0))}}},sYe=({modelConfiguration:e,parentId:t})=>{const{t:n}=io("Inline"),[r]=Ir.useForm(),[i]=Ir.useForm(),{configuration:a}=b.useContext(Mc),[o,s]=b.useState(!1),[l,c]=b.useState(!1),[u,f]=b.useState(),{defaultPage:d,defaultPageSize:h,page:p,setPage:v,pageSize:g,setPageSize:m,search:y,setSearch:x,filters:S,setFilters:w,sortBy:C,action:E,setAction:O,selectedRowKeys:$,setSelectedRowKeys:P,resetTable:M,onTableChange:k}=yie(e),T=e.name,R=b.useCallback(()=>{s(!0)},[]),A=b.useCallback(()=>{M(),s(!1)},[M]),N=b.useCallback(()=>{r.resetFields(),c(!0),f(void 0),r.setFieldValue(e.fk_name,t)},[r,t,e.fk_name]),L=b.useCallback(()=>{c(!1),f(void 0)},[]),j=b.useCallback(fe=>{i.resetFields(),f(fe==null?void 0:fe.id),c(!1)},[i]),F=b.useCallback(()=>{f(void 0),c(!1)},[]),B=Im.stringify(Ke({search:y,sort_by:C,offset:(p-1)*g,limit:g,[e.fk_name]:t},nN(S))),{data:D,isLoading:z,refetch:W}=Kc({queryKey:[`/list/${T}`,B],queryFn:()=>lu(`/list/${T}?${B}`),enabled:o,refetchOnWindowFocus:!1}),{data:q,isLoading:H}=Kc({queryKey:[`/retrieve/${T}/${u}`],queryFn:()=>lu(`/retrieve/${T}/${u}`),enabled:!!u,refetchOnWindowFocus:!1}),{mutate:U,isPending:G,isError:K}=Oo({mutationFn:fe=>gf(`/add/${T}`,fe),onSuccess:()=>{na.success(n("Succesfully added")),W(),L()},onError:fe=>{kc(fe,r)}}),{mutate:X,isPending:Q,isError:ee}=Oo({mutationFn:fe=>NO(`/change/${T}/${u}`,fe),onSuccess:()=>{na.success(n("Succesfully changed")),W(),F()},onError:fe=>{kc(fe,i)}}),{mutate:ne}=Oo({mutationFn:fe=>XA(`/delete/${T}/${fe}`),onSuccess:()=>{M(e==null?void 0:e.preserve_filters),W(),na.success(n("Successfully deleted"))},onError:fe=>{kc(fe)}}),{mutate:te,isPending:ie}=Oo({mutationFn:fe=>gf(`/action/${T}/${E}`,fe),onSuccess:()=>{M(e==null?void 0:e.preserve_filters),W(),na.success(n("Successfully applied"))},onError:()=>{na.error(n("Server error"))}}),J=fe=>P(fe),le=b.useCallback(()=>te({ids:$}),[te,$]),oe=a==null?void 0:a.datetime_format,re=mie(e,oe,b.useCallback(fe=>S[fe],[S]),b.useCallback((fe,xe)=>{S[fe]=xe,w(Ke({},S)),v(d),m(h)},[d,h,S,w,v,m]),b.useCallback(fe=>{delete S[fe],w(Ke({},S)),v(d),m(h)},[d,h,S,w,v,m]),b.useCallback(fe=>{ne(fe.id)},[ne]),b.useCallback(fe=>{j(fe)},[j])),se=fe=>{U(fe)},ge=fe=>{X(fe)},de=b.useCallback(()=>{var fe,xe;return ve.jsxs(Ri,{justify:"end",gutter:[8,8],children:[((e==null?void 0:e.actions)||[]).length>0&&(e==null?void 0:e.actions_on_top)&&ve.jsxs(vr,{children:[ve.jsx(no,{placeholder:n("Select Action By"),allowClear:!0,value:E,onChange:O,style:{width:300},children:((e==null?void 0:e.actions)||[]).map(Oe=>ve.jsx(no.Option,{value:Oe.name,children:Oe.description||Oe.name},Oe.name))}),ve.jsx(Hn,{disabled:!E||$.length===0,style:{marginLeft:5},loading:ie,onClick:le,children:n("Apply")})]}),((e==null?void 0:e.search_fields)||[]).length>0&&ve.jsx(vr,{children:ve.jsx(oi.Search,{placeholder:(e==null?void 0:e.search_help_text)||n("Search By"),allowClear:!0,onSearch:x,style:{width:200}})}),((fe=e==null?void 0:e.permissions)==null?void 0:fe.includes(Ss.Export))&&ve.jsx(vr,{children:ve.jsx(tne,{model:T,search:y,filters:Rn(Ke({},S),{[e.fk_name]:t}),sortBy:C})}),((xe=e==null?void 0:e.permissions)==null?void 0:xe.includes(Ss.Add))&&ve.jsx(vr,{children:ve.jsxs(Hn,{onClick:N,style:{marginRight:-10},children:[ve.jsx(T5,{})," ",n("Add")]})})]})},[e==null?void 0:e.actions,e==null?void 0:e.actions_on_top,e==null?void 0:e.search_fields,e==null?void 0:e.search_help_text,e==null?void 0:e.permissions,e.fk_name,n,E,O,$.length,ie,le,x,T,y,S,t,C,N]),pe=b.useCallback(()=>{var fe;return ve.jsx(ve.Fragment,{children:((fe=e==null?void 0:e.permissions)==null?void 0:fe.includes(Ss.Add))&&ve.jsx(Ri,{justify:"space-between",children:ve.jsx(vr,{children:((e==null?void 0:e.actions)||[]).length>0&&(e==null?void 0:e.actions_on_bottom)&&ve.jsxs("div",{style:{marginLeft:-8},children:[ve.jsx(no,{placeholder:n("Select Action By"),allowClear:!0,value:E,onChange:O,style:{width:200},children:((e==null?void 0:e.actions)||[]).map(xe=>ve.jsx(no.Option,{value:xe.name,children:xe.description||xe.name},xe.name))}),ve.jsx(Hn,{disabled:!E||$.length===0,style:{marginLeft:5},loading:ie,onClick:le,children:n("Apply")})]})})})})},[n,E,ie,e==null?void 0:e.actions,e==null?void 0:e.actions_on_bottom,e==null?void 0:e.permissions,le,$.length,O]);return ve.jsxs("div",{children:[ve.jsx(Hn,{style:{minWidth:200},type:"dashed",onClick:R,children:n("Change")}),ve.jsx(Ha,{width:"100%",open:o,title:ts(e,!0),onCancel:A,footer:null,children:ve.jsx(Ri,{children:ve.jsx(vr,{xs:24,children:ve.jsx(nne,{title:de,footer:pe,loading:z,sticky:!0,rowSelection:((e==null?void 0:e.actions)||[]).length>0?{selectedRowKeys:$,onChange:J}:void 0,columns:re,onChange:k,rowKey:"id",dataSource:(D==null?void 0:D.results)||[],pagination:{current:p,pageSize:g,total:D==null?void 0:D.total,showSizeChanger:!0},scroll:{x:1e3}})})})}),ve.jsxs(Ha,{width:600,open:l,title:`Add ${ts(e)}`,onCancel:L,footer:null,children:[ve.jsx(iu,{}),e!=null&&e.permissions.includes(Ss.Add)?ve.jsx(Dm,{modelConfiguration:e,form:r,onFinish:se,mode:"inline-add",hasOperationError:K,children:ve.jsx(Ri,{justify:"end",children:ve.jsx(vr,{children:ve.jsx(va,{children:ve.jsxs(Hn,{loading:G,htmlType:"submit",type:"primary",children:[ve.jsx(ym,{})," ",n("Add")]})})})})}):ve.jsx(Ba,{description:n("No permissions for model")})]}),ve.jsxs(Ha,{width:600,open:!!u,title:`Change ${ts(e)} ${u}`,onCancel:F,footer:null,children:[ve.jsx(iu,{}),q&&e&&e.permissions.includes(Ss.Change)?ve.jsx(Dm,{modelConfiguration:e,form:i,onFinish:ge,mode:"inline-change",hasOperationError:ee,initialValues:rN(q),children:ve.jsx(Ri,{justify:"end",children:ve.jsx(vr,{children:ve.jsx(va,{children:ve.jsxs(Hn,{loading:Q||H,htmlType:"submit",type:"primary",children:[ve.jsx(ym,{})," ",n("Save")]})})})})}):ve.jsx(Ba,{description:n("No permissions for model")})]})]})},Dm=({modelConfiguration:e,id:t,form:n,onFinish:r,children:i,mode:a,hasOperationError:o,initialValues:s})=>{const{t:l}=io("FormContainer"),[c,u]=b.useState(((e==null?void 0:e.fieldsets)||[]).filter(g=>{var m;return!(((m=g[1])==null?void 0:m.classes)||[]).includes("collapse")}).map(g=>{var m;return JSON.stringify((m=g[1])==null?void 0:m.fields)}));b.useEffect(()=>{o&&u(((e==null?void 0:e.fieldsets)||[]).map(g=>{var m;return JSON.stringify((m=g[1])==null?void 0:m.fields)}))},[o,e==null?void 0:e.fieldsets]),b.useEffect(()=>{n.setFieldsValue(s)},[n,s]);const f=b.useCallback(g=>{if(!g.form_widget_type)return null;const[m,y]=J6(g.form_widget_type,l,t);return ve.jsx(m,Ke(Ke({},y||{}),g.form_widget_props||{}))},[l,t]),d=b.useCallback(g=>a==="change"||a==="inline-change"?(g==null?void 0:g.change_configuration)||{}:(g==null?void 0:g.add_configuration)||{},[a]),h=b.useCallback(g=>g.map(m=>ve.jsx(Ir.Item,{name:m.name,label:LO(m.name),rules:[...d(m).required?[{required:!0}]:[],...d(m).form_widget_type===Hr.EmailInput?[{type:"email"}]:[],...d(m).form_widget_type===Hr.UrlInput?[{type:"url"}]:[],...d(m).form_widget_type===Hr.JsonTextArea?[{validator:(y,x)=>la(this,null,function*(){if(!CUe(x))throw new Error(l("Invalid JSON"))})}]:[],...d(m).form_widget_type===Hr.SlugInput?[{validator:(y,x)=>la(this,null,function*(){if(!EUe(x))throw new Error(l("Invalid Slug. Please use lowercase letters, numbers, and hyphens."))})}]:[]],valuePropName:[Hr.Checkbox,Hr.Switch,Hr.CheckboxGroup].includes(d(m).form_widget_type)?"checked":void 0,children:f(d(m))},m.name)),[l,d,f]),p=b.useCallback(()=>{const g=((e==null?void 0:e.fields)||[]).filter(y=>!!d(y).form_widget_type).filter(y=>{var x,S,w,C;return a==="add"||a==="inline-add"?!((S=(x=y.add_configuration)==null?void 0:x.form_widget_props)!=null&&S.disabled)&&!((C=(w=y.add_configuration)==null?void 0:w.form_widget_props)!=null&&C.readOnly):!0}),m=(e==null?void 0:e.fieldsets)||[];if(m.length>0){const y=x=>u(x);return ve.jsx(l3e,{size:"small",expandIconPosition:"end",activeKey:c,onChange:y,items:m.map(x=>{var C;const S=x[0],w=(C=x[1])==null?void 0:C.fields;return{key:JSON.stringify(w),label:S||l("General"),children:h(g.filter(E=>(w||[]).includes(E.name)).sort((E,O)=>w.indexOf(E.name)-w.indexOf(O.name)))}})})}return h(g.sort((y,x)=>(d(y).index||0)-(d(x).index||0)))},[l,c,h,d,e==null?void 0:e.fields,e==null?void 0:e.fieldsets,a]),v=b.useCallback(()=>t?((e==null?void 0:e.inlines)||[]).map(g=>ve.jsx(Ir.Item,{label:ts(g,!0),children:ve.jsx(sYe,{modelConfiguration:g,parentId:t})},g.name)):null,[e==null?void 0:e.inlines,t]);return ve.jsxs(Ir,{initialValues:s,layout:"vertical",form:n,onFinish:r,children:[(e==null?void 0:e.save_on_top)&&ve.jsxs(ve.Fragment,{children:[i,ve.jsx(iu,{})]}),ve.jsxs(Ri,{gutter:[32,32],children:[ve.jsx(vr,{xs:24,xl:a==="inline-add"||a==="inline-change"?24:12,children:p()}),a==="change"&&ve.jsx(vr,{xs:24,xl:12,children:v()})]}),ve.jsx(iu,{}),i]})},lYe=()=>{const[e]=Ir.useForm(),t=$S(),n=Mm(),{configuration:r}=b.useContext(Mc),{t:i}=io("Add"),{model:a}=SO(),o=HO(r,a),{mutate:s,isPending:l,isError:c}=Oo({mutationFn:f=>gf(`/add/${a}`,f),onSuccess:()=>{na.success(i("Succesfully added")),t.invalidateQueries([`/list/${a}`]),n(`/list/${a}`)},onError:f=>{kc(f,e)}}),u=f=>{const d=zO(f);s(d)};return ve.jsx(DO,{title:`${i("Add")} ${o&&ts(o)}`,breadcrumbs:ve.jsx(ob,{items:[{title:ve.jsx(Gd,{to:"/",children:i("Dashboard")})},{title:ve.jsx(Gd,{to:`/list/${a}`,children:o&&ts(o)})},{title:i("Add")}]}),children:o!=null&&o.permissions.includes(Ss.Add)?ve.jsx(Dm,{modelConfiguration:o,form:e,onFinish:u,mode:"add",hasOperationError:c,children:ve.jsx(Ri,{justify:"end",children:ve.jsx(vr,{children:ve.jsx(va,{children:ve.jsxs(Hn,{loading:l,htmlType:"submit",type:"primary",children:[ve.jsx(ym,{})," ",i("Add")]})})})})}):ve.jsx(Ba,{description:i("No permissions for model")})})},cYe=()=>{const[e]=Ir.useForm(),t=zb(),n=$S(),r=Mm(),{configuration:i}=b.useContext(Mc),{t:a}=io("Change"),{model:o,id:s}=SO(),l=HO(i,o),{data:c,isLoading:u}=Kc({queryKey:[`/retrieve/${o}/${s}`],queryFn:()=>lu(`/retrieve/${o}/${s}`),refetchOnWindowFocus:!1}),{mutate:f,isPending:d,isError:h}=Oo({mutationFn:E=>gf(`/add/${o}`,E),onSuccess:()=>{na.success(a("Succesfully added")),n.invalidateQueries([`/list/${o}`]);const E=e.getFieldValue("next");E&&r(E)},onError:E=>{kc(E,e)}}),{mutate:p,isPending:v,isError:g}=Oo({mutationFn:E=>NO(`/change/${o}/${s}`,E),onSuccess:()=>{na.success(a("Succesfully changed")),n.invalidateQueries([`/retrieve/${o}/${s}`]),n.invalidateQueries([`/list/${o}`]);const E=e.getFieldValue("next");E&&r(E)},onError:E=>{kc(E,e)}}),{mutate:m}=Oo({mutationFn:()=>XA(`/delete/${o}/${s}`),onSuccess:()=>{na.success(a("Successfully deleted")),n.invalidateQueries([`/list/${o}`]),r(`/list/${o}`)},onError:()=>{na.error(a("Server error"))}}),y=E=>{if(e.getFieldValue("save_as_new")){f(zO(E));return}p(zO(E))},x=()=>m(),S=()=>{e.submit()},w=()=>{e.setFieldValue("next",`/add/${o}`),l!=null&&l.save_as&&e.setFieldValue("save_as_new",!0),e.submit()},C=()=>{l!=null&&l.save_as_continue||e.setFieldValue("next",`/list/${o}`),e.submit()};return ve.jsx(DO,{title:`${a("Change")} ${l&&ts(l)} ${s}`,breadcrumbs:ve.jsx(ob,{items:[{title:ve.jsx(Gd,{to:"/",children:a("Dashboard")})},{title:ve.jsx(Gd,{to:`/list/${o}`,children:l&&ts(l)})},{title:s}]}),isLoading:u,children:c&&l&&l.permissions.includes(Ss.Change)?ve.jsx(Dm,{modelConfiguration:l,id:s,form:e,onFinish:y,mode:"change",hasOperationError:g||h,initialValues:rN(c),children:ve.jsxs(Ri,{gutter:[8,8],justify:"space-between",children:[ve.jsx(vr,{children:ve.jsx(va,{children:ve.jsx(P5,{title:a("Are you sure?"),onConfirm:x,children:ve.jsxs(Hn,{danger:!0,children:[ve.jsx(XE,{})," ",a("Delete")]})})})}),ve.jsx(vr,{children:ve.jsxs(va,{children:[!t&&!(l!=null&&l.save_as_continue)&&ve.jsxs(Hn,{loading:v||d,onClick:S,type:"default",children:[ve.jsx(YQ,{})," ",a("Save and continue editing")]}),!t&&ve.jsxs(Hn,{loading:v||d,onClick:w,type:"default",children:[ve.jsx(YQ,{})," ",l!=null&&l.save_as?a("Save as new"):a("Save and add another")]}),ve.jsxs(Hn,{loading:v||d,onClick:C,type:"primary",children:[ve.jsx(ym,{})," ",a("Save")]})]})})]})}):ve.jsx(Ba,{description:a("No permissions for model")})})};var bie={exports:{}};(function(e){var t=Object.prototype.hasOwnProperty,n="~";function r(){}Object.create&&(r.prototype=Object.create(null),new r().__proto__||(n=!1));function i(l,c,u){this.fn=l,this.context=c,this.once=u||!1}function a(l,c,u,f,d){if(typeof u!="function")throw new TypeError("The listener must be a function");var h=new i(u,f||l,d),p=n?n+c:c;return l._events[p]?l._events[p].fn?l._events[p]=[l._events[p],h]:l._events[p].push(h):(l._events[p]=h,l._eventsCount++),l}function o(l,c){--l._eventsCount===0?l._events=new r:delete l._events[c]}function s(){this._events=new r,this._eventsCount=0}s.prototype.eventNames=function(){var c=[],u,f;if(this._eventsCount===0)return c;for(f in u=this._events)t.call(u,f)&&c.push(n?f.slice(1):f);return Object.getOwnPropertySymbols?c.concat(Object.getOwnPropertySymbols(u)):c},s.prototype.listeners=function(c){var u=n?n+c:c,f=this._events[u];if(!f)return[];if(f.fn)return[f.fn];for(var d=0,h=f.length,p=new Array(h);d<h;d++)p[d]=f[d].fn;return p},s.prototype.listenerCount=function(c){var u=n?n+c:c,f=this._events[u];return f?f.fn?1:f.length:0},s.prototype.emit=function(c,u,f,d,h,p){var v=n?n+c:c;if(!this._events[v])return!1;var g=this._events[v],m=arguments.length,y,x;if(g.fn){switch(g.once&&this.removeListener(c,g.fn,void 0,!0),m){case 1:return g.fn.call(g.context),!0;case 2:return g.fn.call(g.context,u),!0;case 3:return g.fn.call(g.context,u,f),!0;case 4:return g.fn.call(g.context,u,f,d),!0;case 5:return g.fn.call(g.context,u,f,d,h),!0;case 6:return g.fn.call(g.context,u,f,d,h,p),!0}for(x=1,y=new Array(m-1);x<m;x++)y[x-1]=arguments[x];g.fn.apply(g.context,y)}else{var S=g.length,w;for(x=0;x<S;x++)switch(g[x].once&&this.removeListener(c,g[x].fn,void 0,!0),m){case 1:g[x].fn.call(g[x].context);break;case 2:g[x].fn.call(g[x].context,u);break;case 3:g[x].fn.call(g[x].context,u,f);break;case 4:g[x].fn.call(g[x].context,u,f,d);break;default:if(!y)for(w=1,y=new Array(m-1);w<m;w++)y[w-1]=arguments[w];g[x].fn.apply(g[x].context,y)}}return!0},s.prototype.on=function(c,u,f){return a(this,c,u,f,!1)},s.prototype.once=function(c,u,f){return a(this,c,u,f,!0)},s.prototype.removeListener=function(c,u,f,d){var h=n?n+c:c;if(!this._events[h])return this;if(!u)return o(this,h),this;var p=this._events[h];if(p.fn)p.fn===u&&(!d||p.once)&&(!f||p.context===f)&&o(this,h);else{for(var v=0,g=[],m=p.length;v<m;v++)(p[v].fn!==u||d&&!p[v].once||f&&p[v].context!==f)&&g.push(p[v]);g.length?this._events[h]=g.length===1?g[0]:g:o(this,h)}return this},s.prototype.removeAllListeners=function(c){var u;return c?(u=n?n+c:c,this._events[u]&&o(this,u)):(this._events=new r,this._eventsCount=0),this},s.prototype.off=s.prototype.removeListener,s.prototype.addListener=s.prototype.on,s.prefixed=n,s.EventEmitter=s,e.exports=s})(bie);var uYe=bie.exports;const xie=rn(uYe);var _i=1e-6,ga=typeof Float32Array!="undefined"?Float32Array:Array;Math.hypot||(Math.hypot=function(){for(var e=0,t=arguments.length;t--;)e+=arguments[t]*arguments[t];return Math.sqrt(e)});function Fm(){var e=new ga(9);return ga!=Float32Array&&(e[1]=0,e[2]=0,e[3]=0,e[5]=0,e[6]=0,e[7]=0),e[0]=1,e[4]=1,e[8]=1,e}function fYe(e,t){return e[0]=t[0],e[1]=t[1],e[2]=t[2],e[3]=t[4],e[4]=t[5],e[5]=t[6],e[6]=t[8],e[7]=t[9],e[8]=t[10],e}function dYe(e){var t=new ga(9);return t[0]=e[0],t[1]=e[1],t[2]=e[2],t[3]=e[3],t[4]=e[4],t[5]=e[5],t[6]=e[6],t[7]=e[7],t[8]=e[8],t}function hYe(e,t,n,r,i,a,o,s,l){var c=new ga(9);return c[0]=e,c[1]=t,c[2]=n,c[3]=r,c[4]=i,c[5]=a,c[6]=o,c[7]=s,c[8]=l,c}function pYe(e,t){var n=t[0],r=t[1],i=t[2],a=t[3],o=t[4],s=t[5],l=t[6],c=t[7],u=t[8],f=u*o-s*c,d=-u*a+s*l,h=c*a-o*l,p=n*f+r*d+i*h;return p?(p=1/p,e[0]=f*p,e[1]=(-u*r+i*c)*p,e[2]=(s*r-i*o)*p,e[3]=d*p,e[4]=(u*n-i*l)*p,e[5]=(-s*n+i*a)*p,e[6]=h*p,e[7]=(-c*n+r*l)*p,e[8]=(o*n-r*a)*p,e):null}function vYe(e,t,n){var r=t[0],i=t[1],a=t[2],o=t[3],s=t[4],l=t[5],c=t[6],u=t[7],f=t[8],d=n[0],h=n[1],p=n[2],v=n[3],g=n[4],m=n[5],y=n[6],x=n[7],S=n[8];return e[0]=d*r+h*o+p*c,e[1]=d*i+h*s+p*u,e[2]=d*a+h*l+p*f,e[3]=v*r+g*o+m*c,e[4]=v*i+g*s+m*u,e[5]=v*a+g*l+m*f,e[6]=y*r+x*o+S*c,e[7]=y*i+x*s+S*u,e[8]=y*a+x*l+S*f,e}function gYe(e,t){return e[0]=1,e[1]=0,e[2]=0,e[3]=0,e[4]=1,e[5]=0,e[6]=t[0],e[7]=t[1],e[8]=1,e}function mYe(e,t){var n=Math.sin(t),r=Math.cos(t);return e[0]=r,e[1]=n,e[2]=0,e[3]=-n,e[4]=r,e[5]=0,e[6]=0,e[7]=0,e[8]=1,e}function yYe(e,t){return e[0]=t[0],e[1]=0,e[2]=0,e[3]=0,e[4]=t[1],e[5]=0,e[6]=0,e[7]=0,e[8]=1,e}var bYe=vYe;function Wr(){var e=new ga(16);return ga!=Float32Array&&(e[1]=0,e[2]=0,e[3]=0,e[4]=0,e[6]=0,e[7]=0,e[8]=0,e[9]=0,e[11]=0,e[12]=0,e[13]=0,e[14]=0),e[0]=1,e[5]=1,e[10]=1,e[15]=1,e}function t8(e){var t=new ga(16);return t[0]=e[0],t[1]=e[1],t[2]=e[2],t[3]=e[3],t[4]=e[4],t[5]=e[5],t[6]=e[6],t[7]=e[7],t[8]=e[8],t[9]=e[9],t[10]=e[10],t[11]=e[11],t[12]=e[12],t[13]=e[13],t[14]=e[14],t[15]=e[15],t}function Bm(e,t){return e[0]=t[0],e[1]=t[1],e[2]=t[2],e[3]=t[3],e[4]=t[4],e[5]=t[5],e[6]=t[6],e[7]=t[7],e[8]=t[8],e[9]=t[9],e[10]=t[10],e[11]=t[11],e[12]=t[12],e[13]=t[13],e[14]=t[14],e[15]=t[15],e}function Sie(e,t,n,r,i,a,o,s,l,c,u,f,d,h,p,v){var g=new ga(16);return g[0]=e,g[1]=t,g[2]=n,g[3]=r,g[4]=i,g[5]=a,g[6]=o,g[7]=s,g[8]=l,g[9]=c,g[10]=u,g[11]=f,g[12]=d,g[13]=h,g[14]=p,g[15]=v,g}function n8(e,t,n,r,i,a,o,s,l,c,u,f,d,h,p,v,g){return e[0]=t,e[1]=n,e[2]=r,e[3]=i,e[4]=a,e[5]=o,e[6]=s,e[7]=l,e[8]=c,e[9]=u,e[10]=f,e[11]=d,e[12]=h,e[13]=p,e[14]=v,e[15]=g,e}function Kd(e){return e[0]=1,e[1]=0,e[2]=0,e[3]=0,e[4]=0,e[5]=1,e[6]=0,e[7]=0,e[8]=0,e[9]=0,e[10]=1,e[11]=0,e[12]=0,e[13]=0,e[14]=0,e[15]=1,e}function wie(e,t){if(e===t){var n=t[1],r=t[2],i=t[3],a=t[6],o=t[7],s=t[11];e[1]=t[4],e[2]=t[8],e[3]=t[12],e[4]=n,e[6]=t[9],e[7]=t[13],e[8]=r,e[9]=a,e[11]=t[14],e[12]=i,e[13]=o,e[14]=s}else e[0]=t[0],e[1]=t[4],e[2]=t[8],e[3]=t[12],e[4]=t[1],e[5]=t[5],e[6]=t[9],e[7]=t[13],e[8]=t[2],e[9]=t[6],e[10]=t[10],e[11]=t[14],e[12]=t[3],e[13]=t[7],e[14]=t[11],e[15]=t[15];return e}function Tc(e,t){var n=t[0],r=t[1],i=t[2],a=t[3],o=t[4],s=t[5],l=t[6],c=t[7],u=t[8],f=t[9],d=t[10],h=t[11],p=t[12],v=t[13],g=t[14],m=t[15],y=n*s-r*o,x=n*l-i*o,S=n*c-a*o,w=r*l-i*s,C=r*c-a*s,E=i*c-a*l,O=u*v-f*p,$=u*g-d*p,P=u*m-h*p,M=f*g-d*v,k=f*m-h*v,T=d*m-h*g,R=y*T-x*k+S*M+w*P-C*$+E*O;return R?(R=1/R,e[0]=(s*T-l*k+c*M)*R,e[1]=(i*k-r*T-a*M)*R,e[2]=(v*E-g*C+m*w)*R,e[3]=(d*C-f*E-h*w)*R,e[4]=(l*P-o*T-c*$)*R,e[5]=(n*T-i*P+a*$)*R,e[6]=(g*S-p*E-m*x)*R,e[7]=(u*E-d*S+h*x)*R,e[8]=(o*k-s*P+c*O)*R,e[9]=(r*P-n*k-a*O)*R,e[10]=(p*C-v*S+m*y)*R,e[11]=(f*S-u*C-h*y)*R,e[12]=(s*$-o*M-l*O)*R,e[13]=(n*M-r*$+i*O)*R,e[14]=(v*x-p*w-g*y)*R,e[15]=(u*w-f*x+d*y)*R,e):null}function xYe(e,t){var n=t[0],r=t[1],i=t[2],a=t[3],o=t[4],s=t[5],l=t[6],c=t[7],u=t[8],f=t[9],d=t[10],h=t[11],p=t[12],v=t[13],g=t[14],m=t[15];return e[0]=s*(d*m-h*g)-f*(l*m-c*g)+v*(l*h-c*d),e[1]=-(r*(d*m-h*g)-f*(i*m-a*g)+v*(i*h-a*d)),e[2]=r*(l*m-c*g)-s*(i*m-a*g)+v*(i*c-a*l),e[3]=-(r*(l*h-c*d)-s*(i*h-a*d)+f*(i*c-a*l)),e[4]=-(o*(d*m-h*g)-u*(l*m-c*g)+p*(l*h-c*d)),e[5]=n*(d*m-h*g)-u*(i*m-a*g)+p*(i*h-a*d),e[6]=-(n*(l*m-c*g)-o*(i*m-a*g)+p*(i*c-a*l)),e[7]=n*(l*h-c*d)-o*(i*h-a*d)+u*(i*c-a*l),e[8]=o*(f*m-h*v)-u*(s*m-c*v)+p*(s*h-c*f),e[9]=-(n*(f*m-h*v)-u*(r*m-a*v)+p*(r*h-a*f)),e[10]=n*(s*m-c*v)-o*(r*m-a*v)+p*(r*c-a*s),e[11]=-(n*(s*h-c*f)-o*(r*h-a*f)+u*(r*c-a*s)),e[12]=-(o*(f*g-d*v)-u*(s*g-l*v)+p*(s*d-l*f)),e[13]=n*(f*g-d*v)-u*(r*g-i*v)+p*(r*d-i*f),e[14]=-(n*(s*g-l*v)-o*(r*g-i*v)+p*(r*l-i*s)),e[15]=n*(s*d-l*f)-o*(r*d-i*f)+u*(r*l-i*s),e}function Cie(e){var t=e[0],n=e[1],r=e[2],i=e[3],a=e[4],o=e[5],s=e[6],l=e[7],c=e[8],u=e[9],f=e[10],d=e[11],h=e[12],p=e[13],v=e[14],g=e[15],m=t*o-n*a,y=t*s-r*a,x=t*l-i*a,S=n*s-r*o,w=n*l-i*o,C=r*l-i*s,E=c*p-u*h,O=c*v-f*h,$=c*g-d*h,P=u*v-f*p,M=u*g-d*p,k=f*g-d*v;return m*k-y*M+x*P+S*$-w*O+C*E}function No(e,t,n){var r=t[0],i=t[1],a=t[2],o=t[3],s=t[4],l=t[5],c=t[6],u=t[7],f=t[8],d=t[9],h=t[10],p=t[11],v=t[12],g=t[13],m=t[14],y=t[15],x=n[0],S=n[1],w=n[2],C=n[3];return e[0]=x*r+S*s+w*f+C*v,e[1]=x*i+S*l+w*d+C*g,e[2]=x*a+S*c+w*h+C*m,e[3]=x*o+S*u+w*p+C*y,x=n[4],S=n[5],w=n[6],C=n[7],e[4]=x*r+S*s+w*f+C*v,e[5]=x*i+S*l+w*d+C*g,e[6]=x*a+S*c+w*h+C*m,e[7]=x*o+S*u+w*p+C*y,x=n[8],S=n[9],w=n[10],C=n[11],e[8]=x*r+S*s+w*f+C*v,e[9]=x*i+S*l+w*d+C*g,e[10]=x*a+S*c+w*h+C*m,e[11]=x*o+S*u+w*p+C*y,x=n[12],S=n[13],w=n[14],C=n[15],e[12]=x*r+S*s+w*f+C*v,e[13]=x*i+S*l+w*d+C*g,e[14]=x*a+S*c+w*h+C*m,e[15]=x*o+S*u+w*p+C*y,e}function zm(e,t,n){var r=n[0],i=n[1],a=n[2],o,s,l,c,u,f,d,h,p,v,g,m;return t===e?(e[12]=t[0]*r+t[4]*i+t[8]*a+t[12],e[13]=t[1]*r+t[5]*i+t[9]*a+t[13],e[14]=t[2]*r+t[6]*i+t[10]*a+t[14],e[15]=t[3]*r+t[7]*i+t[11]*a+t[15]):(o=t[0],s=t[1],l=t[2],c=t[3],u=t[4],f=t[5],d=t[6],h=t[7],p=t[8],v=t[9],g=t[10],m=t[11],e[0]=o,e[1]=s,e[2]=l,e[3]=c,e[4]=u,e[5]=f,e[6]=d,e[7]=h,e[8]=p,e[9]=v,e[10]=g,e[11]=m,e[12]=o*r+u*i+p*a+t[12],e[13]=s*r+f*i+v*a+t[13],e[14]=l*r+d*i+g*a+t[14],e[15]=c*r+h*i+m*a+t[15]),e}function Eie(e,t,n){var r=n[0],i=n[1],a=n[2];return e[0]=t[0]*r,e[1]=t[1]*r,e[2]=t[2]*r,e[3]=t[3]*r,e[4]=t[4]*i,e[5]=t[5]*i,e[6]=t[6]*i,e[7]=t[7]*i,e[8]=t[8]*a,e[9]=t[9]*a,e[10]=t[10]*a,e[11]=t[11]*a,e[12]=t[12],e[13]=t[13],e[14]=t[14],e[15]=t[15],e}function SYe(e,t,n,r){var i=r[0],a=r[1],o=r[2],s=Math.hypot(i,a,o),l,c,u,f,d,h,p,v,g,m,y,x,S,w,C,E,O,$,P,M,k,T,R,A;return s<_i?null:(s=1/s,i*=s,a*=s,o*=s,l=Math.sin(n),c=Math.cos(n),u=1-c,f=t[0],d=t[1],h=t[2],p=t[3],v=t[4],g=t[5],m=t[6],y=t[7],x=t[8],S=t[9],w=t[10],C=t[11],E=i*i*u+c,O=a*i*u+o*l,$=o*i*u-a*l,P=i*a*u-o*l,M=a*a*u+c,k=o*a*u+i*l,T=i*o*u+a*l,R=a*o*u-i*l,A=o*o*u+c,e[0]=f*E+v*O+x*$,e[1]=d*E+g*O+S*$,e[2]=h*E+m*O+w*$,e[3]=p*E+y*O+C*$,e[4]=f*P+v*M+x*k,e[5]=d*P+g*M+S*k,e[6]=h*P+m*M+w*k,e[7]=p*P+y*M+C*k,e[8]=f*T+v*R+x*A,e[9]=d*T+g*R+S*A,e[10]=h*T+m*R+w*A,e[11]=p*T+y*R+C*A,t!==e&&(e[12]=t[12],e[13]=t[13],e[14]=t[14],e[15]=t[15]),e)}function Oie(e,t,n){var r=Math.sin(n),i=Math.cos(n),a=t[4],o=t[5],s=t[6],l=t[7],c=t[8],u=t[9],f=t[10],d=t[11];return t!==e&&(e[0]=t[0],e[1]=t[1],e[2]=t[2],e[3]=t[3],e[12]=t[12],e[13]=t[13],e[14]=t[14],e[15]=t[15]),e[4]=a*i+c*r,e[5]=o*i+u*r,e[6]=s*i+f*r,e[7]=l*i+d*r,e[8]=c*i-a*r,e[9]=u*i-o*r,e[10]=f*i-s*r,e[11]=d*i-l*r,e}function _ie(e,t,n){var r=Math.sin(n),i=Math.cos(n),a=t[0],o=t[1],s=t[2],l=t[3],c=t[8],u=t[9],f=t[10],d=t[11];return t!==e&&(e[4]=t[4],e[5]=t[5],e[6]=t[6],e[7]=t[7],e[12]=t[12],e[13]=t[13],e[14]=t[14],e[15]=t[15]),e[0]=a*i-c*r,e[1]=o*i-u*r,e[2]=s*i-f*r,e[3]=l*i-d*r,e[8]=a*r+c*i,e[9]=o*r+u*i,e[10]=s*r+f*i,e[11]=l*r+d*i,e}function wYe(e,t,n){var r=Math.sin(n),i=Math.cos(n),a=t[0],o=t[1],s=t[2],l=t[3],c=t[4],u=t[5],f=t[6],d=t[7];return t!==e&&(e[8]=t[8],e[9]=t[9],e[10]=t[10],e[11]=t[11],e[12]=t[12],e[13]=t[13],e[14]=t[14],e[15]=t[15]),e[0]=a*i+c*r,e[1]=o*i+u*r,e[2]=s*i+f*r,e[3]=l*i+d*r,e[4]=c*i-a*r,e[5]=u*i-o*r,e[6]=f*i-s*r,e[7]=d*i-l*r,e}function bf(e,t){return e[0]=1,e[1]=0,e[2]=0,e[3]=0,e[4]=0,e[5]=1,e[6]=0,e[7]=0,e[8]=0,e[9]=0,e[10]=1,e[11]=0,e[12]=t[0],e[13]=t[1],e[14]=t[2],e[15]=1,e}function Yd(e,t){return e[0]=t[0],e[1]=0,e[2]=0,e[3]=0,e[4]=0,e[5]=t[1],e[6]=0,e[7]=0,e[8]=0,e[9]=0,e[10]=t[2],e[11]=0,e[12]=0,e[13]=0,e[14]=0,e[15]=1,e}function $ie(e,t,n){var r=n[0],i=n[1],a=n[2],o=Math.hypot(r,i,a),s,l,c;return o<_i?null:(o=1/o,r*=o,i*=o,a*=o,s=Math.sin(t),l=Math.cos(t),c=1-l,e[0]=r*r*c+l,e[1]=i*r*c+a*s,e[2]=a*r*c-i*s,e[3]=0,e[4]=r*i*c-a*s,e[5]=i*i*c+l,e[6]=a*i*c+r*s,e[7]=0,e[8]=r*a*c+i*s,e[9]=i*a*c-r*s,e[10]=a*a*c+l,e[11]=0,e[12]=0,e[13]=0,e[14]=0,e[15]=1,e)}function Pie(e,t){var n=Math.sin(t),r=Math.cos(t);return e[0]=1,e[1]=0,e[2]=0,e[3]=0,e[4]=0,e[5]=r,e[6]=n,e[7]=0,e[8]=0,e[9]=-n,e[10]=r,e[11]=0,e[12]=0,e[13]=0,e[14]=0,e[15]=1,e}function Mie(e,t){var n=Math.sin(t),r=Math.cos(t);return e[0]=r,e[1]=0,e[2]=-n,e[3]=0,e[4]=0,e[5]=1,e[6]=0,e[7]=0,e[8]=n,e[9]=0,e[10]=r,e[11]=0,e[12]=0,e[13]=0,e[14]=0,e[15]=1,e}function r8(e,t){var n=Math.sin(t),r=Math.cos(t);return e[0]=r,e[1]=n,e[2]=0,e[3]=0,e[4]=-n,e[5]=r,e[6]=0,e[7]=0,e[8]=0,e[9]=0,e[10]=1,e[11]=0,e[12]=0,e[13]=0,e[14]=0,e[15]=1,e}function kie(e,t,n){var r=t[0],i=t[1],a=t[2],o=t[3],s=r+r,l=i+i,c=a+a,u=r*s,f=r*l,d=r*c,h=i*l,p=i*c,v=a*c,g=o*s,m=o*l,y=o*c;return e[0]=1-(h+v),e[1]=f+y,e[2]=d-m,e[3]=0,e[4]=f-y,e[5]=1-(u+v),e[6]=p+g,e[7]=0,e[8]=d+m,e[9]=p-g,e[10]=1-(u+h),e[11]=0,e[12]=n[0],e[13]=n[1],e[14]=n[2],e[15]=1,e}function CYe(e,t){var n=new ga(3),r=-t[0],i=-t[1],a=-t[2],o=t[3],s=t[4],l=t[5],c=t[6],u=t[7],f=r*r+i*i+a*a+o*o;return f>0?(n[0]=(s*o+u*r+l*a-c*i)*2/f,n[1]=(l*o+u*i+c*r-s*a)*2/f,n[2]=(c*o+u*a+s*i-l*r)*2/f):(n[0]=(s*o+u*r+l*a-c*i)*2,n[1]=(l*o+u*i+c*r-s*a)*2,n[2]=(c*o+u*a+s*i-l*r)*2),kie(e,t,n),e}function a_(e,t){return e[0]=t[12],e[1]=t[13],e[2]=t[14],e}function Hm(e,t){var n=t[0],r=t[1],i=t[2],a=t[4],o=t[5],s=t[6],l=t[8],c=t[9],u=t[10];return e[0]=Math.hypot(n,r,i),e[1]=Math.hypot(a,o,s),e[2]=Math.hypot(l,c,u),e}function o_(e,t){var n=new ga(3);Hm(n,t);var r=1/n[0],i=1/n[1],a=1/n[2],o=t[0]*r,s=t[1]*i,l=t[2]*a,c=t[4]*r,u=t[5]*i,f=t[6]*a,d=t[8]*r,h=t[9]*i,p=t[10]*a,v=o+u+p,g=0;return v>0?(g=Math.sqrt(v+1)*2,e[3]=.25*g,e[0]=(f-h)/g,e[1]=(d-l)/g,e[2]=(s-c)/g):o>u&&o>p?(g=Math.sqrt(1+o-u-p)*2,e[3]=(f-h)/g,e[0]=.25*g,e[1]=(s+c)/g,e[2]=(d+l)/g):u>p?(g=Math.sqrt(1+u-o-p)*2,e[3]=(d-l)/g,e[0]=(s+c)/g,e[1]=.25*g,e[2]=(f+h)/g):(g=Math.sqrt(1+p-o-u)*2,e[3]=(s-c)/g,e[0]=(d+l)/g,e[1]=(f+h)/g,e[2]=.25*g),e}function EYe(e,t,n,r){var i=t[0],a=t[1],o=t[2],s=t[3],l=i+i,c=a+a,u=o+o,f=i*l,d=i*c,h=i*u,p=a*c,v=a*u,g=o*u,m=s*l,y=s*c,x=s*u,S=r[0],w=r[1],C=r[2];return e[0]=(1-(p+g))*S,e[1]=(d+x)*S,e[2]=(h-y)*S,e[3]=0,e[4]=(d-x)*w,e[5]=(1-(f+g))*w,e[6]=(v+m)*w,e[7]=0,e[8]=(h+y)*C,e[9]=(v-m)*C,e[10]=(1-(f+p))*C,e[11]=0,e[12]=n[0],e[13]=n[1],e[14]=n[2],e[15]=1,e}function Qb(e,t,n,r,i){var a=t[0],o=t[1],s=t[2],l=t[3],c=a+a,u=o+o,f=s+s,d=a*c,h=a*u,p=a*f,v=o*u,g=o*f,m=s*f,y=l*c,x=l*u,S=l*f,w=r[0],C=r[1],E=r[2],O=i[0],$=i[1],P=i[2],M=(1-(v+m))*w,k=(h+S)*w,T=(p-x)*w,R=(h-S)*C,A=(1-(d+m))*C,N=(g+y)*C,L=(p+x)*E,j=(g-y)*E,F=(1-(d+v))*E;return e[0]=M,e[1]=k,e[2]=T,e[3]=0,e[4]=R,e[5]=A,e[6]=N,e[7]=0,e[8]=L,e[9]=j,e[10]=F,e[11]=0,e[12]=n[0]+O-(M*O+R*$+L*P),e[13]=n[1]+$-(k*O+A*$+j*P),e[14]=n[2]+P-(T*O+N*$+F*P),e[15]=1,e}function i8(e,t){var n=t[0],r=t[1],i=t[2],a=t[3],o=n+n,s=r+r,l=i+i,c=n*o,u=r*o,f=r*s,d=i*o,h=i*s,p=i*l,v=a*o,g=a*s,m=a*l;return e[0]=1-f-p,e[1]=u+m,e[2]=d-g,e[3]=0,e[4]=u-m,e[5]=1-c-p,e[6]=h+v,e[7]=0,e[8]=d+g,e[9]=h-v,e[10]=1-c-f,e[11]=0,e[12]=0,e[13]=0,e[14]=0,e[15]=1,e}function OYe(e,t,n,r,i,a,o){var s=1/(n-t),l=1/(i-r),c=1/(a-o);return e[0]=a*2*s,e[1]=0,e[2]=0,e[3]=0,e[4]=0,e[5]=a*2*l,e[6]=0,e[7]=0,e[8]=(n+t)*s,e[9]=(i+r)*l,e[10]=(o+a)*c,e[11]=-1,e[12]=0,e[13]=0,e[14]=o*a*2*c,e[15]=0,e}function Tie(e,t,n,r,i){var a=1/Math.tan(t/2),o;return e[0]=a/n,e[1]=0,e[2]=0,e[3]=0,e[4]=0,e[5]=a,e[6]=0,e[7]=0,e[8]=0,e[9]=0,e[11]=-1,e[12]=0,e[13]=0,e[15]=0,i!=null&&i!==1/0?(o=1/(r-i),e[10]=(i+r)*o,e[14]=2*i*r*o):(e[10]=-1,e[14]=-2*r),e}var _Ye=Tie;function $Ye(e,t,n,r,i){var a=1/Math.tan(t/2),o;return e[0]=a/n,e[1]=0,e[2]=0,e[3]=0,e[4]=0,e[5]=a,e[6]=0,e[7]=0,e[8]=0,e[9]=0,e[11]=-1,e[12]=0,e[13]=0,e[15]=0,i!=null&&i!==1/0?(o=1/(r-i),e[10]=i*o,e[14]=i*r*o):(e[10]=-1,e[14]=-r),e}function PYe(e,t,n,r){var i=Math.tan(t.upDegrees*Math.PI/180),a=Math.tan(t.downDegrees*Math.PI/180),o=Math.tan(t.leftDegrees*Math.PI/180),s=Math.tan(t.rightDegrees*Math.PI/180),l=2/(o+s),c=2/(i+a);return e[0]=l,e[1]=0,e[2]=0,e[3]=0,e[4]=0,e[5]=c,e[6]=0,e[7]=0,e[8]=-((o-s)*l*.5),e[9]=(i-a)*c*.5,e[10]=r/(n-r),e[11]=-1,e[12]=0,e[13]=0,e[14]=r*n/(n-r),e[15]=0,e}function Rie(e,t,n,r,i,a,o){var s=1/(t-n),l=1/(r-i),c=1/(a-o);return e[0]=-2*s,e[1]=0,e[2]=0,e[3]=0,e[4]=0,e[5]=-2*l,e[6]=0,e[7]=0,e[8]=0,e[9]=0,e[10]=2*c,e[11]=0,e[12]=(t+n)*s,e[13]=(i+r)*l,e[14]=(o+a)*c,e[15]=1,e}var Iie=Rie;function Aie(e,t,n,r,i,a,o){var s=1/(t-n),l=1/(r-i),c=1/(a-o);return e[0]=-2*s,e[1]=0,e[2]=0,e[3]=0,e[4]=0,e[5]=-2*l,e[6]=0,e[7]=0,e[8]=0,e[9]=0,e[10]=c,e[11]=0,e[12]=(t+n)*s,e[13]=(i+r)*l,e[14]=a*c,e[15]=1,e}function Nie(e,t,n,r){var i,a,o,s,l,c,u,f,d,h,p=t[0],v=t[1],g=t[2],m=r[0],y=r[1],x=r[2],S=n[0],w=n[1],C=n[2];return Math.abs(p-S)<_i&&Math.abs(v-w)<_i&&Math.abs(g-C)<_i?Kd(e):(u=p-S,f=v-w,d=g-C,h=1/Math.hypot(u,f,d),u*=h,f*=h,d*=h,i=y*d-x*f,a=x*u-m*d,o=m*f-y*u,h=Math.hypot(i,a,o),h?(h=1/h,i*=h,a*=h,o*=h):(i=0,a=0,o=0),s=f*o-d*a,l=d*i-u*o,c=u*a-f*i,h=Math.hypot(s,l,c),h?(h=1/h,s*=h,l*=h,c*=h):(s=0,l=0,c=0),e[0]=i,e[1]=s,e[2]=u,e[3]=0,e[4]=a,e[5]=l,e[6]=f,e[7]=0,e[8]=o,e[9]=c,e[10]=d,e[11]=0,e[12]=-(i*p+a*v+o*g),e[13]=-(s*p+l*v+c*g),e[14]=-(u*p+f*v+d*g),e[15]=1,e)}function MYe(e,t,n,r){var i=t[0],a=t[1],o=t[2],s=r[0],l=r[1],c=r[2],u=i-n[0],f=a-n[1],d=o-n[2],h=u*u+f*f+d*d;h>0&&(h=1/Math.sqrt(h),u*=h,f*=h,d*=h);var p=l*d-c*f,v=c*u-s*d,g=s*f-l*u;return h=p*p+v*v+g*g,h>0&&(h=1/Math.sqrt(h),p*=h,v*=h,g*=h),e[0]=p,e[1]=v,e[2]=g,e[3]=0,e[4]=f*g-d*v,e[5]=d*p-u*g,e[6]=u*v-f*p,e[7]=0,e[8]=u,e[9]=f,e[10]=d,e[11]=0,e[12]=i,e[13]=a,e[14]=o,e[15]=1,e}function kYe(e){return"mat4("+e[0]+", "+e[1]+", "+e[2]+", "+e[3]+", "+e[4]+", "+e[5]+", "+e[6]+", "+e[7]+", "+e[8]+", "+e[9]+", "+e[10]+", "+e[11]+", "+e[12]+", "+e[13]+", "+e[14]+", "+e[15]+")"}function TYe(e){return Math.hypot(e[0],e[1],e[2],e[3],e[4],e[5],e[6],e[7],e[8],e[9],e[10],e[11],e[12],e[13],e[14],e[15])}function RYe(e,t,n){return e[0]=t[0]+n[0],e[1]=t[1]+n[1],e[2]=t[2]+n[2],e[3]=t[3]+n[3],e[4]=t[4]+n[4],e[5]=t[5]+n[5],e[6]=t[6]+n[6],e[7]=t[7]+n[7],e[8]=t[8]+n[8],e[9]=t[9]+n[9],e[10]=t[10]+n[10],e[11]=t[11]+n[11],e[12]=t[12]+n[12],e[13]=t[13]+n[13],e[14]=t[14]+n[14],e[15]=t[15]+n[15],e}function Lie(e,t,n){return e[0]=t[0]-n[0],e[1]=t[1]-n[1],e[2]=t[2]-n[2],e[3]=t[3]-n[3],e[4]=t[4]-n[4],e[5]=t[5]-n[5],e[6]=t[6]-n[6],e[7]=t[7]-n[7],e[8]=t[8]-n[8],e[9]=t[9]-n[9],e[10]=t[10]-n[10],e[11]=t[11]-n[11],e[12]=t[12]-n[12],e[13]=t[13]-n[13],e[14]=t[14]-n[14],e[15]=t[15]-n[15],e}function IYe(e,t,n){return e[0]=t[0]*n,e[1]=t[1]*n,e[2]=t[2]*n,e[3]=t[3]*n,e[4]=t[4]*n,e[5]=t[5]*n,e[6]=t[6]*n,e[7]=t[7]*n,e[8]=t[8]*n,e[9]=t[9]*n,e[10]=t[10]*n,e[11]=t[11]*n,e[12]=t[12]*n,e[13]=t[13]*n,e[14]=t[14]*n,e[15]=t[15]*n,e}function AYe(e,t,n,r){return e[0]=t[0]+n[0]*r,e[1]=t[1]+n[1]*r,e[2]=t[2]+n[2]*r,e[3]=t[3]+n[3]*r,e[4]=t[4]+n[4]*r,e[5]=t[5]+n[5]*r,e[6]=t[6]+n[6]*r,e[7]=t[7]+n[7]*r,e[8]=t[8]+n[8]*r,e[9]=t[9]+n[9]*r,e[10]=t[10]+n[10]*r,e[11]=t[11]+n[11]*r,e[12]=t[12]+n[12]*r,e[13]=t[13]+n[13]*r,e[14]=t[14]+n[14]*r,e[15]=t[15]+n[15]*r,e}function a8(e,t){return e[0]===t[0]&&e[1]===t[1]&&e[2]===t[2]&&e[3]===t[3]&&e[4]===t[4]&&e[5]===t[5]&&e[6]===t[6]&&e[7]===t[7]&&e[8]===t[8]&&e[9]===t[9]&&e[10]===t[10]&&e[11]===t[11]&&e[12]===t[12]&&e[13]===t[13]&&e[14]===t[14]&&e[15]===t[15]}function NYe(e,t){var n=e[0],r=e[1],i=e[2],a=e[3],o=e[4],s=e[5],l=e[6],c=e[7],u=e[8],f=e[9],d=e[10],h=e[11],p=e[12],v=e[13],g=e[14],m=e[15],y=t[0],x=t[1],S=t[2],w=t[3],C=t[4],E=t[5],O=t[6],$=t[7],P=t[8],M=t[9],k=t[10],T=t[11],R=t[12],A=t[13],N=t[14],L=t[15];return Math.abs(n-y)<=_i*Math.max(1,Math.abs(n),Math.abs(y))&&Math.abs(r-x)<=_i*Math.max(1,Math.abs(r),Math.abs(x))&&Math.abs(i-S)<=_i*Math.max(1,Math.abs(i),Math.abs(S))&&Math.abs(a-w)<=_i*Math.max(1,Math.abs(a),Math.abs(w))&&Math.abs(o-C)<=_i*Math.max(1,Math.abs(o),Math.abs(C))&&Math.abs(s-E)<=_i*Math.max(1,Math.abs(s),Math.abs(E))&&Math.abs(l-O)<=_i*Math.max(1,Math.abs(l),Math.abs(O))&&Math.abs(c-$)<=_i*Math.max(1,Math.abs(c),Math.abs($))&&Math.abs(u-P)<=_i*Math.max(1,Math.abs(u),Math.abs(P))&&Math.abs(f-M)<=_i*Math.max(1,Math.abs(f),Math.abs(M))&&Math.abs(d-k)<=_i*Math.max(1,Math.abs(d),Math.abs(k))&&Math.abs(h-T)<=_i*Math.max(1,Math.abs(h),Math.abs(T))&&Math.abs(p-R)<=_i*Math.max(1,Math.abs(p),Math.abs(R))&&Math.abs(v-A)<=_i*Math.max(1,Math.abs(v),Math.abs(A))&&Math.abs(g-N)<=_i*Math.max(1,Math.abs(g),Math.abs(N))&&Math.abs(m-L)<=_i*Math.max(1,Math.abs(m),Math.abs(L))}var o8=No,LYe=Lie;const jYe=Object.freeze(Object.defineProperty({__proto__:null,add:RYe,adjoint:xYe,clone:t8,copy:Bm,create:Wr,determinant:Cie,equals:NYe,exactEquals:a8,frob:TYe,fromQuat:i8,fromQuat2:CYe,fromRotation:$ie,fromRotationTranslation:kie,fromRotationTranslationScale:EYe,fromRotationTranslationScaleOrigin:Qb,fromScaling:Yd,fromTranslation:bf,fromValues:Sie,fromXRotation:Pie,fromYRotation:Mie,fromZRotation:r8,frustum:OYe,getRotation:o_,getScaling:Hm,getTranslation:a_,identity:Kd,invert:Tc,lookAt:Nie,mul:o8,multiply:No,multiplyScalar:IYe,multiplyScalarAndAdd:AYe,ortho:Iie,orthoNO:Rie,orthoZO:Aie,perspective:_Ye,perspectiveFromFieldOfView:PYe,perspectiveNO:Tie,perspectiveZO:$Ye,rotate:SYe,rotateX:Oie,rotateY:_ie,rotateZ:wYe,scale:Eie,set:n8,str:kYe,sub:LYe,subtract:Lie,targetTo:MYe,translate:zm,transpose:wie},Symbol.toStringTag,{value:"Module"}));function dr(){var e=new ga(3);return ga!=Float32Array&&(e[0]=0,e[1]=0,e[2]=0),e}function xf(e){var t=new ga(3);return t[0]=e[0],t[1]=e[1],t[2]=e[2],t}function Sf(e){var t=e[0],n=e[1],r=e[2];return Math.hypot(t,n,r)}function kr(e,t,n){var r=new ga(3);return r[0]=e,r[1]=t,r[2]=n,r}function fu(e,t){return e[0]=t[0],e[1]=t[1],e[2]=t[2],e}function Lo(e,t,n,r){return e[0]=t,e[1]=n,e[2]=r,e}function Xd(e,t,n){return e[0]=t[0]+n[0],e[1]=t[1]+n[1],e[2]=t[2]+n[2],e}function s8(e,t,n){return e[0]=t[0]-n[0],e[1]=t[1]-n[1],e[2]=t[2]-n[2],e}function DYe(e,t,n){return e[0]=t[0]*n[0],e[1]=t[1]*n[1],e[2]=t[2]*n[2],e}function FYe(e,t,n){return e[0]=Math.min(t[0],n[0]),e[1]=Math.min(t[1],n[1]),e[2]=Math.min(t[2],n[2]),e}function BYe(e,t,n){return e[0]=Math.max(t[0],n[0]),e[1]=Math.max(t[1],n[1]),e[2]=Math.max(t[2],n[2]),e}function s_(e,t,n){return e[0]=t[0]*n,e[1]=t[1]*n,e[2]=t[2]*n,e}function zYe(e,t){var n=t[0]-e[0],r=t[1]-e[1],i=t[2]-e[2];return Math.hypot(n,r,i)}function Wp(e,t){var n=t[0],r=t[1],i=t[2],a=n*n+r*r+i*i;return a>0&&(a=1/Math.sqrt(a)),e[0]=t[0]*a,e[1]=t[1]*a,e[2]=t[2]*a,e}function du(e,t){return e[0]*t[0]+e[1]*t[1]+e[2]*t[2]}function l_(e,t,n){var r=t[0],i=t[1],a=t[2],o=n[0],s=n[1],l=n[2];return e[0]=i*l-a*s,e[1]=a*o-r*l,e[2]=r*s-i*o,e}function l8(e,t,n,r){var i=t[0],a=t[1],o=t[2];return e[0]=i+r*(n[0]-i),e[1]=a+r*(n[1]-a),e[2]=o+r*(n[2]-o),e}function Wi(e,t,n){var r=t[0],i=t[1],a=t[2],o=n[3]*r+n[7]*i+n[11]*a+n[15];return o=o||1,e[0]=(n[0]*r+n[4]*i+n[8]*a+n[12])/o,e[1]=(n[1]*r+n[5]*i+n[9]*a+n[13])/o,e[2]=(n[2]*r+n[6]*i+n[10]*a+n[14])/o,e}function jie(e,t,n){var r=t[0],i=t[1],a=t[2];return e[0]=r*n[0]+i*n[3]+a*n[6],e[1]=r*n[1]+i*n[4]+a*n[7],e[2]=r*n[2]+i*n[5]+a*n[8],e}function HYe(e,t,n){var r=n[0],i=n[1],a=n[2],o=n[3],s=t[0],l=t[1],c=t[2],u=i*c-a*l,f=a*s-r*c,d=r*l-i*s,h=i*d-a*f,p=a*u-r*d,v=r*f-i*u,g=o*2;return u*=g,f*=g,d*=g,h*=2,p*=2,v*=2,e[0]=s+u+h,e[1]=l+f+p,e[2]=c+d+v,e}function Jb(e,t){var n=e[0],r=e[1],i=e[2],a=t[0],o=t[1],s=t[2];return Math.abs(n-a)<=_i*Math.max(1,Math.abs(n),Math.abs(a))&&Math.abs(r-o)<=_i*Math.max(1,Math.abs(r),Math.abs(o))&&Math.abs(i-s)<=_i*Math.max(1,Math.abs(i),Math.abs(s))}var WYe=s8,Die=zYe,Fie=Sf;(function(){var e=dr();return function(t,n,r,i,a,o){var s,l;for(n||(n=3),r||(r=0),i?l=Math.min(i*n+r,t.length):l=t.length,s=r;s<l;s+=n)e[0]=t[s],e[1]=t[s+1],e[2]=t[s+2],a(e,e,o),t[s]=e[0],t[s+1]=e[1],t[s+2]=e[2];return t}})();function hu(){var e=new ga(4);return ga!=Float32Array&&(e[0]=0,e[1]=0,e[2]=0,e[3]=0),e}function ex(e,t,n,r){var i=new ga(4);return i[0]=e,i[1]=t,i[2]=n,i[3]=r,i}function VYe(e,t){return e[0]=t[0],e[1]=t[1],e[2]=t[2],e[3]=t[3],e}function qYe(e,t,n,r,i){return e[0]=t,e[1]=n,e[2]=r,e[3]=i,e}function UYe(e,t){var n=t[0],r=t[1],i=t[2],a=t[3],o=n*n+r*r+i*i+a*a;return o>0&&(o=1/Math.sqrt(o)),e[0]=n*o,e[1]=r*o,e[2]=i*o,e[3]=a*o,e}function pu(e,t,n){var r=t[0],i=t[1],a=t[2],o=t[3];return e[0]=n[0]*r+n[4]*i+n[8]*a+n[12]*o,e[1]=n[1]*r+n[5]*i+n[9]*a+n[13]*o,e[2]=n[2]*r+n[6]*i+n[10]*a+n[14]*o,e[3]=n[3]*r+n[7]*i+n[11]*a+n[15]*o,e}(function(){var e=hu();return function(t,n,r,i,a,o){var s,l;for(n||(n=4),r||(r=0),i?l=Math.min(i*n+r,t.length):l=t.length,s=r;s<l;s+=n)e[0]=t[s],e[1]=t[s+1],e[2]=t[s+2],e[3]=t[s+3],a(e,e,o),t[s]=e[0],t[s+1]=e[1],t[s+2]=e[2],t[s+3]=e[3];return t}})();function Va(){var e=new ga(4);return ga!=Float32Array&&(e[0]=0,e[1]=0,e[2]=0),e[3]=1,e}function Zd(e,t,n){n=n*.5;var r=Math.sin(n);return e[0]=r*t[0],e[1]=r*t[1],e[2]=r*t[2],e[3]=Math.cos(n),e}function Qd(e,t,n){var r=t[0],i=t[1],a=t[2],o=t[3],s=n[0],l=n[1],c=n[2],u=n[3];return e[0]=r*u+o*s+i*c-a*l,e[1]=i*u+o*l+a*s-r*c,e[2]=a*u+o*c+r*l-i*s,e[3]=o*u-r*s-i*l-a*c,e}function c8(e,t,n,r){var i=t[0],a=t[1],o=t[2],s=t[3],l=n[0],c=n[1],u=n[2],f=n[3],d,h,p,v,g;return h=i*l+a*c+o*u+s*f,h<0&&(h=-h,l=-l,c=-c,u=-u,f=-f),1-h>_i?(d=Math.acos(h),p=Math.sin(d),v=Math.sin((1-r)*d)/p,g=Math.sin(r*d)/p):(v=1-r,g=r),e[0]=v*i+g*l,e[1]=v*a+g*c,e[2]=v*o+g*u,e[3]=v*s+g*f,e}function u8(e,t){var n=t[0],r=t[1],i=t[2],a=t[3],o=n*n+r*r+i*i+a*a,s=o?1/o:0;return e[0]=-n*s,e[1]=-r*s,e[2]=-i*s,e[3]=a*s,e}function GYe(e,t){var n=t[0]+t[4]+t[8],r;if(n>0)r=Math.sqrt(n+1),e[3]=.5*r,r=.5/r,e[0]=(t[5]-t[7])*r,e[1]=(t[6]-t[2])*r,e[2]=(t[1]-t[3])*r;else{var i=0;t[4]>t[0]&&(i=1),t[8]>t[i*3+i]&&(i=2);var a=(i+1)%3,o=(i+2)%3;r=Math.sqrt(t[i*3+i]-t[a*3+a]-t[o*3+o]+1),e[i]=.5*r,r=.5/r,e[3]=(t[a*3+o]-t[o*3+a])*r,e[a]=(t[a*3+i]+t[i*3+a])*r,e[o]=(t[o*3+i]+t[i*3+o])*r}return e}function c_(e,t,n,r){var i=.5*Math.PI/180;t*=i,n*=i,r*=i;var a=Math.sin(t),o=Math.cos(t),s=Math.sin(n),l=Math.cos(n),c=Math.sin(r),u=Math.cos(r);return e[0]=a*l*u-o*s*c,e[1]=o*s*u+a*l*c,e[2]=o*l*c-a*s*u,e[3]=o*l*u+a*s*c,e}var KYe=ex,u_=VYe,Bie=qYe,zie=Qd,f_=UYe;(function(){var e=dr(),t=kr(1,0,0),n=kr(0,1,0);return function(r,i,a){var o=du(i,a);return o<-.999999?(l_(e,t,i),Fie(e)<1e-6&&l_(e,n,i),Wp(e,e),Zd(r,e,Math.PI),r):o>.999999?(r[0]=0,r[1]=0,r[2]=0,r[3]=1,r):(l_(e,i,a),r[0]=e[0],r[1]=e[1],r[2]=e[2],r[3]=1+o,f_(r,r))}})(),function(){var e=Va(),t=Va();return function(n,r,i,a,o,s){return c8(e,r,o,s),c8(t,i,a,s),c8(n,e,t,2*s*(1-s)),n}}(),function(){var e=Fm();return function(t,n,r,i){return e[0]=r[0],e[3]=r[1],e[6]=r[2],e[1]=i[0],e[4]=i[1],e[7]=i[2],e[2]=-n[0],e[5]=-n[1],e[8]=-n[2],f_(t,GYe(t,e))}}();function f8(){var e=new ga(2);return ga!=Float32Array&&(e[0]=0,e[1]=0),e}function YYe(e,t){return e[0]=t[0],e[1]=t[1],e}function XYe(e,t,n){return e[0]=t,e[1]=n,e}function ZYe(e,t){var n=t[0],r=t[1],i=n*n+r*r;return i>0&&(i=1/Math.sqrt(i)),e[0]=t[0]*i,e[1]=t[1]*i,e}function QYe(e,t){return e[0]*t[0]+e[1]*t[1]}function JYe(e,t){return e[0]===t[0]&&e[1]===t[1]}(function(){var e=f8();return function(t,n,r,i,a,o){var s,l;for(n||(n=2),r||(r=0),i?l=Math.min(i*n+r,t.length):l=t.length,s=r;s<l;s+=n)e[0]=t[s],e[1]=t[s+1],a(e,e,o),t[s]=e[0],t[s+1]=e[1];return t}})();var Wm=function(e){return e!==null&&typeof e!="function"&&isFinite(e.length)},Hie=function(e,t){if(!Wm(e))return e;for(var n=[],r=0;r<e.length;r++){var i=e[r];t(i,r)&&n.push(i)}return n};function qa(e){return typeof e=="function"}function Pn(e){return e==null}function Ua(e){return Array.isArray(e)}const d_=function(e){var t=typeof e;return e!==null&&t==="object"||t==="function"};function d8(e,t){if(e){var n;if(Ua(e))for(var r=0,i=e.length;r<i&&(n=t(e[r],r),n!==!1);r++);else if(d_(e)){for(var a in e)if(e.hasOwnProperty(a)&&(n=t(e[a],a),n===!1))break}}}var h8=Object.keys?function(e){return Object.keys(e)}:function(e){var t=[];return d8(e,function(n,r){qa(e)&&r==="prototype"||t.push(r)}),t};function eXe(e,t){var n=h8(t),r=n.length;if(Pn(e))return!r;for(var i=0;i<r;i+=1){var a=n[i];if(t[a]!==e[a]||!(a in e))return!1}return!0}var p8=function(e){return typeof e=="object"&&e!==null},tXe={}.toString,Wie=function(e,t){return tXe.call(e)==="[object "+t+"]"},wf=function(e){if(!p8(e)||!Wie(e,"Object"))return!1;if(Object.getPrototypeOf(e)===null)return!0;for(var t=e;Object.getPrototypeOf(t)!==null;)t=Object.getPrototypeOf(t);return Object.getPrototypeOf(e)===t};function Vm(e,t){if(!Ua(e))return null;var n;if(qa(t)&&(n=t),wf(t)&&(n=function(i){return eXe(i,t)}),n){for(var r=0;r<e.length;r+=1)if(n(e[r]))return e[r]}return null}function h_(e){if(!Array.isArray(e))return-1/0;var t=e.length;if(!t)return-1/0;for(var n=e[0],r=1;r<t;r++)n=Math.max(n,e[r]);return n}const p_=function(e){if(Ua(e))return e.reduce(function(t,n){return Math.min(t,n)},e[0])};var Vie=function(e,t,n){if(!Ua(e)&&!wf(e))return e;var r=n;return d8(e,function(i,a){r=t(r,i,a)}),r};function $i(e){return typeof e=="string"}function tx(e){if(Wm(e)){var t=e;return t[t.length-1]}}var Vi=function(e,t,n){return e<t?t:e>n?n:e};function gi(e){return typeof e=="number"}var nXe=1e-5;function nx(e,t,n){return n===void 0&&(n=nXe),e===t||Math.abs(e-t)<n}const rXe=function(e,t){if(Ua(e)){for(var n,r=-1/0,i=0;i<e.length;i++){var a=e[i],o=qa(t)?t(a):a[t];o>r&&(n=a,r=o)}return n}},iXe=function(e,t){if(Ua(e)){for(var n,r=1/0,i=0;i<e.length;i++){var a=e[i],o=qa(t)?t(a):a[t];o<r&&(n=a,r=o)}return n}};var qie=function(e,t){return(e%t+t)%t};const Uie=function(e){return Pn(e)?"":e.toString()};var Gie=function(e){var t=Uie(e);return t.charAt(0).toLowerCase()+t.substring(1)};function aXe(e,t){return!e||!t?e:e.replace(/\\?\{([^{}]+)\}/g,function(n,r){return n.charAt(0)==="\\"?n.slice(1):t[r]===void 0?"":t[r]})}var Jd=function(e){var t=Uie(e);return t.charAt(0).toUpperCase()+t.substring(1)},Kie=function(e){return Wie(e,"Boolean")};function oXe(e){return e===null}var si=function(e){return e===void 0};function Yie(e,t){for(var n in t)t.hasOwnProperty(n)&&n!=="constructor"&&t[n]!==void 0&&(e[n]=t[n])}function sXe(e,t,n,r){return Yie(e,t),n&&Yie(e,n),e}var rx=function(e){if(typeof e!="object"||e===null)return e;var t;if(Ua(e)){t=[];for(var n=0,r=e.length;n<r;n++)typeof e[n]=="object"&&e[n]!=null?t[n]=rx(e[n]):t[n]=e[n]}else{t={};for(var i in e)typeof e[i]=="object"&&e[i]!=null?t[i]=rx(e[i]):t[i]=e[i]}return t};function Xie(e,t,n){var r;return function(){var i=this,a=arguments,o=function(){r=null,e.apply(i,a)};clearTimeout(r),r=setTimeout(o,t)}}function lXe(e){var t,n,r,i=e;function a(s,l){++t>i&&(r=n,o(1),++t),n[s]=l}function o(s){t=0,n=Object.create(null),s||(r=Object.create(null))}return o(),{clear:o,has:function(s){return n[s]!==void 0||r[s]!==void 0},get:function(s){var l=n[s];if(l!==void 0)return l;if((l=r[s])!==void 0)return a(s,l),l},set:function(s,l){n[s]!==void 0?n[s]=l:a(s,l)}}}var v8=new Map;function cXe(e,t,n){var r=function(){for(var i=[],a=0;a<arguments.length;a++)i[a]=arguments[a];var o=t.apply(this,i);v8.has(e)||v8.set(e,lXe(n));var s=v8.get(e);if(s.has(o))return s.get(o);var l=e.apply(this,i);return s.set(o,l),l};return r}var uXe=5;function fXe(e,t){if(Object.hasOwn)return Object.hasOwn(e,t);if(e==null)throw new TypeError("Cannot convert undefined or null to object");return Object.prototype.hasOwnProperty.call(Object(e),t)}function Zie(e,t,n,r){n=n||0,r=r||uXe;for(var i in t)if(fXe(t,i)){var a=t[i];a!==null&&wf(a)?(wf(e[i])||(e[i]={}),n<r?Zie(e[i],a,n+1,r):e[i]=t[i]):Ua(a)?(e[i]=[],e[i]=e[i].concat(a)):a!==void 0&&(e[i]=a)}}var ct=function(e){for(var t=[],n=1;n<arguments.length;n++)t[n-1]=arguments[n];for(var r=0;r<t.length;r+=1)Zie(e,t[r]);return e},Qie=function(e,t){if(!Wm(e))return-1;var n=Array.prototype.indexOf;if(n)return n.call(e,t);for(var r=-1,i=0;i<e.length;i++)if(e[i]===t){r=i;break}return r},v_=function(e,t){if(e===t)return!0;if(!e||!t||$i(e)||$i(t))return!1;if(Wm(e)||Wm(t)){if(e.length!==t.length)return!1;for(var n=!0,r=0;r<e.length&&(n=v_(e[r],t[r]),!!n);r++);return n}if(p8(e)||p8(t)){var i=Object.keys(e),a=Object.keys(t);if(i.length!==a.length)return!1;for(var n=!0,r=0;r<i.length&&(n=v_(e[i[r]],t[i[r]]),!!n);r++);return n}return!1};const xr=function(e,t,n){for(var r=0,i=$i(t)?t.split("."):t;e&&r<i.length;)e=e[i[r++]];return e===void 0||r<i.length?n:e},dXe=function(e,t,n){var r=e,i=$i(t)?t.split("."):t;return i.forEach(function(a,o){o<i.length-1?(d_(r[a])||(r[a]=gi(i[o+1])?[]:{}),r=r[a]):r[a]=n}),e};var hXe=Object.prototype.hasOwnProperty;const g8=function(e,t){if(e===null||!wf(e))return{};var n={};return d8(t,function(r){hXe.call(e,r)&&(n[r]=e[r])}),n},m8=function(e,t){return Vie(e,function(n,r,i){return t.includes(i)||(n[i]=r),n},{})},Vp=function(e,t,n){var r,i,a,o,s=0;n||(n={});var l=function(){s=n.leading===!1?0:Date.now(),r=null,o=e.apply(i,a),r||(i=a=null)},c=function(){var u=Date.now();!s&&n.leading===!1&&(s=u);var f=t-(u-s);return i=this,a=arguments,f<=0||f>t?(r&&(clearTimeout(r),r=null),s=u,o=e.apply(i,a),r||(i=a=null)):!r&&n.trailing!==!1&&(r=setTimeout(l,f)),o};return c.cancel=function(){clearTimeout(r),s=0,r=i=a=null},c},y8=function(){},qp=function(e){return e};function ix(e){return Pn(e)?0:Wm(e)?e.length:Object.keys(e).length}var Jie={x1:0,y1:0,x2:0,y2:0,x:0,y:0,qx:null,qy:null};function pXe(e,t,n){if(e[n].length>7){e[n].shift();for(var r=e[n],i=n;r.length;)t[n]="A",e.splice(i+=1,0,["C"].concat(r.splice(0,6)));e.splice(n,1)}}var ax={a:7,c:6,h:1,l:2,m:2,r:4,q:4,s:4,t:2,v:1,z:0};function eae(e){return Array.isArray(e)&&e.every(function(t){var n=t[0].toLowerCase();return ax[n]===t.length-1&&"achlmqstvz".includes(n)})}function tae(e){return eae(e)&&e.every(function(t){var n=t[0];return n===n.toUpperCase()})}function nae(e){return tae(e)&&e.every(function(t){var n=t[0];return"ACLMQZ".includes(n)})}function rae(e){for(var t=e.pathValue[e.segmentStart],n=t.toLowerCase(),r=e.data;r.length>=ax[n]&&(n==="m"&&r.length>2?(e.segments.push([t].concat(r.splice(0,2))),n="l",t=t==="m"?"l":"L"):e.segments.push([t].concat(r.splice(0,ax[n]))),!!ax[n]););}function vXe(e){var t=e.index,n=e.pathValue,r=n.charCodeAt(t);if(r===48){e.param=0,e.index+=1;return}if(r===49){e.param=1,e.index+=1;return}e.err='[path-util]: invalid Arc flag "'.concat(n[t],'", expecting 0 or 1 at index ').concat(t)}function gXe(e){return e>=48&&e<=57||e===43||e===45||e===46}function qm(e){return e>=48&&e<=57}function mXe(e){var t=e.max,n=e.pathValue,r=e.index,i=r,a=!1,o=!1,s=!1,l=!1,c;if(i>=t){e.err="[path-util]: Invalid path value at index ".concat(i,', "pathValue" is missing param');return}if(c=n.charCodeAt(i),(c===43||c===45)&&(i+=1,c=n.charCodeAt(i)),!qm(c)&&c!==46){e.err="[path-util]: Invalid path value at index ".concat(i,', "').concat(n[i],'" is not a number');return}if(c!==46){if(a=c===48,i+=1,c=n.charCodeAt(i),a&&i<t&&c&&qm(c)){e.err="[path-util]: Invalid path value at index ".concat(r,', "').concat(n[r],'" illegal number');return}for(;i<t&&qm(n.charCodeAt(i));)i+=1,o=!0;c=n.charCodeAt(i)}if(c===46){for(l=!0,i+=1;qm(n.charCodeAt(i));)i+=1,s=!0;c=n.charCodeAt(i)}if(c===101||c===69){if(l&&!o&&!s){e.err="[path-util]: Invalid path value at index ".concat(i,', "').concat(n[i],'" invalid float exponent');return}if(i+=1,c=n.charCodeAt(i),(c===43||c===45)&&(i+=1),i<t&&qm(n.charCodeAt(i)))for(;i<t&&qm(n.charCodeAt(i));)i+=1;else{e.err="[path-util]: Invalid path value at index ".concat(i,', "').concat(n[i],'" invalid integer exponent');return}}e.index=i,e.param=+e.pathValue.slice(r,i)}function yXe(e){var t=[5760,6158,8192,8193,8194,8195,8196,8197,8198,8199,8200,8201,8202,8239,8287,12288,65279];return e===10||e===13||e===8232||e===8233||e===32||e===9||e===11||e===12||e===160||e>=5760&&t.includes(e)}function g_(e){for(var t=e.pathValue,n=e.max;e.index<n&&yXe(t.charCodeAt(e.index));)e.index+=1}function bXe(e){switch(e|32){case 109:case 122:case 108:case 104:case 118:case 99:case 115:case 113:case 116:case 97:return!0;default:return!1}}function xXe(e){return(e|32)===97}function SXe(e){var t=e.max,n=e.pathValue,r=e.index,i=n.charCodeAt(r),a=ax[n[r].toLowerCase()];if(e.segmentStart=r,!bXe(i)){e.err='[path-util]: Invalid path value "'.concat(n[r],'" is not a path command');return}if(e.index+=1,g_(e),e.data=[],!a){rae(e);return}for(;;){for(var o=a;o>0;o-=1){if(xXe(i)&&(o===3||o===4)?vXe(e):mXe(e),e.err.length)return;e.data.push(e.param),g_(e),e.index<t&&n.charCodeAt(e.index)===44&&(e.index+=1,g_(e))}if(e.index>=e.max||!gXe(n.charCodeAt(e.index)))break}rae(e)}var wXe=function(){function e(t){this.pathValue=t,this.segments=[],this.max=t.length,this.index=0,this.param=0,this.segmentStart=0,this.data=[],this.err=""}return e}();function CXe(e){if(eae(e))return[].concat(e);var t=new wXe(e);for(g_(t);t.index<t.max&&!t.err.length;)SXe(t);return t.err?t.err:t.segments}function EXe(e){if(tae(e))return[].concat(e);var t=CXe(e),n=0,r=0,i=0,a=0;return t.map(function(o){var s=o.slice(1).map(Number),l=o[0],c=l.toUpperCase();if(l==="M")return n=s[0],r=s[1],i=n,a=r,["M",n,r];var u;if(l!==c)switch(c){case"A":u=[c,s[0],s[1],s[2],s[3],s[4],s[5]+n,s[6]+r];break;case"V":u=[c,s[0]+r];break;case"H":u=[c,s[0]+n];break;default:{var f=s.map(function(h,p){return h+(p%2?r:n)});u=[c].concat(f)}}else u=[c].concat(s);var d=u.length;switch(c){case"Z":n=i,r=a;break;case"H":n=u[1];break;case"V":r=u[1];break;default:n=u[d-2],r=u[d-1],c==="M"&&(i=n,a=r)}return u})}function OXe(e,t){var n=e[0],r=t.x1,i=t.y1,a=t.x2,o=t.y2,s=e.slice(1).map(Number),l=e;if("TQ".includes(n)||(t.qx=null,t.qy=null),n==="H")l=["L",e[1],i];else if(n==="V")l=["L",r,e[1]];else if(n==="S"){var c=r*2-a,u=i*2-o;t.x1=c,t.y1=u,l=["C",c,u].concat(s)}else if(n==="T"){var f=r*2-t.qx,d=i*2-t.qy;t.qx=f,t.qy=d,l=["Q",f,d].concat(s)}else if(n==="Q"){var h=s[0],p=s[1];t.qx=h,t.qy=p}return l}function m_(e){if(nae(e))return[].concat(e);for(var t=EXe(e),n=dt({},Jie),r=0;r<t.length;r+=1){t[r]=OXe(t[r],n);var i=t[r],a=i.length;n.x1=+i[a-2],n.y1=+i[a-1],n.x2=+i[a-4]||n.x1,n.y2=+i[a-3]||n.y1}return t}function _Xe(e){return nae(e)&&e.every(function(t){var n=t[0];return"MC".includes(n)})}function y_(e,t,n){var r=e*Math.cos(n)-t*Math.sin(n),i=e*Math.sin(n)+t*Math.cos(n);return{x:r,y:i}}function b8(e,t,n,r,i,a,o,s,l,c){var u=e,f=t,d=n,h=r,p=s,v=l,g=Math.PI*120/180,m=Math.PI/180*(+i||0),y=[],x,S,w,C,E;if(c)S=c[0],w=c[1],C=c[2],E=c[3];else{x=y_(u,f,-m),u=x.x,f=x.y,x=y_(p,v,-m),p=x.x,v=x.y;var O=(u-p)/2,$=(f-v)/2,P=O*O/(d*d)+$*$/(h*h);P>1&&(P=Math.sqrt(P),d*=P,h*=P);var M=d*d,k=h*h,T=(a===o?-1:1)*Math.sqrt(Math.abs((M*k-M*$*$-k*O*O)/(M*$*$+k*O*O)));C=T*d*$/h+(u+p)/2,E=T*-h*O/d+(f+v)/2,S=Math.asin(((f-E)/h*Math.pow(10,9)>>0)/Math.pow(10,9)),w=Math.asin(((v-E)/h*Math.pow(10,9)>>0)/Math.pow(10,9)),S=u<C?Math.PI-S:S,w=p<C?Math.PI-w:w,S<0&&(S=Math.PI*2+S),w<0&&(w=Math.PI*2+w),o&&S>w&&(S-=Math.PI*2),!o&&w>S&&(w-=Math.PI*2)}var R=w-S;if(Math.abs(R)>g){var A=w,N=p,L=v;w=S+g*(o&&w>S?1:-1),p=C+d*Math.cos(w),v=E+h*Math.sin(w),y=b8(p,v,d,h,i,0,o,N,L,[w,A,C,E])}R=w-S;var j=Math.cos(S),F=Math.sin(S),B=Math.cos(w),D=Math.sin(w),z=Math.tan(R/4),W=4/3*d*z,q=4/3*h*z,H=[u,f],U=[u+W*F,f-q*j],G=[p+W*D,v-q*B],K=[p,v];if(U[0]=2*H[0]-U[0],U[1]=2*H[1]-U[1],c)return U.concat(G,K,y);y=U.concat(G,K,y);for(var X=[],Q=0,ee=y.length;Q<ee;Q+=1)X[Q]=Q%2?y_(y[Q-1],y[Q],m).y:y_(y[Q],y[Q+1],m).x;return X}function $Xe(e,t,n,r,i,a){var o=.3333333333333333,s=2/3;return[o*e+s*n,o*t+s*r,o*i+s*n,o*a+s*r,i,a]}function eh(e,t,n){var r=e[0],i=e[1],a=t[0],o=t[1];return[r+(a-r)*n,i+(o-i)*n]}var iae=function(e,t,n,r){var i=.5,a=eh([e,t],[n,r],i);return nn(nn([],a,!0),[n,r,n,r],!1)};function PXe(e,t){var n=e[0],r=e.slice(1).map(Number),i=r[0],a=r[1],o,s=t.x1,l=t.y1,c=t.x,u=t.y;switch("TQ".includes(n)||(t.qx=null,t.qy=null),n){case"M":return t.x=i,t.y=a,e;case"A":return o=[s,l].concat(r),["C"].concat(b8(o[0],o[1],o[2],o[3],o[4],o[5],o[6],o[7],o[8],o[9]));case"Q":return t.qx=i,t.qy=a,o=[s,l].concat(r),["C"].concat($Xe(o[0],o[1],o[2],o[3],o[4],o[5]));case"L":return["C"].concat(iae(s,l,i,a));case"Z":return s===c&&l===u?["C",s,l,c,u,c,u]:["C"].concat(iae(s,l,c,u))}return e}function x8(e,t){if(t===void 0&&(t=!1),_Xe(e)){var n=[].concat(e);return t?[n,[]]:n}for(var r=m_(e),i=dt({},Jie),a=[],o="",s=r.length,l,c,u=[],f=0;f<s;f+=1){r[f]&&(o=r[f][0]),a[f]=o;var d=PXe(r[f],i);r[f]=d,pXe(r,a,f),s=r.length,o==="Z"&&u.push(f),l=r[f],c=l.length,i.x1=+l[c-2],i.y1=+l[c-1],i.x2=+l[c-4]||i.x1,i.y2=+l[c-3]||i.y1}return t?[r,u]:r}function MXe(e){return e.map(function(t){return Array.isArray(t)?[].concat(t):t})}function kXe(e){var t=e.slice(1).map(function(n,r,i){return r?i[r-1].slice(-2).concat(n.slice(1)):e[0].slice(1).concat(n.slice(1))}).map(function(n){return n.map(function(r,i){return n[n.length-i-2*(1-i%2)]})}).reverse();return[["M"].concat(t[0].slice(0,2))].concat(t.map(function(n){return["C"].concat(n.slice(2))}))}function Cs(e,t){return Math.sqrt((e[0]-t[0])*(e[0]-t[0])+(e[1]-t[1])*(e[1]-t[1]))}function S8(e,t,n,r,i){var a=Cs([e,t],[n,r]),o={x:0,y:0};if(typeof i=="number")if(i<=0)o={x:e,y:t};else if(i>=a)o={x:n,y:r};else{var s=eh([e,t],[n,r],i/a),l=s[0],c=s[1];o={x:l,y:c}}return{length:a,point:o,min:{x:Math.min(e,n),y:Math.min(t,r)},max:{x:Math.max(e,n),y:Math.max(t,r)}}}function aae(e,t){var n=e.x,r=e.y,i=t.x,a=t.y,o=n*i+r*a,s=Math.sqrt((Math.pow(n,2)+Math.pow(r,2))*(Math.pow(i,2)+Math.pow(a,2))),l=n*a-r*i<0?-1:1,c=l*Math.acos(o/s);return c}function TXe(e,t,n,r,i,a,o,s,l,c){var u=Math.abs,f=Math.sin,d=Math.cos,h=Math.sqrt,p=Math.PI,v=u(n),g=u(r),m=(i%360+360)%360,y=m*(p/180);if(e===s&&t===l)return{x:e,y:t};if(v===0||g===0)return S8(e,t,s,l,c).point;var x=(e-s)/2,S=(t-l)/2,w={x:d(y)*x+f(y)*S,y:-f(y)*x+d(y)*S},C=Math.pow(w.x,2)/Math.pow(v,2)+Math.pow(w.y,2)/Math.pow(g,2);C>1&&(v*=h(C),g*=h(C));var E=Math.pow(v,2)*Math.pow(g,2)-Math.pow(v,2)*Math.pow(w.y,2)-Math.pow(g,2)*Math.pow(w.x,2),O=Math.pow(v,2)*Math.pow(w.y,2)+Math.pow(g,2)*Math.pow(w.x,2),$=E/O;$=$<0?0:$;var P=(a!==o?1:-1)*h($),M={x:P*(v*w.y/g),y:P*(-(g*w.x)/v)},k={x:d(y)*M.x-f(y)*M.y+(e+s)/2,y:f(y)*M.x+d(y)*M.y+(t+l)/2},T={x:(w.x-M.x)/v,y:(w.y-M.y)/g},R=aae({x:1,y:0},T),A={x:(-w.x-M.x)/v,y:(-w.y-M.y)/g},N=aae(T,A);!o&&N>0?N-=2*p:o&&N<0&&(N+=2*p),N%=2*p;var L=R+N*c,j=v*d(L),F=g*f(L),B={x:d(y)*j-f(y)*F+k.x,y:f(y)*j+d(y)*F+k.y};return B}function RXe(e,t,n,r,i,a,o,s,l,c,u){var f,d=u.bbox,h=d===void 0?!0:d,p=u.length,v=p===void 0?!0:p,g=u.sampleSize,m=g===void 0?30:g,y=typeof c=="number",x=e,S=t,w=0,C=[x,S,w],E=[x,S],O=0,$={x:0,y:0},P=[{x,y:S}];y&&c<=0&&($={x,y:S});for(var M=0;M<=m;M+=1){if(O=M/m,f=TXe(e,t,n,r,i,a,o,s,l,O),x=f.x,S=f.y,h&&P.push({x,y:S}),v&&(w+=Cs(E,[x,S])),E=[x,S],y&&w>=c&&c>C[2]){var k=(w-c)/(w-C[2]);$={x:E[0]*(1-k)+C[0]*k,y:E[1]*(1-k)+C[1]*k}}C=[x,S,w]}return y&&c>=w&&($={x:s,y:l}),{length:w,point:$,min:{x:Math.min.apply(null,P.map(function(T){return T.x})),y:Math.min.apply(null,P.map(function(T){return T.y}))},max:{x:Math.max.apply(null,P.map(function(T){return T.x})),y:Math.max.apply(null,P.map(function(T){return T.y}))}}}function IXe(e,t,n,r,i,a,o,s,l){var c=1-l;return{x:Math.pow(c,3)*e+3*Math.pow(c,2)*l*n+3*c*Math.pow(l,2)*i+Math.pow(l,3)*o,y:Math.pow(c,3)*t+3*Math.pow(c,2)*l*r+3*c*Math.pow(l,2)*a+Math.pow(l,3)*s}}function oae(e,t,n,r,i,a,o,s,l,c){var u,f=c.bbox,d=f===void 0?!0:f,h=c.length,p=h===void 0?!0:h,v=c.sampleSize,g=v===void 0?10:v,m=typeof l=="number",y=e,x=t,S=0,w=[y,x,S],C=[y,x],E=0,O={x:0,y:0},$=[{x:y,y:x}];m&&l<=0&&(O={x:y,y:x});for(var P=0;P<=g;P+=1){if(E=P/g,u=IXe(e,t,n,r,i,a,o,s,E),y=u.x,x=u.y,d&&$.push({x:y,y:x}),p&&(S+=Cs(C,[y,x])),C=[y,x],m&&S>=l&&l>w[2]){var M=(S-l)/(S-w[2]);O={x:C[0]*(1-M)+w[0]*M,y:C[1]*(1-M)+w[1]*M}}w=[y,x,S]}return m&&l>=S&&(O={x:o,y:s}),{length:S,point:O,min:{x:Math.min.apply(null,$.map(function(k){return k.x})),y:Math.min.apply(null,$.map(function(k){return k.y}))},max:{x:Math.max.apply(null,$.map(function(k){return k.x})),y:Math.max.apply(null,$.map(function(k){return k.y}))}}}function AXe(e,t,n,r,i,a,o){var s=1-o;return{x:Math.pow(s,2)*e+2*s*o*n+Math.pow(o,2)*i,y:Math.pow(s,2)*t+2*s*o*r+Math.pow(o,2)*a}}function NXe(e,t,n,r,i,a,o,s){var l,c=s.bbox,u=c===void 0?!0:c,f=s.length,d=f===void 0?!0:f,h=s.sampleSize,p=h===void 0?10:h,v=typeof o=="number",g=e,m=t,y=0,x=[g,m,y],S=[g,m],w=0,C={x:0,y:0},E=[{x:g,y:m}];v&&o<=0&&(C={x:g,y:m});for(var O=0;O<=p;O+=1){if(w=O/p,l=AXe(e,t,n,r,i,a,w),g=l.x,m=l.y,u&&E.push({x:g,y:m}),d&&(y+=Cs(S,[g,m])),S=[g,m],v&&y>=o&&o>x[2]){var $=(y-o)/(y-x[2]);C={x:S[0]*(1-$)+x[0]*$,y:S[1]*(1-$)+x[1]*$}}x=[g,m,y]}return v&&o>=y&&(C={x:i,y:a}),{length:y,point:C,min:{x:Math.min.apply(null,E.map(function(P){return P.x})),y:Math.min.apply(null,E.map(function(P){return P.y}))},max:{x:Math.max.apply(null,E.map(function(P){return P.x})),y:Math.max.apply(null,E.map(function(P){return P.y}))}}}function sae(e,t,n){for(var r,i,a,o,s,l,c=m_(e),u=typeof t=="number",f,d=[],h,p=0,v=0,g=0,m=0,y,x=[],S=[],w=0,C={x:0,y:0},E=C,O=C,$=C,P=0,M=0,k=c.length;M<k;M+=1)y=c[M],h=y[0],f=h==="M",d=f?d:[p,v].concat(y.slice(1)),f?(g=y[1],m=y[2],C={x:g,y:m},E=C,w=0,u&&t<.001&&($=C)):h==="L"?(r=S8(d[0],d[1],d[2],d[3],(t||0)-P),w=r.length,C=r.min,E=r.max,O=r.point):h==="A"?(i=RXe(d[0],d[1],d[2],d[3],d[4],d[5],d[6],d[7],d[8],(t||0)-P,n||{}),w=i.length,C=i.min,E=i.max,O=i.point):h==="C"?(a=oae(d[0],d[1],d[2],d[3],d[4],d[5],d[6],d[7],(t||0)-P,n||{}),w=a.length,C=a.min,E=a.max,O=a.point):h==="Q"?(o=NXe(d[0],d[1],d[2],d[3],d[4],d[5],(t||0)-P,n||{}),w=o.length,C=o.min,E=o.max,O=o.point):h==="Z"&&(d=[p,v,g,m],s=S8(d[0],d[1],d[2],d[3],(t||0)-P),w=s.length,C=s.min,E=s.max,O=s.point),u&&P<t&&P+w>=t&&($=O),S.push(E),x.push(C),P+=w,l=h!=="Z"?y.slice(-2):[g,m],p=l[0],v=l[1];return u&&t>=P&&($={x:p,y:v}),{length:P,point:$,min:{x:Math.min.apply(null,x.map(function(T){return T.x})),y:Math.min.apply(null,x.map(function(T){return T.y}))},max:{x:Math.max.apply(null,S.map(function(T){return T.x})),y:Math.max.apply(null,S.map(function(T){return T.y}))}}}function LXe(e,t){return sae(e,void 0,dt(dt({},t),{bbox:!1,length:!0})).length}function jXe(e){var t=e.length,n=t-1;return e.map(function(r,i){return e.map(function(a,o){var s=i+o,l;return o===0||e[s]&&e[s][0]==="M"?(l=e[s],["M"].concat(l.slice(-2))):(s>=t&&(s-=n),e[s])})})}function DXe(e,t){var n=e.length-1,r=[],i=0,a=0,o=jXe(e);return o.forEach(function(s,l){e.slice(1).forEach(function(c,u){a+=Cs(e[(l+u)%n].slice(-2),t[u%n].slice(-2))}),r[l]=a,a=0}),i=r.indexOf(Math.min.apply(null,r)),o[i]}function FXe(e,t,n,r,i,a,o,s){return 3*((s-t)*(n+i)-(o-e)*(r+a)+r*(e-i)-n*(t-a)+s*(i+e/3)-o*(a+t/3))/20}function BXe(e){var t=0,n=0,r=0;return x8(e).map(function(i){var a;switch(i[0]){case"M":return t=i[1],n=i[2],0;default:var o=i.slice(1),s=o[0],l=o[1],c=o[2],u=o[3],f=o[4],d=o[5];return r=FXe(t,n,s,l,c,u,f,d),a=i.slice(-2),t=a[0],n=a[1],r}}).reduce(function(i,a){return i+a},0)}function lae(e){return BXe(e)>=0}function zXe(e,t,n){return sae(e,t,dt(dt({},n),{bbox:!1,length:!0})).point}function HXe(e,t){t===void 0&&(t=.5);var n=e.slice(0,2),r=e.slice(2,4),i=e.slice(4,6),a=e.slice(6,8),o=eh(n,r,t),s=eh(r,i,t),l=eh(i,a,t),c=eh(o,s,t),u=eh(s,l,t),f=eh(c,u,t);return[["C"].concat(o,c,f),["C"].concat(u,l,a)]}function cae(e){return e.map(function(t,n,r){var i=n&&r[n-1].slice(-2).concat(t.slice(1)),a=n?oae(i[0],i[1],i[2],i[3],i[4],i[5],i[6],i[7],i[8],{bbox:!1}).length:0,o;return n?o=a?HXe(i):[t,t]:o=[t],{s:t,ss:o,l:a}})}function uae(e,t,n){var r=cae(e),i=cae(t),a=r.length,o=i.length,s=r.filter(function(g){return g.l}).length,l=i.filter(function(g){return g.l}).length,c=r.filter(function(g){return g.l}).reduce(function(g,m){var y=m.l;return g+y},0)/s||0,u=i.filter(function(g){return g.l}).reduce(function(g,m){var y=m.l;return g+y},0)/l||0,f=n||Math.max(a,o),d=[c,u],h=[f-a,f-o],p=0,v=[r,i].map(function(g,m){return g.l===f?g.map(function(y){return y.s}):g.map(function(y,x){return p=x&&h[m]&&y.l>=d[m],h[m]-=p?1:0,p?y.ss:[y.s]}).flat()});return v[0].length===v[1].length?v:uae(v[0],v[1],f)}function fae(e){var t=document.createElement("div");t.innerHTML=e;var n=t.childNodes[0];return n&&t.contains(n)&&t.removeChild(n),n}function WXe(e,t){for(;!{}.hasOwnProperty.call(e,t)&&(e=tf(e))!==null;);return e}function w8(){return w8=typeof Reflect!="undefined"&&Reflect.get?Reflect.get.bind():function(e,t,n){var r=WXe(e,t);if(r){var i=Object.getOwnPropertyDescriptor(r,t);return i.get?i.get.call(arguments.length<3?e:n):i.value}},w8.apply(null,arguments)}function dae(e,t,n,r){var i=w8(tf(e.prototype),t,n);return typeof i=="function"?function(a){return i.apply(n,a)}:i}function b_(e,t,n){e.prototype=t.prototype=n,n.constructor=e}function C8(e,t){var n=Object.create(e.prototype);for(var r in t)n[r]=t[r];return n}function Um(){}var Up=.7,Gm=1/Up,Km="\\s*([+-]?\\d+)\\s*",ox="\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)\\s*",vu="\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)%\\s*",VXe=/^#([0-9a-f]{3,8})$/,qXe=new RegExp(`^rgb\\(${Km},${Km},${Km}\\)$`),UXe=new RegExp(`^rgb\\(${vu},${vu},${vu}\\)$`),GXe=new RegExp(`^rgba\\(${Km},${Km},${Km},${ox}\\)$`),KXe=new RegExp(`^rgba\\(${vu},${vu},${vu},${ox}\\)$`),YXe=new RegExp(`^hsl\\(${ox},${vu},${vu}\\)$`),XXe=new RegExp(`^hsla\\(${ox},${vu},${vu},${ox}\\)$`),hae={aliceblue:15792383,antiquewhite:16444375,aqua:65535,aquamarine:8388564,azure:15794175,beige:16119260,bisque:16770244,black:0,blanchedalmond:16772045,blue:255,blueviolet:9055202,brown:10824234,burlywood:14596231,cadetblue:6266528,chartreuse:8388352,chocolate:13789470,coral:16744272,cornflowerblue:6591981,cornsilk:16775388,crimson:14423100,cyan:65535,darkblue:139,darkcyan:35723,darkgoldenrod:12092939,darkgray:11119017,darkgreen:25600,darkgrey:11119017,darkkhaki:12433259,darkmagenta:9109643,darkolivegreen:5597999,darkorange:16747520,darkorchid:10040012,darkred:9109504,darksalmon:15308410,darkseagreen:9419919,darkslateblue:4734347,darkslategray:3100495,darkslategrey:3100495,darkturquoise:52945,darkviolet:9699539,deeppink:16716947,deepskyblue:49151,dimgray:6908265,dimgrey:6908265,dodgerblue:2003199,firebrick:11674146,floralwhite:16775920,forestgreen:2263842,fuchsia:16711935,gainsboro:14474460,ghostwhite:16316671,gold:16766720,goldenrod:14329120,gray:8421504,green:32768,greenyellow:11403055,grey:8421504,honeydew:15794160,hotpink:16738740,indianred:13458524,indigo:4915330,ivory:16777200,khaki:15787660,lavender:15132410,lavenderblush:16773365,lawngreen:8190976,lemonchiffon:16775885,lightblue:11393254,lightcoral:15761536,lightcyan:14745599,lightgoldenrodyellow:16448210,lightgray:13882323,lightgreen:9498256,lightgrey:13882323,lightpink:16758465,lightsalmon:16752762,lightseagreen:2142890,lightskyblue:8900346,lightslategray:7833753,lightslategrey:7833753,lightsteelblue:11584734,lightyellow:16777184,lime:65280,limegreen:3329330,linen:16445670,magenta:16711935,maroon:8388608,mediumaquamarine:6737322,mediumblue:205,mediumorchid:12211667,mediumpurple:9662683,mediumseagreen:3978097,mediumslateblue:8087790,mediumspringgreen:64154,mediumturquoise:4772300,mediumvioletred:13047173,midnightblue:1644912,mintcream:16121850,mistyrose:16770273,moccasin:16770229,navajowhite:16768685,navy:128,oldlace:16643558,olive:8421376,olivedrab:7048739,orange:16753920,orangered:16729344,orchid:14315734,palegoldenrod:15657130,palegreen:10025880,paleturquoise:11529966,palevioletred:14381203,papayawhip:16773077,peachpuff:16767673,peru:13468991,pink:16761035,plum:14524637,powderblue:11591910,purple:8388736,rebeccapurple:6697881,red:16711680,rosybrown:12357519,royalblue:4286945,saddlebrown:9127187,salmon:16416882,sandybrown:16032864,seagreen:3050327,seashell:16774638,sienna:10506797,silver:12632256,skyblue:8900331,slateblue:6970061,slategray:7372944,slategrey:7372944,snow:16775930,springgreen:65407,steelblue:4620980,tan:13808780,teal:32896,thistle:14204888,tomato:16737095,turquoise:4251856,violet:15631086,wheat:16113331,white:16777215,whitesmoke:16119285,yellow:16776960,yellowgreen:10145074};b_(Um,x_,{copy(e){return Object.assign(new this.constructor,this,e)},displayable(){return this.rgb().displayable()},hex:pae,formatHex:pae,formatHex8:ZXe,formatHsl:QXe,formatRgb:vae,toString:vae});function pae(){return this.rgb().formatHex()}function ZXe(){return this.rgb().formatHex8()}function QXe(){return Sae(this).formatHsl()}function vae(){return this.rgb().formatRgb()}function x_(e){var t,n;return e=(e+"").trim().toLowerCase(),(t=VXe.exec(e))?(n=t[1].length,t=parseInt(t[1],16),n===6?gae(t):n===3?new jo(t>>8&15|t>>4&240,t>>4&15|t&240,(t&15)<<4|t&15,1):n===8?S_(t>>24&255,t>>16&255,t>>8&255,(t&255)/255):n===4?S_(t>>12&15|t>>8&240,t>>8&15|t>>4&240,t>>4&15|t&240,((t&15)<<4|t&15)/255):null):(t=qXe.exec(e))?new jo(t[1],t[2],t[3],1):(t=UXe.exec(e))?new jo(t[1]*255/100,t[2]*255/100,t[3]*255/100,1):(t=GXe.exec(e))?S_(t[1],t[2],t[3],t[4]):(t=KXe.exec(e))?S_(t[1]*255/100,t[2]*255/100,t[3]*255/100,t[4]):(t=YXe.exec(e))?xae(t[1],t[2]/100,t[3]/100,1):(t=XXe.exec(e))?xae(t[1],t[2]/100,t[3]/100,t[4]):hae.hasOwnProperty(e)?gae(hae[e]):e==="transparent"?new jo(NaN,NaN,NaN,0):null}function gae(e){return new jo(e>>16&255,e>>8&255,e&255,1)}function S_(e,t,n,r){return r<=0&&(e=t=n=NaN),new jo(e,t,n,r)}function mae(e){return e instanceof Um||(e=x_(e)),e?(e=e.rgb(),new jo(e.r,e.g,e.b,e.opacity)):new jo}function sx(e,t,n,r){return arguments.length===1?mae(e):new jo(e,t,n,r==null?1:r)}function jo(e,t,n,r){this.r=+e,this.g=+t,this.b=+n,this.opacity=+r}b_(jo,sx,C8(Um,{brighter(e){return e=e==null?Gm:Math.pow(Gm,e),new jo(this.r*e,this.g*e,this.b*e,this.opacity)},darker(e){return e=e==null?Up:Math.pow(Up,e),new jo(this.r*e,this.g*e,this.b*e,this.opacity)},rgb(){return this},clamp(){return new jo(Gp(this.r),Gp(this.g),Gp(this.b),w_(this.opacity))},displayable(){return-.5<=this.r&&this.r<255.5&&-.5<=this.g&&this.g<255.5&&-.5<=this.b&&this.b<255.5&&0<=this.opacity&&this.opacity<=1},hex:yae,formatHex:yae,formatHex8:JXe,formatRgb:bae,toString:bae}));function yae(){return`#${Kp(this.r)}${Kp(this.g)}${Kp(this.b)}`}function JXe(){return`#${Kp(this.r)}${Kp(this.g)}${Kp(this.b)}${Kp((isNaN(this.opacity)?1:this.opacity)*255)}`}function bae(){const e=w_(this.opacity);return`${e===1?"rgb(":"rgba("}${Gp(this.r)}, ${Gp(this.g)}, ${Gp(this.b)}${e===1?")":`, ${e})`}`}function w_(e){return isNaN(e)?1:Math.max(0,Math.min(1,e))}function Gp(e){return Math.max(0,Math.min(255,Math.round(e)||0))}function Kp(e){return e=Gp(e),(e<16?"0":"")+e.toString(16)}function xae(e,t,n,r){return r<=0?e=t=n=NaN:n<=0||n>=1?e=t=NaN:t<=0&&(e=NaN),new Rc(e,t,n,r)}function Sae(e){if(e instanceof Rc)return new Rc(e.h,e.s,e.l,e.opacity);if(e instanceof Um||(e=x_(e)),!e)return new Rc;if(e instanceof Rc)return e;e=e.rgb();var t=e.r/255,n=e.g/255,r=e.b/255,i=Math.min(t,n,r),a=Math.max(t,n,r),o=NaN,s=a-i,l=(a+i)/2;return s?(t===a?o=(n-r)/s+(n<r)*6:n===a?o=(r-t)/s+2:o=(t-n)/s+4,s/=l<.5?a+i:2-a-i,o*=60):s=l>0&&l<1?0:o,new Rc(o,s,l,e.opacity)}function eZe(e,t,n,r){return arguments.length===1?Sae(e):new Rc(e,t,n,r==null?1:r)}function Rc(e,t,n,r){this.h=+e,this.s=+t,this.l=+n,this.opacity=+r}b_(Rc,eZe,C8(Um,{brighter(e){return e=e==null?Gm:Math.pow(Gm,e),new Rc(this.h,this.s,this.l*e,this.opacity)},darker(e){return e=e==null?Up:Math.pow(Up,e),new Rc(this.h,this.s,this.l*e,this.opacity)},rgb(){var e=this.h%360+(this.h<0)*360,t=isNaN(e)||isNaN(this.s)?0:this.s,n=this.l,r=n+(n<.5?n:1-n)*t,i=2*n-r;return new jo(E8(e>=240?e-240:e+120,i,r),E8(e,i,r),E8(e<120?e+240:e-120,i,r),this.opacity)},clamp(){return new Rc(wae(this.h),C_(this.s),C_(this.l),w_(this.opacity))},displayable(){return(0<=this.s&&this.s<=1||isNaN(this.s))&&0<=this.l&&this.l<=1&&0<=this.opacity&&this.opacity<=1},formatHsl(){const e=w_(this.opacity);return`${e===1?"hsl(":"hsla("}${wae(this.h)}, ${C_(this.s)*100}%, ${C_(this.l)*100}%${e===1?")":`, ${e})`}`}}));function wae(e){return e=(e||0)%360,e<0?e+360:e}function C_(e){return Math.max(0,Math.min(1,e||0))}function E8(e,t,n){return(e<60?t+(n-t)*e/60:e<180?n:e<240?t+(n-t)*(240-e)/60:t)*255}const tZe=Math.PI/180,nZe=180/Math.PI;var Cae=-.14861,O8=1.78277,_8=-.29227,E_=-.90649,lx=1.97294,Eae=lx*E_,Oae=lx*O8,_ae=O8*_8-E_*Cae;function rZe(e){if(e instanceof Yp)return new Yp(e.h,e.s,e.l,e.opacity);e instanceof jo||(e=mae(e));var t=e.r/255,n=e.g/255,r=e.b/255,i=(_ae*r+Eae*t-Oae*n)/(_ae+Eae-Oae),a=r-i,o=(lx*(n-i)-_8*a)/E_,s=Math.sqrt(o*o+a*a)/(lx*i*(1-i)),l=s?Math.atan2(o,a)*nZe-120:NaN;return new Yp(l<0?l+360:l,s,i,e.opacity)}function gu(e,t,n,r){return arguments.length===1?rZe(e):new Yp(e,t,n,r==null?1:r)}function Yp(e,t,n,r){this.h=+e,this.s=+t,this.l=+n,this.opacity=+r}b_(Yp,gu,C8(Um,{brighter(e){return e=e==null?Gm:Math.pow(Gm,e),new Yp(this.h,this.s,this.l*e,this.opacity)},darker(e){return e=e==null?Up:Math.pow(Up,e),new Yp(this.h,this.s,this.l*e,this.opacity)},rgb(){var e=isNaN(this.h)?0:(this.h+120)*tZe,t=+this.l,n=isNaN(this.s)?0:this.s*t*(1-t),r=Math.cos(e),i=Math.sin(e);return new jo(255*(t+n*(Cae*r+O8*i)),255*(t+n*(_8*r+E_*i)),255*(t+n*(lx*r)),this.opacity)}}));function Cf(e,t,n,r){var i=e-n,a=t-r;return Math.sqrt(i*i+a*a)}function $ae(e,t){var n=Math.min.apply(Math,nn([],Ce(e),!1)),r=Math.min.apply(Math,nn([],Ce(t),!1)),i=Math.max.apply(Math,nn([],Ce(e),!1)),a=Math.max.apply(Math,nn([],Ce(t),!1));return{x:n,y:r,width:i-n,height:a-r}}function iZe(e,t,n){return Math.atan(-t/e*Math.tan(n))}function aZe(e,t,n){return Math.atan(t/(e*Math.tan(n)))}function oZe(e,t,n,r,i,a){return n*Math.cos(i)*Math.cos(a)-r*Math.sin(i)*Math.sin(a)+e}function sZe(e,t,n,r,i,a){return n*Math.sin(i)*Math.cos(a)+r*Math.cos(i)*Math.sin(a)+t}function lZe(e,t,n,r,i,a,o){for(var s=iZe(n,r,i),l=1/0,c=-1/0,u=[a,o],f=-Math.PI*2;f<=Math.PI*2;f+=Math.PI){var d=s+f;a<o?a<d&&d<o&&u.push(d):o<d&&d<a&&u.push(d)}for(var f=0;f<u.length;f++){var h=oZe(e,t,n,r,i,u[f]);h<l&&(l=h),h>c&&(c=h)}for(var p=aZe(n,r,i),v=1/0,g=-1/0,m=[a,o],f=-Math.PI*2;f<=Math.PI*2;f+=Math.PI){var y=p+f;a<o?a<y&&y<o&&m.push(y):o<y&&y<a&&m.push(y)}for(var f=0;f<m.length;f++){var x=sZe(e,t,n,r,i,m[f]);x<v&&(v=x),x>g&&(g=x)}return{x:l,y:v,width:c-l,height:g-v}}var cZe=1e-4;function Pae(e,t,n,r,i,a){var o=-1,s=1/0,l=[n,r],c=20;a&&a>200&&(c=a/10);for(var u=1/c,f=u/10,d=0;d<=c;d++){var h=d*u,p=[i.apply(void 0,nn([],Ce(e.concat([h])),!1)),i.apply(void 0,nn([],Ce(t.concat([h])),!1))],v=Cf(l[0],l[1],p[0],p[1]);v<s&&(o=h,s=v)}if(o===0)return{x:e[0],y:t[0]};if(o===1){var g=e.length;return{x:e[g-1],y:t[g-1]}}s=1/0;for(var d=0;d<32&&!(f<cZe);d++){var m=o-f,y=o+f,p=[i.apply(void 0,nn([],Ce(e.concat([m])),!1)),i.apply(void 0,nn([],Ce(t.concat([m])),!1))],v=Cf(l[0],l[1],p[0],p[1]);if(m>=0&&v<s)o=m,s=v;else{var x=[i.apply(void 0,nn([],Ce(e.concat([y])),!1)),i.apply(void 0,nn([],Ce(t.concat([y])),!1))],S=Cf(l[0],l[1],x[0],x[1]);y<=1&&S<s?(o=y,s=S):f*=.5}}return{x:i.apply(void 0,nn([],Ce(e.concat([o])),!1)),y:i.apply(void 0,nn([],Ce(t.concat([o])),!1))}}function Mae(e,t,n,r){return Cf(e,t,n,r)}function kae(e,t,n,r,i){return{x:(1-i)*e+i*n,y:(1-i)*t+i*r}}function uZe(e,t,n,r,i,a){var o=[n-e,r-t];if(JYe(o,[0,0]))return Math.sqrt((i-e)*(i-e)+(a-t)*(a-t));var s=[-o[1],o[0]];ZYe(s,s);var l=[i-e,a-t];return Math.abs(QYe(l,s))}function $8(e,t,n,r,i){var a=1-i;return a*a*a*e+3*t*i*a*a+3*n*i*i*a+r*i*i*i}function Tae(e,t,n,r){var i=-3*e+9*t-9*n+3*r,a=6*e-12*t+6*n,o=3*t-3*e,s=[],l,c,u;if(nx(i,0))nx(a,0)||(l=-o/a,l>=0&&l<=1&&s.push(l));else{var f=a*a-4*i*o;nx(f,0)?s.push(-a/(2*i)):f>0&&(u=Math.sqrt(f),l=(-a+u)/(2*i),c=(-a-u)/(2*i),l>=0&&l<=1&&s.push(l),c>=0&&c<=1&&s.push(c))}return s}function fZe(e,t,n,r,i,a,o,s){for(var l=[e,o],c=[t,s],u=Tae(e,n,i,o),f=Tae(t,r,a,s),d=0;d<u.length;d++)l.push($8(e,n,i,o,u[d]));for(var d=0;d<f.length;d++)c.push($8(t,r,a,s,f[d]));return $ae(l,c)}function dZe(e,t,n,r,i,a,o,s,l,c,u){return Pae([e,n,i,o],[t,r,a,s],l,c,$8,u)}function Rae(e,t,n,r,i,a,o,s,l,c,u){var f=dZe(e,t,n,r,i,a,o,s,l,c,u);return Cf(f.x,f.y,l,c)}function hZe(e){if(e.length<2)return 0;for(var t=0,n=0;n<e.length-1;n++){var r=e[n],i=e[n+1];t+=Cf(r[0],r[1],i[0],i[1])}return t}function pZe(e){return hZe(e)}function P8(e,t,n,r){var i=1-r;return i*i*e+2*r*i*t+r*r*n}function Iae(e,t,n){var r=e+n-2*t;if(nx(r,0))return[.5];var i=(e-t)/r;return i<=1&&i>=0?[i]:[]}function vZe(e,t,n,r,i,a){var o=Iae(e,n,i)[0],s=Iae(t,r,a)[0],l=[e,i],c=[t,a];return o!==void 0&&l.push(P8(e,n,i,o)),s!==void 0&&c.push(P8(t,r,a,s)),$ae(l,c)}function gZe(e,t,n,r,i,a,o,s){return Pae([e,n,i],[t,r,a],o,s,P8)}function mZe(e,t,n,r,i,a,o,s){var l=gZe(e,t,n,r,i,a,o,s);return Cf(l.x,l.y,o,s)}/*!
+`,UKe=1,GKe=3,KKe=1,YKe=function(e){Oi(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.imageRef=b.createRef(),n.videoRef=b.createRef(),n.containerPosition={x:0,y:0},n.containerRef=null,n.styleRef=null,n.containerRect=null,n.mediaSize={width:0,height:0,naturalWidth:0,naturalHeight:0},n.dragStartPosition={x:0,y:0},n.dragStartCrop={x:0,y:0},n.gestureZoomStart=0,n.gestureRotationStart=0,n.isTouching=!1,n.lastPinchDistance=0,n.lastPinchRotation=0,n.rafDragTimeout=null,n.rafPinchTimeout=null,n.wheelTimer=null,n.currentDoc=typeof document!="undefined"?document:null,n.currentWindow=typeof window!="undefined"?window:null,n.resizeObserver=null,n.state={cropSize:null,hasWheelJustStarted:!1,mediaObjectFit:void 0},n.initResizeObserver=function(){if(!(typeof window.ResizeObserver=="undefined"||!n.containerRef)){var r=!0;n.resizeObserver=new window.ResizeObserver(function(i){if(r){r=!1;return}n.computeSizes()}),n.resizeObserver.observe(n.containerRef)}},n.preventZoomSafari=function(r){return r.preventDefault()},n.cleanEvents=function(){n.currentDoc&&(n.currentDoc.removeEventListener("mousemove",n.onMouseMove),n.currentDoc.removeEventListener("mouseup",n.onDragStopped),n.currentDoc.removeEventListener("touchmove",n.onTouchMove),n.currentDoc.removeEventListener("touchend",n.onDragStopped),n.currentDoc.removeEventListener("gesturemove",n.onGestureMove),n.currentDoc.removeEventListener("gestureend",n.onGestureEnd),n.currentDoc.removeEventListener("scroll",n.onScroll))},n.clearScrollEvent=function(){n.containerRef&&n.containerRef.removeEventListener("wheel",n.onWheel),n.wheelTimer&&clearTimeout(n.wheelTimer)},n.onMediaLoad=function(){var r=n.computeSizes();r&&(n.emitCropData(),n.setInitialCrop(r)),n.props.onMediaLoaded&&n.props.onMediaLoaded(n.mediaSize)},n.setInitialCrop=function(r){if(n.props.initialCroppedAreaPercentages){var i=zKe(n.props.initialCroppedAreaPercentages,n.mediaSize,n.props.rotation,r,n.props.minZoom,n.props.maxZoom),a=i.crop,o=i.zoom;n.props.onCropChange(a),n.props.onZoomChange&&n.props.onZoomChange(o)}else if(n.props.initialCroppedAreaPixels){var s=WKe(n.props.initialCroppedAreaPixels,n.mediaSize,n.props.rotation,r,n.props.minZoom,n.props.maxZoom),a=s.crop,o=s.zoom;n.props.onCropChange(a),n.props.onZoomChange&&n.props.onZoomChange(o)}},n.computeSizes=function(){var r,i,a,o,s,l,c=n.imageRef.current||n.videoRef.current;if(c&&n.containerRef){n.containerRect=n.containerRef.getBoundingClientRect(),n.saveContainerPosition();var u=n.containerRect.width/n.containerRect.height,f=((r=n.imageRef.current)===null||r===void 0?void 0:r.naturalWidth)||((i=n.videoRef.current)===null||i===void 0?void 0:i.videoWidth)||0,d=((a=n.imageRef.current)===null||a===void 0?void 0:a.naturalHeight)||((o=n.videoRef.current)===null||o===void 0?void 0:o.videoHeight)||0,h=c.offsetWidth<f||c.offsetHeight<d,p=f/d,v=void 0;if(h)switch(n.state.mediaObjectFit){default:case"contain":v=u>p?{width:n.containerRect.height*p,height:n.containerRect.height}:{width:n.containerRect.width,height:n.containerRect.width/p};break;case"horizontal-cover":v={width:n.containerRect.width,height:n.containerRect.width/p};break;case"vertical-cover":v={width:n.containerRect.height*p,height:n.containerRect.height};break}else v={width:c.offsetWidth,height:c.offsetHeight};n.mediaSize=dt(dt({},v),{naturalWidth:f,naturalHeight:d}),n.props.setMediaSize&&n.props.setMediaSize(n.mediaSize);var g=n.props.cropSize?n.props.cropSize:LKe(n.mediaSize.width,n.mediaSize.height,n.containerRect.width,n.containerRect.height,n.props.aspect,n.props.rotation);return(((s=n.state.cropSize)===null||s===void 0?void 0:s.height)!==g.height||((l=n.state.cropSize)===null||l===void 0?void 0:l.width)!==g.width)&&n.props.onCropSizeChange&&n.props.onCropSizeChange(g),n.setState({cropSize:g},n.recomputeCropPosition),n.props.setCropSize&&n.props.setCropSize(g),g}},n.saveContainerPosition=function(){if(n.containerRef){var r=n.containerRef.getBoundingClientRect();n.containerPosition={x:r.left,y:r.top}}},n.onMouseDown=function(r){n.currentDoc&&(r.preventDefault(),n.currentDoc.addEventListener("mousemove",n.onMouseMove),n.currentDoc.addEventListener("mouseup",n.onDragStopped),n.saveContainerPosition(),n.onDragStart(t.getMousePoint(r)))},n.onMouseMove=function(r){return n.onDrag(t.getMousePoint(r))},n.onScroll=function(r){n.currentDoc&&(r.preventDefault(),n.saveContainerPosition())},n.onTouchStart=function(r){n.currentDoc&&(n.isTouching=!0,!(n.props.onTouchRequest&&!n.props.onTouchRequest(r))&&(n.currentDoc.addEventListener("touchmove",n.onTouchMove,{passive:!1}),n.currentDoc.addEventListener("touchend",n.onDragStopped),n.saveContainerPosition(),r.touches.length===2?n.onPinchStart(r):r.touches.length===1&&n.onDragStart(t.getTouchPoint(r.touches[0]))))},n.onTouchMove=function(r){r.preventDefault(),r.touches.length===2?n.onPinchMove(r):r.touches.length===1&&n.onDrag(t.getTouchPoint(r.touches[0]))},n.onGestureStart=function(r){n.currentDoc&&(r.preventDefault(),n.currentDoc.addEventListener("gesturechange",n.onGestureMove),n.currentDoc.addEventListener("gestureend",n.onGestureEnd),n.gestureZoomStart=n.props.zoom,n.gestureRotationStart=n.props.rotation)},n.onGestureMove=function(r){if(r.preventDefault(),!n.isTouching){var i=t.getMousePoint(r),a=n.gestureZoomStart-1+r.scale;if(n.setNewZoom(a,i,{shouldUpdatePosition:!0}),n.props.onRotationChange){var o=n.gestureRotationStart+r.rotation;n.props.onRotationChange(o)}}},n.onGestureEnd=function(r){n.cleanEvents()},n.onDragStart=function(r){var i,a,o=r.x,s=r.y;n.dragStartPosition={x:o,y:s},n.dragStartCrop=dt({},n.props.crop),(a=(i=n.props).onInteractionStart)===null||a===void 0||a.call(i)},n.onDrag=function(r){var i=r.x,a=r.y;n.currentWindow&&(n.rafDragTimeout&&n.currentWindow.cancelAnimationFrame(n.rafDragTimeout),n.rafDragTimeout=n.currentWindow.requestAnimationFrame(function(){if(n.state.cropSize&&!(i===void 0||a===void 0)){var o=i-n.dragStartPosition.x,s=a-n.dragStartPosition.y,l={x:n.dragStartCrop.x+o,y:n.dragStartCrop.y+s},c=n.props.restrictPosition?Kb(l,n.mediaSize,n.state.cropSize,n.props.zoom,n.props.rotation):l;n.props.onCropChange(c)}}))},n.onDragStopped=function(){var r,i;n.isTouching=!1,n.cleanEvents(),n.emitCropData(),(i=(r=n.props).onInteractionEnd)===null||i===void 0||i.call(r)},n.onWheel=function(r){if(n.currentWindow&&!(n.props.onWheelRequest&&!n.props.onWheelRequest(r))){r.preventDefault();var i=t.getMousePoint(r),a=NKe(r).pixelY,o=n.props.zoom-a*n.props.zoomSpeed/200;n.setNewZoom(o,i,{shouldUpdatePosition:!0}),n.state.hasWheelJustStarted||n.setState({hasWheelJustStarted:!0},function(){var s,l;return(l=(s=n.props).onInteractionStart)===null||l===void 0?void 0:l.call(s)}),n.wheelTimer&&clearTimeout(n.wheelTimer),n.wheelTimer=n.currentWindow.setTimeout(function(){return n.setState({hasWheelJustStarted:!1},function(){var s,l;return(l=(s=n.props).onInteractionEnd)===null||l===void 0?void 0:l.call(s)})},250)}},n.getPointOnContainer=function(r,i){var a=r.x,o=r.y;if(!n.containerRect)throw new Error("The Cropper is not mounted");return{x:n.containerRect.width/2-(a-i.x),y:n.containerRect.height/2-(o-i.y)}},n.getPointOnMedia=function(r){var i=r.x,a=r.y,o=n.props,s=o.crop,l=o.zoom;return{x:(i+s.x)/l,y:(a+s.y)/l}},n.setNewZoom=function(r,i,a){var o=a===void 0?{}:a,s=o.shouldUpdatePosition,l=s===void 0?!0:s;if(!(!n.state.cropSize||!n.props.onZoomChange)){var c=n_(r,n.props.minZoom,n.props.maxZoom);if(l){var u=n.getPointOnContainer(i,n.containerPosition),f=n.getPointOnMedia(u),d={x:f.x*c-u.x,y:f.y*c-u.y},h=n.props.restrictPosition?Kb(d,n.mediaSize,n.state.cropSize,c,n.props.rotation):d;n.props.onCropChange(h)}n.props.onZoomChange(c)}},n.getCropData=function(){if(!n.state.cropSize)return null;var r=n.props.restrictPosition?Kb(n.props.crop,n.mediaSize,n.state.cropSize,n.props.zoom,n.props.rotation):n.props.crop;return DKe(r,n.mediaSize,n.state.cropSize,n.getAspect(),n.props.zoom,n.props.rotation,n.props.restrictPosition)},n.emitCropData=function(){var r=n.getCropData();if(r){var i=r.croppedAreaPercentages,a=r.croppedAreaPixels;n.props.onCropComplete&&n.props.onCropComplete(i,a),n.props.onCropAreaChange&&n.props.onCropAreaChange(i,a)}},n.emitCropAreaChange=function(){var r=n.getCropData();if(r){var i=r.croppedAreaPercentages,a=r.croppedAreaPixels;n.props.onCropAreaChange&&n.props.onCropAreaChange(i,a)}},n.recomputeCropPosition=function(){if(n.state.cropSize){var r=n.props.restrictPosition?Kb(n.props.crop,n.mediaSize,n.state.cropSize,n.props.zoom,n.props.rotation):n.props.crop;n.props.onCropChange(r),n.emitCropData()}},n.onKeyDown=function(r){var i=n.props,a=i.crop,o=i.onCropChange,s=i.keyboardStep,l=i.zoom,c=i.rotation,u=s;if(n.state.cropSize){r.shiftKey&&(u*=.2);var f=dt({},a);switch(r.key){case"ArrowUp":f.y-=u,r.preventDefault();break;case"ArrowDown":f.y+=u,r.preventDefault();break;case"ArrowLeft":f.x-=u,r.preventDefault();break;case"ArrowRight":f.x+=u,r.preventDefault();break;default:return}n.props.restrictPosition&&(f=Kb(f,n.mediaSize,n.state.cropSize,l,c)),o(f)}},n}return t.prototype.componentDidMount=function(){!this.currentDoc||!this.currentWindow||(this.containerRef&&(this.containerRef.ownerDocument&&(this.currentDoc=this.containerRef.ownerDocument),this.currentDoc.defaultView&&(this.currentWindow=this.currentDoc.defaultView),this.initResizeObserver(),typeof window.ResizeObserver=="undefined"&&this.currentWindow.addEventListener("resize",this.computeSizes),this.props.zoomWithScroll&&this.containerRef.addEventListener("wheel",this.onWheel,{passive:!1}),this.containerRef.addEventListener("gesturestart",this.onGestureStart)),this.currentDoc.addEventListener("scroll",this.onScroll),this.props.disableAutomaticStylesInjection||(this.styleRef=this.currentDoc.createElement("style"),this.styleRef.setAttribute("type","text/css"),this.props.nonce&&this.styleRef.setAttribute("nonce",this.props.nonce),this.styleRef.innerHTML=qKe,this.currentDoc.head.appendChild(this.styleRef)),this.imageRef.current&&this.imageRef.current.complete&&this.onMediaLoad(),this.props.setImageRef&&this.props.setImageRef(this.imageRef),this.props.setVideoRef&&this.props.setVideoRef(this.videoRef))},t.prototype.componentWillUnmount=function(){var n,r;!this.currentDoc||!this.currentWindow||(typeof window.ResizeObserver=="undefined"&&this.currentWindow.removeEventListener("resize",this.computeSizes),(n=this.resizeObserver)===null||n===void 0||n.disconnect(),this.containerRef&&this.containerRef.removeEventListener("gesturestart",this.preventZoomSafari),this.styleRef&&((r=this.styleRef.parentNode)===null||r===void 0||r.removeChild(this.styleRef)),this.cleanEvents(),this.props.zoomWithScroll&&this.clearScrollEvent())},t.prototype.componentDidUpdate=function(n){var r,i,a,o,s,l,c,u,f;n.rotation!==this.props.rotation?(this.computeSizes(),this.recomputeCropPosition()):n.aspect!==this.props.aspect?this.computeSizes():n.objectFit!==this.props.objectFit?this.computeSizes():n.zoom!==this.props.zoom?this.recomputeCropPosition():((r=n.cropSize)===null||r===void 0?void 0:r.height)!==((i=this.props.cropSize)===null||i===void 0?void 0:i.height)||((a=n.cropSize)===null||a===void 0?void 0:a.width)!==((o=this.props.cropSize)===null||o===void 0?void 0:o.width)?this.computeSizes():(((s=n.crop)===null||s===void 0?void 0:s.x)!==((l=this.props.crop)===null||l===void 0?void 0:l.x)||((c=n.crop)===null||c===void 0?void 0:c.y)!==((u=this.props.crop)===null||u===void 0?void 0:u.y))&&this.emitCropAreaChange(),n.zoomWithScroll!==this.props.zoomWithScroll&&this.containerRef&&(this.props.zoomWithScroll?this.containerRef.addEventListener("wheel",this.onWheel,{passive:!1}):this.clearScrollEvent()),n.video!==this.props.video&&((f=this.videoRef.current)===null||f===void 0||f.load());var d=this.getObjectFit();d!==this.state.mediaObjectFit&&this.setState({mediaObjectFit:d},this.computeSizes)},t.prototype.getAspect=function(){var n=this.props,r=n.cropSize,i=n.aspect;return r?r.width/r.height:i},t.prototype.getObjectFit=function(){var n,r,i,a;if(this.props.objectFit==="cover"){var o=this.imageRef.current||this.videoRef.current;if(o&&this.containerRef){this.containerRect=this.containerRef.getBoundingClientRect();var s=this.containerRect.width/this.containerRect.height,l=((n=this.imageRef.current)===null||n===void 0?void 0:n.naturalWidth)||((r=this.videoRef.current)===null||r===void 0?void 0:r.videoWidth)||0,c=((i=this.imageRef.current)===null||i===void 0?void 0:i.naturalHeight)||((a=this.videoRef.current)===null||a===void 0?void 0:a.videoHeight)||0,u=l/c;return u<s?"horizontal-cover":"vertical-cover"}return"horizontal-cover"}return this.props.objectFit},t.prototype.onPinchStart=function(n){var r=t.getTouchPoint(n.touches[0]),i=t.getTouchPoint(n.touches[1]);this.lastPinchDistance=fie(r,i),this.lastPinchRotation=die(r,i),this.onDragStart(hie(r,i))},t.prototype.onPinchMove=function(n){var r=this;if(!(!this.currentDoc||!this.currentWindow)){var i=t.getTouchPoint(n.touches[0]),a=t.getTouchPoint(n.touches[1]),o=hie(i,a);this.onDrag(o),this.rafPinchTimeout&&this.currentWindow.cancelAnimationFrame(this.rafPinchTimeout),this.rafPinchTimeout=this.currentWindow.requestAnimationFrame(function(){var s=fie(i,a),l=r.props.zoom*(s/r.lastPinchDistance);r.setNewZoom(l,o,{shouldUpdatePosition:!1}),r.lastPinchDistance=s;var c=die(i,a),u=r.props.rotation+(c-r.lastPinchRotation);r.props.onRotationChange&&r.props.onRotationChange(u),r.lastPinchRotation=c})}},t.prototype.render=function(){var n=this,r,i=this.props,a=i.image,o=i.video,s=i.mediaProps,l=i.transform,c=i.crop,u=c.x,f=c.y,d=i.rotation,h=i.zoom,p=i.cropShape,v=i.showGrid,g=i.style,m=g.containerStyle,y=g.cropAreaStyle,x=g.mediaStyle,S=i.classes,w=S.containerClassName,C=S.cropAreaClassName,E=S.mediaClassName,O=(r=this.state.mediaObjectFit)!==null&&r!==void 0?r:this.getObjectFit();return b.createElement("div",{onMouseDown:this.onMouseDown,onTouchStart:this.onTouchStart,ref:function(P){return n.containerRef=P},"data-testid":"container",style:m,className:r_("reactEasyCrop_Container",w)},a?b.createElement("img",dt({alt:"",className:r_("reactEasyCrop_Image",O==="contain"&&"reactEasyCrop_Contain",O==="horizontal-cover"&&"reactEasyCrop_Cover_Horizontal",O==="vertical-cover"&&"reactEasyCrop_Cover_Vertical",E)},s,{src:a,ref:this.imageRef,style:dt(dt({},x),{transform:l||"translate(".concat(u,"px, ").concat(f,"px) rotate(").concat(d,"deg) scale(").concat(h,")")}),onLoad:this.onMediaLoad})):o&&b.createElement("video",dt({autoPlay:!0,playsInline:!0,loop:!0,muted:!0,className:r_("reactEasyCrop_Video",O==="contain"&&"reactEasyCrop_Contain",O==="horizontal-cover"&&"reactEasyCrop_Cover_Horizontal",O==="vertical-cover"&&"reactEasyCrop_Cover_Vertical",E)},s,{ref:this.videoRef,onLoadedMetadata:this.onMediaLoad,style:dt(dt({},x),{transform:l||"translate(".concat(u,"px, ").concat(f,"px) rotate(").concat(d,"deg) scale(").concat(h,")")}),controls:!1}),(Array.isArray(o)?o:[{src:o}]).map(function($){return b.createElement("source",dt({key:$.src},$))})),this.state.cropSize&&b.createElement("div",{style:dt(dt({},y),{width:this.state.cropSize.width,height:this.state.cropSize.height}),tabIndex:0,onKeyDown:this.onKeyDown,"data-testid":"cropper",className:r_("reactEasyCrop_CropArea",p==="round"&&"reactEasyCrop_CropAreaRound",v&&"reactEasyCrop_CropAreaGrid",C)}))},t.defaultProps={zoom:1,rotation:0,aspect:4/3,maxZoom:GKe,minZoom:UKe,cropShape:"rect",objectFit:"contain",showGrid:!0,style:{},classes:{},mediaProps:{},zoomSpeed:1,restrictPosition:!0,zoomWithScroll:!0,keyboardStep:KKe},t.getMousePoint=function(n){return{x:Number(n.clientX),y:Number(n.clientY)}},t.getTouchPoint=function(n){return{x:Number(n.clientX),y:Number(n.clientY)}},t}(b.Component);const uu="img-crop",Z6=1,Yb=.1,i_=0,pie=-180,vie=180,Q6=1,Xb=.01,XKe=b.forwardRef((e,t)=>{const{cropperRef:n,zoomSlider:r,rotationSlider:i,aspectSlider:a,showReset:o,resetBtnText:s,modalImage:l,aspect:c,minZoom:u,maxZoom:f,minAspect:d,maxAspect:h,cropShape:p,showGrid:v,cropperProps:g}=e,[m,y]=b.useState(Z6),[x,S]=b.useState(i_),[w,C]=b.useState(c),E=m!==Z6||x!==i_||w!==c,O=()=>{y(Z6),S(i_),C(c)},[$,P]=b.useState({x:0,y:0}),M=b.useRef({width:0,height:0,x:0,y:0}),k=b.useCallback((N,L)=>{M.current=L},[]);b.useImperativeHandle(t,()=>({rotation:x,cropPixelsRef:M,onReset:O}));const T="[display:flex] [align-items:center] [width:60%] [margin-inline:auto]",R="[display:flex] [align-items:center] [justify-content:center] [height:32px] [width:32px] [background:transparent] [border:0] [font-family:inherit] [font-size:18px] [cursor:pointer] disabled:[opacity:20%] disabled:[cursor:default]",A="[flex:1]";return ve.jsxs(ve.Fragment,{children:[ve.jsx(YKe,Object.assign({},g,{ref:n,image:l,crop:$,zoom:m,rotation:x,aspect:w,minZoom:u,maxZoom:f,zoomWithScroll:r,cropShape:p,showGrid:v,onCropChange:P,onZoomChange:y,onRotationChange:S,onCropComplete:k,classes:{containerClassName:`${uu}-container ![position:relative] [width:100%] [height:40vh] [&~section:first-of-type]:[margin-top:16px] [&~section:last-of-type]:[margin-bottom:16px]`,mediaClassName:`${uu}-media`}})),r&&ve.jsxs("section",{className:`${uu}-control ${uu}-control-zoom ${T}`,children:[ve.jsx("button",{className:R,onClick:()=>y(+(m-Yb).toFixed(1)),disabled:m-Yb<u,children:"－"}),ve.jsx(g5,{className:A,min:u,max:f,step:Yb,value:m,onChange:y}),ve.jsx("button",{className:R,onClick:()=>y(+(m+Yb).toFixed(1)),disabled:m+Yb>f,children:"＋"})]}),i&&ve.jsxs("section",{className:`${uu}-control ${uu}-control-rotation ${T}`,children:[ve.jsx("button",{className:`${R} [font-size:16px]`,onClick:()=>S(x-Q6),disabled:x===pie,children:"↺"}),ve.jsx(g5,{className:A,min:pie,max:vie,step:Q6,value:x,onChange:S}),ve.jsx("button",{className:`${R} [font-size:16px]`,onClick:()=>S(x+Q6),disabled:x===vie,children:"↻"})]}),a&&ve.jsxs("section",{className:`${uu}-control ${uu}-control-aspect ${T}`,children:[ve.jsx("button",{className:R,onClick:()=>C(+(w-Xb).toFixed(2)),disabled:w-Xb<d,children:"↕"}),ve.jsx(g5,{className:A,min:d,max:h,step:Xb,value:w,onChange:C}),ve.jsx("button",{className:R,onClick:()=>C(+(w+Xb).toFixed(2)),disabled:w+Xb>h,children:"↔"})]}),o&&(r||i||a)&&ve.jsx(Hn,{className:"[bottom:20px] [position:absolute]",style:E?{}:{opacity:.3,pointerEvents:"none"},onClick:O,children:s})]})});var ZKe=b.memo(XKe);function QKe(e,t){t===void 0&&(t={});var n=t.insertAt;if(typeof document!="undefined"){var r=document.head||document.getElementsByTagName("head")[0],i=document.createElement("style");i.type="text/css",n==="top"&&r.firstChild?r.insertBefore(i,r.firstChild):r.appendChild(i),i.styleSheet?i.styleSheet.cssText=e:i.appendChild(document.createTextNode(e))}}var JKe=".\\[align-items\\:center\\]{align-items:center}.\\[background\\:transparent\\]{background:transparent}.\\[border\\:0\\]{border:0}.\\[bottom\\:20px\\]{bottom:20px}.\\[cursor\\:pointer\\]{cursor:pointer}.\\[display\\:flex\\]{display:flex}.\\[flex\\:1\\]{flex:1}.\\[font-family\\:inherit\\]{font-family:inherit}.\\[font-size\\:16px\\]{font-size:16px}.\\[font-size\\:18px\\]{font-size:18px}.\\[height\\:32px\\]{height:32px}.\\[height\\:40vh\\]{height:40vh}.\\[justify-content\\:center\\]{justify-content:center}.\\[margin-inline\\:auto\\]{margin-inline:auto}.\\[position\\:absolute\\]{position:absolute}.\\!\\[position\\:relative\\]{position:relative!important}.\\[width\\:100\\%\\]{width:100%}.\\[width\\:32px\\]{width:32px}.\\[width\\:60\\%\\]{width:60%}.disabled\\:\\[cursor\\:default\\]:disabled{cursor:default}.disabled\\:\\[opacity\\:20\\%\\]:disabled{opacity:20%}.\\[\\&\\~section\\:first-of-type\\]\\:\\[margin-top\\:16px\\]~section:first-of-type{margin-top:16px}.\\[\\&\\~section\\:last-of-type\\]\\:\\[margin-bottom\\:16px\\]~section:last-of-type{margin-bottom:16px}";QKe(JKe,{insertAt:"top"});const eYe=b.forwardRef((e,t)=>{const{quality:n=.4,fillColor:r="white",zoomSlider:i=!0,rotationSlider:a=!1,aspectSlider:o=!1,showReset:s=!1,resetText:l,aspect:c=1,minZoom:u=1,maxZoom:f=3,minAspect:d=.5,maxAspect:h=2,cropShape:p="rect",showGrid:v=!1,cropperProps:g,modalClassName:m,modalTitle:y,modalWidth:x,modalOk:S,modalCancel:w,onModalOk:C,onModalCancel:E,modalProps:O,beforeCrop:$,children:P}=e,M=b.useRef({});M.current.onModalOk=C,M.current.onModalCancel=E,M.current.beforeCrop=$;const k=b.useRef(null),T=b.useCallback(G=>{var K;const X=document.createElement("canvas"),Q=X.getContext("2d"),ne=(((K=G==null?void 0:G.getRootNode)===null||K===void 0?void 0:K.call(G))||document).querySelector(`.${uu}-media`),{width:te,height:ie,x:J,y:le}=k.current.cropPixelsRef.current;if(a&&k.current.rotation!==i_){const{naturalWidth:oe,naturalHeight:re}=ne,se=k.current.rotation*(Math.PI/180),ge=Math.abs(Math.sin(se)),de=Math.abs(Math.cos(se)),pe=oe*de+re*ge,fe=re*de+oe*ge;X.width=pe,X.height=fe,Q.fillStyle=r,Q.fillRect(0,0,pe,fe);const xe=pe/2,Oe=fe/2;Q.translate(xe,Oe),Q.rotate(se),Q.translate(-xe,-Oe);const _e=(pe-oe)/2,Te=(fe-re)/2;Q.drawImage(ne,0,0,oe,re,_e,Te,oe,re);const Fe=Q.getImageData(0,0,pe,fe);X.width=te,X.height=ie,Q.putImageData(Fe,-J,-le)}else X.width=te,X.height=ie,Q.fillStyle=r,Q.fillRect(0,0,te,ie),Q.drawImage(ne,J,le,te,ie,0,0,te,ie);return X},[r,a]),[R,A]=b.useState(""),N=b.useRef(),L=b.useRef(),j=b.useCallback(G=>ZO(void 0,[G],void 0,function*({beforeUpload:K,file:X,resolve:Q,reject:ee}){const ne=X;if(typeof K!="function"){Q(ne);return}try{const te=yield K(X,[X]);Q(te===!1?!1:te!==!0&&te||ne)}catch(te){ee(te)}}),[]),F=b.useCallback(G=>(K,X)=>new Promise((Q,ee)=>ZO(void 0,void 0,void 0,function*(){let ne=K;if(typeof M.current.beforeCrop=="function")try{const ie=yield M.current.beforeCrop(K,X);if(ie===!1)return j({beforeUpload:G,file:K,resolve:Q,reject:ee});ie!==!0&&(ne=ie||K)}catch(ie){return j({beforeUpload:G,file:K,resolve:Q,reject:ee})}const te=new FileReader;te.addEventListener("load",()=>{typeof te.result=="string"&&A(te.result)}),te.readAsDataURL(ne),N.current=()=>{var ie,J;A(""),k.current.onReset();let le=!1;(J=(ie=M.current).onModalCancel)===null||J===void 0||J.call(ie,oe=>{Q(oe),le=!0}),le||Q(pO.LIST_IGNORE)},L.current=ie=>ZO(void 0,void 0,void 0,function*(){A(""),k.current.onReset();const J=T(ie.target),{type:le,name:oe,uid:re}=ne;J.toBlob(se=>ZO(void 0,void 0,void 0,function*(){const ge=new File([se],oe,{type:le});Object.assign(ge,{uid:re}),j({beforeUpload:G,file:ge,resolve:de=>{var pe,fe;Q(de),(fe=(pe=M.current).onModalOk)===null||fe===void 0||fe.call(pe,de)},reject:de=>{var pe,fe;ee(de),(fe=(pe=M.current).onModalOk)===null||fe===void 0||fe.call(pe,de)}})}),le,n)})})),[T,n,j]),B=b.useCallback(G=>{const K=Array.isArray(G)?G[0]:G,X=K.props,{beforeUpload:Q,accept:ee}=X,ne=Wa(X,["beforeUpload","accept"]);return Object.assign(Object.assign({},K),{props:Object.assign(Object.assign({},ne),{accept:ee||"image/*",beforeUpload:F(Q)})})},[F]),D=b.useMemo(()=>{const G={};return x!==void 0&&(G.width=x),S!==void 0&&(G.okText=S),w!==void 0&&(G.cancelText=w),G},[w,S,x]),z=`${uu}-modal${m?` ${m}`:""}`,q=(typeof window=="undefined"?"":window.navigator.language)==="zh-CN",H=y||(q?"编辑图片":"Edit image"),U=l||(q?"重置":"Reset");return ve.jsxs(ve.Fragment,{children:[B(P),R&&ve.jsx(Ha,Object.assign({},O,D,{open:!0,title:H,onCancel:N.current,onOk:L.current,wrapClassName:z,maskClosable:!1,destroyOnClose:!0,children:ve.jsx(ZKe,{ref:k,cropperRef:t,zoomSlider:i,rotationSlider:a,aspectSlider:o,showReset:s,resetBtnText:U,modalImage:R,aspect:c,minZoom:u,maxZoom:f,minAspect:d,maxAspect:h,cropShape:p,showGrid:v,cropperProps:g})}))]})});var tYe=e=>new Promise((t,n)=>{const r=new FileReader;r.readAsDataURL(e),r.onload=()=>t(r.result),r.onerror=i=>n(i)}),nYe=e=>la(this,null,function*(){const n=yield(yield fetch(e)).blob();return new Promise((r,i)=>{const a=new FileReader;a.readAsDataURL(n),a.onloadend=()=>{const o=a.result;r(o)},a.onerror=o=>i(o)})}),rYe=e=>la(this,null,function*(){return e.split(",")[0].match(/:(.*?);/)[1]}),iYe={fromFile:tYe,fromURL:nYe,mimeType:rYe};const gie=rn(iYe),aYe=a=>{var o=a,{parentId:e,value:t,onChange:n,multiple:r}=o,i=oc(o,["parentId","value","onChange","multiple"]);const{t:s}=io("UploadInput"),[l,c]=b.useState(),{configuration:u}=b.useContext(Mc),f=m=>la(this,null,function*(){const y=r?m.fileList:m.fileList.slice(-1),x=[];for(const S of y)if(S.originFileObj){const w=yield gie.fromFile(S.originFileObj);x.push(w)}else x.push(S.url);r?n&&n(x):n&&n(x[0])}),d=b.useMemo(()=>t?(Am(t)?t:[t]).map((y,x)=>({uid:x,status:"done",url:y})):void 0,[t]),h=m=>la(this,null,function*(){c(m.url?m.url:yield gie.fromFile(m.originFileObj))}),p=()=>c(void 0),v=()=>!1,g=({withCrop:m,children:y})=>m?ve.jsx(eYe,{rotationSlider:!0,children:y}):ve.jsx(ve.Fragment,{children:y});return ve.jsxs(ve.Fragment,{children:[ve.jsx(g,{withCrop:!(u!=null&&u.disable_crop_image),children:ve.jsx(pO,Rn(Ke({listType:"picture-card",withCredentials:!0,beforeUpload:v,onChange:f,defaultFileList:d,multiple:r,onPreview:h},i),{children:ve.jsxs(va,{children:[ve.jsx(QDe,{}),s("Upload")]})}))}),ve.jsx(Ha,{footer:null,title:s("Preview Image"),open:!!l,onCancel:p,children:ve.jsx(HE,{preview:!1,src:l})})]})},J6=(e,t,n)=>{switch(e){case Hr.Input:return[oi,{}];case Hr.InputNumber:return[s5,{style:{width:"100%"}}];case Hr.EmailInput:return[oi,{}];case Hr.PhoneInput:return[JUe,{}];case Hr.SlugInput:return[eGe,{}];case Hr.UrlInput:return[oi,{}];case Hr.PasswordInput:return[YUe,{parentId:n}];case Hr.TextArea:return[oi.TextArea,{}];case Hr.RichTextArea:return[EKe,{}];case Hr.JsonTextArea:return[KUe,{}];case Hr.Select:return[no,{style:{width:"100%"}}];case Hr.AsyncSelect:return[qUe,{style:{width:"100%"}}];case Hr.AsyncTransfer:return[UUe,{}];case Hr.Switch:return[ZQ,{}];case Hr.Checkbox:return[Ol,{}];case Hr.CheckboxGroup:return[Ol.Group,{}];case Hr.RadioGroup:return[Dd.Group,{}];case Hr.DatePicker:return[df,{style:{width:"100%"}}];case Hr.TimePicker:return[Pb,{style:{width:"100%"}}];case Hr.DateTimePicker:return[df,{style:{width:"100%"},showTime:!0}];case Hr.RangePicker:return[df.RangePicker,{style:{width:"100%"},placeholder:[t("Start"),t("End")]}];case Hr.Upload:return[aYe,{parentId:n}];default:return[oi,{}]}},oYe=({widgetType:e,widgetProps:t,value:n,onFilter:r,onReset:i})=>{const{t:a}=io("List"),[o,s]=b.useState(),[l,c]=J6(e,a);b.useEffect(()=>{s(n)},[n]);const u=()=>{r(o)},f=d=>{switch(l){case oi:case oi.TextArea:case Dd.Group:s(d.target.value);break;default:s(d);break}};return ve.jsxs(Ri,{style:{width:400},children:[ve.jsx(vr,{xs:24,style:{padding:10},children:ve.jsx(l,Ke(Ke({value:o,size:"middle",onChange:f,placeholder:a("Filter By")},c||{}),t||{}))}),ve.jsx(vr,{xs:24,style:{padding:10},children:ve.jsxs(va,{align:"end",children:[ve.jsx(Hn,{onClick:i,size:"small",children:a("Reset")}),ve.jsx(Hn,{type:"primary",onClick:u,icon:l===oi?ve.jsx(nm,{}):ve.jsx(KQ,{}),size:"small",children:a("Filter")})]})})]})},mie=(e,t,n,r,i,a,o)=>{const{t:s}=io("List"),l=(e||{fields:[]}).fields;return b.useMemo(()=>{const c=l.filter(u=>!!u.list_configuration).sort((u,f)=>{var d,h;return(((d=u.list_configuration)==null?void 0:d.index)||0)-(((h=f.list_configuration)==null?void 0:h.index)||0)}).map(u=>{var f,d,h,p;return{title:LO(u.name),dataIndex:u.name,key:u.name,sorter:(f=u.list_configuration)==null?void 0:f.sorter,width:(d=u.list_configuration)==null?void 0:d.width,ellipsis:!0,filterIcon:(h=u.list_configuration)!=null&&h.filter_widget_type?n(u.name)?ve.jsx(ro,{title:s("Click to reset this filter"),children:ve.jsx(GQ,{style:{color:"red"}})}):ve.jsx(ro,{title:s("Click to filter"),children:ve.jsx(KQ,{})}):void 0,filterDropdown:(p=u.list_configuration)!=null&&p.filter_widget_type?({confirm:v,clearFilters:g})=>{var x,S;const m=()=>{i(u.name),g(),v()},y=w=>{r(u.name,w),v()};return ve.jsx(oYe,{widgetType:(x=u.list_configuration)==null?void 0:x.filter_widget_type,widgetProps:(S=u.list_configuration)==null?void 0:S.filter_widget_props,value:n(u.name),onFilter:y,onReset:m})}:void 0,render:(v,g)=>{var y,x,S;if(v===void 0)return(y=u.list_configuration)==null?void 0:y.empty_value_display;const m=OUe(v,(x=u.list_configuration)==null?void 0:x.empty_value_display,t);if((S=u==null?void 0:u.list_configuration)!=null&&S.is_link){const w=()=>o(g);return ve.jsx(Hn,{style:{padding:0},type:"link",onClick:w,children:m})}return BO(m)&&(m.startsWith("http")||m.startsWith("/"))?ve.jsx("a",{href:m,target:"_blank",rel:"noreferrer",children:m}):m}}});return c.push({title:s("Actions"),key:"actions",width:100,fixed:"right",render:u=>{const f=()=>a(u),d=()=>o(u);return ve.jsxs(va,{children:[((e==null?void 0:e.permissions)||[]).includes(Ss.Delete)&&ve.jsx(P5,{title:s("Are you sure?"),onConfirm:f,children:ve.jsx(Hn,{size:"small",danger:!0,children:ve.jsx(XE,{})})}),((e==null?void 0:e.permissions)||[]).includes(Ss.Change)&&ve.jsx(Hn,{size:"small",onClick:d,children:ve.jsx(ZE,{})})]})}}),c},[s,t,l,n,e==null?void 0:e.permissions,r,o,a,i])},Zb=1,e8=10,yie=e=>{const[t,n]=b.useState(),[r,i]=b.useState([]),[a,o]=b.useState({}),[s,l]=b.useState(),[c,u]=b.useState(Zb),[f,d]=b.useState(e8),[h,p]=b.useState();return b.useEffect(()=>{e!=null&&e.list_per_page&&d(e==null?void 0:e.list_per_page)},[e==null?void 0:e.list_per_page]),b.useEffect(()=>{e!=null&&e.name&&(u(Zb),p(void 0),o({}))},[e==null?void 0:e.name]),{defaultPage:Zb,defaultPageSize:e8,page:c,setPage:u,pageSize:f,setPageSize:d,search:s,setSearch:l,filters:a,setFilters:o,sortBy:h,setSortBy:p,action:t,setAction:n,selectedRowKeys:r,setSelectedRowKeys:i,onTableChange:(m,y,x)=>{m.pageSize!==f?u(Zb):u(m.current),d(m.pageSize),x.field&&p(x.order==="ascend"?x.field:`-${x.field}`)},resetTable:m=>{n(void 0),i([]),u(Zb),d(e8),p(void 0),m||(o({}),l(void 0))}}},KBk=new Intl.NumberFormat("en",{notation:"compact",maximumFractionDigits:1}),YBk=e=>`~${KBk.format(e)}`,XBk=e=>({total:e==null?void 0:e.total,showTotal:e!=null&&e.total_is_estimate?YBk:void 0}),sYe=({modelConfiguration:e,parentId:t})=>{const{t:n}=io("Inline"),[r]=Ir.useForm(),[i]=Ir.useForm(),{configuration:a}=b.useContext(Mc),[o,s]=b.useState(!1),[l,c]=b.useState(!1),[u,f]=b.useState(),{defaultPage:d,defaultPageSize:h,page:p,setPage:v,pageSize:g,setPageSize:m,search:y,setSearch:x,filters:S,setFilters:w,sortBy:C,action:E,setAction:O,selectedRowKeys:$,setSelectedRowKeys:P,resetTable:M,onTableChange:k}=yie(e),T=e.name,R=b.useCallback(()=>{s(!0)},[]),A=b.useCallback(()=>{M(),s(!1)},[M]),N=b.useCallback(()=>{r.resetFields(),c(!0),f(void 0),r.setFieldValue(e.fk_name,t)},[r,t,e.fk_name]),L=b.useCallback(()=>{c(!1),f(void 0)},[]),j=b.useCallback(fe=>{i.resetFields(),f(fe==null?void 0:fe.id),c(!1)},[i]),F=b.useCallback(()=>{f(void 0),c(!1)},[]),B=Im.stringify(Ke({search:y,sort_by:C,offset:(p-1)*g,limit:g,[e.fk_name]:t},nN(S))),{data:D,isLoading:z,refetch:W}=Kc({queryKey:[`/list/${T}`,B],queryFn:()=>lu(`/list/${T}?${B}`),enabled:o,refetchOnWindowFocus:!1}),{data:q,isLoading:H}=Kc({queryKey:[`/retrieve/${T}/${u}`],queryFn:()=>lu(`/retrieve/${T}/${u}`),enabled:!!u,refetchOnWindowFocus:!1}),{mutate:U,isPending:G,isError:K}=Oo({mutationFn:fe=>gf(`/add/${T}`,fe),onSuccess:()=>{na.success(n("Succesfully added")),W(),L()},onError:fe=>{kc(fe,r)}}),{mutate:X,isPending:Q,isError:ee}=Oo({mutationFn:fe=>NO(`/change/${T}/${u}`,fe),onSuccess:()=>{na.success(n("Succesfully changed")),W(),F()},onError:fe=>{kc(fe,i)}}),{mutate:ne}=Oo({mutationFn:fe=>XA(`/delete/${T}/${fe}`),onSuccess:()=>{M(e==null?void 0:e.preserve_filters),W(),na.success(n("Successfully deleted"))},onError:fe=>{kc(fe)}}),{mutate:te,isPending:ie}=Oo({mutationFn:fe=>gf(`/action/${T}/${E}`,fe),onSuccess:()=>{M(e==null?void 0:e.preserve_filters),W(),na.success(n("Successfully applied"))},onError:()=>{na.error(n("Server error"))}}),J=fe=>P(fe),le=b.useCallback(()=>te({ids:$}),[te,$]),oe=a==null?void 0:a.datetime_format,re=mie(e,oe,b.useCallback(fe=>S[fe],[S]),b.useCallback((fe,xe)=>{S[fe]=xe,w(Ke({},S)),v(d),m(h)},[d,h,S,w,v,m]),b.useCallback(fe=>{delete S[fe],w(Ke({},S)),v(d),m(h)},[d,h,S,w,v,m]),b.useCallback(fe=>{ne(fe.id)},[ne]),b.useCallback(fe=>{j(fe)},[j])),se=fe=>{U(fe)},ge=fe=>{X(fe)},de=b.useCallback(()=>{var fe,xe;return ve.jsxs(Ri,{justify:"end",gutter:[8,8],children:[((e==null?void 0:e.actions)||[]).length>0&&(e==null?void 0:e.actions_on_top)&&ve.jsxs(vr,{children:[ve.jsx(no,{placeholder:n("Select Action By"),allowClear:!0,value:E,onChange:O,style:{width:300},children:((e==null?void 0:e.actions)||[]).map(Oe=>ve.jsx(no.Option,{value:Oe.name,children:Oe.description||Oe.name},Oe.name))}),ve.jsx(Hn,{disabled:!E||$.length===0,style:{marginLeft:5},loading:ie,onClick:le,children:n("Apply")})]}),((e==null?void 0:e.search_fields)||[]).length>0&&ve.jsx(vr,{children:ve.jsx(oi.Search,{placeholder:(e==null?void 0:e.search_help_text)||n("Search By"),allowClear:!0,onSearch:x,style:{width:200}})}),((fe=e==null?void 0:e.permissions)==null?void 0:fe.includes(Ss.Export))&&ve.jsx(vr,{children:ve.jsx(tne,{model:T,search:y,filters:Rn(Ke({},S),{[e.fk_name]:t}),sortBy:C})}),((xe=e==null?void 0:e.permissions)==null?void 0:xe.includes(Ss.Add))&&ve.jsx(vr,{children:ve.jsxs(Hn,{onClick:N,style:{marginRight:-10},children:[ve.jsx(T5,{})," ",n("Add")]})})]})},[e==null?void 0:e.actions,e==null?void 0:e.actions_on_top,e==null?void 0:e.search_fields,e==null?void 0:e.search_help_text,e==null?void 0:e.permissions,e.fk_name,n,E,O,$.length,ie,le,x,T,y,S,t,C,N]),pe=b.useCallback(()=>{var fe;return ve.jsx(ve.Fragment,{children:((fe=e==null?void 0:e.permissions)==null?void 0:fe.includes(Ss.Add))&&ve.jsx(Ri,{justify:"space-between",children:ve.jsx(vr,{children:((e==null?void 0:e.actions)||[]).length>0&&(e==null?void 0:e.actions_on_bottom)&&ve.jsxs("div",{style:{marginLeft:-8},children:[ve.jsx(no,{placeholder:n("Select Action By"),allowClear:!0,value:E,onChange:O,style:{width:200},children:((e==null?void 0:e.actions)||[]).map(xe=>ve.jsx(no.Option,{value:xe.name,children:xe.description||xe.name},xe.name))}),ve.jsx(Hn,{disabled:!E||$.length===0,style:{marginLeft:5},loading:ie,onClick:le,children:n("Apply")})]})})})})},[n,E,ie,e==null?void 0:e.actions,e==null?void 0:e.actions_on_bottom,e==null?void 0:e.permissions,le,$.length,O]);return ve.jsxs("div",{children:[ve.jsx(Hn,{style:{minWidth:200},type:"dashed",onClick:R,children:n("Change")}),ve.jsx(Ha,{width:"100%",open:o,title:ts(e,!0),onCancel:A,footer:null,children:ve.jsx(Ri,{children:ve.jsx(vr,{xs:24,children:ve.jsx(nne,{title:de,footer:pe,loading:z,sticky:!0,rowSelection:((e==null?void 0:e.actions)||[]).length>0?{selectedRowKeys:$,onChange:J}:void 0,columns:re,onChange:k,rowKey:"id",dataSource:(D==null?void 0:D.results)||[],pagination:Rn(Ke({current:p,pageSize:g},XBk(D)),{showSizeChanger:!0}),scroll:{x:1e3}})})})}),ve.jsxs(Ha,{width:600,open:l,title:`Add ${ts(e)}`,onCancel:L,footer:null,children:[ve.jsx(iu,{}),e!=null&&e.permissions.includes(Ss.Add)?ve.jsx(Dm,{modelConfiguration:e,form:r,onFinish:se,mode:"inline-add",hasOperationError:K,children:ve.jsx(Ri,{justify:"end",children:ve.jsx(vr,{children:ve.jsx(va,{children:ve.jsxs(Hn,{loading:G,htmlType:"submit",type:"primary",children:[ve.jsx(ym,{})," ",n("Add")]})})})})}):ve.jsx(Ba,{description:n("No permissions for model")})]}),ve.jsxs(Ha,{width:600,open:!!u,title:`Change ${ts(e)} ${u}`,onCancel:F,footer:null,children:[ve.jsx(iu,{}),q&&e&&e.permissions.includes(Ss.Change)?ve.jsx(Dm,{modelConfiguration:e,form:i,onFinish:ge,mode:"inline-change",hasOperationError:ee,initialValues:rN(q),children:ve.jsx(Ri,{justify:"end",children:ve.jsx(vr,{children:ve.jsx(va,{children:ve.jsxs(Hn,{loading:Q||H,htmlType:"submit",type:"primary",children:[ve.jsx(ym,{})," ",n("Save")]})})})})}):ve.jsx(Ba,{description:n("No permissions for model")})]})]})},Dm=({modelConfiguration:e,id:t,form:n,onFinish:r,children:i,mode:a,hasOperationError:o,initialValues:s})=>{const{t:l}=io("FormContainer"),[c,u]=b.useState(((e==null?void 0:e.fieldsets)||[]).filter(g=>{var m;return!(((m=g[1])==null?void 0:m.classes)||[]).includes("collapse")}).map(g=>{var m;return JSON.stringify((m=g[1])==null?void 0:m.fields)}));b.useEffect(()=>{o&&u(((e==null?void 0:e.fieldsets)||[]).map(g=>{var m;return JSON.stringify((m=g[1])==null?void 0:m.fields)}))},[o,e==null?void 0:e.fieldsets]),b.useEffect(()=>{n.setFieldsValue(s)},[n,s]);const f=b.useCallback(g=>{if(!g.form_widget_type)return null;const[m,y]=J6(g.form_widget_type,l,t);return ve.jsx(m,Ke(Ke({},y||{}),g.form_widget_props||{}))},[l,t]),d=b.useCallback(g=>a==="change"||a==="inline-change"?(g==null?void 0:g.change_configuration)||{}:(g==null?void 0:g.add_configuration)||{},[a]),h=b.useCallback(g=>g.map(m=>ve.jsx(Ir.Item,{name:m.name,label:LO(m.name),rules:[...d(m).required?[{required:!0}]:[],...d(m).form_widget_type===Hr.EmailInput?[{type:"email"}]:[],...d(m).form_widget_type===Hr.UrlInput?[{type:"url"}]:[],...d(m).form_widget_type===Hr.JsonTextArea?[{validator:(y,x)=>la(this,null,function*(){if(!CUe(x))throw new Error(l("Invalid JSON"))})}]:[],...d(m).form_widget_type===Hr.SlugInput?[{validator:(y,x)=>la(this,null,function*(){if(!EUe(x))throw new Error(l("Invalid Slug. Please use lowercase letters, numbers, and hyphens."))})}]:[]],valuePropName:[Hr.Checkbox,Hr.Switch,Hr.CheckboxGroup].includes(d(m).form_widget_type)?"checked":void 0,children:f(d(m))},m.name)),[l,d,f]),p=b.useCallback(()=>{const g=((e==null?void 0:e.fields)||[]).filter(y=>!!d(y).form_widget_type).filter(y=>{var x,S,w,C;return a==="add"||a==="inline-add"?!((S=(x=y.add_configuration)==null?void 0:x.form_widget_props)!=null&&S.disabled)&&!((C=(w=y.add_configuration)==null?void 0:w.form_widget_props)!=null&&C.readOnly):!0}),m=(e==null?void 0:e.fieldsets)||[];if(m.length>0){const y=x=>u(x);return ve.jsx(l3e,{size:"small",expandIconPosition:"end",activeKey:c,onChange:y,items:m.map(x=>{var C;const S=x[0],w=(C=x[1])==null?void 0:C.fields;return{key:JSON.stringify(w),label:S||l("General"),children:h(g.filter(E=>(w||[]).includes(E.name)).sort((E,O)=>w.indexOf(E.name)-w.indexOf(O.name)))}})})}return h(g.sort((y,x)=>(d(y).index||0)-(d(x).index||0)))},[l,c,h,d,e==null?void 0:e.fields,e==null?void 0:e.fieldsets,a]),v=b.useCallback(()=>t?((e==null?void 0:e.inlines)||[]).map(g=>ve.jsx(Ir.Item,{label:ts(g,!0),children:ve.jsx(sYe,{modelConfiguration:g,parentId:t})},g.name)):null,[e==null?void 0:e.inlines,t]);return ve.jsxs(Ir,{initialValues:s,layout:"vertical",form:n,onFinish:r,children:[(e==null?void 0:e.save_on_top)&&ve.jsxs(ve.Fragment,{children:[i,ve.jsx(iu,{})]}),ve.jsxs(Ri,{gutter:[32,32],children:[ve.jsx(vr,{xs:24,xl:a==="inline-add"||a==="inline-change"?24:12,children:p()}),a==="change"&&ve.jsx(vr,{xs:24,xl:12,children:v()})]}),ve.jsx(iu,{}),i]})},lYe=()=>{const[e]=Ir.useForm(),t=$S(),n=Mm(),{configuration:r}=b.useContext(Mc),{t:i}=io("Add"),{model:a}=SO(),o=HO(r,a),{mutate:s,isPending:l,isError:c}=Oo({mutationFn:f=>gf(`/add/${a}`,f),onSuccess:()=>{na.success(i("Succesfully added")),t.invalidateQueries([`/list/${a}`]),n(`/list/${a}`)},onError:f=>{kc(f,e)}}),u=f=>{const d=zO(f);s(d)};return ve.jsx(DO,{title:`${i("Add")} ${o&&ts(o)}`,breadcrumbs:ve.jsx(ob,{items:[{title:ve.jsx(Gd,{to:"/",children:i("Dashboard")})},{title:ve.jsx(Gd,{to:`/list/${a}`,children:o&&ts(o)})},{title:i("Add")}]}),children:o!=null&&o.permissions.includes(Ss.Add)?ve.jsx(Dm,{modelConfiguration:o,form:e,onFinish:u,mode:"add",hasOperationError:c,children:ve.jsx(Ri,{justify:"end",children:ve.jsx(vr,{children:ve.jsx(va,{children:ve.jsxs(Hn,{loading:l,htmlType:"submit",type:"primary",children:[ve.jsx(ym,{})," ",i("Add")]})})})})}):ve.jsx(Ba,{description:i("No permissions for model")})})},cYe=()=>{const[e]=Ir.useForm(),t=zb(),n=$S(),r=Mm(),{configuration:i}=b.useContext(Mc),{t:a}=io("Change"),{model:o,id:s}=SO(),l=HO(i,o),{data:c,isLoading:u}=Kc({queryKey:[`/retrieve/${o}/${s}`],queryFn:()=>lu(`/retrieve/${o}/${s}`),refetchOnWindowFocus:!1}),{mutate:f,isPending:d,isError:h}=Oo({mutationFn:E=>gf(`/add/${o}`,E),onSuccess:()=>{na.success(a("Succesfully added")),n.invalidateQueries([`/list/${o}`]);const E=e.getFieldValue("next");E&&r(E)},onError:E=>{kc(E,e)}}),{mutate:p,isPending:v,isError:g}=Oo({mutationFn:E=>NO(`/change/${o}/${s}`,E),onSuccess:()=>{na.success(a("Succesfully changed")),n.invalidateQueries([`/retrieve/${o}/${s}`]),n.invalidateQueries([`/list/${o}`]);const E=e.getFieldValue("next");E&&r(E)},onError:E=>{kc(E,e)}}),{mutate:m}=Oo({mutationFn:()=>XA(`/delete/${o}/${s}`),onSuccess:()=>{na.success(a("Successfully deleted")),n.invalidateQueries([`/list/${o}`]),r(`/list/${o}`)},onError:()=>{na.error(a("Server error"))}}),y=E=>{if(e.getFieldValue("save_as_new")){f(zO(E));return}p(zO(E))},x=()=>m(),S=()=>{e.submit()},w=()=>{e.setFieldValue("next",`/add/${o}`),l!=null&&l.save_as&&e.setFieldValue("save_as_new",!0),e.submit()},C=()=>{l!=null&&l.save_as_continue||e.setFieldValue("next",`/list/${o}`),e.submit()};return ve.jsx(DO,{title:`${a("Change")} ${l&&ts(l)} ${s}`,breadcrumbs:ve.jsx(ob,{items:[{title:ve.jsx(Gd,{to:"/",children:a("Dashboard")})},{title:ve.jsx(Gd,{to:`/list/${o}`,children:l&&ts(l)})},{title:s}]}),isLoading:u,children:c&&l&&l.permissions.includes(Ss.Change)?ve.jsx(Dm,{modelConfiguration:l,id:s,form:e,onFinish:y,mode:"change",hasOperationError:g||h,initialValues:rN(c),children:ve.jsxs(Ri,{gutter:[8,8],justify:"space-between",children:[ve.jsx(vr,{children:ve.jsx(va,{children:ve.jsx(P5,{title:a("Are you sure?"),onConfirm:x,children:ve.jsxs(Hn,{danger:!0,children:[ve.jsx(XE,{})," ",a("Delete")]})})})}),ve.jsx(vr,{children:ve.jsxs(va,{children:[!t&&!(l!=null&&l.save_as_continue)&&ve.jsxs(Hn,{loading:v||d,onClick:S,type:"default",children:[ve.jsx(YQ,{})," ",a("Save and continue editing")]}),!t&&ve.jsxs(Hn,{loading:v||d,onClick:w,type:"default",children:[ve.jsx(YQ,{})," ",l!=null&&l.save_as?a("Save as new"):a("Save and add another")]}),ve.jsxs(Hn,{loading:v||d,onClick:C,type:"primary",children:[ve.jsx(ym,{})," ",a("Save")]})]})})]})}):ve.jsx(Ba,{description:a("No permissions for model")})})};var bie={exports:{}};(function(e){var t=Object.prototype.hasOwnProperty,n="~";function r(){}Object.create&&(r.prototype=Object.create(null),new r().__proto__||(n=!1));function i(l,c,u){this.fn=l,this.context=c,this.once=u||!1}function a(l,c,u,f,d){if(typeof u!="function")throw new TypeError("The listener must be a function");var h=new i(u,f||l,d),p=n?n+c:c;return l._events[p]?l._events[p].fn?l._events[p]=[l._events[p],h]:l._events[p].push(h):(l._events[p]=h,l._eventsCount++),l}function o(l,c){--l._eventsCount===0?l._events=new r:delete l._events[c]}function s(){this._events=new r,this._eventsCount=0}s.prototype.eventNames=function(){var c=[],u,f;if(this._eventsCount===0)return c;for(f in u=this._events)t.call(u,f)&&c.push(n?f.slice(1):f);return Object.getOwnPropertySymbols?c.concat(Object.getOwnPropertySymbols(u)):c},s.prototype.listeners=function(c){var u=n?n+c:c,f=this._events[u];if(!f)return[];if(f.fn)return[f.fn];for(var d=0,h=f.length,p=new Array(h);d<h;d++)p[d]=f[d].fn;return p},s.prototype.listenerCount=function(c){var u=n?n+c:c,f=this._events[u];return f?f.fn?1:f.length:0},s.prototype.emit=function(c,u,f,d,h,p){var v=n?n+c:c;if(!this._events[v])return!1;var g=this._events[v],m=arguments.length,y,x;if(g.fn){switch(g.once&&this.removeListener(c,g.fn,void 0,!0),m){case 1:return g.fn.call(g.context),!0;case 2:return g.fn.call(g.context,u),!0;case 3:return g.fn.call(g.context,u,f),!0;case 4:return g.fn.call(g.context,u,f,d),!0;case 5:return g.fn.call(g.context,u,f,d,h),!0;case 6:return g.fn.call(g.context,u,f,d,h,p),!0}for(x=1,y=new Array(m-1);x<m;x++)y[x-1]=arguments[x];g.fn.apply(g.context,y)}else{var S=g.length,w;for(x=0;x<S;x++)switch(g[x].once&&this.removeListener(c,g[x].fn,void 0,!0),m){case 1:g[x].fn.call(g[x].context);break;case 2:g[x].fn.call(g[x].context,u);break;case 3:g[x].fn.call(g[x].context,u,f);break;case 4:g[x].fn.call(g[x].context,u,f,d);break;default:if(!y)for(w=1,y=new Array(m-1);w<m;w++)y[w-1]=arguments[w];g[x].fn.apply(g[x].context,y)}}return!0},s.prototype.on=function(c,u,f){return a(this,c,u,f,!1)},s.prototype.once=function(c,u,f){return a(this,c,u,f,!0)},s.prototype.removeListener=function(c,u,f,d){var h=n?n+c:c;if(!this._events[h])return this;if(!u)return o(this,h),this;var p=this._events[h];if(p.fn)p.fn===u&&(!d||p.once)&&(!f||p.context===f)&&o(this,h);else{for(var v=0,g=[],m=p.length;v<m;v++)(p[v].fn!==u||d&&!p[v].once||f&&p[v].context!==f)&&g.push(p[v]);g.length?this._events[h]=g.length===1?g[0]:g:o(this,h)}return this},s.prototype.removeAllListeners=function(c){var u;return c?(u=n?n+c:c,this._events[u]&&o(this,u)):(this._events=new r,this._eventsCount=0),this},s.prototype.off=s.prototype.removeListener,s.prototype.addListener=s.prototype.on,s.prefixed=n,s.EventEmitter=s,e.exports=s})(bie);var uYe=bie.exports;const xie=rn(uYe);var _i=1e-6,ga=typeof Float32Array!="undefined"?Float32Array:Array;Math.hypot||(Math.hypot=function(){for(var e=0,t=arguments.length;t--;)e+=arguments[t]*arguments[t];return Math.sqrt(e)});function Fm(){var e=new ga(9);return ga!=Float32Array&&(e[1]=0,e[2]=0,e[3]=0,e[5]=0,e[6]=0,e[7]=0),e[0]=1,e[4]=1,e[8]=1,e}function fYe(e,t){return e[0]=t[0],e[1]=t[1],e[2]=t[2],e[3]=t[4],e[4]=t[5],e[5]=t[6],e[6]=t[8],e[7]=t[9],e[8]=t[10],e}function dYe(e){var t=new ga(9);return t[0]=e[0],t[1]=e[1],t[2]=e[2],t[3]=e[3],t[4]=e[4],t[5]=e[5],t[6]=e[6],t[7]=e[7],t[8]=e[8],t}function hYe(e,t,n,r,i,a,o,s,l){var c=new ga(9);return c[0]=e,c[1]=t,c[2]=n,c[3]=r,c[4]=i,c[5]=a,c[6]=o,c[7]=s,c[8]=l,c}function pYe(e,t){var n=t[0],r=t[1],i=t[2],a=t[3],o=t[4],s=t[5],l=t[6],c=t[7],u=t[8],f=u*o-s*c,d=-u*a+s*l,h=c*a-o*l,p=n*f+r*d+i*h;return p?(p=1/p,e[0]=f*p,e[1]=(-u*r+i*c)*p,e[2]=(s*r-i*o)*p,e[3]=d*p,e[4]=(u*n-i*l)*p,e[5]=(-s*n+i*a)*p,e[6]=h*p,e[7]=(-c*n+r*l)*p,e[8]=(o*n-r*a)*p,e):null}function vYe(e,t,n){var r=t[0],i=t[1],a=t[2],o=t[3],s=t[4],l=t[5],c=t[6],u=t[7],f=t[8],d=n[0],h=n[1],p=n[2],v=n[3],g=n[4],m=n[5],y=n[6],x=n[7],S=n[8];return e[0]=d*r+h*o+p*c,e[1]=d*i+h*s+p*u,e[2]=d*a+h*l+p*f,e[3]=v*r+g*o+m*c,e[4]=v*i+g*s+m*u,e[5]=v*a+g*l+m*f,e[6]=y*r+x*o+S*c,e[7]=y*i+x*s+S*u,e[8]=y*a+x*l+S*f,e}function gYe(e,t){return e[0]=1,e[1]=0,e[2]=0,e[3]=0,e[4]=1,e[5]=0,e[6]=t[0],e[7]=t[1],e[8]=1,e}function mYe(e,t){var n=Math.sin(t),r=Math.cos(t);return e[0]=r,e[1]=n,e[2]=0,e[3]=-n,e[4]=r,e[5]=0,e[6]=0,e[7]=0,e[8]=1,e}function yYe(e,t){return e[0]=t[0],e[1]=0,e[2]=0,e[3]=0,e[4]=t[1],e[5]=0,e[6]=0,e[7]=0,e[8]=1,e}var bYe=vYe;function Wr(){var e=new ga(16);return ga!=Float32Array&&(e[1]=0,e[2]=0,e[3]=0,e[4]=0,e[6]=0,e[7]=0,e[8]=0,e[9]=0,e[11]=0,e[12]=0,e[13]=0,e[14]=0),e[0]=1,e[5]=1,e[10]=1,e[15]=1,e}function t8(e){var t=new ga(16);return t[0]=e[0],t[1]=e[1],t[2]=e[2],t[3]=e[3],t[4]=e[4],t[5]=e[5],t[6]=e[6],t[7]=e[7],t[8]=e[8],t[9]=e[9],t[10]=e[10],t[11]=e[11],t[12]=e[12],t[13]=e[13],t[14]=e[14],t[15]=e[15],t}function Bm(e,t){return e[0]=t[0],e[1]=t[1],e[2]=t[2],e[3]=t[3],e[4]=t[4],e[5]=t[5],e[6]=t[6],e[7]=t[7],e[8]=t[8],e[9]=t[9],e[10]=t[10],e[11]=t[11],e[12]=t[12],e[13]=t[13],e[14]=t[14],e[15]=t[15],e}function Sie(e,t,n,r,i,a,o,s,l,c,u,f,d,h,p,v){var g=new ga(16);return g[0]=e,g[1]=t,g[2]=n,g[3]=r,g[4]=i,g[5]=a,g[6]=o,g[7]=s,g[8]=l,g[9]=c,g[10]=u,g[11]=f,g[12]=d,g[13]=h,g[14]=p,g[15]=v,g}function n8(e,t,n,r,i,a,o,s,l,c,u,f,d,h,p,v,g){return e[0]=t,e[1]=n,e[2]=r,e[3]=i,e[4]=a,e[5]=o,e[6]=s,e[7]=l,e[8]=c,e[9]=u,e[10]=f,e[11]=d,e[12]=h,e[13]=p,e[14]=v,e[15]=g,e}function Kd(e){return e[0]=1,e[1]=0,e[2]=0,e[3]=0,e[4]=0,e[5]=1,e[6]=0,e[7]=0,e[8]=0,e[9]=0,e[10]=1,e[11]=0,e[12]=0,e[13]=0,e[14]=0,e[15]=1,e}function wie(e,t){if(e===t){var n=t[1],r=t[2],i=t[3],a=t[6],o=t[7],s=t[11];e[1]=t[4],e[2]=t[8],e[3]=t[12],e[4]=n,e[6]=t[9],e[7]=t[13],e[8]=r,e[9]=a,e[11]=t[14],e[12]=i,e[13]=o,e[14]=s}else e[0]=t[0],e[1]=t[4],e[2]=t[8],e[3]=t[12],e[4]=t[1],e[5]=t[5],e[6]=t[9],e[7]=t[13],e[8]=t[2],e[9]=t[6],e[10]=t[10],e[11]=t[14],e[12]=t[3],e[13]=t[7],e[14]=t[11],e[15]=t[15];return e}function Tc(e,t){var n=t[0],r=t[1],i=t[2],a=t[3],o=t[4],s=t[5],l=t[6],c=t[7],u=t[8],f=t[9],d=t[10],h=t[11],p=t[12],v=t[13],g=t[14],m=t[15],y=n*s-r*o,x=n*l-i*o,S=n*c-a*o,w=r*l-i*s,C=r*c-a*s,E=i*c-a*l,O=u*v-f*p,$=u*g-d*p,P=u*m-h*p,M=f*g-d*v,k=f*m-h*v,T=d*m-h*g,R=y*T-x*k+S*M+w*P-C*$+E*O;return R?(R=1/R,e[0]=(s*T-l*k+c*M)*R,e[1]=(i*k-r*T-a*M)*R,e[2]=(v*E-g*C+m*w)*R,e[3]=(d*C-f*E-h*w)*R,e[4]=(l*P-o*T-c*$)*R,e[5]=(n*T-i*P+a*$)*R,e[6]=(g*S-p*E-m*x)*R,e[7]=(u*E-d*S+h*x)*R,e[8]=(o*k-s*P+c*O)*R,e[9]=(r*P-n*k-a*O)*R,e[10]=(p*C-v*S+m*y)*R,e[11]=(f*S-u*C-h*y)*R,e[12]=(s*$-o*M-l*O)*R,e[13]=(n*M-r*$+i*O)*R,e[14]=(v*x-p*w-g*y)*R,e[15]=(u*w-f*x+d*y)*R,e):null}function xYe(e,t){var n=t[0],r=t[1],i=t[2],a=t[3],o=t[4],s=t[5],l=t[6],c=t[7],u=t[8],f=t[9],d=t[10],h=t[11],p=t[12],v=t[13],g=t[14],m=t[15];return e[0]=s*(d*m-h*g)-f*(l*m-c*g)+v*(l*h-c*d),e[1]=-(r*(d*m-h*g)-f*(i*m-a*g)+v*(i*h-a*d)),e[2]=r*(l*m-c*g)-s*(i*m-a*g)+v*(i*c-a*l),e[3]=-(r*(l*h-c*d)-s*(i*h-a*d)+f*(i*c-a*l)),e[4]=-(o*(d*m-h*g)-u*(l*m-c*g)+p*(l*h-c*d)),e[5]=n*(d*m-h*g)-u*(i*m-a*g)+p*(i*h-a*d),e[6]=-(n*(l*m-c*g)-o*(i*m-a*g)+p*(i*c-a*l)),e[7]=n*(l*h-c*d)-o*(i*h-a*d)+u*(i*c-a*l),e[8]=o*(f*m-h*v)-u*(s*m-c*v)+p*(s*h-c*f),e[9]=-(n*(f*m-h*v)-u*(r*m-a*v)+p*(r*h-a*f)),e[10]=n*(s*m-c*v)-o*(r*m-a*v)+p*(r*c-a*s),e[11]=-(n*(s*h-c*f)-o*(r*h-a*f)+u*(r*c-a*s)),e[12]=-(o*(f*g-d*v)-u*(s*g-l*v)+p*(s*d-l*f)),e[13]=n*(f*g-d*v)-u*(r*g-i*v)+p*(r*d-i*f),e[14]=-(n*(s*g-l*v)-o*(r*g-i*v)+p*(r*l-i*s)),e[15]=n*(s*d-l*f)-o*(r*d-i*f)+u*(r*l-i*s),e}function Cie(e){var t=e[0],n=e[1],r=e[2],i=e[3],a=e[4],o=e[5],s=e[6],l=e[7],c=e[8],u=e[9],f=e[10],d=e[11],h=e[12],p=e[13],v=e[14],g=e[15],m=t*o-n*a,y=t*s-r*a,x=t*l-i*a,S=n*s-r*o,w=n*l-i*o,C=r*l-i*s,E=c*p-u*h,O=c*v-f*h,$=c*g-d*h,P=u*v-f*p,M=u*g-d*p,k=f*g-d*v;return m*k-y*M+x*P+S*$-w*O+C*E}function No(e,t,n){var r=t[0],i=t[1],a=t[2],o=t[3],s=t[4],l=t[5],c=t[6],u=t[7],f=t[8],d=t[9],h=t[10],p=t[11],v=t[12],g=t[13],m=t[14],y=t[15],x=n[0],S=n[1],w=n[2],C=n[3];return e[0]=x*r+S*s+w*f+C*v,e[1]=x*i+S*l+w*d+C*g,e[2]=x*a+S*c+w*h+C*m,e[3]=x*o+S*u+w*p+C*y,x=n[4],S=n[5],w=n[6],C=n[7],e[4]=x*r+S*s+w*f+C*v,e[5]=x*i+S*l+w*d+C*g,e[6]=x*a+S*c+w*h+C*m,e[7]=x*o+S*u+w*p+C*y,x=n[8],S=n[9],w=n[10],C=n[11],e[8]=x*r+S*s+w*f+C*v,e[9]=x*i+S*l+w*d+C*g,e[10]=x*a+S*c+w*h+C*m,e[11]=x*o+S*u+w*p+C*y,x=n[12],S=n[13],w=n[14],C=n[15],e[12]=x*r+S*s+w*f+C*v,e[13]=x*i+S*l+w*d+C*g,e[14]=x*a+S*c+w*h+C*m,e[15]=x*o+S*u+w*p+C*y,e}function zm(e,t,n){var r=n[0],i=n[1],a=n[2],o,s,l,c,u,f,d,h,p,v,g,m;return t===e?(e[12]=t[0]*r+t[4]*i+t[8]*a+t[12],e[13]=t[1]*r+t[5]*i+t[9]*a+t[13],e[14]=t[2]*r+t[6]*i+t[10]*a+t[14],e[15]=t[3]*r+t[7]*i+t[11]*a+t[15]):(o=t[0],s=t[1],l=t[2],c=t[3],u=t[4],f=t[5],d=t[6],h=t[7],p=t[8],v=t[9],g=t[10],m=t[11],e[0]=o,e[1]=s,e[2]=l,e[3]=c,e[4]=u,e[5]=f,e[6]=d,e[7]=h,e[8]=p,e[9]=v,e[10]=g,e[11]=m,e[12]=o*r+u*i+p*a+t[12],e[13]=s*r+f*i+v*a+t[13],e[14]=l*r+d*i+g*a+t[14],e[15]=c*r+h*i+m*a+t[15]),e}function Eie(e,t,n){var r=n[0],i=n[1],a=n[2];return e[0]=t[0]*r,e[1]=t[1]*r,e[2]=t[2]*r,e[3]=t[3]*r,e[4]=t[4]*i,e[5]=t[5]*i,e[6]=t[6]*i,e[7]=t[7]*i,e[8]=t[8]*a,e[9]=t[9]*a,e[10]=t[10]*a,e[11]=t[11]*a,e[12]=t[12],e[13]=t[13],e[14]=t[14],e[15]=t[15],e}function SYe(e,t,n,r){var i=r[0],a=r[1],o=r[2],s=Math.hypot(i,a,o),l,c,u,f,d,h,p,v,g,m,y,x,S,w,C,E,O,$,P,M,k,T,R,A;return s<_i?null:(s=1/s,i*=s,a*=s,o*=s,l=Math.sin(n),c=Math.cos(n),u=1-c,f=t[0],d=t[1],h=t[2],p=t[3],v=t[4],g=t[5],m=t[6],y=t[7],x=t[8],S=t[9],w=t[10],C=t[11],E=i*i*u+c,O=a*i*u+o*l,$=o*i*u-a*l,P=i*a*u-o*l,M=a*a*u+c,k=o*a*u+i*l,T=i*o*u+a*l,R=a*o*u-i*l,A=o*o*u+c,e[0]=f*E+v*O+x*$,e[1]=d*E+g*O+S*$,e[2]=h*E+m*O+w*$,e[3]=p*E+y*O+C*$,e[4]=f*P+v*M+x*k,e[5]=d*P+g*M+S*k,e[6]=h*P+m*M+w*k,e[7]=p*P+y*M+C*k,e[8]=f*T+v*R+x*A,e[9]=d*T+g*R+S*A,e[10]=h*T+m*R+w*A,e[11]=p*T+y*R+C*A,t!==e&&(e[12]=t[12],e[13]=t[13],e[14]=t[14],e[15]=t[15]),e)}function Oie(e,t,n){var r=Math.sin(n),i=Math.cos(n),a=t[4],o=t[5],s=t[6],l=t[7],c=t[8],u=t[9],f=t[10],d=t[11];return t!==e&&(e[0]=t[0],e[1]=t[1],e[2]=t[2],e[3]=t[3],e[12]=t[12],e[13]=t[13],e[14]=t[14],e[15]=t[15]),e[4]=a*i+c*r,e[5]=o*i+u*r,e[6]=s*i+f*r,e[7]=l*i+d*r,e[8]=c*i-a*r,e[9]=u*i-o*r,e[10]=f*i-s*r,e[11]=d*i-l*r,e}function _ie(e,t,n){var r=Math.sin(n),i=Math.cos(n),a=t[0],o=t[1],s=t[2],l=t[3],c=t[8],u=t[9],f=t[10],d=t[11];return t!==e&&(e[4]=t[4],e[5]=t[5],e[6]=t[6],e[7]=t[7],e[12]=t[12],e[13]=t[13],e[14]=t[14],e[15]=t[15]),e[0]=a*i-c*r,e[1]=o*i-u*r,e[2]=s*i-f*r,e[3]=l*i-d*r,e[8]=a*r+c*i,e[9]=o*r+u*i,e[10]=s*r+f*i,e[11]=l*r+d*i,e}function wYe(e,t,n){var r=Math.sin(n),i=Math.cos(n),a=t[0],o=t[1],s=t[2],l=t[3],c=t[4],u=t[5],f=t[6],d=t[7];return t!==e&&(e[8]=t[8],e[9]=t[9],e[10]=t[10],e[11]=t[11],e[12]=t[12],e[13]=t[13],e[14]=t[14],e[15]=t[15]),e[0]=a*i+c*r,e[1]=o*i+u*r,e[2]=s*i+f*r,e[3]=l*i+d*r,e[4]=c*i-a*r,e[5]=u*i-o*r,e[6]=f*i-s*r,e[7]=d*i-l*r,e}function bf(e,t){return e[0]=1,e[1]=0,e[2]=0,e[3]=0,e[4]=0,e[5]=1,e[6]=0,e[7]=0,e[8]=0,e[9]=0,e[10]=1,e[11]=0,e[12]=t[0],e[13]=t[1],e[14]=t[2],e[15]=1,e}function Yd(e,t){return e[0]=t[0],e[1]=0,e[2]=0,e[3]=0,e[4]=0,e[5]=t[1],e[6]=0,e[7]=0,e[8]=0,e[9]=0,e[10]=t[2],e[11]=0,e[12]=0,e[13]=0,e[14]=0,e[15]=1,e}function $ie(e,t,n){var r=n[0],i=n[1],a=n[2],o=Math.hypot(r,i,a),s,l,c;return o<_i?null:(o=1/o,r*=o,i*=o,a*=o,s=Math.sin(t),l=Math.cos(t),c=1-l,e[0]=r*r*c+l,e[1]=i*r*c+a*s,e[2]=a*r*c-i*s,e[3]=0,e[4]=r*i*c-a*s,e[5]=i*i*c+l,e[6]=a*i*c+r*s,e[7]=0,e[8]=r*a*c+i*s,e[9]=i*a*c-r*s,e[10]=a*a*c+l,e[11]=0,e[12]=0,e[13]=0,e[14]=0,e[15]=1,e)}function Pie(e,t){var n=Math.sin(t),r=Math.cos(t);return e[0]=1,e[1]=0,e[2]=0,e[3]=0,e[4]=0,e[5]=r,e[6]=n,e[7]=0,e[8]=0,e[9]=-n,e[10]=r,e[11]=0,e[12]=0,e[13]=0,e[14]=0,e[15]=1,e}function Mie(e,t){var n=Math.sin(t),r=Math.cos(t);return e[0]=r,e[1]=0,e[2]=-n,e[3]=0,e[4]=0,e[5]=1,e[6]=0,e[7]=0,e[8]=n,e[9]=0,e[10]=r,e[11]=0,e[12]=0,e[13]=0,e[14]=0,e[15]=1,e}function r8(e,t){var n=Math.sin(t),r=Math.cos(t);return e[0]=r,e[1]=n,e[2]=0,e[3]=0,e[4]=-n,e[5]=r,e[6]=0,e[7]=0,e[8]=0,e[9]=0,e[10]=1,e[11]=0,e[12]=0,e[13]=0,e[14]=0,e[15]=1,e}function kie(e,t,n){var r=t[0],i=t[1],a=t[2],o=t[3],s=r+r,l=i+i,c=a+a,u=r*s,f=r*l,d=r*c,h=i*l,p=i*c,v=a*c,g=o*s,m=o*l,y=o*c;return e[0]=1-(h+v),e[1]=f+y,e[2]=d-m,e[3]=0,e[4]=f-y,e[5]=1-(u+v),e[6]=p+g,e[7]=0,e[8]=d+m,e[9]=p-g,e[10]=1-(u+h),e[11]=0,e[12]=n[0],e[13]=n[1],e[14]=n[2],e[15]=1,e}function CYe(e,t){var n=new ga(3),r=-t[0],i=-t[1],a=-t[2],o=t[3],s=t[4],l=t[5],c=t[6],u=t[7],f=r*r+i*i+a*a+o*o;return f>0?(n[0]=(s*o+u*r+l*a-c*i)*2/f,n[1]=(l*o+u*i+c*r-s*a)*2/f,n[2]=(c*o+u*a+s*i-l*r)*2/f):(n[0]=(s*o+u*r+l*a-c*i)*2,n[1]=(l*o+u*i+c*r-s*a)*2,n[2]=(c*o+u*a+s*i-l*r)*2),kie(e,t,n),e}function a_(e,t){return e[0]=t[12],e[1]=t[13],e[2]=t[14],e}function Hm(e,t){var n=t[0],r=t[1],i=t[2],a=t[4],o=t[5],s=t[6],l=t[8],c=t[9],u=t[10];return e[0]=Math.hypot(n,r,i),e[1]=Math.hypot(a,o,s),e[2]=Math.hypot(l,c,u),e}function o_(e,t){var n=new ga(3);Hm(n,t);var r=1/n[0],i=1/n[1],a=1/n[2],o=t[0]*r,s=t[1]*i,l=t[2]*a,c=t[4]*r,u=t[5]*i,f=t[6]*a,d=t[8]*r,h=t[9]*i,p=t[10]*a,v=o+u+p,g=0;return v>0?(g=Math.sqrt(v+1)*2,e[3]=.25*g,e[0]=(f-h)/g,e[1]=(d-l)/g,e[2]=(s-c)/g):o>u&&o>p?(g=Math.sqrt(1+o-u-p)*2,e[3]=(f-h)/g,e[0]=.25*g,e[1]=(s+c)/g,e[2]=(d+l)/g):u>p?(g=Math.sqrt(1+u-o-p)*2,e[3]=(d-l)/g,e[0]=(s+c)/g,e[1]=.25*g,e[2]=(f+h)/g):(g=Math.sqrt(1+p-o-u)*2,e[3]=(s-c)/g,e[0]=(d+l)/g,e[1]=(f+h)/g,e[2]=.25*g),e}function EYe(e,t,n,r){var i=t[0],a=t[1],o=t[2],s=t[3],l=i+i,c=a+a,u=o+o,f=i*l,d=i*c,h=i*u,p=a*c,v=a*u,g=o*u,m=s*l,y=s*c,x=s*u,S=r[0],w=r[1],C=r[2];return e[0]=(1-(p+g))*S,e[1]=(d+x)*S,e[2]=(h-y)*S,e[3]=0,e[4]=(d-x)*w,e[5]=(1-(f+g))*w,e[6]=(v+m)*w,e[7]=0,e[8]=(h+y)*C,e[9]=(v-m)*C,e[10]=(1-(f+p))*C,e[11]=0,e[12]=n[0],e[13]=n[1],e[14]=n[2],e[15]=1,e}function Qb(e,t,n,r,i){var a=t[0],o=t[1],s=t[2],l=t[3],c=a+a,u=o+o,f=s+s,d=a*c,h=a*u,p=a*f,v=o*u,g=o*f,m=s*f,y=l*c,x=l*u,S=l*f,w=r[0],C=r[1],E=r[2],O=i[0],$=i[1],P=i[2],M=(1-(v+m))*w,k=(h+S)*w,T=(p-x)*w,R=(h-S)*C,A=(1-(d+m))*C,N=(g+y)*C,L=(p+x)*E,j=(g-y)*E,F=(1-(d+v))*E;return e[0]=M,e[1]=k,e[2]=T,e[3]=0,e[4]=R,e[5]=A,e[6]=N,e[7]=0,e[8]=L,e[9]=j,e[10]=F,e[11]=0,e[12]=n[0]+O-(M*O+R*$+L*P),e[13]=n[1]+$-(k*O+A*$+j*P),e[14]=n[2]+P-(T*O+N*$+F*P),e[15]=1,e}function i8(e,t){var n=t[0],r=t[1],i=t[2],a=t[3],o=n+n,s=r+r,l=i+i,c=n*o,u=r*o,f=r*s,d=i*o,h=i*s,p=i*l,v=a*o,g=a*s,m=a*l;return e[0]=1-f-p,e[1]=u+m,e[2]=d-g,e[3]=0,e[4]=u-m,e[5]=1-c-p,e[6]=h+v,e[7]=0,e[8]=d+g,e[9]=h-v,e[10]=1-c-f,e[11]=0,e[12]=0,e[13]=0,e[14]=0,e[15]=1,e}function OYe(e,t,n,r,i,a,o){var s=1/(n-t),l=1/(i-r),c=1/(a-o);return e[0]=a*2*s,e[1]=0,e[2]=0,e[3]=0,e[4]=0,e[5]=a*2*l,e[6]=0,e[7]=0,e[8]=(n+t)*s,e[9]=(i+r)*l,e[10]=(o+a)*c,e[11]=-1,e[12]=0,e[13]=0,e[14]=o*a*2*c,e[15]=0,e}function Tie(e,t,n,r,i){var a=1/Math.tan(t/2),o;return e[0]=a/n,e[1]=0,e[2]=0,e[3]=0,e[4]=0,e[5]=a,e[6]=0,e[7]=0,e[8]=0,e[9]=0,e[11]=-1,e[12]=0,e[13]=0,e[15]=0,i!=null&&i!==1/0?(o=1/(r-i),e[10]=(i+r)*o,e[14]=2*i*r*o):(e[10]=-1,e[14]=-2*r),e}var _Ye=Tie;function $Ye(e,t,n,r,i){var a=1/Math.tan(t/2),o;return e[0]=a/n,e[1]=0,e[2]=0,e[3]=0,e[4]=0,e[5]=a,e[6]=0,e[7]=0,e[8]=0,e[9]=0,e[11]=-1,e[12]=0,e[13]=0,e[15]=0,i!=null&&i!==1/0?(o=1/(r-i),e[10]=i*o,e[14]=i*r*o):(e[10]=-1,e[14]=-r),e}function PYe(e,t,n,r){var i=Math.tan(t.upDegrees*Math.PI/180),a=Math.tan(t.downDegrees*Math.PI/180),o=Math.tan(t.leftDegrees*Math.PI/180),s=Math.tan(t.rightDegrees*Math.PI/180),l=2/(o+s),c=2/(i+a);return e[0]=l,e[1]=0,e[2]=0,e[3]=0,e[4]=0,e[5]=c,e[6]=0,e[7]=0,e[8]=-((o-s)*l*.5),e[9]=(i-a)*c*.5,e[10]=r/(n-r),e[11]=-1,e[12]=0,e[13]=0,e[14]=r*n/(n-r),e[15]=0,e}function Rie(e,t,n,r,i,a,o){var s=1/(t-n),l=1/(r-i),c=1/(a-o);return e[0]=-2*s,e[1]=0,e[2]=0,e[3]=0,e[4]=0,e[5]=-2*l,e[6]=0,e[7]=0,e[8]=0,e[9]=0,e[10]=2*c,e[11]=0,e[12]=(t+n)*s,e[13]=(i+r)*l,e[14]=(o+a)*c,e[15]=1,e}var Iie=Rie;function Aie(e,t,n,r,i,a,o){var s=1/(t-n),l=1/(r-i),c=1/(a-o);return e[0]=-2*s,e[1]=0,e[2]=0,e[3]=0,e[4]=0,e[5]=-2*l,e[6]=0,e[7]=0,e[8]=0,e[9]=0,e[10]=c,e[11]=0,e[12]=(t+n)*s,e[13]=(i+r)*l,e[14]=a*c,e[15]=1,e}function Nie(e,t,n,r){var i,a,o,s,l,c,u,f,d,h,p=t[0],v=t[1],g=t[2],m=r[0],y=r[1],x=r[2],S=n[0],w=n[1],C=n[2];return Math.abs(p-S)<_i&&Math.abs(v-w)<_i&&Math.abs(g-C)<_i?Kd(e):(u=p-S,f=v-w,d=g-C,h=1/Math.hypot(u,f,d),u*=h,f*=h,d*=h,i=y*d-x*f,a=x*u-m*d,o=m*f-y*u,h=Math.hypot(i,a,o),h?(h=1/h,i*=h,a*=h,o*=h):(i=0,a=0,o=0),s=f*o-d*a,l=d*i-u*o,c=u*a-f*i,h=Math.hypot(s,l,c),h?(h=1/h,s*=h,l*=h,c*=h):(s=0,l=0,c=0),e[0]=i,e[1]=s,e[2]=u,e[3]=0,e[4]=a,e[5]=l,e[6]=f,e[7]=0,e[8]=o,e[9]=c,e[10]=d,e[11]=0,e[12]=-(i*p+a*v+o*g),e[13]=-(s*p+l*v+c*g),e[14]=-(u*p+f*v+d*g),e[15]=1,e)}function MYe(e,t,n,r){var i=t[0],a=t[1],o=t[2],s=r[0],l=r[1],c=r[2],u=i-n[0],f=a-n[1],d=o-n[2],h=u*u+f*f+d*d;h>0&&(h=1/Math.sqrt(h),u*=h,f*=h,d*=h);var p=l*d-c*f,v=c*u-s*d,g=s*f-l*u;return h=p*p+v*v+g*g,h>0&&(h=1/Math.sqrt(h),p*=h,v*=h,g*=h),e[0]=p,e[1]=v,e[2]=g,e[3]=0,e[4]=f*g-d*v,e[5]=d*p-u*g,e[6]=u*v-f*p,e[7]=0,e[8]=u,e[9]=f,e[10]=d,e[11]=0,e[12]=i,e[13]=a,e[14]=o,e[15]=1,e}function kYe(e){return"mat4("+e[0]+", "+e[1]+", "+e[2]+", "+e[3]+", "+e[4]+", "+e[5]+", "+e[6]+", "+e[7]+", "+e[8]+", "+e[9]+", "+e[10]+", "+e[11]+", "+e[12]+", "+e[13]+", "+e[14]+", "+e[15]+")"}function TYe(e){return Math.hypot(e[0],e[1],e[2],e[3],e[4],e[5],e[6],e[7],e[8],e[9],e[10],e[11],e[12],e[13],e[14],e[15])}function RYe(e,t,n){return e[0]=t[0]+n[0],e[1]=t[1]+n[1],e[2]=t[2]+n[2],e[3]=t[3]+n[3],e[4]=t[4]+n[4],e[5]=t[5]+n[5],e[6]=t[6]+n[6],e[7]=t[7]+n[7],e[8]=t[8]+n[8],e[9]=t[9]+n[9],e[10]=t[10]+n[10],e[11]=t[11]+n[11],e[12]=t[12]+n[12],e[13]=t[13]+n[13],e[14]=t[14]+n[14],e[15]=t[15]+n[15],e}function Lie(e,t,n){return e[0]=t[0]-n[0],e[1]=t[1]-n[1],e[2]=t[2]-n[2],e[3]=t[3]-n[3],e[4]=t[4]-n[4],e[5]=t[5]-n[5],e[6]=t[6]-n[6],e[7]=t[7]-n[7],e[8]=t[8]-n[8],e[9]=t[9]-n[9],e[10]=t[10]-n[10],e[11]=t[11]-n[11],e[12]=t[12]-n[12],e[13]=t[13]-n[13],e[14]=t[14]-n[14],e[15]=t[15]-n[15],e}function IYe(e,t,n){return e[0]=t[0]*n,e[1]=t[1]*n,e[2]=t[2]*n,e[3]=t[3]*n,e[4]=t[4]*n,e[5]=t[5]*n,e[6]=t[6]*n,e[7]=t[7]*n,e[8]=t[8]*n,e[9]=t[9]*n,e[10]=t[10]*n,e[11]=t[11]*n,e[12]=t[12]*n,e[13]=t[13]*n,e[14]=t[14]*n,e[15]=t[15]*n,e}function AYe(e,t,n,r){return e[0]=t[0]+n[0]*r,e[1]=t[1]+n[1]*r,e[2]=t[2]+n[2]*r,e[3]=t[3]+n[3]*r,e[4]=t[4]+n[4]*r,e[5]=t[5]+n[5]*r,e[6]=t[6]+n[6]*r,e[7]=t[7]+n[7]*r,e[8]=t[8]+n[8]*r,e[9]=t[9]+n[9]*r,e[10]=t[10]+n[10]*r,e[11]=t[11]+n[11]*r,e[12]=t[12]+n[12]*r,e[13]=t[13]+n[13]*r,e[14]=t[14]+n[14]*r,e[15]=t[15]+n[15]*r,e}function a8(e,t){return e[0]===t[0]&&e[1]===t[1]&&e[2]===t[2]&&e[3]===t[3]&&e[4]===t[4]&&e[5]===t[5]&&e[6]===t[6]&&e[7]===t[7]&&e[8]===t[8]&&e[9]===t[9]&&e[10]===t[10]&&e[11]===t[11]&&e[12]===t[12]&&e[13]===t[13]&&e[14]===t[14]&&e[15]===t[15]}function NYe(e,t){var n=e[0],r=e[1],i=e[2],a=e[3],o=e[4],s=e[5],l=e[6],c=e[7],u=e[8],f=e[9],d=e[10],h=e[11],p=e[12],v=e[13],g=e[14],m=e[15],y=t[0],x=t[1],S=t[2],w=t[3],C=t[4],E=t[5],O=t[6],$=t[7],P=t[8],M=t[9],k=t[10],T=t[11],R=t[12],A=t[13],N=t[14],L=t[15];return Math.abs(n-y)<=_i*Math.max(1,Math.abs(n),Math.abs(y))&&Math.abs(r-x)<=_i*Math.max(1,Math.abs(r),Math.abs(x))&&Math.abs(i-S)<=_i*Math.max(1,Math.abs(i),Math.abs(S))&&Math.abs(a-w)<=_i*Math.max(1,Math.abs(a),Math.abs(w))&&Math.abs(o-C)<=_i*Math.max(1,Math.abs(o),Math.abs(C))&&Math.abs(s-E)<=_i*Math.max(1,Math.abs(s),Math.abs(E))&&Math.abs(l-O)<=_i*Math.max(1,Math.abs(l),Math.abs(O))&&Math.abs(c-$)<=_i*Math.max(1,Math.abs(c),Math.abs($))&&Math.abs(u-P)<=_i*Math.max(1,Math.abs(u),Math.abs(P))&&Math.abs(f-M)<=_i*Math.max(1,Math.abs(f),Math.abs(M))&&Math.abs(d-k)<=_i*Math.max(1,Math.abs(d),Math.abs(k))&&Math.abs(h-T)<=_i*Math.max(1,Math.abs(h),Math.abs(T))&&Math.abs(p-R)<=_i*Math.max(1,Math.abs(p),Math.abs(R))&&Math.abs(v-A)<=_i*Math.max(1,Math.abs(v),Math.abs(A))&&Math.abs(g-N)<=_i*Math.max(1,Math.abs(g),Math.abs(N))&&Math.abs(m-L)<=_i*Math.max(1,Math.abs(m),Math.abs(L))}var o8=No,LYe=Lie;const jYe=Object.freeze(Object.defineProperty({__proto__:null,add:RYe,adjoint:xYe,clone:t8,copy:Bm,create:Wr,determinant:Cie,equals:NYe,exactEquals:a8,frob:TYe,fromQuat:i8,fromQuat2:CYe,fromRotation:$ie,fromRotationTranslation:kie,fromRotationTranslationScale:EYe,fromRotationTranslationScaleOrigin:Qb,fromScaling:Yd,fromTranslation:bf,fromValues:Sie,fromXRotation:Pie,fromYRotation:Mie,fromZRotation:r8,frustum:OYe,getRotation:o_,getScaling:Hm,getTranslation:a_,identity:Kd,invert:Tc,lookAt:Nie,mul:o8,multiply:No,multiplyScalar:IYe,multiplyScalarAndAdd:AYe,ortho:Iie,orthoNO:Rie,orthoZO:Aie,perspective:_Ye,perspectiveFromFieldOfView:PYe,perspectiveNO:Tie,perspectiveZO:$Ye,rotate:SYe,rotateX:Oie,rotateY:_ie,rotateZ:wYe,scale:Eie,set:n8,str:kYe,sub:LYe,subtract:Lie,targetTo:MYe,translate:zm,transpose:wie},Symbol.toStringTag,{value:"Module"}));function dr(){var e=new ga(3);return ga!=Float32Array&&(e[0]=0,e[1]=0,e[2]=0),e}function xf(e){var t=new ga(3);return t[0]=e[0],t[1]=e[1],t[2]=e[2],t}function Sf(e){var t=e[0],n=e[1],r=e[2];return Math.hypot(t,n,r)}function kr(e,t,n){var r=new ga(3);return r[0]=e,r[1]=t,r[2]=n,r}function fu(e,t){return e[0]=t[0],e[1]=t[1],e[2]=t[2],e}function Lo(e,t,n,r){return e[0]=t,e[1]=n,e[2]=r,e}function Xd(e,t,n){return e[0]=t[0]+n[0],e[1]=t[1]+n[1],e[2]=t[2]+n[2],e}function s8(e,t,n){return e[0]=t[0]-n[0],e[1]=t[1]-n[1],e[2]=t[2]-n[2],e}function DYe(e,t,n){return e[0]=t[0]*n[0],e[1]=t[1]*n[1],e[2]=t[2]*n[2],e}function FYe(e,t,n){return e[0]=Math.min(t[0],n[0]),e[1]=Math.min(t[1],n[1]),e[2]=Math.min(t[2],n[2]),e}function BYe(e,t,n){return e[0]=Math.max(t[0],n[0]),e[1]=Math.max(t[1],n[1]),e[2]=Math.max(t[2],n[2]),e}function s_(e,t,n){return e[0]=t[0]*n,e[1]=t[1]*n,e[2]=t[2]*n,e}function zYe(e,t){var n=t[0]-e[0],r=t[1]-e[1],i=t[2]-e[2];return Math.hypot(n,r,i)}function Wp(e,t){var n=t[0],r=t[1],i=t[2],a=n*n+r*r+i*i;return a>0&&(a=1/Math.sqrt(a)),e[0]=t[0]*a,e[1]=t[1]*a,e[2]=t[2]*a,e}function du(e,t){return e[0]*t[0]+e[1]*t[1]+e[2]*t[2]}function l_(e,t,n){var r=t[0],i=t[1],a=t[2],o=n[0],s=n[1],l=n[2];return e[0]=i*l-a*s,e[1]=a*o-r*l,e[2]=r*s-i*o,e}function l8(e,t,n,r){var i=t[0],a=t[1],o=t[2];return e[0]=i+r*(n[0]-i),e[1]=a+r*(n[1]-a),e[2]=o+r*(n[2]-o),e}function Wi(e,t,n){var r=t[0],i=t[1],a=t[2],o=n[3]*r+n[7]*i+n[11]*a+n[15];return o=o||1,e[0]=(n[0]*r+n[4]*i+n[8]*a+n[12])/o,e[1]=(n[1]*r+n[5]*i+n[9]*a+n[13])/o,e[2]=(n[2]*r+n[6]*i+n[10]*a+n[14])/o,e}function jie(e,t,n){var r=t[0],i=t[1],a=t[2];return e[0]=r*n[0]+i*n[3]+a*n[6],e[1]=r*n[1]+i*n[4]+a*n[7],e[2]=r*n[2]+i*n[5]+a*n[8],e}function HYe(e,t,n){var r=n[0],i=n[1],a=n[2],o=n[3],s=t[0],l=t[1],c=t[2],u=i*c-a*l,f=a*s-r*c,d=r*l-i*s,h=i*d-a*f,p=a*u-r*d,v=r*f-i*u,g=o*2;return u*=g,f*=g,d*=g,h*=2,p*=2,v*=2,e[0]=s+u+h,e[1]=l+f+p,e[2]=c+d+v,e}function Jb(e,t){var n=e[0],r=e[1],i=e[2],a=t[0],o=t[1],s=t[2];return Math.abs(n-a)<=_i*Math.max(1,Math.abs(n),Math.abs(a))&&Math.abs(r-o)<=_i*Math.max(1,Math.abs(r),Math.abs(o))&&Math.abs(i-s)<=_i*Math.max(1,Math.abs(i),Math.abs(s))}var WYe=s8,Die=zYe,Fie=Sf;(function(){var e=dr();return function(t,n,r,i,a,o){var s,l;for(n||(n=3),r||(r=0),i?l=Math.min(i*n+r,t.length):l=t.length,s=r;s<l;s+=n)e[0]=t[s],e[1]=t[s+1],e[2]=t[s+2],a(e,e,o),t[s]=e[0],t[s+1]=e[1],t[s+2]=e[2];return t}})();function hu(){var e=new ga(4);return ga!=Float32Array&&(e[0]=0,e[1]=0,e[2]=0,e[3]=0),e}function ex(e,t,n,r){var i=new ga(4);return i[0]=e,i[1]=t,i[2]=n,i[3]=r,i}function VYe(e,t){return e[0]=t[0],e[1]=t[1],e[2]=t[2],e[3]=t[3],e}function qYe(e,t,n,r,i){return e[0]=t,e[1]=n,e[2]=r,e[3]=i,e}function UYe(e,t){var n=t[0],r=t[1],i=t[2],a=t[3],o=n*n+r*r+i*i+a*a;return o>0&&(o=1/Math.sqrt(o)),e[0]=n*o,e[1]=r*o,e[2]=i*o,e[3]=a*o,e}function pu(e,t,n){var r=t[0],i=t[1],a=t[2],o=t[3];return e[0]=n[0]*r+n[4]*i+n[8]*a+n[12]*o,e[1]=n[1]*r+n[5]*i+n[9]*a+n[13]*o,e[2]=n[2]*r+n[6]*i+n[10]*a+n[14]*o,e[3]=n[3]*r+n[7]*i+n[11]*a+n[15]*o,e}(function(){var e=hu();return function(t,n,r,i,a,o){var s,l;for(n||(n=4),r||(r=0),i?l=Math.min(i*n+r,t.length):l=t.length,s=r;s<l;s+=n)e[0]=t[s],e[1]=t[s+1],e[2]=t[s+2],e[3]=t[s+3],a(e,e,o),t[s]=e[0],t[s+1]=e[1],t[s+2]=e[2],t[s+3]=e[3];return t}})();function Va(){var e=new ga(4);return ga!=Float32Array&&(e[0]=0,e[1]=0,e[2]=0),e[3]=1,e}function Zd(e,t,n){n=n*.5;var r=Math.sin(n);return e[0]=r*t[0],e[1]=r*t[1],e[2]=r*t[2],e[3]=Math.cos(n),e}function Qd(e,t,n){var r=t[0],i=t[1],a=t[2],o=t[3],s=n[0],l=n[1],c=n[2],u=n[3];return e[0]=r*u+o*s+i*c-a*l,e[1]=i*u+o*l+a*s-r*c,e[2]=a*u+o*c+r*l-i*s,e[3]=o*u-r*s-i*l-a*c,e}function c8(e,t,n,r){var i=t[0],a=t[1],o=t[2],s=t[3],l=n[0],c=n[1],u=n[2],f=n[3],d,h,p,v,g;return h=i*l+a*c+o*u+s*f,h<0&&(h=-h,l=-l,c=-c,u=-u,f=-f),1-h>_i?(d=Math.acos(h),p=Math.sin(d),v=Math.sin((1-r)*d)/p,g=Math.sin(r*d)/p):(v=1-r,g=r),e[0]=v*i+g*l,e[1]=v*a+g*c,e[2]=v*o+g*u,e[3]=v*s+g*f,e}function u8(e,t){var n=t[0],r=t[1],i=t[2],a=t[3],o=n*n+r*r+i*i+a*a,s=o?1/o:0;return e[0]=-n*s,e[1]=-r*s,e[2]=-i*s,e[3]=a*s,e}function GYe(e,t){var n=t[0]+t[4]+t[8],r;if(n>0)r=Math.sqrt(n+1),e[3]=.5*r,r=.5/r,e[0]=(t[5]-t[7])*r,e[1]=(t[6]-t[2])*r,e[2]=(t[1]-t[3])*r;else{var i=0;t[4]>t[0]&&(i=1),t[8]>t[i*3+i]&&(i=2);var a=(i+1)%3,o=(i+2)%3;r=Math.sqrt(t[i*3+i]-t[a*3+a]-t[o*3+o]+1),e[i]=.5*r,r=.5/r,e[3]=(t[a*3+o]-t[o*3+a])*r,e[a]=(t[a*3+i]+t[i*3+a])*r,e[o]=(t[o*3+i]+t[i*3+o])*r}return e}function c_(e,t,n,r){var i=.5*Math.PI/180;t*=i,n*=i,r*=i;var a=Math.sin(t),o=Math.cos(t),s=Math.sin(n),l=Math.cos(n),c=Math.sin(r),u=Math.cos(r);return e[0]=a*l*u-o*s*c,e[1]=o*s*u+a*l*c,e[2]=o*l*c-a*s*u,e[3]=o*l*u+a*s*c,e}var KYe=ex,u_=VYe,Bie=qYe,zie=Qd,f_=UYe;(function(){var e=dr(),t=kr(1,0,0),n=kr(0,1,0);return function(r,i,a){var o=du(i,a);return o<-.999999?(l_(e,t,i),Fie(e)<1e-6&&l_(e,n,i),Wp(e,e),Zd(r,e,Math.PI),r):o>.999999?(r[0]=0,r[1]=0,r[2]=0,r[3]=1,r):(l_(e,i,a),r[0]=e[0],r[1]=e[1],r[2]=e[2],r[3]=1+o,f_(r,r))}})(),function(){var e=Va(),t=Va();return function(n,r,i,a,o,s){return c8(e,r,o,s),c8(t,i,a,s),c8(n,e,t,2*s*(1-s)),n}}(),function(){var e=Fm();return function(t,n,r,i){return e[0]=r[0],e[3]=r[1],e[6]=r[2],e[1]=i[0],e[4]=i[1],e[7]=i[2],e[2]=-n[0],e[5]=-n[1],e[8]=-n[2],f_(t,GYe(t,e))}}();function f8(){var e=new ga(2);return ga!=Float32Array&&(e[0]=0,e[1]=0),e}function YYe(e,t){return e[0]=t[0],e[1]=t[1],e}function XYe(e,t,n){return e[0]=t,e[1]=n,e}function ZYe(e,t){var n=t[0],r=t[1],i=n*n+r*r;return i>0&&(i=1/Math.sqrt(i)),e[0]=t[0]*i,e[1]=t[1]*i,e}function QYe(e,t){return e[0]*t[0]+e[1]*t[1]}function JYe(e,t){return e[0]===t[0]&&e[1]===t[1]}(function(){var e=f8();return function(t,n,r,i,a,o){var s,l;for(n||(n=2),r||(r=0),i?l=Math.min(i*n+r,t.length):l=t.length,s=r;s<l;s+=n)e[0]=t[s],e[1]=t[s+1],a(e,e,o),t[s]=e[0],t[s+1]=e[1];return t}})();var Wm=function(e){return e!==null&&typeof e!="function"&&isFinite(e.length)},Hie=function(e,t){if(!Wm(e))return e;for(var n=[],r=0;r<e.length;r++){var i=e[r];t(i,r)&&n.push(i)}return n};function qa(e){return typeof e=="function"}function Pn(e){return e==null}function Ua(e){return Array.isArray(e)}const d_=function(e){var t=typeof e;return e!==null&&t==="object"||t==="function"};function d8(e,t){if(e){var n;if(Ua(e))for(var r=0,i=e.length;r<i&&(n=t(e[r],r),n!==!1);r++);else if(d_(e)){for(var a in e)if(e.hasOwnProperty(a)&&(n=t(e[a],a),n===!1))break}}}var h8=Object.keys?function(e){return Object.keys(e)}:function(e){var t=[];return d8(e,function(n,r){qa(e)&&r==="prototype"||t.push(r)}),t};function eXe(e,t){var n=h8(t),r=n.length;if(Pn(e))return!r;for(var i=0;i<r;i+=1){var a=n[i];if(t[a]!==e[a]||!(a in e))return!1}return!0}var p8=function(e){return typeof e=="object"&&e!==null},tXe={}.toString,Wie=function(e,t){return tXe.call(e)==="[object "+t+"]"},wf=function(e){if(!p8(e)||!Wie(e,"Object"))return!1;if(Object.getPrototypeOf(e)===null)return!0;for(var t=e;Object.getPrototypeOf(t)!==null;)t=Object.getPrototypeOf(t);return Object.getPrototypeOf(e)===t};function Vm(e,t){if(!Ua(e))return null;var n;if(qa(t)&&(n=t),wf(t)&&(n=function(i){return eXe(i,t)}),n){for(var r=0;r<e.length;r+=1)if(n(e[r]))return e[r]}return null}function h_(e){if(!Array.isArray(e))return-1/0;var t=e.length;if(!t)return-1/0;for(var n=e[0],r=1;r<t;r++)n=Math.max(n,e[r]);return n}const p_=function(e){if(Ua(e))return e.reduce(function(t,n){return Math.min(t,n)},e[0])};var Vie=function(e,t,n){if(!Ua(e)&&!wf(e))return e;var r=n;return d8(e,function(i,a){r=t(r,i,a)}),r};function $i(e){return typeof e=="string"}function tx(e){if(Wm(e)){var t=e;return t[t.length-1]}}var Vi=function(e,t,n){return e<t?t:e>n?n:e};function gi(e){return typeof e=="number"}var nXe=1e-5;function nx(e,t,n){return n===void 0&&(n=nXe),e===t||Math.abs(e-t)<n}const rXe=function(e,t){if(Ua(e)){for(var n,r=-1/0,i=0;i<e.length;i++){var a=e[i],o=qa(t)?t(a):a[t];o>r&&(n=a,r=o)}return n}},iXe=function(e,t){if(Ua(e)){for(var n,r=1/0,i=0;i<e.length;i++){var a=e[i],o=qa(t)?t(a):a[t];o<r&&(n=a,r=o)}return n}};var qie=function(e,t){return(e%t+t)%t};const Uie=function(e){return Pn(e)?"":e.toString()};var Gie=function(e){var t=Uie(e);return t.charAt(0).toLowerCase()+t.substring(1)};function aXe(e,t){return!e||!t?e:e.replace(/\\?\{([^{}]+)\}/g,function(n,r){return n.charAt(0)==="\\"?n.slice(1):t[r]===void 0?"":t[r]})}var Jd=function(e){var t=Uie(e);return t.charAt(0).toUpperCase()+t.substring(1)},Kie=function(e){return Wie(e,"Boolean")};function oXe(e){return e===null}var si=function(e){return e===void 0};function Yie(e,t){for(var n in t)t.hasOwnProperty(n)&&n!=="constructor"&&t[n]!==void 0&&(e[n]=t[n])}function sXe(e,t,n,r){return Yie(e,t),n&&Yie(e,n),e}var rx=function(e){if(typeof e!="object"||e===null)return e;var t;if(Ua(e)){t=[];for(var n=0,r=e.length;n<r;n++)typeof e[n]=="object"&&e[n]!=null?t[n]=rx(e[n]):t[n]=e[n]}else{t={};for(var i in e)typeof e[i]=="object"&&e[i]!=null?t[i]=rx(e[i]):t[i]=e[i]}return t};function Xie(e,t,n){var r;return function(){var i=this,a=arguments,o=function(){r=null,e.apply(i,a)};clearTimeout(r),r=setTimeout(o,t)}}function lXe(e){var t,n,r,i=e;function a(s,l){++t>i&&(r=n,o(1),++t),n[s]=l}function o(s){t=0,n=Object.create(null),s||(r=Object.create(null))}return o(),{clear:o,has:function(s){return n[s]!==void 0||r[s]!==void 0},get:function(s){var l=n[s];if(l!==void 0)return l;if((l=r[s])!==void 0)return a(s,l),l},set:function(s,l){n[s]!==void 0?n[s]=l:a(s,l)}}}var v8=new Map;function cXe(e,t,n){var r=function(){for(var i=[],a=0;a<arguments.length;a++)i[a]=arguments[a];var o=t.apply(this,i);v8.has(e)||v8.set(e,lXe(n));var s=v8.get(e);if(s.has(o))return s.get(o);var l=e.apply(this,i);return s.set(o,l),l};return r}var uXe=5;function fXe(e,t){if(Object.hasOwn)return Object.hasOwn(e,t);if(e==null)throw new TypeError("Cannot convert undefined or null to object");return Object.prototype.hasOwnProperty.call(Object(e),t)}function Zie(e,t,n,r){n=n||0,r=r||uXe;for(var i in t)if(fXe(t,i)){var a=t[i];a!==null&&wf(a)?(wf(e[i])||(e[i]={}),n<r?Zie(e[i],a,n+1,r):e[i]=t[i]):Ua(a)?(e[i]=[],e[i]=e[i].concat(a)):a!==void 0&&(e[i]=a)}}var ct=function(e){for(var t=[],n=1;n<arguments.length;n++)t[n-1]=arguments[n];for(var r=0;r<t.length;r+=1)Zie(e,t[r]);return e},Qie=function(e,t){if(!Wm(e))return-1;var n=Array.prototype.indexOf;if(n)return n.call(e,t);for(var r=-1,i=0;i<e.length;i++)if(e[i]===t){r=i;break}return r},v_=function(e,t){if(e===t)return!0;if(!e||!t||$i(e)||$i(t))return!1;if(Wm(e)||Wm(t)){if(e.length!==t.length)return!1;for(var n=!0,r=0;r<e.length&&(n=v_(e[r],t[r]),!!n);r++);return n}if(p8(e)||p8(t)){var i=Object.keys(e),a=Object.keys(t);if(i.length!==a.length)return!1;for(var n=!0,r=0;r<i.length&&(n=v_(e[i[r]],t[i[r]]),!!n);r++);return n}return!1};const xr=function(e,t,n){for(var r=0,i=$i(t)?t.split("."):t;e&&r<i.length;)e=e[i[r++]];return e===void 0||r<i.length?n:e},dXe=function(e,t,n){var r=e,i=$i(t)?t.split("."):t;return i.forEach(function(a,o){o<i.length-1?(d_(r[a])||(r[a]=gi(i[o+1])?[]:{}),r=r[a]):r[a]=n}),e};var hXe=Object.prototype.hasOwnProperty;const g8=function(e,t){if(e===null||!wf(e))return{};var n={};return d8(t,function(r){hXe.call(e,r)&&(n[r]=e[r])}),n},m8=function(e,t){return Vie(e,function(n,r,i){return t.includes(i)||(n[i]=r),n},{})},Vp=function(e,t,n){var r,i,a,o,s=0;n||(n={});var l=function(){s=n.leading===!1?0:Date.now(),r=null,o=e.apply(i,a),r||(i=a=null)},c=function(){var u=Date.now();!s&&n.leading===!1&&(s=u);var f=t-(u-s);return i=this,a=arguments,f<=0||f>t?(r&&(clearTimeout(r),r=null),s=u,o=e.apply(i,a),r||(i=a=null)):!r&&n.trailing!==!1&&(r=setTimeout(l,f)),o};return c.cancel=function(){clearTimeout(r),s=0,r=i=a=null},c},y8=function(){},qp=function(e){return e};function ix(e){return Pn(e)?0:Wm(e)?e.length:Object.keys(e).length}var Jie={x1:0,y1:0,x2:0,y2:0,x:0,y:0,qx:null,qy:null};function pXe(e,t,n){if(e[n].length>7){e[n].shift();for(var r=e[n],i=n;r.length;)t[n]="A",e.splice(i+=1,0,["C"].concat(r.splice(0,6)));e.splice(n,1)}}var ax={a:7,c:6,h:1,l:2,m:2,r:4,q:4,s:4,t:2,v:1,z:0};function eae(e){return Array.isArray(e)&&e.every(function(t){var n=t[0].toLowerCase();return ax[n]===t.length-1&&"achlmqstvz".includes(n)})}function tae(e){return eae(e)&&e.every(function(t){var n=t[0];return n===n.toUpperCase()})}function nae(e){return tae(e)&&e.every(function(t){var n=t[0];return"ACLMQZ".includes(n)})}function rae(e){for(var t=e.pathValue[e.segmentStart],n=t.toLowerCase(),r=e.data;r.length>=ax[n]&&(n==="m"&&r.length>2?(e.segments.push([t].concat(r.splice(0,2))),n="l",t=t==="m"?"l":"L"):e.segments.push([t].concat(r.splice(0,ax[n]))),!!ax[n]););}function vXe(e){var t=e.index,n=e.pathValue,r=n.charCodeAt(t);if(r===48){e.param=0,e.index+=1;return}if(r===49){e.param=1,e.index+=1;return}e.err='[path-util]: invalid Arc flag "'.concat(n[t],'", expecting 0 or 1 at index ').concat(t)}function gXe(e){return e>=48&&e<=57||e===43||e===45||e===46}function qm(e){return e>=48&&e<=57}function mXe(e){var t=e.max,n=e.pathValue,r=e.index,i=r,a=!1,o=!1,s=!1,l=!1,c;if(i>=t){e.err="[path-util]: Invalid path value at index ".concat(i,', "pathValue" is missing param');return}if(c=n.charCodeAt(i),(c===43||c===45)&&(i+=1,c=n.charCodeAt(i)),!qm(c)&&c!==46){e.err="[path-util]: Invalid path value at index ".concat(i,', "').concat(n[i],'" is not a number');return}if(c!==46){if(a=c===48,i+=1,c=n.charCodeAt(i),a&&i<t&&c&&qm(c)){e.err="[path-util]: Invalid path value at index ".concat(r,', "').concat(n[r],'" illegal number');return}for(;i<t&&qm(n.charCodeAt(i));)i+=1,o=!0;c=n.charCodeAt(i)}if(c===46){for(l=!0,i+=1;qm(n.charCodeAt(i));)i+=1,s=!0;c=n.charCodeAt(i)}if(c===101||c===69){if(l&&!o&&!s){e.err="[path-util]: Invalid path value at index ".concat(i,', "').concat(n[i],'" invalid float exponent');return}if(i+=1,c=n.charCodeAt(i),(c===43||c===45)&&(i+=1),i<t&&qm(n.charCodeAt(i)))for(;i<t&&qm(n.charCodeAt(i));)i+=1;else{e.err="[path-util]: Invalid path value at index ".concat(i,', "').concat(n[i],'" invalid integer exponent');return}}e.index=i,e.param=+e.pathValue.slice(r,i)}function yXe(e){var t=[5760,6158,8192,8193,8194,8195,8196,8197,8198,8199,8200,8201,8202,8239,8287,12288,65279];return e===10||e===13||e===8232||e===8233||e===32||e===9||e===11||e===12||e===160||e>=5760&&t.includes(e)}function g_(e){for(var t=e.pathValue,n=e.max;e.index<n&&yXe(t.charCodeAt(e.index));)e.index+=1}function bXe(e){switch(e|32){case 109:case 122:case 108:case 104:case 118:case 99:case 115:case 113:case 116:case 97:return!0;default:return!1}}function xXe(e){return(e|32)===97}function SXe(e){var t=e.max,n=e.pathValue,r=e.index,i=n.charCodeAt(r),a=ax[n[r].toLowerCase()];if(e.segmentStart=r,!bXe(i)){e.err='[path-util]: Invalid path value "'.concat(n[r],'" is not a path command');return}if(e.index+=1,g_(e),e.data=[],!a){rae(e);return}for(;;){for(var o=a;o>0;o-=1){if(xXe(i)&&(o===3||o===4)?vXe(e):mXe(e),e.err.length)return;e.data.push(e.param),g_(e),e.index<t&&n.charCodeAt(e.index)===44&&(e.index+=1,g_(e))}if(e.index>=e.max||!gXe(n.charCodeAt(e.index)))break}rae(e)}var wXe=function(){function e(t){this.pathValue=t,this.segments=[],this.max=t.length,this.index=0,this.param=0,this.segmentStart=0,this.data=[],this.err=""}return e}();function CXe(e){if(eae(e))return[].concat(e);var t=new wXe(e);for(g_(t);t.index<t.max&&!t.err.length;)SXe(t);return t.err?t.err:t.segments}function EXe(e){if(tae(e))return[].concat(e);var t=CXe(e),n=0,r=0,i=0,a=0;return t.map(function(o){var s=o.slice(1).map(Number),l=o[0],c=l.toUpperCase();if(l==="M")return n=s[0],r=s[1],i=n,a=r,["M",n,r];var u;if(l!==c)switch(c){case"A":u=[c,s[0],s[1],s[2],s[3],s[4],s[5]+n,s[6]+r];break;case"V":u=[c,s[0]+r];break;case"H":u=[c,s[0]+n];break;default:{var f=s.map(function(h,p){return h+(p%2?r:n)});u=[c].concat(f)}}else u=[c].concat(s);var d=u.length;switch(c){case"Z":n=i,r=a;break;case"H":n=u[1];break;case"V":r=u[1];break;default:n=u[d-2],r=u[d-1],c==="M"&&(i=n,a=r)}return u})}function OXe(e,t){var n=e[0],r=t.x1,i=t.y1,a=t.x2,o=t.y2,s=e.slice(1).map(Number),l=e;if("TQ".includes(n)||(t.qx=null,t.qy=null),n==="H")l=["L",e[1],i];else if(n==="V")l=["L",r,e[1]];else if(n==="S"){var c=r*2-a,u=i*2-o;t.x1=c,t.y1=u,l=["C",c,u].concat(s)}else if(n==="T"){var f=r*2-t.qx,d=i*2-t.qy;t.qx=f,t.qy=d,l=["Q",f,d].concat(s)}else if(n==="Q"){var h=s[0],p=s[1];t.qx=h,t.qy=p}return l}function m_(e){if(nae(e))return[].concat(e);for(var t=EXe(e),n=dt({},Jie),r=0;r<t.length;r+=1){t[r]=OXe(t[r],n);var i=t[r],a=i.length;n.x1=+i[a-2],n.y1=+i[a-1],n.x2=+i[a-4]||n.x1,n.y2=+i[a-3]||n.y1}return t}function _Xe(e){return nae(e)&&e.every(function(t){var n=t[0];return"MC".includes(n)})}function y_(e,t,n){var r=e*Math.cos(n)-t*Math.sin(n),i=e*Math.sin(n)+t*Math.cos(n);return{x:r,y:i}}function b8(e,t,n,r,i,a,o,s,l,c){var u=e,f=t,d=n,h=r,p=s,v=l,g=Math.PI*120/180,m=Math.PI/180*(+i||0),y=[],x,S,w,C,E;if(c)S=c[0],w=c[1],C=c[2],E=c[3];else{x=y_(u,f,-m),u=x.x,f=x.y,x=y_(p,v,-m),p=x.x,v=x.y;var O=(u-p)/2,$=(f-v)/2,P=O*O/(d*d)+$*$/(h*h);P>1&&(P=Math.sqrt(P),d*=P,h*=P);var M=d*d,k=h*h,T=(a===o?-1:1)*Math.sqrt(Math.abs((M*k-M*$*$-k*O*O)/(M*$*$+k*O*O)));C=T*d*$/h+(u+p)/2,E=T*-h*O/d+(f+v)/2,S=Math.asin(((f-E)/h*Math.pow(10,9)>>0)/Math.pow(10,9)),w=Math.asin(((v-E)/h*Math.pow(10,9)>>0)/Math.pow(10,9)),S=u<C?Math.PI-S:S,w=p<C?Math.PI-w:w,S<0&&(S=Math.PI*2+S),w<0&&(w=Math.PI*2+w),o&&S>w&&(S-=Math.PI*2),!o&&w>S&&(w-=Math.PI*2)}var R=w-S;if(Math.abs(R)>g){var A=w,N=p,L=v;w=S+g*(o&&w>S?1:-1),p=C+d*Math.cos(w),v=E+h*Math.sin(w),y=b8(p,v,d,h,i,0,o,N,L,[w,A,C,E])}R=w-S;var j=Math.cos(S),F=Math.sin(S),B=Math.cos(w),D=Math.sin(w),z=Math.tan(R/4),W=4/3*d*z,q=4/3*h*z,H=[u,f],U=[u+W*F,f-q*j],G=[p+W*D,v-q*B],K=[p,v];if(U[0]=2*H[0]-U[0],U[1]=2*H[1]-U[1],c)return U.concat(G,K,y);y=U.concat(G,K,y);for(var X=[],Q=0,ee=y.length;Q<ee;Q+=1)X[Q]=Q%2?y_(y[Q-1],y[Q],m).y:y_(y[Q],y[Q+1],m).x;return X}function $Xe(e,t,n,r,i,a){var o=.3333333333333333,s=2/3;return[o*e+s*n,o*t+s*r,o*i+s*n,o*a+s*r,i,a]}function eh(e,t,n){var r=e[0],i=e[1],a=t[0],o=t[1];return[r+(a-r)*n,i+(o-i)*n]}var iae=function(e,t,n,r){var i=.5,a=eh([e,t],[n,r],i);return nn(nn([],a,!0),[n,r,n,r],!1)};function PXe(e,t){var n=e[0],r=e.slice(1).map(Number),i=r[0],a=r[1],o,s=t.x1,l=t.y1,c=t.x,u=t.y;switch("TQ".includes(n)||(t.qx=null,t.qy=null),n){case"M":return t.x=i,t.y=a,e;case"A":return o=[s,l].concat(r),["C"].concat(b8(o[0],o[1],o[2],o[3],o[4],o[5],o[6],o[7],o[8],o[9]));case"Q":return t.qx=i,t.qy=a,o=[s,l].concat(r),["C"].concat($Xe(o[0],o[1],o[2],o[3],o[4],o[5]));case"L":return["C"].concat(iae(s,l,i,a));case"Z":return s===c&&l===u?["C",s,l,c,u,c,u]:["C"].concat(iae(s,l,c,u))}return e}function x8(e,t){if(t===void 0&&(t=!1),_Xe(e)){var n=[].concat(e);return t?[n,[]]:n}for(var r=m_(e),i=dt({},Jie),a=[],o="",s=r.length,l,c,u=[],f=0;f<s;f+=1){r[f]&&(o=r[f][0]),a[f]=o;var d=PXe(r[f],i);r[f]=d,pXe(r,a,f),s=r.length,o==="Z"&&u.push(f),l=r[f],c=l.length,i.x1=+l[c-2],i.y1=+l[c-1],i.x2=+l[c-4]||i.x1,i.y2=+l[c-3]||i.y1}return t?[r,u]:r}function MXe(e){return e.map(function(t){return Array.isArray(t)?[].concat(t):t})}function kXe(e){var t=e.slice(1).map(function(n,r,i){return r?i[r-1].slice(-2).concat(n.slice(1)):e[0].slice(1).concat(n.slice(1))}).map(function(n){return n.map(function(r,i){return n[n.length-i-2*(1-i%2)]})}).reverse();return[["M"].concat(t[0].slice(0,2))].concat(t.map(function(n){return["C"].concat(n.slice(2))}))}function Cs(e,t){return Math.sqrt((e[0]-t[0])*(e[0]-t[0])+(e[1]-t[1])*(e[1]-t[1]))}function S8(e,t,n,r,i){var a=Cs([e,t],[n,r]),o={x:0,y:0};if(typeof i=="number")if(i<=0)o={x:e,y:t};else if(i>=a)o={x:n,y:r};else{var s=eh([e,t],[n,r],i/a),l=s[0],c=s[1];o={x:l,y:c}}return{length:a,point:o,min:{x:Math.min(e,n),y:Math.min(t,r)},max:{x:Math.max(e,n),y:Math.max(t,r)}}}function aae(e,t){var n=e.x,r=e.y,i=t.x,a=t.y,o=n*i+r*a,s=Math.sqrt((Math.pow(n,2)+Math.pow(r,2))*(Math.pow(i,2)+Math.pow(a,2))),l=n*a-r*i<0?-1:1,c=l*Math.acos(o/s);return c}function TXe(e,t,n,r,i,a,o,s,l,c){var u=Math.abs,f=Math.sin,d=Math.cos,h=Math.sqrt,p=Math.PI,v=u(n),g=u(r),m=(i%360+360)%360,y=m*(p/180);if(e===s&&t===l)return{x:e,y:t};if(v===0||g===0)return S8(e,t,s,l,c).point;var x=(e-s)/2,S=(t-l)/2,w={x:d(y)*x+f(y)*S,y:-f(y)*x+d(y)*S},C=Math.pow(w.x,2)/Math.pow(v,2)+Math.pow(w.y,2)/Math.pow(g,2);C>1&&(v*=h(C),g*=h(C));var E=Math.pow(v,2)*Math.pow(g,2)-Math.pow(v,2)*Math.pow(w.y,2)-Math.pow(g,2)*Math.pow(w.x,2),O=Math.pow(v,2)*Math.pow(w.y,2)+Math.pow(g,2)*Math.pow(w.x,2),$=E/O;$=$<0?0:$;var P=(a!==o?1:-1)*h($),M={x:P*(v*w.y/g),y:P*(-(g*w.x)/v)},k={x:d(y)*M.x-f(y)*M.y+(e+s)/2,y:f(y)*M.x+d(y)*M.y+(t+l)/2},T={x:(w.x-M.x)/v,y:(w.y-M.y)/g},R=aae({x:1,y:0},T),A={x:(-w.x-M.x)/v,y:(-w.y-M.y)/g},N=aae(T,A);!o&&N>0?N-=2*p:o&&N<0&&(N+=2*p),N%=2*p;var L=R+N*c,j=v*d(L),F=g*f(L),B={x:d(y)*j-f(y)*F+k.x,y:f(y)*j+d(y)*F+k.y};return B}function RXe(e,t,n,r,i,a,o,s,l,c,u){var f,d=u.bbox,h=d===void 0?!0:d,p=u.length,v=p===void 0?!0:p,g=u.sampleSize,m=g===void 0?30:g,y=typeof c=="number",x=e,S=t,w=0,C=[x,S,w],E=[x,S],O=0,$={x:0,y:0},P=[{x,y:S}];y&&c<=0&&($={x,y:S});for(var M=0;M<=m;M+=1){if(O=M/m,f=TXe(e,t,n,r,i,a,o,s,l,O),x=f.x,S=f.y,h&&P.push({x,y:S}),v&&(w+=Cs(E,[x,S])),E=[x,S],y&&w>=c&&c>C[2]){var k=(w-c)/(w-C[2]);$={x:E[0]*(1-k)+C[0]*k,y:E[1]*(1-k)+C[1]*k}}C=[x,S,w]}return y&&c>=w&&($={x:s,y:l}),{length:w,point:$,min:{x:Math.min.apply(null,P.map(function(T){return T.x})),y:Math.min.apply(null,P.map(function(T){return T.y}))},max:{x:Math.max.apply(null,P.map(function(T){return T.x})),y:Math.max.apply(null,P.map(function(T){return T.y}))}}}function IXe(e,t,n,r,i,a,o,s,l){var c=1-l;return{x:Math.pow(c,3)*e+3*Math.pow(c,2)*l*n+3*c*Math.pow(l,2)*i+Math.pow(l,3)*o,y:Math.pow(c,3)*t+3*Math.pow(c,2)*l*r+3*c*Math.pow(l,2)*a+Math.pow(l,3)*s}}function oae(e,t,n,r,i,a,o,s,l,c){var u,f=c.bbox,d=f===void 0?!0:f,h=c.length,p=h===void 0?!0:h,v=c.sampleSize,g=v===void 0?10:v,m=typeof l=="number",y=e,x=t,S=0,w=[y,x,S],C=[y,x],E=0,O={x:0,y:0},$=[{x:y,y:x}];m&&l<=0&&(O={x:y,y:x});for(var P=0;P<=g;P+=1){if(E=P/g,u=IXe(e,t,n,r,i,a,o,s,E),y=u.x,x=u.y,d&&$.push({x:y,y:x}),p&&(S+=Cs(C,[y,x])),C=[y,x],m&&S>=l&&l>w[2]){var M=(S-l)/(S-w[2]);O={x:C[0]*(1-M)+w[0]*M,y:C[1]*(1-M)+w[1]*M}}w=[y,x,S]}return m&&l>=S&&(O={x:o,y:s}),{length:S,point:O,min:{x:Math.min.apply(null,$.map(function(k){return k.x})),y:Math.min.apply(null,$.map(function(k){return k.y}))},max:{x:Math.max.apply(null,$.map(function(k){return k.x})),y:Math.max.apply(null,$.map(function(k){return k.y}))}}}function AXe(e,t,n,r,i,a,o){var s=1-o;return{x:Math.pow(s,2)*e+2*s*o*n+Math.pow(o,2)*i,y:Math.pow(s,2)*t+2*s*o*r+Math.pow(o,2)*a}}function NXe(e,t,n,r,i,a,o,s){var l,c=s.bbox,u=c===void 0?!0:c,f=s.length,d=f===void 0?!0:f,h=s.sampleSize,p=h===void 0?10:h,v=typeof o=="number",g=e,m=t,y=0,x=[g,m,y],S=[g,m],w=0,C={x:0,y:0},E=[{x:g,y:m}];v&&o<=0&&(C={x:g,y:m});for(var O=0;O<=p;O+=1){if(w=O/p,l=AXe(e,t,n,r,i,a,w),g=l.x,m=l.y,u&&E.push({x:g,y:m}),d&&(y+=Cs(S,[g,m])),S=[g,m],v&&y>=o&&o>x[2]){var $=(y-o)/(y-x[2]);C={x:S[0]*(1-$)+x[0]*$,y:S[1]*(1-$)+x[1]*$}}x=[g,m,y]}return v&&o>=y&&(C={x:i,y:a}),{length:y,point:C,min:{x:Math.min.apply(null,E.map(function(P){return P.x})),y:Math.min.apply(null,E.map(function(P){return P.y}))},max:{x:Math.max.apply(null,E.map(function(P){return P.x})),y:Math.max.apply(null,E.map(function(P){return P.y}))}}}function sae(e,t,n){for(var r,i,a,o,s,l,c=m_(e),u=typeof t=="number",f,d=[],h,p=0,v=0,g=0,m=0,y,x=[],S=[],w=0,C={x:0,y:0},E=C,O=C,$=C,P=0,M=0,k=c.length;M<k;M+=1)y=c[M],h=y[0],f=h==="M",d=f?d:[p,v].concat(y.slice(1)),f?(g=y[1],m=y[2],C={x:g,y:m},E=C,w=0,u&&t<.001&&($=C)):h==="L"?(r=S8(d[0],d[1],d[2],d[3],(t||0)-P),w=r.length,C=r.min,E=r.max,O=r.point):h==="A"?(i=RXe(d[0],d[1],d[2],d[3],d[4],d[5],d[6],d[7],d[8],(t||0)-P,n||{}),w=i.length,C=i.min,E=i.max,O=i.point):h==="C"?(a=oae(d[0],d[1],d[2],d[3],d[4],d[5],d[6],d[7],(t||0)-P,n||{}),w=a.length,C=a.min,E=a.max,O=a.point):h==="Q"?(o=NXe(d[0],d[1],d[2],d[3],d[4],d[5],(t||0)-P,n||{}),w=o.length,C=o.min,E=o.max,O=o.point):h==="Z"&&(d=[p,v,g,m],s=S8(d[0],d[1],d[2],d[3],(t||0)-P),w=s.length,C=s.min,E=s.max,O=s.point),u&&P<t&&P+w>=t&&($=O),S.push(E),x.push(C),P+=w,l=h!=="Z"?y.slice(-2):[g,m],p=l[0],v=l[1];return u&&t>=P&&($={x:p,y:v}),{length:P,point:$,min:{x:Math.min.apply(null,x.map(function(T){return T.x})),y:Math.min.apply(null,x.map(function(T){return T.y}))},max:{x:Math.max.apply(null,S.map(function(T){return T.x})),y:Math.max.apply(null,S.map(function(T){return T.y}))}}}function LXe(e,t){return sae(e,void 0,dt(dt({},t),{bbox:!1,length:!0})).length}function jXe(e){var t=e.length,n=t-1;return e.map(function(r,i){return e.map(function(a,o){var s=i+o,l;return o===0||e[s]&&e[s][0]==="M"?(l=e[s],["M"].concat(l.slice(-2))):(s>=t&&(s-=n),e[s])})})}function DXe(e,t){var n=e.length-1,r=[],i=0,a=0,o=jXe(e);return o.forEach(function(s,l){e.slice(1).forEach(function(c,u){a+=Cs(e[(l+u)%n].slice(-2),t[u%n].slice(-2))}),r[l]=a,a=0}),i=r.indexOf(Math.min.apply(null,r)),o[i]}function FXe(e,t,n,r,i,a,o,s){return 3*((s-t)*(n+i)-(o-e)*(r+a)+r*(e-i)-n*(t-a)+s*(i+e/3)-o*(a+t/3))/20}function BXe(e){var t=0,n=0,r=0;return x8(e).map(function(i){var a;switch(i[0]){case"M":return t=i[1],n=i[2],0;default:var o=i.slice(1),s=o[0],l=o[1],c=o[2],u=o[3],f=o[4],d=o[5];return r=FXe(t,n,s,l,c,u,f,d),a=i.slice(-2),t=a[0],n=a[1],r}}).reduce(function(i,a){return i+a},0)}function lae(e){return BXe(e)>=0}function zXe(e,t,n){return sae(e,t,dt(dt({},n),{bbox:!1,length:!0})).point}function HXe(e,t){t===void 0&&(t=.5);var n=e.slice(0,2),r=e.slice(2,4),i=e.slice(4,6),a=e.slice(6,8),o=eh(n,r,t),s=eh(r,i,t),l=eh(i,a,t),c=eh(o,s,t),u=eh(s,l,t),f=eh(c,u,t);return[["C"].concat(o,c,f),["C"].concat(u,l,a)]}function cae(e){return e.map(function(t,n,r){var i=n&&r[n-1].slice(-2).concat(t.slice(1)),a=n?oae(i[0],i[1],i[2],i[3],i[4],i[5],i[6],i[7],i[8],{bbox:!1}).length:0,o;return n?o=a?HXe(i):[t,t]:o=[t],{s:t,ss:o,l:a}})}function uae(e,t,n){var r=cae(e),i=cae(t),a=r.length,o=i.length,s=r.filter(function(g){return g.l}).length,l=i.filter(function(g){return g.l}).length,c=r.filter(function(g){return g.l}).reduce(function(g,m){var y=m.l;return g+y},0)/s||0,u=i.filter(function(g){return g.l}).reduce(function(g,m){var y=m.l;return g+y},0)/l||0,f=n||Math.max(a,o),d=[c,u],h=[f-a,f-o],p=0,v=[r,i].map(function(g,m){return g.l===f?g.map(function(y){return y.s}):g.map(function(y,x){return p=x&&h[m]&&y.l>=d[m],h[m]-=p?1:0,p?y.ss:[y.s]}).flat()});return v[0].length===v[1].length?v:uae(v[0],v[1],f)}function fae(e){var t=document.createElement("div");t.innerHTML=e;var n=t.childNodes[0];return n&&t.contains(n)&&t.removeChild(n),n}function WXe(e,t){for(;!{}.hasOwnProperty.call(e,t)&&(e=tf(e))!==null;);return e}function w8(){return w8=typeof Reflect!="undefined"&&Reflect.get?Reflect.get.bind():function(e,t,n){var r=WXe(e,t);if(r){var i=Object.getOwnPropertyDescriptor(r,t);return i.get?i.get.call(arguments.length<3?e:n):i.value}},w8.apply(null,arguments)}function dae(e,t,n,r){var i=w8(tf(e.prototype),t,n);return typeof i=="function"?function(a){return i.apply(n,a)}:i}function b_(e,t,n){e.prototype=t.prototype=n,n.constructor=e}function C8(e,t){var n=Object.create(e.prototype);for(var r in t)n[r]=t[r];return n}function Um(){}var Up=.7,Gm=1/Up,Km="\\s*([+-]?\\d+)\\s*",ox="\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)\\s*",vu="\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)%\\s*",VXe=/^#([0-9a-f]{3,8})$/,qXe=new RegExp(`^rgb\\(${Km},${Km},${Km}\\)$`),UXe=new RegExp(`^rgb\\(${vu},${vu},${vu}\\)$`),GXe=new RegExp(`^rgba\\(${Km},${Km},${Km},${ox}\\)$`),KXe=new RegExp(`^rgba\\(${vu},${vu},${vu},${ox}\\)$`),YXe=new RegExp(`^hsl\\(${ox},${vu},${vu}\\)$`),XXe=new RegExp(`^hsla\\(${ox},${vu},${vu},${ox}\\)$`),hae={aliceblue:15792383,antiquewhite:16444375,aqua:65535,aquamarine:8388564,azure:15794175,beige:16119260,bisque:16770244,black:0,blanchedalmond:16772045,blue:255,blueviolet:9055202,brown:10824234,burlywood:14596231,cadetblue:6266528,chartreuse:8388352,chocolate:13789470,coral:16744272,cornflowerblue:6591981,cornsilk:16775388,crimson:14423100,cyan:65535,darkblue:139,darkcyan:35723,darkgoldenrod:12092939,darkgray:11119017,darkgreen:25600,darkgrey:11119017,darkkhaki:12433259,darkmagenta:9109643,darkolivegreen:5597999,darkorange:16747520,darkorchid:10040012,darkred:9109504,darksalmon:15308410,darkseagreen:9419919,darkslateblue:4734347,darkslategray:3100495,darkslategrey:3100495,darkturquoise:52945,darkviolet:9699539,deeppink:16716947,deepskyblue:49151,dimgray:6908265,dimgrey:6908265,dodgerblue:2003199,firebrick:11674146,floralwhite:16775920,forestgreen:2263842,fuchsia:16711935,gainsboro:14474460,ghostwhite:16316671,gold:16766720,goldenrod:14329120,gray:8421504,green:32768,greenyellow:11403055,grey:8421504,honeydew:15794160,hotpink:16738740,indianred:13458524,indigo:4915330,ivory:16777200,khaki:15787660,lavender:15132410,lavenderblush:16773365,lawngreen:8190976,lemonchiffon:16775885,lightblue:11393254,lightcoral:15761536,lightcyan:14745599,lightgoldenrodyellow:16448210,lightgray:13882323,lightgreen:9498256,lightgrey:13882323,lightpink:16758465,lightsalmon:16752762,lightseagreen:2142890,lightskyblue:8900346,lightslategray:7833753,lightslategrey:7833753,lightsteelblue:11584734,lightyellow:16777184,lime:65280,limegreen:3329330,linen:16445670,magenta:16711935,maroon:8388608,mediumaquamarine:6737322,mediumblue:205,mediumorchid:12211667,mediumpurple:9662683,mediumseagreen:3978097,mediumslateblue:8087790,mediumspringgreen:64154,mediumturquoise:4772300,mediumvioletred:13047173,midnightblue:1644912,mintcream:16121850,mistyrose:16770273,moccasin:16770229,navajowhite:16768685,navy:128,oldlace:16643558,olive:8421376,olivedrab:7048739,orange:16753920,orangered:16729344,orchid:14315734,palegoldenrod:15657130,palegreen:10025880,paleturquoise:11529966,palevioletred:14381203,papayawhip:16773077,peachpuff:16767673,peru:13468991,pink:16761035,plum:14524637,powderblue:11591910,purple:8388736,rebeccapurple:6697881,red:16711680,rosybrown:12357519,royalblue:4286945,saddlebrown:9127187,salmon:16416882,sandybrown:16032864,seagreen:3050327,seashell:16774638,sienna:10506797,silver:12632256,skyblue:8900331,slateblue:6970061,slategray:7372944,slategrey:7372944,snow:16775930,springgreen:65407,steelblue:4620980,tan:13808780,teal:32896,thistle:14204888,tomato:16737095,turquoise:4251856,violet:15631086,wheat:16113331,white:16777215,whitesmoke:16119285,yellow:16776960,yellowgreen:10145074};b_(Um,x_,{copy(e){return Object.assign(new this.constructor,this,e)},displayable(){return this.rgb().displayable()},hex:pae,formatHex:pae,formatHex8:ZXe,formatHsl:QXe,formatRgb:vae,toString:vae});function pae(){return this.rgb().formatHex()}function ZXe(){return this.rgb().formatHex8()}function QXe(){return Sae(this).formatHsl()}function vae(){return this.rgb().formatRgb()}function x_(e){var t,n;return e=(e+"").trim().toLowerCase(),(t=VXe.exec(e))?(n=t[1].length,t=parseInt(t[1],16),n===6?gae(t):n===3?new jo(t>>8&15|t>>4&240,t>>4&15|t&240,(t&15)<<4|t&15,1):n===8?S_(t>>24&255,t>>16&255,t>>8&255,(t&255)/255):n===4?S_(t>>12&15|t>>8&240,t>>8&15|t>>4&240,t>>4&15|t&240,((t&15)<<4|t&15)/255):null):(t=qXe.exec(e))?new jo(t[1],t[2],t[3],1):(t=UXe.exec(e))?new jo(t[1]*255/100,t[2]*255/100,t[3]*255/100,1):(t=GXe.exec(e))?S_(t[1],t[2],t[3],t[4]):(t=KXe.exec(e))?S_(t[1]*255/100,t[2]*255/100,t[3]*255/100,t[4]):(t=YXe.exec(e))?xae(t[1],t[2]/100,t[3]/100,1):(t=XXe.exec(e))?xae(t[1],t[2]/100,t[3]/100,t[4]):hae.hasOwnProperty(e)?gae(hae[e]):e==="transparent"?new jo(NaN,NaN,NaN,0):null}function gae(e){return new jo(e>>16&255,e>>8&255,e&255,1)}function S_(e,t,n,r){return r<=0&&(e=t=n=NaN),new jo(e,t,n,r)}function mae(e){return e instanceof Um||(e=x_(e)),e?(e=e.rgb(),new jo(e.r,e.g,e.b,e.opacity)):new jo}function sx(e,t,n,r){return arguments.length===1?mae(e):new jo(e,t,n,r==null?1:r)}function jo(e,t,n,r){this.r=+e,this.g=+t,this.b=+n,this.opacity=+r}b_(jo,sx,C8(Um,{brighter(e){return e=e==null?Gm:Math.pow(Gm,e),new jo(this.r*e,this.g*e,this.b*e,this.opacity)},darker(e){return e=e==null?Up:Math.pow(Up,e),new jo(this.r*e,this.g*e,this.b*e,this.opacity)},rgb(){return this},clamp(){return new jo(Gp(this.r),Gp(this.g),Gp(this.b),w_(this.opacity))},displayable(){return-.5<=this.r&&this.r<255.5&&-.5<=this.g&&this.g<255.5&&-.5<=this.b&&this.b<255.5&&0<=this.opacity&&this.opacity<=1},hex:yae,formatHex:yae,formatHex8:JXe,formatRgb:bae,toString:bae}));function yae(){return`#${Kp(this.r)}${Kp(this.g)}${Kp(this.b)}`}function JXe(){return`#${Kp(this.r)}${Kp(this.g)}${Kp(this.b)}${Kp((isNaN(this.opacity)?1:this.opacity)*255)}`}function bae(){const e=w_(this.opacity);return`${e===1?"rgb(":"rgba("}${Gp(this.r)}, ${Gp(this.g)}, ${Gp(this.b)}${e===1?")":`, ${e})`}`}function w_(e){return isNaN(e)?1:Math.max(0,Math.min(1,e))}function Gp(e){return Math.max(0,Math.min(255,Math.round(e)||0))}function Kp(e){return e=Gp(e),(e<16?"0":"")+e.toString(16)}function xae(e,t,n,r){return r<=0?e=t=n=NaN:n<=0||n>=1?e=t=NaN:t<=0&&(e=NaN),new Rc(e,t,n,r)}function Sae(e){if(e instanceof Rc)return new Rc(e.h,e.s,e.l,e.opacity);if(e instanceof Um||(e=x_(e)),!e)return new Rc;if(e instanceof Rc)return e;e=e.rgb();var t=e.r/255,n=e.g/255,r=e.b/255,i=Math.min(t,n,r),a=Math.max(t,n,r),o=NaN,s=a-i,l=(a+i)/2;return s?(t===a?o=(n-r)/s+(n<r)*6:n===a?o=(r-t)/s+2:o=(t-n)/s+4,s/=l<.5?a+i:2-a-i,o*=60):s=l>0&&l<1?0:o,new Rc(o,s,l,e.opacity)}function eZe(e,t,n,r){return arguments.length===1?Sae(e):new Rc(e,t,n,r==null?1:r)}function Rc(e,t,n,r){this.h=+e,this.s=+t,this.l=+n,this.opacity=+r}b_(Rc,eZe,C8(Um,{brighter(e){return e=e==null?Gm:Math.pow(Gm,e),new Rc(this.h,this.s,this.l*e,this.opacity)},darker(e){return e=e==null?Up:Math.pow(Up,e),new Rc(this.h,this.s,this.l*e,this.opacity)},rgb(){var e=this.h%360+(this.h<0)*360,t=isNaN(e)||isNaN(this.s)?0:this.s,n=this.l,r=n+(n<.5?n:1-n)*t,i=2*n-r;return new jo(E8(e>=240?e-240:e+120,i,r),E8(e,i,r),E8(e<120?e+240:e-120,i,r),this.opacity)},clamp(){return new Rc(wae(this.h),C_(this.s),C_(this.l),w_(this.opacity))},displayable(){return(0<=this.s&&this.s<=1||isNaN(this.s))&&0<=this.l&&this.l<=1&&0<=this.opacity&&this.opacity<=1},formatHsl(){const e=w_(this.opacity);return`${e===1?"hsl(":"hsla("}${wae(this.h)}, ${C_(this.s)*100}%, ${C_(this.l)*100}%${e===1?")":`, ${e})`}`}}));function wae(e){return e=(e||0)%360,e<0?e+360:e}function C_(e){return Math.max(0,Math.min(1,e||0))}function E8(e,t,n){return(e<60?t+(n-t)*e/60:e<180?n:e<240?t+(n-t)*(240-e)/60:t)*255}const tZe=Math.PI/180,nZe=180/Math.PI;var Cae=-.14861,O8=1.78277,_8=-.29227,E_=-.90649,lx=1.97294,Eae=lx*E_,Oae=lx*O8,_ae=O8*_8-E_*Cae;function rZe(e){if(e instanceof Yp)return new Yp(e.h,e.s,e.l,e.opacity);e instanceof jo||(e=mae(e));var t=e.r/255,n=e.g/255,r=e.b/255,i=(_ae*r+Eae*t-Oae*n)/(_ae+Eae-Oae),a=r-i,o=(lx*(n-i)-_8*a)/E_,s=Math.sqrt(o*o+a*a)/(lx*i*(1-i)),l=s?Math.atan2(o,a)*nZe-120:NaN;return new Yp(l<0?l+360:l,s,i,e.opacity)}function gu(e,t,n,r){return arguments.length===1?rZe(e):new Yp(e,t,n,r==null?1:r)}function Yp(e,t,n,r){this.h=+e,this.s=+t,this.l=+n,this.opacity=+r}b_(Yp,gu,C8(Um,{brighter(e){return e=e==null?Gm:Math.pow(Gm,e),new Yp(this.h,this.s,this.l*e,this.opacity)},darker(e){return e=e==null?Up:Math.pow(Up,e),new Yp(this.h,this.s,this.l*e,this.opacity)},rgb(){var e=isNaN(this.h)?0:(this.h+120)*tZe,t=+this.l,n=isNaN(this.s)?0:this.s*t*(1-t),r=Math.cos(e),i=Math.sin(e);return new jo(255*(t+n*(Cae*r+O8*i)),255*(t+n*(_8*r+E_*i)),255*(t+n*(lx*r)),this.opacity)}}));function Cf(e,t,n,r){var i=e-n,a=t-r;return Math.sqrt(i*i+a*a)}function $ae(e,t){var n=Math.min.apply(Math,nn([],Ce(e),!1)),r=Math.min.apply(Math,nn([],Ce(t),!1)),i=Math.max.apply(Math,nn([],Ce(e),!1)),a=Math.max.apply(Math,nn([],Ce(t),!1));return{x:n,y:r,width:i-n,height:a-r}}function iZe(e,t,n){return Math.atan(-t/e*Math.tan(n))}function aZe(e,t,n){return Math.atan(t/(e*Math.tan(n)))}function oZe(e,t,n,r,i,a){return n*Math.cos(i)*Math.cos(a)-r*Math.sin(i)*Math.sin(a)+e}function sZe(e,t,n,r,i,a){return n*Math.sin(i)*Math.cos(a)+r*Math.cos(i)*Math.sin(a)+t}function lZe(e,t,n,r,i,a,o){for(var s=iZe(n,r,i),l=1/0,c=-1/0,u=[a,o],f=-Math.PI*2;f<=Math.PI*2;f+=Math.PI){var d=s+f;a<o?a<d&&d<o&&u.push(d):o<d&&d<a&&u.push(d)}for(var f=0;f<u.length;f++){var h=oZe(e,t,n,r,i,u[f]);h<l&&(l=h),h>c&&(c=h)}for(var p=aZe(n,r,i),v=1/0,g=-1/0,m=[a,o],f=-Math.PI*2;f<=Math.PI*2;f+=Math.PI){var y=p+f;a<o?a<y&&y<o&&m.push(y):o<y&&y<a&&m.push(y)}for(var f=0;f<m.length;f++){var x=sZe(e,t,n,r,i,m[f]);x<v&&(v=x),x>g&&(g=x)}return{x:l,y:v,width:c-l,height:g-v}}var cZe=1e-4;function Pae(e,t,n,r,i,a){var o=-1,s=1/0,l=[n,r],c=20;a&&a>200&&(c=a/10);for(var u=1/c,f=u/10,d=0;d<=c;d++){var h=d*u,p=[i.apply(void 0,nn([],Ce(e.concat([h])),!1)),i.apply(void 0,nn([],Ce(t.concat([h])),!1))],v=Cf(l[0],l[1],p[0],p[1]);v<s&&(o=h,s=v)}if(o===0)return{x:e[0],y:t[0]};if(o===1){var g=e.length;return{x:e[g-1],y:t[g-1]}}s=1/0;for(var d=0;d<32&&!(f<cZe);d++){var m=o-f,y=o+f,p=[i.apply(void 0,nn([],Ce(e.concat([m])),!1)),i.apply(void 0,nn([],Ce(t.concat([m])),!1))],v=Cf(l[0],l[1],p[0],p[1]);if(m>=0&&v<s)o=m,s=v;else{var x=[i.apply(void 0,nn([],Ce(e.concat([y])),!1)),i.apply(void 0,nn([],Ce(t.concat([y])),!1))],S=Cf(l[0],l[1],x[0],x[1]);y<=1&&S<s?(o=y,s=S):f*=.5}}return{x:i.apply(void 0,nn([],Ce(e.concat([o])),!1)),y:i.apply(void 0,nn([],Ce(t.concat([o])),!1))}}function Mae(e,t,n,r){return Cf(e,t,n,r)}function kae(e,t,n,r,i){return{x:(1-i)*e+i*n,y:(1-i)*t+i*r}}function uZe(e,t,n,r,i,a){var o=[n-e,r-t];if(JYe(o,[0,0]))return Math.sqrt((i-e)*(i-e)+(a-t)*(a-t));var s=[-o[1],o[0]];ZYe(s,s);var l=[i-e,a-t];return Math.abs(QYe(l,s))}function $8(e,t,n,r,i){var a=1-i;return a*a*a*e+3*t*i*a*a+3*n*i*i*a+r*i*i*i}function Tae(e,t,n,r){var i=-3*e+9*t-9*n+3*r,a=6*e-12*t+6*n,o=3*t-3*e,s=[],l,c,u;if(nx(i,0))nx(a,0)||(l=-o/a,l>=0&&l<=1&&s.push(l));else{var f=a*a-4*i*o;nx(f,0)?s.push(-a/(2*i)):f>0&&(u=Math.sqrt(f),l=(-a+u)/(2*i),c=(-a-u)/(2*i),l>=0&&l<=1&&s.push(l),c>=0&&c<=1&&s.push(c))}return s}function fZe(e,t,n,r,i,a,o,s){for(var l=[e,o],c=[t,s],u=Tae(e,n,i,o),f=Tae(t,r,a,s),d=0;d<u.length;d++)l.push($8(e,n,i,o,u[d]));for(var d=0;d<f.length;d++)c.push($8(t,r,a,s,f[d]));return $ae(l,c)}function dZe(e,t,n,r,i,a,o,s,l,c,u){return Pae([e,n,i,o],[t,r,a,s],l,c,$8,u)}function Rae(e,t,n,r,i,a,o,s,l,c,u){var f=dZe(e,t,n,r,i,a,o,s,l,c,u);return Cf(f.x,f.y,l,c)}function hZe(e){if(e.length<2)return 0;for(var t=0,n=0;n<e.length-1;n++){var r=e[n],i=e[n+1];t+=Cf(r[0],r[1],i[0],i[1])}return t}function pZe(e){return hZe(e)}function P8(e,t,n,r){var i=1-r;return i*i*e+2*r*i*t+r*r*n}function Iae(e,t,n){var r=e+n-2*t;if(nx(r,0))return[.5];var i=(e-t)/r;return i<=1&&i>=0?[i]:[]}function vZe(e,t,n,r,i,a){var o=Iae(e,n,i)[0],s=Iae(t,r,a)[0],l=[e,i],c=[t,a];return o!==void 0&&l.push(P8(e,n,i,o)),s!==void 0&&c.push(P8(t,r,a,s)),$ae(l,c)}function gZe(e,t,n,r,i,a,o,s){return Pae([e,n,i],[t,r,a],o,s,P8)}function mZe(e,t,n,r,i,a,o,s){var l=gZe(e,t,n,r,i,a,o,s);return Cf(l.x,l.y,o,s)}/*!
  * @antv/g-lite
  * @description A core module for rendering engine implements DOM API.
  * @version 2.2.14
@@ -862,4 +862,4 @@ function print() { __p += __j.call(arguments, '') }
 `)}function l(f){return f.map(c).join(`
 `)}function c(f){return f.map(u).join(e)}function u(f){return f==null?"":f instanceof Date?Obt(f):t.test(f+="")?'"'+f.replace(/"/g,'""')+'"':f}return{parse:r,parseRows:i,format:o,formatBody:s,formatRows:l,formatRow:c,formatValue:u}}function $bt(e){for(var t in e){var n=e[t].trim(),r,i;if(!n)n=null;else if(n==="true")n=!0;else if(n==="false")n=!1;else if(n==="NaN")n=NaN;else if(!isNaN(r=+n))n=r;else if(i=n.match(/^([-+]\d{2})?\d{4}(-\d{2}(-\d{2})?)?(T\d{2}:\d{2}(:\d{2}(\.\d{3})?)?(Z|[-+]\d{2}:\d{2})?)?$/))Pbt&&i[4]&&!i[7]&&(n=n.replace(/-/g,"/").replace(/T/," ")),n=new Date(n);else continue;e[t]=n}return e}const Pbt=new Date("2019-01-01T00:00").getHours()||new Date("2019-07-01T00:00").getHours();var Mbt=function(e,t,n,r){function i(a){return a instanceof n?a:new n(function(o){o(a)})}return new(n||(n=Promise))(function(a,o){function s(u){try{c(r.next(u))}catch(f){o(f)}}function l(u){try{c(r.throw(u))}catch(f){o(f)}}function c(u){u.done?a(u.value):i(u.value).then(s,l)}c((r=r.apply(e,t||[])).next())})};const sye=e=>{const{value:t,format:n=t.split(".").pop(),delimiter:r=",",autoType:i=!0}=e;return()=>Mbt(void 0,void 0,void 0,function*(){const a=yield fetch(t);if(n==="csv"){const o=yield a.text();return _bt(r).parse(o,i?$bt:hv)}else if(n==="json")return yield a.json();throw new Error(`Unknown format: ${n}.`)})};sye.props={};function kbt(e){return!e||Object.keys(e).length===0}const lye=e=>{const{fields:t,key:n="key",value:r="value"}=e;return i=>kbt(t)?i:i.flatMap(a=>t.map(o=>Object.assign(Object.assign({},a),{[n]:o,[r]:a[o]})))};lye.props={};function Tbt(e){return e!=null&&!Number.isNaN(e)}const cye=e=>{const{callback:t=Tbt}=e;return n=>n.filter(t)};cye.props={};const uye=e=>{const{callback:t}=e;return n=>Array.isArray(n)?[...n].sort(t):n};uye.props={};function Rbt(e,t=[]){return t.reduce((n,r)=>(r in e&&(n[r]=e[r]),n),{})}const fye=e=>{const{fields:t}=e;return n=>n.map(r=>Rbt(r,t))};fye.props={};function Ibt(e){return Object.keys(e).length===0}const dye=e=>t=>{if(!e||Ibt(e))return t;const n=r=>Object.entries(r).reduce((i,[a,o])=>(i[e[a]||a]=o,i),{});return t.map(n)};dye.props={};function Abt(e,t){return e.map(n=>{if(Array.isArray(n)){const[r,i=t]=n;return[r,i]}return[n,t]})}const hye=e=>{const{fields:t=[]}=e,n=Abt(t,!0);return r=>{const i=(a,o)=>n.reduce((s,[l,c=!0])=>s!==0?s:c?a[l]<o[l]?-1:+(a[l]!==o[l]):a[l]>o[l]?-1:+(a[l]!==o[l]),0);return[...r].sort(i)}};hye.props={};const pye=e=>{const{value:t}=e;return()=>t};pye.props={};const vye=e=>{const{callback:t=hv}=e;return n=>t(n)};vye.props={};const gye=e=>{const{callback:t=hv}=e;return n=>Array.isArray(n)?n.map(t):n};gye.props={};var Nbt=function(e,t,n,r){function i(a){return a instanceof n?a:new n(function(o){o(a)})}return new(n||(n=Promise))(function(a,o){function s(u){try{c(r.next(u))}catch(f){o(f)}}function l(u){try{c(r.throw(u))}catch(f){o(f)}}function c(u){u.done?a(u.value):i(u.value).then(s,l)}c((r=r.apply(e,t||[])).next())})};function Lbt(e,t){return{set(n,r,i){if(t[n]===void 0)return this;const a=r?r.call(null,t[n]):t[n];return i?i.call(null,a):typeof e[n]=="function"?e[n](a):e[n]=a,this},setAsync(n,r,i){return Nbt(this,void 0,void 0,function*(){if(t[n]===void 0)return this;const a=r?yield r.call(null,t[n]):t[n];return i?i.call(null,a):typeof e[n]=="function"?e[n](a):e[n]=a,this})}}}const s9=Math.PI/180,z2=64,v3=2048;function jbt(e){return e.text}function Dbt(){return"serif"}function mye(){return"normal"}function Fbt(e){return e.value}function Bbt(){return~~(Math.random()*2)*90}function zbt(){return 1}function Hbt(){}function Wbt(e,t,n,r){if(t.sprite)return;const i=e.context,a=e.ratio;i.clearRect(0,0,(z2<<5)/a,v3/a);let o=0,s=0,l=0;const c=n.length;for(--r;++r<c;){t=n[r],i.save(),i.font=t.style+" "+t.weight+" "+~~((t.size+1)/a)+"px "+t.font;let d=i.measureText(t.text+"m").width*a,h=t.size<<1;if(t.rotate){const p=Math.sin(t.rotate*s9),v=Math.cos(t.rotate*s9),g=d*v,m=d*p,y=h*v,x=h*p;d=Math.max(Math.abs(g+x),Math.abs(g-x))+31>>5<<5,h=~~Math.max(Math.abs(m+y),Math.abs(m-y))}else d=d+31>>5<<5;if(h>l&&(l=h),o+d>=z2<<5&&(o=0,s+=l,l=0),s+h>=v3)break;i.translate((o+(d>>1))/a,(s+(h>>1))/a),t.rotate&&i.rotate(t.rotate*s9),i.fillText(t.text,0,0),t.padding&&(i.lineWidth=2*t.padding,i.strokeText(t.text,0,0)),i.restore(),t.width=d,t.height=h,t.xoff=o,t.yoff=s,t.x1=d>>1,t.y1=h>>1,t.x0=-t.x1,t.y0=-t.y1,t.hasText=!0,o+=d}const u=i.getImageData(0,0,(z2<<5)/a,v3/a).data,f=[];for(;--r>=0;){if(t=n[r],!t.hasText)continue;const d=t.width,h=d>>5;let p=t.y1-t.y0;for(let m=0;m<p*h;m++)f[m]=0;if(o=t.xoff,o==null)return;s=t.yoff;let v=0,g=-1;for(let m=0;m<p;m++){for(let y=0;y<d;y++){const x=h*m+(y>>5),S=u[(s+m)*(z2<<5)+(o+y)<<2]?1<<31-y%32:0;f[x]|=S,v|=S}v?g=m:(t.y0++,p--,m--,s++)}t.y1=t.y0+g,t.sprite=f.slice(0,(t.y1-t.y0)*h)}}function Vbt(e,t,n){n>>=5;const r=e.sprite,i=e.width>>5,a=e.x-(i<<4),o=a&127,s=32-o,l=e.y1-e.y0;let c=(e.y+e.y0)*n+(a>>5),u;for(let f=0;f<l;f++){u=0;for(let d=0;d<=i;d++)if((u<<s|(d<i?(u=r[f*i+d])>>>o:0))&t[c+d])return!0;c+=n}return!1}function qbt(e,t){const n=e[0],r=e[1];t.x+t.x0<n.x&&(n.x=t.x+t.x0),t.y+t.y0<n.y&&(n.y=t.y+t.y0),t.x+t.x1>r.x&&(r.x=t.x+t.x1),t.y+t.y1>r.y&&(r.y=t.y+t.y1)}function Ubt(e,t){return e.x+e.x1>t[0].x&&e.x+e.x0<t[1].x&&e.y+e.y1>t[0].y&&e.y+e.y0<t[1].y}function yye(e){const t=e[0]/e[1];return function(n){return[t*(n*=.1)*Math.cos(n),n*Math.sin(n)]}}function Gbt(e){const n=4*e[0]/e[1];let r=0,i=0;return function(a){const o=a<0?-1:1;switch(Math.sqrt(1+4*o*a)-o&3){case 0:r+=n;break;case 1:i+=4;break;case 2:r-=n;break;default:i-=4;break}return[r,i]}}function bye(e){const t=[];let n=-1;for(;++n<e;)t[n]=0;return t}function Kbt(){return document.createElement("canvas")}function Df(e){return typeof e=="function"?e:function(){return e}}const Ybt={archimedean:yye,rectangular:Gbt};function Xbt(){let e=[256,256],t=jbt,n=Dbt,r=Fbt,i=mye,a=Bbt,o=zbt,s=yye,l=Math.random,c=Hbt,u=[],f=null,d=1/0,h=Kbt;const p=mye,v={};v.start=function(){const[y,x]=e,S=g(h()),w=v.board?v.board:bye((e[0]>>5)*e[1]),C=u.length,E=[],O=u.map(function(k,T,R){return k.text=t.call(this,k,T,R),k.font=n.call(this,k,T,R),k.style=p.call(this,k,T,R),k.weight=i.call(this,k,T,R),k.rotate=a.call(this,k,T,R),k.size=~~r.call(this,k,T,R),k.padding=o.call(this,k,T,R),k}).sort(function(k,T){return T.size-k.size});let $=-1,P=v.board?[{x:0,y:0},{x:y,y:x}]:void 0;f&&clearInterval(f),f=setInterval(M,0),M();function M(){const k=Date.now();for(;Date.now()-k<d&&++$<C;){const T=O[$];T.x=y*(l()+.5)>>1,T.y=x*(l()+.5)>>1,Wbt(S,T,O,$),T.hasText&&m(w,T,P)&&(c.call(null,"word",{cloud:v,word:T}),E.push(T),P?v.hasImage||qbt(P,T):P=[{x:T.x+T.x0,y:T.y+T.y0},{x:T.x+T.x1,y:T.y+T.y1}],T.x-=e[0]>>1,T.y-=e[1]>>1)}v._tags=E,v._bounds=P,$>=C&&(v.stop(),c.call(null,"end",{cloud:v,words:E,bounds:P}))}return v},v.stop=function(){return f&&(clearInterval(f),f=null),v};function g(y){y.width=y.height=1;const x=Math.sqrt(y.getContext("2d").getImageData(0,0,1,1).data.length>>2);y.width=(z2<<5)/x,y.height=v3/x;const S=y.getContext("2d");return S.fillStyle=S.strokeStyle="red",S.textAlign="center",S.textBaseline="middle",{context:S,ratio:x}}function m(y,x,S){const w=x.x,C=x.y,E=Math.sqrt(e[0]*e[0]+e[1]*e[1]),O=s(e),$=l()<.5?1:-1;let P,M=-$,k,T;for(;(P=O(M+=$))&&(k=~~P[0],T=~~P[1],!(Math.min(Math.abs(k),Math.abs(T))>=E));)if(x.x=w+k,x.y=C+T,!(x.x+x.x0<0||x.y+x.y0<0||x.x+x.x1>e[0]||x.y+x.y1>e[1])&&(!S||!Vbt(x,y,e[0]))&&(!S||Ubt(x,S))){const R=x.sprite,A=x.width>>5,N=e[0]>>5,L=x.x-(A<<4),j=L&127,F=32-j,B=x.y1-x.y0;let D,z=(x.y+x.y0)*N+(L>>5);for(let W=0;W<B;W++){D=0;for(let q=0;q<=A;q++)y[z+q]|=D<<F|(q<A?(D=R[W*A+q])>>>j:0);z+=N}return delete x.sprite,!0}return!1}return v.createMask=y=>{const x=document.createElement("canvas"),[S,w]=e;if(!S||!w)return;const C=S>>5,E=bye((S>>5)*w);x.width=S,x.height=w;const O=x.getContext("2d");O.drawImage(y,0,0,y.width,y.height,0,0,S,w);const $=O.getImageData(0,0,S,w).data;for(let P=0;P<w;P++)for(let M=0;M<S;M++){const k=C*P+(M>>5),T=P*S+M<<2,A=$[T]>=250&&$[T+1]>=250&&$[T+2]>=250?1<<31-M%32:0;E[k]|=A}v.board=E,v.hasImage=!0},v.timeInterval=function(y){d=y==null?1/0:y},v.words=function(y){u=y},v.size=function(y=[]){e=[+y[0],+y[1]]},v.text=function(y){t=Df(y)},v.font=function(y){n=Df(y)},v.fontWeight=function(y){i=Df(y)},v.rotate=function(y){a=Df(y)},v.canvas=function(y){h=Df(y)},v.spiral=function(y){s=Ybt[y]||y},v.fontSize=function(y){r=Df(y)},v.padding=function(y){o=Df(y)},v.random=function(y){l=Df(y)},v.on=function(y){c=Df(y)},v}var Zbt=function(e,t,n,r){function i(a){return a instanceof n?a:new n(function(o){o(a)})}return new(n||(n=Promise))(function(a,o){function s(u){try{c(r.next(u))}catch(f){o(f)}}function l(u){try{c(r.throw(u))}catch(f){o(f)}}function c(u){u.done?a(u.value):i(u.value).then(s,l)}c((r=r.apply(e,t||[])).next())})},Qbt=function(e,t){var n={};for(var r in e)Object.prototype.hasOwnProperty.call(e,r)&&t.indexOf(r)<0&&(n[r]=e[r]);if(e!=null&&typeof Object.getOwnPropertySymbols=="function")for(var i=0,r=Object.getOwnPropertySymbols(e);i<r.length;i++)t.indexOf(r[i])<0&&Object.prototype.propertyIsEnumerable.call(e,r[i])&&(n[r[i]]=e[r[i]]);return n};const Jbt={fontSize:[20,60],font:"Impact",padding:2,rotate:function(){return(~~(Math.random()*6)-3)*30}};function ext(e){return new Promise((t,n)=>{if(e instanceof HTMLImageElement){t(e);return}if(typeof e=="string"){const r=new Image;r.crossOrigin="anonymous",r.src=e,r.onload=()=>t(r),r.onerror=()=>{console.error(`'image ${e} load failed !!!'`),n()};return}n()})}function txt(e,t){if(typeof e=="function")return e;if(Array.isArray(e)){const[n,r]=e;if(!t)return()=>(r+n)/2;const[i,a]=t;return a===i?()=>(r+n)/2:({value:o})=>(r-n)/(a-i)*(o-i)+n}return()=>e}const xye=(e,t)=>n=>Zbt(void 0,void 0,void 0,function*(){const r=Object.assign({},Jbt,e,{canvas:t.createCanvas}),i=Xbt();yield Lbt(i,r).set("fontSize",y=>{const x=n.map(S=>S.value);return txt(y,[tl(x),Lr(x)])}).set("font").set("fontStyle").set("fontWeight").set("padding").set("rotate").set("size").set("spiral").set("timeInterval").set("random").set("text").set("on").set("canvas").setAsync("imageMask",ext,i.createMask),i.words([...n]);const a=i.start(),[o,s]=r.size,l=[{x:0,y:0},{x:o,y:s}],{_bounds:c=l,_tags:u,hasImage:f}=a,d=u.map(y=>{var{x,y:S,font:w}=y,C=Qbt(y,["x","y","font"]);return Object.assign(Object.assign({},C),{x:x+o/2,y:S+s/2,fontFamily:w})}),[{x:h,y:p},{x:v,y:g}]=c,m={text:"",value:0,opacity:0,fontSize:0};return d.push(Object.assign(Object.assign({},m),{x:f?0:h,y:f?0:p}),Object.assign(Object.assign({},m),{x:f?o:v,y:f?s:g})),d});xye.props={};function Sye(e){return typeof e=="string"?t=>t[e]:e}const wye=e=>{const{join:t,on:n,select:r=[],as:i=r,unknown:a=NaN}=e,[o,s]=n,l=Sye(s),c=Sye(o),u=dj(t,([f])=>f,f=>l(f));return f=>f.map(d=>{const h=u.get(c(d));return Object.assign(Object.assign({},d),r.reduce((p,v,g)=>(p[i[g]]=h?h[v]:a,p),{}))})};wye.props={};const Cye=e=>{const{start:t,end:n}=e;return r=>r.slice(t,n)};Cye.props={};var Eye={exports:{}},Oye={exports:{}};(function(e){var t=e.exports;e.exports.isNumber=function(n){return typeof n=="number"},e.exports.findMin=function(n){if(n.length===0)return 1/0;for(var r=n[0],i=1;i<n.length;i++)r=Math.min(r,n[i]);return r},e.exports.findMax=function(n){if(n.length===0)return-1/0;for(var r=n[0],i=1;i<n.length;i++)r=Math.max(r,n[i]);return r},e.exports.findMinMulti=function(n){for(var r=t.findMin(n[0]),i=1;i<n.length;i++)r=Math.min(r,t.findMin(n[i]));return r},e.exports.findMaxMulti=function(n){for(var r=t.findMax(n[0]),i=1;i<n.length;i++)r=Math.max(r,t.findMax(n[i]));return r},e.exports.inside=function(n,r,i){return n<=i&&i<=r}})(Oye);var nxt=Oye.exports;(function(e){var t=50,n=2,r=Math.log(2),i=e.exports,a=nxt;function o(l){return 1-Math.abs(l)}e.exports.getUnifiedMinMax=function(l,c){return i.getUnifiedMinMaxMulti([l],c)},e.exports.getUnifiedMinMaxMulti=function(l,c){c=c||{};var u=!1,f=!1,d=a.isNumber(c.width)?c.width:n,h=a.isNumber(c.size)?c.size:t,p=a.isNumber(c.min)?c.min:(u=!0,a.findMinMulti(l)),v=a.isNumber(c.max)?c.max:(f=!0,a.findMaxMulti(l)),g=v-p,m=g/(h-1);return u&&(p=p-2*d*m),f&&(v=v+2*d*m),{min:p,max:v}},e.exports.create=function(l,c){if(c=c||{},!l||l.length===0)return[];var u=a.isNumber(c.size)?c.size:t,f=a.isNumber(c.width)?c.width:n,d=i.getUnifiedMinMax(l,{size:u,width:f,min:c.min,max:c.max}),h=d.min,p=d.max,v=p-h,g=v/(u-1);if(v===0)return[{x:h,y:1}];for(var m=[],y=0;y<u;y++)m.push({x:h+y*g,y:0});var x=function(M){return Math.floor((M-h)/g)},S=s(o,f),w=S[f],C=S[f-1]-S[f-2],E=0;l.forEach(function(M){var k=x(M);if(!(k+f<0||k-f>=m.length)){var T=Math.max(k-f,0),R=k,A=Math.min(k+f,m.length-1),N=T-(k-f),L=k+f-A,j=S[-f-1+N]||0,F=S[-f-1+L]||0,B=w/(w-j-F);N>0&&(E+=B*(N-1)*C);var D=Math.max(0,k-f+1);a.inside(0,m.length-1,D)&&(m[D].y+=B*1*C),a.inside(0,m.length-1,R+1)&&(m[R+1].y-=B*2*C),a.inside(0,m.length-1,A+1)&&(m[A+1].y+=B*1*C)}});var O=E,$=0,P=0;return m.forEach(function(M){$+=M.y,O+=$,M.y=O,P+=O}),P>0&&m.forEach(function(M){M.y/=P}),m};function s(l,c){for(var u={},f=0,d=-c;d<=c;d++)f+=l(d/c),u[d]=f;return u}e.exports.getExpectedValueFromPdf=function(l){if(!(!l||l.length===0)){var c=0;return l.forEach(function(u){c+=u.x*u.y}),c}},e.exports.getXWithLeftTailArea=function(l,c){if(!(!l||l.length===0)){for(var u=0,f=0,d=0;d<l.length&&(f=d,u+=l[d].y,!(u>=c));d++);return l[f].x}},e.exports.getPerplexity=function(l){if(!(!l||l.length===0)){var c=0;return l.forEach(function(u){var f=Math.log(u.y);isFinite(f)&&(c+=u.y*f)}),c=-c/r,Math.pow(2,c)}}})(Eye);var rxt=Eye.exports;const ixt=rn(rxt),_ye=e=>{const{field:t,groupBy:n,as:r=["y","size"],min:i,max:a,size:o=10,width:s}=e,[l,c]=r;return u=>Array.from(mi(u,d=>n.map(h=>d[h]).join("-")).values()).map(d=>{const h=ixt.create(d.map(g=>g[t]),{min:i,max:a,size:o,width:s}),p=h.map(g=>g.x),v=h.map(g=>g.y);return Object.assign(Object.assign({},d[0]),{[l]:p,[c]:v})})};_ye.props={};function axt(e,t,n,r){r=r||{};var i=r.maxIterations||100,a=r.tolerance||1e-10,o=e(t),s=e(n),l=n-t;if(o*s>0)throw"Initial bisect points must have opposite signs";if(o===0)return t;if(s===0)return n;for(var c=0;c<i;++c){l/=2;var u=t+l,f=e(u);if(f*o>=0&&(t=u),Math.abs(l)<a||f===0)return u}return t+l}function l9(e){for(var t=new Array(e),n=0;n<e;++n)t[n]=0;return t}function $ye(e,t){return l9(e).map(function(){return l9(t)})}function H0(e,t){for(var n=0,r=0;r<e.length;++r)n+=e[r]*t[r];return n}function c9(e){return Math.sqrt(H0(e,e))}function u9(e,t,n){for(var r=0;r<t.length;++r)e[r]=t[r]*n}function Ff(e,t,n,r,i){for(var a=0;a<e.length;++a)e[a]=t*n[a]+r*i[a]}function oxt(e,t,n){n=n||{};var r=n.maxIterations||t.length*200,i=n.nonZeroDelta||1.05,a=n.zeroDelta||.001,o=n.minErrorDelta||1e-6,s=n.minErrorDelta||1e-5,l=n.rho!==void 0?n.rho:1,c=n.chi!==void 0?n.chi:2,u=n.psi!==void 0?n.psi:-.5,f=n.sigma!==void 0?n.sigma:.5,d,h=t.length,p=new Array(h+1);p[0]=t,p[0].fx=e(t),p[0].id=0;for(var v=0;v<h;++v){var g=t.slice();g[v]=g[v]?g[v]*i:a,p[v+1]=g,p[v+1].fx=e(g),p[v+1].id=v+1}function m(k){for(var T=0;T<k.length;T++)p[h][T]=k[T];p[h].fx=k.fx}for(var y=function(k,T){return k.fx-T.fx},x=t.slice(),S=t.slice(),w=t.slice(),C=t.slice(),E=0;E<r;++E){if(p.sort(y),n.history){var O=p.map(function(k){var T=k.slice();return T.fx=k.fx,T.id=k.id,T});O.sort(function(k,T){return k.id-T.id}),n.history.push({x:p[0].slice(),fx:p[0].fx,simplex:O})}for(d=0,v=0;v<h;++v)d=Math.max(d,Math.abs(p[0][v]-p[1][v]));if(Math.abs(p[0].fx-p[h].fx)<o&&d<s)break;for(v=0;v<h;++v){x[v]=0;for(var $=0;$<h;++$)x[v]+=p[$][v];x[v]/=h}var P=p[h];if(Ff(S,1+l,x,-l,P),S.fx=e(S),S.fx<p[0].fx)Ff(C,1+c,x,-c,P),C.fx=e(C),C.fx<S.fx?m(C):m(S);else if(S.fx>=p[h-1].fx){var M=!1;if(S.fx>P.fx?(Ff(w,1+u,x,-u,P),w.fx=e(w),w.fx<P.fx?m(w):M=!0):(Ff(w,1-u*l,x,u*l,P),w.fx=e(w),w.fx<S.fx?m(w):M=!0),M){if(f>=1)break;for(v=1;v<p.length;++v)Ff(p[v],1-f,p[0],f,p[v]),p[v].fx=e(p[v])}}else m(S)}return p.sort(y),{fx:p[0].fx,x:p[0]}}function sxt(e,t,n,r,i,a,o){var s=n.fx,l=H0(n.fxprime,t),c=s,u=s,f=l,d=0;i=i||1,a=a||1e-6,o=o||.1;function h(v,g,m){for(var y=0;y<16;++y)if(i=(v+g)/2,Ff(r.x,1,n.x,i,t),c=r.fx=e(r.x,r.fxprime),f=H0(r.fxprime,t),c>s+a*i*l||c>=m)g=i;else{if(Math.abs(f)<=-o*l)return i;f*(g-v)>=0&&(g=v),v=i,m=c}return 0}for(var p=0;p<10;++p){if(Ff(r.x,1,n.x,i,t),c=r.fx=e(r.x,r.fxprime),f=H0(r.fxprime,t),c>s+a*i*l||p&&c>=u)return h(d,i,u);if(Math.abs(f)<=-o*l)return i;if(f>=0)return h(i,d,c);u=c,d=i,i*=2}return i}function lxt(e,t,n){var r={x:t.slice(),fx:0,fxprime:t.slice()},i={x:t.slice(),fx:0,fxprime:t.slice()},a=t.slice(),o,s,l=1,c;n=n||{},c=n.maxIterations||t.length*20,r.fx=e(r.x,r.fxprime),o=r.fxprime.slice(),u9(o,r.fxprime,-1);for(var u=0;u<c;++u){if(l=sxt(e,o,r,i,l),n.history&&n.history.push({x:r.x.slice(),fx:r.fx,fxprime:r.fxprime.slice(),alpha:l}),!l)u9(o,r.fxprime,-1);else{Ff(a,1,i.fxprime,-1,r.fxprime);var f=H0(r.fxprime,r.fxprime),d=Math.max(0,H0(a,i.fxprime)/f);Ff(o,d,o,-1,i.fxprime),s=r,r=i,i=s}if(c9(r.fxprime)<=1e-5)break}return n.history&&n.history.push({x:r.x.slice(),fx:r.fx,fxprime:r.fxprime.slice(),alpha:l}),r}const Pye=1e-10;function Mye(e,t){const n=uxt(e),r=n.filter(function(l){return cxt(l,e)});let i=0,a=0,o;const s=[];if(r.length>1){const l=fxt(r);for(o=0;o<r.length;++o){const u=r[o];u.angle=Math.atan2(u.x-l.x,u.y-l.y)}r.sort(function(u,f){return f.angle-u.angle});let c=r[r.length-1];for(o=0;o<r.length;++o){const u=r[o];a+=(c.x+u.x)*(u.y-c.y);const f={x:(u.x+c.x)/2,y:(u.y+c.y)/2};let d=null;for(let h=0;h<u.parentIndex.length;++h)if(c.parentIndex.indexOf(u.parentIndex[h])>-1){const p=e[u.parentIndex[h]],v=Math.atan2(u.x-p.x,u.y-p.y),g=Math.atan2(c.x-p.x,c.y-p.y);let m=g-v;m<0&&(m+=2*Math.PI);const y=g-m/2;let x=H2(f,{x:p.x+p.radius*Math.sin(y),y:p.y+p.radius*Math.cos(y)});x>p.radius*2&&(x=p.radius*2),(d===null||d.width>x)&&(d={circle:p,width:x,p1:u,p2:c})}d!==null&&(s.push(d),i+=f9(d.circle.radius,d.width),c=u)}}else{let l=e[0];for(o=1;o<e.length;++o)e[o].radius<l.radius&&(l=e[o]);let c=!1;for(o=0;o<e.length;++o)if(H2(e[o],l)>Math.abs(l.radius-e[o].radius)){c=!0;break}c?i=a=0:(i=l.radius*l.radius*Math.PI,s.push({circle:l,p1:{x:l.x,y:l.y+l.radius},p2:{x:l.x-Pye,y:l.y+l.radius},width:l.radius*2}))}return a/=2,t&&(t.area=i+a,t.arcArea=i,t.polygonArea=a,t.arcs=s,t.innerPoints=r,t.intersectionPoints=n),i+a}function cxt(e,t){for(let n=0;n<t.length;++n)if(H2(e,t[n])>t[n].radius+Pye)return!1;return!0}function uxt(e){const t=[];for(let n=0;n<e.length;++n)for(let r=n+1;r<e.length;++r){const i=Tye(e[n],e[r]);for(let a=0;a<i.length;++a){const o=i[a];o.parentIndex=[n,r],t.push(o)}}return t}function f9(e,t){return e*e*Math.acos(1-t/e)-(e-t)*Math.sqrt(t*(2*e-t))}function H2(e,t){return Math.sqrt((e.x-t.x)*(e.x-t.x)+(e.y-t.y)*(e.y-t.y))}function kye(e,t,n){if(n>=e+t)return 0;if(n<=Math.abs(e-t))return Math.PI*Math.min(e,t)*Math.min(e,t);const r=e-(n*n-t*t+e*e)/(2*n),i=t-(n*n-e*e+t*t)/(2*n);return f9(e,r)+f9(t,i)}function Tye(e,t){const n=H2(e,t),r=e.radius,i=t.radius;if(n>=r+i||n<=Math.abs(r-i))return[];const a=(r*r-i*i+n*n)/(2*n),o=Math.sqrt(r*r-a*a),s=e.x+a*(t.x-e.x)/n,l=e.y+a*(t.y-e.y)/n,c=-(t.y-e.y)*(o/n),u=-(t.x-e.x)*(o/n);return[{x:s+c,y:l-u},{x:s-c,y:l+u}]}function fxt(e){const t={x:0,y:0};for(let n=0;n<e.length;++n)t.x+=e[n].x,t.y+=e[n].y;return t.x/=e.length,t.y/=e.length,t}function dxt(e,t){t=t||{},t.maxIterations=t.maxIterations||500;const n=t.initialLayout||gxt,r=t.lossFunction||h9;e=hxt(e);const i=n(e,t),a=[],o=[];let s;for(s in i)i.hasOwnProperty(s)&&(a.push(i[s].x),a.push(i[s].y),o.push(s));const c=oxt(function(u){const f={};for(let d=0;d<o.length;++d){const h=o[d];f[h]={x:u[2*d],y:u[2*d+1],radius:i[h].radius}}return r(f,e)},a,t).x;for(let u=0;u<o.length;++u)s=o[u],i[s].x=c[2*u],i[s].y=c[2*u+1];return i}const Rye=1e-10;function d9(e,t,n){return Math.min(e,t)*Math.min(e,t)*Math.PI<=n+Rye?Math.abs(e-t):axt(function(r){return kye(e,t,r)-n},0,e+t)}function hxt(e){e=e.slice();const t=[],n={};let r,i,a,o;for(r=0;r<e.length;++r){const s=e[r];s.sets.length==1?t.push(s.sets[0]):s.sets.length==2&&(a=s.sets[0],o=s.sets[1],n[[a,o]]=!0,n[[o,a]]=!0)}for(t.sort((s,l)=>s>l?1:-1),r=0;r<t.length;++r)for(a=t[r],i=r+1;i<t.length;++i)o=t[i],[a,o]in n||e.push({sets:[a,o],size:0});return e}function pxt(e,t,n){const r=$ye(t.length,t.length),i=$ye(t.length,t.length);return e.filter(function(a){return a.sets.length==2}).map(function(a){const o=n[a.sets[0]],s=n[a.sets[1]],l=Math.sqrt(t[o].size/Math.PI),c=Math.sqrt(t[s].size/Math.PI),u=d9(l,c,a.size);r[o][s]=r[s][o]=u;let f=0;a.size+1e-10>=Math.min(t[o].size,t[s].size)?f=1:a.size<=1e-10&&(f=-1),i[o][s]=i[s][o]=f}),{distances:r,constraints:i}}function vxt(e,t,n,r){let i=0,a;for(a=0;a<t.length;++a)t[a]=0;for(a=0;a<n.length;++a){const o=e[2*a],s=e[2*a+1];for(let l=a+1;l<n.length;++l){const c=e[2*l],u=e[2*l+1],f=n[a][l],d=r[a][l],h=(c-o)*(c-o)+(u-s)*(u-s),p=Math.sqrt(h),v=h-f*f;d>0&&p<=f||d<0&&p>=f||(i+=2*v*v,t[2*a]+=4*v*(o-c),t[2*a+1]+=4*v*(s-u),t[2*l]+=4*v*(c-o),t[2*l+1]+=4*v*(u-s))}}return i}function gxt(e,t){let n=yxt(e,t);const r=t.lossFunction||h9;if(e.length>=8){const i=mxt(e,t),a=r(i,e),o=r(n,e);a+1e-8<o&&(n=i)}return n}function mxt(e,t){t=t||{};const n=t.restarts||10,r=[],i={};let a;for(a=0;a<e.length;++a){const v=e[a];v.sets.length==1&&(i[v.sets[0]]=r.length,r.push(v))}const o=pxt(e,r,i);let s=o.distances;const l=o.constraints,c=c9(s.map(c9))/s.length;s=s.map(function(v){return v.map(function(g){return g/c})});const u=function(v,g){return vxt(v,g,s,l)};let f,d;for(a=0;a<n;++a){const v=l9(s.length*2).map(Math.random);d=lxt(u,v,t),(!f||d.fx<f.fx)&&(f=d)}const h=f.x,p={};for(a=0;a<r.length;++a){const v=r[a];p[v.sets[0]]={x:h[2*a]*c,y:h[2*a+1]*c,radius:Math.sqrt(v.size/Math.PI)}}if(t.history)for(a=0;a<t.history.length;++a)u9(t.history[a].x,c);return p}function yxt(e,t){const n=t&&t.lossFunction?t.lossFunction:h9,r={},i={};let a;for(let f=0;f<e.length;++f){const d=e[f];d.sets.length==1&&(a=d.sets[0],r[a]={x:1e10,y:1e10,rowid:Object.keys(r).length,size:d.size,radius:Math.sqrt(d.size/Math.PI)},i[a]=[])}e=e.filter(function(f){return f.sets.length==2});for(let f=0;f<e.length;++f){const d=e[f];let h=d.hasOwnProperty("weight")?d.weight:1;const p=d.sets[0],v=d.sets[1];d.size+Rye>=Math.min(r[p].size,r[v].size)&&(h=0),i[p].push({set:v,size:d.size,weight:h}),i[v].push({set:p,size:d.size,weight:h})}const o=[];for(a in i)if(i.hasOwnProperty(a)){let f=0;for(let d=0;d<i[a].length;++d)f+=i[a][d].size*i[a][d].weight;o.push({set:a,size:f})}function s(f,d){return d.size-f.size}o.sort(s);const l={};function c(f){return f.set in l}function u(f,d){r[d].x=f.x,r[d].y=f.y,l[d]=!0}u({x:0,y:0},o[0].set);for(let f=1;f<o.length;++f){const d=o[f].set,h=i[d].filter(c);if(a=r[d],h.sort(s),h.length===0)throw"ERROR: missing pairwise overlap information";const p=[];for(let m=0;m<h.length;++m){const y=r[h[m].set],x=d9(a.radius,y.radius,h[m].size);p.push({x:y.x+x,y:y.y}),p.push({x:y.x-x,y:y.y}),p.push({y:y.y+x,x:y.x}),p.push({y:y.y-x,x:y.x});for(let S=m+1;S<h.length;++S){const w=r[h[S].set],C=d9(a.radius,w.radius,h[S].size),E=Tye({x:y.x,y:y.y,radius:x},{x:w.x,y:w.y,radius:C});for(let O=0;O<E.length;++O)p.push(E[O])}}let v=1e50,g=p[0];for(let m=0;m<p.length;++m){r[d].x=p[m].x,r[d].y=p[m].y;const y=n(r,e);y<v&&(v=y,g=p[m])}u(g,d)}return r}function h9(e,t){let n=0;function r(i){return i.map(function(a){return e[a]})}for(let i=0;i<t.length;++i){const a=t[i];let o;if(a.sets.length==1)continue;if(a.sets.length==2){const l=e[a.sets[0]],c=e[a.sets[1]];o=kye(l.radius,c.radius,H2(l,c))}else o=Mye(r(a.sets));const s=a.hasOwnProperty("weight")?a.weight:1;n+=s*(o-a.size)*(o-a.size)}return n}function bxt(e){const t=function(n){const r=Math.max.apply(null,e.map(function(a){return a[n]+a.radius})),i=Math.min.apply(null,e.map(function(a){return a[n]-a.radius}));return{max:r,min:i}};return{xRange:t("x"),yRange:t("y")}}function xxt(e,t,n,r){const i=[],a=[];for(const v in e)e.hasOwnProperty(v)&&(a.push(v),i.push(e[v]));t-=2*r,n-=2*r;const o=bxt(i),s=o.xRange,l=o.yRange;if(s.max==s.min||l.max==l.min)return console.log("not scaling solution: zero size detected"),e;const c=t/(s.max-s.min),u=n/(l.max-l.min),f=Math.min(u,c),d=(t-(s.max-s.min)*f)/2,h=(n-(l.max-l.min)*f)/2,p={};for(let v=0;v<i.length;++v){const g=i[v];p[a[v]]={radius:f*g.radius,x:r+d+(g.x-s.min)*f,y:r+h+(g.y-l.min)*f}}return p}function Sxt(e,t,n){const r=[],i=e-n,a=t;return r.push("M",i,a),r.push("A",n,n,0,1,0,i+2*n,a),r.push("A",n,n,0,1,0,i,a),r.join(" ")}function wxt(e){const t={};Mye(e,t);const n=t.arcs;if(n.length===0)return"M 0 0";if(n.length==1){const r=n[0].circle;return Sxt(r.x,r.y,r.radius)}else{const r=[`
 M`,n[0].p2.x,n[0].p2.y];for(let i=0;i<n.length;++i){const a=n[i],o=a.circle.radius,s=a.width>o;r.push(`
-A`,o,o,0,s?1:0,1,a.p1.x,a.p1.y)}return r.join(" ")}}const Iye=e=>{const{sets:t="sets",size:n="size",as:r=["key","path"],padding:i=0}=e,[a,o]=r;return s=>{const l=s.map(f=>Object.assign(Object.assign({},f),{sets:f[t],size:f[n],[a]:f.sets.join("&")}));l.sort((f,d)=>f.sets.length-d.sets.length);const c=dxt(l);let u;return l.map(f=>{const d=f[t],h=({width:p,height:v})=>{u=u||xxt(c,p,v,i);const g=d.map(y=>u[y]);let m=wxt(g);return/[zZ]$/.test(m)||(m+=" Z"),m};return Object.assign(Object.assign({},f),{[o]:h})})}};Iye.props={};const Aye=()=>e=>(console.log("G2 data section:",e),e);Aye.props={};function Cxt(e,t){if(t<0||t>1)throw new Error("alpha must be between 0 and 1.");if(e.length===0)return[];let n=e[0];const r=[];for(const i of e){if(i==null){r.push(i),console.warn("EMA：The value is null or undefined",e);continue}n==null&&(n=i);const a=n*t+(1-t)*i;r.push(a),n=a}return r}const Nye=e=>{const{field:t="y",alpha:n=.6,as:r=t}=e;return i=>{const a=i.map(s=>s[t]),o=Cxt(a,n);return i.map((s,l)=>Object.assign(Object.assign({},s),{[r]:o[l]}))}};Nye.props={};function p9(e){const{min:t,max:n}=e;return[[t[0],t[1]],[n[0],n[1]]]}function Lye(e,t){const[n,r]=e,[i,a]=t;return n>=i[0]&&n<=a[0]&&r>=i[1]&&r<=a[1]}function Ext(e,t){const[n,r]=e;return!(Lye(n,t)&&Lye(r,t))}function Oxt(e,t){const[n,r]=e,[i,a]=t;return n[0]<a[0]&&r[0]>i[0]&&n[1]<a[1]&&r[1]>i[1]}const _xt=e=>{const{priority:t}=e;return n=>{const r=[];return t&&n.sort(t),n.forEach(i=>{o3(i);const a=i.getLocalBounds();r.some(s=>Oxt(p9(a),p9(s.getLocalBounds())))?BD(i):r.push(i)}),n}};function $xt([e,t],[n,r]){return r>e&&t>n}function g3(){const e=new Map;return[r=>e.get(r),(r,i)=>e.set(r,i)]}function Pxt(e){const t=e.cloneNode(!0),n=t.getElementById("connector");n&&t.removeChild(n);const{min:r,max:i}=t.getRenderBounds();return t.destroy(),{min:r,max:i}}const Mxt=e=>{const{maxIterations:t=10,maxError:n=.1,padding:r=1}=e;return i=>{const a=i.length;if(a<=1)return i;const[o,s]=g3(),[l,c]=g3(),[u,f]=g3(),[d,h]=g3();for(const p of i){const{min:v,max:g}=Pxt(p),[m,y]=v,[x,S]=g;s(p,y),c(p,y),f(p,S-y),h(p,[m,x])}for(let p=0;p<t;p++){i.sort((g,m)=>Gi(l(g),l(m)));let v=0;for(let g=0;g<a-1;g++){const m=i[g];let y=g+1,x;for(;(x=i[y])&&!$xt(d(m),d(x));)y+=1;if(x){const S=l(m),w=u(m),C=l(x),E=C-(S+w);if(E<r){const O=(r-E)/2;v=Math.max(v,O),c(m,S-O),c(x,C+O)}}}if(v<n)break}for(const p of i)p.style.y+=l(p)-o(p);return i}};function kxt(e){return typeof e=="object"?e:rh(e)}function v9(e){let t=e/255;return t=t<=.03928?t/12.92:Math.pow((t+.055)/1.055,2.4),t}function jye(e,t,n){return .2126*v9(e)+.7152*v9(t)+.0722*v9(n)}function Dye(e,t){if(!e||!t||e===t)return 1;const{r:n,g:r,b:i}=e,{r:a,g:o,b:s}=t,l=jye(n,r,i),c=jye(a,o,s);return(Math.max(l,c)+.05)/(Math.min(l,c)+.05)}function Txt(e,t){const n=d0(t,r=>Dye(e,kxt(r)));return t[n]}const Rxt=e=>{const{threshold:t=4.5,palette:n=["#000","#fff"]}=e;return r=>(r.forEach(i=>{const a=i.attr("dependentElement").parsedStyle.fill,o=i.parsedStyle.fill;Dye(o,a)<t&&i.attr("fill",Txt(a,n))}),r)},Ixt=()=>e=>(e.forEach(t=>{o3(t);const n=t.attr("bounds"),r=t.getLocalBounds();Ext(p9(r),n)&&BD(t)}),e),Axt=(e,t)=>{const[[n,r],[i,a]]=t,[[o,s],[l,c]]=e;let u=0,f=0;return o<n?u=n-o:l>i&&(u=i-l),s<r?f=r-s:c>a&&(f=a-c),[u,f]},Nxt=()=>(e,{canvas:t,layout:n})=>(e.forEach(r=>{o3(r);const{max:i,min:a}=r.getRenderBounds(),[o,s]=i,[l,c]=a,u=Axt([[l,c],[o,s]],[[n.x,n.y],[n.x+n.width,n.y+n.height]]);r.style.connector&&r.style.connectorPoints&&(r.style.connectorPoints[0][0]-=u[0],r.style.connectorPoints[0][1]-=u[1]),r.style.x+=u[0],r.style.y+=u[1]}),e);function Lxt(){return{"data.fetch":sye,"data.inline":pye,"data.sortBy":hye,"data.sort":uye,"data.filter":cye,"data.pick":fye,"data.rename":dye,"data.fold":lye,"data.slice":Cye,"data.custom":vye,"data.map":gye,"data.join":wye,"data.kde":_ye,"data.log":Aye,"data.wordCloud":xye,"data.ema":Nye,"transform.stackY":Fce,"transform.binX":xue,"transform.bin":_j,"transform.dodgeX":Zce,"transform.jitter":eue,"transform.jitterX":tue,"transform.jitterY":nue,"transform.symmetryY":rue,"transform.diffY":iue,"transform.stackEnter":Qce,"transform.normalizeY":Jce,"transform.select":U$,"transform.selectX":oue,"transform.selectY":sue,"transform.groupX":lue,"transform.groupY":cue,"transform.groupColor":uue,"transform.group":e2,"transform.sortX":due,"transform.sortY":pue,"transform.sortColor":hue,"transform.flexX":vue,"transform.pack":yue,"transform.sample":Sue,"transform.filter":wue,"coordinate.cartesian":pce,"coordinate.polar":Hx,"coordinate.transpose":sj,"coordinate.theta":gce,"coordinate.parallel":cj,"coordinate.fisheye":yce,"coordinate.radial":lj,"coordinate.radar":bce,"encode.constant":xce,"encode.field":wce,"encode.transform":Sce,"encode.column":Cce,"mark.interval":Kde,"mark.rect":Xde,"mark.line":Qde,"mark.point":ehe,"mark.text":nhe,"mark.cell":ihe,"mark.area":ohe,"mark.link":l7,"mark.image":che,"mark.polygon":fhe,"mark.box":hhe,"mark.vector":vhe,"mark.lineX":bhe,"mark.lineY":mhe,"mark.connector":She,"mark.range":Ehe,"mark.rangeX":_he,"mark.rangeY":Phe,"mark.path":Fhe,"mark.shape":fpe,"mark.density":xpe,"mark.heatmap":wpe,"mark.wordCloud":w7,"palette.category10":Epe,"palette.category20":Ope,"scale.linear":$pe,"scale.ordinal":Ppe,"scale.band":_pe,"scale.identity":Mpe,"scale.point":kpe,"scale.time":Tpe,"scale.log":Rpe,"scale.pow":Ipe,"scale.sqrt":jpe,"scale.threshold":Ape,"scale.quantile":Npe,"scale.quantize":Lpe,"scale.sequential":Dpe,"scale.constant":Fpe,"theme.classic":Bpe,"theme.classicDark":Hpe,"theme.academy":Wpe,"theme.light":E7,"theme.dark":zpe,"component.axisX":ove,"component.axisY":sve,"component.legendCategory":$7,"component.legendContinuous":yh,"component.legends":mve,"component.title":dve,"component.sliderX":hve,"component.sliderY":pve,"component.scrollbarX":vve,"component.scrollbarY":gve,"animation.scaleInX":k7,"animation.scaleOutX":Kht,"animation.scaleInY":yve,"animation.scaleOutY":Yht,"animation.waveIn":_ve,"animation.fadeIn":bve,"animation.fadeOut":xve,"animation.zoomIn":opt,"animation.zoomOut":spt,"animation.pathIn":$ve,"animation.morphing":Ove,"animation.growInX":Pve,"animation.growInY":Mve,"interaction.elementHighlight":u3,"interaction.elementHighlightByX":x0e,"interaction.elementHighlightByColor":S0e,"interaction.elementSelect":f3,"interaction.elementSelectByX":w0e,"interaction.elementSelectByColor":C0e,"interaction.fisheye":g1t,"interaction.chartIndex":E0e,"interaction.tooltip":L0e,"interaction.legendFilter":N1t,"interaction.legendHighlight":L1t,"interaction.brushHighlight":XD,"interaction.brushXHighlight":H1t,"interaction.brushYHighlight":W1t,"interaction.brushAxisHighlight":Q1t,"interaction.brushFilter":e9,"interaction.brushXFilter":nbt,"interaction.brushYFilter":rbt,"interaction.sliderFilter":Y0e,"interaction.scrollbarFilter":lbt,"interaction.poptip":Q0e,"interaction.treemapDrillDown":gbt,"interaction.elementPointMove":wbt,"composition.spaceLayer":Kve,"composition.spaceFlex":Yve,"composition.facetRect":tge,"composition.repeatMatrix":pvt,"composition.facetCircle":xvt,"composition.timingKeyframe":rge,"labelTransform.overlapHide":_xt,"labelTransform.overlapDodgeY":Mxt,"labelTransform.overflowHide":Ixt,"labelTransform.contrastReverse":Rxt,"labelTransform.exceedAdjust":Nxt}}function jxt(){return{"composition.geoView":Jge,"composition.geoPath":ige}}function Dxt(){return{"data.arc":f7,"data.cluster":ppe,"mark.forceGraph":dpe,"mark.tree":gpe,"mark.pack":ope,"mark.sankey":Nhe,"mark.chord":jhe,"mark.treemap":ape}}function Fxt(){return{"data.venn":Iye,"mark.boxplot":upe,"mark.gauge":ype,"mark.wordCloud":w7,"mark.liquid":Cpe}}function Fye(){return Object.assign(Object.assign(Object.assign(Object.assign({},jxt()),Dxt()),Fxt()),Lxt())}function Bxt(e,t){class n extends e{constructor(i){super(Object.assign(Object.assign({},i),{lib:t}))}}return n}const Bye={};function zye(e,t){e.startsWith("symbol.")?bct(e.split(".").pop(),t):Object.assign(Bye,{[e]:t})}const W0=e=>e?parseInt(e):0;function zxt(e){const t=getComputedStyle(e),n=e.clientWidth||W0(t.width),r=e.clientHeight||W0(t.height),i=W0(t.paddingLeft)+W0(t.paddingRight),a=W0(t.paddingTop)+W0(t.paddingBottom);return{width:n-i,height:r-a}}function g9(e,t){const n=[e];for(;n.length;){const r=n.shift();t&&t(r);const i=r.children||[];for(const a of i)n.push(a)}}let m9=class{constructor(t={},n){this.parentNode=null,this.children=[],this.index=0,this.type=n,this.value=t}map(t=n=>n){const n=t(this.value);return this.value=n,this}attr(t,n){return arguments.length===1?this.value[t]:this.map(r=>(r[t]=n,r))}append(t){const n=new t({});return n.children=[],this.push(n),n}push(t){return t.parentNode=this,t.index=this.children.length,this.children.push(t),this}remove(){const t=this.parentNode;if(t){const{children:n}=t,r=n.findIndex(i=>i===this);n.splice(r,1)}return this}getNodeByKey(t){let n=null;return g9(this,i=>{t===i.attr("key")&&(n=i)}),n}getNodesByType(t){const n=[];return g9(this,i=>{t===i.type&&n.push(i)}),n}getNodeByType(t){let n=null;return g9(this,r=>{n||t===r.type&&(n=r)}),n}call(t,...n){return t(this.map(),...n),this}getRoot(){let t=this;for(;t&&t.parentNode;)t=t.parentNode;return t}};var Hye=function(e,t){var n={};for(var r in e)Object.prototype.hasOwnProperty.call(e,r)&&t.indexOf(r)<0&&(n[r]=e[r]);if(e!=null&&typeof Object.getOwnPropertySymbols=="function")for(var i=0,r=Object.getOwnPropertySymbols(e);i<r.length;i++)t.indexOf(r[i])<0&&Object.prototype.propertyIsEnumerable.call(e,r[i])&&(n[r[i]]=e[r[i]]);return n};const y9=["width","height","depth","padding","paddingLeft","paddingRight","paddingBottom","paddingTop","inset","insetLeft","insetRight","insetTop","insetBottom","margin","marginLeft","marginRight","marginTop","marginBottom","autoFit","theme","title","interaction"],Wye="__remove__",Vye="__callback__",qye=1,Uye=1;function Hxt(e){if(e===void 0){const t=document.createElement("div");return t[Wye]=!0,t}return typeof e=="string"?document.getElementById(e):e}function Wxt(e){const t=e.parentNode;t&&t.removeChild(e)}function Vxt(e){if(e.type!==null)return e;const t=e.children[e.children.length-1];for(const n of y9)t.attr(n,e.attr(n));return t}function Gye(e){return Object.assign(Object.assign({},e.value),{type:e.type})}function b9(e,t){const{width:n,height:r,autoFit:i,depth:a=0}=e;let o=640,s=480;if(i){const{width:l,height:c}=zxt(t);o=l||o,s=c||s}return o=n||o,s=r||s,{width:Math.max(gi(o)?o:qye,qye),height:Math.max(gi(s)?s:Uye,Uye),depth:a}}function qxt(e){const t=Vxt(e),n=[t],r=new Map;for(r.set(t,Gye(t));n.length;){const i=n.pop(),a=r.get(i),{children:o=[]}=i;for(const s of o)if(s.type===Vye)a.children=s.value;else{const l=Gye(s),{children:c=[]}=a;c.push(l),n.push(s),r.set(s,l),a.children=c}}return r.get(t)}function Uxt(e,t){return typeof e=="function"?!0:new Set(Object.keys(t)).has(e)}function Gxt(e,t){return typeof e!="function"&&new Set(Object.keys(t)).has(e)}function Kxt(e,t,n,r,i){const{type:a}=e,{type:o=n||a}=t;if(Gxt(o,i)){for(const s of y9)e.attr(s)!==void 0&&t[s]===void 0&&(t[s]=e.attr(s));return t}if(Uxt(o,r)){const s={type:"view"},l=Object.assign({},t);for(const c of y9)l[c]!==void 0&&(s[c]=l[c],delete l[c]);return Object.assign(Object.assign({},s),{children:[l]})}return t}function Yxt(e,t,n){if(typeof e=="function")return t.mark;const i=Object.assign(Object.assign({},t),n)[e];if(!i)throw new Error(`Unknown mark: ${e}.`);return i}function Xxt(e,t,n){if(typeof e=="function"){const l=new m9;return l.value=e,l.type=Vye,l}const{type:r,children:i}=e,a=Hye(e,["type","children"]),o=Yxt(r,t,n),s=new o;return s.value=a,s.type=r,s}function Zxt(e,t){const{type:n,children:r}=t,i=Hye(t,["type","children"]);e.type===n||n===void 0?Rce(e.value,i):typeof n=="string"&&(e.type=n,e.value=i)}function Qxt(e,t,n,r){if(!e)return;const i=[[e,t]];for(;i.length;){const[a,o]=i.shift(),s=Xxt(o,n,r);Array.isArray(a.children)&&a.push(s);const{children:l}=o;if(Array.isArray(l))for(const c of l)i.push([s,c]);else typeof l=="function"&&i.push([s,l])}}function Jxt(e,t,n,r,i){const a=Kxt(e,t,n,r,i),o=[[null,e,a]];for(;o.length;){const[s,l,c]=o.shift();if(!l)Qxt(s,c,r,i);else if(!c)l.remove();else{Zxt(l,c);const{children:u}=c,{children:f}=l;if(Array.isArray(u)&&Array.isArray(f)){const d=Math.max(u.length,f.length);for(let h=0;h<d;h++){const p=u[h],v=f[h];o.push([l,v,p])}}else typeof u=="function"&&o.push([l,null,u])}}}function e2t(){let e,t;return[new Promise((r,i)=>{t=r,e=i}),t,e]}function t2t(e,t,{key:n=t}){e.prototype[t]=function(r){return arguments.length===0?this.attr(n):this.attr(n,r)}}function n2t(e,t,{key:n=t}){e.prototype[t]=function(r){if(arguments.length===0)return this.attr(n);if(Array.isArray(r))return this.attr(n,r);const i=[...this.attr(n)||[],r];return this.attr(n,i)}}function r2t(e,t,{key:n=t}){e.prototype[t]=function(r,i){if(arguments.length===0)return this.attr(n);if(arguments.length===1&&typeof r!="string")return this.attr(n,r);const a=this.attr(n)||{};return a[r]=arguments.length===1?!0:i,this.attr(n,a)}}function i2t(e,t,n){e.prototype[t]=function(r){if(arguments.length===0)return this.attr(t);if(Array.isArray(r))return this.attr(t,{items:r});if(v0(r)&&(r.title!==void 0||r.items!==void 0))return this.attr(t,r);if(r===null||r===!1)return this.attr(t,r);const i=this.attr(t)||{},{items:a=[]}=i;return a.push(r),i.items=a,this.attr(t,i)}}function a2t(e,t,{ctor:n}){e.prototype[t]=function(r){const i=this.append(n);return t==="mark"&&(i.type=r),i}}function o2t(e,t,{ctor:n}){e.prototype[t]=function(){return this.type=null,this.append(n)}}function m3(e){return t=>{for(const[n,r]of Object.entries(e)){const{type:i}=r;i==="value"?t2t(t,n,r):i==="array"?n2t(t,n,r):i==="object"?r2t(t,n,r):i==="node"?a2t(t,n,r):i==="container"?o2t(t,n,r):i==="mix"&&i2t(t,n)}return t}}function Kye(e){return Object.fromEntries(Object.entries(e).map(([t,n])=>[t,{type:"node",ctor:n}]))}const Yye={encode:{type:"object"},scale:{type:"object"},data:{type:"value"},transform:{type:"array"},style:{type:"object"},animate:{type:"object"},coordinate:{type:"object"},interaction:{type:"object"},label:{type:"array",key:"labels"},axis:{type:"object"},legend:{type:"object"},slider:{type:"object"},scrollbar:{type:"object"},state:{type:"object"},layout:{type:"object"},theme:{type:"object"},title:{type:"value"}},s2t=Object.assign(Object.assign({},Yye),{tooltip:{type:"mix"},viewStyle:{type:"object"}}),l2t=Object.assign(Object.assign({},Yye),{labelTransform:{type:"array"}});var c2t=function(e,t,n,r){var i=arguments.length,a=i<3?t:r===null?r=Object.getOwnPropertyDescriptor(t,n):r,o;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")a=Reflect.decorate(e,t,n,r);else for(var s=e.length-1;s>=0;s--)(o=e[s])&&(a=(i<3?o(a):i>3?o(t,n,a):o(t,n))||a);return i>3&&a&&Object.defineProperty(t,n,a),a};let y3=class extends m9{changeData(t){var n;const r=this.getRoot();if(r)return this.attr("data",t),!((n=this.children)===null||n===void 0)&&n.length&&this.children.forEach(i=>{i.attr("data",t)}),r==null?void 0:r.render()}getView(){const t=this.getRoot(),{views:n}=t.getContext();if(n!=null&&n.length)return n.find(r=>r.key===this._key)}getScale(){var t;return(t=this.getView())===null||t===void 0?void 0:t.scale}getScaleByChannel(t){const n=this.getScale();if(n)return n[t]}getCoordinate(){var t;return(t=this.getView())===null||t===void 0?void 0:t.coordinate}getTheme(){var t;return(t=this.getView())===null||t===void 0?void 0:t.theme}getGroup(){const t=this._key;return t?this.getRoot().getContext().canvas.getRoot().getElementById(t):void 0}show(){const t=this.getGroup();t&&!t.isVisible()&&o3(t)}hide(){const t=this.getGroup();t&&t.isVisible()&&BD(t)}};y3=c2t([m3(l2t)],y3);var u2t=function(e,t,n,r){var i=arguments.length,a=i<3?t:r===null?r=Object.getOwnPropertyDescriptor(t,n):r,o;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")a=Reflect.decorate(e,t,n,r);else for(var s=e.length-1;s>=0;s--)(o=e[s])&&(a=(i<3?o(a):i>3?o(t,n,a):o(t,n))||a);return i>3&&a&&Object.defineProperty(t,n,a),a};let x9=class extends m9{changeData(t){const n=this.getRoot();if(n)return this.attr("data",t),n==null?void 0:n.render()}getMark(){var t;const n=(t=this.getRoot())===null||t===void 0?void 0:t.getView();if(!n)return;const{markState:r}=n,i=Array.from(r.keys()).find(a=>a.key===this.attr("key"));return r.get(i)}getScale(){var t;const n=(t=this.getRoot())===null||t===void 0?void 0:t.getView();if(n)return n==null?void 0:n.scale}getScaleByChannel(t){var n,r;const i=(n=this.getRoot())===null||n===void 0?void 0:n.getView();if(i)return(r=i==null?void 0:i.scale)===null||r===void 0?void 0:r[t]}getGroup(){const t=this.attr("key");return t?this.getRoot().getContext().canvas.getRoot().getElementById(t):void 0}};x9=u2t([m3(s2t)],x9);var f2t=function(e,t,n,r){var i=arguments.length,a=i<3?t:r===null?r=Object.getOwnPropertyDescriptor(t,n):r,o;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")a=Reflect.decorate(e,t,n,r);else for(var s=e.length-1;s>=0;s--)(o=e[s])&&(a=(i<3?o(a):i>3?o(t,n,a):o(t,n))||a);return i>3&&a&&Object.defineProperty(t,n,a),a},d2t=function(e,t){var n={};for(var r in e)Object.prototype.hasOwnProperty.call(e,r)&&t.indexOf(r)<0&&(n[r]=e[r]);if(e!=null&&typeof Object.getOwnPropertySymbols=="function")for(var i=0,r=Object.getOwnPropertySymbols(e);i<r.length;i++)t.indexOf(r[i])<0&&Object.prototype.propertyIsEnumerable.call(e,r[i])&&(n[r[i]]=e[r[i]]);return n};const h2t="G2_CHART_KEY";class p2t extends y3{constructor(t){const{container:n,canvas:r,renderer:i,plugins:a,lib:o,createCanvas:s}=t,l=d2t(t,["container","canvas","renderer","plugins","lib","createCanvas"]);super(l,"view"),this._hasBindAutoFit=!1,this._rendering=!1,this._trailing=!1,this._trailingResolve=null,this._trailingReject=null,this._previousDefinedType=null,this._onResize=Xie(()=>{this.forceFit()},300),this._renderer=i||new hse,this._plugins=a||[],this._container=Hxt(n),this._emitter=new wL,this._context={library:Object.assign(Object.assign({},o),Bye),emitter:this._emitter,canvas:r,createCanvas:s},this._create()}render(){if(this._rendering)return this._addToTrailing();this._context.canvas||this._createCanvas(),this._context.canvas.getConfig().supportsCSSTransform=!0,this._bindAutoFit(),this._rendering=!0;const t=new Promise((a,o)=>Qyt(this._computedOptions(),this._context,this._createResolve(a),this._createReject(o))),[n,r,i]=e2t();return t.then(r).catch(i).then(()=>this._renderTrailing()),n}options(t){if(arguments.length===0)return qxt(this);const{type:n}=t;return n&&(this._previousDefinedType=n),Jxt(this,t,this._previousDefinedType,this._marks,this._compositions),this}getContainer(){return this._container}getContext(){return this._context}on(t,n,r){return this._emitter.on(t,n,r),this}once(t,n){return this._emitter.once(t,n),this}emit(t,...n){return this._emitter.emit(t,...n),this}off(t,n){return this._emitter.off(t,n),this}clear(){const t=this.options();this.emit(jr.BEFORE_CLEAR),this._reset(),d0e(t,this._context,!1),this.emit(jr.AFTER_CLEAR)}destroy(){const t=this.options();this.emit(jr.BEFORE_DESTROY),this._unbindAutoFit(),this._reset(),d0e(t,this._context,!0),this._container[Wye]&&Wxt(this._container),this.emit(jr.AFTER_DESTROY)}forceFit(){this.options.autoFit=!0;const{width:t,height:n}=b9(this.options(),this._container);if(t===this._width&&n===this._height)return Promise.resolve(this);this.emit(jr.BEFORE_CHANGE_SIZE);const r=this.render();return r.then(()=>{this.emit(jr.AFTER_CHANGE_SIZE)}),r}changeSize(t,n){if(t===this._width&&n===this._height)return Promise.resolve(this);this.emit(jr.BEFORE_CHANGE_SIZE),this.attr("width",t),this.attr("height",n);const r=this.render();return r.then(()=>{this.emit(jr.AFTER_CHANGE_SIZE)}),r}_create(){const{library:t}=this._context,n=a=>a.startsWith("mark.")||a==="component.axisX"||a==="component.axisY"||a==="component.legends",r=["mark.mark",...Object.keys(t).filter(n)];this._marks={};for(const a of r){const o=a.split(".").pop();class s extends x9{constructor(){super({},o)}}this._marks[o]=s,this[o]=function(l){const c=this.append(s);return o==="mark"&&(c.type=l),c}}const i=["composition.view",...Object.keys(t).filter(a=>a.startsWith("composition.")&&a!=="composition.mark")];this._compositions=Object.fromEntries(i.map(a=>{const o=a.split(".").pop();let s=class extends y3{constructor(){super({},o)}};return s=f2t([m3(Kye(this._marks))],s),[o,s]}));for(const a of Object.values(this._compositions))m3(Kye(this._compositions))(a);for(const a of i){const o=a.split(".").pop();this[o]=function(){const s=this._compositions[o];return this.type=null,this.append(s)}}}_reset(){const t=["theme","type","width","height","autoFit"];this.type="view",this.value=Object.fromEntries(Object.entries(this.value).filter(([n])=>n.startsWith("margin")||n.startsWith("padding")||n.startsWith("inset")||t.includes(n))),this.children=[]}_renderTrailing(){this._trailing&&(this._trailing=!1,this.render().then(()=>{const t=this._trailingResolve.bind(this);this._trailingResolve=null,t(this)}).catch(t=>{const n=this._trailingReject.bind(this);this._trailingReject=null,n(t)}))}_createResolve(t){return()=>{this._rendering=!1,t(this)}}_createReject(t){return n=>{this._rendering=!1,t(n)}}_computedOptions(){const t=this.options(),{key:n=h2t}=t,{width:r,height:i,depth:a}=b9(t,this._container);return this._width=r,this._height=i,this._key=n,Object.assign(Object.assign({key:this._key},t),{width:r,height:i,depth:a})}_createCanvas(){const{width:t,height:n}=b9(this.options(),this._container);this._plugins.push(new fce),this._plugins.forEach(r=>this._renderer.registerPlugin(r)),this._context.canvas=new Boe({container:this._container,width:t,height:n,renderer:this._renderer})}_addToTrailing(){var t;return(t=this._trailingResolve)===null||t===void 0||t.call(this,this),this._trailing=!0,new Promise((r,i)=>{this._trailingResolve=r,this._trailingReject=i})}_bindAutoFit(){const t=this.options(),{autoFit:n}=t;if(this._hasBindAutoFit){n||this._unbindAutoFit();return}n&&(this._hasBindAutoFit=!0,window.addEventListener("resize",this._onResize))}_unbindAutoFit(){this._hasBindAutoFit&&(this._hasBindAutoFit=!1,window.removeEventListener("resize",this._onResize))}}Object.assign({},Fye());var v2t=function(e){var t=/react|\.jsx|children:\[\(|return\s+[A-Za-z0-9].createElement\((?!['"][g|circle|ellipse|image|rect|line|polyline|polygon|text|path|html|mesh]['"])([^\)])*,/i;return t.test(e)},S9=function(){return S9=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},S9.apply(this,arguments)};function g2t(e,t){var n=b.useRef(),r=b.useRef(),i=b.useRef(null),a=t.onReady,o=t.onEvent,s=function(u,f){var d;u===void 0&&(u="image/png");var h=(d=i.current)===null||d===void 0?void 0:d.getElementsByTagName("canvas")[0];return h==null?void 0:h.toDataURL(u,f)},l=function(u,f,d){u===void 0&&(u="download"),f===void 0&&(f="image/png");var h=u;u.indexOf(".")===-1&&(h="".concat(u,".").concat(f.split("/")[1]));var p=s(f,d),v=document.createElement("a");return v.href=p,v.download=h,document.body.appendChild(v),v.click(),document.body.removeChild(v),v=null,h},c=function(u,f){f===void 0&&(f=!1);var d=Object.keys(u),h=f;d.forEach(function(p){var v=u[p];p==="tooltip"&&(h=!0),qe.isFunction(v)&&v2t("".concat(v))?u[p]=function(){for(var g=[],m=0;m<arguments.length;m++)g[m]=arguments[m];return ust(v.apply(void 0,g),h)}:qe.isArray(v)?v.forEach(function(g){c(g,h)}):qe.isObject(v)?c(v,h):h=f})};return b.useEffect(function(){n.current&&!qe.isEqual(r.current,t)&&(r.current=qe.cloneDeep(t),c(t),n.current.update(t),n.current.render())},[t]),b.useEffect(function(){if(!i.current)return function(){return null};r.current||(r.current=qe.cloneDeep(t)),c(t);var u=new e(i.current,S9({},t));u.toDataURL=s,u.downloadImage=l,u.render(),n.current=u,a&&a(u);var f=function(d){o&&o(u,d)};return u.on("*",f),function(){n.current&&(n.current.destroy(),n.current.off("*",f),n.current=void 0)}},[]),{chart:n,container:i}}const m2t={field:"value",size:[1,1],round:!1,padding:0,sort:(e,t)=>t.value-e.value,as:["x","y"],ignoreParentValue:!0},y2t="nodeIndex",W2="childNodeCount",b2t="nodeAncestor",w9="Invalid field: it must be a string!";function x2t(e,t){const{field:n,fields:r}=e;if($i(n))return n;if(Ua(n))return console.warn(w9),n[0];if(console.warn(`${w9} will try to get fields instead.`),$i(r))return r;if(Ua(r)&&r.length)return r[0];throw new TypeError(w9)}function S2t(e){const t=[];if(e&&e.each){let n,r;e.each(i=>{var a,o;i.parent!==n?(n=i.parent,r=0):r+=1;const s=Hie((((a=i.ancestors)===null||a===void 0?void 0:a.call(i))||[]).map(l=>t.find(c=>c.name===l.name)||l),({depth:l})=>l>0&&l<i.depth);i[b2t]=s,i[W2]=((o=i.children)===null||o===void 0?void 0:o.length)||0,i[y2t]=r,t.push(i)})}else e&&e.eachNode&&e.eachNode(n=>{t.push(n)});return t}function w2t(e,t){t=sXe({},m2t,t);const n=t.as;if(!Ua(n)||n.length!==2)throw new TypeError('Invalid as: it must be an array with 2 strings (e.g. [ "x", "y" ])!');let r;try{r=x2t(t)}catch(l){console.warn(l)}const a=(l=>Bft().size(t.size).round(t.round).padding(t.padding)(C0(l).sum(c=>ix(c.children)?t.ignoreParentValue?0:c[r]-Vie(c.children,(u,f)=>u+f[r],0):c[r]).sort(t.sort)))(e),o=n[0],s=n[1];return a.each(l=>{var c,u;l[o]=[l.x0,l.x1,l.x1,l.x0],l[s]=[l.y1,l.y1,l.y0,l.y0],l.name=l.name||((c=l.data)===null||c===void 0?void 0:c.name)||((u=l.data)===null||u===void 0?void 0:u.label),l.data.name=l.name,["x0","x1","y0","y1"].forEach(f=>{n.indexOf(f)===-1&&delete l[f]})}),S2t(a)}var C2t=function(e,t){var n={};for(var r in e)Object.prototype.hasOwnProperty.call(e,r)&&t.indexOf(r)<0&&(n[r]=e[r]);if(e!=null&&typeof Object.getOwnPropertySymbols=="function")for(var i=0,r=Object.getOwnPropertySymbols(e);i<r.length;i++)t.indexOf(r[i])<0&&Object.prototype.propertyIsEnumerable.call(e,r[i])&&(n[r[i]]=e[r[i]]);return n};const V0="sunburst",C9="markType",Xye="path",b3="ancestor-node";function E2t(e){const{data:t,encode:n}=e,{color:r,value:i}=n,o=w2t(t,{field:i,type:"hierarchy.partition",as:["x","y"]}),s=[];return o.forEach(l=>{var c,u,f,d;if(l.depth===0)return null;let h=l.data.name;const p=[h];let v=Object.assign({},l);for(;v.depth>1;)h=`${(c=v.parent.data)===null||c===void 0?void 0:c.name} / ${h}`,p.unshift((u=v.parent.data)===null||u===void 0?void 0:u.name),v=v.parent;const g=Object.assign(Object.assign(Object.assign({},g8(l.data,[i])),{[Xye]:h,[b3]:v.data.name}),l);r&&r!==b3&&(g[r]=l.data[r]||((d=(f=l.parent)===null||f===void 0?void 0:f.data)===null||d===void 0?void 0:d[r])),s.push(g)}),s.map(l=>{const c=l.x.slice(0,2),u=[l.y[2],l.y[0]];return c[0]===c[1]&&(u[0]=u[1]=(l.y[2]+l.y[0])/2),Object.assign(Object.assign({},l),{x:c,y:u,fillOpacity:Math.pow(.85,l.depth)})})}const Zye={id:V0,encode:{x:"x",y:"y",key:Xye,color:b3,value:"value"},axis:{x:!1,y:!1},style:{[C9]:V0,stroke:"#fff",lineWidth:.5,fillOpacity:"fillOpacity",[W2]:W2,depth:"depth"},state:{active:{zIndex:2,stroke:"#000"},inactive:{zIndex:1,stroke:"#fff"}},legend:!1,interaction:{drillDown:!0},coordinate:{type:"polar",innerRadius:.2}},Qye=e=>{const{encode:t,data:n=[],legend:r}=e,i=C2t(e,["encode","data","legend"]),a=Object.assign(Object.assign({},i.coordinate),{innerRadius:Math.max(xr(i,["coordinate","innerRadius"],.2),1e-5)}),o=Object.assign(Object.assign({},Zye.encode),t),{value:s}=o,l=E2t({encode:o,data:n});return console.log(l,"rectData"),[ct({},Zye,Object.assign(Object.assign({type:"rect",data:l,encode:o,tooltip:{title:"path",items:[c=>({name:s,value:c[s]})]}},i),{coordinate:a}))]};Qye.props={};var O2t=function(e,t,n,r){function i(a){return a instanceof n?a:new n(function(o){o(a)})}return new(n||(n=Promise))(function(a,o){function s(u){try{c(r.next(u))}catch(f){o(f)}}function l(u){try{c(r.throw(u))}catch(f){o(f)}}function c(u){u.done?a(u.value):i(u.value).then(s,l)}c((r=r.apply(e,t||[])).next())})};const _2t=e=>e.querySelectorAll(".element").filter(t=>xr(t,["style",C9])===V0);function $2t(e){return Cn(e).select(`.${v2}`).node()}const P2t={rootText:"root",style:{fill:"rgba(0, 0, 0, 0.85)",fontSize:12,y:1},active:{fill:"rgba(0, 0, 0, 0.5)"}};function M2t(e={}){const{breadCrumb:t={},isFixedColor:n=!1}=e,r=ct({},P2t,t);return i=>{const{update:a,setState:o,container:s,view:l,options:c}=i,u=s.ownerDocument,f=$2t(s),d=c.marks.find(({id:x})=>x===V0),{state:h}=d,p=u.createElement("g");f.appendChild(p);const v=(x,S)=>O2t(this,void 0,void 0,function*(){if(p.removeChildren(),x){const w=u.createElement("text",{style:Object.assign({x:0,text:r.rootText,depth:0},r.style)});p.appendChild(w);let C="";const E=x==null?void 0:x.split(" / ");let O=r.style.y,$=p.getBBox().width;const P=f.getBBox().width,M=E.map((k,T)=>{const R=u.createElement("text",{style:Object.assign(Object.assign({x:$,text:" / "},r.style),{y:O})});p.appendChild(R),$+=R.getBBox().width,C=`${C}${k} / `;const A=u.createElement("text",{name:C.replace(/\s\/\s$/,""),style:Object.assign(Object.assign({text:k,x:$,depth:T+1},r.style),{y:O})});return p.appendChild(A),$+=A.getBBox().width,$>P&&(O=p.getBBox().height,$=0,R.attr({x:$,y:O}),$+=R.getBBox().width,A.attr({x:$,y:O}),$+=A.getBBox().width),A});[w,...M].forEach((k,T)=>{if(T===M.length)return;const R=Object.assign({},k.attributes);k.attr("cursor","pointer"),k.addEventListener("mouseenter",()=>{k.attr(r.active)}),k.addEventListener("mouseleave",()=>{k.attr(R)}),k.addEventListener("click",()=>{v(k.name,xr(k,["style","depth"]))})})}o("drillDown",w=>{const{marks:C}=w,E=C.map(O=>{if(O.id!==V0&&O.type!=="rect")return O;const{data:$}=O,P=Object.fromEntries(["color"].map(k=>[k,{domain:l.scale[k].getOptions().domain}])),M=$.filter(k=>{const T=k.path;return n||(k[b3]=T.split(" / ")[S]),x?new RegExp(`^${x}.+`).test(T):!0});return ct({},O,n?{data:M,scale:P}:{data:M})});return Object.assign(Object.assign({},w),{marks:E})}),yield a()}),g=x=>{const S=x.target;if(xr(S,["style",C9])!==V0||xr(S,["markType"])!=="rect"||!xr(S,["style",W2]))return;const w=xr(S,["__data__","key"]),C=xr(S,["style","depth"]);S.style.cursor="pointer",v(w,C)};f.addEventListener("click",g);const m=h8(Object.assign(Object.assign({},h.active),h.inactive)),y=()=>{_2t(f).forEach(S=>{const w=xr(S,["style",W2]);if(xr(S,["style","cursor"])!=="pointer"&&w){S.style.cursor="pointer";const E=g8(S.attributes,m);S.addEventListener("mouseenter",()=>{S.attr(h.active)}),S.addEventListener("mouseleave",()=>{S.attr(ct(E,h.inactive))})}})};return f.addEventListener("mousemove",y),()=>{p.remove(),f.removeEventListener("click",g),f.removeEventListener("mousemove",y)}}}function k2t(){return{"interaction.drillDown":M2t,"mark.sunburst":Qye}}var x3=function(){return x3=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},x3.apply(this,arguments)},T2t=Bxt(p2t,x3(x3({},Fye()),k2t())),Dr=function(e){var t=I2t(e),n=t.children,r=n===void 0?[]:n,i=qe.omit(t,[].concat(t1e,S3.map(function(c){return c.key}))),a=function(c){var u;return(u=D2t.find(function(f){return f.key===c}))===null||u===void 0?void 0:u.callback},o=function(c,u,f){var d=a(u);d?d(c,u,f):c[u]=Oh({},c[u],f)},s=function(c){Object.keys(c).forEach(function(u){if(c[u]){var f=S3.find(function(p){return p.key===u});if(f){var d=f.type,h=f.extend_keys;d?r.push(l(Oh({},qe.pick(c,h),{type:d},c[u]))):qe.isArray(c[u])&&c[u].forEach(function(p){r.push(l(p))})}}})},l=function(c){return s(c),Object.keys(O9).forEach(function(u){var f=O9[u];if(!qe.isUndefined(c[u]))if(qe.isObject(f)){var d=f.value,h=f.target,p=d(c[u]);o(c,h,p)}else qe.set(c,f,c[u])}),c};return r.forEach(function(c){var u=Oh({},i,c);l(Oh(c,u))}),s(t),R2t(t),e},Jye=function(e,t,n){if(n||arguments.length===2)for(var r=0,i=t.length,a;r<i;r++)(a||!(r in t))&&(a||(a=Array.prototype.slice.call(t,0,r)),a[r]=t[r]);return e.concat(a||Array.prototype.slice.call(t))},R2t=function(e){var t=e.children,n=t===void 0?[]:t,r=Object.keys(O9).concat(S3.map(function(i){return i.key}));return r.forEach(function(i){delete e[i]}),n.forEach(function(i){Object.keys(i).forEach(function(a){r.includes(a)&&delete i[a]})}),Object.keys(e).forEach(function(i){Jye(Jye([],t1e,!0),$9.map(function(a){return a.key}),!0).includes(i)||delete e[i]}),e},I2t=function(e){var t=e.options,n=t.children,r=n===void 0?[]:n;return r.forEach(function(i){Object.keys(i).forEach(function(a){qe.isArray(i[a])&&a!=="data"&&(i[a]=i[a].filter(function(o){return!o[E9]}))})}),t},e1e=function(e,t,n){if(n||arguments.length===2)for(var r=0,i=t.length,a;r<i;r++)(a||!(r in t))&&(a||(a=Array.prototype.slice.call(t,0,r)),a[r]=t[r]);return e.concat(a||Array.prototype.slice.call(t))},A2t=function(e,t){if(qe.isArray(t))return t},Oh=function(){for(var e=[],t=0;t<arguments.length;t++)e[t]=arguments[t];return qe.mergeWith.apply(void 0,e1e(e1e([],e,!1),[A2t],!1))};function V2(e){switch(typeof e){case"function":return e;case"string":return function(t){return qe.get(t,[e])};default:return function(){return e}}}var q2=function(){return q2=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},q2.apply(this,arguments)},N2t=function(e,t){var n={};for(var r in e)Object.prototype.hasOwnProperty.call(e,r)&&t.indexOf(r)<0&&(n[r]=e[r]);if(e!=null&&typeof Object.getOwnPropertySymbols=="function")for(var i=0,r=Object.getOwnPropertySymbols(e);i<r.length;i++)t.indexOf(r[i])<0&&Object.prototype.propertyIsEnumerable.call(e,r[i])&&(n[r[i]]=e[r[i]]);return n},L2t=["renderer"],t1e=["width","height","autoFit","theme","inset","insetLeft","insetRight","insetTop","insetBottom","padding","paddingTop","paddingRight","paddingBottom","paddingLeft","margin","marginTop","marginRight","marginBottom","marginLeft","depth","title","clip","children","type","data","direction"],E9="__transform__",j2t="__skipDelCustomKeys__",Pv=function(e,t){return qe.isBoolean(t)?{type:e,available:t}:q2({type:e},t)},O9={xField:"encode.x",yField:"encode.y",colorField:"encode.color",angleField:"encode.y",keyField:"encode.key",sizeField:"encode.size",shapeField:"encode.shape",seriesField:"encode.series",positionField:"encode.position",textField:"encode.text",valueField:"encode.value",binField:"encode.x",srcField:"encode.src",linkColorField:"encode.linkColor",fontSizeField:"encode.fontSize",radius:"coordinate.outerRadius",innerRadius:"coordinate.innerRadius",startAngle:"coordinate.startAngle",endAngle:"coordinate.endAngle",focusX:"coordinate.focusX",focusY:"coordinate.focusY",distortionX:"coordinate.distortionX",distortionY:"coordinate.distortionY",visual:"coordinate.visual",stack:{target:"transform",value:function(e){return Pv("stackY",e)}},normalize:{target:"transform",value:function(e){return Pv("normalizeY",e)}},percent:{target:"transform",value:function(e){return Pv("normalizeY",e)}},group:{target:"transform",value:function(e){return Pv("dodgeX",e)}},sort:{target:"transform",value:function(e){return Pv("sortX",e)}},symmetry:{target:"transform",value:function(e){return Pv("symmetryY",e)}},diff:{target:"transform",value:function(e){return Pv("diffY",e)}},meta:{target:"scale",value:function(e){return e}},label:{target:"labels",value:function(e){return e}},shape:"style.shape",connectNulls:{target:"style",value:function(e){return qe.isBoolean(e)?{connect:e}:e}}},_9=["xField","yField","seriesField","colorField","keyField","positionField","meta","tooltip","animate","stack","normalize","percent","group","sort","symmetry","diff"],S3=[{key:"annotations",extend_keys:[]},{key:"line",type:"line",extend_keys:_9},{key:"point",type:"point",extend_keys:_9},{key:"area",type:"area",extend_keys:_9}],D2t=[{key:"transform",callback:function(e,t,n){var r;e[t]=e[t]||[];var i=n.available,a=i===void 0?!0:i,o=N2t(n,["available"]);if(a)e[t].push(q2((r={},r[E9]=!0,r),o));else{var s=e[t].indexOf(function(l){return l.type===n.type});s!==-1&&e[t].splice(s,1)}}},{key:"labels",callback:function(e,t,n){var r;if(!n||qe.isArray(n)){e[t]=n||[];return}n.text||(n.text=e.yField),e[t]=e[t]||[],e[t].push(q2((r={},r[E9]=!0,r),n))}}],$9=[{key:"conversionTag",shape:"ConversionTag"},{key:"axisText",shape:"BidirectionalBarAxisText"}],F2t=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),w3=function(){return w3=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},w3.apply(this,arguments)},B2t=function(e,t){var n={};for(var r in e)Object.prototype.hasOwnProperty.call(e,r)&&t.indexOf(r)<0&&(n[r]=e[r]);if(e!=null&&typeof Object.getOwnPropertySymbols=="function")for(var i=0,r=Object.getOwnPropertySymbols(e);i<r.length;i++)t.indexOf(r[i])<0&&Object.prototype.propertyIsEnumerable.call(e,r[i])&&(n[r[i]]=e[r[i]]);return n},n1e=function(e){F2t(t,e);function t(n){n===void 0&&(n={});var r=n.style,i=B2t(n,["style"]);return e.call(this,w3({style:w3({text:"",fontSize:12,textBaseline:"middle",textAlign:"center",fill:"#000",fontStyle:"normal",fontVariant:"normal",fontWeight:"normal",lineWidth:1},r)},i))||this}return t}(Rl),z2t=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),C3=function(){return C3=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},C3.apply(this,arguments)},H2t=function(e,t){var n={};for(var r in e)Object.prototype.hasOwnProperty.call(e,r)&&t.indexOf(r)<0&&(n[r]=e[r]);if(e!=null&&typeof Object.getOwnPropertySymbols=="function")for(var i=0,r=Object.getOwnPropertySymbols(e);i<r.length;i++)t.indexOf(r[i])<0&&Object.prototype.propertyIsEnumerable.call(e,r[i])&&(n[r[i]]=e[r[i]]);return n},W2t=function(e){z2t(t,e);function t(n){n===void 0&&(n={});var r=n.style,i=H2t(n,["style"]);return e.call(this,C3({style:C3({fill:"#eee"},r)},i))||this}return t}(rv),V2t=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),r1e=function(e){V2t(t,e);function t(n,r,i){var a=e.call(this,{style:Oh(i,r)})||this;return a.chart=n,a}return t.prototype.connectedCallback=function(){this.render(this.attributes,this),this.bindEvents(this.attributes,this)},t.prototype.disconnectedCallback=function(){},t.prototype.attributeChangedCallback=function(n){},t.prototype.update=function(n,r){var i;return this.attr(Oh({},this.attributes,n||{})),(i=this.render)===null||i===void 0?void 0:i.call(this,this.attributes,this,r)},t.prototype.clear=function(){this.removeChildren()},t.prototype.getElementsLayout=function(){var n=this.chart.getContext().canvas,r=n.document.getElementsByClassName("element"),i=[];return r.forEach(function(a){var o=a.getBBox(),s=o.x,l=o.y,c=o.width,u=o.height,f=a.__data__;i.push({bbox:o,x:s,y:l,width:c,height:u,key:f.key,data:f})}),i},t.prototype.bindEvents=function(n,r){},t}(vx),q2t=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),E3=function(){return E3=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},E3.apply(this,arguments)},U2t=function(e){q2t(t,e);function t(n,r){return e.call(this,n,r,{type:t.tag})||this}return t.prototype.getConversionTagLayout=function(){var n=this.direction==="vertical",r=this.getElementsLayout(),i=r[0],a=i.x,o=i.y,s=i.height,l=i.width,c=i.data,u=["items",0,"value"],f=qe.get(c,u),d=n?r[1].y-o-s:r[1].x-a-l,h=[],p=this.attributes,v=p.size,g=v===void 0?40:v,m=p.arrowSize,y=m===void 0?20:m,x=p.spacing,S=x===void 0?4:x;return r.forEach(function(w,C){if(C>0){var E=w.x,O=w.y,$=w.height,P=w.width,M=w.data,k=w.key,T=qe.get(M,u),R=g/2;if(n){var A=E+P/2,N=O;h.push({points:[[A+R,N-d+S],[A+R,N-y-S],[A,N-S],[A-R,N-y-S],[A-R,N-d+S]],center:[A,N-d/2-S],width:d,value:[f,T],key:k})}else{var A=E,N=O+$/2;h.push({points:[[E-d+S,N-R],[E-y-S,N-R],[A-S,N],[E-y-S,N+R],[E-d+S,N+R]],center:[A-d/2-S,N],width:d,value:[f,T],key:k})}f=T}}),h},t.prototype.render=function(){this.setDirection(),this.drawConversionTag()},t.prototype.setDirection=function(){var n=this.chart.getCoordinate(),r=qe.get(n,"options.transformations"),i="horizontal";r.forEach(function(a){a.includes("transpose")&&(i="vertical")}),this.direction=i},t.prototype.drawConversionTag=function(){var n=this,r=this.getConversionTagLayout(),i=this.attributes,a=i.style,o=i.text,s=o.style,l=o.formatter;r.forEach(function(c){var u=c.points,f=c.center,d=c.value,h=c.key,p=d[0],v=d[1],g=f[0],m=f[1],y=new W2t({style:E3({points:u,fill:"#eee"},a),id:"polygon-".concat(h)}),x=new n1e({style:E3({x:g,y:m,text:qe.isFunction(l)?l(p,v):(v/p*100).toFixed(2)+"%"},s),id:"text-".concat(h)});n.appendChild(y),n.appendChild(x)})},t.prototype.update=function(){var n=this,r=this.getConversionTagLayout();r.forEach(function(i){var a=i.points,o=i.center,s=i.key,l=o[0],c=o[1],u=n.getElementById("polygon-".concat(s)),f=n.getElementById("text-".concat(s));u.setAttribute("points",a),f.setAttribute("x",l),f.setAttribute("y",c)})},t.tag="ConversionTag",t}(r1e),P9=32,i1e=16,a1e=48,G2t=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),U2=function(){return U2=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},U2.apply(this,arguments)},K2t=function(e,t){var n={};for(var r in e)Object.prototype.hasOwnProperty.call(e,r)&&t.indexOf(r)<0&&(n[r]=e[r]);if(e!=null&&typeof Object.getOwnPropertySymbols=="function")for(var i=0,r=Object.getOwnPropertySymbols(e);i<r.length;i++)t.indexOf(r[i])<0&&Object.prototype.propertyIsEnumerable.call(e,r[i])&&(n[r[i]]=e[r[i]]);return n},Y2t=function(e){G2t(t,e);function t(n,r){return e.call(this,n,r,{type:t.tag})||this}return t.prototype.render=function(){this.drawText()},t.prototype.getBidirectionalBarAxisTextLayout=function(){var n=this.attributes.layout,r=n==="vertical",i=this.getElementsLayout(),a=r?qe.uniqBy(i,"x"):qe.uniqBy(i,"y"),o=["title"],s=[],l=this.chart.getContext().views,c=qe.get(l,[0,"layout"]),u=c.width,f=c.height;return a.forEach(function(d){var h=d.x,p=d.y,v=d.height,g=d.width,m=d.data,y=d.key,x=qe.get(m,o);r?s.push({x:h+g/2,y:f,text:x,key:y}):s.push({x:u,y:p+v/2,text:x,key:y})}),qe.uniqBy(s,"text").length!==s.length&&(s=Object.values(qe.groupBy(s,"text")).map(function(d){var h,p=d.reduce(function(v,g){return v+(r?g.x:g.y)},0);return U2(U2({},d[0]),(h={},h[r?"x":"y"]=p/d.length,h))})),s},t.prototype.transformLabelStyle=function(n){var r={},i=/^label[A-Z]/;return Object.keys(n).forEach(function(a){i.test(a)&&(r[a.replace("label","").replace(/^[A-Z]/,function(o){return o.toLowerCase()})]=n[a])}),r},t.prototype.drawText=function(){var n=this,r=this.getBidirectionalBarAxisTextLayout(),i=this.attributes,a=i.layout,o=i.labelFormatter,s=K2t(i,["layout","labelFormatter"]);r.forEach(function(l){var c=l.x,u=l.y,f=l.text,d=l.key,h=new n1e({style:U2({x:c,y:u,text:qe.isFunction(o)?o(f):f,wordWrap:!0,wordWrapWidth:a==="horizontal"?P9*2:120,maxLines:2,textOverflow:"ellipsis"},n.transformLabelStyle(s)),id:"text-".concat(d)});n.appendChild(h)})},t.prototype.destroy=function(){this.clear()},t.prototype.update=function(){this.destroy(),this.drawText()},t.tag="BidirectionalBarAxisText",t}(r1e),X2t={ConversionTag:U2t,BidirectionalBarAxisText:Y2t},Z2t=function(){function e(t,n){this.container=new Map,this.chart=t,this.config=n,this.init()}return e.prototype.init=function(){var t=this;$9.forEach(function(n){var r,i=n.key,a=n.shape,o=t.config[i];if(o){var s=new X2t[a](t.chart,o),l=t.chart.getContext().canvas;l.appendChild(s),t.container.set(i,s)}else(r=t.container.get(i))===null||r===void 0||r.clear()})},e.prototype.update=function(){var t=this;this.container.size&&$9.forEach(function(n){var r=n.key,i=t.container.get(r);i==null||i.update()})},e}(),Q2t=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),q0=function(){return q0=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},q0.apply(this,arguments)},o1e="data-chart-source-type",Tr=function(e){Q2t(t,e);function t(n,r){var i=e.call(this)||this;return i.container=typeof n=="string"?document.getElementById(n):n,i.options=i.mergeOption(r),i.createG2(),i.bindEvents(),i}return t.prototype.getChartOptions=function(){return q0(q0({},qe.pick(this.options,L2t)),{container:this.container})},t.prototype.getSpecOptions=function(){return this.type==="base"||this[j2t]?q0(q0({},this.options),this.getChartOptions()):this.options},t.prototype.createG2=function(){if(!this.container)throw Error("The container is not initialized!");this.chart=new T2t(this.getChartOptions()),this.container.setAttribute(o1e,"Ant Design Charts")},t.prototype.bindEvents=function(){var n=this;this.chart&&this.chart.on("*",function(r){r!=null&&r.type&&n.emit(r.type,r)})},t.prototype.getBaseOptions=function(){return{type:"view",autoFit:!0}},t.prototype.getDefaultOptions=function(){},t.prototype.render=function(){var n=this;this.type!=="base"&&this.execAdaptor(),this.chart.options(this.getSpecOptions()),this.chart.render().then(function(){n.annotation=new Z2t(n.chart,n.options)}),this.bindSizeSensor()},t.prototype.update=function(n){this.options=this.mergeOption(n)},t.prototype.mergeOption=function(n){return Oh({},this.getBaseOptions(),this.getDefaultOptions(),n)},t.prototype.changeData=function(n){this.chart.changeData(n)},t.prototype.changeSize=function(n,r){this.chart.changeSize(n,r)},t.prototype.destroy=function(){this.chart.destroy(),this.off(),this.container.removeAttribute(o1e)},t.prototype.execAdaptor=function(){var n=this.getSchemaAdaptor();n({chart:this.chart,options:this.options})},t.prototype.triggerResize=function(){this.chart.forceFit()},t.prototype.bindSizeSensor=function(){var n=this,r=this.options.autoFit,i=r===void 0?!0:r;i&&this.chart.on(jr.AFTER_CHANGE_SIZE,function(){n.annotation.update()})},t}(wL),J2t=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),eSt=function(e){J2t(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="base",n}return t.getDefaultOptions=function(){return{type:"view",children:[{type:"line"}]}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return function(n){return n}},t}(Tr),M9=function(){return M9=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},M9.apply(this,arguments)};function tSt(e){var t=e.options,n=t.stack,r=t.tooltip,i=t.xField;if(!n)return e;var a=S3.map(function(s){return s.type}).filter(function(s){return!!s}),o=!1;return a.forEach(function(s){t[s]&&(o=!0,qe.set(t,[s,"stack"],M9({y1:"y"},typeof n=="object"?n:{})))}),o&&!qe.isBoolean(r)&&!r&&qe.set(t,"tooltip",{title:i,items:[{channel:"y"}]}),e}function Xi(e){return qe.flow(tSt)(e)}function nSt(e){var t=e.options.layout,n=t===void 0?"horizontal":t;return e.options.coordinate.transform=n!=="horizontal"?void 0:[{type:"transpose"}],e}function rSt(e){nSt(e);var t=e.options.layout,n=t===void 0?"horizontal":t;return e.options.children.forEach(function(r){var i;!((i=r==null?void 0:r.coordinate)===null||i===void 0)&&i.transform&&(r.coordinate.transform=n!=="horizontal"?void 0:[{type:"transpose"}])}),e}function iSt(e){return qe.flow(Xi,Dr)(e)}var aSt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),oSt=function(e){aSt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="area",n}return t.getDefaultOptions=function(){return{type:"view",children:[{type:"area"}],scale:{y:{nice:!0}},axis:{y:{title:!1},x:{title:!1}},interaction:{tooltip:{shared:!0}}}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return iSt},t}(Tr),U0=function(){return U0=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},U0.apply(this,arguments)};function s1e(e){var t=function(n){var r=n.options;qe.get(r,"children.length")>1&&qe.set(r,"children",[{type:"interval"}]);var i=r.scale,a=r.markBackground,o=r.data,s=r.children,l=r.yField,c=qe.get(i,"y.domain",[]);if(a&&c.length&&qe.isArray(o)){var u="domainMax",f=o.map(function(d){var h;return U0(U0({originData:U0({},d)},qe.omit(d,l)),(h={},h[u]=c[c.length-1],h))});s.unshift(U0({type:"interval",data:f,yField:u,tooltip:!1,style:{fill:"#eee"},label:!1},a))}return n};return qe.flow(t,Xi,Dr)(e)}var sSt=function(){var e=function(t,n){return function(r){var i=t.fill,a=i===void 0?"#2888FF":i,o=t.stroke,s=t.fillOpacity,l=s===void 0?1:s,c=t.strokeOpacity,u=c===void 0?.2:c,f=t.pitch,d=f===void 0?8:f,h=r[0],p=r[1],v=r[2],g=r[3],m=(p[1]-h[1])/2,y=n.document,x=y.createElement("g",{}),S=y.createElement("polygon",{style:{points:[h,[h[0]-d,h[1]+m],[v[0]-d,h[1]+m],g],fill:a,fillOpacity:l,stroke:o,strokeOpacity:u,inset:30}}),w=y.createElement("polygon",{style:{points:[[h[0]-d,h[1]+m],p,v,[v[0]-d,h[1]+m]],fill:a,fillOpacity:l,stroke:o,strokeOpacity:u}}),C=y.createElement("polygon",{style:{points:[h,[h[0]-d,h[1]+m],p,[h[0]+d,h[1]+m]],fill:a,fillOpacity:l-.2}});return x.appendChild(S),x.appendChild(w),x.appendChild(C),x}};zye("shape.interval.bar25D",e)},lSt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}();sSt();var cSt=function(e){lSt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="Bar",n}return t.getDefaultOptions=function(){return{type:"view",coordinate:{transform:[{type:"transpose"}]},children:[{type:"interval"}],scale:{y:{nice:!0}},axis:{y:{title:!1},x:{title:!1}},interaction:{tooltip:{shared:!0},elementHighlight:{background:!0}}}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return s1e},t}(Tr),uSt=function(){var e=function(t,n){return function(r){var i=t.fill,a=i===void 0?"#2888FF":i,o=t.stroke,s=t.fillOpacity,l=s===void 0?1:s,c=t.strokeOpacity,u=c===void 0?.2:c,f=t.pitch,d=f===void 0?8:f,h=r[1][0]-r[0][0],p=h/2+r[0][0],v=n.document,g=v.createElement("g",{}),m=v.createElement("polygon",{style:{points:[[r[0][0],r[0][1]],[p,r[1][1]+d],[p,r[3][1]+d],[r[3][0],r[3][1]]],fill:a,fillOpacity:l,stroke:o,strokeOpacity:u,inset:30}}),y=v.createElement("polygon",{style:{points:[[p,r[1][1]+d],[r[1][0],r[1][1]],[r[2][0],r[2][1]],[p,r[2][1]+d]],fill:a,fillOpacity:l,stroke:o,strokeOpacity:u}}),x=v.createElement("polygon",{style:{points:[[r[0][0],r[0][1]],[p,r[1][1]-d],[r[1][0],r[1][1]],[p,r[1][1]+d]],fill:a,fillOpacity:l-.2}});return g.appendChild(y),g.appendChild(m),g.appendChild(x),g}};zye("shape.interval.column25D",e)},fSt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}();uSt();var dSt=function(e){fSt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="column",n}return t.getDefaultOptions=function(){return{type:"view",scale:{y:{nice:!0}},interaction:{tooltip:{shared:!0},elementHighlight:{background:!0}},axis:{y:{title:!1},x:{title:!1}},children:[{type:"interval"}]}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return s1e},t}(Tr);function hSt(e){var t=function(r){var i=r.options,a=i.children,o=a===void 0?[]:a,s=i.legend;return s&&o.forEach(function(l){if(!qe.get(l,"colorField")){var c=qe.get(l,"yField");qe.set(l,"colorField",function(){return c})}}),r},n=function(r){var i=r.options,a=i.annotations,o=a===void 0?[]:a,s=i.children,l=s===void 0?[]:s,c=i.scale,u=!1;return qe.get(c,"y.key")||l.forEach(function(f,d){if(!qe.get(f,"scale.y.key")){var h="child".concat(d,"Scale");qe.set(f,"scale.y.key",h);var p=f.annotations,v=p===void 0?[]:p;v.length>0&&(qe.set(f,"scale.y.independent",!1),v.forEach(function(g){qe.set(g,"scale.y.key",h)})),!u&&o.length>0&&qe.get(f,"scale.y.independent")===void 0&&(u=!0,qe.set(f,"scale.y.independent",!1),o.forEach(function(g){qe.set(g,"scale.y.key",h)}))}}),r};return qe.flow(t,n,Xi,Dr)(e)}var pSt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),l1e=function(e){pSt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="DualAxes",n}return t.getDefaultOptions=function(){return{type:"view",axis:{y:{title:!1,tick:!1},x:{title:!1}},scale:{y:{independent:!0,nice:!0}}}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return hSt},t}(Tr);function vSt(e){var t=function(a){var o=a.options,s=o.xField,l=o.colorField;return l||qe.set(o,"colorField",s),a},n=function(a){var o=a.options,s=o.compareField,l=o.transform,c=o.isTransposed,u=c===void 0?!0:c,f=o.coordinate;return l||(s?qe.set(o,"transform",[]):qe.set(o,"transform",[{type:"symmetryY"}])),!f&&u&&qe.set(o,"coordinate",{transform:[{type:"transpose"}]}),a},r=function(a){var o=a.options,s=o.compareField,l=o.seriesField,c=o.data,u=o.children,f=o.yField,d=o.isTransposed,h=d===void 0?!0:d;if(s||l){var p=Object.values(qe.groupBy(c,function(v){return v[s||l]}));u[0].data=p[0],u.push({type:"interval",data:p[1],yField:function(v){return-v[f]}}),delete o.compareField,delete o.data}return l&&(qe.set(o,"type","spaceFlex"),qe.set(o,"ratio",[1,1]),qe.set(o,"direction",h?"row":"col"),delete o.seriesField),a},i=function(a){var o=a.options,s=o.tooltip,l=o.xField,c=o.yField;return s||qe.set(o,"tooltip",{title:!1,items:[function(u){return{name:u[l],value:u[c]}}]}),a};return qe.flow(t,n,r,i,Xi,Dr)(e)}var gSt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),mSt=function(e){gSt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="column",n}return t.getDefaultOptions=function(){return{type:"view",scale:{x:{padding:0}},animate:{enter:{type:"fadeIn"}},axis:!1,shapeField:"funnel",label:{position:"inside",transform:[{type:"contrastReverse"}]},children:[{type:"interval"}]}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return vSt},t}(Tr);function ySt(e){return qe.flow(Xi,Dr)(e)}var bSt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),xSt=function(e){bSt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="line",n}return t.getDefaultOptions=function(){return{type:"view",scale:{y:{nice:!0}},interaction:{tooltip:{shared:!0}},axis:{y:{title:!1},x:{title:!1}},children:[{type:"line"}]}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return ySt},t}(Tr),Xl=function(){return Xl=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},Xl.apply(this,arguments)};function SSt(e){var t=function(n){var r=n.options,i=r.angleField,a=r.data,o=r.label,s=r.tooltip,l=r.colorField,c=V2(l);if(qe.isArray(a)&&a.length>0){var u=a.reduce(function(d,h){return d+h[i]},0);if(u===0){var f=a.map(function(d){var h;return Xl(Xl({},d),(h={},h[i]=1,h))});qe.set(r,"data",f),o&&qe.set(r,"label",Xl(Xl({},o),{formatter:function(){return 0}})),s!==!1&&(qe.isFunction(s)?qe.set(r,"tooltip",function(d,h,p){var v;return s(Xl(Xl({},d),(v={},v[i]=0,v)),h,p.map(function(g){var m;return Xl(Xl({},g),(m={},m[i]=0,m))}))}):qe.set(r,"tooltip",Xl(Xl({},s),{items:[function(d,h,p){return{name:c(d,h,p),value:0}}]})))}}return n};return qe.flow(t,Dr)(e)}var wSt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),CSt=function(e){wSt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="pie",n}return t.getDefaultOptions=function(){return{type:"view",children:[{type:"interval"}],coordinate:{type:"theta"},transform:[{type:"stackY",reverse:!0}],animate:{enter:{type:"waveIn"}}}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return SSt},t}(Tr);function ESt(e){return qe.flow(Xi,Dr)(e)}var OSt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),_St=function(e){OSt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="scatter",n}return t.getDefaultOptions=function(){return{axis:{y:{title:!1},x:{title:!1}},legend:{size:!1},children:[{type:"point"}]}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return ESt},t}(Tr);function $St(e){var t=function(n){return qe.set(n,"options.coordinate",{type:qe.get(n,"options.coordinateType","polar")}),n};return qe.flow(t,Dr)(e)}var PSt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),MSt=function(e){PSt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="radar",n}return t.getDefaultOptions=function(){return{axis:{x:{grid:!0,line:!0},y:{zIndex:1,title:!1,line:!0,nice:!0}},meta:{x:{padding:.5,align:0}},interaction:{tooltip:{style:{crosshairsLineDash:[4,4]}}},children:[{type:"line"}],coordinateType:"polar"}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return $St},t}(Tr),Bf=function(){return Bf=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},Bf.apply(this,arguments)},kSt="__stock-range__",TSt="trend",RSt="up",ISt="down";function ASt(e){var t=function(r){var i=r.options,a=i.data,o=i.yField;return r.options.data=qe.map(a,function(s){var l=s&&Bf({},s);if(Array.isArray(o)&&l){var c=o[0],u=o[1],f=o[2],d=o[3];l[TSt]=l[c]<=l[u]?RSt:ISt,l[kSt]=[l[c],l[u],l[f],l[d]]}return l}),r},n=function(r){var i=r.options,a=i.xField,o=i.yField,s=i.fallingFill,l=i.risingFill,c=o[0],u=o[1],f=o[2],d=o[3],h=V2(a);return r.options.children=qe.map(r.options.children,function(p,v){var g=v===0;return Bf(Bf({},p),{tooltip:{title:function(m,y,x){var S=h(m,y,x);return S instanceof Date?S.toLocaleString():S},items:[{field:f},{field:d},{field:c},{field:u}]},encode:Bf(Bf({},p.encode||{}),{y:g?[f,d]:[c,u],color:function(m){return Math.sign(m[u]-m[c])}}),style:Bf(Bf({},p.style||{}),{lineWidth:g?1:10})})}),delete i.yField,r.options.legend={color:!1},s&&qe.set(r,"options.scale.color.range[0]",s),l&&qe.set(r,"options.scale.color.range[2]",l),r};return qe.flow(t,n,Dr)(e)}var NSt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),LSt=["#26a69a","#999999","#ef5350"],jSt=function(e){NSt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="stock",n}return t.getDefaultOptions=function(){return{type:"view",scale:{color:{domain:[-1,0,1],range:LSt},y:{nice:!0}},children:[{type:"link"},{type:"link"}],axis:{x:{title:!1,grid:!1},y:{title:!1,grid:!0,gridLineDash:null}},animate:{enter:{type:"scaleInY"}},interaction:{tooltip:{shared:!0,marker:!1,groupName:!1,crosshairs:!0}}}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return ASt},t}(Tr);function DSt(e){return qe.flow(Xi,Dr)(e)}var FSt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),BSt=function(e){FSt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="TinyLine",n}return t.getDefaultOptions=function(){return{type:"view",children:[{type:"line",axis:!1}],animate:{enter:{type:"growInX",duration:500}},padding:0,margin:0,tooltip:!1}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return DSt},t}(Tr);function zSt(e){return qe.flow(Xi,Dr)(e)}var HSt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),WSt=function(e){HSt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="TinyArea",n}return t.getDefaultOptions=function(){return{type:"view",animate:{enter:{type:"growInX",duration:500}},children:[{type:"area",axis:!1}],padding:0,margin:0,tooltip:!1}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return zSt},t}(Tr);function VSt(e){return qe.flow(Xi,Dr)(e)}var qSt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),USt=function(e){qSt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="TinyColumn",n}return t.getDefaultOptions=function(){return{type:"view",children:[{type:"interval",axis:!1}],padding:0,margin:0,tooltip:!1}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return VSt},t}(Tr),k9=function(){return k9=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},k9.apply(this,arguments)};function GSt(e){var t=function(n){var r=n.options,i=r.percent,a=r.color,o=a===void 0?[]:a;if(!i)return n;var s={scale:{color:{range:o.length?o:[]}},data:[1,i]};return Object.assign(r,k9({},s)),n};return qe.flow(t,Xi,Dr)(e)}var KSt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),YSt=function(e){KSt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="TinyProgress",n}return t.getDefaultOptions=function(){return{type:"view",data:[],margin:0,padding:0,tooltip:!1,children:[{interaction:{tooltip:!1},coordinate:{transform:[{type:"transpose"}]},type:"interval",axis:!1,legend:!1,encode:{y:function(n){return n},color:function(n,r){return r}}}]}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return GSt},t}(Tr),T9=function(){return T9=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},T9.apply(this,arguments)};function XSt(e){var t=function(r){var i=r.options,a=i.radius,o=a===void 0?.8:a;return qe.set(r,"options.coordinate.innerRadius",o),r},n=function(r){var i=r.options,a=i.percent,o=i.color,s=o===void 0?[]:o;if(!a)return r;var l={scale:{color:{range:s.length?s:[]}},data:[1,a]};return Object.assign(i,T9({},l)),r};return qe.flow(t,n,Xi,Dr)(e)}var ZSt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),QSt=function(e){ZSt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="TinyRing",n}return t.getDefaultOptions=function(){return{type:"view",data:[],margin:0,padding:0,coordinate:{type:"theta"},animate:{enter:{type:"waveIn"}},interaction:{tooltip:!1},tooltip:!1,children:[{type:"interval",axis:!1,legend:!1,encode:{y:function(n){return n},color:function(n,r){return r}}}]}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return XSt},t}(Tr);function JSt(e){return qe.flow(Dr)(e)}var ewt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),twt=function(e){ewt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="rose",n}return t.getDefaultOptions=function(){return{type:"view",children:[{type:"interval"}],coordinate:{type:"polar"},animate:{enter:{type:"waveIn"}}}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return JSt},t}(Tr),R9="__start__",G0="__end__",I9="__waterfall_value__",A9=function(){return A9=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},A9.apply(this,arguments)},nwt=function(e,t,n){if(n||arguments.length===2)for(var r=0,i=t.length,a;r<i;r++)(a||!(r in t))&&(a||(a=Array.prototype.slice.call(t,0,r)),a[r]=t[r]);return e.concat(a||Array.prototype.slice.call(t))};function rwt(e){var t=function(r){var i=r.options,a=i.data,o=a===void 0?[]:a,s=i.yField;return o.length&&(o.reduce(function(l,c,u){var f,d=V2(s),h=d(c,u,o);if(u===0||c.isTotal)c[R9]=0,c[G0]=h,c[I9]=h;else{var p=(f=l[G0])!==null&&f!==void 0?f:d(l,u,o);c[R9]=p,c[G0]=p+h,c[I9]=l[G0]}return c},[]),Object.assign(i,{yField:[R9,G0]})),r},n=function(r){var i=r.options,a=i.data,o=a===void 0?[]:a,s=i.xField,l=i.children,c=i.linkStyle,u=nwt([],o,!0);return u.reduce(function(f,d,h){return h>0&&(d.x1=f[s],d.x2=d[s],d.y1=f[G0]),d},[]),u.shift(),l.push({type:"link",xField:["x1","x2"],yField:"y1",zIndex:-1,data:u,style:A9({stroke:"#697474"},c),label:!1,tooltip:!1}),r};return qe.flow(t,n,Xi,Dr)(e)}var iwt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),awt=function(e){iwt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="waterfall",n}return t.getDefaultOptions=function(){return{type:"view",legend:null,tooltip:{field:I9,valueFormatter:"~s",name:"value"},axis:{y:{title:null,labelFormatter:"~s"},x:{title:null}},children:[{type:"interval",interaction:{elementHighlight:{background:!0}}}]}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return rwt},t}(Tr);function owt(e){var t=function(n){var r=n.options,i=r.data,a=r.binNumber,o=r.binWidth,s=r.children,l=r.channel,c=l===void 0?"count":l,u=qe.get(s,"[0].transform[0]",{});return qe.isNumber(o)?(qe.assign(u,{thresholds:qe.ceil(qe.divide(i.length,o)),y:c}),n):(qe.isNumber(a)&&qe.assign(u,{thresholds:a,y:c}),n)};return qe.flow(t,Xi,Dr)(e)}var swt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),lwt=function(e){swt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="Histogram",n}return t.getDefaultOptions=function(){return{type:"view",autoFit:!0,axis:{y:{title:!1},x:{title:!1}},children:[{type:"rect",transform:[{type:"binX",y:"count"}],interaction:{elementHighlight:{background:!0}}}]}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return owt},t}(Tr);function cwt(e){var t=function(r){var i=r.options,a=i.tooltip,o=a===void 0?{}:a,s=i.colorField,l=i.sizeField;return o&&!o.field&&(o.field=s||l),r},n=function(r){var i=r.options,a=i.mark,o=i.children;return a&&(o[0].type=a),r};return qe.flow(t,n,Xi,Dr)(e)}var uwt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),fwt=function(e){uwt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="heatmap",n}return t.getDefaultOptions=function(){return{type:"view",legend:null,tooltip:{valueFormatter:"~s"},axis:{y:{title:null,grid:!0},x:{title:null,grid:!0}},children:[{type:"point",interaction:{elementHighlight:{background:!0}}}]}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return cwt},t}(Tr);function dwt(e){var t=function(n){var r=n.options.boxType,i=r===void 0?"box":r;return n.options.children[0].type=i,n};return qe.flow(t,Xi,Dr)(e)}var hwt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),pwt=function(e){hwt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="box",n}return t.getDefaultOptions=function(){return{type:"view",children:[{type:"box"}],axis:{y:{title:!1},x:{title:!1}},tooltip:{items:[{name:"min",channel:"y"},{name:"q1",channel:"y1"},{name:"q2",channel:"y2"},{name:"q3",channel:"y3"},{name:"max",channel:"y4"}]}}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return dwt},t}(Tr);function vwt(e){var t=function(n){var r=n.options,i=r.data,a=[{type:"custom",callback:function(s){return{links:s}}}];if(qe.isArray(i))i.length>0?qe.set(r,"data",{value:i,transform:a}):delete r.children;else if(qe.get(i,"type")==="fetch"&&qe.get(i,"value")){var o=qe.get(i,"transform");qe.isArray(o)?qe.set(i,"transform",o.concat(a)):qe.set(i,"transform",a)}return n};return qe.flow(t,Xi,Dr)(e)}var gwt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),mwt=function(e){gwt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="sankey",n}return t.getDefaultOptions=function(){return{type:"view",children:[{type:"sankey"}]}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return vwt},t}(Tr),Bc=function(){return Bc=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},Bc.apply(this,arguments)},O3=["#f0efff","#5B8FF9","#3D76DD"];function N9(e,t,n,r){r===void 0&&(r=!0);var i=0,a=!1,o=qe.map(e,function(s){var l,c,u=qe.get(s,[t]);if(qe.isNil(u))return[];if(qe.isString(u)){var f=Number(u);return isNaN(f)?[]:(l={},l[n]=s[n],l[t]=f,l)}return qe.isArray(u)?(a=!0,i=Math.max(i,u.length),qe.map(r?u.sort(function(d,h){return h-d}):u,function(d,h){var p;return p={},p[n]=s[n],p[t]=d,p.index=h,p})):(i=Math.max(1,i),c={},c[n]=s[n],c[t]=u,c)}).flat();return a?[o.map(function(s){return Bc({index:0},s)}),i]:[o,i]}function L9(e,t){return new Array(e).fill("").map(function(n,r){return qe.isArray(t)?t[r%t.length]:t})}function ywt(e){var t=function(i){var a=i.options,o=a.color,s=a.rangeField,l=s===void 0?"ranges":s,c=a.measureField,u=c===void 0?"measures":c,f=a.targetField,d=f===void 0?"targets":f,h=a.xField,p=h===void 0?"title":h,v=a.mapField,g=a.data,m=N9(g,l,p),y=m[0],x=m[1],S=N9(g,u,p,!1),w=S[0],C=S[1],E=N9(g,d,p,!1),O=E[0],$=E[1],P=qe.get(o,[l],O3[0]),M=qe.get(o,[u],O3[1]),k=qe.get(o,[d],O3[2]),T=[L9(x,P),L9(C,M),L9($,k)].flat();return i.options.children=qe.map(i.options.children,function(R,A){var N=[y,w,O][A],L=[l,u,d][A];return Bc(Bc({},R),{data:N,encode:Bc(Bc({},R.encode||{}),{x:p,y:L,color:function(j){var F=j.index,B=qe.isNumber(F)?"".concat(L,"_").concat(F):L;return v?qe.get(v,[L,F],B):B}}),style:Bc(Bc({},R.style||{}),{zIndex:function(j){return-j[L]}}),labels:A!==0?qe.map(R.labels,function(j){return Bc(Bc({},j),{text:L})}):void 0})}),i.options.scale.color.range=T,i.options.legend.color.itemMarker=function(R){return v&&qe.includes(v==null?void 0:v[d],R)||(R==null?void 0:R.replace(/\_\d$/,""))===d?"line":"square"},i},n=function(i){var a=i.options.layout,o=a===void 0?"horizontal":a;return o!=="horizontal"&&qe.set(i,"options.children[2].shapeField","hyphen"),i},r=function(i){var a=i.options,o=a.range,s=o===void 0?{}:o,l=a.measure,c=l===void 0?{}:l,u=a.target,f=u===void 0?{}:u,d=a.children;return i.options.children=[s,c,f].map(function(h,p){return Oh(d[p],h)}),i};return qe.flow(t,n,r,rSt,Dr)(e)}var bwt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),xwt=function(e){bwt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="bullet",n}return t.getDefaultOptions=function(){return{type:"view",scale:{color:{range:O3}},legend:{color:{itemMarker:function(n){return n==="target"?"line":"square"}}},axis:{y:{title:!1},x:{title:!1}},children:[{type:"interval",style:{maxWidth:30},axis:{y:{grid:!0,gridLineWidth:2}}},{type:"interval",style:{maxWidth:20},transform:[{type:"stackY"}]},{type:"point",encode:{size:8,shape:"line"}}],interaction:{tooltip:{shared:!0}},coordinate:{transform:[{type:"transpose"}]}}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return ywt},t}(Tr);function Swt(e){var t=function(n){var r=n.options.data;return n.options.data={value:r},n};return qe.flow(t,Xi,Dr)(e)}var wwt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),Cwt=function(e){wwt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="Gauge",n}return t.getDefaultOptions=function(){return{type:"view",legend:!1,children:[{type:"gauge"}]}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return Swt},t}(Tr);function Ewt(e){var t=function(n){var r=n.options.percent;return qe.isNumber(r)&&(qe.set(n,"options.data",r),delete n.options.percent),n};return qe.flow(t,Xi,Dr)(e)}var Owt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),_wt=function(e){Owt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="Liquid",n}return t.getDefaultOptions=function(){return{type:"view",children:[{type:"liquid"}]}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return Ewt},t}(Tr);function $wt(e){return qe.flow(Xi,Dr)(e)}var Pwt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),Mwt=function(e){Pwt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="WordCloud",n}return t.getDefaultOptions=function(){return{type:"view",legend:!1,children:[{type:"wordCloud"}]}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return $wt},t}(Tr);function kwt(e){var t=function(n){var r=n.options,i=r.data;return i&&qe.set(r,"data",{value:i}),n};return qe.flow(t,Xi,Dr)(e)}var Twt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),Rwt=function(e){Twt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="treemap",n}return t.getDefaultOptions=function(){return{type:"view",children:[{type:"treemap"}]}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return kwt},t}(Tr),Mv=function(){return Mv=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},Mv.apply(this,arguments)};function Iwt(e){var t=function(i){var a=i.options,o=a.startAngle,s=a.maxAngle,l=a.coordinate,c=qe.isNumber(o)?o/(2*Math.PI)*360:-90,u=qe.isNumber(s)?(Number(s)+c)/180*Math.PI:Math.PI;return qe.set(i,["options","coordinate"],Mv(Mv({},l),{endAngle:u,startAngle:o!=null?o:-Math.PI/2})),i},n=function(i){var a=i.options,o=a.tooltip,s=a.xField,l=a.yField,c=V2(s),u=V2(l);return o||qe.set(a,"tooltip",{title:!1,items:[function(f,d,h){return{name:c(f,d,h),value:u(f,d,h)}}]}),i},r=function(i){var a=i.options,o=a.markBackground,s=a.children,l=a.scale,c=a.coordinate,u=a.xField,f=qe.get(l,"y.domain",[]);return o&&s.unshift(Mv({type:"interval",xField:u,yField:f[f.length-1],colorField:o.color,scale:{color:{type:"identity"}},style:{fillOpacity:o.opacity,fill:o.color?void 0:"#e0e4ee"},coordinate:Mv(Mv({},c),{startAngle:-Math.PI/2,endAngle:1.5*Math.PI}),animate:!1},o)),i};return qe.flow(t,n,r,Xi,Dr)(e)}var Awt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),Nwt=function(e){Awt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="radial",n}return t.getDefaultOptions=function(){return{type:"view",children:[{type:"interval"}],coordinate:{type:"radial",innerRadius:.1,outerRadius:1,endAngle:Math.PI},animate:{enter:{type:"waveIn",duration:800}},axis:{y:{nice:!0,labelAutoHide:!0,labelAutoRotate:!1},x:{title:!1,nice:!0,labelAutoRotate:!1,labelAutoHide:{type:"equidistance",cfg:{minGap:6}}}}}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return Iwt},t}(Tr);function Lwt(e){return qe.flow(Dr)(e)}var jwt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),Dwt=function(e){jwt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="CirclePacking",n}return t.getDefaultOptions=function(){return{legend:!1,type:"view",children:[{type:"pack"}]}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return Lwt},t}(Tr),_3=function(){return _3=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},_3.apply(this,arguments)};function Fwt(e){var t=function(n){var r=n.options,i=r.xField,a=r.yField,o=r.seriesField,s=r.children,l=s==null?void 0:s.map(function(c){return _3(_3({},c),{xField:i,yField:a,seriesField:o,colorField:o,data:c.type==="density"?{transform:[{type:"kde",field:a,groupBy:[i,o]}]}:c.data})}).filter(function(c){return r.violinType!=="density"||c.type==="density"});return qe.set(r,"children",l),r.violinType==="polar"&&qe.set(r,"coordinate",{type:"polar"}),qe.set(r,"violinType",void 0),n};return qe.flow(t,Xi,Dr)(e)}var Bwt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),zwt=function(e){Bwt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="violin",n}return t.getDefaultOptions=function(){return{type:"view",children:[{type:"density",sizeField:"size",tooltip:!1},{type:"boxplot",shapeField:"violin",style:{opacity:.5,point:!1}}],animate:{enter:{type:"fadeIn"}}}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return Fwt},t}(Tr),G2=function(){return G2=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},G2.apply(this,arguments)},Hwt=function(e,t,n){if(n||arguments.length===2)for(var r=0,i=t.length,a;r<i;r++)(a||!(r in t))&&(a||(a=Array.prototype.slice.call(t,0,r)),a[r]=t[r]);return e.concat(a||Array.prototype.slice.call(t))};function Wwt(e){var t=function(a){var o=a.options,s=o.yField,l=o.children;return l.forEach(function(c,u){qe.set(c,"yField",s[u])}),a},n=function(a){var o=a.options,s=o.yField,l=o.children,c=o.data;if(qe.isPlainObject(c))return a;var u=qe.isArray(qe.get(c,[0]))?c:[c,c];return l.forEach(function(f,d){qe.set(f,"data",Hwt([],u[d].map(function(h){return G2({groupKey:s[d]},h)}),!0))}),a},r=function(a){var o=a.options,s=o.yField,l=s[0],c=s[1],u=o.tooltip;return u||qe.set(o,"tooltip",{items:[{field:l,value:l},{field:c,value:c}]}),a},i=function(a){var o=a.options,s=o.children,l=o.layout,c=o.coordinate.transform,u=o.paddingBottom,f=u===void 0?a1e:u,d=o.paddingLeft,h=d===void 0?a1e:d,p=o.axis;qe.set(o,"axisText",G2(G2({},(p==null?void 0:p.x)||{}),{layout:l}));var v=s[0],g=s[1];if(l==="vertical")qe.set(o,"direction","col"),qe.set(o,"paddingLeft",h),qe.set(o,"coordinate.transform",c.filter(function(w){return w.type!=="transpose"})),qe.set(v,"paddingBottom",i1e),qe.set(g,"paddingTop",i1e),qe.set(g,"axis",{x:{position:"top"}}),qe.set(g,"scale",{y:{range:[0,1]}});else{qe.set(o,"paddingBottom",f),qe.set(v,"scale",{y:{range:[0,1]}});var m=v.paddingRight,y=m===void 0?P9:m,x=g.paddingLeft,S=x===void 0?P9:x;qe.set(v,"paddingRight",y),qe.set(v,"axis",{x:{position:"right"}}),qe.set(g,"paddingLeft",S)}return a};return qe.flow(t,n,r,i,Xi,Dr)(e)}var Vwt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),qwt=function(e){Vwt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="BidirectionalBar",n}return t.getDefaultOptions=function(){return{type:"spaceFlex",coordinate:{transform:[{type:"transpose"}]},scale:{y:{nice:!0}},direction:"row",layout:"horizontal",legend:!1,axis:{y:{title:!1},x:{title:!1,label:!1}},children:[{type:"interval"},{type:"interval"}]}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return Wwt},t}(Tr),kv;(function(e){e.color="key",e.d="path"})(kv||(kv={}));function Uwt(e){var t=function(n){var r=n.options,i=r.data,a=r.setsField,o=r.sizeField;return qe.isArray(i)&&(qe.set(r,"data",{type:"inline",value:i,transform:[{type:"venn",sets:a,size:o,as:[kv.color,kv.d]}]}),qe.set(r,"colorField",a),qe.set(r,["children","0","encode","d"],kv.d)),qe.set(n,"options",qe.omit(r,["sizeField","setsField"])),n};return qe.flow(t,Dr)(e)}var Gwt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),Kwt=function(e){Gwt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="venn",n}return t.getDefaultOptions=function(){return{type:"view",children:[{type:"path"}],legend:{color:{itemMarker:"circle"}},encode:{color:kv.color,d:kv.d}}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return Uwt},t}(Tr);function Ywt(e){var t=function(n){return n};return qe.flow(t,Dr)(e)}var Xwt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),Zwt=function(e){Xwt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="Sunburst",n}return t.getDefaultOptions=function(){return{type:"view",children:[{type:"sunburst"}]}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return Ywt},t}(Tr),Qwt={Base:eSt,Line:xSt,Column:dSt,Pie:CSt,Area:oSt,Bar:cSt,DualAxes:l1e,Funnel:mSt,Scatter:_St,Radar:MSt,Rose:twt,Stock:jSt,TinyLine:BSt,TinyArea:WSt,TinyColumn:USt,TinyProgress:YSt,TinyRing:QSt,Waterfall:awt,Histogram:lwt,Heatmap:fwt,Box:pwt,Sankey:mwt,Bullet:xwt,Gauge:Cwt,Liquid:_wt,WordCloud:Mwt,Treemap:Rwt,RadialBar:Nwt,CirclePacking:Dwt,Violin:zwt,BidirectionalBar:qwt,Venn:Kwt,Mix:l1e,Sunburst:Zwt},j9=function(){return j9=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},j9.apply(this,arguments)},c1e=function(e,t){var n={};for(var r in e)Object.prototype.hasOwnProperty.call(e,r)&&t.indexOf(r)<0&&(n[r]=e[r]);if(e!=null&&typeof Object.getOwnPropertySymbols=="function")for(var i=0,r=Object.getOwnPropertySymbols(e);i<r.length;i++)t.indexOf(r[i])<0&&Object.prototype.propertyIsEnumerable.call(e,r[i])&&(n[r[i]]=e[r[i]]);return n},K2=b.forwardRef(function(e,t){var n=e.chartType,r=n===void 0?"Base":n,i=c1e(e,["chartType"]),a=i.containerStyle,o=a===void 0?{height:"inherit",flex:1}:a,s=i.containerAttributes,l=s===void 0?{}:s,c=i.className,u=i.loading,f=i.loadingTemplate,d=i.errorTemplate,h=c1e(i,["containerStyle","containerAttributes","className","loading","loadingTemplate","errorTemplate"]),p=g2t(Qwt[r],h),v=p.chart,g=p.container;return b.useImperativeHandle(t,function(){return v.current}),we.createElement(pst,{errorTemplate:d},u&&we.createElement(dst,{loadingTemplate:f}),we.createElement("div",j9({className:c,style:o,ref:g},l)))}),D9=function(){return D9=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},D9.apply(this,arguments)},Jwt=b.forwardRef(function(e,t){return we.createElement(K2,D9({},e,{chartType:"Area",ref:t}))}),F9=function(){return F9=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},F9.apply(this,arguments)},eCt=b.forwardRef(function(e,t){return we.createElement(K2,F9({},e,{chartType:"Bar",ref:t}))}),B9=function(){return B9=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},B9.apply(this,arguments)},tCt=b.forwardRef(function(e,t){return we.createElement(K2,B9({},e,{chartType:"Column",ref:t}))}),z9=function(){return z9=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},z9.apply(this,arguments)},nCt=b.forwardRef(function(e,t){return we.createElement(K2,z9({},e,{chartType:"Line",ref:t}))}),H9=function(){return H9=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},H9.apply(this,arguments)},rCt=b.forwardRef(function(e,t){return we.createElement(K2,H9({},e,{chartType:"Pie",ref:t}))});const{useToken:iCt}=$b,aCt=({widget:e})=>{const{t}=io("DashboardWidget"),{token:n}=iCt(),[r,i]=we.useState(),[a,o]=we.useState(),[s,l]=we.useState(),c=Im.stringify({min_x_field:Hb(r),max_x_field:Hb(a),period_x_field:Hb(s)}),{data:u,isLoading:f}=Kc({queryKey:["/dashboard-widget",e.key,c],queryFn:()=>lu(`/dashboard-widget/${e.key}?${c}`),refetchOnWindowFocus:!1});b.useEffect(()=>{u&&(i(Wb(u.min_x_field)),o(Wb(u.max_x_field)),l(Wb(u.period_x_field)))},[u]);const d=b.useCallback((h,p,v,g)=>{if(!h.x_field_filter_widget_type)return null;const[m,y]=J6(h.x_field_filter_widget_type,t),x=S=>{switch(m){case oi:case oi.TextArea:case Dd.Group:g(S.target.value);break;default:g(S);break}};return ve.jsx(m,Rn(Ke(Ke({size:"small",placeholder:p},y||{}),h.x_field_filter_widget_props||{}),{value:v,onChange:x}))},[t]);return ve.jsxs(hm,{title:ve.jsxs(Ri,{justify:"space-between",style:{lineHeight:2},children:[ve.jsx(vr,{children:e.title}),e.x_field_filter_widget_type&&ve.jsx(vr,{children:ve.jsxs(va,{children:[e.x_field_periods&&ve.jsx(no,{allowClear:!0,style:{width:100},options:e.x_field_periods.map(h=>({label:LO(h),value:h})),value:s,onChange:l,size:"small"}),d(e,t("From"),r,i),ve.jsx(zE,{}),d(e,t("To"),a,o)]})})]}),children:[!f&&e.dashboard_widget_type===Nm.ChartLine&&ve.jsx(nCt,Ke({data:(u==null?void 0:u.results)||[],xField:e.x_field,yField:e.y_field,legend:{position:"top-left"},colorField:n.colorPrimary},e.dashboard_widget_props||{})),!f&&e.dashboard_widget_type===Nm.ChartArea&&ve.jsx(Jwt,Ke({data:(u==null?void 0:u.results)||[],xField:e.x_field,yField:e.y_field,legend:{position:"top-left"},colorField:n.colorPrimary},e.dashboard_widget_props||{})),!f&&e.dashboard_widget_type===Nm.ChartColumn&&ve.jsx(tCt,Ke({data:(u==null?void 0:u.results)||[],xField:e.x_field,yField:e.y_field,legend:{position:"top-left"},colorField:n.colorPrimary},e.dashboard_widget_props||{})),!f&&e.dashboard_widget_type===Nm.ChartBar&&ve.jsx(eCt,Ke({data:(u==null?void 0:u.results)||[],xField:e.x_field,yField:e.y_field,legend:{position:"top-left"},colorField:n.colorPrimary},e.dashboard_widget_props||{})),!f&&e.dashboard_widget_type===Nm.ChartPie&&ve.jsx(rCt,Ke({data:(u==null?void 0:u.results)||[],colorField:e.x_field,angleField:e.y_field,legend:{position:"top-left"}},e.dashboard_widget_props||{})),f&&ve.jsx(Ri,{justify:"center",align:"middle",children:ve.jsx(vr,{children:ve.jsx(qE,{})})})]},e.title)},oCt=()=>{const{t:e}=io("Dashboard"),{configuration:t}=b.useContext(Mc);return ve.jsxs(DO,{title:e("Dashboard"),children:[ve.jsx(Ri,{gutter:[16,16],children:t.dashboard_widgets.map(n=>ve.jsx(vr,{xs:24,md:12,children:ve.jsx(aCt,{widget:n})},n.title))}),t.dashboard_widgets.length===0&&ve.jsx(Ba,{})]})},sCt=()=>{var F,B;const{configuration:e}=b.useContext(Mc),t=Mm(),{t:n}=io("List"),{model:r}=SO(),i=zb(),a=HO(e,r),{defaultPage:o,defaultPageSize:s,page:l,setPage:c,pageSize:u,setPageSize:f,search:d,setSearch:h,filters:p,setFilters:v,sortBy:g,action:m,setAction:y,selectedRowKeys:x,setSelectedRowKeys:S,onTableChange:w,resetTable:C}=yie(a),E=Im.stringify(Ke({search:d,sort_by:g,offset:(l-1)*u,limit:u},nN(p))),{data:O,isLoading:$,refetch:P}=Kc({queryKey:[`/list/${r}`,E],queryFn:()=>lu(`/list/${r}?${E}`),refetchOnWindowFocus:!1}),{mutate:M}=Oo({mutationFn:D=>XA(`/delete/${r}/${D}`),onSuccess:()=>{C(a==null?void 0:a.preserve_filters),P(),na.success(n("Successfully deleted"))},onError:D=>{kc(D)}}),{mutate:k,isPending:T}=Oo({mutationFn:D=>gf(`/action/${r}/${m}`,D),onSuccess:()=>{C(a==null?void 0:a.preserve_filters),P(),na.success(n("Successfully applied"))},onError:()=>{na.error(n("Server error"))}}),R=D=>S(D),A=b.useCallback(()=>k({ids:x}),[k,x]),N=b.useCallback(()=>t(`/add/${r}`),[r,t]),L=e==null?void 0:e.datetime_format,j=mie(a,L,b.useCallback(D=>p[D],[p]),b.useCallback((D,z)=>{p[D]=z,v(Ke({},p)),c(o),f(s)},[o,s,p,v,c,f]),b.useCallback(D=>{delete p[D],v(Ke({},p)),c(o),f(s)},[o,s,p,v,c,f]),b.useCallback(D=>{M(D.id)},[M]),b.useCallback(D=>{t(`/change/${r}/${D.id}`)},[r,t]));return ve.jsx(DO,{title:a?ts(a,!0):"",breadcrumbs:ve.jsx(ob,{items:[{title:ve.jsx(Gd,{to:"/",children:n("Dashboard")})},{title:ve.jsx(Gd,{to:`/list/${r}`,children:a&&ts(a)})}]}),viewOnSite:a==null?void 0:a.view_on_site,headerActions:ve.jsxs(Ri,{style:{marginTop:10,marginBottom:10},gutter:[8,8],children:[((a==null?void 0:a.actions)||[]).length>0&&(a==null?void 0:a.actions_on_top)&&ve.jsxs(vr,{children:[ve.jsx(no,{placeholder:n("Select Action By"),allowClear:!0,value:m,onChange:y,style:{width:300},children:((a==null?void 0:a.actions)||[]).map(D=>ve.jsx(no.Option,{value:D.name,children:D.description||D.name},D.name))}),ve.jsx(Hn,{disabled:!m||x.length===0,style:{marginLeft:5},loading:T,onClick:A,children:n("Apply")})]}),((a==null?void 0:a.search_fields)||[]).length>0&&ve.jsx(vr,{children:ve.jsx(oi.Search,{placeholder:(a==null?void 0:a.search_help_text)||n("Search By"),allowClear:!0,onSearch:h,style:{width:200}})}),((F=a==null?void 0:a.permissions)==null?void 0:F.includes(Ss.Export))&&ve.jsx(vr,{children:ve.jsx(tne,{model:r,search:d,filters:p,sortBy:g})}),((B=a==null?void 0:a.permissions)==null?void 0:B.includes(Ss.Add))&&ve.jsx(vr,{children:ve.jsxs(Hn,{onClick:N,children:[ve.jsx(T5,{})," ",n("Add")]})})]}),bottomActions:((a==null?void 0:a.actions)||[]).length>0&&(a==null?void 0:a.actions_on_bottom)&&ve.jsxs("div",{style:{marginTop:i?10:-50},children:[ve.jsx(no,{placeholder:n("Select Action By"),allowClear:!0,value:m,onChange:y,style:{width:200},children:((a==null?void 0:a.actions)||[]).map(D=>ve.jsx(no.Option,{value:D.name,children:D.description||D.name},D.name))}),ve.jsx(Hn,{disabled:!m||x.length===0,style:{marginLeft:5},loading:T,onClick:A,children:n("Apply")})]}),children:a?ve.jsx(nne,{loading:$,rowSelection:((a==null?void 0:a.actions)||[]).length>0?{selectedRowKeys:x,onChange:R}:void 0,columns:j,onChange:w,rowKey:"id",dataSource:(O==null?void 0:O.results)||[],pagination:{current:l,pageSize:u,total:O==null?void 0:O.total,showSizeChanger:!0}}):ve.jsx(Ba,{description:n("No permissions for model")})})},lCt=({title:e,children:t})=>{const{signedIn:n}=b.useContext(jO),r=Mm();return b.useEffect(()=>{n&&r("/")},[r,n]),ve.jsxs("div",{style:{height:"100vh"},children:[ve.jsx($A,{defaultTitle:e,children:ve.jsx("meta",{name:"description",content:e})}),ve.jsx(Ri,{justify:"center",align:"middle",style:{height:"100%"},children:ve.jsx(vr,{xs:24,xl:8,children:t})})]})},cCt=()=>{const[e]=Ir.useForm(),{token:{colorPrimary:t}}=$b.useToken(),{configuration:n}=b.useContext(Mc),{signedInUserRefetch:r}=b.useContext(jO),{t:i}=io("SignIn"),{mutate:a,isPending:o}=Oo({mutationFn:l=>gf("/sign-in",l),onSuccess:()=>{r()},onError:l=>{kc(l,e)}}),s=l=>{a(l)};return ve.jsx(lCt,{title:`${i("Sign In")}`,children:ve.jsxs(hm,{children:[ve.jsx(Ri,{justify:"center",children:ve.jsx(vr,{children:ve.jsxs(va,{style:{marginBottom:20},children:[ve.jsx(HE,{src:window.SERVER_DOMAIN+n.site_sign_in_logo,height:80,alt:n.site_name,preview:!1}),ve.jsx("span",{style:{color:t,fontSize:36,fontWeight:600},children:n.site_name})]})})}),ve.jsxs(Ir,{initialValues:{remember:!0},onFinish:s,autoComplete:"off",layout:"vertical",children:[ve.jsx(Ir.Item,{label:LO((n==null?void 0:n.username_field)||"username"),name:"username",rules:[{required:!0}],children:ve.jsx(oi,{})}),ve.jsx(Ir.Item,{label:"Password",name:"password",rules:[{required:!0}],children:ve.jsx(oi.Password,{})}),ve.jsx(Ri,{justify:"end",children:ve.jsx(vr,{children:ve.jsx(Ir.Item,{children:ve.jsx(Hn,{type:"primary",htmlType:"submit",loading:o,children:i("Sign In")})})})})]})]})})},uCt=()=>{const{configuration:e}=b.useContext(Mc),{t}=io("App");return ve.jsxs(Sc,{theme:{token:{colorPrimary:e.primary_color,colorLink:e.primary_color,colorLinkActive:e.primary_color,colorLinkHover:e.primary_color}},form:{validateMessages:{required:t("${label} is required."),types:{email:t("${label} is not valid."),number:t("${label} is not valid.")},number:{range:t("${label} must be between ${min} and ${max}")}}},children:[ve.jsxs($A,{titleTemplate:"FastAPI Admin | %s",defaultTitle:t("FastAPI Admin"),children:[ve.jsx("meta",{name:"description",content:t("FastAPI Admin")}),ve.jsx("link",{rel:"icon",href:window.SERVER_DOMAIN+e.site_favicon})]}),ve.jsxs(_Ve,{children:[ve.jsx(km,{path:"/sign-in",element:ve.jsx(cCt,{})}),ve.jsx(km,{path:"/",element:ve.jsx(oCt,{})}),ve.jsx(km,{path:"/list/:model",element:ve.jsx(sCt,{})}),ve.jsx(km,{path:"/add/:model",element:ve.jsx(lYe,{})}),ve.jsx(km,{path:"/change/:model/:id",element:ve.jsx(cYe,{})})]})]})},fCt=({children:e})=>{var r,i;const{t}=io("ConfigurationProvider"),n=Kc({queryKey:["/configuration"],queryFn:()=>lu("/configuration"),retry:!1,refetchOnWindowFocus:!1});if(n.isLoading)return null;if(n.error){const a=n.error;return ve.jsx(QE,{status:"warning",title:"Invalid configuration. Please check your admin model classes and logs.",extra:ve.jsx(pI,{title:t("Error"),content:((i=(r=a==null?void 0:a.response)==null?void 0:r.data)==null?void 0:i.exception)||(a==null?void 0:a.message),placement:"bottom",trigger:"click",children:ve.jsx(Hn,{type:"primary",children:t("Show Error")},"console")})})}return ve.jsx(Mc.Provider,{value:{configuration:(n==null?void 0:n.data)||Bte},children:e})},dCt=({children:e})=>{const t=Kc({queryKey:["/me"],queryFn:()=>lu("/me"),retry:!1,refetchOnWindowFocus:!1});if(t.isLoading)return null;const n=!!t.isError;return ve.jsx(jO.Provider,{value:{signedInUser:t.data,signedInUserRefetch:t.refetch,signedIn:!n},children:e})},hCt=({children:e})=>ve.jsx(dCt,{children:ve.jsx(fCt,{children:e})}),pCt=({children:e,client:t,i18n:n})=>ve.jsx(RVe,{children:ve.jsx(O2e,{client:t,children:ve.jsx(NWe,{i18n:n,children:ve.jsx(Pee,{children:e})})})}),vCt=new x2e;co.init({interpolation:{escapeValue:!1}});const u1e=document.getElementById("root");if(!u1e)throw new Error("Root element not found");LM.createRoot(u1e).render(ve.jsx(we.StrictMode,{children:ve.jsx(pCt,{client:vCt,locale:_o,i18n:co,children:ve.jsx(hCt,{children:ve.jsx(uCt,{})})})}))});
+A`,o,o,0,s?1:0,1,a.p1.x,a.p1.y)}return r.join(" ")}}const Iye=e=>{const{sets:t="sets",size:n="size",as:r=["key","path"],padding:i=0}=e,[a,o]=r;return s=>{const l=s.map(f=>Object.assign(Object.assign({},f),{sets:f[t],size:f[n],[a]:f.sets.join("&")}));l.sort((f,d)=>f.sets.length-d.sets.length);const c=dxt(l);let u;return l.map(f=>{const d=f[t],h=({width:p,height:v})=>{u=u||xxt(c,p,v,i);const g=d.map(y=>u[y]);let m=wxt(g);return/[zZ]$/.test(m)||(m+=" Z"),m};return Object.assign(Object.assign({},f),{[o]:h})})}};Iye.props={};const Aye=()=>e=>(console.log("G2 data section:",e),e);Aye.props={};function Cxt(e,t){if(t<0||t>1)throw new Error("alpha must be between 0 and 1.");if(e.length===0)return[];let n=e[0];const r=[];for(const i of e){if(i==null){r.push(i),console.warn("EMA：The value is null or undefined",e);continue}n==null&&(n=i);const a=n*t+(1-t)*i;r.push(a),n=a}return r}const Nye=e=>{const{field:t="y",alpha:n=.6,as:r=t}=e;return i=>{const a=i.map(s=>s[t]),o=Cxt(a,n);return i.map((s,l)=>Object.assign(Object.assign({},s),{[r]:o[l]}))}};Nye.props={};function p9(e){const{min:t,max:n}=e;return[[t[0],t[1]],[n[0],n[1]]]}function Lye(e,t){const[n,r]=e,[i,a]=t;return n>=i[0]&&n<=a[0]&&r>=i[1]&&r<=a[1]}function Ext(e,t){const[n,r]=e;return!(Lye(n,t)&&Lye(r,t))}function Oxt(e,t){const[n,r]=e,[i,a]=t;return n[0]<a[0]&&r[0]>i[0]&&n[1]<a[1]&&r[1]>i[1]}const _xt=e=>{const{priority:t}=e;return n=>{const r=[];return t&&n.sort(t),n.forEach(i=>{o3(i);const a=i.getLocalBounds();r.some(s=>Oxt(p9(a),p9(s.getLocalBounds())))?BD(i):r.push(i)}),n}};function $xt([e,t],[n,r]){return r>e&&t>n}function g3(){const e=new Map;return[r=>e.get(r),(r,i)=>e.set(r,i)]}function Pxt(e){const t=e.cloneNode(!0),n=t.getElementById("connector");n&&t.removeChild(n);const{min:r,max:i}=t.getRenderBounds();return t.destroy(),{min:r,max:i}}const Mxt=e=>{const{maxIterations:t=10,maxError:n=.1,padding:r=1}=e;return i=>{const a=i.length;if(a<=1)return i;const[o,s]=g3(),[l,c]=g3(),[u,f]=g3(),[d,h]=g3();for(const p of i){const{min:v,max:g}=Pxt(p),[m,y]=v,[x,S]=g;s(p,y),c(p,y),f(p,S-y),h(p,[m,x])}for(let p=0;p<t;p++){i.sort((g,m)=>Gi(l(g),l(m)));let v=0;for(let g=0;g<a-1;g++){const m=i[g];let y=g+1,x;for(;(x=i[y])&&!$xt(d(m),d(x));)y+=1;if(x){const S=l(m),w=u(m),C=l(x),E=C-(S+w);if(E<r){const O=(r-E)/2;v=Math.max(v,O),c(m,S-O),c(x,C+O)}}}if(v<n)break}for(const p of i)p.style.y+=l(p)-o(p);return i}};function kxt(e){return typeof e=="object"?e:rh(e)}function v9(e){let t=e/255;return t=t<=.03928?t/12.92:Math.pow((t+.055)/1.055,2.4),t}function jye(e,t,n){return .2126*v9(e)+.7152*v9(t)+.0722*v9(n)}function Dye(e,t){if(!e||!t||e===t)return 1;const{r:n,g:r,b:i}=e,{r:a,g:o,b:s}=t,l=jye(n,r,i),c=jye(a,o,s);return(Math.max(l,c)+.05)/(Math.min(l,c)+.05)}function Txt(e,t){const n=d0(t,r=>Dye(e,kxt(r)));return t[n]}const Rxt=e=>{const{threshold:t=4.5,palette:n=["#000","#fff"]}=e;return r=>(r.forEach(i=>{const a=i.attr("dependentElement").parsedStyle.fill,o=i.parsedStyle.fill;Dye(o,a)<t&&i.attr("fill",Txt(a,n))}),r)},Ixt=()=>e=>(e.forEach(t=>{o3(t);const n=t.attr("bounds"),r=t.getLocalBounds();Ext(p9(r),n)&&BD(t)}),e),Axt=(e,t)=>{const[[n,r],[i,a]]=t,[[o,s],[l,c]]=e;let u=0,f=0;return o<n?u=n-o:l>i&&(u=i-l),s<r?f=r-s:c>a&&(f=a-c),[u,f]},Nxt=()=>(e,{canvas:t,layout:n})=>(e.forEach(r=>{o3(r);const{max:i,min:a}=r.getRenderBounds(),[o,s]=i,[l,c]=a,u=Axt([[l,c],[o,s]],[[n.x,n.y],[n.x+n.width,n.y+n.height]]);r.style.connector&&r.style.connectorPoints&&(r.style.connectorPoints[0][0]-=u[0],r.style.connectorPoints[0][1]-=u[1]),r.style.x+=u[0],r.style.y+=u[1]}),e);function Lxt(){return{"data.fetch":sye,"data.inline":pye,"data.sortBy":hye,"data.sort":uye,"data.filter":cye,"data.pick":fye,"data.rename":dye,"data.fold":lye,"data.slice":Cye,"data.custom":vye,"data.map":gye,"data.join":wye,"data.kde":_ye,"data.log":Aye,"data.wordCloud":xye,"data.ema":Nye,"transform.stackY":Fce,"transform.binX":xue,"transform.bin":_j,"transform.dodgeX":Zce,"transform.jitter":eue,"transform.jitterX":tue,"transform.jitterY":nue,"transform.symmetryY":rue,"transform.diffY":iue,"transform.stackEnter":Qce,"transform.normalizeY":Jce,"transform.select":U$,"transform.selectX":oue,"transform.selectY":sue,"transform.groupX":lue,"transform.groupY":cue,"transform.groupColor":uue,"transform.group":e2,"transform.sortX":due,"transform.sortY":pue,"transform.sortColor":hue,"transform.flexX":vue,"transform.pack":yue,"transform.sample":Sue,"transform.filter":wue,"coordinate.cartesian":pce,"coordinate.polar":Hx,"coordinate.transpose":sj,"coordinate.theta":gce,"coordinate.parallel":cj,"coordinate.fisheye":yce,"coordinate.radial":lj,"coordinate.radar":bce,"encode.constant":xce,"encode.field":wce,"encode.transform":Sce,"encode.column":Cce,"mark.interval":Kde,"mark.rect":Xde,"mark.line":Qde,"mark.point":ehe,"mark.text":nhe,"mark.cell":ihe,"mark.area":ohe,"mark.link":l7,"mark.image":che,"mark.polygon":fhe,"mark.box":hhe,"mark.vector":vhe,"mark.lineX":bhe,"mark.lineY":mhe,"mark.connector":She,"mark.range":Ehe,"mark.rangeX":_he,"mark.rangeY":Phe,"mark.path":Fhe,"mark.shape":fpe,"mark.density":xpe,"mark.heatmap":wpe,"mark.wordCloud":w7,"palette.category10":Epe,"palette.category20":Ope,"scale.linear":$pe,"scale.ordinal":Ppe,"scale.band":_pe,"scale.identity":Mpe,"scale.point":kpe,"scale.time":Tpe,"scale.log":Rpe,"scale.pow":Ipe,"scale.sqrt":jpe,"scale.threshold":Ape,"scale.quantile":Npe,"scale.quantize":Lpe,"scale.sequential":Dpe,"scale.constant":Fpe,"theme.classic":Bpe,"theme.classicDark":Hpe,"theme.academy":Wpe,"theme.light":E7,"theme.dark":zpe,"component.axisX":ove,"component.axisY":sve,"component.legendCategory":$7,"component.legendContinuous":yh,"component.legends":mve,"component.title":dve,"component.sliderX":hve,"component.sliderY":pve,"component.scrollbarX":vve,"component.scrollbarY":gve,"animation.scaleInX":k7,"animation.scaleOutX":Kht,"animation.scaleInY":yve,"animation.scaleOutY":Yht,"animation.waveIn":_ve,"animation.fadeIn":bve,"animation.fadeOut":xve,"animation.zoomIn":opt,"animation.zoomOut":spt,"animation.pathIn":$ve,"animation.morphing":Ove,"animation.growInX":Pve,"animation.growInY":Mve,"interaction.elementHighlight":u3,"interaction.elementHighlightByX":x0e,"interaction.elementHighlightByColor":S0e,"interaction.elementSelect":f3,"interaction.elementSelectByX":w0e,"interaction.elementSelectByColor":C0e,"interaction.fisheye":g1t,"interaction.chartIndex":E0e,"interaction.tooltip":L0e,"interaction.legendFilter":N1t,"interaction.legendHighlight":L1t,"interaction.brushHighlight":XD,"interaction.brushXHighlight":H1t,"interaction.brushYHighlight":W1t,"interaction.brushAxisHighlight":Q1t,"interaction.brushFilter":e9,"interaction.brushXFilter":nbt,"interaction.brushYFilter":rbt,"interaction.sliderFilter":Y0e,"interaction.scrollbarFilter":lbt,"interaction.poptip":Q0e,"interaction.treemapDrillDown":gbt,"interaction.elementPointMove":wbt,"composition.spaceLayer":Kve,"composition.spaceFlex":Yve,"composition.facetRect":tge,"composition.repeatMatrix":pvt,"composition.facetCircle":xvt,"composition.timingKeyframe":rge,"labelTransform.overlapHide":_xt,"labelTransform.overlapDodgeY":Mxt,"labelTransform.overflowHide":Ixt,"labelTransform.contrastReverse":Rxt,"labelTransform.exceedAdjust":Nxt}}function jxt(){return{"composition.geoView":Jge,"composition.geoPath":ige}}function Dxt(){return{"data.arc":f7,"data.cluster":ppe,"mark.forceGraph":dpe,"mark.tree":gpe,"mark.pack":ope,"mark.sankey":Nhe,"mark.chord":jhe,"mark.treemap":ape}}function Fxt(){return{"data.venn":Iye,"mark.boxplot":upe,"mark.gauge":ype,"mark.wordCloud":w7,"mark.liquid":Cpe}}function Fye(){return Object.assign(Object.assign(Object.assign(Object.assign({},jxt()),Dxt()),Fxt()),Lxt())}function Bxt(e,t){class n extends e{constructor(i){super(Object.assign(Object.assign({},i),{lib:t}))}}return n}const Bye={};function zye(e,t){e.startsWith("symbol.")?bct(e.split(".").pop(),t):Object.assign(Bye,{[e]:t})}const W0=e=>e?parseInt(e):0;function zxt(e){const t=getComputedStyle(e),n=e.clientWidth||W0(t.width),r=e.clientHeight||W0(t.height),i=W0(t.paddingLeft)+W0(t.paddingRight),a=W0(t.paddingTop)+W0(t.paddingBottom);return{width:n-i,height:r-a}}function g9(e,t){const n=[e];for(;n.length;){const r=n.shift();t&&t(r);const i=r.children||[];for(const a of i)n.push(a)}}let m9=class{constructor(t={},n){this.parentNode=null,this.children=[],this.index=0,this.type=n,this.value=t}map(t=n=>n){const n=t(this.value);return this.value=n,this}attr(t,n){return arguments.length===1?this.value[t]:this.map(r=>(r[t]=n,r))}append(t){const n=new t({});return n.children=[],this.push(n),n}push(t){return t.parentNode=this,t.index=this.children.length,this.children.push(t),this}remove(){const t=this.parentNode;if(t){const{children:n}=t,r=n.findIndex(i=>i===this);n.splice(r,1)}return this}getNodeByKey(t){let n=null;return g9(this,i=>{t===i.attr("key")&&(n=i)}),n}getNodesByType(t){const n=[];return g9(this,i=>{t===i.type&&n.push(i)}),n}getNodeByType(t){let n=null;return g9(this,r=>{n||t===r.type&&(n=r)}),n}call(t,...n){return t(this.map(),...n),this}getRoot(){let t=this;for(;t&&t.parentNode;)t=t.parentNode;return t}};var Hye=function(e,t){var n={};for(var r in e)Object.prototype.hasOwnProperty.call(e,r)&&t.indexOf(r)<0&&(n[r]=e[r]);if(e!=null&&typeof Object.getOwnPropertySymbols=="function")for(var i=0,r=Object.getOwnPropertySymbols(e);i<r.length;i++)t.indexOf(r[i])<0&&Object.prototype.propertyIsEnumerable.call(e,r[i])&&(n[r[i]]=e[r[i]]);return n};const y9=["width","height","depth","padding","paddingLeft","paddingRight","paddingBottom","paddingTop","inset","insetLeft","insetRight","insetTop","insetBottom","margin","marginLeft","marginRight","marginTop","marginBottom","autoFit","theme","title","interaction"],Wye="__remove__",Vye="__callback__",qye=1,Uye=1;function Hxt(e){if(e===void 0){const t=document.createElement("div");return t[Wye]=!0,t}return typeof e=="string"?document.getElementById(e):e}function Wxt(e){const t=e.parentNode;t&&t.removeChild(e)}function Vxt(e){if(e.type!==null)return e;const t=e.children[e.children.length-1];for(const n of y9)t.attr(n,e.attr(n));return t}function Gye(e){return Object.assign(Object.assign({},e.value),{type:e.type})}function b9(e,t){const{width:n,height:r,autoFit:i,depth:a=0}=e;let o=640,s=480;if(i){const{width:l,height:c}=zxt(t);o=l||o,s=c||s}return o=n||o,s=r||s,{width:Math.max(gi(o)?o:qye,qye),height:Math.max(gi(s)?s:Uye,Uye),depth:a}}function qxt(e){const t=Vxt(e),n=[t],r=new Map;for(r.set(t,Gye(t));n.length;){const i=n.pop(),a=r.get(i),{children:o=[]}=i;for(const s of o)if(s.type===Vye)a.children=s.value;else{const l=Gye(s),{children:c=[]}=a;c.push(l),n.push(s),r.set(s,l),a.children=c}}return r.get(t)}function Uxt(e,t){return typeof e=="function"?!0:new Set(Object.keys(t)).has(e)}function Gxt(e,t){return typeof e!="function"&&new Set(Object.keys(t)).has(e)}function Kxt(e,t,n,r,i){const{type:a}=e,{type:o=n||a}=t;if(Gxt(o,i)){for(const s of y9)e.attr(s)!==void 0&&t[s]===void 0&&(t[s]=e.attr(s));return t}if(Uxt(o,r)){const s={type:"view"},l=Object.assign({},t);for(const c of y9)l[c]!==void 0&&(s[c]=l[c],delete l[c]);return Object.assign(Object.assign({},s),{children:[l]})}return t}function Yxt(e,t,n){if(typeof e=="function")return t.mark;const i=Object.assign(Object.assign({},t),n)[e];if(!i)throw new Error(`Unknown mark: ${e}.`);return i}function Xxt(e,t,n){if(typeof e=="function"){const l=new m9;return l.value=e,l.type=Vye,l}const{type:r,children:i}=e,a=Hye(e,["type","children"]),o=Yxt(r,t,n),s=new o;return s.value=a,s.type=r,s}function Zxt(e,t){const{type:n,children:r}=t,i=Hye(t,["type","children"]);e.type===n||n===void 0?Rce(e.value,i):typeof n=="string"&&(e.type=n,e.value=i)}function Qxt(e,t,n,r){if(!e)return;const i=[[e,t]];for(;i.length;){const[a,o]=i.shift(),s=Xxt(o,n,r);Array.isArray(a.children)&&a.push(s);const{children:l}=o;if(Array.isArray(l))for(const c of l)i.push([s,c]);else typeof l=="function"&&i.push([s,l])}}function Jxt(e,t,n,r,i){const a=Kxt(e,t,n,r,i),o=[[null,e,a]];for(;o.length;){const[s,l,c]=o.shift();if(!l)Qxt(s,c,r,i);else if(!c)l.remove();else{Zxt(l,c);const{children:u}=c,{children:f}=l;if(Array.isArray(u)&&Array.isArray(f)){const d=Math.max(u.length,f.length);for(let h=0;h<d;h++){const p=u[h],v=f[h];o.push([l,v,p])}}else typeof u=="function"&&o.push([l,null,u])}}}function e2t(){let e,t;return[new Promise((r,i)=>{t=r,e=i}),t,e]}function t2t(e,t,{key:n=t}){e.prototype[t]=function(r){return arguments.length===0?this.attr(n):this.attr(n,r)}}function n2t(e,t,{key:n=t}){e.prototype[t]=function(r){if(arguments.length===0)return this.attr(n);if(Array.isArray(r))return this.attr(n,r);const i=[...this.attr(n)||[],r];return this.attr(n,i)}}function r2t(e,t,{key:n=t}){e.prototype[t]=function(r,i){if(arguments.length===0)return this.attr(n);if(arguments.length===1&&typeof r!="string")return this.attr(n,r);const a=this.attr(n)||{};return a[r]=arguments.length===1?!0:i,this.attr(n,a)}}function i2t(e,t,n){e.prototype[t]=function(r){if(arguments.length===0)return this.attr(t);if(Array.isArray(r))return this.attr(t,{items:r});if(v0(r)&&(r.title!==void 0||r.items!==void 0))return this.attr(t,r);if(r===null||r===!1)return this.attr(t,r);const i=this.attr(t)||{},{items:a=[]}=i;return a.push(r),i.items=a,this.attr(t,i)}}function a2t(e,t,{ctor:n}){e.prototype[t]=function(r){const i=this.append(n);return t==="mark"&&(i.type=r),i}}function o2t(e,t,{ctor:n}){e.prototype[t]=function(){return this.type=null,this.append(n)}}function m3(e){return t=>{for(const[n,r]of Object.entries(e)){const{type:i}=r;i==="value"?t2t(t,n,r):i==="array"?n2t(t,n,r):i==="object"?r2t(t,n,r):i==="node"?a2t(t,n,r):i==="container"?o2t(t,n,r):i==="mix"&&i2t(t,n)}return t}}function Kye(e){return Object.fromEntries(Object.entries(e).map(([t,n])=>[t,{type:"node",ctor:n}]))}const Yye={encode:{type:"object"},scale:{type:"object"},data:{type:"value"},transform:{type:"array"},style:{type:"object"},animate:{type:"object"},coordinate:{type:"object"},interaction:{type:"object"},label:{type:"array",key:"labels"},axis:{type:"object"},legend:{type:"object"},slider:{type:"object"},scrollbar:{type:"object"},state:{type:"object"},layout:{type:"object"},theme:{type:"object"},title:{type:"value"}},s2t=Object.assign(Object.assign({},Yye),{tooltip:{type:"mix"},viewStyle:{type:"object"}}),l2t=Object.assign(Object.assign({},Yye),{labelTransform:{type:"array"}});var c2t=function(e,t,n,r){var i=arguments.length,a=i<3?t:r===null?r=Object.getOwnPropertyDescriptor(t,n):r,o;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")a=Reflect.decorate(e,t,n,r);else for(var s=e.length-1;s>=0;s--)(o=e[s])&&(a=(i<3?o(a):i>3?o(t,n,a):o(t,n))||a);return i>3&&a&&Object.defineProperty(t,n,a),a};let y3=class extends m9{changeData(t){var n;const r=this.getRoot();if(r)return this.attr("data",t),!((n=this.children)===null||n===void 0)&&n.length&&this.children.forEach(i=>{i.attr("data",t)}),r==null?void 0:r.render()}getView(){const t=this.getRoot(),{views:n}=t.getContext();if(n!=null&&n.length)return n.find(r=>r.key===this._key)}getScale(){var t;return(t=this.getView())===null||t===void 0?void 0:t.scale}getScaleByChannel(t){const n=this.getScale();if(n)return n[t]}getCoordinate(){var t;return(t=this.getView())===null||t===void 0?void 0:t.coordinate}getTheme(){var t;return(t=this.getView())===null||t===void 0?void 0:t.theme}getGroup(){const t=this._key;return t?this.getRoot().getContext().canvas.getRoot().getElementById(t):void 0}show(){const t=this.getGroup();t&&!t.isVisible()&&o3(t)}hide(){const t=this.getGroup();t&&t.isVisible()&&BD(t)}};y3=c2t([m3(l2t)],y3);var u2t=function(e,t,n,r){var i=arguments.length,a=i<3?t:r===null?r=Object.getOwnPropertyDescriptor(t,n):r,o;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")a=Reflect.decorate(e,t,n,r);else for(var s=e.length-1;s>=0;s--)(o=e[s])&&(a=(i<3?o(a):i>3?o(t,n,a):o(t,n))||a);return i>3&&a&&Object.defineProperty(t,n,a),a};let x9=class extends m9{changeData(t){const n=this.getRoot();if(n)return this.attr("data",t),n==null?void 0:n.render()}getMark(){var t;const n=(t=this.getRoot())===null||t===void 0?void 0:t.getView();if(!n)return;const{markState:r}=n,i=Array.from(r.keys()).find(a=>a.key===this.attr("key"));return r.get(i)}getScale(){var t;const n=(t=this.getRoot())===null||t===void 0?void 0:t.getView();if(n)return n==null?void 0:n.scale}getScaleByChannel(t){var n,r;const i=(n=this.getRoot())===null||n===void 0?void 0:n.getView();if(i)return(r=i==null?void 0:i.scale)===null||r===void 0?void 0:r[t]}getGroup(){const t=this.attr("key");return t?this.getRoot().getContext().canvas.getRoot().getElementById(t):void 0}};x9=u2t([m3(s2t)],x9);var f2t=function(e,t,n,r){var i=arguments.length,a=i<3?t:r===null?r=Object.getOwnPropertyDescriptor(t,n):r,o;if(typeof Reflect=="object"&&typeof Reflect.decorate=="function")a=Reflect.decorate(e,t,n,r);else for(var s=e.length-1;s>=0;s--)(o=e[s])&&(a=(i<3?o(a):i>3?o(t,n,a):o(t,n))||a);return i>3&&a&&Object.defineProperty(t,n,a),a},d2t=function(e,t){var n={};for(var r in e)Object.prototype.hasOwnProperty.call(e,r)&&t.indexOf(r)<0&&(n[r]=e[r]);if(e!=null&&typeof Object.getOwnPropertySymbols=="function")for(var i=0,r=Object.getOwnPropertySymbols(e);i<r.length;i++)t.indexOf(r[i])<0&&Object.prototype.propertyIsEnumerable.call(e,r[i])&&(n[r[i]]=e[r[i]]);return n};const h2t="G2_CHART_KEY";class p2t extends y3{constructor(t){const{container:n,canvas:r,renderer:i,plugins:a,lib:o,createCanvas:s}=t,l=d2t(t,["container","canvas","renderer","plugins","lib","createCanvas"]);super(l,"view"),this._hasBindAutoFit=!1,this._rendering=!1,this._trailing=!1,this._trailingResolve=null,this._trailingReject=null,this._previousDefinedType=null,this._onResize=Xie(()=>{this.forceFit()},300),this._renderer=i||new hse,this._plugins=a||[],this._container=Hxt(n),this._emitter=new wL,this._context={library:Object.assign(Object.assign({},o),Bye),emitter:this._emitter,canvas:r,createCanvas:s},this._create()}render(){if(this._rendering)return this._addToTrailing();this._context.canvas||this._createCanvas(),this._context.canvas.getConfig().supportsCSSTransform=!0,this._bindAutoFit(),this._rendering=!0;const t=new Promise((a,o)=>Qyt(this._computedOptions(),this._context,this._createResolve(a),this._createReject(o))),[n,r,i]=e2t();return t.then(r).catch(i).then(()=>this._renderTrailing()),n}options(t){if(arguments.length===0)return qxt(this);const{type:n}=t;return n&&(this._previousDefinedType=n),Jxt(this,t,this._previousDefinedType,this._marks,this._compositions),this}getContainer(){return this._container}getContext(){return this._context}on(t,n,r){return this._emitter.on(t,n,r),this}once(t,n){return this._emitter.once(t,n),this}emit(t,...n){return this._emitter.emit(t,...n),this}off(t,n){return this._emitter.off(t,n),this}clear(){const t=this.options();this.emit(jr.BEFORE_CLEAR),this._reset(),d0e(t,this._context,!1),this.emit(jr.AFTER_CLEAR)}destroy(){const t=this.options();this.emit(jr.BEFORE_DESTROY),this._unbindAutoFit(),this._reset(),d0e(t,this._context,!0),this._container[Wye]&&Wxt(this._container),this.emit(jr.AFTER_DESTROY)}forceFit(){this.options.autoFit=!0;const{width:t,height:n}=b9(this.options(),this._container);if(t===this._width&&n===this._height)return Promise.resolve(this);this.emit(jr.BEFORE_CHANGE_SIZE);const r=this.render();return r.then(()=>{this.emit(jr.AFTER_CHANGE_SIZE)}),r}changeSize(t,n){if(t===this._width&&n===this._height)return Promise.resolve(this);this.emit(jr.BEFORE_CHANGE_SIZE),this.attr("width",t),this.attr("height",n);const r=this.render();return r.then(()=>{this.emit(jr.AFTER_CHANGE_SIZE)}),r}_create(){const{library:t}=this._context,n=a=>a.startsWith("mark.")||a==="component.axisX"||a==="component.axisY"||a==="component.legends",r=["mark.mark",...Object.keys(t).filter(n)];this._marks={};for(const a of r){const o=a.split(".").pop();class s extends x9{constructor(){super({},o)}}this._marks[o]=s,this[o]=function(l){const c=this.append(s);return o==="mark"&&(c.type=l),c}}const i=["composition.view",...Object.keys(t).filter(a=>a.startsWith("composition.")&&a!=="composition.mark")];this._compositions=Object.fromEntries(i.map(a=>{const o=a.split(".").pop();let s=class extends y3{constructor(){super({},o)}};return s=f2t([m3(Kye(this._marks))],s),[o,s]}));for(const a of Object.values(this._compositions))m3(Kye(this._compositions))(a);for(const a of i){const o=a.split(".").pop();this[o]=function(){const s=this._compositions[o];return this.type=null,this.append(s)}}}_reset(){const t=["theme","type","width","height","autoFit"];this.type="view",this.value=Object.fromEntries(Object.entries(this.value).filter(([n])=>n.startsWith("margin")||n.startsWith("padding")||n.startsWith("inset")||t.includes(n))),this.children=[]}_renderTrailing(){this._trailing&&(this._trailing=!1,this.render().then(()=>{const t=this._trailingResolve.bind(this);this._trailingResolve=null,t(this)}).catch(t=>{const n=this._trailingReject.bind(this);this._trailingReject=null,n(t)}))}_createResolve(t){return()=>{this._rendering=!1,t(this)}}_createReject(t){return n=>{this._rendering=!1,t(n)}}_computedOptions(){const t=this.options(),{key:n=h2t}=t,{width:r,height:i,depth:a}=b9(t,this._container);return this._width=r,this._height=i,this._key=n,Object.assign(Object.assign({key:this._key},t),{width:r,height:i,depth:a})}_createCanvas(){const{width:t,height:n}=b9(this.options(),this._container);this._plugins.push(new fce),this._plugins.forEach(r=>this._renderer.registerPlugin(r)),this._context.canvas=new Boe({container:this._container,width:t,height:n,renderer:this._renderer})}_addToTrailing(){var t;return(t=this._trailingResolve)===null||t===void 0||t.call(this,this),this._trailing=!0,new Promise((r,i)=>{this._trailingResolve=r,this._trailingReject=i})}_bindAutoFit(){const t=this.options(),{autoFit:n}=t;if(this._hasBindAutoFit){n||this._unbindAutoFit();return}n&&(this._hasBindAutoFit=!0,window.addEventListener("resize",this._onResize))}_unbindAutoFit(){this._hasBindAutoFit&&(this._hasBindAutoFit=!1,window.removeEventListener("resize",this._onResize))}}Object.assign({},Fye());var v2t=function(e){var t=/react|\.jsx|children:\[\(|return\s+[A-Za-z0-9].createElement\((?!['"][g|circle|ellipse|image|rect|line|polyline|polygon|text|path|html|mesh]['"])([^\)])*,/i;return t.test(e)},S9=function(){return S9=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},S9.apply(this,arguments)};function g2t(e,t){var n=b.useRef(),r=b.useRef(),i=b.useRef(null),a=t.onReady,o=t.onEvent,s=function(u,f){var d;u===void 0&&(u="image/png");var h=(d=i.current)===null||d===void 0?void 0:d.getElementsByTagName("canvas")[0];return h==null?void 0:h.toDataURL(u,f)},l=function(u,f,d){u===void 0&&(u="download"),f===void 0&&(f="image/png");var h=u;u.indexOf(".")===-1&&(h="".concat(u,".").concat(f.split("/")[1]));var p=s(f,d),v=document.createElement("a");return v.href=p,v.download=h,document.body.appendChild(v),v.click(),document.body.removeChild(v),v=null,h},c=function(u,f){f===void 0&&(f=!1);var d=Object.keys(u),h=f;d.forEach(function(p){var v=u[p];p==="tooltip"&&(h=!0),qe.isFunction(v)&&v2t("".concat(v))?u[p]=function(){for(var g=[],m=0;m<arguments.length;m++)g[m]=arguments[m];return ust(v.apply(void 0,g),h)}:qe.isArray(v)?v.forEach(function(g){c(g,h)}):qe.isObject(v)?c(v,h):h=f})};return b.useEffect(function(){n.current&&!qe.isEqual(r.current,t)&&(r.current=qe.cloneDeep(t),c(t),n.current.update(t),n.current.render())},[t]),b.useEffect(function(){if(!i.current)return function(){return null};r.current||(r.current=qe.cloneDeep(t)),c(t);var u=new e(i.current,S9({},t));u.toDataURL=s,u.downloadImage=l,u.render(),n.current=u,a&&a(u);var f=function(d){o&&o(u,d)};return u.on("*",f),function(){n.current&&(n.current.destroy(),n.current.off("*",f),n.current=void 0)}},[]),{chart:n,container:i}}const m2t={field:"value",size:[1,1],round:!1,padding:0,sort:(e,t)=>t.value-e.value,as:["x","y"],ignoreParentValue:!0},y2t="nodeIndex",W2="childNodeCount",b2t="nodeAncestor",w9="Invalid field: it must be a string!";function x2t(e,t){const{field:n,fields:r}=e;if($i(n))return n;if(Ua(n))return console.warn(w9),n[0];if(console.warn(`${w9} will try to get fields instead.`),$i(r))return r;if(Ua(r)&&r.length)return r[0];throw new TypeError(w9)}function S2t(e){const t=[];if(e&&e.each){let n,r;e.each(i=>{var a,o;i.parent!==n?(n=i.parent,r=0):r+=1;const s=Hie((((a=i.ancestors)===null||a===void 0?void 0:a.call(i))||[]).map(l=>t.find(c=>c.name===l.name)||l),({depth:l})=>l>0&&l<i.depth);i[b2t]=s,i[W2]=((o=i.children)===null||o===void 0?void 0:o.length)||0,i[y2t]=r,t.push(i)})}else e&&e.eachNode&&e.eachNode(n=>{t.push(n)});return t}function w2t(e,t){t=sXe({},m2t,t);const n=t.as;if(!Ua(n)||n.length!==2)throw new TypeError('Invalid as: it must be an array with 2 strings (e.g. [ "x", "y" ])!');let r;try{r=x2t(t)}catch(l){console.warn(l)}const a=(l=>Bft().size(t.size).round(t.round).padding(t.padding)(C0(l).sum(c=>ix(c.children)?t.ignoreParentValue?0:c[r]-Vie(c.children,(u,f)=>u+f[r],0):c[r]).sort(t.sort)))(e),o=n[0],s=n[1];return a.each(l=>{var c,u;l[o]=[l.x0,l.x1,l.x1,l.x0],l[s]=[l.y1,l.y1,l.y0,l.y0],l.name=l.name||((c=l.data)===null||c===void 0?void 0:c.name)||((u=l.data)===null||u===void 0?void 0:u.label),l.data.name=l.name,["x0","x1","y0","y1"].forEach(f=>{n.indexOf(f)===-1&&delete l[f]})}),S2t(a)}var C2t=function(e,t){var n={};for(var r in e)Object.prototype.hasOwnProperty.call(e,r)&&t.indexOf(r)<0&&(n[r]=e[r]);if(e!=null&&typeof Object.getOwnPropertySymbols=="function")for(var i=0,r=Object.getOwnPropertySymbols(e);i<r.length;i++)t.indexOf(r[i])<0&&Object.prototype.propertyIsEnumerable.call(e,r[i])&&(n[r[i]]=e[r[i]]);return n};const V0="sunburst",C9="markType",Xye="path",b3="ancestor-node";function E2t(e){const{data:t,encode:n}=e,{color:r,value:i}=n,o=w2t(t,{field:i,type:"hierarchy.partition",as:["x","y"]}),s=[];return o.forEach(l=>{var c,u,f,d;if(l.depth===0)return null;let h=l.data.name;const p=[h];let v=Object.assign({},l);for(;v.depth>1;)h=`${(c=v.parent.data)===null||c===void 0?void 0:c.name} / ${h}`,p.unshift((u=v.parent.data)===null||u===void 0?void 0:u.name),v=v.parent;const g=Object.assign(Object.assign(Object.assign({},g8(l.data,[i])),{[Xye]:h,[b3]:v.data.name}),l);r&&r!==b3&&(g[r]=l.data[r]||((d=(f=l.parent)===null||f===void 0?void 0:f.data)===null||d===void 0?void 0:d[r])),s.push(g)}),s.map(l=>{const c=l.x.slice(0,2),u=[l.y[2],l.y[0]];return c[0]===c[1]&&(u[0]=u[1]=(l.y[2]+l.y[0])/2),Object.assign(Object.assign({},l),{x:c,y:u,fillOpacity:Math.pow(.85,l.depth)})})}const Zye={id:V0,encode:{x:"x",y:"y",key:Xye,color:b3,value:"value"},axis:{x:!1,y:!1},style:{[C9]:V0,stroke:"#fff",lineWidth:.5,fillOpacity:"fillOpacity",[W2]:W2,depth:"depth"},state:{active:{zIndex:2,stroke:"#000"},inactive:{zIndex:1,stroke:"#fff"}},legend:!1,interaction:{drillDown:!0},coordinate:{type:"polar",innerRadius:.2}},Qye=e=>{const{encode:t,data:n=[],legend:r}=e,i=C2t(e,["encode","data","legend"]),a=Object.assign(Object.assign({},i.coordinate),{innerRadius:Math.max(xr(i,["coordinate","innerRadius"],.2),1e-5)}),o=Object.assign(Object.assign({},Zye.encode),t),{value:s}=o,l=E2t({encode:o,data:n});return console.log(l,"rectData"),[ct({},Zye,Object.assign(Object.assign({type:"rect",data:l,encode:o,tooltip:{title:"path",items:[c=>({name:s,value:c[s]})]}},i),{coordinate:a}))]};Qye.props={};var O2t=function(e,t,n,r){function i(a){return a instanceof n?a:new n(function(o){o(a)})}return new(n||(n=Promise))(function(a,o){function s(u){try{c(r.next(u))}catch(f){o(f)}}function l(u){try{c(r.throw(u))}catch(f){o(f)}}function c(u){u.done?a(u.value):i(u.value).then(s,l)}c((r=r.apply(e,t||[])).next())})};const _2t=e=>e.querySelectorAll(".element").filter(t=>xr(t,["style",C9])===V0);function $2t(e){return Cn(e).select(`.${v2}`).node()}const P2t={rootText:"root",style:{fill:"rgba(0, 0, 0, 0.85)",fontSize:12,y:1},active:{fill:"rgba(0, 0, 0, 0.5)"}};function M2t(e={}){const{breadCrumb:t={},isFixedColor:n=!1}=e,r=ct({},P2t,t);return i=>{const{update:a,setState:o,container:s,view:l,options:c}=i,u=s.ownerDocument,f=$2t(s),d=c.marks.find(({id:x})=>x===V0),{state:h}=d,p=u.createElement("g");f.appendChild(p);const v=(x,S)=>O2t(this,void 0,void 0,function*(){if(p.removeChildren(),x){const w=u.createElement("text",{style:Object.assign({x:0,text:r.rootText,depth:0},r.style)});p.appendChild(w);let C="";const E=x==null?void 0:x.split(" / ");let O=r.style.y,$=p.getBBox().width;const P=f.getBBox().width,M=E.map((k,T)=>{const R=u.createElement("text",{style:Object.assign(Object.assign({x:$,text:" / "},r.style),{y:O})});p.appendChild(R),$+=R.getBBox().width,C=`${C}${k} / `;const A=u.createElement("text",{name:C.replace(/\s\/\s$/,""),style:Object.assign(Object.assign({text:k,x:$,depth:T+1},r.style),{y:O})});return p.appendChild(A),$+=A.getBBox().width,$>P&&(O=p.getBBox().height,$=0,R.attr({x:$,y:O}),$+=R.getBBox().width,A.attr({x:$,y:O}),$+=A.getBBox().width),A});[w,...M].forEach((k,T)=>{if(T===M.length)return;const R=Object.assign({},k.attributes);k.attr("cursor","pointer"),k.addEventListener("mouseenter",()=>{k.attr(r.active)}),k.addEventListener("mouseleave",()=>{k.attr(R)}),k.addEventListener("click",()=>{v(k.name,xr(k,["style","depth"]))})})}o("drillDown",w=>{const{marks:C}=w,E=C.map(O=>{if(O.id!==V0&&O.type!=="rect")return O;const{data:$}=O,P=Object.fromEntries(["color"].map(k=>[k,{domain:l.scale[k].getOptions().domain}])),M=$.filter(k=>{const T=k.path;return n||(k[b3]=T.split(" / ")[S]),x?new RegExp(`^${x}.+`).test(T):!0});return ct({},O,n?{data:M,scale:P}:{data:M})});return Object.assign(Object.assign({},w),{marks:E})}),yield a()}),g=x=>{const S=x.target;if(xr(S,["style",C9])!==V0||xr(S,["markType"])!=="rect"||!xr(S,["style",W2]))return;const w=xr(S,["__data__","key"]),C=xr(S,["style","depth"]);S.style.cursor="pointer",v(w,C)};f.addEventListener("click",g);const m=h8(Object.assign(Object.assign({},h.active),h.inactive)),y=()=>{_2t(f).forEach(S=>{const w=xr(S,["style",W2]);if(xr(S,["style","cursor"])!=="pointer"&&w){S.style.cursor="pointer";const E=g8(S.attributes,m);S.addEventListener("mouseenter",()=>{S.attr(h.active)}),S.addEventListener("mouseleave",()=>{S.attr(ct(E,h.inactive))})}})};return f.addEventListener("mousemove",y),()=>{p.remove(),f.removeEventListener("click",g),f.removeEventListener("mousemove",y)}}}function k2t(){return{"interaction.drillDown":M2t,"mark.sunburst":Qye}}var x3=function(){return x3=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},x3.apply(this,arguments)},T2t=Bxt(p2t,x3(x3({},Fye()),k2t())),Dr=function(e){var t=I2t(e),n=t.children,r=n===void 0?[]:n,i=qe.omit(t,[].concat(t1e,S3.map(function(c){return c.key}))),a=function(c){var u;return(u=D2t.find(function(f){return f.key===c}))===null||u===void 0?void 0:u.callback},o=function(c,u,f){var d=a(u);d?d(c,u,f):c[u]=Oh({},c[u],f)},s=function(c){Object.keys(c).forEach(function(u){if(c[u]){var f=S3.find(function(p){return p.key===u});if(f){var d=f.type,h=f.extend_keys;d?r.push(l(Oh({},qe.pick(c,h),{type:d},c[u]))):qe.isArray(c[u])&&c[u].forEach(function(p){r.push(l(p))})}}})},l=function(c){return s(c),Object.keys(O9).forEach(function(u){var f=O9[u];if(!qe.isUndefined(c[u]))if(qe.isObject(f)){var d=f.value,h=f.target,p=d(c[u]);o(c,h,p)}else qe.set(c,f,c[u])}),c};return r.forEach(function(c){var u=Oh({},i,c);l(Oh(c,u))}),s(t),R2t(t),e},Jye=function(e,t,n){if(n||arguments.length===2)for(var r=0,i=t.length,a;r<i;r++)(a||!(r in t))&&(a||(a=Array.prototype.slice.call(t,0,r)),a[r]=t[r]);return e.concat(a||Array.prototype.slice.call(t))},R2t=function(e){var t=e.children,n=t===void 0?[]:t,r=Object.keys(O9).concat(S3.map(function(i){return i.key}));return r.forEach(function(i){delete e[i]}),n.forEach(function(i){Object.keys(i).forEach(function(a){r.includes(a)&&delete i[a]})}),Object.keys(e).forEach(function(i){Jye(Jye([],t1e,!0),$9.map(function(a){return a.key}),!0).includes(i)||delete e[i]}),e},I2t=function(e){var t=e.options,n=t.children,r=n===void 0?[]:n;return r.forEach(function(i){Object.keys(i).forEach(function(a){qe.isArray(i[a])&&a!=="data"&&(i[a]=i[a].filter(function(o){return!o[E9]}))})}),t},e1e=function(e,t,n){if(n||arguments.length===2)for(var r=0,i=t.length,a;r<i;r++)(a||!(r in t))&&(a||(a=Array.prototype.slice.call(t,0,r)),a[r]=t[r]);return e.concat(a||Array.prototype.slice.call(t))},A2t=function(e,t){if(qe.isArray(t))return t},Oh=function(){for(var e=[],t=0;t<arguments.length;t++)e[t]=arguments[t];return qe.mergeWith.apply(void 0,e1e(e1e([],e,!1),[A2t],!1))};function V2(e){switch(typeof e){case"function":return e;case"string":return function(t){return qe.get(t,[e])};default:return function(){return e}}}var q2=function(){return q2=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},q2.apply(this,arguments)},N2t=function(e,t){var n={};for(var r in e)Object.prototype.hasOwnProperty.call(e,r)&&t.indexOf(r)<0&&(n[r]=e[r]);if(e!=null&&typeof Object.getOwnPropertySymbols=="function")for(var i=0,r=Object.getOwnPropertySymbols(e);i<r.length;i++)t.indexOf(r[i])<0&&Object.prototype.propertyIsEnumerable.call(e,r[i])&&(n[r[i]]=e[r[i]]);return n},L2t=["renderer"],t1e=["width","height","autoFit","theme","inset","insetLeft","insetRight","insetTop","insetBottom","padding","paddingTop","paddingRight","paddingBottom","paddingLeft","margin","marginTop","marginRight","marginBottom","marginLeft","depth","title","clip","children","type","data","direction"],E9="__transform__",j2t="__skipDelCustomKeys__",Pv=function(e,t){return qe.isBoolean(t)?{type:e,available:t}:q2({type:e},t)},O9={xField:"encode.x",yField:"encode.y",colorField:"encode.color",angleField:"encode.y",keyField:"encode.key",sizeField:"encode.size",shapeField:"encode.shape",seriesField:"encode.series",positionField:"encode.position",textField:"encode.text",valueField:"encode.value",binField:"encode.x",srcField:"encode.src",linkColorField:"encode.linkColor",fontSizeField:"encode.fontSize",radius:"coordinate.outerRadius",innerRadius:"coordinate.innerRadius",startAngle:"coordinate.startAngle",endAngle:"coordinate.endAngle",focusX:"coordinate.focusX",focusY:"coordinate.focusY",distortionX:"coordinate.distortionX",distortionY:"coordinate.distortionY",visual:"coordinate.visual",stack:{target:"transform",value:function(e){return Pv("stackY",e)}},normalize:{target:"transform",value:function(e){return Pv("normalizeY",e)}},percent:{target:"transform",value:function(e){return Pv("normalizeY",e)}},group:{target:"transform",value:function(e){return Pv("dodgeX",e)}},sort:{target:"transform",value:function(e){return Pv("sortX",e)}},symmetry:{target:"transform",value:function(e){return Pv("symmetryY",e)}},diff:{target:"transform",value:function(e){return Pv("diffY",e)}},meta:{target:"scale",value:function(e){return e}},label:{target:"labels",value:function(e){return e}},shape:"style.shape",connectNulls:{target:"style",value:function(e){return qe.isBoolean(e)?{connect:e}:e}}},_9=["xField","yField","seriesField","colorField","keyField","positionField","meta","tooltip","animate","stack","normalize","percent","group","sort","symmetry","diff"],S3=[{key:"annotations",extend_keys:[]},{key:"line",type:"line",extend_keys:_9},{key:"point",type:"point",extend_keys:_9},{key:"area",type:"area",extend_keys:_9}],D2t=[{key:"transform",callback:function(e,t,n){var r;e[t]=e[t]||[];var i=n.available,a=i===void 0?!0:i,o=N2t(n,["available"]);if(a)e[t].push(q2((r={},r[E9]=!0,r),o));else{var s=e[t].indexOf(function(l){return l.type===n.type});s!==-1&&e[t].splice(s,1)}}},{key:"labels",callback:function(e,t,n){var r;if(!n||qe.isArray(n)){e[t]=n||[];return}n.text||(n.text=e.yField),e[t]=e[t]||[],e[t].push(q2((r={},r[E9]=!0,r),n))}}],$9=[{key:"conversionTag",shape:"ConversionTag"},{key:"axisText",shape:"BidirectionalBarAxisText"}],F2t=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),w3=function(){return w3=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},w3.apply(this,arguments)},B2t=function(e,t){var n={};for(var r in e)Object.prototype.hasOwnProperty.call(e,r)&&t.indexOf(r)<0&&(n[r]=e[r]);if(e!=null&&typeof Object.getOwnPropertySymbols=="function")for(var i=0,r=Object.getOwnPropertySymbols(e);i<r.length;i++)t.indexOf(r[i])<0&&Object.prototype.propertyIsEnumerable.call(e,r[i])&&(n[r[i]]=e[r[i]]);return n},n1e=function(e){F2t(t,e);function t(n){n===void 0&&(n={});var r=n.style,i=B2t(n,["style"]);return e.call(this,w3({style:w3({text:"",fontSize:12,textBaseline:"middle",textAlign:"center",fill:"#000",fontStyle:"normal",fontVariant:"normal",fontWeight:"normal",lineWidth:1},r)},i))||this}return t}(Rl),z2t=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),C3=function(){return C3=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},C3.apply(this,arguments)},H2t=function(e,t){var n={};for(var r in e)Object.prototype.hasOwnProperty.call(e,r)&&t.indexOf(r)<0&&(n[r]=e[r]);if(e!=null&&typeof Object.getOwnPropertySymbols=="function")for(var i=0,r=Object.getOwnPropertySymbols(e);i<r.length;i++)t.indexOf(r[i])<0&&Object.prototype.propertyIsEnumerable.call(e,r[i])&&(n[r[i]]=e[r[i]]);return n},W2t=function(e){z2t(t,e);function t(n){n===void 0&&(n={});var r=n.style,i=H2t(n,["style"]);return e.call(this,C3({style:C3({fill:"#eee"},r)},i))||this}return t}(rv),V2t=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),r1e=function(e){V2t(t,e);function t(n,r,i){var a=e.call(this,{style:Oh(i,r)})||this;return a.chart=n,a}return t.prototype.connectedCallback=function(){this.render(this.attributes,this),this.bindEvents(this.attributes,this)},t.prototype.disconnectedCallback=function(){},t.prototype.attributeChangedCallback=function(n){},t.prototype.update=function(n,r){var i;return this.attr(Oh({},this.attributes,n||{})),(i=this.render)===null||i===void 0?void 0:i.call(this,this.attributes,this,r)},t.prototype.clear=function(){this.removeChildren()},t.prototype.getElementsLayout=function(){var n=this.chart.getContext().canvas,r=n.document.getElementsByClassName("element"),i=[];return r.forEach(function(a){var o=a.getBBox(),s=o.x,l=o.y,c=o.width,u=o.height,f=a.__data__;i.push({bbox:o,x:s,y:l,width:c,height:u,key:f.key,data:f})}),i},t.prototype.bindEvents=function(n,r){},t}(vx),q2t=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),E3=function(){return E3=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},E3.apply(this,arguments)},U2t=function(e){q2t(t,e);function t(n,r){return e.call(this,n,r,{type:t.tag})||this}return t.prototype.getConversionTagLayout=function(){var n=this.direction==="vertical",r=this.getElementsLayout(),i=r[0],a=i.x,o=i.y,s=i.height,l=i.width,c=i.data,u=["items",0,"value"],f=qe.get(c,u),d=n?r[1].y-o-s:r[1].x-a-l,h=[],p=this.attributes,v=p.size,g=v===void 0?40:v,m=p.arrowSize,y=m===void 0?20:m,x=p.spacing,S=x===void 0?4:x;return r.forEach(function(w,C){if(C>0){var E=w.x,O=w.y,$=w.height,P=w.width,M=w.data,k=w.key,T=qe.get(M,u),R=g/2;if(n){var A=E+P/2,N=O;h.push({points:[[A+R,N-d+S],[A+R,N-y-S],[A,N-S],[A-R,N-y-S],[A-R,N-d+S]],center:[A,N-d/2-S],width:d,value:[f,T],key:k})}else{var A=E,N=O+$/2;h.push({points:[[E-d+S,N-R],[E-y-S,N-R],[A-S,N],[E-y-S,N+R],[E-d+S,N+R]],center:[A-d/2-S,N],width:d,value:[f,T],key:k})}f=T}}),h},t.prototype.render=function(){this.setDirection(),this.drawConversionTag()},t.prototype.setDirection=function(){var n=this.chart.getCoordinate(),r=qe.get(n,"options.transformations"),i="horizontal";r.forEach(function(a){a.includes("transpose")&&(i="vertical")}),this.direction=i},t.prototype.drawConversionTag=function(){var n=this,r=this.getConversionTagLayout(),i=this.attributes,a=i.style,o=i.text,s=o.style,l=o.formatter;r.forEach(function(c){var u=c.points,f=c.center,d=c.value,h=c.key,p=d[0],v=d[1],g=f[0],m=f[1],y=new W2t({style:E3({points:u,fill:"#eee"},a),id:"polygon-".concat(h)}),x=new n1e({style:E3({x:g,y:m,text:qe.isFunction(l)?l(p,v):(v/p*100).toFixed(2)+"%"},s),id:"text-".concat(h)});n.appendChild(y),n.appendChild(x)})},t.prototype.update=function(){var n=this,r=this.getConversionTagLayout();r.forEach(function(i){var a=i.points,o=i.center,s=i.key,l=o[0],c=o[1],u=n.getElementById("polygon-".concat(s)),f=n.getElementById("text-".concat(s));u.setAttribute("points",a),f.setAttribute("x",l),f.setAttribute("y",c)})},t.tag="ConversionTag",t}(r1e),P9=32,i1e=16,a1e=48,G2t=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),U2=function(){return U2=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},U2.apply(this,arguments)},K2t=function(e,t){var n={};for(var r in e)Object.prototype.hasOwnProperty.call(e,r)&&t.indexOf(r)<0&&(n[r]=e[r]);if(e!=null&&typeof Object.getOwnPropertySymbols=="function")for(var i=0,r=Object.getOwnPropertySymbols(e);i<r.length;i++)t.indexOf(r[i])<0&&Object.prototype.propertyIsEnumerable.call(e,r[i])&&(n[r[i]]=e[r[i]]);return n},Y2t=function(e){G2t(t,e);function t(n,r){return e.call(this,n,r,{type:t.tag})||this}return t.prototype.render=function(){this.drawText()},t.prototype.getBidirectionalBarAxisTextLayout=function(){var n=this.attributes.layout,r=n==="vertical",i=this.getElementsLayout(),a=r?qe.uniqBy(i,"x"):qe.uniqBy(i,"y"),o=["title"],s=[],l=this.chart.getContext().views,c=qe.get(l,[0,"layout"]),u=c.width,f=c.height;return a.forEach(function(d){var h=d.x,p=d.y,v=d.height,g=d.width,m=d.data,y=d.key,x=qe.get(m,o);r?s.push({x:h+g/2,y:f,text:x,key:y}):s.push({x:u,y:p+v/2,text:x,key:y})}),qe.uniqBy(s,"text").length!==s.length&&(s=Object.values(qe.groupBy(s,"text")).map(function(d){var h,p=d.reduce(function(v,g){return v+(r?g.x:g.y)},0);return U2(U2({},d[0]),(h={},h[r?"x":"y"]=p/d.length,h))})),s},t.prototype.transformLabelStyle=function(n){var r={},i=/^label[A-Z]/;return Object.keys(n).forEach(function(a){i.test(a)&&(r[a.replace("label","").replace(/^[A-Z]/,function(o){return o.toLowerCase()})]=n[a])}),r},t.prototype.drawText=function(){var n=this,r=this.getBidirectionalBarAxisTextLayout(),i=this.attributes,a=i.layout,o=i.labelFormatter,s=K2t(i,["layout","labelFormatter"]);r.forEach(function(l){var c=l.x,u=l.y,f=l.text,d=l.key,h=new n1e({style:U2({x:c,y:u,text:qe.isFunction(o)?o(f):f,wordWrap:!0,wordWrapWidth:a==="horizontal"?P9*2:120,maxLines:2,textOverflow:"ellipsis"},n.transformLabelStyle(s)),id:"text-".concat(d)});n.appendChild(h)})},t.prototype.destroy=function(){this.clear()},t.prototype.update=function(){this.destroy(),this.drawText()},t.tag="BidirectionalBarAxisText",t}(r1e),X2t={ConversionTag:U2t,BidirectionalBarAxisText:Y2t},Z2t=function(){function e(t,n){this.container=new Map,this.chart=t,this.config=n,this.init()}return e.prototype.init=function(){var t=this;$9.forEach(function(n){var r,i=n.key,a=n.shape,o=t.config[i];if(o){var s=new X2t[a](t.chart,o),l=t.chart.getContext().canvas;l.appendChild(s),t.container.set(i,s)}else(r=t.container.get(i))===null||r===void 0||r.clear()})},e.prototype.update=function(){var t=this;this.container.size&&$9.forEach(function(n){var r=n.key,i=t.container.get(r);i==null||i.update()})},e}(),Q2t=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),q0=function(){return q0=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},q0.apply(this,arguments)},o1e="data-chart-source-type",Tr=function(e){Q2t(t,e);function t(n,r){var i=e.call(this)||this;return i.container=typeof n=="string"?document.getElementById(n):n,i.options=i.mergeOption(r),i.createG2(),i.bindEvents(),i}return t.prototype.getChartOptions=function(){return q0(q0({},qe.pick(this.options,L2t)),{container:this.container})},t.prototype.getSpecOptions=function(){return this.type==="base"||this[j2t]?q0(q0({},this.options),this.getChartOptions()):this.options},t.prototype.createG2=function(){if(!this.container)throw Error("The container is not initialized!");this.chart=new T2t(this.getChartOptions()),this.container.setAttribute(o1e,"Ant Design Charts")},t.prototype.bindEvents=function(){var n=this;this.chart&&this.chart.on("*",function(r){r!=null&&r.type&&n.emit(r.type,r)})},t.prototype.getBaseOptions=function(){return{type:"view",autoFit:!0}},t.prototype.getDefaultOptions=function(){},t.prototype.render=function(){var n=this;this.type!=="base"&&this.execAdaptor(),this.chart.options(this.getSpecOptions()),this.chart.render().then(function(){n.annotation=new Z2t(n.chart,n.options)}),this.bindSizeSensor()},t.prototype.update=function(n){this.options=this.mergeOption(n)},t.prototype.mergeOption=function(n){return Oh({},this.getBaseOptions(),this.getDefaultOptions(),n)},t.prototype.changeData=function(n){this.chart.changeData(n)},t.prototype.changeSize=function(n,r){this.chart.changeSize(n,r)},t.prototype.destroy=function(){this.chart.destroy(),this.off(),this.container.removeAttribute(o1e)},t.prototype.execAdaptor=function(){var n=this.getSchemaAdaptor();n({chart:this.chart,options:this.options})},t.prototype.triggerResize=function(){this.chart.forceFit()},t.prototype.bindSizeSensor=function(){var n=this,r=this.options.autoFit,i=r===void 0?!0:r;i&&this.chart.on(jr.AFTER_CHANGE_SIZE,function(){n.annotation.update()})},t}(wL),J2t=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),eSt=function(e){J2t(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="base",n}return t.getDefaultOptions=function(){return{type:"view",children:[{type:"line"}]}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return function(n){return n}},t}(Tr),M9=function(){return M9=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},M9.apply(this,arguments)};function tSt(e){var t=e.options,n=t.stack,r=t.tooltip,i=t.xField;if(!n)return e;var a=S3.map(function(s){return s.type}).filter(function(s){return!!s}),o=!1;return a.forEach(function(s){t[s]&&(o=!0,qe.set(t,[s,"stack"],M9({y1:"y"},typeof n=="object"?n:{})))}),o&&!qe.isBoolean(r)&&!r&&qe.set(t,"tooltip",{title:i,items:[{channel:"y"}]}),e}function Xi(e){return qe.flow(tSt)(e)}function nSt(e){var t=e.options.layout,n=t===void 0?"horizontal":t;return e.options.coordinate.transform=n!=="horizontal"?void 0:[{type:"transpose"}],e}function rSt(e){nSt(e);var t=e.options.layout,n=t===void 0?"horizontal":t;return e.options.children.forEach(function(r){var i;!((i=r==null?void 0:r.coordinate)===null||i===void 0)&&i.transform&&(r.coordinate.transform=n!=="horizontal"?void 0:[{type:"transpose"}])}),e}function iSt(e){return qe.flow(Xi,Dr)(e)}var aSt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),oSt=function(e){aSt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="area",n}return t.getDefaultOptions=function(){return{type:"view",children:[{type:"area"}],scale:{y:{nice:!0}},axis:{y:{title:!1},x:{title:!1}},interaction:{tooltip:{shared:!0}}}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return iSt},t}(Tr),U0=function(){return U0=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},U0.apply(this,arguments)};function s1e(e){var t=function(n){var r=n.options;qe.get(r,"children.length")>1&&qe.set(r,"children",[{type:"interval"}]);var i=r.scale,a=r.markBackground,o=r.data,s=r.children,l=r.yField,c=qe.get(i,"y.domain",[]);if(a&&c.length&&qe.isArray(o)){var u="domainMax",f=o.map(function(d){var h;return U0(U0({originData:U0({},d)},qe.omit(d,l)),(h={},h[u]=c[c.length-1],h))});s.unshift(U0({type:"interval",data:f,yField:u,tooltip:!1,style:{fill:"#eee"},label:!1},a))}return n};return qe.flow(t,Xi,Dr)(e)}var sSt=function(){var e=function(t,n){return function(r){var i=t.fill,a=i===void 0?"#2888FF":i,o=t.stroke,s=t.fillOpacity,l=s===void 0?1:s,c=t.strokeOpacity,u=c===void 0?.2:c,f=t.pitch,d=f===void 0?8:f,h=r[0],p=r[1],v=r[2],g=r[3],m=(p[1]-h[1])/2,y=n.document,x=y.createElement("g",{}),S=y.createElement("polygon",{style:{points:[h,[h[0]-d,h[1]+m],[v[0]-d,h[1]+m],g],fill:a,fillOpacity:l,stroke:o,strokeOpacity:u,inset:30}}),w=y.createElement("polygon",{style:{points:[[h[0]-d,h[1]+m],p,v,[v[0]-d,h[1]+m]],fill:a,fillOpacity:l,stroke:o,strokeOpacity:u}}),C=y.createElement("polygon",{style:{points:[h,[h[0]-d,h[1]+m],p,[h[0]+d,h[1]+m]],fill:a,fillOpacity:l-.2}});return x.appendChild(S),x.appendChild(w),x.appendChild(C),x}};zye("shape.interval.bar25D",e)},lSt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}();sSt();var cSt=function(e){lSt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="Bar",n}return t.getDefaultOptions=function(){return{type:"view",coordinate:{transform:[{type:"transpose"}]},children:[{type:"interval"}],scale:{y:{nice:!0}},axis:{y:{title:!1},x:{title:!1}},interaction:{tooltip:{shared:!0},elementHighlight:{background:!0}}}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return s1e},t}(Tr),uSt=function(){var e=function(t,n){return function(r){var i=t.fill,a=i===void 0?"#2888FF":i,o=t.stroke,s=t.fillOpacity,l=s===void 0?1:s,c=t.strokeOpacity,u=c===void 0?.2:c,f=t.pitch,d=f===void 0?8:f,h=r[1][0]-r[0][0],p=h/2+r[0][0],v=n.document,g=v.createElement("g",{}),m=v.createElement("polygon",{style:{points:[[r[0][0],r[0][1]],[p,r[1][1]+d],[p,r[3][1]+d],[r[3][0],r[3][1]]],fill:a,fillOpacity:l,stroke:o,strokeOpacity:u,inset:30}}),y=v.createElement("polygon",{style:{points:[[p,r[1][1]+d],[r[1][0],r[1][1]],[r[2][0],r[2][1]],[p,r[2][1]+d]],fill:a,fillOpacity:l,stroke:o,strokeOpacity:u}}),x=v.createElement("polygon",{style:{points:[[r[0][0],r[0][1]],[p,r[1][1]-d],[r[1][0],r[1][1]],[p,r[1][1]+d]],fill:a,fillOpacity:l-.2}});return g.appendChild(y),g.appendChild(m),g.appendChild(x),g}};zye("shape.interval.column25D",e)},fSt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}();uSt();var dSt=function(e){fSt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="column",n}return t.getDefaultOptions=function(){return{type:"view",scale:{y:{nice:!0}},interaction:{tooltip:{shared:!0},elementHighlight:{background:!0}},axis:{y:{title:!1},x:{title:!1}},children:[{type:"interval"}]}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return s1e},t}(Tr);function hSt(e){var t=function(r){var i=r.options,a=i.children,o=a===void 0?[]:a,s=i.legend;return s&&o.forEach(function(l){if(!qe.get(l,"colorField")){var c=qe.get(l,"yField");qe.set(l,"colorField",function(){return c})}}),r},n=function(r){var i=r.options,a=i.annotations,o=a===void 0?[]:a,s=i.children,l=s===void 0?[]:s,c=i.scale,u=!1;return qe.get(c,"y.key")||l.forEach(function(f,d){if(!qe.get(f,"scale.y.key")){var h="child".concat(d,"Scale");qe.set(f,"scale.y.key",h);var p=f.annotations,v=p===void 0?[]:p;v.length>0&&(qe.set(f,"scale.y.independent",!1),v.forEach(function(g){qe.set(g,"scale.y.key",h)})),!u&&o.length>0&&qe.get(f,"scale.y.independent")===void 0&&(u=!0,qe.set(f,"scale.y.independent",!1),o.forEach(function(g){qe.set(g,"scale.y.key",h)}))}}),r};return qe.flow(t,n,Xi,Dr)(e)}var pSt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),l1e=function(e){pSt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="DualAxes",n}return t.getDefaultOptions=function(){return{type:"view",axis:{y:{title:!1,tick:!1},x:{title:!1}},scale:{y:{independent:!0,nice:!0}}}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return hSt},t}(Tr);function vSt(e){var t=function(a){var o=a.options,s=o.xField,l=o.colorField;return l||qe.set(o,"colorField",s),a},n=function(a){var o=a.options,s=o.compareField,l=o.transform,c=o.isTransposed,u=c===void 0?!0:c,f=o.coordinate;return l||(s?qe.set(o,"transform",[]):qe.set(o,"transform",[{type:"symmetryY"}])),!f&&u&&qe.set(o,"coordinate",{transform:[{type:"transpose"}]}),a},r=function(a){var o=a.options,s=o.compareField,l=o.seriesField,c=o.data,u=o.children,f=o.yField,d=o.isTransposed,h=d===void 0?!0:d;if(s||l){var p=Object.values(qe.groupBy(c,function(v){return v[s||l]}));u[0].data=p[0],u.push({type:"interval",data:p[1],yField:function(v){return-v[f]}}),delete o.compareField,delete o.data}return l&&(qe.set(o,"type","spaceFlex"),qe.set(o,"ratio",[1,1]),qe.set(o,"direction",h?"row":"col"),delete o.seriesField),a},i=function(a){var o=a.options,s=o.tooltip,l=o.xField,c=o.yField;return s||qe.set(o,"tooltip",{title:!1,items:[function(u){return{name:u[l],value:u[c]}}]}),a};return qe.flow(t,n,r,i,Xi,Dr)(e)}var gSt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),mSt=function(e){gSt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="column",n}return t.getDefaultOptions=function(){return{type:"view",scale:{x:{padding:0}},animate:{enter:{type:"fadeIn"}},axis:!1,shapeField:"funnel",label:{position:"inside",transform:[{type:"contrastReverse"}]},children:[{type:"interval"}]}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return vSt},t}(Tr);function ySt(e){return qe.flow(Xi,Dr)(e)}var bSt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),xSt=function(e){bSt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="line",n}return t.getDefaultOptions=function(){return{type:"view",scale:{y:{nice:!0}},interaction:{tooltip:{shared:!0}},axis:{y:{title:!1},x:{title:!1}},children:[{type:"line"}]}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return ySt},t}(Tr),Xl=function(){return Xl=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},Xl.apply(this,arguments)};function SSt(e){var t=function(n){var r=n.options,i=r.angleField,a=r.data,o=r.label,s=r.tooltip,l=r.colorField,c=V2(l);if(qe.isArray(a)&&a.length>0){var u=a.reduce(function(d,h){return d+h[i]},0);if(u===0){var f=a.map(function(d){var h;return Xl(Xl({},d),(h={},h[i]=1,h))});qe.set(r,"data",f),o&&qe.set(r,"label",Xl(Xl({},o),{formatter:function(){return 0}})),s!==!1&&(qe.isFunction(s)?qe.set(r,"tooltip",function(d,h,p){var v;return s(Xl(Xl({},d),(v={},v[i]=0,v)),h,p.map(function(g){var m;return Xl(Xl({},g),(m={},m[i]=0,m))}))}):qe.set(r,"tooltip",Xl(Xl({},s),{items:[function(d,h,p){return{name:c(d,h,p),value:0}}]})))}}return n};return qe.flow(t,Dr)(e)}var wSt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),CSt=function(e){wSt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="pie",n}return t.getDefaultOptions=function(){return{type:"view",children:[{type:"interval"}],coordinate:{type:"theta"},transform:[{type:"stackY",reverse:!0}],animate:{enter:{type:"waveIn"}}}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return SSt},t}(Tr);function ESt(e){return qe.flow(Xi,Dr)(e)}var OSt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),_St=function(e){OSt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="scatter",n}return t.getDefaultOptions=function(){return{axis:{y:{title:!1},x:{title:!1}},legend:{size:!1},children:[{type:"point"}]}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return ESt},t}(Tr);function $St(e){var t=function(n){return qe.set(n,"options.coordinate",{type:qe.get(n,"options.coordinateType","polar")}),n};return qe.flow(t,Dr)(e)}var PSt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),MSt=function(e){PSt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="radar",n}return t.getDefaultOptions=function(){return{axis:{x:{grid:!0,line:!0},y:{zIndex:1,title:!1,line:!0,nice:!0}},meta:{x:{padding:.5,align:0}},interaction:{tooltip:{style:{crosshairsLineDash:[4,4]}}},children:[{type:"line"}],coordinateType:"polar"}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return $St},t}(Tr),Bf=function(){return Bf=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},Bf.apply(this,arguments)},kSt="__stock-range__",TSt="trend",RSt="up",ISt="down";function ASt(e){var t=function(r){var i=r.options,a=i.data,o=i.yField;return r.options.data=qe.map(a,function(s){var l=s&&Bf({},s);if(Array.isArray(o)&&l){var c=o[0],u=o[1],f=o[2],d=o[3];l[TSt]=l[c]<=l[u]?RSt:ISt,l[kSt]=[l[c],l[u],l[f],l[d]]}return l}),r},n=function(r){var i=r.options,a=i.xField,o=i.yField,s=i.fallingFill,l=i.risingFill,c=o[0],u=o[1],f=o[2],d=o[3],h=V2(a);return r.options.children=qe.map(r.options.children,function(p,v){var g=v===0;return Bf(Bf({},p),{tooltip:{title:function(m,y,x){var S=h(m,y,x);return S instanceof Date?S.toLocaleString():S},items:[{field:f},{field:d},{field:c},{field:u}]},encode:Bf(Bf({},p.encode||{}),{y:g?[f,d]:[c,u],color:function(m){return Math.sign(m[u]-m[c])}}),style:Bf(Bf({},p.style||{}),{lineWidth:g?1:10})})}),delete i.yField,r.options.legend={color:!1},s&&qe.set(r,"options.scale.color.range[0]",s),l&&qe.set(r,"options.scale.color.range[2]",l),r};return qe.flow(t,n,Dr)(e)}var NSt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),LSt=["#26a69a","#999999","#ef5350"],jSt=function(e){NSt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="stock",n}return t.getDefaultOptions=function(){return{type:"view",scale:{color:{domain:[-1,0,1],range:LSt},y:{nice:!0}},children:[{type:"link"},{type:"link"}],axis:{x:{title:!1,grid:!1},y:{title:!1,grid:!0,gridLineDash:null}},animate:{enter:{type:"scaleInY"}},interaction:{tooltip:{shared:!0,marker:!1,groupName:!1,crosshairs:!0}}}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return ASt},t}(Tr);function DSt(e){return qe.flow(Xi,Dr)(e)}var FSt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),BSt=function(e){FSt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="TinyLine",n}return t.getDefaultOptions=function(){return{type:"view",children:[{type:"line",axis:!1}],animate:{enter:{type:"growInX",duration:500}},padding:0,margin:0,tooltip:!1}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return DSt},t}(Tr);function zSt(e){return qe.flow(Xi,Dr)(e)}var HSt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),WSt=function(e){HSt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="TinyArea",n}return t.getDefaultOptions=function(){return{type:"view",animate:{enter:{type:"growInX",duration:500}},children:[{type:"area",axis:!1}],padding:0,margin:0,tooltip:!1}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return zSt},t}(Tr);function VSt(e){return qe.flow(Xi,Dr)(e)}var qSt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),USt=function(e){qSt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="TinyColumn",n}return t.getDefaultOptions=function(){return{type:"view",children:[{type:"interval",axis:!1}],padding:0,margin:0,tooltip:!1}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return VSt},t}(Tr),k9=function(){return k9=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},k9.apply(this,arguments)};function GSt(e){var t=function(n){var r=n.options,i=r.percent,a=r.color,o=a===void 0?[]:a;if(!i)return n;var s={scale:{color:{range:o.length?o:[]}},data:[1,i]};return Object.assign(r,k9({},s)),n};return qe.flow(t,Xi,Dr)(e)}var KSt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),YSt=function(e){KSt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="TinyProgress",n}return t.getDefaultOptions=function(){return{type:"view",data:[],margin:0,padding:0,tooltip:!1,children:[{interaction:{tooltip:!1},coordinate:{transform:[{type:"transpose"}]},type:"interval",axis:!1,legend:!1,encode:{y:function(n){return n},color:function(n,r){return r}}}]}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return GSt},t}(Tr),T9=function(){return T9=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},T9.apply(this,arguments)};function XSt(e){var t=function(r){var i=r.options,a=i.radius,o=a===void 0?.8:a;return qe.set(r,"options.coordinate.innerRadius",o),r},n=function(r){var i=r.options,a=i.percent,o=i.color,s=o===void 0?[]:o;if(!a)return r;var l={scale:{color:{range:s.length?s:[]}},data:[1,a]};return Object.assign(i,T9({},l)),r};return qe.flow(t,n,Xi,Dr)(e)}var ZSt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),QSt=function(e){ZSt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="TinyRing",n}return t.getDefaultOptions=function(){return{type:"view",data:[],margin:0,padding:0,coordinate:{type:"theta"},animate:{enter:{type:"waveIn"}},interaction:{tooltip:!1},tooltip:!1,children:[{type:"interval",axis:!1,legend:!1,encode:{y:function(n){return n},color:function(n,r){return r}}}]}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return XSt},t}(Tr);function JSt(e){return qe.flow(Dr)(e)}var ewt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),twt=function(e){ewt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="rose",n}return t.getDefaultOptions=function(){return{type:"view",children:[{type:"interval"}],coordinate:{type:"polar"},animate:{enter:{type:"waveIn"}}}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return JSt},t}(Tr),R9="__start__",G0="__end__",I9="__waterfall_value__",A9=function(){return A9=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},A9.apply(this,arguments)},nwt=function(e,t,n){if(n||arguments.length===2)for(var r=0,i=t.length,a;r<i;r++)(a||!(r in t))&&(a||(a=Array.prototype.slice.call(t,0,r)),a[r]=t[r]);return e.concat(a||Array.prototype.slice.call(t))};function rwt(e){var t=function(r){var i=r.options,a=i.data,o=a===void 0?[]:a,s=i.yField;return o.length&&(o.reduce(function(l,c,u){var f,d=V2(s),h=d(c,u,o);if(u===0||c.isTotal)c[R9]=0,c[G0]=h,c[I9]=h;else{var p=(f=l[G0])!==null&&f!==void 0?f:d(l,u,o);c[R9]=p,c[G0]=p+h,c[I9]=l[G0]}return c},[]),Object.assign(i,{yField:[R9,G0]})),r},n=function(r){var i=r.options,a=i.data,o=a===void 0?[]:a,s=i.xField,l=i.children,c=i.linkStyle,u=nwt([],o,!0);return u.reduce(function(f,d,h){return h>0&&(d.x1=f[s],d.x2=d[s],d.y1=f[G0]),d},[]),u.shift(),l.push({type:"link",xField:["x1","x2"],yField:"y1",zIndex:-1,data:u,style:A9({stroke:"#697474"},c),label:!1,tooltip:!1}),r};return qe.flow(t,n,Xi,Dr)(e)}var iwt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),awt=function(e){iwt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="waterfall",n}return t.getDefaultOptions=function(){return{type:"view",legend:null,tooltip:{field:I9,valueFormatter:"~s",name:"value"},axis:{y:{title:null,labelFormatter:"~s"},x:{title:null}},children:[{type:"interval",interaction:{elementHighlight:{background:!0}}}]}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return rwt},t}(Tr);function owt(e){var t=function(n){var r=n.options,i=r.data,a=r.binNumber,o=r.binWidth,s=r.children,l=r.channel,c=l===void 0?"count":l,u=qe.get(s,"[0].transform[0]",{});return qe.isNumber(o)?(qe.assign(u,{thresholds:qe.ceil(qe.divide(i.length,o)),y:c}),n):(qe.isNumber(a)&&qe.assign(u,{thresholds:a,y:c}),n)};return qe.flow(t,Xi,Dr)(e)}var swt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),lwt=function(e){swt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="Histogram",n}return t.getDefaultOptions=function(){return{type:"view",autoFit:!0,axis:{y:{title:!1},x:{title:!1}},children:[{type:"rect",transform:[{type:"binX",y:"count"}],interaction:{elementHighlight:{background:!0}}}]}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return owt},t}(Tr);function cwt(e){var t=function(r){var i=r.options,a=i.tooltip,o=a===void 0?{}:a,s=i.colorField,l=i.sizeField;return o&&!o.field&&(o.field=s||l),r},n=function(r){var i=r.options,a=i.mark,o=i.children;return a&&(o[0].type=a),r};return qe.flow(t,n,Xi,Dr)(e)}var uwt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),fwt=function(e){uwt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="heatmap",n}return t.getDefaultOptions=function(){return{type:"view",legend:null,tooltip:{valueFormatter:"~s"},axis:{y:{title:null,grid:!0},x:{title:null,grid:!0}},children:[{type:"point",interaction:{elementHighlight:{background:!0}}}]}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return cwt},t}(Tr);function dwt(e){var t=function(n){var r=n.options.boxType,i=r===void 0?"box":r;return n.options.children[0].type=i,n};return qe.flow(t,Xi,Dr)(e)}var hwt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),pwt=function(e){hwt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="box",n}return t.getDefaultOptions=function(){return{type:"view",children:[{type:"box"}],axis:{y:{title:!1},x:{title:!1}},tooltip:{items:[{name:"min",channel:"y"},{name:"q1",channel:"y1"},{name:"q2",channel:"y2"},{name:"q3",channel:"y3"},{name:"max",channel:"y4"}]}}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return dwt},t}(Tr);function vwt(e){var t=function(n){var r=n.options,i=r.data,a=[{type:"custom",callback:function(s){return{links:s}}}];if(qe.isArray(i))i.length>0?qe.set(r,"data",{value:i,transform:a}):delete r.children;else if(qe.get(i,"type")==="fetch"&&qe.get(i,"value")){var o=qe.get(i,"transform");qe.isArray(o)?qe.set(i,"transform",o.concat(a)):qe.set(i,"transform",a)}return n};return qe.flow(t,Xi,Dr)(e)}var gwt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),mwt=function(e){gwt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="sankey",n}return t.getDefaultOptions=function(){return{type:"view",children:[{type:"sankey"}]}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return vwt},t}(Tr),Bc=function(){return Bc=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},Bc.apply(this,arguments)},O3=["#f0efff","#5B8FF9","#3D76DD"];function N9(e,t,n,r){r===void 0&&(r=!0);var i=0,a=!1,o=qe.map(e,function(s){var l,c,u=qe.get(s,[t]);if(qe.isNil(u))return[];if(qe.isString(u)){var f=Number(u);return isNaN(f)?[]:(l={},l[n]=s[n],l[t]=f,l)}return qe.isArray(u)?(a=!0,i=Math.max(i,u.length),qe.map(r?u.sort(function(d,h){return h-d}):u,function(d,h){var p;return p={},p[n]=s[n],p[t]=d,p.index=h,p})):(i=Math.max(1,i),c={},c[n]=s[n],c[t]=u,c)}).flat();return a?[o.map(function(s){return Bc({index:0},s)}),i]:[o,i]}function L9(e,t){return new Array(e).fill("").map(function(n,r){return qe.isArray(t)?t[r%t.length]:t})}function ywt(e){var t=function(i){var a=i.options,o=a.color,s=a.rangeField,l=s===void 0?"ranges":s,c=a.measureField,u=c===void 0?"measures":c,f=a.targetField,d=f===void 0?"targets":f,h=a.xField,p=h===void 0?"title":h,v=a.mapField,g=a.data,m=N9(g,l,p),y=m[0],x=m[1],S=N9(g,u,p,!1),w=S[0],C=S[1],E=N9(g,d,p,!1),O=E[0],$=E[1],P=qe.get(o,[l],O3[0]),M=qe.get(o,[u],O3[1]),k=qe.get(o,[d],O3[2]),T=[L9(x,P),L9(C,M),L9($,k)].flat();return i.options.children=qe.map(i.options.children,function(R,A){var N=[y,w,O][A],L=[l,u,d][A];return Bc(Bc({},R),{data:N,encode:Bc(Bc({},R.encode||{}),{x:p,y:L,color:function(j){var F=j.index,B=qe.isNumber(F)?"".concat(L,"_").concat(F):L;return v?qe.get(v,[L,F],B):B}}),style:Bc(Bc({},R.style||{}),{zIndex:function(j){return-j[L]}}),labels:A!==0?qe.map(R.labels,function(j){return Bc(Bc({},j),{text:L})}):void 0})}),i.options.scale.color.range=T,i.options.legend.color.itemMarker=function(R){return v&&qe.includes(v==null?void 0:v[d],R)||(R==null?void 0:R.replace(/\_\d$/,""))===d?"line":"square"},i},n=function(i){var a=i.options.layout,o=a===void 0?"horizontal":a;return o!=="horizontal"&&qe.set(i,"options.children[2].shapeField","hyphen"),i},r=function(i){var a=i.options,o=a.range,s=o===void 0?{}:o,l=a.measure,c=l===void 0?{}:l,u=a.target,f=u===void 0?{}:u,d=a.children;return i.options.children=[s,c,f].map(function(h,p){return Oh(d[p],h)}),i};return qe.flow(t,n,r,rSt,Dr)(e)}var bwt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),xwt=function(e){bwt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="bullet",n}return t.getDefaultOptions=function(){return{type:"view",scale:{color:{range:O3}},legend:{color:{itemMarker:function(n){return n==="target"?"line":"square"}}},axis:{y:{title:!1},x:{title:!1}},children:[{type:"interval",style:{maxWidth:30},axis:{y:{grid:!0,gridLineWidth:2}}},{type:"interval",style:{maxWidth:20},transform:[{type:"stackY"}]},{type:"point",encode:{size:8,shape:"line"}}],interaction:{tooltip:{shared:!0}},coordinate:{transform:[{type:"transpose"}]}}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return ywt},t}(Tr);function Swt(e){var t=function(n){var r=n.options.data;return n.options.data={value:r},n};return qe.flow(t,Xi,Dr)(e)}var wwt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),Cwt=function(e){wwt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="Gauge",n}return t.getDefaultOptions=function(){return{type:"view",legend:!1,children:[{type:"gauge"}]}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return Swt},t}(Tr);function Ewt(e){var t=function(n){var r=n.options.percent;return qe.isNumber(r)&&(qe.set(n,"options.data",r),delete n.options.percent),n};return qe.flow(t,Xi,Dr)(e)}var Owt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),_wt=function(e){Owt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="Liquid",n}return t.getDefaultOptions=function(){return{type:"view",children:[{type:"liquid"}]}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return Ewt},t}(Tr);function $wt(e){return qe.flow(Xi,Dr)(e)}var Pwt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),Mwt=function(e){Pwt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="WordCloud",n}return t.getDefaultOptions=function(){return{type:"view",legend:!1,children:[{type:"wordCloud"}]}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return $wt},t}(Tr);function kwt(e){var t=function(n){var r=n.options,i=r.data;return i&&qe.set(r,"data",{value:i}),n};return qe.flow(t,Xi,Dr)(e)}var Twt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),Rwt=function(e){Twt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="treemap",n}return t.getDefaultOptions=function(){return{type:"view",children:[{type:"treemap"}]}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return kwt},t}(Tr),Mv=function(){return Mv=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},Mv.apply(this,arguments)};function Iwt(e){var t=function(i){var a=i.options,o=a.startAngle,s=a.maxAngle,l=a.coordinate,c=qe.isNumber(o)?o/(2*Math.PI)*360:-90,u=qe.isNumber(s)?(Number(s)+c)/180*Math.PI:Math.PI;return qe.set(i,["options","coordinate"],Mv(Mv({},l),{endAngle:u,startAngle:o!=null?o:-Math.PI/2})),i},n=function(i){var a=i.options,o=a.tooltip,s=a.xField,l=a.yField,c=V2(s),u=V2(l);return o||qe.set(a,"tooltip",{title:!1,items:[function(f,d,h){return{name:c(f,d,h),value:u(f,d,h)}}]}),i},r=function(i){var a=i.options,o=a.markBackground,s=a.children,l=a.scale,c=a.coordinate,u=a.xField,f=qe.get(l,"y.domain",[]);return o&&s.unshift(Mv({type:"interval",xField:u,yField:f[f.length-1],colorField:o.color,scale:{color:{type:"identity"}},style:{fillOpacity:o.opacity,fill:o.color?void 0:"#e0e4ee"},coordinate:Mv(Mv({},c),{startAngle:-Math.PI/2,endAngle:1.5*Math.PI}),animate:!1},o)),i};return qe.flow(t,n,r,Xi,Dr)(e)}var Awt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),Nwt=function(e){Awt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="radial",n}return t.getDefaultOptions=function(){return{type:"view",children:[{type:"interval"}],coordinate:{type:"radial",innerRadius:.1,outerRadius:1,endAngle:Math.PI},animate:{enter:{type:"waveIn",duration:800}},axis:{y:{nice:!0,labelAutoHide:!0,labelAutoRotate:!1},x:{title:!1,nice:!0,labelAutoRotate:!1,labelAutoHide:{type:"equidistance",cfg:{minGap:6}}}}}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return Iwt},t}(Tr);function Lwt(e){return qe.flow(Dr)(e)}var jwt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),Dwt=function(e){jwt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="CirclePacking",n}return t.getDefaultOptions=function(){return{legend:!1,type:"view",children:[{type:"pack"}]}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return Lwt},t}(Tr),_3=function(){return _3=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},_3.apply(this,arguments)};function Fwt(e){var t=function(n){var r=n.options,i=r.xField,a=r.yField,o=r.seriesField,s=r.children,l=s==null?void 0:s.map(function(c){return _3(_3({},c),{xField:i,yField:a,seriesField:o,colorField:o,data:c.type==="density"?{transform:[{type:"kde",field:a,groupBy:[i,o]}]}:c.data})}).filter(function(c){return r.violinType!=="density"||c.type==="density"});return qe.set(r,"children",l),r.violinType==="polar"&&qe.set(r,"coordinate",{type:"polar"}),qe.set(r,"violinType",void 0),n};return qe.flow(t,Xi,Dr)(e)}var Bwt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),zwt=function(e){Bwt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="violin",n}return t.getDefaultOptions=function(){return{type:"view",children:[{type:"density",sizeField:"size",tooltip:!1},{type:"boxplot",shapeField:"violin",style:{opacity:.5,point:!1}}],animate:{enter:{type:"fadeIn"}}}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return Fwt},t}(Tr),G2=function(){return G2=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},G2.apply(this,arguments)},Hwt=function(e,t,n){if(n||arguments.length===2)for(var r=0,i=t.length,a;r<i;r++)(a||!(r in t))&&(a||(a=Array.prototype.slice.call(t,0,r)),a[r]=t[r]);return e.concat(a||Array.prototype.slice.call(t))};function Wwt(e){var t=function(a){var o=a.options,s=o.yField,l=o.children;return l.forEach(function(c,u){qe.set(c,"yField",s[u])}),a},n=function(a){var o=a.options,s=o.yField,l=o.children,c=o.data;if(qe.isPlainObject(c))return a;var u=qe.isArray(qe.get(c,[0]))?c:[c,c];return l.forEach(function(f,d){qe.set(f,"data",Hwt([],u[d].map(function(h){return G2({groupKey:s[d]},h)}),!0))}),a},r=function(a){var o=a.options,s=o.yField,l=s[0],c=s[1],u=o.tooltip;return u||qe.set(o,"tooltip",{items:[{field:l,value:l},{field:c,value:c}]}),a},i=function(a){var o=a.options,s=o.children,l=o.layout,c=o.coordinate.transform,u=o.paddingBottom,f=u===void 0?a1e:u,d=o.paddingLeft,h=d===void 0?a1e:d,p=o.axis;qe.set(o,"axisText",G2(G2({},(p==null?void 0:p.x)||{}),{layout:l}));var v=s[0],g=s[1];if(l==="vertical")qe.set(o,"direction","col"),qe.set(o,"paddingLeft",h),qe.set(o,"coordinate.transform",c.filter(function(w){return w.type!=="transpose"})),qe.set(v,"paddingBottom",i1e),qe.set(g,"paddingTop",i1e),qe.set(g,"axis",{x:{position:"top"}}),qe.set(g,"scale",{y:{range:[0,1]}});else{qe.set(o,"paddingBottom",f),qe.set(v,"scale",{y:{range:[0,1]}});var m=v.paddingRight,y=m===void 0?P9:m,x=g.paddingLeft,S=x===void 0?P9:x;qe.set(v,"paddingRight",y),qe.set(v,"axis",{x:{position:"right"}}),qe.set(g,"paddingLeft",S)}return a};return qe.flow(t,n,r,i,Xi,Dr)(e)}var Vwt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),qwt=function(e){Vwt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="BidirectionalBar",n}return t.getDefaultOptions=function(){return{type:"spaceFlex",coordinate:{transform:[{type:"transpose"}]},scale:{y:{nice:!0}},direction:"row",layout:"horizontal",legend:!1,axis:{y:{title:!1},x:{title:!1,label:!1}},children:[{type:"interval"},{type:"interval"}]}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return Wwt},t}(Tr),kv;(function(e){e.color="key",e.d="path"})(kv||(kv={}));function Uwt(e){var t=function(n){var r=n.options,i=r.data,a=r.setsField,o=r.sizeField;return qe.isArray(i)&&(qe.set(r,"data",{type:"inline",value:i,transform:[{type:"venn",sets:a,size:o,as:[kv.color,kv.d]}]}),qe.set(r,"colorField",a),qe.set(r,["children","0","encode","d"],kv.d)),qe.set(n,"options",qe.omit(r,["sizeField","setsField"])),n};return qe.flow(t,Dr)(e)}var Gwt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),Kwt=function(e){Gwt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="venn",n}return t.getDefaultOptions=function(){return{type:"view",children:[{type:"path"}],legend:{color:{itemMarker:"circle"}},encode:{color:kv.color,d:kv.d}}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return Uwt},t}(Tr);function Ywt(e){var t=function(n){return n};return qe.flow(t,Dr)(e)}var Xwt=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(r,i){r.__proto__=i}||function(r,i){for(var a in i)Object.prototype.hasOwnProperty.call(i,a)&&(r[a]=i[a])},e(t,n)};return function(t,n){if(typeof n!="function"&&n!==null)throw new TypeError("Class extends value "+String(n)+" is not a constructor or null");e(t,n);function r(){this.constructor=t}t.prototype=n===null?Object.create(n):(r.prototype=n.prototype,new r)}}(),Zwt=function(e){Xwt(t,e);function t(){var n=e!==null&&e.apply(this,arguments)||this;return n.type="Sunburst",n}return t.getDefaultOptions=function(){return{type:"view",children:[{type:"sunburst"}]}},t.prototype.getDefaultOptions=function(){return t.getDefaultOptions()},t.prototype.getSchemaAdaptor=function(){return Ywt},t}(Tr),Qwt={Base:eSt,Line:xSt,Column:dSt,Pie:CSt,Area:oSt,Bar:cSt,DualAxes:l1e,Funnel:mSt,Scatter:_St,Radar:MSt,Rose:twt,Stock:jSt,TinyLine:BSt,TinyArea:WSt,TinyColumn:USt,TinyProgress:YSt,TinyRing:QSt,Waterfall:awt,Histogram:lwt,Heatmap:fwt,Box:pwt,Sankey:mwt,Bullet:xwt,Gauge:Cwt,Liquid:_wt,WordCloud:Mwt,Treemap:Rwt,RadialBar:Nwt,CirclePacking:Dwt,Violin:zwt,BidirectionalBar:qwt,Venn:Kwt,Mix:l1e,Sunburst:Zwt},j9=function(){return j9=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},j9.apply(this,arguments)},c1e=function(e,t){var n={};for(var r in e)Object.prototype.hasOwnProperty.call(e,r)&&t.indexOf(r)<0&&(n[r]=e[r]);if(e!=null&&typeof Object.getOwnPropertySymbols=="function")for(var i=0,r=Object.getOwnPropertySymbols(e);i<r.length;i++)t.indexOf(r[i])<0&&Object.prototype.propertyIsEnumerable.call(e,r[i])&&(n[r[i]]=e[r[i]]);return n},K2=b.forwardRef(function(e,t){var n=e.chartType,r=n===void 0?"Base":n,i=c1e(e,["chartType"]),a=i.containerStyle,o=a===void 0?{height:"inherit",flex:1}:a,s=i.containerAttributes,l=s===void 0?{}:s,c=i.className,u=i.loading,f=i.loadingTemplate,d=i.errorTemplate,h=c1e(i,["containerStyle","containerAttributes","className","loading","loadingTemplate","errorTemplate"]),p=g2t(Qwt[r],h),v=p.chart,g=p.container;return b.useImperativeHandle(t,function(){return v.current}),we.createElement(pst,{errorTemplate:d},u&&we.createElement(dst,{loadingTemplate:f}),we.createElement("div",j9({className:c,style:o,ref:g},l)))}),D9=function(){return D9=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},D9.apply(this,arguments)},Jwt=b.forwardRef(function(e,t){return we.createElement(K2,D9({},e,{chartType:"Area",ref:t}))}),F9=function(){return F9=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},F9.apply(this,arguments)},eCt=b.forwardRef(function(e,t){return we.createElement(K2,F9({},e,{chartType:"Bar",ref:t}))}),B9=function(){return B9=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},B9.apply(this,arguments)},tCt=b.forwardRef(function(e,t){return we.createElement(K2,B9({},e,{chartType:"Column",ref:t}))}),z9=function(){return z9=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},z9.apply(this,arguments)},nCt=b.forwardRef(function(e,t){return we.createElement(K2,z9({},e,{chartType:"Line",ref:t}))}),H9=function(){return H9=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++){t=arguments[n];for(var i in t)Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i])}return e},H9.apply(this,arguments)},rCt=b.forwardRef(function(e,t){return we.createElement(K2,H9({},e,{chartType:"Pie",ref:t}))});const{useToken:iCt}=$b,aCt=({widget:e})=>{const{t}=io("DashboardWidget"),{token:n}=iCt(),[r,i]=we.useState(),[a,o]=we.useState(),[s,l]=we.useState(),c=Im.stringify({min_x_field:Hb(r),max_x_field:Hb(a),period_x_field:Hb(s)}),{data:u,isLoading:f}=Kc({queryKey:["/dashboard-widget",e.key,c],queryFn:()=>lu(`/dashboard-widget/${e.key}?${c}`),refetchOnWindowFocus:!1});b.useEffect(()=>{u&&(i(Wb(u.min_x_field)),o(Wb(u.max_x_field)),l(Wb(u.period_x_field)))},[u]);const d=b.useCallback((h,p,v,g)=>{if(!h.x_field_filter_widget_type)return null;const[m,y]=J6(h.x_field_filter_widget_type,t),x=S=>{switch(m){case oi:case oi.TextArea:case Dd.Group:g(S.target.value);break;default:g(S);break}};return ve.jsx(m,Rn(Ke(Ke({size:"small",placeholder:p},y||{}),h.x_field_filter_widget_props||{}),{value:v,onChange:x}))},[t]);return ve.jsxs(hm,{title:ve.jsxs(Ri,{justify:"space-between",style:{lineHeight:2},children:[ve.jsx(vr,{children:e.title}),e.x_field_filter_widget_type&&ve.jsx(vr,{children:ve.jsxs(va,{children:[e.x_field_periods&&ve.jsx(no,{allowClear:!0,style:{width:100},options:e.x_field_periods.map(h=>({label:LO(h),value:h})),value:s,onChange:l,size:"small"}),d(e,t("From"),r,i),ve.jsx(zE,{}),d(e,t("To"),a,o)]})})]}),children:[!f&&e.dashboard_widget_type===Nm.ChartLine&&ve.jsx(nCt,Ke({data:(u==null?void 0:u.results)||[],xField:e.x_field,yField:e.y_field,legend:{position:"top-left"},colorField:n.colorPrimary},e.dashboard_widget_props||{})),!f&&e.dashboard_widget_type===Nm.ChartArea&&ve.jsx(Jwt,Ke({data:(u==null?void 0:u.results)||[],xField:e.x_field,yField:e.y_field,legend:{position:"top-left"},colorField:n.colorPrimary},e.dashboard_widget_props||{})),!f&&e.dashboard_widget_type===Nm.ChartColumn&&ve.jsx(tCt,Ke({data:(u==null?void 0:u.results)||[],xField:e.x_field,yField:e.y_field,legend:{position:"top-left"},colorField:n.colorPrimary},e.dashboard_widget_props||{})),!f&&e.dashboard_widget_type===Nm.ChartBar&&ve.jsx(eCt,Ke({data:(u==null?void 0:u.results)||[],xField:e.x_field,yField:e.y_field,legend:{position:"top-left"},colorField:n.colorPrimary},e.dashboard_widget_props||{})),!f&&e.dashboard_widget_type===Nm.ChartPie&&ve.jsx(rCt,Ke({data:(u==null?void 0:u.results)||[],colorField:e.x_field,angleField:e.y_field,legend:{position:"top-left"}},e.dashboard_widget_props||{})),f&&ve.jsx(Ri,{justify:"center",align:"middle",children:ve.jsx(vr,{children:ve.jsx(qE,{})})})]},e.title)},oCt=()=>{const{t:e}=io("Dashboard"),{configuration:t}=b.useContext(Mc);return ve.jsxs(DO,{title:e("Dashboard"),children:[ve.jsx(Ri,{gutter:[16,16],children:t.dashboard_widgets.map(n=>ve.jsx(vr,{xs:24,md:12,children:ve.jsx(aCt,{widget:n})},n.title))}),t.dashboard_widgets.length===0&&ve.jsx(Ba,{})]})},QBk="__bulk_delete__",JBk="bulk-job",ZBk=e=>na.loading({content:`${e.done} / ${e.total}`,key:JBk,duration:0}),zBk=5e3,WBk=1e3,qBk=e=>new Promise(t=>setTimeout(t,e)),GBk=(e,t,n={},r)=>la(this,null,function*(){const i=Math.max(1,Math.ceil(t.length/zBk));let a;for(let s=0;s<i;s++)a=yield gf(e,Rn(Ke({},n),{ids:t.slice(s*zBk,(s+1)*zBk),job_id:a==null?void 0:a.id,final:s===i-1}));let o=a;for(;o.status==="RUNNING";)r==null||r(o),yield qBk(WBk),o=yield lu(`/bulk-job/${o.id}`);if(o.status==="FAILED")throw new Error(o.error||"Bulk job failed");return o}),sCt=()=>{var F,B;const{configuration:e}=b.useContext(Mc),t=Mm(),{t:n}=io("List"),{model:r}=SO(),i=zb(),a=HO(e,r),{defaultPage:o,defaultPageSize:s,page:l,setPage:c,pageSize:u,setPageSize:f,search:d,setSearch:h,filters:p,setFilters:v,sortBy:g,action:m,setAction:y,selectedRowKeys:x,setSelectedRowKeys:S,onTableChange:w,resetTable:C}=yie(a),E=Im.stringify(Ke({search:d,sort_by:g,offset:(l-1)*u,limit:u},nN(p))),{data:O,isLoading:$,refetch:P}=Kc({queryKey:[`/list/${r}`,E],queryFn:()=>lu(`/list/${r}?${E}`),refetchOnWindowFocus:!1}),{mutate:M}=Oo({mutationFn:D=>XA(`/delete/${r}/${D}`),onSuccess:()=>{C(a==null?void 0:a.preserve_filters),P(),na.success(n("Successfully deleted"))},onError:D=>{kc(D)}}),{mutate:k,isPending:T}=Oo({mutationFn:D=>m===QBk?GBk(`/bulk-delete/${r}`,D,{},ZBk):GBk(`/action/${r}/${m}`,D,{},ZBk),onSuccess:()=>{na.destroy(JBk),C(a==null?void 0:a.preserve_filters),P(),na.success(m===QBk?n("Successfully deleted"):n("Successfully applied"))},onError:D=>{na.destroy(JBk),D!=null&&D.response?kc(D):na.error((D==null?void 0:D.message)||n("Server error"))}}),I=b.useMemo(()=>{var D;return[...(a==null?void 0:a.actions)||[],...(D=a==null?void 0:a.permissions)!=null&&D.includes(Ss.Delete)?[{name:QBk,description:n("Delete selected")}]:[]]},[a,n]),R=D=>S(D),A=b.useCallback(()=>k(x),[k,x]),N=b.useCallback(()=>t(`/add/${r}`),[r,t]),L=e==null?void 0:e.datetime_format,j=mie(a,L,b.useCallback(D=>p[D],[p]),b.useCallback((D,z)=>{p[D]=z,v(Ke({},p)),c(o),f(s)},[o,s,p,v,c,f]),b.useCallback(D=>{delete p[D],v(Ke({},p)),c(o),f(s)},[o,s,p,v,c,f]),b.useCallback(D=>{M(D.id)},[M]),b.useCallback(D=>{t(`/change/${r}/${D.id}`)},[r,t]));return ve.jsx(DO,{title:a?ts(a,!0):"",breadcrumbs:ve.jsx(ob,{items:[{title:ve.jsx(Gd,{to:"/",children:n("Dashboard")})},{title:ve.jsx(Gd,{to:`/list/${r}`,children:a&&ts(a)})}]}),viewOnSite:a==null?void 0:a.view_on_site,headerActions:ve.jsxs(Ri,{style:{marginTop:10,marginBottom:10},gutter:[8,8],children:[I.length>0&&(a==null?void 0:a.actions_on_top)&&ve.jsxs(vr,{children:[ve.jsx(no,{placeholder:n("Select Action By"),allowClear:!0,value:m,onChange:y,style:{width:300},children:I.map(D=>ve.jsx(no.Option,{value:D.name,children:D.description||D.name},D.name))}),ve.jsx(Hn,{disabled:!m||x.length===0,style:{marginLeft:5},loading:T,onClick:A,children:n("Apply")})]}),((a==null?void 0:a.search_fields)||[]).length>0&&ve.jsx(vr,{children:ve.jsx(oi.Search,{placeholder:(a==null?void 0:a.search_help_text)||n("Search By"),allowClear:!0,onSearch:h,style:{width:200}})}),((F=a==null?void 0:a.permissions)==null?void 0:F.includes(Ss.Export))&&ve.jsx(vr,{children:ve.jsx(tne,{model:r,search:d,filters:p,sortBy:g})}),((B=a==null?void 0:a.permissions)==null?void 0:B.includes(Ss.Add))&&ve.jsx(vr,{children:ve.jsxs(Hn,{onClick:N,children:[ve.jsx(T5,{})," ",n("Add")]})})]}),bottomActions:I.length>0&&(a==null?void 0:a.actions_on_bottom)&&ve.jsxs("div",{style:{marginTop:i?10:-50},children:[ve.jsx(no,{placeholder:n("Select Action By"),allowClear:!0,value:m,onChange:y,style:{width:200},children:I.map(D=>ve.jsx(no.Option,{value:D.name,children:D.description||D.name},D.name))}),ve.jsx(Hn,{disabled:!m||x.length===0,style:{marginLeft:5},loading:T,onClick:A,children:n("Apply")})]}),children:a?ve.jsx(nne,{loading:$,rowSelection:I.length>0?{selectedRowKeys:x,onChange:R}:void 0,columns:j,onChange:w,rowKey:"id",dataSource:(O==null?void 0:O.results)||[],pagination:Rn(Ke({current:l,pageSize:u},XBk(O)),{showSizeChanger:!0})}):ve.jsx(Ba,{description:n("No permissions for model")})})},lCt=({title:e,children:t})=>{const{signedIn:n}=b.useContext(jO),r=Mm();return b.useEffect(()=>{n&&r("/")},[r,n]),ve.jsxs("div",{style:{height:"100vh"},children:[ve.jsx($A,{defaultTitle:e,children:ve.jsx("meta",{name:"description",content:e})}),ve.jsx(Ri,{justify:"center",align:"middle",style:{height:"100%"},children:ve.jsx(vr,{xs:24,xl:8,children:t})})]})},cCt=()=>{const[e]=Ir.useForm(),{token:{colorPrimary:t}}=$b.useToken(),{configuration:n}=b.useContext(Mc),{signedInUserRefetch:r}=b.useContext(jO),{t:i}=io("SignIn"),{mutate:a,isPending:o}=Oo({mutationFn:l=>gf("/sign-in",l),onSuccess:()=>{r()},onError:l=>{kc(l,e)}}),s=l=>{a(l)};return ve.jsx(lCt,{title:`${i("Sign In")}`,children:ve.jsxs(hm,{children:[ve.jsx(Ri,{justify:"center",children:ve.jsx(vr,{children:ve.jsxs(va,{style:{marginBottom:20},children:[ve.jsx(HE,{src:window.SERVER_DOMAIN+n.site_sign_in_logo,height:80,alt:n.site_name,preview:!1}),ve.jsx("span",{style:{color:t,fontSize:36,fontWeight:600},children:n.site_name})]})})}),ve.jsxs(Ir,{initialValues:{remember:!0},onFinish:s,autoComplete:"off",layout:"vertical",children:[ve.jsx(Ir.Item,{label:LO((n==null?void 0:n.username_field)||"username"),name:"username",rules:[{required:!0}],children:ve.jsx(oi,{})}),ve.jsx(Ir.Item,{label:"Password",name:"password",rules:[{required:!0}],children:ve.jsx(oi.Password,{})}),ve.jsx(Ri,{justify:"end",children:ve.jsx(vr,{children:ve.jsx(Ir.Item,{children:ve.jsx(Hn,{type:"primary",htmlType:"submit",loading:o,children:i("Sign In")})})})})]})]})})},uCt=()=>{const{configuration:e}=b.useContext(Mc),{t}=io("App");return ve.jsxs(Sc,{theme:{token:{colorPrimary:e.primary_color,colorLink:e.primary_color,colorLinkActive:e.primary_color,colorLinkHover:e.primary_color}},form:{validateMessages:{required:t("${label} is required."),types:{email:t("${label} is not valid."),number:t("${label} is not valid.")},number:{range:t("${label} must be between ${min} and ${max}")}}},children:[ve.jsxs($A,{titleTemplate:"FastAPI Admin | %s",defaultTitle:t("FastAPI Admin"),children:[ve.jsx("meta",{name:"description",content:t("FastAPI Admin")}),ve.jsx("link",{rel:"icon",href:window.SERVER_DOMAIN+e.site_favicon})]}),ve.jsxs(_Ve,{children:[ve.jsx(km,{path:"/sign-in",element:ve.jsx(cCt,{})}),ve.jsx(km,{path:"/",element:ve.jsx(oCt,{})}),ve.jsx(km,{path:"/list/:model",element:ve.jsx(sCt,{})}),ve.jsx(km,{path:"/add/:model",element:ve.jsx(lYe,{})}),ve.jsx(km,{path:"/change/:model/:id",element:ve.jsx(cYe,{})})]})]})},fCt=({children:e})=>{var r,i;const{t}=io("ConfigurationProvider"),n=Kc({queryKey:["/configuration"],queryFn:()=>lu("/configuration"),retry:!1,refetchOnWindowFocus:!1});if(n.isLoading)return null;if(n.error){const a=n.error;return ve.jsx(QE,{status:"warning",title:"Invalid configuration. Please check your admin model classes and logs.",extra:ve.jsx(pI,{title:t("Error"),content:((i=(r=a==null?void 0:a.response)==null?void 0:r.data)==null?void 0:i.exception)||(a==null?void 0:a.message),placement:"bottom",trigger:"click",children:ve.jsx(Hn,{type:"primary",children:t("Show Error")},"console")})})}return ve.jsx(Mc.Provider,{value:{configuration:(n==null?void 0:n.data)||Bte},children:e})},dCt=({children:e})=>{const t=Kc({queryKey:["/me"],queryFn:()=>lu("/me"),retry:!1,refetchOnWindowFocus:!1});if(t.isLoading)return null;const n=!!t.isError;return ve.jsx(jO.Provider,{value:{signedInUser:t.data,signedInUserRefetch:t.refetch,signedIn:!n},children:e})},hCt=({children:e})=>ve.jsx(dCt,{children:ve.jsx(fCt,{children:e})}),pCt=({children:e,client:t,i18n:n})=>ve.jsx(RVe,{children:ve.jsx(O2e,{client:t,children:ve.jsx(NWe,{i18n:n,children:ve.jsx(Pee,{children:e})})})}),vCt=new x2e;co.init({interpolation:{escapeValue:!1}});const u1e=document.getElementById("root");if(!u1e)throw new Error("Root element not found");LM.createRoot(u1e).render(ve.jsx(we.StrictMode,{children:ve.jsx(pCt,{client:vCt,locale:_o,i18n:co,children:ve.jsx(hCt,{children:ve.jsx(uCt,{})})})}))});
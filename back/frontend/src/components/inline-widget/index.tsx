@@ -29,6 +29,7 @@ import {
   postFetcher,
 } from "@/fetchers/fetchers";
 import { handleError } from "@/helpers/forms";
+import { getPaginationTotal } from "@/helpers/pagination";
 import { getTitleFromModel } from "@/helpers/title";
 import {
   transformDataFromServer,
@@ -429,7 +430,7 @@ export const InlineWidget: React.FC<IInlineWidget> = ({
               pagination={{
                 current: page,
                 pageSize,
-                total: data?.total,
+                ...getPaginationTotal(data),
                 showSizeChanger: true,
               }}
               scroll={{ x: 1000 }}
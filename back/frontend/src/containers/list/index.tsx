@@ -12,7 +12,7 @@ import {
 } from "antd";
 import querystring from "query-string";
 import type React from "react";
-import { useCallback, useContext } from "react";
+import { useCallback, useContext, useMemo } from "react";
 import { useTranslation } from "react-i18next";
 import { Link, useNavigate, useParams } from "react-router-dom";
 
@@ -25,15 +25,28 @@ import { ConfigurationContext } from "@/providers/ConfigurationProvider";
 
 import { ExportBtn } from "@/components/export-btn";
 import { TableOrCards } from "@/components/table-or-cards";
-import { deleteFetcher, getFetcher, postFetcher } from "@/fetchers/fetchers";
+import { deleteFetcher, getFetcher } from "@/fetchers/fetchers";
+import { type IBulkJob, runBulkJob } from "@/helpers/bulk";
 import { getConfigurationModel } from "@/helpers/configuration";
 import { handleError } from "@/helpers/forms";
+import { getPaginationTotal } from "@/helpers/pagination";
 import { getTitleFromModel } from "@/helpers/title";
 import { transformFiltersToServer } from "@/helpers/transform";
 import { useIsMobile } from "@/hooks/useIsMobile";
 import { useTableColumns } from "@/hooks/useTableColumns";
 import { useTableQuery } from "@/hooks/useTableQuery";
 
+// a built-in action of the list, it deletes the selected rows with bulk delete
+const BULK_DELETE_ACTION = "__bulk_delete__";
+const BULK_MESSAGE_KEY = "bulk-job";
+
+const onBulkProgress = (job: IBulkJob) =>
+  message.loading({
+    content: `${job.done} / ${job.total}`,
+    key: BULK_MESSAGE_KEY,
+    duration: 0,
+  });
+
 export const List: React.FC = () => {
   const { configuration } = useContext(ConfigurationContext);
   const navigate = useNavigate();
@@ -93,21 +106,43 @@ export const List: React.FC = () => {
   });
 
   const { mutate: mutateAction, isPending: isLoadingAction } = useMutation({
-    mutationFn: (payload: any) =>
-      postFetcher(`/action/${model}/${action}`, payload),
+    mutationFn: (ids: string[]) =>
+      action === BULK_DELETE_ACTION
+        ? runBulkJob(`/bulk-delete/${model}`, ids, {}, onBulkProgress)
+        : runBulkJob(`/action/${model}/${action}`, ids, {}, onBulkProgress),
     onSuccess: () => {
+      message.destroy(BULK_MESSAGE_KEY);
       resetTable(modelConfiguration?.preserve_filters);
       refetch();
-      message.success(_t("Successfully applied"));
+      message.success(
+        action === BULK_DELETE_ACTION
+          ? _t("Successfully deleted")
+          : _t("Successfully applied"),
+      );
     },
-    onError: () => {
-      message.error(_t("Server error"));
+    onError: (error: any) => {
+      message.destroy(BULK_MESSAGE_KEY);
+      if (error?.response) {
+        handleError(error);
+      } else {
+        message.error(error?.message || _t("Server error"));
+      }
     },
   });
 
+  const actions: IModelAction[] = useMemo(
+    () => [
+      ...(modelConfiguration?.actions || []),
+      ...(modelConfiguration?.permissions?.includes(EModelPermission.Delete)
+        ? [{ name: BULK_DELETE_ACTION, description: _t("Delete selected") }]
+        : []),
+    ],
+    [modelConfiguration, _t],
+  );
+
   const onSelectRow = (v: string[]) => setSelectedRowKeys(v);
   const onApplyAction = useCallback(
-    () => mutateAction({ ids: selectedRowKeys }),
+    () => mutateAction(selectedRowKeys),
     [mutateAction, selectedRowKeys],
   );
 
@@ -181,34 +216,31 @@ export const List: React.FC = () => {
       viewOnSite={modelConfiguration?.view_on_site}
       headerActions={
         <Row style={{ marginTop: 10, marginBottom: 10 }} gutter={[8, 8]}>
-          {(modelConfiguration?.actions || []).length > 0 &&
-            modelConfiguration?.actions_on_top && (
-              <Col>
-                <Select
-                  placeholder={_t("Select Action By") as string}
-                  allowClear={true}
-                  value={action}
-                  onChange={setAction}
-                  style={{ width: 300 }}
-                >
-                  {(modelConfiguration?.actions || []).map(
-                    (a: IModelAction) => (
-                      <Select.Option key={a.name} value={a.name}>
-                        {a.description || a.name}
-                      </Select.Option>
-                    ),
-                  )}
-                </Select>
-                <Button
-                  disabled={!action || selectedRowKeys.length === 0}
-                  style={{ marginLeft: 5 }}
-                  loading={isLoadingAction}
-                  onClick={onApplyAction}
-                >
-                  {_t("Apply")}
-                </Button>
-              </Col>
-            )}
+          {actions.length > 0 && modelConfiguration?.actions_on_top && (
+            <Col>
+              <Select
+                placeholder={_t("Select Action By") as string}
+                allowClear={true}
+                value={action}
+                onChange={setAction}
+                style={{ width: 300 }}
+              >
+                {actions.map((a: IModelAction) => (
+                  <Select.Option key={a.name} value={a.name}>
+                    {a.description || a.name}
+                  </Select.Option>
+                ))}
+              </Select>
+              <Button
+                disabled={!action || selectedRowKeys.length === 0}
+                style={{ marginLeft: 5 }}
+                loading={isLoadingAction}
+                onClick={onApplyAction}
+              >
+                {_t("Apply")}
+              </Button>
+            </Col>
+          )}
           {(modelConfiguration?.search_fields || []).length > 0 && (
             <Col>
               <Input.Search
@@ -244,7 +276,7 @@ export const List: React.FC = () => {
         </Row>
       }
       bottomActions={
-        (modelConfiguration?.actions || []).length > 0 &&
+        actions.length > 0 &&
         modelConfiguration?.actions_on_bottom && (
           <div style={{ marginTop: isMobile ? 10 : -50 }}>
             <Select
@@ -254,7 +286,7 @@ export const List: React.FC = () => {
               onChange={setAction}
               style={{ width: 200 }}
             >
-              {(modelConfiguration?.actions || []).map((a: IModelAction) => (
+              {actions.map((a: IModelAction) => (
                 <Select.Option key={a.name} value={a.name}>
                   {a.description || a.name}
                 </Select.Option>
@@ -276,7 +308,7 @@ export const List: React.FC = () => {
         <TableOrCards
           loading={isLoading}
           rowSelection={
-            (modelConfiguration?.actions || []).length > 0
+            actions.length > 0
               ? {
                   selectedRowKeys,
                   onChange: onSelectRow as any,
@@ -290,7 +322,7 @@ export const List: React.FC = () => {
           pagination={{
             current: page,
             pageSize,
-            total: data?.total,
+            ...getPaginationTotal(data),
             showSizeChanger: true,
           }}
         />
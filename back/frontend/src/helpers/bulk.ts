@@ -0,0 +1,52 @@
+import { getFetcher, postFetcher } from "@/fetchers/fetchers";
+
+// ids are sent in parts, so selecting many rows doesn't make one huge request
+const BULK_IDS_PART_SIZE = 5000;
+const BULK_JOB_POLL_INTERVAL = 1000;
+
+export enum EBulkJobStatus {
+  Receiving = "RECEIVING",
+  Running = "RUNNING",
+  Done = "DONE",
+  Failed = "FAILED",
+}
+
+export interface IBulkJob {
+  id: string;
+  status: EBulkJobStatus;
+  total: number;
+  done: number;
+  error?: string | null;
+}
+
+const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms));
+
+export const runBulkJob = async (
+  url: string,
+  ids: (string | number)[],
+  payload: Record<string, any> = {},
+  onProgress?: (job: IBulkJob) => void,
+): Promise<IBulkJob> => {
+  const parts = Math.max(1, Math.ceil(ids.length / BULK_IDS_PART_SIZE));
+  let job: IBulkJob | undefined;
+  for (let part = 0; part < parts; part++) {
+    job = (await postFetcher(url, {
+      ...payload,
+      ids: ids.slice(part * BULK_IDS_PART_SIZE, (part + 1) * BULK_IDS_PART_SIZE),
+      job_id: job?.id,
+      final: part === parts - 1,
+    })) as IBulkJob;
+  }
+
+  // big jobs run in background on the server, poll them until they finish
+  let result = job as IBulkJob;
+  while (result.status === EBulkJobStatus.Running) {
+    onProgress?.(result);
+    await sleep(BULK_JOB_POLL_INTERVAL);
+    result = await getFetcher(`/bulk-job/${result.id}`);
+  }
+  if (result.status === EBulkJobStatus.Failed) {
+    throw new Error(result.error || "Bulk job failed");
+  }
+  return result;
+};
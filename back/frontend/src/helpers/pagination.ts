@@ -0,0 +1,18 @@
+const compactNumber = new Intl.NumberFormat("en", {
+  notation: "compact",
+  maximumFractionDigits: 1,
+});
+
+export interface IListTotal {
+  total?: number;
+  total_is_estimate?: boolean;
+}
+
+// estimated totals come from the planner, so show them rounded like "~5.1M"
+export const formatApproximateTotal = (total: number) =>
+  `~${compactNumber.format(total)}`;
+
+export const getPaginationTotal = (data?: IListTotal) => ({
+  total: data?.total,
+  showTotal: data?.total_is_estimate ? formatApproximateTotal : undefined,
+});
@@ -0,0 +1,106 @@
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+import bcrypt
+
+from config import config
+
+
+class HashingPoolSaturated(Exception):
+    """All hashing workers are busy and the queue is full, handlers answer it with 503."""
+
+
+def _hash_password(password: bytes) -> bytes:
+    return bcrypt.hashpw(password, bcrypt.gensalt())
+
+
+def _check_password(password: bytes, password_hash: bytes) -> bool:
+    return bcrypt.checkpw(password, password_hash)
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt in a dedicated executor so hashing doesn't block the event loop.
+
+    A thread pool is enough since bcrypt releases the GIL, a process pool is also supported.
+    At most `workers + max_queue` calls are accepted at once, the rest are rejected with HashingPoolSaturated.
+    """
+
+    def __init__(self, kind: str = "thread", workers: int = 4, max_queue: int = 64):
+        self.kind = kind
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor: Executor | None = None
+
+        self.in_flight = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bcrypt")
+        return self._executor
+
+    async def _run(self, fn, *args):
+        if self.in_flight >= self.workers + self.max_queue:
+            self.rejected += 1
+            raise HashingPoolSaturated()
+
+        self.in_flight += 1
+        self.submitted += 1
+        started = time.perf_counter()
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.in_flight -= 1
+            elapsed = time.perf_counter() - started
+            self.total_seconds += elapsed
+            self.max_seconds = max(self.max_seconds, elapsed)
+        self.completed += 1
+        return result
+
+    async def hash(self, password: str) -> str:
+        return (await self._run(_hash_password, password.encode())).decode()
+
+    async def verify(self, password: str, password_hash: str) -> bool:
+        return await self._run(_check_password, password.encode(), password_hash.encode())
+
+    def stats(self) -> dict:
+        finished = self.completed + self.failed
+        return {
+            "executor": self.kind,
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "queued": max(self.in_flight - self.workers, 0),
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "avg_seconds": self.total_seconds / finished if finished else 0.0,
+            "max_seconds": self.max_seconds,
+        }
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    kind=config.HASHING_EXECUTOR,
+    workers=config.HASHING_WORKERS,
+    max_queue=config.HASHING_MAX_QUEUE,
+)
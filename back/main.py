@@ -6,16 +6,26 @@ from fastapi.middleware.cors import CORSMiddleware
 import admin  # to load admin models
 import config  # to load environment vars
 from auth_api import router as auth_router
+from db_pool import warm_up_pool
+from db_routing import REPLICA, replica_name
 from fastadmin.api.frameworks.fastapi.app import app as admin_app
+from hashing import password_hasher
+from main_api import comment_writer
 from main_api import router as main_router
+from metrics_api import router as metrics_router
 from models import init
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):  # fastapi calls this async manager twice
     await init()  # on startup
+    await warm_up_pool()
+    if replica_name():
+        await warm_up_pool(REPLICA)
     yield
     # on shutdown
+    await comment_writer.drain()  # write buffered comments before exiting
+    password_hasher.shutdown()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -26,8 +36,10 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
 
 app.mount("/admin", admin_app)
 app.include_router(auth_router, prefix="/api")
 app.include_router(main_router, prefix="/api")
+app.include_router(metrics_router, prefix="/api")
@@ -1,174 +1,394 @@
-from typing import Annotated
+from datetime import datetime
+from typing import Annotated, Literal
 
-from fastapi import APIRouter, Header, Query, Response, status
-from tortoise.exceptions import DoesNotExist
+from fastapi import APIRouter, Depends, Header, Query, Response, status
+from tortoise import timezone
+from tortoise.exceptions import DoesNotExist, IntegrityError
+from tortoise.expressions import Expression, F, Q, RawSQL, ResolveResult
+from tortoise.transactions import in_transaction
 
 from api_pydantic_schemas import (
     CommentCreate,
     CommentCreateResponse,
     CommentGetResponse,
-    CommentSchema,
     FlowerSchema,
     FlowersGetResponse,
+    OrderBatchCreate,
+    OrderBatchCreateResponse,
+    OrderBatchLineResult,
     OrderCreate,
     OrderCreateResponse,
     OrderDeleteResponse,
     OrderGetResponse,
-    OrderSchema,
     OrderUpdateData,
 )
-from models import Comment, Flower, Order, User
+from catalog_cache import catalog_cache, etag_matches, render_json
+from comment_queue import CommentWriter
+from config import config
+from db_routing import PRIMARY, pin_to_primary, read_db
+from dependencies import UserRecord, current_user
+from models import Comment, Flower, Order
+from pagination import decode_cursor, encode_cursor
+from ttl_cache import TTLCache
 
 router = APIRouter()
 
+FLOWER_FIELDS = tuple(FlowerSchema.model_fields)
+ORDER_COLUMNS = ("id", "status", "amount", "quantity", *(f"flower__{field}" for field in FLOWER_FIELDS))
+
+# rendered first pages of the comments feed, by limit
+comments_cache = TTLCache(maxsize=16, ttl=config.COMMENTS_CACHE_TTL)
+comment_writer = CommentWriter(
+    batch_size=config.COMMENTS_BATCH_SIZE,
+    flush_interval=config.COMMENTS_FLUSH_INTERVAL,
+    max_queue=config.COMMENTS_QUEUE_SIZE,
+    on_flush=comments_cache.clear,
+)
+
+
+class OrderAmount(Expression):
+    """`quantity * flower.price` as a correlated subquery, so an UPDATE of order doesn't need the flower loaded."""
+
+    def __init__(self, quantity: int):
+        self.quantity = int(quantity)
+
+    def resolve(self, resolve_context) -> ResolveResult:
+        return ResolveResult(
+            term=RawSQL(
+                f'{self.quantity} * (SELECT "price" FROM "{Flower._meta.db_table}" '
+                f'WHERE "id" = "{Order._meta.db_table}"."flower_id")'
+            )
+        )
+
 
 @router.get("/flowers", response_model=FlowersGetResponse, status_code=status.HTTP_200_OK)
-async def flowers(category: str | None = Query(default=None)):
-    if category:
-        flowers = await Flower.filter(category=category).values()
-    else:
-        flowers = await Flower.all().values()
+async def flowers(
+    category: Flower.FlowerCategory | None = Query(default=None),
+    type: Flower.FlowerType | None = Query(default=None),
+    min_price: float | None = Query(default=None, ge=0),
+    max_price: float | None = Query(default=None, ge=0),
+    order_by: Literal["id", "price"] = Query(default="id"),
+    limit: int | None = Query(default=None, ge=1, le=100),
+    cursor: str | None = Query(default=None),
+    fields: str | None = Query(default=None, description="Comma separated flower fields to return"),
+    if_none_match: Annotated[str | None, Header()] = None,
+):
+    if type or min_price is not None or max_price is not None or order_by != "id" or limit or cursor or fields:
+        return await query_flowers(category, type, min_price, max_price, order_by, limit, cursor, fields)
 
-    return {"success": True, "data": [FlowerSchema.model_validate(f) for f in flowers], "message": ""}
+    snapshot = await catalog_cache.get(category)
+    headers = {"ETag": snapshot.etag, "Cache-Control": "no-cache"}
+    if etag_matches(if_none_match, snapshot.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    # snapshot body is already rendered, returning a response directly skips response_model validation
+    return Response(content=snapshot.body, media_type="application/json", headers=headers)
 
 
-@router.get("/orders", response_model=OrderGetResponse, status_code=status.HTTP_200_OK)
-async def user_orders(token: Annotated[str | None, Header()], response: Response):
-    try:
-        user = await User.get(token=token)
-        orders = await Order.filter(user=user).prefetch_related(
-            "flower"
-        )  # to fetch flower data, without it flower will be as queryset
-        order_list = [
-            OrderSchema(
-                id=order.id,
-                status=order.status,
-                amount=float(order.amount),
-                flower=FlowerSchema(
-                    id=order.flower.id,
-                    name=order.flower.name,
-                    price=order.flower.price,
-                    type=order.flower.type,
-                    category=order.flower.category,
-                    img_link=order.flower.img_link,
-                ),
-                quantity=order.quantity,
+async def query_flowers(
+    category: Flower.FlowerCategory | None,
+    type: Flower.FlowerType | None,
+    min_price: float | None,
+    max_price: float | None,
+    order_by: str,
+    limit: int | None,
+    cursor: str | None,
+    fields: str | None,
+) -> Response:
+    """Filtered / paginated catalog page, queried directly with keyset pagination on (id) or (price, id)."""
+    keyset = ("price", "id") if order_by == "price" else ("id",)
+
+    columns = list(FLOWER_FIELDS)
+    if fields:
+        columns = [f.strip() for f in fields.split(",") if f.strip()]
+        if not set(columns) <= set(FLOWER_FIELDS):
+            return Response(
+                content=render_json({"success": False, "data": [], "message": "Error. Unknown flower fields."}),
+                status_code=status.HTTP_400_BAD_REQUEST,
+                media_type="application/json",
             )
-            for order in orders
-        ]
+    # keyset columns are needed to build the next cursor
+    columns += [k for k in keyset if k not in columns]
 
-        return {"success": True, "data": order_list, "message": ""}
-    except DoesNotExist:
+    qs = Flower.all().using_db(read_db())
+    if category:
+        qs = qs.filter(category=category)
+    if type:
+        qs = qs.filter(type=type)
+    if min_price is not None:
+        qs = qs.filter(price__gte=min_price)
+    if max_price is not None:
+        qs = qs.filter(price__lte=max_price)
+
+    if cursor:
+        try:
+            last = decode_cursor(cursor, len(keyset))
+        except ValueError:
+            return Response(
+                content=render_json({"success": False, "data": [], "message": "Error. Invalid cursor."}),
+                status_code=status.HTTP_400_BAD_REQUEST,
+                media_type="application/json",
+            )
+        if order_by == "price":
+            qs = qs.filter(Q(price__gt=last[0]) | Q(price=last[0], id__gt=last[1]))
+        else:
+            qs = qs.filter(id__gt=last[0])
+
+    qs = qs.order_by(*keyset)
+    if limit:
+        qs = qs.limit(limit + 1)  # one extra row tells if there is a next page
+    rows = await qs.values(*columns)
+
+    next_cursor = None
+    if limit and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor([rows[-1][k] for k in keyset])
+
+    for row in rows:
+        if "price" in row:
+            row["price"] = float(row["price"])
+
+    return Response(
+        content=render_json({"success": True, "data": rows, "message": "", "next_cursor": next_cursor}),
+        media_type="application/json",
+    )
+
+
+@router.get("/orders", response_model=OrderGetResponse, status_code=status.HTTP_200_OK)
+async def user_orders(
+    user: Annotated[UserRecord | None, Depends(current_user)],
+    response: Response,
+    limit: int | None = Query(default=None, ge=1, le=500),
+    before_id: int | None = Query(default=None, ge=1),
+):
+    """Orders of the user, newest first. With `limit` the response has `next_before_id` for the next page."""
+    if user is None:
         response.status_code = status.HTTP_403_FORBIDDEN
         return {"success": False, "data": [], "message": "Error. Incorrect token."}
 
+    qs = Order.filter(user_id=user.id).using_db(read_db(sticky_key=user.id))
+    if before_id:
+        qs = qs.filter(id__lt=before_id)
+    qs = qs.order_by("-id")
+    if limit:
+        qs = qs.limit(limit + 1)  # one extra row tells if there is a next page
+    rows = await qs.values(*ORDER_COLUMNS)
+
+    next_before_id = None
+    if limit and len(rows) > limit:
+        rows = rows[:limit]
+        next_before_id = rows[-1]["id"]
+
+    # joined columns are shaped into OrderSchema by hand and rendered straight to bytes,
+    # returning a response directly skips response_model validation
+    data = [
+        {
+            "id": row["id"],
+            "status": row["status"],
+            "amount": row["amount"],
+            "flower": {field: row[f"flower__{field}"] for field in FLOWER_FIELDS},
+            "quantity": row["quantity"],
+        }
+        for row in rows
+    ]
+    return Response(
+        content=render_json({"success": True, "data": data, "message": "", "next_before_id": next_before_id}),
+        media_type="application/json",
+    )
+
+
+async def add_to_pending_order(user_id: int, flower: Flower, quantity: int):
+    """
+    Add quantity to the user's pending order of the flower, or create it.
+
+    The increment is done by the database, and the unique partial index on pending (user_id, flower_id)
+    makes a concurrent second insert fail, so it falls back to the increment instead of duplicating the order.
+    """
+    pin_to_primary(user_id)
+    pending_order = Order.filter(user_id=user_id, flower_id=flower.id, status=Order.STATUSES.pending)
+    increment = {"quantity": F("quantity") + quantity, "amount": F("amount") + quantity * flower.price}
+
+    if await pending_order.update(**increment):
+        return
+    try:
+        async with in_transaction(PRIMARY):  # a savepoint if called inside a transaction, so the failed insert doesn't abort it
+            await Order.create(user_id=user_id, flower_id=flower.id, quantity=quantity, amount=quantity * flower.price)
+    except IntegrityError:
+        await pending_order.update(**increment)
+
 
 @router.post("/orders", response_model=OrderCreateResponse, status_code=status.HTTP_200_OK)
-async def create_order(order_data: OrderCreate, token: Annotated[str | None, Header()], response: Response):
+async def create_order(
+    order_data: OrderCreate, user: Annotated[UserRecord | None, Depends(current_user)], response: Response
+):
+    if user is None:
+        response.status_code = status.HTTP_403_FORBIDDEN
+        return {"success": False, "message": "Error. Incorrect token."}
+
     try:
-        user = await User.get(token=token)
-        try:
-            flower = await Flower.get(name=order_data.flower_name)
-            user_old_orders = await Order.filter(user=user, flower=flower)
-            user_old_pending_orders = [order for order in user_old_orders if order.status == "Pending"]
-            if user_old_pending_orders:
-                user_old_pending_order = user_old_pending_orders[0]
-                user_old_pending_order.quantity += 1
-                user_old_pending_order.amount = user_old_pending_order.quantity * flower.price
-                await user_old_pending_order.save()
-            else:
-                await Order.create(
-                    user=user, flower=flower, quantity=order_data.quantity, amount=order_data.quantity * flower.price
-                )
-            return {"success": True, "message": ""}
-        except DoesNotExist:
-            response.status_code = status.HTTP_403_FORBIDDEN
-            return {"success": False, "message": "Error. There is no that flower."}
+        flower = await Flower.get(name=order_data.flower_name)
+        await add_to_pending_order(user.id, flower, order_data.quantity)
+        return {"success": True, "message": ""}
     except DoesNotExist:
         response.status_code = status.HTTP_403_FORBIDDEN
-        return {"success": False, "message": "Error. Incorrect token."}
+        return {"success": False, "message": "Error. There is no that flower."}
+
+
+@router.post("/orders/batch", response_model=OrderBatchCreateResponse, status_code=status.HTTP_200_OK)
+async def create_orders_batch(
+    batch: OrderBatchCreate, user: Annotated[UserRecord | None, Depends(current_user)], response: Response
+):
+    if user is None:
+        response.status_code = status.HTTP_403_FORBIDDEN
+        return {"success": False, "data": [], "message": "Error. Incorrect token."}
+
+    flower_names = {item.flower_name for item in batch.items}
+    flowers = {flower.name: flower for flower in await Flower.filter(name__in=flower_names).only("id", "name", "price")}
+
+    results = []
+    async with in_transaction(PRIMARY):
+        for item in batch.items:
+            flower = flowers.get(item.flower_name)
+            if flower is None:
+                results.append(
+                    OrderBatchLineResult(
+                        flower_name=item.flower_name, success=False, message="Error. There is no that flower."
+                    )
+                )
+                continue
+            await add_to_pending_order(user.id, flower, item.quantity)
+            results.append(OrderBatchLineResult(flower_name=item.flower_name, success=True, message=""))
+
+    return {"success": all(result.success for result in results), "data": results, "message": ""}
 
 
 @router.put("/orders/{order_id}", response_model=OrderCreateResponse, status_code=status.HTTP_200_OK)
 async def update_orders(
     order_id: int,
     update_data: OrderUpdateData,
-    token: Annotated[str | None, Header()] = None,
+    user: Annotated[UserRecord | None, Depends(current_user)],
     response: Response = None,
 ):
-    try:
-        user = await User.get(token=token)
-        orders = await Order.filter(user=user, id=order_id)
-
-        if not orders:
-            response.status_code = status.HTTP_404_NOT_FOUND
-            return {"success": False, "message": "Orders not found."}
-
-        for order in orders:
-            if update_data.status:
-                if update_data.status not in [s.value for s in Order.STATUSES]:
-                    response.status_code = status.HTTP_400_BAD_REQUEST
-                    return {"success": False, "message": "Invalid status value."}
-                order.status = update_data.status
-
-            if update_data.quantity is not None:
-                if update_data.quantity <= 0:
-                    response.status_code = status.HTTP_400_BAD_REQUEST
-                    return {"success": False, "message": "Quantity must be greater than 0."}
-                flower = await order.flower.first()
-                order.quantity = update_data.quantity
-                order.amount = update_data.quantity * flower.price
-
-            await order.save()
-
-        return {"success": True, "message": ""}
-    except DoesNotExist:
+    if user is None:
         response.status_code = status.HTTP_403_FORBIDDEN
         return {"success": False, "message": "Error. Incorrect token."}
 
+    values = {}
+    error = None
+    if update_data.status:
+        if update_data.status in [s.value for s in Order.STATUSES]:
+            values["status"] = update_data.status
+        else:
+            error = "Invalid status value."
 
-@router.delete("/orders/{order_id}", response_model=OrderDeleteResponse, status_code=status.HTTP_200_OK)
-async def delete_order(order_id: int, token: Annotated[str | None, Header()] = None, response: Response = None):
-    try:
-        user = await User.get(token=token)
-        orders = await Order.filter(user=user, id=order_id)
+    if update_data.quantity is not None and error is None:
+        if update_data.quantity > 0:
+            values["quantity"] = update_data.quantity
+            values["amount"] = OrderAmount(update_data.quantity)
+        else:
+            error = "Quantity must be greater than 0."
 
-        if not orders:
-            response.status_code = status.HTTP_404_NOT_FOUND
-            return {"success": False, "message": "No orders found for given IDs."}
+    pin_to_primary(user.id)
+    orders = Order.filter(user_id=user.id, id=order_id)
+    if error or not values:
+        # a missing order is reported before a bad body, only a valid update goes straight to the UPDATE
+        updated = await orders.exists()
+    else:
+        try:
+            updated = await orders.update(**values, modified_at=timezone.now())
+        except IntegrityError:  # back to Pending while another pending order of that flower is in the cart
+            response.status_code = status.HTTP_409_CONFLICT
+            return {"success": False, "message": "Error. There is already a pending order of that flower."}
 
-        await Order.filter(user=user, id=order_id).delete()
+    if not updated:
+        response.status_code = status.HTTP_404_NOT_FOUND
+        return {"success": False, "message": "Orders not found."}
 
-        return {"success": True, "message": ""}
+    if error:
+        response.status_code = status.HTTP_400_BAD_REQUEST
+        return {"success": False, "message": error}
 
-    except DoesNotExist:
+    return {"success": True, "message": ""}
+
+
+@router.delete("/orders/{order_id}", response_model=OrderDeleteResponse, status_code=status.HTTP_200_OK)
+async def delete_order(
+    order_id: int, user: Annotated[UserRecord | None, Depends(current_user)], response: Response = None
+):
+    if user is None:
         response.status_code = status.HTTP_403_FORBIDDEN
         return {"success": False, "message": "Error. Incorrect token."}
 
+    pin_to_primary(user.id)
+    deleted = await Order.filter(user_id=user.id, id=order_id).delete()
+
+    if not deleted:
+        response.status_code = status.HTTP_404_NOT_FOUND
+        return {"success": False, "message": "No orders found for given IDs."}
+
+    return {"success": True, "message": ""}
+
 
 @router.get("/comments", response_model=CommentGetResponse, status_code=status.HTTP_200_OK)
-async def get_comments(response: Response):
+async def get_comments(
+    response: Response,
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = Query(default=None),
+):
+    """Comments feed, newest first, keyset paginated on (created_at, id). The first page is cached for a few seconds."""
+    if cursor is None:
+        body = comments_cache.get(limit)
+        if body is not None:
+            return Response(content=body, media_type="application/json")
+
+    # next pages go to the replica, the first page is cached so it's read from the primary to not cache a lagging page
+    qs = Comment.all().using_db(read_db()) if cursor else Comment.all()
+    if cursor:
+        try:
+            created_at, last_id = decode_cursor(cursor, 2)
+            created_at = datetime.fromisoformat(created_at)
+        except (ValueError, TypeError):
+            response.status_code = status.HTTP_400_BAD_REQUEST
+            return {"success": False, "data": [], "message": "Error. Invalid cursor."}
+        qs = qs.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=last_id))
+
     try:
-        comments = await Comment.all().prefetch_related("user")
-        comments_list = [
-            CommentSchema(id=comment.id, text=comment.text, username=comment.user.username) for comment in comments
-        ]
-        return {"success": True, "data": comments_list, "message": ""}
+        # one joined query, only the username is read from the user table
+        rows = await qs.order_by("-created_at", "-id").limit(limit + 1).values(
+            "id", "text", "created_at", username="user__username"
+        )
     except Exception as ex:
         print(ex)
         response.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
         return {"success": False, "data": [], "message": "Error. Internal server error."}
 
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor([rows[-1]["created_at"].isoformat(), rows[-1]["id"]])
+
+    data = [{"id": row["id"], "text": row["text"], "username": row["username"]} for row in rows]
+    body = render_json({"success": True, "data": data, "message": "", "next_cursor": next_cursor})
+    if cursor is None:
+        comments_cache.set(limit, body)
+    return Response(content=body, media_type="application/json")
+
 
 @router.post("/comments", response_model=CommentCreateResponse, status_code=status.HTTP_200_OK)
-async def create_comment(comment_data: CommentCreate, token: Annotated[str | None, Header()], response: Response):
-    try:
-        user = await User.get(token=token)
-        await Comment.create(
-            text=comment_data.text,
-            user=user,
-        )
-        return {"success": True, "message": ""}
-    except DoesNotExist:
+async def create_comment(
+    comment_data: CommentCreate, user: Annotated[UserRecord | None, Depends(current_user)], response: Response
+):
+    if user is None:
         response.status_code = status.HTTP_403_FORBIDDEN
         return {"success": False, "message": "Error. Incorrect token."}
+
+    if config.COMMENTS_INGEST_MODE == "buffered":
+        # accepted now, written with the next batch
+        await comment_writer.submit(comment_data.text, user.id)
+        return {"success": True, "message": ""}
+
+    await Comment.create(
+        text=comment_data.text,
+        user_id=user.id,
+    )
+    comments_cache.clear()
+    return {"success": True, "message": ""}
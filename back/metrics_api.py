@@ -0,0 +1,21 @@
+from fastapi import APIRouter, status
+
+from db_pool import pool_stats
+from db_routing import REPLICA, replica_name
+from dependencies import bad_token_cache, token_cache
+from hashing import password_hasher
+from main_api import comment_writer
+
+router = APIRouter()
+
+
+@router.get("/metrics", status_code=status.HTTP_200_OK)
+async def metrics():
+    return {
+        "hashing": password_hasher.stats(),
+        "token_cache": token_cache.stats(),
+        "bad_token_cache": bad_token_cache.stats(),
+        "comment_writer": comment_writer.stats(),
+        "db_pool": pool_stats(),
+        "db_replica_pool": pool_stats(REPLICA) if replica_name() else None,
+    }
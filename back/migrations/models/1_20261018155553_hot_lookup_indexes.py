@@ -0,0 +1,41 @@
+from tortoise import BaseDBAsyncClient
+
+# Written by hand: aerich loads UniquePartialIndex back as a plain Index, so an autogenerated
+# migration would create idx_order_pending_user_flower without UNIQUE.
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_user_token_feec3b" ON "user" ("token");
+        CREATE INDEX IF NOT EXISTS "idx_flower_categor_ca0988" ON "flower" ("category");
+        CREATE INDEX IF NOT EXISTS "idx_order_user_flower_status" ON "order" ("user_id", "flower_id", "status");
+        -- the cart used to allow several pending orders of a flower: merge them into the oldest one
+        UPDATE "order" SET
+            "quantity" = (
+                SELECT SUM("o"."quantity") FROM "order" "o"
+                WHERE "o"."user_id" = "order"."user_id" AND "o"."flower_id" = "order"."flower_id"
+                    AND "o"."status" = 'Pending'
+            ),
+            "amount" = (
+                SELECT SUM("o"."amount") FROM "order" "o"
+                WHERE "o"."user_id" = "order"."user_id" AND "o"."flower_id" = "order"."flower_id"
+                    AND "o"."status" = 'Pending'
+            )
+        WHERE "id" IN (
+            SELECT MIN("id") FROM "order" WHERE "status" = 'Pending'
+            GROUP BY "user_id", "flower_id" HAVING COUNT(*) > 1
+        );
+        DELETE FROM "order" WHERE "status" = 'Pending' AND "id" NOT IN (
+            SELECT MIN("id") FROM "order" WHERE "status" = 'Pending' GROUP BY "user_id", "flower_id"
+        );
+        -- replaces a non-unique index of the same name created by an autogenerated migration
+        DROP INDEX IF EXISTS "idx_order_pending_user_flower";
+        CREATE UNIQUE INDEX "idx_order_pending_user_flower" ON "order" ("user_id", "flower_id") WHERE status = 'Pending';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_order_pending_user_flower";
+        DROP INDEX IF EXISTS "idx_order_user_flower_status";
+        DROP INDEX IF EXISTS "idx_flower_categor_ca0988";
+        DROP INDEX IF EXISTS "idx_user_token_feec3b";"""
@@ -1,21 +1,27 @@
 import re
 from enum import Enum
 
-import bcrypt
 from tortoise import Tortoise, fields, models
+from tortoise.indexes import Index, PartialIndex
 from tortoise.validators import RegexValidator
 
 from config import config as project_config
+from hashing import password_hasher
 
 EMAIL_REGEX = r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$"
 
 
+class UniquePartialIndex(PartialIndex):
+    def get_sql(self, schema_generator, model, safe) -> str:
+        return super().get_sql(schema_generator, model, safe).replace("CREATE INDEX", "CREATE UNIQUE INDEX", 1)
+
+
 class User(models.Model):
     id = fields.IntField(primary_key=True)
     username = fields.CharField(max_length=20, unique=True)
     email = fields.CharField(max_length=50, unique=True, validators=[RegexValidator(EMAIL_REGEX, re.I)])
     password_hash = fields.CharField(max_length=128, null=True)
-    token = fields.CharField(max_length=128, default="")
+    token = fields.CharField(max_length=128, default="", db_index=True)
 
     is_superuser = fields.BooleanField(default=False)
     is_active = fields.BooleanField(default=False)
@@ -56,7 +62,9 @@ class Flower(models.Model):
     name = fields.CharField(max_length=20, unique=True)
     price = fields.DecimalField(max_digits=5, decimal_places=2, default=0.0)
     type = fields.CharEnumField(enum_type=FlowerType, max_length=20, default=FlowerType.white)
-    category = fields.CharEnumField(enum_type=FlowerCategory, max_length=50, default=FlowerCategory.universal)
+    category = fields.CharEnumField(
+        enum_type=FlowerCategory, max_length=50, default=FlowerCategory.universal, db_index=True
+    )
     img_link = fields.CharField(default="", max_length=500)
 
     created_at = fields.DatetimeField(auto_now_add=True)
@@ -81,6 +89,18 @@ class Order(models.Model):
     created_at = fields.DatetimeField(auto_now_add=True)
     modified_at = fields.DatetimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # order list / create_order lookups
+            Index(fields=("user_id", "flower_id", "status"), name="idx_order_user_flower_status"),
+            # the cart: at most one pending order per (user, flower)
+            UniquePartialIndex(
+                fields=("user_id", "flower_id"),
+                name="idx_order_pending_user_flower",
+                condition={"status": "Pending"},
+            ),
+        ]
+
     def __str__(self):
         return f"{self.user} - order_id: {self.id}"
 
@@ -96,16 +116,24 @@ class Comment(models.Model):
     def __str__(self):
         return f"{self.user} - comment text: {self.text}"
 
+    class Meta:
+        indexes = [
+            # comments feed, newest first keyset pagination
+            Index(fields=("created_at", "id"), name="idx_comment_created_id"),
+        ]
+
 
 config = project_config.db_config
 
 async def init():
     await Tortoise.init(config=project_config.db_config)
+    if await User.exists(username=project_config.ADMIN_NAME):  # don't spend a bcrypt round on every startup
+        return
     await User.get_or_create(
         username=project_config.ADMIN_NAME,
         defaults={
             "email": project_config.ADMIN_EMAIL,
-            "password_hash": bcrypt.hashpw(project_config.ADMIN_PASSWORD.encode(), bcrypt.gensalt()).decode(),
+            "password_hash": await password_hasher.hash(project_config.ADMIN_PASSWORD),
             "is_superuser": True,
             "is_active": True,
         },
@@ -0,0 +1,20 @@
+import base64
+import json
+
+
+def encode_cursor(values: list) -> str:
+    """Pack the keyset values of the last returned row into an opaque url-safe cursor."""
+    raw = json.dumps(values, separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list:
+    """Unpack a cursor made by encode_cursor, raises ValueError if it is malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (ValueError, TypeError) as ex:
+        raise ValueError("Invalid cursor.") from ex
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid cursor.")
+    return values
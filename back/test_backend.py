@@ -1,25 +1,88 @@
+import asyncio
+import csv
+import inspect
+import json
+import sys
 import unittest
+from contextlib import contextmanager
+from decimal import Decimal
+from io import BytesIO, StringIO
+from pathlib import Path
+from unittest import mock
 
+import pyarrow as pa
+import pyarrow.parquet as pq
+from aerich.utils import import_py_file
+from asgiref.sync import sync_to_async
 from httpx import AsyncClient
 from httpx._transports.asgi import ASGITransport
-from tortoise import Tortoise
+from tortoise import Tortoise, connections, fields
+from tortoise.exceptions import IntegrityError
+from tortoise.models import Model
+from tortoise.utils import get_schema_sql
 
+from admin import CommentAdmin, FlowerAdmin, OrderAdmin
+from api_pydantic_schemas import OrderGetResponse
+from catalog_cache import catalog_cache
+from comment_queue import CommentWriter
+from db_routing import REPLICA, reset_pins
+from dependencies import bad_token_cache, invalidate_token, resolve_token, token_cache
+from fastadmin.api.helpers import encode_cursor
+from fastadmin import ModelAdmin, TortoiseModelAdmin, display, register
+from fastadmin.api.service import get_user_id_from_session_id, revoked_sessions, verified_sessions
+from fastadmin.models.base import admin_fields_cache, admin_models, cache_model_fields
+from fastadmin.models.search import InMemorySearchIndex, TrigramSearch
+from fastadmin.settings import settings as admin_settings
+from hashing import password_hasher
 from main import app  # або де саме в тебе FastAPI app
-from models import Flower, Order
+from main_api import add_to_pending_order, comment_writer, comments_cache
+from models import Comment, Flower, Order, User
 from testing_utils import user_data_generator
 
+MIGRATIONS_DIR = Path(__file__).parent / "migrations" / "models"
+
+@contextmanager
+def count_queries():
+    """Counts statements sent to the default connection inside the block."""
+    client_cls = type(Tortoise.get_connection("default"))
+    queries = []
+
+    def counting(name):
+        original = getattr(client_cls, name)
+
+        async def wrapper(self, query, *args, **kwargs):
+            queries.append(query)
+            return await original(self, query, *args, **kwargs)
+        return wrapper
+
+    names = ("execute_query", "execute_query_dict", "execute_insert", "execute_many")
+    with mock.patch.multiple(client_cls, **{name: counting(name) for name in names}):
+        yield queries
+
+
 class BaseTestCase(unittest.IsolatedAsyncioTestCase):
     async def asyncSetUp(self):
+        await self.init_db()
+        catalog_cache.invalidate()
+        token_cache.clear()
+        bad_token_cache.clear()
+        comments_cache.clear()
+        reset_pins()
+        verified_sessions.clear()
+        revoked_sessions.clear()
+        self.transport = ASGITransport(app=app)
+        self.client = AsyncClient(transport=self.transport, base_url="http://test")
+        self.user_gen = user_data_generator()
+
+    async def init_db(self):
         await Tortoise.init(
             db_url="sqlite://:memory:",
             modules={"models": ["models"]}
         )
         await Tortoise.generate_schemas()
-        self.transport = ASGITransport(app=app)
-        self.client = AsyncClient(transport=self.transport, base_url="http://test")
-        self.user_gen = user_data_generator()
 
     async def asyncTearDown(self):
+        await comment_writer.drain()
         await self.client.aclose()
         await Tortoise._drop_databases()
 
@@ -57,6 +120,75 @@ class TestAuth(BaseTestCase):
         self.assertEqual(logout.status_code, 200)
         self.assertTrue(logout.json()["success"])
 
+    async def test_token_cache_invalidation(self):
+        username, email, password = next(self.user_gen)
+        await self.client.post("/api/register", json={"username": username, "email": email, "password": password})
+        login = await self.client.post("/api/login", json={"email": email, "password": password})
+        token = login.json()["token"]
+
+        # Second request is served from the cache
+        self.assertEqual((await self.client.get("/api/orders", headers={"token": token})).status_code, 200)
+        self.assertEqual((await self.client.get("/api/orders", headers={"token": token})).status_code, 200)
+        self.assertIsNotNone(token_cache.get(token))
+
+        # New login replaces the token
+        relogin = await self.client.post("/api/login", json={"email": email, "password": password})
+        new_token = relogin.json()["token"]
+        self.assertEqual((await self.client.get("/api/orders", headers={"token": token})).status_code, 403)
+        self.assertEqual((await self.client.get("/api/orders", headers={"token": new_token})).status_code, 200)
+
+        # Logout
+        await self.client.post("/api/logout", headers={"token": new_token})
+        self.assertEqual((await self.client.get("/api/orders", headers={"token": new_token})).status_code, 403)
+
+        # Missing token
+        self.assertEqual((await self.client.get("/api/orders")).status_code, 403)
+
+    async def test_token_evicted_during_lookup_is_not_cached(self):
+        username, email, password = next(self.user_gen)
+        await self.client.post("/api/register", json={"username": username, "email": email, "password": password})
+        token = (await self.client.post("/api/login", json={"email": email, "password": password})).json()["token"]
+        token_cache.clear()
+
+        # the user logs out while another request still resolves the token
+        client_cls = type(Tortoise.get_connection("default"))
+        execute_query_dict = client_cls.execute_query_dict
+
+        async def logout_during_lookup(self, query, *args, **kwargs):
+            result = await execute_query_dict(self, query, *args, **kwargs)
+            invalidate_token(token)
+            return result
+
+        with mock.patch.object(client_cls, "execute_query_dict", logout_during_lookup):
+            self.assertIsNotNone(await resolve_token(token))
+        self.assertIsNone(token_cache.get(token))
+
+    async def test_hashing_pool_backpressure(self):
+        username, email, password = next(self.user_gen)
+        completed = password_hasher.completed
+
+        # Pool is full
+        password_hasher.in_flight = password_hasher.workers + password_hasher.max_queue
+        try:
+            busy = await self.client.post(
+                "/api/register",
+                json={"username": username, "email": email, "password": password},
+            )
+        finally:
+            password_hasher.in_flight = 0
+        self.assertEqual(busy.status_code, 503)
+
+        resp = await self.client.post(
+            "/api/register",
+            json={"username": username, "email": email, "password": password},
+        )
+        self.assertEqual(resp.status_code, 200)
+
+        metrics = (await self.client.get("/api/metrics")).json()
+        self.assertEqual(metrics["hashing"]["completed"], completed + 1)
+        self.assertGreaterEqual(metrics["hashing"]["rejected"], 1)
+        self.assertIsNone(metrics["db_pool"])  # sqlite isn't pooled
+
 
 class TestFlowersAndOrders(BaseTestCase):
 
@@ -105,12 +237,136 @@ class TestFlowersAndOrders(BaseTestCase):
         self.assertEqual(data[0]["flower"]["name"], "Rose")
         self.assertEqual(data[0]["quantity"], 3)
 
+        # Adding the same flower again increments the pending order
+        await self.client.post("/api/orders", headers=headers, json={"flower_name": "Rose", "quantity": 2})
+        await asyncio.gather(
+            *(self.client.post("/api/orders", headers=headers, json={"flower_name": "Rose", "quantity": 1}) for _ in range(3))
+        )
+        orders = await self.client.get("/api/orders", headers=headers)
+        data = orders.json()["data"]
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]["quantity"], 8)
+        self.assertEqual(data[0]["amount"], 84.0)
+
         # Invalid flower order
         bad_order = await self.client.post("/api/orders", headers=headers, json={
             "flower_name": "NonexistentFlower", "quantity": 1
         })
         self.assertEqual(bad_order.status_code, 403)
 
+        # Batch
+        batch = await self.client.post("/api/orders/batch", headers=headers, json={"items": [
+            {"flower_name": "Rose", "quantity": 1},
+            {"flower_name": "Tulip", "quantity": 2},
+            {"flower_name": "NonexistentFlower", "quantity": 1},
+        ]})
+        self.assertEqual(batch.status_code, 200)
+        self.assertEqual([line["success"] for line in batch.json()["data"]], [True, True, False])
+        data = (await self.client.get("/api/orders", headers=headers)).json()["data"]
+        self.assertDictEqual({o["flower"]["name"]: o["quantity"] for o in data}, {"Rose": 9, "Tulip": 2})
+
+
+class TestCatalogCache(BaseTestCase):
+
+    async def test_snapshot_is_invalidated_on_flower_writes(self):
+        rose = await Flower.create(name="Rose", price=10.50, type=Flower.FlowerType.red, category=Flower.FlowerCategory.birthday)
+
+        resp = await self.client.get("/api/flowers", params={"category": "Birthday"})
+        self.assertEqual([f["name"] for f in resp.json()["data"]], ["Rose"])
+        snapshot = await catalog_cache.get(Flower.FlowerCategory.birthday)
+        self.assertIs(snapshot, await catalog_cache.get(Flower.FlowerCategory.birthday))
+
+        # Update through the model
+        rose.price = 12
+        await rose.save()
+        resp = await self.client.get("/api/flowers", params={"category": "Birthday"})
+        self.assertEqual(resp.json()["data"][0]["price"], 12.0)
+
+        # Delete through the admin
+        await FlowerAdmin(Flower).delete_model(rose.id)
+        resp = await self.client.get("/api/flowers", params={"category": "Birthday"})
+        self.assertEqual(resp.json()["data"], [])
+
+        # Bulk update and delete through the admin
+        tulip = await Flower.create(name="Tulip", price=5, type=Flower.FlowerType.yellow, category=Flower.FlowerCategory.birthday)
+        await catalog_cache.get(Flower.FlowerCategory.birthday)
+        await admin_models[Flower].update_many([tulip.id], {"price": 99})
+        resp = await self.client.get("/api/flowers", params={"category": "Birthday"})
+        self.assertEqual([f["price"] for f in resp.json()["data"]], [99.0])
+        await admin_models[Flower].delete_many([tulip.id])
+        resp = await self.client.get("/api/flowers", params={"category": "Birthday"})
+        self.assertEqual(resp.json()["data"], [])
+
+        # Unknown category
+        bad = await self.client.get("/api/flowers", params={"category": "Unknown"})
+        self.assertEqual(bad.status_code, 422)
+
+    async def test_snapshot_expires_for_writes_from_other_workers(self):
+        await Flower.create(name="Rose", price=10, type=Flower.FlowerType.red, category=Flower.FlowerCategory.birthday)
+
+        with mock.patch.object(catalog_cache, "ttl", 0.05):
+            snapshot = await catalog_cache.get()
+            # another worker's write doesn't bump this process' version
+            await Flower.filter(name="Rose").update(price=20)
+            self.assertIs(await catalog_cache.get(), snapshot)
+
+            await asyncio.sleep(0.1)
+            resp = await self.client.get("/api/flowers")
+        self.assertEqual(resp.json()["data"][0]["price"], 20.0)
+
+    async def test_etag_and_not_modified(self):
+        await Flower.create(name="Rose", price=10.50, type=Flower.FlowerType.red, category=Flower.FlowerCategory.birthday)
+
+        resp = await self.client.get("/api/flowers")
+        self.assertEqual(resp.status_code, 200)
+        etag = resp.headers["etag"]
+
+        not_modified = await self.client.get("/api/flowers", headers={"If-None-Match": etag})
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified.content, b"")
+        self.assertEqual(not_modified.headers["etag"], etag)
+
+        # Catalog changed, the old etag is stale
+        await Flower.create(name="Tulip", price=8.00, type=Flower.FlowerType.yellow, category=Flower.FlowerCategory.kids)
+        changed = await self.client.get("/api/flowers", headers={"If-None-Match": etag})
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed.headers["etag"], etag)
+        self.assertEqual(len(changed.json()["data"]), 2)
+
+
+class TestFlowersPagination(BaseTestCase):
+
+    async def test_keyset_pages_filters_and_fields(self):
+        for i, price in enumerate([5, 7, 7, 8, 9.5]):
+            await Flower.create(name=f"Flower{i}", price=price, type=Flower.FlowerType.red if i % 2 else Flower.FlowerType.white)
+
+        # Pages ordered by (price, id)
+        names, cursor = [], None
+        while True:
+            params = {"order_by": "price", "limit": 2, "fields": "name"}
+            if cursor:
+                params["cursor"] = cursor
+            resp = await self.client.get("/api/flowers", params=params)
+            self.assertEqual(resp.status_code, 200)
+            page = resp.json()
+            self.assertLessEqual(len(page["data"]), 2)
+            self.assertSetEqual(set(page["data"][0]), {"id", "name", "price"})
+            names += [f["name"] for f in page["data"]]
+            cursor = page["next_cursor"]
+            if not cursor:
+                break
+        self.assertEqual(names, ["Flower0", "Flower1", "Flower2", "Flower3", "Flower4"])
+
+        # Filters
+        resp = await self.client.get("/api/flowers", params={"type": "Red", "min_price": 6, "max_price": 9})
+        self.assertEqual([f["name"] for f in resp.json()["data"]], ["Flower1", "Flower3"])
+
+        # Invalid params
+        bad_fields = await self.client.get("/api/flowers", params={"fields": "password"})
+        self.assertEqual(bad_fields.status_code, 400)
+        bad_cursor = await self.client.get("/api/flowers", params={"limit": 2, "cursor": "garbage"})
+        self.assertEqual(bad_cursor.status_code, 400)
+
 
 class TestOrderUpdateDelete(BaseTestCase):
 
@@ -140,10 +396,14 @@ class TestOrderUpdateDelete(BaseTestCase):
         order = await Order.all().order_by("-id").first()
         order_id = order.id
 
-        # Update quantity
-        res1 = await self.client.put(f"/api/orders/{order_id}", headers=headers, json={"quantity": 5})
+        # Update quantity, the token is cached by now so the handler itself is one UPDATE
+        with count_queries() as queries:
+            res1 = await self.client.put(f"/api/orders/{order_id}", headers=headers, json={"quantity": 5})
         self.assertEqual(res1.status_code, 200)
-        self.assertEqual((await Order.get(id=order_id)).quantity, 5)
+        self.assertEqual(len(queries), 1)
+        updated = await Order.get(id=order_id)
+        self.assertEqual(updated.quantity, 5)
+        self.assertEqual(float(updated.amount), 27.5)
 
         # Update status
         res2 = await self.client.put(f"/api/orders/{order_id}", headers=headers, json={"status": "Completed"})
@@ -161,9 +421,34 @@ class TestOrderUpdateDelete(BaseTestCase):
         res4 = await self.client.put("/api/orders/9999", headers=headers, json={"quantity": 3})
         self.assertEqual(res4.status_code, 404)
 
+        # Back to Pending while the cart already has a pending order of that flower
+        await self.client.post("/api/orders", headers=headers, json={"flower_name": "Daisy", "quantity": 1})
+        res_conflict = await self.client.put(f"/api/orders/{order_id}", headers=headers, json={"status": "Pending"})
+        self.assertEqual(res_conflict.status_code, 409)
+        self.assertFalse(res_conflict.json()["success"])
+        self.assertEqual((await Order.get(id=order_id)).status.value, "Failed")
+
+        # Invalid values are rejected without an UPDATE, after the order is found
+        with count_queries() as queries:
+            res_bad = await self.client.put(f"/api/orders/{order_id}", headers=headers, json={"quantity": 0})
+        self.assertEqual(res_bad.status_code, 400)
+        self.assertEqual(res_bad.json()["message"], "Quantity must be greater than 0.")
+        self.assertEqual(len(queries), 1)
+        self.assertFalse(queries[0].startswith("UPDATE"))
+        res_bad = await self.client.put(f"/api/orders/{order_id}", headers=headers, json={"status": "Lost", "quantity": 0})
+        self.assertEqual((res_bad.status_code, res_bad.json()["message"]), (400, "Invalid status value."))
+        self.assertEqual((await Order.get(id=order_id)).quantity, 1)
+
+        # A missing order is a 404 whatever the body
+        for body in ({"quantity": 0}, {"status": "Lost"}, {}):
+            res_missing = await self.client.put("/api/orders/9999", headers=headers, json=body)
+            self.assertEqual(res_missing.status_code, 404)
+
         # Delete
-        res5 = await self.client.delete(f"/api/orders/{order_id}", headers=headers)
+        with count_queries() as queries:
+            res5 = await self.client.delete(f"/api/orders/{order_id}", headers=headers)
         self.assertEqual(res5.status_code, 200)
+        self.assertEqual(len(queries), 1)
         self.assertTrue(res5.json()["success"])
 
         # Delete again
@@ -172,5 +457,735 @@ class TestOrderUpdateDelete(BaseTestCase):
         self.assertFalse(res6.json()["success"])
 
 
+class TestMigrations(BaseTestCase):
+    HOT_LOOKUP_INDEXES = (
+        "idx_user_token_feec3b", "idx_flower_categor_ca0988",
+        "idx_order_user_flower_status", "idx_order_pending_user_flower",
+    )
+
+    async def upgrade_sql(self, version: str) -> str:
+        migration = import_py_file(next(MIGRATIONS_DIR.glob(f"{version}_*.py")))
+        return await migration.upgrade(Tortoise.get_connection("default"))
+
+    async def test_hot_lookup_indexes_migration_merges_duplicate_pending_orders(self):
+        # a database from before the indexes, where the cart could hold duplicates
+        db = Tortoise.get_connection("default")
+        for name in self.HOT_LOOKUP_INDEXES:
+            await db.execute_script(f'DROP INDEX "{name}";')
+        user = await User.create(username="buyer", email="buyer@example.com")
+        rose = await Flower.create(
+            name="Rose", price=10, type=Flower.FlowerType.red,
+            category=Flower.FlowerCategory.love, img_link="/img/rose.png"
+        )
+        tulip = await Flower.create(
+            name="Tulip", price=4, type=Flower.FlowerType.yellow,
+            category=Flower.FlowerCategory.mom, img_link="/img/tulip.png"
+        )
+        first = await Order.create(user=user, flower=rose, quantity=1, amount=10)
+        await Order.create(user=user, flower=rose, quantity=2, amount=20)
+        await Order.create(user=user, flower=rose, quantity=3, amount=30)
+        completed = await Order.create(user=user, flower=rose, quantity=5, amount=50, status=Order.STATUSES.completed)
+        single = await Order.create(user=user, flower=tulip, quantity=1, amount=4)
+
+        await db.execute_script(await self.upgrade_sql(1))
+
+        self.assertEqual(
+            sorted(await Order.all().values_list("id", flat=True)), sorted([first.id, completed.id, single.id])
+        )
+        merged = await Order.get(id=first.id)
+        self.assertEqual((merged.quantity, merged.amount), (6, Decimal(60)))
+        self.assertEqual((await Order.get(id=single.id)).quantity, 1)
+        _, indexes = await db.execute_query("SELECT name FROM sqlite_master WHERE type = 'index'")
+        self.assertLessEqual(set(self.HOT_LOOKUP_INDEXES), {index["name"] for index in indexes})
+
+    async def test_migrated_cart_has_the_unique_pending_index(self):
+        upgrade_sql = await self.upgrade_sql(1)
+        self.assertRegex(upgrade_sql, r'CREATE UNIQUE INDEX "idx_order_pending_user_flower" .* WHERE status = \'Pending\'')
+
+        # the index comes from the migration, not from generate_schemas
+        db = Tortoise.get_connection("default")
+        for name in self.HOT_LOOKUP_INDEXES:
+            await db.execute_script(f'DROP INDEX "{name}";')
+        await db.execute_script(upgrade_sql)
+
+        user = await User.create(username="buyer", email="buyer@example.com")
+        rose = await Flower.create(
+            name="Rose", price=10, type=Flower.FlowerType.red,
+            category=Flower.FlowerCategory.love, img_link="/img/rose.png"
+        )
+        await asyncio.gather(*(add_to_pending_order(user.id, rose, 1) for _ in range(3)))
+        pending = await Order.filter(user=user, flower=rose, status=Order.STATUSES.pending)
+        self.assertEqual([order.quantity for order in pending], [3])
+        with self.assertRaises(IntegrityError):
+            await Order.create(user=user, flower=rose, quantity=1, amount=10)
+
+
+class TestOrdersPagination(BaseTestCase):
+
+    async def test_orders_pages_keep_the_response_shape(self):
+        username, email, password = next(self.user_gen)
+        await self.client.post("/api/register", json={"username": username, "email": email, "password": password})
+        token = (await self.client.post("/api/login", json={"email": email, "password": password})).json()["token"]
+        headers = {"token": token}
+
+        for i, name in enumerate(["Rose", "Tulip", "Lily"], start=1):
+            await Flower.create(
+                name=name, price=i, type=Flower.FlowerType.red,
+                category=Flower.FlowerCategory.birthday, img_link=f"/img/{name}.png"
+            )
+            await self.client.post("/api/orders", headers=headers, json={"flower_name": name, "quantity": i})
+
+        everything = await self.client.get("/api/orders", headers=headers)
+        self.assertEqual(everything.status_code, 200)
+        body = OrderGetResponse.model_validate(everything.json())
+        self.assertEqual([o.flower.name for o in body.data], ["Lily", "Tulip", "Rose"])
+        self.assertEqual(body.data[0].amount, 9.0)
+        self.assertEqual(body.data[0].flower.img_link, "/img/Lily.png")
+        self.assertIsNone(body.next_before_id)
+
+        first = (await self.client.get("/api/orders", headers=headers, params={"limit": 2})).json()
+        self.assertEqual([o["flower"]["name"] for o in first["data"]], ["Lily", "Tulip"])
+        self.assertEqual(first["next_before_id"], first["data"][-1]["id"])
+
+        second = (await self.client.get(
+            "/api/orders", headers=headers, params={"limit": 2, "before_id": first["next_before_id"]}
+        )).json()
+        self.assertEqual([o["flower"]["name"] for o in second["data"]], ["Rose"])
+        self.assertIsNone(second["next_before_id"])
+
+        self.assertEqual((await self.client.get("/api/orders", headers=headers, params={"limit": 0})).status_code, 422)
+
+
+
+class TestComments(BaseTestCase):
+
+    async def test_comments_feed_is_paginated_and_cached(self):
+        username, email, password = next(self.user_gen)
+        await self.client.post("/api/register", json={"username": username, "email": email, "password": password})
+        token = (await self.client.post("/api/login", json={"email": email, "password": password})).json()["token"]
+        headers = {"token": token}
+
+        for i in range(5):
+            resp = await self.client.post("/api/comments", headers=headers, json={"text": f"comment {i}"})
+            self.assertEqual(resp.status_code, 200)
+
+        first = (await self.client.get("/api/comments", params={"limit": 2})).json()
+        self.assertEqual([c["text"] for c in first["data"]], ["comment 4", "comment 3"])
+        self.assertEqual(first["data"][0]["username"], username)
+
+        texts, cursor = [c["text"] for c in first["data"]], first["next_cursor"]
+        while cursor:
+            page = (await self.client.get("/api/comments", params={"limit": 2, "cursor": cursor})).json()
+            texts += [c["text"] for c in page["data"]]
+            cursor = page["next_cursor"]
+        self.assertEqual(texts, [f"comment {i}" for i in reversed(range(5))])
+
+        # the first page is served from the cache until a new comment is posted
+        with count_queries() as queries:
+            cached = await self.client.get("/api/comments", params={"limit": 2})
+        self.assertEqual(queries, [])
+        self.assertEqual(cached.json(), first)
+
+        await self.client.post("/api/comments", headers=headers, json={"text": "comment 5"})
+        fresh = (await self.client.get("/api/comments", params={"limit": 2})).json()
+        self.assertEqual([c["text"] for c in fresh["data"]], ["comment 5", "comment 4"])
+
+        bad = await self.client.get("/api/comments", params={"cursor": "not-a-cursor"})
+        self.assertEqual(bad.status_code, 400)
+
+    async def test_buffered_comments_are_written_in_batches(self):
+        username, email, password = next(self.user_gen)
+        await self.client.post("/api/register", json={"username": username, "email": email, "password": password})
+        token = (await self.client.post("/api/login", json={"email": email, "password": password})).json()["token"]
+        headers = {"token": token}
+
+        with mock.patch.dict("os.environ", {"COMMENTS_INGEST_MODE": "buffered"}):
+            for i in range(3):
+                resp = await self.client.post("/api/comments", headers=headers, json={"text": f"comment {i}"})
+                self.assertEqual(resp.status_code, 200)
+        self.assertEqual(await Comment.all().count(), 0)
+
+        with count_queries() as queries:
+            await comment_writer.drain()
+        self.assertEqual(len(queries), 1)  # one bulk insert
+        feed = (await self.client.get("/api/comments")).json()
+        self.assertEqual([c["text"] for c in feed["data"]], ["comment 2", "comment 1", "comment 0"])
+        self.assertEqual(comment_writer.stats()["queued"], 0)
+
+    async def test_failed_batch_is_saved_row_by_row_and_drops_are_logged(self):
+        user = await User.create(username="alice", email="alice@example.com", password_hash="x")
+        writer = CommentWriter()
+        batch = [Comment(text="kept", user_id=user.id), Comment(text="orphan", user_id=user.id + 1000)]
+        with self.assertLogs("comment_queue", "ERROR") as logs:
+            await writer._write(batch)
+        self.assertEqual(await Comment.all().values_list("text", flat=True), ["kept"])
+        self.assertEqual((writer.written, writer.failed), (1, 1))
+        self.assertEqual(
+            [record.getMessage() for record in logs.records],
+            [
+                "bulk insert of 2 comments failed, saving them one by one",
+                f"comment of user {user.id + 1000} dropped",
+                "1 of 2 comments of the batch dropped",
+            ],
+        )
+        self.assertIsNotNone(logs.records[1].exc_info)
+
+
+
+class TestReadReplica(BaseTestCase):
+
+    async def init_db(self):
+        # two separate in-memory databases stand in for the primary and a replica which hasn't caught up
+        await Tortoise.init(config={
+            "connections": {"default": "sqlite://:memory:", REPLICA: "sqlite://:memory:"},
+            "apps": {"models": {"models": ["models"], "default_connection": "default"}},
+        })
+        await Tortoise.generate_schemas()
+        await connections.get(REPLICA).execute_script(get_schema_sql(connections.get("default"), safe=False))
+
+    async def test_reads_are_routed_to_the_replica(self):
+        replica = connections.get(REPLICA)
+        rose = {"name": "Rose", "price": 5, "type": Flower.FlowerType.red, "category": Flower.FlowerCategory.birthday}
+        await Flower.create(**rose)
+        await Flower.create(**rose, using_db=replica)
+        await Flower.create(name="Tulip", price=7, type=Flower.FlowerType.red, category=Flower.FlowerCategory.birthday)
+
+        # filtered / paginated listing goes to the replica, the cached snapshot is built from the primary
+        listed = (await self.client.get("/api/flowers", params={"limit": 10})).json()["data"]
+        self.assertEqual([f["name"] for f in listed], ["Rose"])
+        snapshot = (await self.client.get("/api/flowers")).json()["data"]
+        self.assertEqual([f["name"] for f in snapshot], ["Rose", "Tulip"])
+
+        # fastadmin lists read from the admin's read_connection
+        flower_admin = FlowerAdmin(Flower)
+        self.assertEqual((await flower_admin.orm_get_list())[1], 2)
+        flower_admin.read_connection = REPLICA
+        self.assertEqual((await flower_admin.orm_get_list())[1], 1)
+
+        # a user's own orders are read from the primary right after they wrote
+        username, email, password = next(self.user_gen)
+        await self.client.post("/api/register", json={"username": username, "email": email, "password": password})
+        token = (await self.client.post("/api/login", json={"email": email, "password": password})).json()["token"]
+        headers = {"token": token}
+        await self.client.post("/api/orders", headers=headers, json={"flower_name": "Rose", "quantity": 1})
+        self.assertEqual(len((await self.client.get("/api/orders", headers=headers)).json()["data"]), 1)
+
+        reset_pins()  # the sticky window is over, the (never synced) replica has no orders
+        self.assertEqual((await self.client.get("/api/orders", headers=headers)).json()["data"], [])
+
+
+
+class TestAdminSessions(BaseTestCase):
+
+    @mock.patch.multiple(admin_settings, ADMIN_USER_MODEL="User", ADMIN_SECRET_KEY="test-secret")
+    async def test_session_is_verified_once_and_revoked_on_sign_out(self):
+        await User.create(
+            username="admin", email="admin@example.com", is_superuser=True, is_active=True,
+            password_hash=await password_hasher.hash("admin-password"),
+        )
+        sign_in = await self.client.post("/admin/api/sign-in", json={"username": "admin", "password": "admin-password"})
+        self.assertEqual(sign_in.status_code, 200)
+        session_id = sign_in.cookies[admin_settings.ADMIN_SESSION_ID_KEY]
+
+        with count_queries() as queries:
+            self.assertIsNotNone(await get_user_id_from_session_id(session_id))
+        self.assertEqual(len(queries), 1)  # an exists() check, not a serialized user
+        with count_queries() as queries:
+            self.assertIsNotNone(await get_user_id_from_session_id(session_id))
+        self.assertEqual(queries, [])
+
+        # a second sign in, likely within the same second, is a separate session
+        sign_in = await self.client.post("/admin/api/sign-in", json={"username": "admin", "password": "admin-password"})
+        other_session_id = sign_in.cookies[admin_settings.ADMIN_SESSION_ID_KEY]
+        self.client.cookies.set(admin_settings.ADMIN_SESSION_ID_KEY, session_id)
+
+        sign_out = await self.client.post("/admin/api/sign-out")  # the client keeps the session cookie
+        self.assertEqual(sign_out.status_code, 200)
+        self.assertIsNone(await get_user_id_from_session_id(session_id))
+        self.assertIsNotNone(await get_user_id_from_session_id(other_session_id))
+
+        # deactivated admins are signed out once the verified session cache expires
+        await User.filter(username="admin").update(is_active=False)
+        verified_sessions.clear()
+        self.assertIsNone(await get_user_id_from_session_id(other_session_id))
+
+
+class TestAdminExport(BaseTestCase):
+    @mock.patch.multiple(admin_settings, ADMIN_USER_MODEL="User", ADMIN_SECRET_KEY="test-secret")
+    async def test_orders_are_exported_to_parquet_and_arrow_with_types(self):
+        user = await User.create(
+            username="admin", email="admin@example.com", is_superuser=True, is_active=True,
+            password_hash=await password_hasher.hash("admin-password"),
+        )
+        for quantity in range(1, 4):
+            flower = await Flower.create(name=f"Rose {quantity}", price=1.25, type=Flower.FlowerType.red, category=Flower.FlowerCategory.birthday)
+            await Order.create(user=user, flower=flower, quantity=quantity, amount=Decimal("1.25") * quantity)
+        await self.client.post("/admin/api/sign-in", json={"username": "admin", "password": "admin-password"})
+
+        with mock.patch.object(admin_models[Order], "export_chunk_size", 2):  # two row groups
+            response = await self.client.post("/admin/api/export/Order", json={"format": "PARQUET"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["content-type"], "application/vnd.apache.parquet")
+        table = pq.read_table(BytesIO(response.content))
+        self.assertEqual(pq.ParquetFile(BytesIO(response.content)).num_row_groups, 2)
+        self.assertEqual(table.column("amount").to_pylist(), [Decimal("1.25"), Decimal("2.50"), Decimal("3.75")])
+        self.assertEqual(table.schema.field("quantity").type, pa.int64())
+        self.assertTrue(pa.types.is_timestamp(table.schema.field("created_at").type))
+
+        response = await self.client.post("/admin/api/export/Order", json={"format": "ARROW"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(pa.ipc.open_file(response.content).read_all().to_pylist(), table.to_pylist())
+
+    @mock.patch.multiple(admin_settings, ADMIN_USER_MODEL="User", ADMIN_SECRET_KEY="test-secret")
+    async def test_orders_are_streamed_to_csv_json_and_ndjson_in_chunks(self):
+        user = await User.create(
+            username="admin", email="admin@example.com", is_superuser=True, is_active=True,
+            password_hash=await password_hasher.hash("admin-password"),
+        )
+        flower = await Flower.create(name="Rose", price=1.25, type=Flower.FlowerType.red, category=Flower.FlowerCategory.birthday)
+        for quantity in range(1, 6):
+            await Order.create(
+                user=user, flower=flower, quantity=quantity, amount=Decimal("1.25") * quantity,
+                status=Order.STATUSES.completed,
+            )
+        await self.client.post("/admin/api/sign-in", json={"username": "admin", "password": "admin-password"})
+
+        async def export(export_format: str) -> str:
+            with mock.patch.object(admin_models[Order], "export_chunk_size", 2), count_queries() as queries:
+                response = await self.client.post(
+                    "/admin/api/export/Order", params={"sort_by": "id"}, json={"format": export_format}
+                )
+            self.assertEqual(response.status_code, 200)
+            # 5 orders are read in 3 chunks, plus the session check
+            self.assertEqual(len([query for query in queries if 'FROM "order"' in query]), 3)
+            return response.text
+
+        rows = list(csv.DictReader(StringIO(await export("CSV"))))
+        self.assertEqual([row["quantity"] for row in rows], ["1", "2", "3", "4", "5"])
+        self.assertEqual(
+            list(rows[0]), [f.name for f in admin_models[Order].get_model_fields_with_widget_types(with_m2m=False)]
+        )
+
+        objs = json.loads(await export("JSON"))
+        self.assertEqual([obj["quantity"] for obj in objs], [1, 2, 3, 4, 5])
+        self.assertEqual(Decimal(objs[1]["amount"]), Decimal("2.50"))
+
+        lines = (await export("NDJSON")).splitlines()
+        self.assertEqual([json.loads(line) for line in lines], objs)
+
+        # nothing to export: the header, an empty array, no lines
+        await Order.all().delete()
+        for export_format, empty in (("CSV", f"{','.join(rows[0])}\r\n"), ("JSON", "[]"), ("NDJSON", "")):
+            response = await self.client.post("/admin/api/export/Order", json={"format": export_format})
+            self.assertEqual(response.text, empty)
+
+
+class TestAdminListTotals(BaseTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        await User.create(
+            username="admin", email="admin@example.com", is_superuser=True, is_active=True,
+            password_hash=await password_hasher.hash("admin-password"),
+        )
+        await Flower.create(name="Rose", price=10.50, type=Flower.FlowerType.red, category=Flower.FlowerCategory.birthday)
+        with mock.patch.multiple(admin_settings, ADMIN_USER_MODEL="User", ADMIN_SECRET_KEY="test-secret"):
+            await self.client.post("/admin/api/sign-in", json={"username": "admin", "password": "admin-password"})
+
+    @mock.patch.multiple(admin_settings, ADMIN_USER_MODEL="User", ADMIN_SECRET_KEY="test-secret")
+    async def test_cached_total_is_counted_once_per_filters(self):
+        admin = admin_models[Flower]
+        with mock.patch.object(admin, "count_strategy", "cached"):
+            await self.client.get("/admin/api/list/Flower")
+            with count_queries() as queries:
+                response = await self.client.get("/admin/api/list/Flower")
+            self.assertEqual(response.json()["total"], 1)
+            self.assertFalse(response.json()["total_is_estimate"])
+            self.assertFalse(any("COUNT" in query.upper() for query in queries))
+
+            await self.client.post("/admin/api/add/Flower", json={
+                "name": "Tulip", "price": 8, "type": Flower.FlowerType.yellow.value, "category": Flower.FlowerCategory.kids.value,
+            })
+            response = await self.client.get("/admin/api/list/Flower")
+            self.assertEqual(response.json()["total"], 2)
+
+    @mock.patch.multiple(admin_settings, ADMIN_USER_MODEL="User", ADMIN_SECRET_KEY="test-secret")
+    async def test_estimated_total_above_the_threshold(self):
+        admin = admin_models[Order]
+        # sqlite has no planner estimates, the total is counted
+        response = await self.client.get("/admin/api/list/Order")
+        self.assertEqual((response.json()["total"], response.json()["total_is_estimate"]), (0, False))
+
+        with mock.patch.object(admin, "orm_estimate_count", mock.AsyncMock(return_value=5_100_000)):
+            response = await self.client.get("/admin/api/list/Order")
+        self.assertEqual((response.json()["total"], response.json()["total_is_estimate"]), (5_100_000, True))
+
+
+class TestAdminCursorPagination(BaseTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        await User.create(
+            username="admin", email="admin@example.com", is_superuser=True, is_active=True,
+            password_hash=await password_hasher.hash("admin-password"),
+        )
+        for i, price in enumerate([5, 3, 5, 1, 3, 5, 2]):
+            await Flower.create(name=f"Rose {i}", price=price, type=Flower.FlowerType.red, category=Flower.FlowerCategory.birthday)
+        with mock.patch.multiple(admin_settings, ADMIN_USER_MODEL="User", ADMIN_SECRET_KEY="test-secret"):
+            await self.client.post("/admin/api/sign-in", json={"username": "admin", "password": "admin-password"})
+
+    @mock.patch.multiple(admin_settings, ADMIN_USER_MODEL="User", ADMIN_SECRET_KEY="test-secret")
+    async def test_pages_follow_the_cursor_without_offsets(self):
+        offset_page = await self.client.get("/admin/api/list/Flower", params={"sort_by": "-created_at", "limit": 100})
+        self.assertIsNone(offset_page.json()["next_cursor"])
+        expected = [obj["id"] for obj in offset_page.json()["results"]]
+
+        seen, cursor = [], ""
+        while cursor is not None:
+            with count_queries() as queries:
+                page = await self.client.get("/admin/api/list/Flower", params={"sort_by": "-created_at", "limit": 3, "cursor": cursor})
+            self.assertEqual(page.status_code, 200)
+            self.assertEqual(page.json()["total"], 7)
+            if cursor:  # the position is a keyset condition, not an offset to scan
+                self.assertTrue(any('WHERE "created_at"<? OR ("created_at"=? AND "id"<?)' in query for query in queries))
+            seen += [obj["id"] for obj in page.json()["results"]]
+            cursor = page.json()["next_cursor"]
+        self.assertEqual(seen, expected)
+
+    @mock.patch.multiple(admin_settings, ADMIN_USER_MODEL="User", ADMIN_SECRET_KEY="test-secret")
+    async def test_ties_of_the_sort_field_are_broken_by_pk(self):
+        seen, cursor = [], ""
+        while cursor is not None:
+            page = await self.client.get("/admin/api/list/Flower", params={"sort_by": "price", "limit": 2, "cursor": cursor})
+            seen += [(float(obj["price"]), obj["id"]) for obj in page.json()["results"]]
+            cursor = page.json()["next_cursor"]
+        self.assertEqual(seen, sorted(seen))
+        self.assertEqual(len(seen), 7)
+
+        response = await self.client.post(
+            "/admin/api/export/Flower?sort_by=price", json={"format": "NDJSON", "cursor": encode_cursor([Decimal(3), seen[3][1]])}
+        )
+        self.assertEqual([json.loads(line)["id"] for line in response.text.splitlines()], [id for _, id in seen[4:]])
+
+        response = await self.client.get("/admin/api/list/Flower", params={"cursor": "not a cursor"})
+        self.assertEqual(response.status_code, 422)
+
+
+class TestAdminSearch(BaseTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.admin = await User.create(
+            username="admin", email="admin@example.com", is_superuser=True, is_active=True,
+            password_hash=await password_hasher.hash("admin-password"),
+        )
+        self.alice = await User.create(username="alice", email="alice@example.com", password_hash="x")
+        await Comment.create(text="Roses are red", user=self.alice)
+        await Comment.create(text="Violets are blue", user=self.alice)
+        await Comment.create(text="Redundant tulips", user=self.admin)
+        with mock.patch.multiple(admin_settings, ADMIN_USER_MODEL="User", ADMIN_SECRET_KEY="test-secret"):
+            await self.client.post("/admin/api/sign-in", json={"username": "admin", "password": "admin-password"})
+
+    async def search(self, search: str) -> list[str]:
+        response = await self.client.get("/admin/api/list/Comment", params={"search": search, "sort_by": "id"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["total"], len(response.json()["results"]))
+        return [obj["text"] for obj in response.json()["results"]]
+
+    @mock.patch.multiple(admin_settings, ADMIN_USER_MODEL="User", ADMIN_SECRET_KEY="test-secret")
+    async def test_icontains_searches_related_fields(self):
+        self.assertEqual(await self.search("ALIC"), ["Roses are red", "Violets are blue"])
+        self.assertEqual(await self.search("red"), ["Roses are red", "Redundant tulips"])
+
+    @mock.patch.multiple(admin_settings, ADMIN_USER_MODEL="User", ADMIN_SECRET_KEY="test-secret")
+    async def test_in_memory_index_matches_word_prefixes(self):
+        with mock.patch.object(admin_models[Comment], "search_backend", InMemorySearchIndex()):
+            self.assertEqual(await self.search("red"), ["Roses are red", "Redundant tulips"])
+            self.assertEqual(await self.search("alice ARE"), ["Roses are red", "Violets are blue"])
+            self.assertEqual(await self.search("ed"), [])  # not a prefix of a word
+
+            with count_queries() as queries:
+                self.assertEqual(await self.search("viol"), ["Violets are blue"])
+            self.assertFalse(any("LIKE" in query for query in queries))  # matched by the index, not scanned
+
+            response = await self.client.post("/admin/api/add/Comment", json={"text": "Red violets", "user": self.admin.id})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(await self.search("viol"), ["Violets are blue", "Red violets"])
+
+    async def test_unsupported_search_fields_are_rejected_on_register(self):
+        # icontains of an orm which can't follow relations
+        class PlainCommentAdmin(ModelAdmin):
+            search_fields = ("user__username", "text")
+
+        with self.assertRaisesRegex(ValueError, "user__username"):
+            register(Comment)(PlainCommentAdmin)
+
+        # trigram search puts its fields into raw SQL as columns of the model
+        class TrigramCommentAdmin(TortoiseModelAdmin):
+            search_fields = ("user__username", "text")
+            search_backend = TrigramSearch()
+
+        with self.assertRaisesRegex(ValueError, "user__username"):
+            register(Comment)(TrigramCommentAdmin)
+        self.assertIsInstance(admin_models[Comment], CommentAdmin)
+
+        TrigramCommentAdmin.search_backend = TrigramSearch(fields=("text",))
+        TrigramCommentAdmin(Comment)  # only columns of the model
+
+
+class TestAdminListColumns(BaseTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.admin = await User.create(
+            username="admin", email="admin@example.com", is_superuser=True, is_active=True,
+            password_hash=await password_hasher.hash("admin-password"),
+        )
+        for i in range(3):
+            await Comment.create(text=f"comment {i} " + "x" * 1000, user=self.admin)
+        with mock.patch.multiple(admin_settings, ADMIN_USER_MODEL="User", ADMIN_SECRET_KEY="test-secret"):
+            await self.client.post("/admin/api/sign-in", json={"username": "admin", "password": "admin-password"})
+
+    @mock.patch.multiple(admin_settings, ADMIN_USER_MODEL="User", ADMIN_SECRET_KEY="test-secret")
+    async def test_list_loads_only_displayed_columns(self):
+        with count_queries() as queries:
+            response = await self.client.get("/admin/api/list/Comment", params={"sort_by": "-created_at", "limit": 2, "cursor": ""})
+        self.assertEqual(response.status_code, 200)
+        select = next(query for query in queries if query.startswith('SELECT') and 'FROM "comment"' in query and "COUNT" not in query)
+        self.assertNotIn('"modified_at"', select)
+
+        results = response.json()["results"]
+        self.assertEqual(set(results[0]), {"id", "text", "user", "created_at", "__str__"})  # created_at for the cursor
+        comment = await Comment.get(id=results[0]["id"])
+        self.assertEqual(results[0]["text"], comment.text)
+        self.assertEqual(results[0]["__str__"].split(" - ", 1)[1], str(comment).split(" - ", 1)[1])
+
+        # the sort column is loaded for the cursor of the next page
+        next_page = await self.client.get("/admin/api/list/Comment", params={"sort_by": "-created_at", "cursor": response.json()["next_cursor"]})
+        self.assertEqual(len(next_page.json()["results"]), 1)
+
+        response = await self.client.get("/admin/api/list/User")
+        self.assertNotIn("password_hash", response.json()["results"][0])
+        self.assertEqual(response.json()["results"][0]["__str__"], "admin - admin@example.com")
+
+
+class TestAdminFieldsCache(BaseTestCase):
+    async def test_field_metadata_is_computed_once_until_registered_again(self):
+        for i in range(3):
+            await Flower.create(name=f"Rose {i}", price=10 + i, type=Flower.FlowerType.red, category=Flower.FlowerCategory.birthday)
+
+        get_fields = mock.Mock(wraps=TortoiseModelAdmin.get_model_fields_with_widget_types.__wrapped__)
+        with (
+            mock.patch.object(FlowerAdmin, "get_model_fields_with_widget_types", cache_model_fields(get_fields)),
+            mock.patch.object(
+                FlowerAdmin, "_get_fields_for_serialize", autospec=True, side_effect=FlowerAdmin._get_fields_for_serialize
+            ) as get_fields_for_serialize,
+        ):
+            register(Flower)(FlowerAdmin)
+            admin = admin_models[Flower]
+            first = await admin.get_list(limit=2)
+            computed = get_fields.call_count
+            self.assertGreater(computed, 0)
+            self.assertEqual(get_fields_for_serialize.call_count, 1)
+
+            second = await admin.get_list(limit=2)
+            self.assertEqual(second, first)
+            self.assertEqual(get_fields.call_count, computed)  # served from admin_fields_cache
+            self.assertEqual(get_fields_for_serialize.call_count, 1)
+
+            # registering an admin model again drops the cached metadata of every admin class
+            register(Flower)(FlowerAdmin)
+            self.assertFalse([key for key in admin_fields_cache if key[0] is FlowerAdmin])
+            self.assertEqual(await admin_models[Flower].get_list(limit=2), first)
+            self.assertGreater(get_fields.call_count, computed)
+            self.assertEqual(get_fields_for_serialize.call_count, 2)
+
+
+class DisplayOrderAdmin(OrderAdmin):
+    list_display = (*OrderAdmin.list_display, "total", "customer")
+
+    @display
+    def total(self, obj):
+        return obj.amount * obj.quantity
+
+    @display
+    async def customer(self, obj):
+        return f"{obj.user.username} <{obj.user.email}>"
+
+
+class PerObjectOrderAdmin(DisplayOrderAdmin):
+    async def serialize_obj(self, obj, list_view=False):
+        # serialize_obj as it was before the row serializers were compiled
+        fields_for_serialize = self.get_fields_for_serialize()
+        obj_dict = {}
+        attributes_to_serizalize = []
+        for field in self.get_model_fields_with_widget_types():
+            if field.name not in fields_for_serialize or field.is_m2m and list_view:
+                continue
+            if field.is_m2m:
+                obj_dict[field.name] = await self.orm_get_m2m_ids(obj, field.column_name)
+            else:
+                attributes_to_serizalize.append(field)
+        obj_dict.update(await self.serialize_obj_attributes(obj, attributes_to_serizalize))
+        for field_name in fields_for_serialize:
+            display_field_function = getattr(self, field_name, None)
+            if not display_field_function or not hasattr(display_field_function, "is_display"):
+                continue
+            if not inspect.iscoroutinefunction(display_field_function):
+                display_field_function = sync_to_async(display_field_function)
+            obj_dict[field_name] = await display_field_function(obj)
+        return obj_dict
+
+
+class TestAdminRowSerializer(BaseTestCase):
+    async def test_compiled_serializer_matches_per_object_serialization(self):
+        alice = await User.create(username="alice", email="alice@example.com", password_hash="x")
+        bob = await User.create(username="bob", email="bob@example.com", password_hash="x")
+        rose = await Flower.create(name="Rose", price=10.50, type=Flower.FlowerType.red, category=Flower.FlowerCategory.birthday)
+        tulip = await Flower.create(name="Tulip", price=8.00, type=Flower.FlowerType.yellow, category=Flower.FlowerCategory.kids)
+        await Order.create(user=alice, flower=rose, quantity=3, amount=Decimal("31.50"))
+        await Order.create(user=alice, flower=tulip, quantity=1, amount=Decimal("8.00"), status=Order.STATUSES.completed)
+        await Order.create(user=bob, flower=rose, quantity=2, amount=Decimal("21.00"), status=Order.STATUSES.failed)
+        orders = await Order.all().order_by("id").prefetch_related("user")
+
+        compiled, per_object = DisplayOrderAdmin(Order), PerObjectOrderAdmin(Order)
+        for list_view in (False, True):
+            expected = [await per_object.serialize_obj(order, list_view=list_view) for order in orders]
+            self.assertEqual(await compiled.serialize_objs(orders, list_view=list_view), expected)
+            serialize = compiled.get_row_serializer(list_view=list_view)
+            self.assertEqual([await serialize(order) for order in orders], expected)
+            self.assertEqual([await compiled.serialize_obj(order, list_view=list_view) for order in orders], expected)
+            # an overridden serialize_obj is still used for every object
+            self.assertEqual(await per_object.serialize_objs(orders, list_view=list_view), expected)
+
+        row = expected[0]
+        self.assertEqual((row["user"], row["flower"]), (alice.id, rose.id))
+        self.assertIs(row["status"], Order.STATUSES.pending)
+        self.assertEqual(row["amount"], Decimal("31.50"))
+        self.assertEqual(row["created_at"], orders[0].created_at)
+        self.assertEqual(row["__str__"], f"alice - alice@example.com - order_id: {orders[0].id}")
+        self.assertEqual((row["total"], row["customer"]), (Decimal("94.50"), "alice <alice@example.com>"))
+
+
+# the app has no m2m relations, these two are created only by TestAdminM2M
+class BouquetTag(Model):
+    id = fields.IntField(primary_key=True)
+    name = fields.CharField(max_length=50)
+
+
+class Bouquet(Model):
+    id = fields.IntField(primary_key=True)
+    name = fields.CharField(max_length=50)
+    tags = fields.ManyToManyField("tests.BouquetTag", related_name="bouquets")
+
+
+class BouquetAdmin(TortoiseModelAdmin):
+    list_display = ("id", "name", "tags")
+
+
+class TestAdminM2M(BaseTestCase):
+    async def init_db(self):
+        await Tortoise.init(
+            db_url="sqlite://:memory:",
+            modules={"models": ["models"], "tests": [sys.modules[__name__]]}
+        )
+        await Tortoise.generate_schemas()
+
+    async def create_bouquets(self, count: int) -> None:
+        tags = [await BouquetTag.create(name=f"tag {i}") for i in range(3)]
+        for i in range(count):
+            bouquet = await Bouquet.create(name=f"bouquet {i}")
+            await bouquet.tags.add(*tags[:i % 4])  # some bouquets have no tags
+
+    async def test_m2m_ids_are_loaded_with_a_query_per_field(self):
+        admin = BouquetAdmin(Bouquet)
+        query_counts = []
+        for count in (2, 8):
+            await self.create_bouquets(count)
+            bouquets = await Bouquet.all().order_by("id")
+            with count_queries() as queries:
+                serialized = await admin.serialize_objs(bouquets)
+            query_counts.append(len(queries))
+            for bouquet, obj in zip(bouquets, serialized, strict=True):
+                self.assertEqual(sorted(obj["tags"]), sorted(await admin.orm_get_m2m_ids(bouquet, "tags")))
+            self.assertIn([], [obj["tags"] for obj in serialized])
+
+            with count_queries() as queries:
+                results, total, _, _ = await admin.get_list(limit=100)
+            self.assertEqual(len(results), total)
+            query_counts.append(len(queries))
+        self.assertEqual(query_counts[:2], [1, 2])  # one m2m query, a page and a count for the list
+        self.assertEqual(query_counts[2:], query_counts[:2])  # same with five times the rows
+
+
+class TestAdminBulk(BaseTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.admin = await User.create(
+            username="admin", email="admin@example.com", is_superuser=True, is_active=True,
+            password_hash=await password_hasher.hash("admin-password"),
+        )
+        await Comment.bulk_create([Comment(text=f"comment {i}", user=self.admin) for i in range(2500)])
+        with mock.patch.multiple(admin_settings, ADMIN_USER_MODEL="User", ADMIN_SECRET_KEY="test-secret"):
+            await self.client.post("/admin/api/sign-in", json={"username": "admin", "password": "admin-password"})
+
+    @mock.patch.multiple(admin_settings, ADMIN_USER_MODEL="User", ADMIN_SECRET_KEY="test-secret")
+    async def test_bulk_delete_runs_chunked_statements(self):
+        ids = await Comment.all().order_by("id").values_list("id", flat=True)
+        with count_queries() as queries:
+            response = await self.client.post("/admin/api/bulk-delete/Comment", json={"ids": ids[:2100]})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["status"], "DONE")
+        self.assertEqual((response.json()["total"], response.json()["done"]), (2100, 2100))
+        self.assertEqual(len([query for query in queries if query.startswith("DELETE")]), 3)
+        self.assertEqual(await Comment.all().count(), 400)
+
+        response = await self.client.post("/admin/api/bulk-delete/User", json={"ids": [self.admin.id]})
+        self.assertEqual(response.status_code, 403)
+
+    @mock.patch.multiple(admin_settings, ADMIN_USER_MODEL="User", ADMIN_SECRET_KEY="test-secret")
+    async def test_bulk_update_and_actions(self):
+        users = [await User.create(username=f"user{i}", email=f"user{i}@example.com", password_hash="x") for i in range(3)]
+        ids = [user.id for user in users]
+        response = await self.client.post("/admin/api/action/User/deactivate", json={"ids": ids})
+        self.assertEqual(response.json()["status"], "DONE")
+        self.assertEqual(await User.filter(id__in=ids, is_active=False).count(), 3)
+
+        response = await self.client.post("/admin/api/bulk-update/User", json={"ids": ids[:2], "values": {"is_active": True}})
+        self.assertEqual(response.json()["done"], 2)
+        self.assertEqual(await User.filter(id__in=ids, is_active=True).count(), 2)
+
+        # cached token owners see the new is_active at once
+        await User.filter(id=ids[0]).update(token="bulk-token")
+        self.assertTrue((await resolve_token("bulk-token")).is_active)
+        await self.client.post("/admin/api/action/User/deactivate", json={"ids": ids[:1]})
+        self.assertFalse((await resolve_token("bulk-token")).is_active)
+
+        response = await self.client.post("/admin/api/bulk-update/User", json={"ids": ids, "values": {"id": 1}})
+        self.assertEqual(response.status_code, 422)
+
+    @mock.patch.multiple(admin_settings, ADMIN_USER_MODEL="User", ADMIN_SECRET_KEY="test-secret")
+    async def test_ids_sent_in_parts_run_as_a_background_job(self):
+        ids = await Comment.all().order_by("id").values_list("id", flat=True)
+        with mock.patch.multiple(admin_models[Comment], bulk_background_threshold=1000, bulk_chunk_size=500):
+            response = await self.client.post("/admin/api/bulk-delete/Comment", json={"ids": ids[:1500], "final": False})
+            job = response.json()
+            self.assertEqual((job["status"], job["total"]), ("RECEIVING", 1500))
+            self.assertEqual(await Comment.all().count(), 2500)
+
+            response = await self.client.post(
+                "/admin/api/bulk-delete/Comment", json={"ids": ids[1500:2000], "job_id": job["id"]}
+            )
+            self.assertEqual((response.json()["status"], response.json()["total"]), ("RUNNING", 2000))
+
+            for _ in range(100):
+                response = await self.client.get(f"/admin/api/bulk-job/{job['id']}")
+                if response.json()["status"] != "RUNNING":
+                    break
+                await asyncio.sleep(0.01)
+        self.assertEqual(response.json(), {"id": job["id"], "status": "DONE", "total": 2000, "done": 2000, "error": None})
+        self.assertEqual(await Comment.all().count(), 500)
+
+        # a finished job doesn't take more ids
+        response = await self.client.post("/admin/api/bulk-delete/Comment", json={"ids": ids[2000:], "job_id": job["id"]})
+        self.assertEqual(response.status_code, 404)
+
+
 if __name__ == "__main__":
     unittest.main()
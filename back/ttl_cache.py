@@ -0,0 +1,63 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+
+class TTLCache:
+    """
+    Bounded LRU mapping, entries expire `ttl` seconds after they were set. A ttl of 0 disables the cache.
+
+    `generation` changes on every removal. A value loaded from the db is stored with
+    `set(key, value, generation=...)` using the generation read before the query, so an entry
+    removed while the query ran isn't written back with stale data.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.generation = 0
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        item = self._data.get(key)
+        if item is None:
+            self.misses += 1
+            return default
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, generation: int | None = None):
+        if self.ttl <= 0 or (generation is not None and generation != self.generation):
+            return
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable):
+        self.generation += 1
+        self._data.pop(key, None)
+
+    def discard_where(self, predicate: Callable[[Any], bool]):
+        self.generation += 1
+        for key in [k for k, (_, v) in self._data.items() if predicate(v)]:
+            del self._data[key]
+
+    def clear(self):
+        self.generation += 1
+        self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+    def stats(self) -> dict:
+        return {"size": len(self._data), "maxsize": self.maxsize, "hits": self.hits, "misses": self.misses}